@@ -229,6 +229,19 @@ def ensure_lapse():
         print("Lapse executable already exists. Skipping download.")
 
 
+def compile_translations():
+    print("Compiling translation catalogs...")
+    python_executable = get_venv_python()
+    if not os.path.exists(python_executable):
+        python_executable = sys.executable
+    if (
+        subprocess.run([python_executable, "main/translations.py"], text=True).returncode
+        != 0
+    ):
+        print("Error compiling translation catalogs.")
+        sys.exit(1)
+
+
 def get_version_info(module_name):
     """Return a version information of package using the venv Python."""
     python_executable = get_venv_python()
@@ -810,6 +823,7 @@ if __name__ == "__main__":
     remove_webrtcvad_hook()
     ensure_ffmpeg()
     ensure_lapse()
+    compile_translations()
     check_versions()
     fix_macos_dylib_versions()
     build_with_pyinstaller()
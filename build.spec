@@ -51,6 +51,7 @@ datas = [
     (os.path.join(os.curdir, 'main', 'VERSION'), '.'),
     (os.path.join(os.curdir, 'main', 'assets'), 'assets'),
     (lapse_bin, 'resources/lapse'),
+    (os.path.join(os.curdir, 'main', 'resources', 'translations'), 'resources/translations'),
     (qt_platforms_dir, 'platforms'),
 ]
 
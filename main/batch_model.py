@@ -0,0 +1,790 @@
+"""Item model behind the batch list.
+
+The batch list used to be a QTreeWidget, which keeps a C++ item per row and
+lays the whole tree out again after every insertion or removal. Here the
+tree lives in plain Python objects (BatchItem, with the parts of the
+QTreeWidgetItem API the batch code uses) and BatchModel presents the visible
+rows to a QTableView as one flat list. The view only asks for the rows it
+paints, and inserting, removing or moving items costs time proportional to
+the rows that changed rather than to the size of the list.
+
+Row positions are cached on the items and renumbered lazily from the first
+position that may have shifted, so repeated edits near each other stay cheap.
+The model also remembers which top-level items changed since the view last
+asked (take_changes), so validation and counters can be updated
+incrementally. While a BatchCommand is set as its journal, the model records
+each insertion, removal and data change so the action can be undone and
+redone without copying the whole list.
+"""
+
+import os
+
+from PyQt6.QtCore import (
+    QAbstractTableModel,
+    QByteArray,
+    QFileInfo,
+    QMimeData,
+    QModelIndex,
+    QRect,
+    Qt,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt6.QtWidgets import (
+    QFileIconProvider,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOption,
+    QStyleOptionViewItem,
+)
+
+PATH_ROLE = Qt.ItemDataRole.UserRole  # File path of the item
+VALID_STATE_ROLE = Qt.ItemDataRole.UserRole + 10  # Parent item's validity state
+ITEM_ID_ROLE = Qt.ItemDataRole.UserRole + 11  # The item's unique ID
+PROCESSED_STATE_ROLE = Qt.ItemDataRole.UserRole + 12  # Item is already processed
+FORCE_PROCESS_ROLE = Qt.ItemDataRole.UserRole + 13  # Item should be force processed
+
+# Roles that can change a top-level item's validity, styling or counts
+STATE_ROLES = frozenset((PATH_ROLE, PROCESSED_STATE_ROLE, FORCE_PROCESS_ROLE))
+
+# Roles restored by undo; validity, tooltip and background are derived from them
+UNDO_ROLES = frozenset(
+    (
+        Qt.ItemDataRole.DisplayRole,
+        Qt.ItemDataRole.DecorationRole,
+        PATH_ROLE,
+        ITEM_ID_ROLE,
+        PROCESSED_STATE_ROLE,
+        FORCE_PROCESS_ROLE,
+    )
+)
+
+# Rough memory held per item by an undo entry, measured on typical paths
+UNDO_ITEM_COST = 700
+
+MIME_TYPE = "application/x-autosubsync-batch-items"
+
+
+class BatchItem:
+    """A node of the batch tree: a reference or subtitle file.
+
+    Only column 0 exists, but the column arguments are kept so code written
+    against QTreeWidgetItem works unchanged. New items are expanded.
+    """
+
+    __slots__ = (
+        "_parent",
+        "_children",
+        "_text",
+        "_icon",
+        "_background",
+        "_tooltip",
+        "_roles",
+        "_expanded",
+        "_row",
+        "_valid_rows",
+        "_flat",
+        "_model",
+    )
+
+    def __init__(self, text=""):
+        self._parent = None
+        self._children = []
+        self._text = text
+        self._icon = None
+        self._background = None
+        self._tooltip = ""
+        self._roles = {}
+        self._expanded = True
+        self._row = 0  # Position in the parent's children, see indexOfChild
+        self._valid_rows = 0  # Children before this position have a correct _row
+        self._flat = 0  # Position in BatchModel's visible rows
+        self._model = None  # Only set on a model's root item
+
+    def _owner(self):
+        """The model this item belongs to, or None for detached items."""
+        item = self
+        while item._parent is not None:
+            item = item._parent
+        return item._model
+
+    def _changed(self, role, old):
+        model = self._owner()
+        if model is not None:
+            model._item_changed(self, role, old)
+
+    # --- Data ---
+
+    def data(self, column, role):
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._text
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._icon
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self._tooltip
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._background
+        return self._roles.get(role)
+
+    def setData(self, column, role, value):
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            self.setText(column, value)
+        elif role == Qt.ItemDataRole.DecorationRole:
+            self.setIcon(column, value)
+        elif role == Qt.ItemDataRole.ToolTipRole:
+            self.setToolTip(column, value)
+        elif role == Qt.ItemDataRole.BackgroundRole:
+            self.setBackground(column, value)
+        elif role not in self._roles or self._roles[role] != value:
+            old = self._roles.get(role)
+            self._roles[role] = value
+            self._changed(role, old)
+
+    def text(self, column=0):
+        return self._text
+
+    def setText(self, column, text):
+        if self._text != text:
+            old, self._text = self._text, text
+            self._changed(Qt.ItemDataRole.DisplayRole, old)
+
+    def icon(self, column=0):
+        return self._icon
+
+    def setIcon(self, column, icon):
+        old, self._icon = self._icon, icon
+        self._changed(Qt.ItemDataRole.DecorationRole, old)
+
+    def toolTip(self, column=0):
+        return self._tooltip
+
+    def setToolTip(self, column, tooltip):
+        if self._tooltip != tooltip:
+            old, self._tooltip = self._tooltip, tooltip
+            self._changed(Qt.ItemDataRole.ToolTipRole, old)
+
+    def background(self, column=0):
+        return self._background
+
+    def setBackground(self, column, brush):
+        if self._background is not brush:
+            old, self._background = self._background, brush
+            self._changed(Qt.ItemDataRole.BackgroundRole, old)
+
+    # --- Structure ---
+
+    def parent(self):
+        """The parent item, or None for top-level and detached items."""
+        parent = self._parent
+        if parent is None or parent._model is not None:
+            return None
+        return parent
+
+    def depth(self):
+        depth = 0
+        parent = self.parent()
+        while parent is not None:
+            depth += 1
+            parent = parent.parent()
+        return depth
+
+    def childCount(self):
+        return len(self._children)
+
+    def child(self, index):
+        if 0 <= index < len(self._children):
+            return self._children[index]
+        return None
+
+    def indexOfChild(self, child):
+        if child is None or child._parent is not self:
+            return -1
+        children = self._children
+        row = child._row
+        if row < self._valid_rows and children[row] is child:
+            return row
+        # Renumber forward from the first stale position until the child is found
+        k = self._valid_rows
+        while True:
+            current = children[k]
+            current._row = k
+            k += 1
+            if current is child:
+                break
+        self._valid_rows = k
+        return child._row
+
+    def addChild(self, child):
+        self.insertChildren(len(self._children), [child])
+
+    def addChildren(self, children):
+        self.insertChildren(len(self._children), children)
+
+    def insertChild(self, index, child):
+        self.insertChildren(index, [child])
+
+    def insertChildren(self, index, children):
+        """Insert detached items; items that already have a parent are ignored."""
+        top = self
+        while top._parent is not None:
+            top = top._parent
+        children = [
+            c
+            for c in dict.fromkeys(children)
+            if c is not None and c is not top and c._parent is None and c._model is None
+        ]
+        if not children:
+            return
+        index = max(0, min(index, len(self._children)))
+        model = self._owner()
+        if model is not None:
+            model._insert(self, index, children)
+        else:
+            self._attach(index, children)
+
+    def removeChild(self, child):
+        if child is not None and child._parent is self:
+            model = self._owner()
+            if model is not None:
+                model.remove_items([child])
+            else:
+                self._detach([child])
+
+    def takeChild(self, index):
+        child = self.child(index)
+        self.removeChild(child)
+        return child
+
+    def takeChildren(self):
+        children = list(self._children)
+        model = self._owner()
+        if model is not None:
+            model.remove_items(children)
+        else:
+            self._detach(children)
+        return children
+
+    def isExpanded(self):
+        return self._expanded
+
+    def setExpanded(self, expanded):
+        expanded = bool(expanded)
+        if self._expanded == expanded:
+            return
+        model = self._owner()
+        if model is not None:
+            model._set_expanded(self, expanded)
+        else:
+            self._expanded = expanded
+
+    def _attach(self, index, children):
+        for child in children:
+            child._parent = self
+        self._children[index:index] = children
+        if self._valid_rows > index:
+            self._valid_rows = index
+
+    def _detach(self, children):
+        if len(children) == 1:
+            del self._children[self.indexOfChild(children[0])]
+            first = children[0]._row
+        else:
+            first = min(self.indexOfChild(c) for c in children)
+            gone = set(children)
+            self._children = [c for c in self._children if c not in gone]
+        if self._valid_rows > first:
+            self._valid_rows = first
+        for child in children:
+            child._parent = None
+
+
+class BatchModel(QAbstractTableModel):
+    """Flat, single-column view of the visible rows of a BatchItem tree."""
+
+    structure_changed = pyqtSignal()  # Items were added, removed or moved
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.root = BatchItem()
+        self.root._model = self
+        self.icon_provider = None
+        self._rows = []  # Visible items in display order
+        self._flat_valid = 0  # Rows before this position have a correct _flat
+        self._header = ""
+        self._icons = {}  # File extension -> icon
+        self._changed_roots = {}  # Top-level items changed since take_changes
+        self._removed_roots = {}  # Top-level items removed since take_changes
+        self._was_reset = False
+        self.track_changes = True
+        self.journal = None  # BatchCommand recording the current action
+
+        # Data changes are announced once per event loop iteration, for all
+        # rows: the view then repaints just the rows it shows.
+        self._data_changed_timer = QTimer(self)
+        self._data_changed_timer.setSingleShot(True)
+        self._data_changed_timer.setInterval(0)
+        self._data_changed_timer.timeout.connect(self._emit_data_changed)
+
+    # --- Qt model interface ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        item = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DecorationRole and item._icon is None:
+            return self._icon_for(item)
+        return item.data(0, role)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self._header
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsDropEnabled
+        return (
+            Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsSelectable
+            | Qt.ItemFlag.ItemIsDragEnabled
+            | Qt.ItemFlag.ItemIsDropEnabled
+        )
+
+    def supportedDragActions(self):
+        return Qt.DropAction.MoveAction
+
+    def supportedDropActions(self):
+        return Qt.DropAction.MoveAction
+
+    def mimeTypes(self):
+        return [MIME_TYPE]
+
+    def mimeData(self, indexes):
+        # Internal moves are carried out by the view from its selection, the
+        # payload only marks the drag as ours.
+        mime_data = QMimeData()
+        mime_data.setData(MIME_TYPE, QByteArray())
+        return mime_data
+
+    def dropMimeData(self, data, action, row, column, parent):
+        return False
+
+    # --- Lookups ---
+
+    def item_at(self, row):
+        """The item shown in the given row, or None."""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def items_in_rows(self, first, last):
+        """The items shown in rows first to last, inclusive."""
+        return self._rows[max(first, 0) : last + 1]
+
+    def item_from_index(self, index):
+        return self.item_at(index.row()) if index.isValid() else None
+
+    def index_from_item(self, item):
+        row = self.row_of(item)
+        return self.index(row, 0) if row >= 0 else QModelIndex()
+
+    def row_of(self, item):
+        """The row showing item, or -1 if it is not in the model or hidden."""
+        if item is None or item is self.root or not self._is_visible(item):
+            return -1
+        return self._flat_row(item)
+
+    def _is_visible(self, item):
+        parent = item._parent
+        while parent is not None and parent is not self.root:
+            if not parent._expanded:
+                return False
+            parent = parent._parent
+        return parent is self.root
+
+    def _flat_row(self, item):
+        rows = self._rows
+        row = item._flat
+        if row < self._flat_valid and rows[row] is item:
+            return row
+        k = self._flat_valid
+        while True:
+            current = rows[k]
+            current._flat = k
+            k += 1
+            if current is item:
+                break
+        self._flat_valid = k
+        return item._flat
+
+    def _visible_size(self, item):
+        """Rows taken by item and its visible descendants."""
+        size = 1
+        if item._expanded:
+            for child in item._children:
+                size += self._visible_size(child)
+        return size
+
+    def _flatten(self, item, rows):
+        rows.append(item)
+        if item._expanded:
+            for child in item._children:
+                self._flatten(child, rows)
+
+    def _top_level(self, item):
+        while item._parent is not None and item._parent is not self.root:
+            item = item._parent
+        return item if item._parent is self.root else None
+
+    def _icon_for(self, item):
+        path = item._roles.get(PATH_ROLE)
+        if not path:
+            return None
+        ext = os.path.splitext(path)[1].lower()
+        icon = self._icons.get(ext)
+        if icon is None:
+            if self.icon_provider is None:
+                self.icon_provider = QFileIconProvider()
+            icon = self._icons[ext] = self.icon_provider.icon(QFileInfo(path))
+        return icon
+
+    # --- Changes ---
+
+    def set_header_label(self, text):
+        if text != self._header:
+            self._header = text
+            self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, 0)
+
+    def _item_changed(self, item, role, old):
+        if self.journal is not None and self.track_changes and role in UNDO_ROLES:
+            self.journal.data_changed(item, role, old)
+        if role in STATE_ROLES:
+            self.mark_changed(item)
+        if not self._data_changed_timer.isActive():
+            self._data_changed_timer.start()
+
+    def _emit_data_changed(self):
+        if self._rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._rows) - 1, 0))
+
+    def mark_changed(self, item):
+        """Record that the top-level item containing item needs revalidation."""
+        if self.track_changes and (top := self._top_level(item)) is not None:
+            self._changed_roots[top] = None
+
+    def mark_all_changed(self):
+        if self.track_changes:
+            self._changed_roots.update(dict.fromkeys(self.root._children))
+
+    def take_changes(self):
+        """Return and forget (changed, removed, was_reset) since the last call.
+
+        changed lists top-level items still in the model whose subtree or
+        state changed; removed lists top-level items taken out of it. After
+        a reset, the items in the model are all in changed.
+        """
+        changed = [i for i in self._changed_roots if i._parent is self.root]
+        removed = list(self._removed_roots)
+        was_reset = self._was_reset
+        self._changed_roots.clear()
+        self._removed_roots.clear()
+        self._was_reset = False
+        return changed, removed, was_reset
+
+    def _record_insert(self, parent, children):
+        if not self.track_changes:
+            return
+        if parent is self.root:
+            self._changed_roots.update(dict.fromkeys(children))
+        else:
+            self.mark_changed(parent)
+
+    def _record_remove(self, parent, children):
+        if not self.track_changes:
+            return
+        if parent is self.root:
+            for child in children:
+                self._changed_roots.pop(child, None)
+                self._removed_roots[child] = None
+        else:
+            self.mark_changed(parent)
+
+    def _insert_rows(self, row, new_rows):
+        self.beginInsertRows(QModelIndex(), row, row + len(new_rows) - 1)
+        self._rows[row:row] = new_rows
+        for k, item in enumerate(new_rows, row):
+            item._flat = k
+        # Rows after the insertion shifted; the identity check in _flat_row
+        # catches those whose cached position now points at a new row.
+        if self._flat_valid >= row:
+            self._flat_valid = row + len(new_rows)
+        self.endInsertRows()
+
+    def _remove_rows(self, row, count):
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        del self._rows[row : row + count]
+        if self._flat_valid > row:
+            self._flat_valid = row
+        self.endRemoveRows()
+
+    def _insert(self, parent, index, children):
+        visible = parent is self.root or (parent._expanded and self._is_visible(parent))
+        if visible:
+            if index < len(parent._children):
+                row = self._flat_row(parent._children[index])
+            elif parent is self.root:
+                row = len(self._rows)
+            else:
+                row = self._flat_row(parent) + self._visible_size(parent)
+            new_rows = []
+            for child in children:
+                self._flatten(child, new_rows)
+        parent._attach(index, children)
+        if visible:
+            self._insert_rows(row, new_rows)
+        if self.journal is not None and self.track_changes:
+            self.journal.inserted(parent, index, children)
+        self._record_insert(parent, children)
+        self.structure_changed.emit()
+
+    def remove_items(self, items):
+        """Remove items (and their subtrees) from the model.
+
+        Items that are not in the model, or whose ancestor is also being
+        removed, are ignored. Adjacent rows are removed in a single step.
+        """
+        selected = set(items)
+        selected.discard(self.root)
+        outermost = []
+        for item in dict.fromkeys(items):
+            if item is None or item is self.root or item._owner() is not self:
+                continue
+            ancestor = item._parent
+            while ancestor is not None and ancestor not in selected:
+                ancestor = ancestor._parent
+            if ancestor is None:
+                outermost.append(item)
+        if not outermost:
+            return
+
+        spans = sorted(
+            (
+                (self._flat_row(item), self._visible_size(item))
+                for item in outermost
+                if self._is_visible(item)
+            ),
+            reverse=True,
+        )
+        # Remove bottom-up so earlier rows keep their positions
+        start, count = None, 0
+        for row, size in spans:
+            if start is not None and row + size == start:
+                start, count = row, count + size
+                continue
+            if start is not None:
+                self._remove_rows(start, count)
+            start, count = row, size
+        if start is not None:
+            self._remove_rows(start, count)
+
+        by_parent = {}
+        for item in outermost:
+            by_parent.setdefault(item._parent, []).append(item)
+        for parent, children in by_parent.items():
+            if self.journal is not None and self.track_changes:
+                self.journal.removed(
+                    parent, sorted((parent.indexOfChild(c), c) for c in children)
+                )
+            parent._detach(children)
+            self._record_remove(parent, children)
+        self.structure_changed.emit()
+
+    def move_items(self, items, parent, before=None):
+        """Move items under parent, ahead of its child before (or at the end).
+
+        Returns False, changing nothing, when parent is one of the items or
+        inside one of them.
+        """
+        moving = set(items)
+        ancestor = parent
+        while ancestor is not None:
+            if ancestor in moving:
+                return False
+            ancestor = ancestor._parent
+        # Keep the on-screen order of the moved items
+        items = sorted(
+            (i for i in dict.fromkeys(items) if i is not None and i._owner() is self),
+            key=self.row_of,
+        )
+        if not items:
+            return False
+        while before is not None and before in moving:
+            before = parent.child(parent.indexOfChild(before) + 1)
+
+        self.remove_items(items)
+        items = [i for i in items if i._parent is None]
+        index = parent.indexOfChild(before) if before is not None else -1
+        parent.insertChildren(index if index >= 0 else parent.childCount(), items)
+        return True
+
+    def _set_expanded(self, item, expanded):
+        if not item._children or not self._is_visible(item):
+            item._expanded = expanded
+            return
+        row = self._flat_row(item) + 1
+        if expanded:
+            item._expanded = True
+            new_rows = []
+            for child in item._children:
+                self._flatten(child, new_rows)
+            self._insert_rows(row, new_rows)
+        else:
+            count = self._visible_size(item) - 1
+            item._expanded = False
+            self._remove_rows(row, count)
+
+    def clear(self):
+        if self.journal is not None and self.track_changes and self.root._children:
+            self.journal.removed(self.root, list(enumerate(self.root._children)))
+        self.beginResetModel()
+        for child in self.root._children:
+            child._parent = None
+        self.root._children = []
+        self.root._valid_rows = 0
+        self._rows = []
+        self._flat_valid = 0
+        self._changed_roots.clear()
+        self._removed_roots.clear()
+        self._was_reset = True
+        self.endResetModel()
+        self.structure_changed.emit()
+
+
+class BatchCommand:
+    """One undoable action on the batch list, kept as the changes it made.
+
+    The model fills it in while it is the model's journal. Removed items are
+    kept (they are not in the model any more), inserted ones are referenced,
+    and for data changes the first old and the last new value per item and
+    role. cost estimates the memory the entry keeps alive.
+    """
+
+    __slots__ = ("_ops", "_data", "cost")
+
+    def __init__(self):
+        self._ops = []  # ("insert", parent, index, children) or ("remove", parent, [(index, child)])
+        self._data = {}  # (item, role) -> [old, new]
+        self.cost = 0
+
+    def __bool__(self):
+        return bool(self._ops or self._data)
+
+    def inserted(self, parent, index, children):
+        self._ops.append(("insert", parent, index, list(children)))
+        self.cost += UNDO_ITEM_COST // 8 * len(children)
+
+    def removed(self, parent, entries):
+        self._ops.append(("remove", parent, entries))
+        stack = [child for _, child in entries]
+        while stack:
+            item = stack.pop()
+            self.cost += UNDO_ITEM_COST
+            stack.extend(item._children)
+
+    def data_changed(self, item, role, old):
+        change = self._data.get((item, role))
+        if change is None:
+            self._data[(item, role)] = [old, item.data(0, role)]
+            self.cost += UNDO_ITEM_COST // 8
+        else:
+            change[1] = item.data(0, role)
+
+    def undo(self, model):
+        """Revert the changes in model; returns the top-level items put back."""
+        restored = []
+        for (item, role), (old, new) in self._data.items():
+            item.setData(0, role, old)
+        for op in reversed(self._ops):
+            if op[0] == "insert":
+                model.remove_items(op[3])
+            else:
+                parent, entries = op[1], op[2]
+                # Put back runs of adjacent positions in one insertion
+                start, run = None, []
+                for index, child in entries:
+                    if run and index != start + len(run):
+                        parent.insertChildren(start, run)
+                        run = []
+                    if not run:
+                        start = index
+                    run.append(child)
+                parent.insertChildren(start, run)
+                if parent is model.root:
+                    restored.extend(child for _, child in entries)
+        return restored
+
+    def redo(self, model):
+        """Apply the changes to model again; returns the top-level items put back."""
+        restored = []
+        for op in self._ops:
+            if op[0] == "insert":
+                parent, index, children = op[1], op[2], op[3]
+                parent.insertChildren(index, children)
+                if parent is model.root:
+                    restored.extend(children)
+            else:
+                model.remove_items([child for _, child in op[2]])
+        for (item, role), (old, new) in self._data.items():
+            item.setData(0, role, new)
+        return restored
+
+
+class BatchItemDelegate(QStyledItemDelegate):
+    """Paints batch rows with tree indentation and expand/collapse arrows."""
+
+    def __init__(self, view, indentation=20):
+        super().__init__(view)
+        self.indentation = indentation
+
+    def branch_rect(self, rect, item):
+        """Area of the expand arrow for item in a row drawn at rect."""
+        return QRect(
+            rect.x() + item.depth() * self.indentation,
+            rect.y(),
+            self.indentation,
+            rect.height(),
+        )
+
+    def paint(self, painter, option, index):
+        item = index.model().item_from_index(index)
+        if item is None:
+            return super().paint(painter, option, index)
+        style = option.widget.style() if option.widget else None
+        branch = self.branch_rect(option.rect, item)
+        if item._children and style is not None:
+            branch_option = QStyleOption()
+            branch_option.rect = branch
+            branch_option.palette = option.palette
+            branch_option.state = (
+                QStyle.StateFlag.State_Children | QStyle.StateFlag.State_Item
+            )
+            if item._expanded:
+                branch_option.state |= QStyle.StateFlag.State_Open
+            style.drawPrimitive(
+                QStyle.PrimitiveElement.PE_IndicatorBranch,
+                branch_option,
+                painter,
+                option.widget,
+            )
+        row_option = QStyleOptionViewItem(option)
+        row_option.rect = option.rect.adjusted(
+            branch.right() + 1 - option.rect.x(), 0, 0, 0
+        )
+        super().paint(painter, row_option, index)
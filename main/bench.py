@@ -0,0 +1,524 @@
+"""Throughput benchmark over a synthetic corpus, behind `assy-cli bench`.
+
+generate_corpus() builds a deterministic corpus from a seed: speech-like
+audio bursts (harmonic tones under a syllable-rate envelope, one burst per
+cue) written as WAV and remuxed to MKV with ffmpeg, the true subtitle of
+each, and a copy shifted by a known offset in every format subtitle_ir
+reads. run_benchmark() then times each sync tool, the converters, the
+shifter, the pairer and the sync-tracking database across the corpus sizes,
+and sweeps batch concurrency to recommend a --jobs value for the machine.
+"""
+
+import os
+import time
+import wave
+import shutil
+import logging
+import platform
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+DEFAULT_DURATIONS = (60, 300)
+DEFAULT_COUNTS = (100, 1000)
+DEFAULT_REPEAT = 3
+# Smallest --jobs whose throughput is within this fraction of the best
+JOBS_TOLERANCE = 0.05
+# Offset range the shifted subtitles are delayed by, in ms
+OFFSET_RANGE_MS = (1500, 6000)
+NOISE_FLOOR = 0.003
+SYLLABLE_HZ = 4.0
+WORDS = (
+    "the quick brown fox jumps over a lazy dog while seven bold wizards "
+    "vex the jovial king and pack my box with five dozen liquor jugs"
+).split()
+
+
+@dataclass
+class CorpusItem:
+    """One synthetic episode: media, true subtitle and shifted copies."""
+
+    duration_s: int
+    offset_ms: int
+    cues: int
+    audio: str
+    video: str
+    reference: str
+    # Extension -> subtitle delayed by offset_ms, in that format
+    subtitles: Dict[str, str] = field(default_factory=dict)
+
+
+def synthetic_cues(duration_s, rng):
+    """(starts, ends) in ms of speech-like cues filling duration_s."""
+    count = int(duration_s) + 1
+    gaps = rng.uniform(400, 3000, count)
+    lengths = rng.uniform(800, 4500, count)
+    ends = np.cumsum(gaps + lengths)
+    starts = ends - lengths
+    keep = ends <= duration_s * 1000 - 500
+    return starts[keep].astype(np.int64), ends[keep].astype(np.int64)
+
+
+def speech_audio(starts, ends, duration_s, rng):
+    """int16 mono samples with one voiced burst per cue over a noise floor."""
+    n = int(duration_s * SAMPLE_RATE)
+    samples = rng.normal(0, NOISE_FLOOR, n)
+    positions = np.arange(n)
+    start_samples = starts * SAMPLE_RATE // 1000
+    end_samples = ends * SAMPLE_RATE // 1000
+    cue = np.searchsorted(start_samples, positions, side="right") - 1
+    active = (cue >= 0) & (positions < end_samples[np.maximum(cue, 0)])
+    cue = cue[active]
+    t = positions[active] / SAMPLE_RATE
+    local = t - start_samples[cue] / SAMPLE_RATE
+    pitch = rng.uniform(100, 240, len(starts))[cue]
+    voiced = sum(np.sin(2 * np.pi * k * pitch * t) / k for k in range(1, 6))
+    envelope = 0.5 * (1 - np.cos(2 * np.pi * SYLLABLE_HZ * local))
+    burst = envelope * (0.4 * voiced + rng.normal(0, 0.1, len(t)))
+    samples[active] += burst
+    peak = np.abs(samples).max() or 1.0
+    return (samples / peak * 0.8 * 32767).astype(np.int16)
+
+
+def write_wav(path, samples):
+    with wave.open(path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes(samples.tobytes())
+
+
+def encode_mkv(wav_path, mkv_path):
+    """Remux a WAV into a FLAC-in-MKV file with ffmpeg, bit-exactly."""
+    from constants import FFMPEG_EXECUTABLE
+    from utils import create_process
+
+    cmd = [
+        FFMPEG_EXECUTABLE,
+        "-y",
+        "-v",
+        "error",
+        "-i",
+        wav_path,
+        "-map_metadata",
+        "-1",
+        "-fflags",
+        "+bitexact",
+        "-flags:a",
+        "+bitexact",
+        "-c:a",
+        "flac",
+        mkv_path,
+    ]
+    process = create_process(cmd)
+    output, _ = process.communicate()
+    if process.returncode != 0:
+        message = output.decode("utf-8", "replace") if output else ""
+        raise RuntimeError(f"ffmpeg failed to write {mkv_path}: {message.strip()}")
+
+
+def generate_corpus(directory, durations=DEFAULT_DURATIONS, seed=0):
+    """Write one CorpusItem per duration (seconds) into directory.
+
+    The same seed always produces the same audio and subtitles.
+    """
+    from subtitle_ir import FORMATS, SubtitleDocument, save_subtitle
+
+    os.makedirs(directory, exist_ok=True)
+    corpus = []
+    for index, duration_s in enumerate(durations):
+        rng = np.random.default_rng([seed, index])
+        starts, ends = synthetic_cues(duration_s, rng)
+        texts = [
+            " ".join(rng.choice(WORDS, size=int(rng.integers(2, 9))))
+            for _ in range(len(starts))
+        ]
+        offset_ms = int(rng.integers(*OFFSET_RANGE_MS))
+        name = f"episode_{duration_s}s"
+        item = CorpusItem(
+            duration_s=duration_s,
+            offset_ms=offset_ms,
+            cues=len(starts),
+            audio=os.path.join(directory, f"{name}.wav"),
+            video=os.path.join(directory, f"{name}.mkv"),
+            reference=os.path.join(directory, f"{name}.reference.srt"),
+        )
+        write_wav(item.audio, speech_audio(starts, ends, duration_s, rng))
+        encode_mkv(item.audio, item.video)
+        doc = SubtitleDocument.from_cues("srt", starts, ends, texts)
+        save_subtitle(doc, item.reference, "srt")
+        shifted = doc.shifted(offset_ms)
+        for ext, fmt in FORMATS.items():
+            path = os.path.join(directory, f"{name}.shifted{ext}")
+            save_subtitle(shifted, path, fmt)
+            item.subtitles[ext] = path
+        corpus.append(item)
+    return corpus
+
+
+def generate_library(directory, count):
+    """Fill directory with count empty episode files and their subtitles."""
+    os.makedirs(directory, exist_ok=True)
+    for i in range(count):
+        season, episode = divmod(i, 100)
+        base = f"Show.S{season + 1:02d}E{episode + 1:02d}"
+        for name in (f"{base}.1080p.mkv", f"{base}.en.srt"):
+            open(os.path.join(directory, name), "wb").close()
+    return directory
+
+
+def _measure(repeat, func, setup=None):
+    """Run func repeat times, each after an untimed setup.
+
+    Returns ({"min_ms", "median_ms"}, result of the last run).
+    """
+    runs = []
+    # Per-call info logs would both flood the output and be timed
+    previous = logging.root.manager.disable
+    logging.disable(logging.INFO)
+    try:
+        for _ in range(max(1, repeat)):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            result = func()
+            runs.append((time.perf_counter() - start) * 1000)
+    finally:
+        logging.disable(previous)
+    timing = {
+        "min_ms": round(min(runs), 3),
+        "median_ms": round(float(np.median(runs)), 3),
+    }
+    return timing, result
+
+
+def alignment_error_ms(output, item) -> Optional[float]:
+    """Median distance in ms between a synced subtitle's cues and the truth."""
+    from subtitle_ir import load_subtitle
+
+    synced = load_subtitle(output)
+    truth = load_subtitle(item.reference)
+    n = min(len(synced), len(truth))
+    if n == 0:
+        return None
+    return float(np.median(np.abs(synced.starts[:n] - truth.starts[:n])))
+
+
+def _reference_for(tool, item):
+    from constants import SYNC_TOOLS
+
+    if SYNC_TOOLS[tool].get("supports_video_as_reference", True):
+        return item.video
+    return item.reference
+
+
+def bench_tools(corpus, tools, config, work_dir):
+    """Sync every corpus item's shifted SRT with each tool."""
+    from sync_core import run_sync
+
+    records = []
+    for item in corpus:
+        for tool in tools:
+            reference = _reference_for(tool, item)
+            output = os.path.join(work_dir, f"{tool}_{item.duration_s}s.srt")
+            logger.info("bench: %s on %ds", tool, item.duration_s)
+            result = run_sync(
+                reference,
+                item.subtitles[".srt"],
+                tool=tool,
+                output=output,
+                config=config,
+            )
+            error = None
+            if result.ok and result.output_path:
+                try:
+                    error = alignment_error_ms(result.output_path, item)
+                except Exception as e:
+                    logger.debug("Could not score %s: %s", output, e)
+            records.append(
+                {
+                    "tool": tool,
+                    "duration_s": item.duration_s,
+                    "reference": "video" if reference == item.video else "subtitle",
+                    "ok": result.ok,
+                    "message": result.message,
+                    "elapsed_ms": result.elapsed_ms,
+                    "error_ms": error,
+                    "timings": result.timings,
+                    "processes": [usage.as_dict() for usage in result.processes],
+                }
+            )
+    return records
+
+
+def bench_converters(corpus, work_dir, repeat=DEFAULT_REPEAT):
+    """Time convert_to_srt for every non-SRT format."""
+    from subtitle_converter import convert_to_srt
+
+    records = []
+    for item in corpus:
+        for ext, path in item.subtitles.items():
+            if ext == ".srt":
+                continue
+            timing, (srt_file, _) = _measure(
+                repeat, lambda path=path: convert_to_srt(path, work_dir)
+            )
+            records.append(
+                {
+                    "format": ext,
+                    "duration_s": item.duration_s,
+                    "cues": item.cues,
+                    "ok": srt_file is not None,
+                }
+                | timing
+            )
+    return records
+
+
+def bench_shifter(corpus, work_dir, repeat=DEFAULT_REPEAT):
+    """Time shift_subtitle for every format."""
+    from sync_manual import shift_subtitle
+
+    records = []
+    for item in corpus:
+        for ext, path in item.subtitles.items():
+            output = os.path.join(work_dir, f"shifted_{item.duration_s}s{ext}")
+            timing, (_, ok, _) = _measure(
+                repeat,
+                lambda path=path, output=output: shift_subtitle(
+                    path, -item.offset_ms, output
+                ),
+            )
+            records.append(
+                {
+                    "format": ext,
+                    "duration_s": item.duration_s,
+                    "cues": item.cues,
+                    "ok": ok,
+                }
+                | timing
+            )
+    return records
+
+
+def bench_pairer(directory, counts, repeat=DEFAULT_REPEAT):
+    """Time pair_folder on libraries of count episodes."""
+    from pairing import pair_folder
+
+    records = []
+    for count in counts:
+        library = generate_library(os.path.join(directory, f"library_{count}"), count)
+        timing, pairs = _measure(repeat, lambda library=library: pair_folder(library))
+        records.append({"count": count, "pairs": len(pairs)} | timing)
+    return records
+
+
+def bench_database(directory, counts, repeat=DEFAULT_REPEAT):
+    """Time marking and looking up count files in a scratch tracking DB."""
+    from processed_items_manager import ProcessedItemsManager
+
+    db_path = os.path.join(directory, "processed_items.db")
+
+    class ScratchManager(ProcessedItemsManager):
+        _instance = None
+
+        def _get_db_path(self):
+            return db_path
+
+    def reset():
+        if ScratchManager._instance is not None:
+            ScratchManager._instance.close()
+            ScratchManager._instance = None
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+
+    records = []
+    try:
+        for count in counts:
+            folder = os.path.join(directory, f"tracked_{count}")
+            os.makedirs(folder, exist_ok=True)
+            rng = np.random.default_rng(count)
+            files = []
+            for i in range(count):
+                path = os.path.join(folder, f"video{i:05d}.mkv")
+                with open(path, "wb") as f:
+                    f.write(rng.bytes(4096 + i))
+                files.append(path)
+            mark, _ = _measure(repeat, lambda: ScratchManager().mark_many(files), reset)
+            lookup, found = _measure(
+                repeat, lambda: ScratchManager().is_processed_many(files)
+            )
+            records.append(
+                {
+                    "count": count,
+                    "found": sum(found.values()),
+                    "mark_min_ms": mark["min_ms"],
+                    "mark_median_ms": mark["median_ms"],
+                    "lookup_min_ms": lookup["min_ms"],
+                    "lookup_median_ms": lookup["median_ms"],
+                }
+            )
+    finally:
+        reset()
+    return records
+
+
+def jobs_candidates(max_jobs=None):
+    """Powers of two up to max_jobs (default: CPU count), then max_jobs."""
+    max_jobs = max(1, max_jobs or os.cpu_count() or 1)
+    candidates = [1]
+    while candidates[-1] * 2 < max_jobs:
+        candidates.append(candidates[-1] * 2)
+    if candidates[-1] != max_jobs:
+        candidates.append(max_jobs)
+    return candidates
+
+
+def sweep_jobs(item, tool, config, work_dir, candidates):
+    """Sync 2 * max(candidates) copies of item at each concurrency level.
+
+    Runs like `assy-cli batch --jobs N`: one thread per job, with the module
+    workers of module-based tools started beforehand.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from constants import SYNC_TOOLS
+    from sync_core import run_sync
+
+    pairs = 2 * max(candidates)
+    reference = _reference_for(tool, item)
+    runs = []
+    for jobs in candidates:
+        if SYNC_TOOLS[tool].get("type") == "module":
+            from worker_pool import get_module_worker_pool
+
+            pool = get_module_worker_pool()
+            if pool is not None:
+                pool.prestart(SYNC_TOOLS[tool]["module"], jobs)
+
+        def sync(i, jobs=jobs):
+            output = os.path.join(work_dir, f"jobs{jobs}_{i}.srt")
+            return run_sync(
+                reference,
+                item.subtitles[".srt"],
+                tool=tool,
+                output=output,
+                config=config,
+            ).ok
+
+        logger.info("bench: %d %s syncs with --jobs %d", pairs, tool, jobs)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            ok = sum(executor.map(sync, range(pairs)))
+        seconds = time.perf_counter() - start
+        runs.append(
+            {
+                "jobs": jobs,
+                "pairs": pairs,
+                "ok": ok,
+                "ms": round(seconds * 1000, 3),
+                "pairs_per_s": round(ok / seconds, 3) if seconds else 0.0,
+            }
+        )
+    return runs
+
+
+def recommend_jobs(runs, tolerance=JOBS_TOLERANCE) -> Optional[int]:
+    """Fewest jobs whose throughput is within tolerance of the best run.
+
+    Extra jobs past that point only add memory and contention.
+    """
+    best = max((run["pairs_per_s"] for run in runs), default=0)
+    if best <= 0:
+        return None
+    return min(
+        run["jobs"] for run in runs if run["pairs_per_s"] >= best * (1 - tolerance)
+    )
+
+
+def _jobs_tool(preferred, tool_records):
+    """preferred if it synced the corpus, else the fastest tool that did."""
+    ok = [r for r in tool_records if r["ok"]]
+    if any(r["tool"] == preferred for r in ok):
+        return preferred
+    if ok:
+        return min(ok, key=lambda r: r["elapsed_ms"])["tool"]
+    return None
+
+
+def run_benchmark(
+    directory,
+    config,
+    *,
+    tools,
+    durations=DEFAULT_DURATIONS,
+    counts=DEFAULT_COUNTS,
+    repeat=DEFAULT_REPEAT,
+    seed=0,
+    max_jobs=None,
+    jobs_tool=None,
+) -> dict:
+    """Generate the corpus in directory, run every benchmark, return the report.
+
+    The speech cache is disabled meanwhile, so every sync decodes its
+    reference as a first run would.
+    """
+    from constants import VERSION
+    from speech_cache import CACHE_SIZE_ENV
+
+    corpus_dir = os.path.join(directory, "corpus")
+    work_dir = os.path.join(directory, "work")
+    os.makedirs(work_dir, exist_ok=True)
+    saved_cache_size = os.environ.get(CACHE_SIZE_ENV)
+    os.environ[CACHE_SIZE_ENV] = "0"
+    try:
+        start = time.perf_counter()
+        corpus = generate_corpus(corpus_dir, durations, seed)
+        generate_ms = round((time.perf_counter() - start) * 1000, 3)
+        report = {
+            "host": {
+                "platform": platform.platform(),
+                "machine": platform.machine(),
+                "python": platform.python_version(),
+                "cpu_count": os.cpu_count(),
+                "version": VERSION,
+            },
+            "corpus": {
+                "seed": seed,
+                "generate_ms": generate_ms,
+                "items": [
+                    {
+                        "duration_s": item.duration_s,
+                        "cues": item.cues,
+                        "offset_ms": item.offset_ms,
+                    }
+                    for item in corpus
+                ],
+            },
+            "tools": bench_tools(corpus, tools, config, work_dir),
+            "converters": bench_converters(corpus, work_dir, repeat),
+            "shifter": bench_shifter(corpus, work_dir, repeat),
+            "pairer": bench_pairer(directory, counts, repeat),
+            "database": bench_database(directory, counts, repeat),
+        }
+        tool = _jobs_tool(jobs_tool, report["tools"])
+        jobs = {"tool": tool, "runs": [], "recommended": None}
+        if tool is not None and corpus:
+            shortest = min(corpus, key=lambda item: item.duration_s)
+            jobs["duration_s"] = shortest.duration_s
+            jobs["runs"] = sweep_jobs(
+                shortest, tool, config, work_dir, jobs_candidates(max_jobs)
+            )
+            jobs["recommended"] = recommend_jobs(jobs["runs"])
+        report["jobs"] = jobs
+    finally:
+        if saved_cache_size is None:
+            os.environ.pop(CACHE_SIZE_ENV, None)
+        else:
+            os.environ[CACHE_SIZE_ENV] = saved_cache_size
+    shutil.rmtree(work_dir, ignore_errors=True)
+    return report
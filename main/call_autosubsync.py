@@ -44,6 +44,15 @@ def _redirect_fd(fd, target_stream):
     return orig_fd, t
 
 
+def warmup():
+    """Import autosubsync's heavy dependencies ahead of time (used by warm pool workers).
+
+    cli_entry re-runs autosubsync.main for every job, but the modules it pulls in
+    stay imported.
+    """
+    import autosubsync.predict  # noqa: F401
+
+
 def cli_entry(args=None):
     _argv = sys.argv
     model_file_default = get_resource_path(
@@ -54,6 +54,86 @@ def _get_silero_vad_model_path():
     return candidate if os.path.isfile(candidate) else None
 
 
+# Silero VAD runs on 512-sample chunks at 16 kHz. Instead of one session.run per
+# chunk, the audio of each detector call is split into SILERO_BATCH_SEGMENTS
+# segments that advance together through the model's batch dimension, each with
+# its own recurrent state. Every segment after the first starts from a zero
+# state and is warmed up on the SILERO_WARMUP_CHUNKS chunks before it, whose
+# outputs are discarded. Both knobs and the intra-op thread count (0 = ONNX
+# Runtime default) can be overridden through the environment.
+SILERO_CHUNK_SIZE = 512
+SILERO_BATCH_SEGMENTS = 16
+SILERO_WARMUP_CHUNKS = 32
+SILERO_MIN_SEGMENT_CHUNKS = 4 * SILERO_WARMUP_CHUNKS
+SILERO_INTRA_OP_THREADS = 0
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _split_chunks(audio, chunk_size):
+    """Cut audio into (n, chunk_size) rows, zero-padding the last partial chunk."""
+    import numpy as np
+
+    n = -(-len(audio) // chunk_size)
+    chunks = np.zeros((n, chunk_size), dtype=np.float32)
+    chunks.reshape(-1)[: len(audio)] = audio
+    return chunks
+
+
+def run_silero_batched(
+    session,
+    chunks,
+    state,
+    segments=SILERO_BATCH_SEGMENTS,
+    warmup=SILERO_WARMUP_CHUNKS,
+    min_segment=SILERO_MIN_SEGMENT_CHUNKS,
+    sr=16000,
+):
+    """Run Silero VAD over consecutive chunks, several segments per session.run.
+
+    state is the (2, 1, 128) recurrent state left by the previous call; it seeds
+    the first segment, so that segment matches sequential inference exactly.
+    Returns (probabilities, state after the last chunk).
+    """
+    import numpy as np
+
+    n = len(chunks)
+    if n == 0:
+        return np.zeros(0, dtype=np.float32), state
+    k = max(1, min(segments, n // max(1, min_segment)))
+    if k == 1:
+        warmup = 0
+    # Row 0 keeps all of its `steps` outputs, each later row keeps steps - warmup.
+    steps = -(-(n + (k - 1) * warmup) // k)
+    starts = [0] + [steps + (r - 1) * (steps - warmup) - warmup for r in range(1, k)]
+
+    padded = np.zeros((starts[-1] + steps, chunks.shape[1]), dtype=np.float32)
+    padded[:n] = chunks
+    row_index = np.asarray(starts)[:, None] + np.arange(steps)[None, :]
+    batch_state = np.zeros((2, k, 128), dtype=np.float32)
+    batch_state[:, :1] = state
+    sr_tensor = np.array(sr, dtype=np.int64)
+    out_probs = np.empty((k, steps), dtype=np.float32)
+    last_step = (n - 1) - starts[-1]
+    final_state = state
+    for t in range(steps):
+        out, batch_state = session.run(
+            None,
+            {"input": padded[row_index[:, t]], "state": batch_state, "sr": sr_tensor},
+        )
+        out_probs[:, t] = out[:, 0]
+        if t == last_step:
+            final_state = batch_state[:, k - 1 : k].copy()
+
+    probs = [out_probs[0]] + [out_probs[r, warmup:] for r in range(1, k)]
+    return np.concatenate(probs)[:n], final_state
+
+
 def _patch_ffsubsync_silero():
     """Patch ffsubsync to use ONNX Runtime with silero_vad.onnx instead of requiring PyTorch."""
     try:
@@ -89,11 +169,14 @@ def _patch_ffsubsync_silero():
 
         opts = ort.SessionOptions()
         opts.log_severity_level = 3  # Suppress verbose ONNX logs
+        threads = _env_int("ASSY_SILERO_THREADS", SILERO_INTRA_OP_THREADS)
+        if threads > 0:
+            opts.intra_op_num_threads = threads
         session = ort.InferenceSession(model_path, opts, providers=["CPUExecutionProvider"])
+        segments = max(1, _env_int("ASSY_SILERO_SEGMENTS", SILERO_BATCH_SEGMENTS))
         sr_model = 16000
-        chunk_size = 512
+        chunk_size = SILERO_CHUNK_SIZE
         state = np.zeros((2, 1, 128), dtype=np.float32)
-        sr_tensor = np.array(sr_model, dtype=np.int64)
         window_duration = 1.0 / sample_rate
         frames_per_output_window = int(window_duration * frame_rate + 0.5)
 
@@ -116,19 +199,10 @@ def _patch_ffsubsync_silero():
             else:
                 audio_16k = audio
 
-            num_chunks = len(audio_16k) // chunk_size
-            chunk_probs = []
-            for i in range(num_chunks):
-                chunk = audio_16k[i * chunk_size : (i + 1) * chunk_size].reshape(1, chunk_size)
-                out, state = session.run(None, {"input": chunk, "state": state, "sr": sr_tensor})
-                chunk_probs.append(float(out[0][0]))
-
-            remainder = len(audio_16k) % chunk_size
-            if remainder > 0:
-                pad = np.zeros(chunk_size - remainder, dtype=np.float32)
-                chunk = np.concatenate([audio_16k[num_chunks * chunk_size:], pad]).reshape(1, chunk_size)
-                out, state = session.run(None, {"input": chunk, "state": state, "sr": sr_tensor})
-                chunk_probs.append(float(out[0][0]))
+            chunks = _split_chunks(audio_16k, chunk_size)
+            chunk_probs, state = run_silero_batched(
+                session, chunks, state, segments=segments, sr=sr_model
+            )
 
             total_output_windows = int(np.ceil(len(audio) / frames_per_output_window))
             if len(chunk_probs) == 0:
@@ -274,17 +348,99 @@ def _patch_ffsubsync_pgs_fallback():
     st.PGSSpeechTransformer._is_patched_fallback = True
 
 
+def _speech_cache_params(transformer):
+    """VAD settings that the speech array of a reference depends on."""
+    params = {
+        "vad": transformer.vad,
+        "sample_rate": transformer.sample_rate,
+        "frame_rate": transformer.frame_rate,
+        "non_speech_label": transformer._non_speech_label,
+        "start_seconds": transformer.start_seconds,
+        "max_duration_seconds": transformer.max_duration_seconds,
+        "ref_stream": transformer.ref_stream,
+    }
+    if "silero" in transformer.vad or "fused" in transformer.vad:
+        params["silero_segments"] = max(
+            1, _env_int("ASSY_SILERO_SEGMENTS", SILERO_BATCH_SEGMENTS)
+        )
+    return params
+
+
+def _patch_ffsubsync_speech_cache():
+    """Patch ffsubsync to reuse cached speech arrays of previously decoded references."""
+    try:
+        import ffsubsync.speech_transformers as st
+        import logging
+        from speech_cache import get_speech_cache
+        logger = logging.getLogger("ffsubsync")
+    except Exception:
+        return
+
+    orig_fit = getattr(st.VideoSpeechTransformer, "fit", None)
+    if orig_fit is None or getattr(
+        st.VideoSpeechTransformer, "_is_patched_speech_cache", False
+    ):
+        return
+
+    # fit() covers both embedded-subtitle and audio VAD references; remote
+    # URLs never produce a key, so their temporary audio extraction is untouched.
+    def _cached_fit(self, fname: str, *args, **kwargs):
+        cache = get_speech_cache()
+        key = None
+        if cache is not None:
+            try:
+                key = cache.make_key(fname, **_speech_cache_params(self))
+            except Exception as e:
+                logger.warning("speech cache lookup failed: %s", e)
+            if key is not None:
+                cached = cache.get(key)
+                if cached is not None:
+                    logger.info("using cached speech segments for %s", fname)
+                    self.video_speech_results_ = cached
+                    return self
+        result = orig_fit(self, fname, *args, **kwargs)
+        if key is not None and self.video_speech_results_ is not None:
+            cache.put(key, self.video_speech_results_)
+        return result
+
+    st.VideoSpeechTransformer.fit = _cached_fit
+    st.VideoSpeechTransformer._is_patched_speech_cache = True
+
+
 def _load_ffsubsync():
     try:
         from ffsubsync.ffsubsync import main as ffsubsync_main
         _patch_ffsubsync_silero()
         _patch_ffsubsync_pgs_timings()
         _patch_ffsubsync_pgs_fallback()
+        _patch_ffsubsync_speech_cache()
         return ffsubsync_main, None
     except Exception as e:
         return None, e
 
 
+def warmup():
+    """Import and patch ffsubsync ahead of time (used by warm pool workers)."""
+    _load_ffsubsync()
+    try:
+        import onnxruntime  # noqa: F401  (imported lazily by the Silero VAD patch)
+    except ImportError:
+        pass
+
+
+def prime_speech_cache(args):
+    """Extract the speech of a video reference into the speech cache.
+
+    args are the reference followed by the usual ffsubsync options, so the
+    cache key matches the one later sync runs with the same options compute.
+    """
+    from ffsubsync.ffsubsync import make_parser, make_reference_pipe
+
+    parsed = make_parser().parse_args(args)
+    make_reference_pipe(parsed).fit(parsed.reference)
+    return 0
+
+
 def cli_entry(args=None):
     """
     Entry point for module-based execution. Accepts a list of arguments (excluding script name),
@@ -304,6 +460,11 @@ def cli_entry(args=None):
             print(f"Import error: {import_error}", file=_sys.stderr)
         return 1
 
+    from speech_cache import PRIME_SPEECH_CACHE_FLAG
+
+    if args and args[0] == PRIME_SPEECH_CACHE_FLAG:
+        return prime_speech_cache(args[1:])
+
     old_argv = _sys.argv
     if args is not None:
         _sys.argv = [old_argv[0]] + args
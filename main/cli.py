@@ -1,11 +1,12 @@
 """AutoSubSync command-line interface for autonomous pipelines.
 
-Provides four subcommands: sync, shift, batch, config.
+Provides subcommands: sync, shift, batch, config, db, bench and version.
 
-This module must remain free of PyQt6 Widgets/Gui imports at module load
-time. The lightweight QtCore module may be loaded transitively (via
-constants/utils for the QObject-based signals used elsewhere in the
-codebase), but no display or event loop is started.
+This module and everything it imports must remain free of PyQt6 (including
+QtCore) and of heavy optional libraries at module load time: each command
+imports what it needs inside its handler, so `import cli`, `--help` and
+`version` stay fast. tests/test_cli_startup.py guards the import graph and
+an import-time budget.
 """
 
 # Path setup: the AutoSubSync codebase uses sibling-module imports (e.g.
@@ -16,12 +17,6 @@ import sys as _sys
 
 _sys.path.insert(0, _os.path.dirname(_os.path.abspath(__file__)))
 
-# Pre-import texts to satisfy the pre-existing utils <-> texts circular import.
-# utils.py imports texts at module top, and texts module-load instantiates
-# TranslationDict() which calls `from utils import get_locale`. If anything
-# imports utils first, get_locale isn't defined yet and the import fails.
-import texts  # noqa: F401,E402
-
 import argparse  # noqa: E402
 import json  # noqa: E402
 import logging  # noqa: E402
@@ -74,7 +69,7 @@ SAVE_MODES_AUTO = (
     "select_destination_folder",
 )
 
-TOOL_CHOICES = ("ffsubsync", "lapse", "alass", "autosubsync")
+TOOL_CHOICES = ("ffsubsync", "lapse", "alass", "autosubsync", "fftalign")
 
 EXIT_OK = 0
 EXIT_SYNC_FAILED = 1
@@ -82,6 +77,39 @@ EXIT_USAGE = 2
 EXIT_INTERRUPTED = 130
 
 
+class _RichLogHandler(logging.Handler):
+    """Log handler that renders through rich, imported on the first record.
+
+    Importing rich costs more than the rest of the CLI's startup, and commands
+    such as `version` never log anything.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._handler = None
+
+    def _get_handler(self) -> logging.Handler:
+        if self._handler is None:
+            try:
+                from rich.console import Console
+                from rich.logging import RichHandler
+
+                handler = RichHandler(
+                    console=Console(file=sys.stderr),
+                    show_path=False,
+                    show_time=False,
+                    rich_tracebacks=True,
+                )
+            except Exception:
+                handler = logging.StreamHandler(sys.stderr)
+            handler.setFormatter(self.formatter)
+            self._handler = handler
+        return self._handler
+
+    def emit(self, record):
+        self._get_handler().emit(record)
+
+
 def setup_logging(level_name: str, quiet: bool, verbose: bool, no_color: bool) -> None:
     """Initialize the root logger. CLI logs go to stderr; stdout is reserved
     for command output (paths in human mode, JSON objects in --json mode)."""
@@ -94,20 +122,7 @@ def setup_logging(level_name: str, quiet: bool, verbose: bool, no_color: bool) -
 
     handlers = []
     if not no_color:
-        try:
-            from rich.console import Console
-            from rich.logging import RichHandler
-
-            handlers = [
-                RichHandler(
-                    console=Console(file=sys.stderr, no_color=no_color),
-                    show_path=False,
-                    show_time=False,
-                    rich_tracebacks=True,
-                )
-            ]
-        except Exception:
-            handlers = [logging.StreamHandler(sys.stderr)]
+        handlers = [_RichLogHandler()]
     else:
         handlers = [logging.StreamHandler(sys.stderr)]
 
@@ -179,15 +194,16 @@ def _validate_save_mode(config: dict) -> Optional[str]:
     return None
 
 
-def _build_callbacks(json_mode: bool, prefix: str = ""):
+def _build_callbacks(json_mode: bool, prefix: str = "", allow_overwrite: bool = True):
     """Construct SyncCallbacks bound to stderr logging.
 
     Subprocess overwrite-style lines (\\r-terminated) are only forwarded when
-    stderr is a TTY; in pipelines they create noisy output.
+    stderr is a TTY; in pipelines they create noisy output. Parallel batch jobs
+    pass allow_overwrite=False since interleaved \\r updates are unreadable.
     """
     from sync_core import SyncCallbacks
 
-    interactive = sys.stderr.isatty()
+    interactive = sys.stderr.isatty() and allow_overwrite
 
     def on_log(msg, color):
         if not msg:
@@ -236,6 +252,56 @@ def _apply_output_encoding(input_subtitle: str, output_path: str, config: dict)
         log.warning("Failed to match subtitle encoding: %s", e)
 
 
+def _finish_sync(subtitle, result, prepared, config) -> None:
+    """Apply the output encoding to a finished sync and complete its timings.
+
+    result.timings gains the reference preparation stages up front and an
+    "output_encoding" stage at the end; result.processes gains the ffprobe
+    and ffmpeg runs of the subtitle extraction up front.
+    """
+    timings = dict(prepared.timings)
+    timings.update(result.timings)
+    if result.ok and result.output_path:
+        start = time.monotonic()
+        _apply_output_encoding(subtitle, result.output_path, config)
+        timings["output_encoding"] = round((time.monotonic() - start) * 1000, 3)
+    result.timings = timings
+    result.processes = prepared.processes + result.processes
+
+
+def _percentile(values, percent):
+    """Nearest-rank percentile of a non-empty list."""
+    import math
+
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(percent / 100 * len(ordered))) - 1]
+
+
+def _timing_summary(job_timings) -> dict:
+    """Total, p50 and p95 milliseconds per stage over several jobs' timings.
+
+    The "total" entry is over each job's stages added up.
+    """
+    per_stage = {}
+    totals = []
+    for timings in job_timings:
+        if not timings:
+            continue
+        for stage, ms in timings.items():
+            per_stage.setdefault(stage, []).append(ms)
+        totals.append(sum(timings.values()))
+    if totals:
+        per_stage["total"] = totals
+    return {
+        stage: {
+            "total_ms": round(sum(values), 3),
+            "p50_ms": _percentile(values, 50),
+            "p95_ms": _percentile(values, 95),
+        }
+        for stage, values in per_stage.items()
+    }
+
+
 def _emit_json(obj) -> None:
     json.dump(obj, sys.stdout, ensure_ascii=False)
     sys.stdout.write("\n")
@@ -265,6 +331,22 @@ def _prepare_reference(reference, subtitle, output_target, tool, config, args):
     return prepared
 
 
+def _sync_record(result, subtitle, reference) -> dict:
+    return {
+        "ok": result.ok,
+        "input": subtitle,
+        "reference": reference,
+        "output": result.output_path,
+        "tool": result.tool_used,
+        "message": result.message,
+        "returncode": result.returncode,
+        "elapsed_ms": result.elapsed_ms,
+        "cancelled": result.cancelled,
+        "timings": result.timings,
+        "processes": [usage.as_dict() for usage in result.processes],
+    }
+
+
 def cmd_sync(args) -> int:
     from subtitle_extractor import cleanup_extracted_subtitles
     from sync_core import run_sync
@@ -281,21 +363,26 @@ def cmd_sync(args) -> int:
     if not is_remote_url(args.video) and not os.path.exists(args.video):
         log.error("Reference not found: %s", args.video)
         return EXIT_USAGE
-    if not os.path.exists(args.subtitle):
-        log.error("Subtitle not found: %s", args.subtitle)
-        return EXIT_USAGE
+    for subtitle in args.subtitles:
+        if not os.path.exists(subtitle):
+            log.error("Subtitle not found: %s", subtitle)
+            return EXIT_USAGE
 
     _ensure_ffmpeg()
+    if len(args.subtitles) > 1:
+        return _cmd_sync_many(args, config)
+
+    subtitle = args.subtitles[0]
     tool = config.get("sync_tool", "ffsubsync")
     callbacks = _build_callbacks(args.json)
     output_path = args.output
     prepared = _prepare_reference(
-        args.video, args.subtitle, output_path, tool, config, args
+        args.video, subtitle, output_path, tool, config, args
     )
     try:
         result = run_sync(
             prepared.effective_reference,
-            args.subtitle,
+            subtitle,
             tool=tool,
             output=output_path,
             config=config,
@@ -303,23 +390,10 @@ def cmd_sync(args) -> int:
         )
     finally:
         cleanup_extracted_subtitles(prepared)
-    if result.ok and result.output_path:
-        _apply_output_encoding(args.subtitle, result.output_path, config)
+    _finish_sync(subtitle, result, prepared, config)
 
     if args.json:
-        _emit_json(
-            {
-                "ok": result.ok,
-                "input": args.subtitle,
-                "reference": args.video,
-                "output": result.output_path,
-                "tool": result.tool_used,
-                "message": result.message,
-                "returncode": result.returncode,
-                "elapsed_ms": result.elapsed_ms,
-                "cancelled": result.cancelled,
-            }
-        )
+        _emit_json(_sync_record(result, subtitle, args.video))
     else:
         if result.ok:
             log.info("Synced -> %s (%dms)", result.output_path, result.elapsed_ms)
@@ -329,17 +403,135 @@ def cmd_sync(args) -> int:
     return EXIT_OK if result.ok else EXIT_SYNC_FAILED
 
 
+def _cmd_sync_many(args, config) -> int:
+    """Sync several subtitles against one reference, decoding it only once.
+
+    -o names an output folder here. Subtitles whose embedded-subtitle
+    extraction picks a different reference are grouped by that reference.
+    """
+    from subtitle_extractor import cleanup_extracted_subtitles
+    from sync_core import run_sync_many
+
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+        config["automatic_save_location"] = "select_destination_folder"
+        config["automatic_save_folder"] = args.output
+    tool = config.get("sync_tool", "ffsubsync")
+    jobs = _resolve_jobs(args.jobs)
+    total = len(args.subtitles)
+
+    groups = {}
+    prepared_refs = []
+    try:
+        for idx, subtitle in enumerate(args.subtitles):
+            prepared = _prepare_reference(
+                args.video, subtitle, args.output, tool, config, args
+            )
+            prepared_refs.append(prepared)
+            groups.setdefault(prepared.effective_reference, []).append(idx)
+
+        _prestart_module_workers(config, min(jobs, total))
+        results = [None] * total
+        for reference, indices in groups.items():
+            group_subs = [args.subtitles[i] for i in indices]
+            group_results = run_sync_many(
+                reference,
+                group_subs,
+                tool=tool,
+                config=config,
+                callbacks=_build_callbacks(args.json, allow_overwrite=jobs == 1),
+                job_callbacks=lambda i, _sub, indices=indices: _build_callbacks(
+                    args.json,
+                    prefix=f"[{indices[i] + 1}/{total}] ",
+                    allow_overwrite=jobs == 1,
+                ),
+                jobs=jobs,
+            )
+            for i, result in zip(indices, group_results):
+                results[i] = result
+    finally:
+        for prepared in prepared_refs:
+            cleanup_extracted_subtitles(prepared)
+
+    ok = 0
+    for subtitle, result, prepared in zip(args.subtitles, results, prepared_refs):
+        _finish_sync(subtitle, result, prepared, config)
+        if result.ok and result.output_path:
+            ok += 1
+        if args.json:
+            _emit_json(_sync_record(result, subtitle, args.video))
+        elif result.ok:
+            log.info("Synced %s -> %s (%dms)", subtitle, result.output_path, result.elapsed_ms)
+        else:
+            log.error("Sync failed for %s: %s", subtitle, result.message)
+    if args.json:
+        _emit_json({"summary": {"total": total, "ok": ok, "failed": total - ok}})
+    return EXIT_OK if ok == total else EXIT_SYNC_FAILED
+
+
+def _build_shift_transform(args):
+    """Transform for the shift command, or None for a plain millisecond shift."""
+    from subtitle_transform import AffineTransform, framerate, parse_time, piecewise
+
+    if args.anchor:
+        if args.milliseconds or args.fps or args.scale is not None:
+            raise ValueError(
+                "--anchor cannot be combined with a millisecond shift, --fps or --scale"
+            )
+        anchors = []
+        for spec in args.anchor:
+            source, sep, target = spec.partition("=")
+            if not sep:
+                raise ValueError(f"Invalid anchor {spec!r}, expected SOURCE=TARGET")
+            anchors.append((parse_time(source), parse_time(target)))
+        return piecewise(anchors)
+    if args.fps and args.scale is not None:
+        raise ValueError("--fps and --scale are mutually exclusive")
+    if args.fps:
+        source, sep, target = args.fps.partition(":")
+        if not sep:
+            raise ValueError(f"Invalid --fps {args.fps!r}, expected SOURCE:TARGET")
+        return framerate(float(source), float(target), args.milliseconds)
+    if args.scale is not None:
+        if args.scale <= 0:
+            raise ValueError("--scale must be positive")
+        return AffineTransform(args.scale, args.milliseconds)
+    return None
+
+
 def cmd_shift(args) -> int:
-    from sync_manual import shift_subtitle
+    # retime_subtitle skips the translated success message, so a shift does
+    # not load texts (and the locale lookup behind it)
+    from sync_manual import (
+        retime_subtitle,
+        retimed_output_path,
+        shifted_output_path,
+    )
 
     if not os.path.exists(args.subtitle):
         log.error("Subtitle not found: %s", args.subtitle)
         return EXIT_USAGE
+    try:
+        transform = _build_shift_transform(args)
+    except ValueError as e:
+        log.error("%s", e)
+        return EXIT_USAGE
 
     start = time.monotonic()
-    output_path, ok, message = shift_subtitle(
-        args.subtitle, args.milliseconds, args.output
-    )
+    if transform is None:
+        from subtitle_transform import offset
+
+        transform = offset(args.milliseconds)
+        description = f"{args.milliseconds:+d}ms"
+        output_path = args.output or shifted_output_path(
+            args.subtitle, args.milliseconds
+        )
+    else:
+        description = transform.describe()
+        output_path = args.output or retimed_output_path(args.subtitle)
+    output_path, error = retime_subtitle(args.subtitle, transform, output_path)
+    ok = error is None
+    message = error or f"Shifted {description} -> {output_path}"
     elapsed_ms = int((time.monotonic() - start) * 1000)
 
     if args.json:
@@ -349,22 +541,144 @@ def cmd_shift(args) -> int:
                 "input": args.subtitle,
                 "output": output_path,
                 "milliseconds": args.milliseconds,
+                "transform": description,
                 "message": message,
                 "elapsed_ms": elapsed_ms,
             }
         )
     else:
         if ok:
-            log.info("Shifted %dms -> %s", args.milliseconds, output_path)
+            log.info("Shifted %s -> %s", description, output_path)
         else:
             log.error("Shift failed: %s", message)
 
     return EXIT_OK if ok else EXIT_SYNC_FAILED
 
 
-def cmd_batch(args) -> int:
+def _resolve_jobs(value) -> int:
+    """Translate the --jobs argument into a worker count (0 = one per CPU)."""
+    if value is None:
+        return 1
+    if value <= 0:
+        return max(1, os.cpu_count() or 1)
+    return value
+
+
+def _sync_batch_pair(idx, total, video, subtitle, output, config, args, ctx) -> dict:
+    """Run one batch pair end-to-end and return its NDJSON record.
+
+    Safe to call from worker threads: pairs that share a reference are
+    serialized through a per-reference lock because embedded-subtitle
+    extraction uses a folder named after the reference, and output is the
+    path cmd_batch planned for the pair, so no two pairs write the same file.
+    """
     from subtitle_extractor import cleanup_extracted_subtitles
-    from sync_core import determine_output_path, run_sync
+    from sync_core import run_sync
+    from constants import SUBTITLE_EXTENSIONS
+
+    prefix = f"[{idx}/{total}] "
+    callbacks = _build_callbacks(
+        args.json, prefix=prefix, allow_overwrite=ctx["jobs"] == 1
+    )
+    callbacks.is_cancelled = ctx["abort"].is_set
+    tool = config.get("sync_tool", "ffsubsync")
+    extract_dir = (
+        args.output_dir
+        if args.output_dir
+        else os.path.dirname(os.path.abspath(subtitle))
+    )
+    with ctx["reference_lock"](video):
+        if ctx["abort"].is_set():
+            return {
+                "ok": False,
+                "skipped": False,
+                "input": subtitle,
+                "reference": video,
+                "output": None,
+                "tool": tool,
+                "message": "cancelled",
+                "returncode": None,
+                "elapsed_ms": 0,
+                "cancelled": True,
+                "timings": {},
+                "processes": [],
+            }
+        log.info("%s%s + %s", prefix, video, subtitle)
+        prepared = _prepare_reference(video, subtitle, extract_dir, tool, config, args)
+        try:
+            result = run_sync(
+                prepared.effective_reference,
+                subtitle,
+                tool=tool,
+                output=output,
+                config=config,
+                callbacks=callbacks,
+            )
+        finally:
+            cleanup_extracted_subtitles(prepared)
+    _finish_sync(subtitle, result, prepared, config)
+    if result.ok and result.output_path:
+        processed_mgr = ctx["processed_mgr"]
+        if ctx["mark"] and processed_mgr is not None:
+            ext = os.path.splitext(video)[1].lower()
+            if ext not in SUBTITLE_EXTENSIONS:
+                try:
+                    processed_mgr.mark_as_processed(video, silent=True)
+                except Exception as e:
+                    log.warning("mark_as_processed failed: %s", e)
+    return {
+        "ok": result.ok,
+        "skipped": False,
+        "input": subtitle,
+        "reference": video,
+        "output": result.output_path,
+        "tool": result.tool_used,
+        "message": result.message,
+        "returncode": result.returncode,
+        "elapsed_ms": result.elapsed_ms,
+        "cancelled": result.cancelled,
+        "timings": result.timings,
+        "processes": [usage.as_dict() for usage in result.processes],
+    }
+
+
+def _prestart_module_workers(config, count):
+    """Warm up pool workers for a module-based tool before a parallel batch."""
+    from constants import SYNC_TOOLS
+
+    tool_info = SYNC_TOOLS.get(config.get("sync_tool", "ffsubsync"), {})
+    if tool_info.get("type") != "module":
+        return
+    try:
+        from worker_pool import get_module_worker_pool
+
+        pool = get_module_worker_pool()
+        if pool is not None:
+            pool.prestart(tool_info["module"], count)
+    except Exception as e:
+        log.debug("Could not prestart module workers: %s", e)
+
+
+def _reference_locks():
+    """Return a factory of per-reference locks for concurrent batch jobs."""
+    import threading
+
+    guard = threading.Lock()
+    locks = {}
+
+    def get(path):
+        key = os.path.normcase(os.path.abspath(path))
+        with guard:
+            lock = locks.get(key)
+            if lock is None:
+                lock = locks[key] = threading.Lock()
+        return lock
+
+    return get
+
+
+def cmd_batch(args) -> int:
+    import threading
     from pairing import pair_paths, pair_folder, pair_folders
     from constants import SUBTITLE_EXTENSIONS
 
@@ -425,123 +739,151 @@ def cmd_batch(args) -> int:
 
     _ensure_ffmpeg()
     total = len(pairs)
-    ok_count = 0
-    fail_count = 0
-    skip_count = 0
+    jobs = _resolve_jobs(getattr(args, "jobs", None))
+    counts = {"ok": 0, "failed": 0, "skipped": 0, "cancelled": 0}
     failed_pairs = []
+    job_timings = []
+    ctx = {
+        "jobs": jobs,
+        "mark": mark,
+        "processed_mgr": processed_mgr,
+        "abort": threading.Event(),
+        "reference_lock": _reference_locks(),
+    }
+
+    processed = {}
+    if skip and processed_mgr is not None:
+        videos = [
+            video
+            for video, _ in pairs
+            if os.path.splitext(video)[1].lower() not in SUBTITLE_EXTENSIONS
+        ]
+        try:
+            processed = processed_mgr.is_processed_many(videos)
+        except Exception as e:
+            log.warning("is_processed check failed: %s", e)
 
+    queue = []
     for idx, (video, subtitle) in enumerate(pairs, 1):
-        if skip and processed_mgr is not None:
-            ext = os.path.splitext(video)[1].lower()
-            if ext not in SUBTITLE_EXTENSIONS:
-                try:
-                    if processed_mgr.is_processed(video):
-                        skip_count += 1
-                        log.info(
-                            "[%d/%d] skip (already processed): %s", idx, total, video
-                        )
-                        if args.json:
-                            _emit_json(
-                                {
-                                    "ok": True,
-                                    "skipped": True,
-                                    "input": subtitle,
-                                    "reference": video,
-                                    "output": None,
-                                    "message": "previously processed",
-                                }
-                            )
-                        continue
-                except Exception as e:
-                    log.warning("is_processed check failed for %s: %s", video, e)
-
-        callbacks = _build_callbacks(args.json, prefix=f"[{idx}/{total}] ")
-        log.info("[%d/%d] %s + %s", idx, total, video, subtitle)
-        tool = config.get("sync_tool", "ffsubsync")
-        extract_dir = (
-            args.output_dir
-            if args.output_dir
-            else os.path.dirname(os.path.abspath(subtitle))
-        )
-        prepared = _prepare_reference(
-            video, subtitle, extract_dir, tool, config, args
-        )
-        try:
-            result = run_sync(
-                prepared.effective_reference,
-                subtitle,
-                tool=tool,
-                output=None,
-                config=config,
-                callbacks=callbacks,
-            )
-        finally:
-            cleanup_extracted_subtitles(prepared)
-        if result.ok and result.output_path:
-            _apply_output_encoding(subtitle, result.output_path, config)
-            if mark and processed_mgr is not None:
-                ext = os.path.splitext(video)[1].lower()
-                if ext not in SUBTITLE_EXTENSIONS:
-                    try:
-                        processed_mgr.mark_as_processed(video, silent=True)
-                    except Exception as e:
-                        log.warning("mark_as_processed failed: %s", e)
+        if processed.get(video):
+            counts["skipped"] += 1
+            log.info("[%d/%d] skip (already processed): %s", idx, total, video)
+            if args.json:
+                _emit_json(
+                    {
+                        "ok": True,
+                        "skipped": True,
+                        "input": subtitle,
+                        "reference": video,
+                        "output": None,
+                        "message": "previously processed",
+                    }
+                )
+            continue
+        queue.append((idx, video, subtitle))
 
-        if args.json:
-            _emit_json(
-                {
-                    "ok": result.ok,
-                    "skipped": False,
-                    "input": subtitle,
-                    "reference": video,
-                    "output": result.output_path,
-                    "tool": result.tool_used,
-                    "message": result.message,
-                    "returncode": result.returncode,
-                    "elapsed_ms": result.elapsed_ms,
-                }
-            )
+    # Plan every output before any pair runs: concurrent pairs that map to
+    # the same name would otherwise all see it free and overwrite each other
+    from sync_core import plan_output_paths
 
-        if result.ok:
-            ok_count += 1
+    outputs = plan_output_paths(
+        [(video, subtitle) for _, video, subtitle in queue],
+        tool=config.get("sync_tool", "ffsubsync"),
+        config=config,
+    )
+    queue = [
+        (idx, video, subtitle, output)
+        for (idx, video, subtitle), output in zip(queue, outputs)
+    ]
+
+    def record(entry) -> bool:
+        """Account for one finished pair; returns False when the batch must abort."""
+        if args.json:
+            _emit_json(entry)
+        job_timings.append(entry["timings"])
+        if entry["ok"]:
+            counts["ok"] += 1
+        elif entry.get("cancelled"):
+            counts["cancelled"] += 1
         else:
-            fail_count += 1
-            failed_pairs.append((video, subtitle, result.message))
+            counts["failed"] += 1
+            failed_pairs.append((entry["reference"], entry["input"], entry["message"]))
             if not args.continue_on_error:
-                log.error("Aborting batch on first failure (use --continue-on-error)")
-                if args.json:
-                    _emit_json(
-                        {
-                            "summary": {
-                                "total": total,
-                                "ok": ok_count,
-                                "failed": fail_count,
-                                "skipped": skip_count,
-                                "aborted": True,
-                            }
-                        }
-                    )
-                return EXIT_SYNC_FAILED
+                return False
+        return True
+
+    aborted = False
+    if jobs == 1 or len(queue) <= 1:
+        for idx, video, subtitle, output in queue:
+            entry = _sync_batch_pair(
+                idx, total, video, subtitle, output, config, args, ctx
+            )
+            if not record(entry):
+                aborted = True
+                break
+    else:
+        from concurrent.futures import ThreadPoolExecutor, as_completed
 
+        log.info("Running %d pairs with %d parallel jobs", len(queue), jobs)
+        _prestart_module_workers(config, min(jobs, len(queue)))
+        executor = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="assy-batch")
+        try:
+            futures = [
+                executor.submit(
+                    _sync_batch_pair,
+                    idx,
+                    total,
+                    video,
+                    subtitle,
+                    output,
+                    config,
+                    args,
+                    ctx,
+                )
+                for idx, video, subtitle, output in queue
+            ]
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                if not record(future.result()) and not aborted:
+                    aborted = True
+                    ctx["abort"].set()
+                    for pending in futures:
+                        pending.cancel()
+        finally:
+            # Interrupts and unexpected errors must not leave syncs running.
+            if not aborted:
+                ctx["abort"].set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    if aborted:
+        log.error("Aborting batch on first failure (use --continue-on-error)")
+
+    summary = {
+        "total": total,
+        "ok": counts["ok"],
+        "failed": counts["failed"],
+        "skipped": counts["skipped"],
+    }
+    if counts["cancelled"]:
+        summary["cancelled"] = counts["cancelled"]
+    if aborted:
+        summary["aborted"] = True
+    stage_timings = _timing_summary(job_timings)
+    if stage_timings:
+        summary["timings"] = stage_timings
     if args.json:
-        _emit_json(
-            {
-                "summary": {
-                    "total": total,
-                    "ok": ok_count,
-                    "failed": fail_count,
-                    "skipped": skip_count,
-                }
-            }
-        )
+        _emit_json({"summary": summary})
+    if aborted:
+        return EXIT_SYNC_FAILED
     log.info(
         "Batch complete: %d/%d ok, %d failed, %d skipped",
-        ok_count,
+        counts["ok"],
         total,
-        fail_count,
-        skip_count,
+        counts["failed"],
+        counts["skipped"],
     )
-    return EXIT_OK if fail_count == 0 else EXIT_SYNC_FAILED
+    return EXIT_OK if counts["failed"] == 0 else EXIT_SYNC_FAILED
 
 
 def _parse_config_value(value: str):
@@ -624,6 +966,104 @@ def cmd_config(args) -> int:
     return EXIT_USAGE
 
 
+def cmd_db(args) -> int:
+    from processed_items_manager import get_processed_items_manager
+
+    manager = get_processed_items_manager()
+
+    if args.db_op == "path":
+        print(manager.get_db_path())
+        return EXIT_OK
+
+    if args.db_op == "prune":
+        removed = manager.prune_fingerprints()
+        if removed < 0:
+            return EXIT_SYNC_FAILED
+        log.info(
+            "Removed %d stale fingerprints, %d remain",
+            removed,
+            manager.get_fingerprint_count(),
+        )
+        print(removed)
+        return EXIT_OK
+
+    log.error("Unknown db op: %s", args.db_op)
+    return EXIT_USAGE
+
+
+def cmd_bench(args) -> int:
+    import tempfile
+    import shutil
+    from bench import run_benchmark
+
+    for name in ("durations", "counts"):
+        if any(value <= 0 for value in getattr(args, name)):
+            log.error("--%s values must be positive", name)
+            return EXIT_USAGE
+    if args.max_jobs is not None and args.max_jobs <= 0:
+        log.error("--max-jobs must be positive")
+        return EXIT_USAGE
+
+    config = _effective_config(args)
+    config["backup_subtitles_before_overwriting"] = False
+    tools = args.tool or list(TOOL_CHOICES)
+    _ensure_ffmpeg()
+
+    directory = args.output_dir or tempfile.mkdtemp(prefix="assy-bench-")
+    try:
+        report = run_benchmark(
+            directory,
+            config,
+            tools=tools,
+            durations=args.durations,
+            counts=args.counts,
+            repeat=args.repeat,
+            seed=args.seed,
+            max_jobs=args.max_jobs,
+            jobs_tool=config.get("sync_tool", "ffsubsync"),
+        )
+    finally:
+        if not args.output_dir:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    if args.json:
+        _emit_json(report)
+    else:
+        for record in report["tools"]:
+            if record["ok"]:
+                log.info(
+                    "%s on %ds: %dms, %sms off",
+                    record["tool"],
+                    record["duration_s"],
+                    record["elapsed_ms"],
+                    record["error_ms"],
+                )
+            else:
+                log.warning(
+                    "%s on %ds failed: %s",
+                    record["tool"],
+                    record["duration_s"],
+                    record["message"],
+                )
+        for name in ("converters", "shifter", "pairer"):
+            total = sum(record["median_ms"] for record in report[name])
+            log.info("%s: %.1fms (sum of medians)", name, total)
+        for record in report["database"]:
+            log.info(
+                "database, %d files: mark %.1fms, lookup %.1fms",
+                record["count"],
+                record["mark_median_ms"],
+                record["lookup_median_ms"],
+            )
+        jobs = report["jobs"]
+        if jobs["recommended"] is None:
+            log.warning("No tool synced the corpus; no --jobs recommendation")
+        else:
+            print(jobs["recommended"])
+            log.info("Recommended: --jobs %d with %s", jobs["recommended"], jobs["tool"])
+    return EXIT_OK
+
+
 def cmd_version(args) -> int:
     from constants import VERSION
 
@@ -677,8 +1117,17 @@ def build_parser() -> argparse.ArgumentParser:
         "sync", help="Auto-sync one subtitle to a video or reference subtitle"
     )
     s.add_argument("video", help="Video or reference subtitle path")
-    s.add_argument("subtitle", help="Subtitle file to sync")
-    s.add_argument("-o", "--output", help="Output subtitle path (overrides save-mode)")
+    s.add_argument(
+        "subtitles",
+        nargs="+",
+        metavar="subtitle",
+        help="Subtitle file(s) to sync; several share one reference decode",
+    )
+    s.add_argument(
+        "-o",
+        "--output",
+        help="Output subtitle path (overrides save-mode); a folder with several subtitles",
+    )
     s.add_argument("-t", "--tool", choices=TOOL_CHOICES, help="Sync engine")
     s.add_argument(
         "--save-mode",
@@ -709,17 +1158,44 @@ def build_parser() -> argparse.ArgumentParser:
         help="Add custom suffix to the output filename",
         metavar="SUFFIX",
     )
+    s.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Subtitles to align concurrently with several inputs (default: 0 = one per CPU core)",
+    )
     add_embedded_subtitle_flags(s)
     s.add_argument("--json", action="store_true", help="Emit JSON result on stdout")
     s.set_defaults(handler=cmd_sync)
 
     # shift
-    sh = sub.add_parser("shift", help="Shift subtitle timing by milliseconds")
+    sh = sub.add_parser(
+        "shift", help="Shift subtitle timing by milliseconds or retime it"
+    )
     sh.add_argument("subtitle", help="Subtitle file to shift")
     sh.add_argument(
         "milliseconds",
         type=int,
-        help="Shift in ms (positive = delay, negative = advance)",
+        nargs="?",
+        default=0,
+        help="Shift in ms (positive = delay, negative = advance), applied after --fps/--scale",
+    )
+    sh.add_argument(
+        "--fps",
+        metavar="SOURCE:TARGET",
+        help="Convert between frame rates, e.g. 23.976:25",
+    )
+    sh.add_argument(
+        "--scale", type=float, metavar="FACTOR", help="Multiply every timestamp by FACTOR"
+    )
+    sh.add_argument(
+        "--anchor",
+        action="append",
+        metavar="SOURCE=TARGET",
+        help="Move time SOURCE to TARGET (ms or HH:MM:SS,mmm); repeat for a "
+        "piecewise-linear retime between anchors",
     )
     sh.add_argument("-o", "--output", help="Output subtitle path")
     sh.add_argument("--json", action="store_true", help="Emit JSON result on stdout")
@@ -808,10 +1284,18 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Keep going after individual sync failures",
     )
+    b.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of pairs to sync concurrently (default: 1, 0 = one per CPU core)",
+    )
     b.add_argument(
         "--json",
         action="store_true",
-        help="Emit one JSON line per pair plus a summary line",
+        help="Emit one JSON line per finished pair plus a summary line",
     )
     b.set_defaults(handler=cmd_batch)
 
@@ -834,6 +1318,69 @@ def build_parser() -> argparse.ArgumentParser:
     cu.add_argument("key")
     c.set_defaults(handler=cmd_config)
 
+    # db
+    d = sub.add_parser("db", help="Maintain the sync-tracking database")
+    dsub = d.add_subparsers(dest="db_op")
+    dsub.add_parser("path", help="Print the database file path")
+    dsub.add_parser(
+        "prune", help="Drop cached fingerprints of moved, changed or deleted files"
+    )
+    d.set_defaults(handler=cmd_db)
+
+    # bench
+    bn = sub.add_parser(
+        "bench",
+        help="Benchmark the tools on a synthetic corpus and recommend --jobs",
+    )
+    bn.add_argument(
+        "-t",
+        "--tool",
+        choices=TOOL_CHOICES,
+        action="append",
+        help="Sync engine to time (may be repeated; default: all)",
+    )
+    bn.add_argument(
+        "--durations",
+        type=int,
+        nargs="+",
+        default=[60, 300],
+        metavar="SECONDS",
+        help="Lengths of the synthetic episodes (default: 60 300)",
+    )
+    bn.add_argument(
+        "--counts",
+        type=int,
+        nargs="+",
+        default=[100, 1000],
+        metavar="N",
+        help="Library sizes for the pairer and tracking DB (default: 100 1000)",
+    )
+    bn.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        metavar="N",
+        help="Runs per converter, shifter, pairer and DB timing (default: 3)",
+    )
+    bn.add_argument(
+        "--max-jobs",
+        type=int,
+        metavar="N",
+        help="Highest --jobs value to try (default: one per CPU core)",
+    )
+    bn.add_argument(
+        "--seed", type=int, default=0, help="Corpus seed (default: 0)"
+    )
+    bn.add_argument(
+        "-o",
+        "--output-dir",
+        help="Keep the corpus in this directory instead of a temporary one",
+    )
+    bn.add_argument(
+        "--json", action="store_true", help="Emit the JSON report on stdout"
+    )
+    bn.set_defaults(handler=cmd_bench)
+
     # version
     v = sub.add_parser("version", help="Print AutoSubSync version")
     v.set_defaults(handler=cmd_version)
@@ -853,6 +1400,9 @@ def main(argv=None) -> int:
         # argparse subsubparsers don't enforce required=True by default
         parser.parse_args(["config", "--help"])
         return EXIT_USAGE
+    if args.subcommand == "db" and not getattr(args, "db_op", None):
+        parser.parse_args(["db", "--help"])
+        return EXIT_USAGE
 
     # Map SIGINT to a clean exit code
     def _sigint(_signum, _frame):
@@ -1,52 +1,8 @@
 import os
 import platform
 import sys
-from utils import get_version, get_resource_path, get_version_info
 
-
-class TranslationDict(str):
-    def __new__(cls, translations):
-        # Import here to avoid circular import
-        from utils import get_locale
-
-        language = get_locale()
-        # Create the string instance with the current language translation
-        current_text = translations.get(language, translations.get("en_US", ""))
-        instance = str.__new__(cls, current_text)
-        instance._translations = translations
-        return instance
-
-    def __missing__(self, key):
-        return self._translations.get("en_US", "")
-
-    def __str__(self):
-        from utils import get_locale
-
-        language = get_locale()
-        return self._translations.get(language, self._translations.get("en_US", ""))
-
-    def __repr__(self):
-        return repr(str(self))
-
-    def __eq__(self, other):
-        return str(self) == (str(other) if other is not None else None)
-
-    def __ne__(self, other):
-        return not (self == other)
-
-    def __hash__(self):
-        return hash(str(self))
-
-    def format(self, *args, **kwargs):
-        from utils import get_locale
-
-        language = get_locale()
-        return self._translations.get(
-            language, self._translations.get("en_US", "")
-        ).format(*args, **kwargs)
-
-    def get(self, key, default=""):
-        return self._translations.get(key, default)
+from translations import TranslationDict, translate_tree
 
 
 LANGUAGES = {
@@ -78,7 +34,7 @@ LANGUAGES = {
 # Program Information
 PROGRAM_NAME = "AutoSubSync"
 
-PROGRAM_TAGLINE = {
+_PROGRAM_TAGLINE = {
     "en_US": "Subtitle Synchronizer",
     "es_ES": "Sincronizador de Subtítulos",
     "tr_TR": "Altyazı Senkronizatörü",
@@ -104,7 +60,7 @@ PROGRAM_TAGLINE = {
     "zh_TW": "字幕同步工具",
 }
 
-PROGRAM_DESCRIPTION = {
+_PROGRAM_DESCRIPTION = {
     "en_US": "AutoSubSync is a user-friendly Python tool that helps you easily synchronize subtitle files. It supports various subtitle formats and allows you to sync subtitles effortlessly by shifting subtitle timings automatically or manually with a millisecond offset.",
     "es_ES": "AutoSubSync es una herramienta de Python fácil de usar que te ayuda a sincronizar archivos de subtítulos fácilmente. Compatible con varios formatos de subtítulos y permite sincronizar subtítulos sin esfuerzo ajustando los tiempos automática o manualmente con un desplazamiento en milisegundos.",
     "tr_TR": "AutoSubSync, altyazı dosyalarını kolayca senkronize etmenize yardımcı olan kullanıcı dostu bir Python aracıdır. Çeşitli altyazı formatlarını destekler ve altyazı zamanlamalarını otomatik veya manuel olarak milisaniye kayması ile değiştirerek altyazıları zahmetsizce senkronize etmenizi sağlar.",
@@ -133,10 +89,9 @@ PROGRAM_DESCRIPTION = {
 GITHUB_URL = "https://github.com/denizsafak/AutoSubSync"
 GITHUB_VERSION_URL = "https://raw.githubusercontent.com/denizsafak/AutoSubSync/refs/heads/main/main/VERSION"
 GITHUB_LATEST_RELEASE_URL = "https://github.com/denizsafak/AutoSubSync/releases/latest"
-VERSION = get_version()
 
-DEFAULT_OPTIONS = {
-    "language": "en_US",  # Will be set properly after LANGUAGES is defined
+_DEFAULT_OPTIONS = {
+    "language": "en_US",  # Replaced with the system locale when DEFAULT_OPTIONS is built
     "sync_tool": "ffsubsync",
     "automatic_save_location": "save_next_to_input_subtitle",
     "manual_save_location": "save_next_to_input_subtitle",
@@ -155,40 +110,41 @@ DEFAULT_OPTIONS = {
     "skip_previously_processed_videos": True,
     "auto_rename_bracket_paths": False,
     "disable_alass_rename_prompt": False,
+    "batch_concurrency": 1,
 }
 
-# ffmpeg and ffprobe paths
-_exe_suffix = ".exe" if platform.system() == "Windows" else ""
-_ffmpeg_res = get_resource_path("resources.ffmpeg-bin", f"ffmpeg{_exe_suffix}")
-_ffprobe_res = get_resource_path("resources.ffmpeg-bin", f"ffprobe{_exe_suffix}")
 
-# Check if bundled executables exist
-if (
-    _ffmpeg_res
-    and _ffprobe_res
-    and os.path.isfile(_ffmpeg_res)
-    and os.path.isfile(_ffprobe_res)
-):
-    FFMPEG_EXECUTABLE = os.path.normpath(_ffmpeg_res)
-    FFPROBE_EXECUTABLE = os.path.normpath(_ffprobe_res)
-    FFMPEG_DIR = os.path.dirname(FFMPEG_EXECUTABLE)
-else:
-    # For pip installs (not in frozen builds), defer static_ffmpeg initialization
-    # until after GUI loads to show download progress
-    FFMPEG_EXECUTABLE = "ffmpeg"
-    FFPROBE_EXECUTABLE = "ffprobe"
-    FFMPEG_DIR = None
+def _resolve_ffmpeg():
+    """ffmpeg and ffprobe paths."""
+    from utils import get_resource_path
 
-# Flag to indicate if static_ffmpeg needs to be initialized
-NEEDS_STATIC_FFMPEG = (
-    not getattr(sys, "frozen", False)
-    and not (
-        _ffmpeg_res
-        and _ffprobe_res
-        and os.path.isfile(_ffmpeg_res)
-        and os.path.isfile(_ffprobe_res)
+    exe_suffix = ".exe" if platform.system() == "Windows" else ""
+    ffmpeg_res = get_resource_path("resources.ffmpeg-bin", f"ffmpeg{exe_suffix}")
+    ffprobe_res = get_resource_path("resources.ffmpeg-bin", f"ffprobe{exe_suffix}")
+
+    # Check if bundled executables exist
+    bundled = bool(
+        ffmpeg_res
+        and ffprobe_res
+        and os.path.isfile(ffmpeg_res)
+        and os.path.isfile(ffprobe_res)
     )
-)
+    if bundled:
+        ffmpeg = os.path.normpath(ffmpeg_res)
+        ffprobe = os.path.normpath(ffprobe_res)
+        ffmpeg_dir = os.path.dirname(ffmpeg)
+    else:
+        # For pip installs (not in frozen builds), defer static_ffmpeg initialization
+        # until after GUI loads to show download progress
+        ffmpeg, ffprobe, ffmpeg_dir = "ffmpeg", "ffprobe", None
+    return {
+        "FFMPEG_EXECUTABLE": ffmpeg,
+        "FFPROBE_EXECUTABLE": ffprobe,
+        "FFMPEG_DIR": ffmpeg_dir,
+        # Flag to indicate if static_ffmpeg needs to be initialized
+        "NEEDS_STATIC_FFMPEG": not getattr(sys, "frozen", False) and not bundled,
+    }
+
 
 REMOTE_URL_PROTOCOLS = (
     "http://",
@@ -206,1394 +162,1613 @@ def is_remote_url(path) -> bool:
     return path.startswith(REMOTE_URL_PROTOCOLS)
 
 
-# Synchronization tools
-SYNC_TOOLS = {
-    "ffsubsync": {
-        "version": get_version_info("ffsubsync"),
-        "description": {
-            "en_US": "Automagically synchronize subtitles with video",
-            "es_ES": "Sincroniza automáticamente los subtítulos con el video",
-            "tr_TR": "Altyazıları videoyla otomatik olarak senkronize edin",
-            "zh_CN": "自动将字幕与视频同步",
-            "ru_RU": "Автоматически синхронизируйте субтитры с видео",
-            "pl_PL": "Automatycznie synchronizuj napisy z wideo",
-            "uk_UA": "Автоматично синхронізуйте субтитри з відео",
-            "ja_JP": "字幕を動画と自動的に同期します",
-            "ko_KR": "자막을 비디오와 자동으로 동기화합니다",
-            "hi_IN": "स्वचालित रूप से उपशीर्षकों को वीडियो के साथ सिंक्रनाइज़ करें",
-            "bn_BD": "স্বয়ংক্রিয়ভাবে সাবটাইটেল ভিডিওর সাথে সিঙ্ক করুন",
-            "it_IT": "Sincronizza automaticamente i sottotitoli con il video",
-            "fr_FR": "Synchronisez automatiquement les sous-titres avec la vidéo",
-            "de_DE": "Synchronisieren Sie Untertitel automatisch mit dem Video",
-            "pt_PT": "Sincronize automaticamente as legendas com o vídeo",
-            "ar_SA": "قم بمزامنة الترجمات مع الفيديو تلقائيًا",
-            "vi_VN": "Tự động đồng bộ phụ đề với video",
-            "fa_IR": "زیرنویس‌ها را به طور خودکار با ویدیو همگام‌سازی کنید",
-            "id_ID": "Sinkronkan subtitle dengan video secara otomatis",
-            "ms_MY": "Segerakkan sarikata dengan video secara automatik",
-            "th_TH": "ซิงค์คำบรรยายกับวิดีโอโดยอัตโนมัติ",
-            "ur_PK": "سب ٹائٹلز کو ویڈیو کے ساتھ خودکار طور پر سنکرونائز کریں",
-            "zh_TW": "自動將字幕與影片同步",
-        },
-        "github": "https://github.com/smacke/ffsubsync",
-        "documentation": "https://ffsubsync.readthedocs.io/",
-        "supported_formats": [".srt", ".ass", ".ssa", ".vtt"],
-        "supports_subtitle_as_reference": True,
-        "type": "module",
-        "module": "call_ffsubsync",
-        "cmd_structure": ["{reference}", "-i", "{subtitle}", "-o", "{output}"],
-        "options": {
-            "dont_fix_framerate": {
-                "type": "checkbox",
-                "label": {
-                    "en_US": "Don't fix framerate",
-                    "es_ES": "No corregir velocidad de fotogramas",
-                    "tr_TR": "Kare hızını düzeltme",
-                    "zh_CN": "不修复帧率",
-                    "ru_RU": "Не исправлять частоту кадров",
-                    "pl_PL": "Nie naprawiaj klatek na sekundę",
-                    "uk_UA": "Не виправляти частоту кадрів",
-                    "ja_JP": "フレームレートを修正しない",
-                    "ko_KR": "프레임레이트 수정하지 않음",
-                    "hi_IN": "फ्रेमरेट को ठीक न करें",
-                    "bn_BD": "ফ্রেমরেট ঠিক করবেন না",
-                    "it_IT": "Non correggere il framerate",
-                    "fr_FR": "Ne pas corriger la fréquence d'images",
-                    "de_DE": "Bildrate nicht korrigieren",
-                    "pt_PT": "Não corrigir taxa de quadros",
-                    "ar_SA": "لا تصحح معدل الإطارات",
-                    "vi_VN": "Không sửa tốc độ khung hình",
-                    "fa_IR": "نرخ فریم را اصلاح نکنید",
-                    "id_ID": "Jangan perbaiki framerate",
-                    "ms_MY": "Jangan betulkan kadar bingkai",
-                    "th_TH": "ไม่ต้องแก้ไขอัตราเฟรม",
-                    "ur_PK": "فریم ریٹ کو ٹھیک نہ کریں",
-                    "zh_TW": "不修復幀率",
-                },
-                "tooltip": {
-                    "en_US": "If specified, ffsubsync will not attempt to correct a framerate mismatch between reference and subtitles.\nThis can be useful when you know that the video and subtitle framerates are same, only the subtitles are out of sync.",
-                    "es_ES": "Si se especifica, ffsubsync no intentará corregir una discrepancia de velocidad de fotogramas entre la referencia y los subtítulos.\nEsto puede ser útil cuando sabes que las velocidades de fotogramas del video y los subtítulos son iguales, solo los subtítulos están desincronizados.",
-                    "tr_TR": "Belirtilirse, ffsubsync referans ve altyazılar arasındaki kare hızı uyumsuzluğunu düzeltmeye çalışmayacaktır.\nBu, video ve altyazı kare hızlarının aynı olduğunu bildiğinizde, sadece altyazıların senkronizasyon dışında olduğu durumlarda yararlı olabilir.",
-                    "zh_CN": "如果指定，ffsubsync将不会尝试纠正参考和字幕之间的帧率不匹配。\n当您知道视频和字幕帧率相同，只是字幕不同步时，这可能很有用。",
-                    "ru_RU": "Если указано, ffsubsync не будет пытаться исправить несоответствие частоты кадров между эталоном и субтитрами.\nЭто может быть полезно, когда вы знаете, что частота кадров видео и субтитров одинакова, только субтитры не синхронизированы.",
-                    "pl_PL": "Jeśli określono, ffsubsync nie będzie próbował poprawić niezgodności klatek na sekundę między referencją a napisami.\nMoże to być przydatne, gdy wiesz, że klatki na sekundę wideo i napisów są takie same, tylko napisy są poza synchronizacją.",
-                    "uk_UA": "Якщо вказано, ffsubsync не спробує виправити невідповідність частоти кадрів між еталоном та субтитрами.\nЦе може бути корисно, коли ви знаєте, що частота кадрів відео та субтитрів однакова, лише субтитри не синхронізовані.",
-                    "ja_JP": "指定した場合、ffsubsyncは参照と字幕間のフレームレートの不一致を修正しようとしません。\nビデオと字幕のフレームレートが同じで、字幕のみが同期していないことがわかっている場合に役立ちます。",
-                    "ko_KR": "지정하면 ffsubsync는 참조와 자막 간의 프레임레이트 불일치를 수정하려고 시도하지 않습니다.\n비디오와 자막 프레임레이트가 동일하고 자막만 동기화되지 않았다는 것을 알고 있을 때 유용할 수 있습니다.",
-                    "hi_IN": "यदि निर्दिष्ट किया गया है, तो ffsubsync संदर्भ और उपशीर्षक के बीच फ्रेमरेट बेमेल को ठीक करने का प्रयास नहीं करेगा।\nयह तब उपयोगी हो सकता है जब आप जानते हैं कि वीडियो और उपशीर्षक फ्रेमरेट समान हैं, केवल उपशीर्षक सिंक से बाहर हैं।",
-                    "bn_BD": "যদি নির্দিষ্ট করা হয়, ffsubsync রেফারেন্স এবং সাবটাইটেলের মধ্যে ফ্রেমরেট অমিল সংশোধন করার চেষ্টা করবে না।\nএটি কার্যকর হতে পারে যখন আপনি জানেন যে ভিডিও এবং সাবটাইটেল ফ্রেমরেট একই, শুধুমাত্র সাবটাইটেল সিঙ্কের বাইরে।",
-                    "it_IT": "Se specificato, ffsubsync non tenterà di correggere una discrepanza di framerate tra riferimento e sottotitoli.\nQuesto può essere utile quando sai che i framerate del video e dei sottotitoli sono uguali, solo i sottotitoli sono fuori sincrono.",
-                    "fr_FR": "Si spécifié, ffsubsync ne tentera pas de corriger une discordance de fréquence d'images entre la référence et les sous-titres.\nCela peut être utile lorsque vous savez que les fréquences d'images de la vidéo et des sous-titres sont identiques, seuls les sous-titres sont désynchronisés.",
-                    "de_DE": "Falls angegeben, wird ffsubsync nicht versuchen, eine Bildrate-Diskrepanz zwischen Referenz und Untertiteln zu korrigieren.\nDies kann nützlich sein, wenn Sie wissen, dass die Video- und Untertitel-Bildraten gleich sind, nur die Untertitel nicht synchron sind.",
-                    "pt_PT": "Se especificado, o ffsubsync não tentará corrigir uma incompatibilidade de taxa de quadros entre referência e legendas.\nIsto pode ser útil quando sabe que as taxas de quadros do vídeo e das legendas são iguais, apenas as legendas estão fora de sincronia.",
-                    "ar_SA": "إذا تم تحديده، فلن يحاول ffsubsync تصحيح عدم تطابق معدل الإطارات بين المرجع والترجمات.\nيمكن أن يكون هذا مفيدًا عندما تعلم أن معدلات إطارات الفيديو والترجمات متماثلة، فقط الترجمات غير متزامنة.",
-                    "vi_VN": "Nếu được chỉ định, ffsubsync sẽ không cố gắng sửa chữa sự không khớp tốc độ khung hình giữa tham chiếu và phụ đề.\nĐiều này có thể hữu ích khi bạn biết rằng tốc độ khung hình video và phụ đề giống nhau, chỉ có phụ đề bị lệch đồng bộ.",
-                    "fa_IR": "اگر مشخص شود، ffsubsync تلاش نخواهد کرد تا عدم تطبیق نرخ فریم بین مرجع و زیرنویس را اصلاح کند.\nاین می‌تواند مفید باشد وقتی می‌دانید که نرخ فریم ویدیو و زیرنویس یکسان است، فقط زیرنویس‌ها همگام نیستند.",
-                    "id_ID": "Jika ditentukan, ffsubsync tidak akan mencoba memperbaiki ketidakcocokan framerate antara referensi dan subtitle.\nIni bisa berguna ketika Anda tahu bahwa framerate video dan subtitle sama, hanya subtitle yang tidak sinkron.",
-                    "ms_MY": "Jika dinyatakan, ffsubsync tidak akan cuba membetulkan ketidakpadanan kadar bingkai antara rujukan dan sarikata.\nIni boleh berguna apabila anda tahu bahawa kadar bingkai video dan sarikata adalah sama, hanya sarikata yang tidak segerak.",
-                    "th_TH": "หากระบุ ffsubsync จะไม่พยายามแก้ไขความไม่ตรงกันของอัตราเฟรมระหว่างอ้างอิงและคำบรรยาย\nสิ่งนี้อาจมีประโยชน์เมื่อคุณรู้ว่าอัตราเฟรมของวิดีโอและคำบรรยายเหมือนกัน เพียงแค่คำบรรยายไม่ตรงกัน",
-                    "ur_PK": "اگر مخصوص کیا جائے تو، ffsubsync ریفرنس اور سب ٹائٹلز کے درمیان فریم ریٹ کی عدم مطابقت کو ٹھیک کرنے کی کوشش نہیں کرے گا۔\nیہ اس وقت مفید ہو سکتا ہے جب آپ جانتے ہیں کہ ویڈیو اور سب ٹائٹل فریم ریٹ یکساں ہیں، صرف سب ٹائٹلز سنک سے باہر ہیں۔",
-                    "zh_TW": "如果指定此選項，ffsubsync 將不會嘗試修正參考檔與字幕之間的幀率不符。\n當您知道影片和字幕的幀率相同，僅是字幕不同步時，這會很有用。",
-                },
-                "argument": "--no-fix-framerate",
-                "default": False,
+def _sync_tools_source():
+    """Synchronization tools, with their texts in every language."""
+    from utils import get_resource_path, get_version_info
+
+    SYNC_TOOLS = {
+        "ffsubsync": {
+            "version": get_version_info("ffsubsync"),
+            "description": {
+                "en_US": "Automagically synchronize subtitles with video",
+                "es_ES": "Sincroniza automáticamente los subtítulos con el video",
+                "tr_TR": "Altyazıları videoyla otomatik olarak senkronize edin",
+                "zh_CN": "自动将字幕与视频同步",
+                "ru_RU": "Автоматически синхронизируйте субтитры с видео",
+                "pl_PL": "Automatycznie synchronizuj napisy z wideo",
+                "uk_UA": "Автоматично синхронізуйте субтитри з відео",
+                "ja_JP": "字幕を動画と自動的に同期します",
+                "ko_KR": "자막을 비디오와 자동으로 동기화합니다",
+                "hi_IN": "स्वचालित रूप से उपशीर्षकों को वीडियो के साथ सिंक्रनाइज़ करें",
+                "bn_BD": "স্বয়ংক্রিয়ভাবে সাবটাইটেল ভিডিওর সাথে সিঙ্ক করুন",
+                "it_IT": "Sincronizza automaticamente i sottotitoli con il video",
+                "fr_FR": "Synchronisez automatiquement les sous-titres avec la vidéo",
+                "de_DE": "Synchronisieren Sie Untertitel automatisch mit dem Video",
+                "pt_PT": "Sincronize automaticamente as legendas com o vídeo",
+                "ar_SA": "قم بمزامنة الترجمات مع الفيديو تلقائيًا",
+                "vi_VN": "Tự động đồng bộ phụ đề với video",
+                "fa_IR": "زیرنویس‌ها را به طور خودکار با ویدیو همگام‌سازی کنید",
+                "id_ID": "Sinkronkan subtitle dengan video secara otomatis",
+                "ms_MY": "Segerakkan sarikata dengan video secara automatik",
+                "th_TH": "ซิงค์คำบรรยายกับวิดีโอโดยอัตโนมัติ",
+                "ur_PK": "سب ٹائٹلز کو ویڈیو کے ساتھ خودکار طور پر سنکرونائز کریں",
+                "zh_TW": "自動將字幕與影片同步",
             },
-            "use_golden_section": {
-                "type": "checkbox",
-                "label": {
-                    "en_US": "Use golden section search",
-                    "es_ES": "Usar búsqueda de sección áurea",
-                    "tr_TR": "Altın oran araması kullan",
-                    "zh_CN": "使用黄金分割搜索",
-                    "ru_RU": "Использовать поиск золотого сечения",
-                    "pl_PL": "Użyj wyszukiwania złotego podziału",
-                    "uk_UA": "Використовувати пошук золотого перерізу",
-                    "ja_JP": "黄金分割探索を使用",
-                    "ko_KR": "황금비 검색 사용",
-                    "hi_IN": "स्वर्ण अनुभाग खोज का उपयोग करें",
-                    "bn_BD": "গোল্ডেন সেকশন অনুসন্ধান ব্যবহার করুন",
-                    "it_IT": "Usa ricerca sezione aurea",
-                    "fr_FR": "Utiliser la recherche par section dorée",
-                    "de_DE": "Goldenen Schnitt-Suche verwenden",
-                    "pt_PT": "Usar pesquisa de secção dourada",
-                    "ar_SA": "استخدم البحث بالقسم الذهبي",
-                    "vi_VN": "Sử dụng tìm kiếm tỷ lệ vàng",
-                    "fa_IR": "از جستجوی نسبت طلایی استفاده کنید",
-                    "id_ID": "Gunakan pencarian bagian emas",
-                    "ms_MY": "Gunakan carian bahagian emas",
-                    "th_TH": "ใช้การค้นหาส่วนทอง",
-                    "ur_PK": "گولڈن سیکشن سرچ استعمال کریں",
-                    "zh_TW": "使用黃金分割搜尋",
+            "github": "https://github.com/smacke/ffsubsync",
+            "documentation": "https://ffsubsync.readthedocs.io/",
+            "supported_formats": [".srt", ".ass", ".ssa", ".vtt"],
+            "supports_subtitle_as_reference": True,
+            "type": "module",
+            "module": "call_ffsubsync",
+            "cmd_structure": ["{reference}", "-i", "{subtitle}", "-o", "{output}"],
+            "options": {
+                "dont_fix_framerate": {
+                    "type": "checkbox",
+                    "label": {
+                        "en_US": "Don't fix framerate",
+                        "es_ES": "No corregir velocidad de fotogramas",
+                        "tr_TR": "Kare hızını düzeltme",
+                        "zh_CN": "不修复帧率",
+                        "ru_RU": "Не исправлять частоту кадров",
+                        "pl_PL": "Nie naprawiaj klatek na sekundę",
+                        "uk_UA": "Не виправляти частоту кадрів",
+                        "ja_JP": "フレームレートを修正しない",
+                        "ko_KR": "프레임레이트 수정하지 않음",
+                        "hi_IN": "फ्रेमरेट को ठीक न करें",
+                        "bn_BD": "ফ্রেমরেট ঠিক করবেন না",
+                        "it_IT": "Non correggere il framerate",
+                        "fr_FR": "Ne pas corriger la fréquence d'images",
+                        "de_DE": "Bildrate nicht korrigieren",
+                        "pt_PT": "Não corrigir taxa de quadros",
+                        "ar_SA": "لا تصحح معدل الإطارات",
+                        "vi_VN": "Không sửa tốc độ khung hình",
+                        "fa_IR": "نرخ فریم را اصلاح نکنید",
+                        "id_ID": "Jangan perbaiki framerate",
+                        "ms_MY": "Jangan betulkan kadar bingkai",
+                        "th_TH": "ไม่ต้องแก้ไขอัตราเฟรม",
+                        "ur_PK": "فریم ریٹ کو ٹھیک نہ کریں",
+                        "zh_TW": "不修復幀率",
+                    },
+                    "tooltip": {
+                        "en_US": "If specified, ffsubsync will not attempt to correct a framerate mismatch between reference and subtitles.\nThis can be useful when you know that the video and subtitle framerates are same, only the subtitles are out of sync.",
+                        "es_ES": "Si se especifica, ffsubsync no intentará corregir una discrepancia de velocidad de fotogramas entre la referencia y los subtítulos.\nEsto puede ser útil cuando sabes que las velocidades de fotogramas del video y los subtítulos son iguales, solo los subtítulos están desincronizados.",
+                        "tr_TR": "Belirtilirse, ffsubsync referans ve altyazılar arasındaki kare hızı uyumsuzluğunu düzeltmeye çalışmayacaktır.\nBu, video ve altyazı kare hızlarının aynı olduğunu bildiğinizde, sadece altyazıların senkronizasyon dışında olduğu durumlarda yararlı olabilir.",
+                        "zh_CN": "如果指定，ffsubsync将不会尝试纠正参考和字幕之间的帧率不匹配。\n当您知道视频和字幕帧率相同，只是字幕不同步时，这可能很有用。",
+                        "ru_RU": "Если указано, ffsubsync не будет пытаться исправить несоответствие частоты кадров между эталоном и субтитрами.\nЭто может быть полезно, когда вы знаете, что частота кадров видео и субтитров одинакова, только субтитры не синхронизированы.",
+                        "pl_PL": "Jeśli określono, ffsubsync nie będzie próbował poprawić niezgodności klatek na sekundę między referencją a napisami.\nMoże to być przydatne, gdy wiesz, że klatki na sekundę wideo i napisów są takie same, tylko napisy są poza synchronizacją.",
+                        "uk_UA": "Якщо вказано, ffsubsync не спробує виправити невідповідність частоти кадрів між еталоном та субтитрами.\nЦе може бути корисно, коли ви знаєте, що частота кадрів відео та субтитрів однакова, лише субтитри не синхронізовані.",
+                        "ja_JP": "指定した場合、ffsubsyncは参照と字幕間のフレームレートの不一致を修正しようとしません。\nビデオと字幕のフレームレートが同じで、字幕のみが同期していないことがわかっている場合に役立ちます。",
+                        "ko_KR": "지정하면 ffsubsync는 참조와 자막 간의 프레임레이트 불일치를 수정하려고 시도하지 않습니다.\n비디오와 자막 프레임레이트가 동일하고 자막만 동기화되지 않았다는 것을 알고 있을 때 유용할 수 있습니다.",
+                        "hi_IN": "यदि निर्दिष्ट किया गया है, तो ffsubsync संदर्भ और उपशीर्षक के बीच फ्रेमरेट बेमेल को ठीक करने का प्रयास नहीं करेगा।\nयह तब उपयोगी हो सकता है जब आप जानते हैं कि वीडियो और उपशीर्षक फ्रेमरेट समान हैं, केवल उपशीर्षक सिंक से बाहर हैं।",
+                        "bn_BD": "যদি নির্দিষ্ট করা হয়, ffsubsync রেফারেন্স এবং সাবটাইটেলের মধ্যে ফ্রেমরেট অমিল সংশোধন করার চেষ্টা করবে না।\nএটি কার্যকর হতে পারে যখন আপনি জানেন যে ভিডিও এবং সাবটাইটেল ফ্রেমরেট একই, শুধুমাত্র সাবটাইটেল সিঙ্কের বাইরে।",
+                        "it_IT": "Se specificato, ffsubsync non tenterà di correggere una discrepanza di framerate tra riferimento e sottotitoli.\nQuesto può essere utile quando sai che i framerate del video e dei sottotitoli sono uguali, solo i sottotitoli sono fuori sincrono.",
+                        "fr_FR": "Si spécifié, ffsubsync ne tentera pas de corriger une discordance de fréquence d'images entre la référence et les sous-titres.\nCela peut être utile lorsque vous savez que les fréquences d'images de la vidéo et des sous-titres sont identiques, seuls les sous-titres sont désynchronisés.",
+                        "de_DE": "Falls angegeben, wird ffsubsync nicht versuchen, eine Bildrate-Diskrepanz zwischen Referenz und Untertiteln zu korrigieren.\nDies kann nützlich sein, wenn Sie wissen, dass die Video- und Untertitel-Bildraten gleich sind, nur die Untertitel nicht synchron sind.",
+                        "pt_PT": "Se especificado, o ffsubsync não tentará corrigir uma incompatibilidade de taxa de quadros entre referência e legendas.\nIsto pode ser útil quando sabe que as taxas de quadros do vídeo e das legendas são iguais, apenas as legendas estão fora de sincronia.",
+                        "ar_SA": "إذا تم تحديده، فلن يحاول ffsubsync تصحيح عدم تطابق معدل الإطارات بين المرجع والترجمات.\nيمكن أن يكون هذا مفيدًا عندما تعلم أن معدلات إطارات الفيديو والترجمات متماثلة، فقط الترجمات غير متزامنة.",
+                        "vi_VN": "Nếu được chỉ định, ffsubsync sẽ không cố gắng sửa chữa sự không khớp tốc độ khung hình giữa tham chiếu và phụ đề.\nĐiều này có thể hữu ích khi bạn biết rằng tốc độ khung hình video và phụ đề giống nhau, chỉ có phụ đề bị lệch đồng bộ.",
+                        "fa_IR": "اگر مشخص شود، ffsubsync تلاش نخواهد کرد تا عدم تطبیق نرخ فریم بین مرجع و زیرنویس را اصلاح کند.\nاین می‌تواند مفید باشد وقتی می‌دانید که نرخ فریم ویدیو و زیرنویس یکسان است، فقط زیرنویس‌ها همگام نیستند.",
+                        "id_ID": "Jika ditentukan, ffsubsync tidak akan mencoba memperbaiki ketidakcocokan framerate antara referensi dan subtitle.\nIni bisa berguna ketika Anda tahu bahwa framerate video dan subtitle sama, hanya subtitle yang tidak sinkron.",
+                        "ms_MY": "Jika dinyatakan, ffsubsync tidak akan cuba membetulkan ketidakpadanan kadar bingkai antara rujukan dan sarikata.\nIni boleh berguna apabila anda tahu bahawa kadar bingkai video dan sarikata adalah sama, hanya sarikata yang tidak segerak.",
+                        "th_TH": "หากระบุ ffsubsync จะไม่พยายามแก้ไขความไม่ตรงกันของอัตราเฟรมระหว่างอ้างอิงและคำบรรยาย\nสิ่งนี้อาจมีประโยชน์เมื่อคุณรู้ว่าอัตราเฟรมของวิดีโอและคำบรรยายเหมือนกัน เพียงแค่คำบรรยายไม่ตรงกัน",
+                        "ur_PK": "اگر مخصوص کیا جائے تو، ffsubsync ریفرنس اور سب ٹائٹلز کے درمیان فریم ریٹ کی عدم مطابقت کو ٹھیک کرنے کی کوشش نہیں کرے گا۔\nیہ اس وقت مفید ہو سکتا ہے جب آپ جانتے ہیں کہ ویڈیو اور سب ٹائٹل فریم ریٹ یکساں ہیں، صرف سب ٹائٹلز سنک سے باہر ہیں۔",
+                        "zh_TW": "如果指定此選項，ffsubsync 將不會嘗試修正參考檔與字幕之間的幀率不符。\n當您知道影片和字幕的幀率相同，僅是字幕不同步時，這會很有用。",
+                    },
+                    "argument": "--no-fix-framerate",
+                    "default": False,
                 },
-                "tooltip": {
-                    "en_US": "Use golden-section search to find the optimal ratio between video and subtitle framerates (by default, only a few common ratios are evaluated)",
-                    "es_ES": "Usar búsqueda de sección áurea para encontrar la relación óptima entre las velocidades de fotogramas del video y los subtítulos (por defecto, solo se evalúan unas pocas relaciones comunes)",
-                    "tr_TR": "Video ve altyazı kare hızları arasındaki optimal oranı bulmak için altın oran araması kullanın (varsayılan olarak, sadece birkaç yaygın oran değerlendirilir)",
-                    "zh_CN": "使用黄金分割搜索来找到视频和字幕帧率之间的最佳比率（默认情况下，只评估几个常见比率）",
-                    "ru_RU": "Использовать поиск золотого сечения для нахождения оптимального соотношения между частотой кадров видео и субтитров (по умолчанию оценивается только несколько общих соотношений)",
-                    "pl_PL": "Użyj wyszukiwania złotego podziału, aby znaleźć optymalny stosunek między klatkami na sekundę wideo i napisów (domyślnie oceniane są tylko kilka powszechnych stosunków)",
-                    "uk_UA": "Використовувати пошук золотого перерізу для знаходження оптимального співвідношення між частотою кадрів відео та субтитрів (за замовчуванням оцінюється лише кілька загальних співвідношень)",
-                    "ja_JP": "ビデオと字幕のフレームレート間の最適な比率を見つけるために黄金分割探索を使用します（デフォルトでは、いくつかの一般的な比率のみが評価されます）",
-                    "ko_KR": "비디오와 자막 프레임레이트 간의 최적 비율을 찾기 위해 황금비 검색을 사용합니다（기본적으로 몇 가지 일반적인 비율만 평가됩니다）",
-                    "hi_IN": "वीडियो और उपशीर्षक फ्रेमरेट के बीच इष्टतम अनुपात खोजने के लिए स्वर्ण-अनुभाग खोज का उपयोग करें (डिफ़ॉल्ट रूप से, केवल कुछ सामान्य अनुपातों का मूल्यांकन किया जाता है)",
-                    "bn_BD": "ভিডিও এবং সাবটাইটেল ফ্রেমরেটের মধ্যে সর্বোত্তম অনুপাত খুঁজে পেতে গোল্ডেন-সেকশন অনুসন্ধান ব্যবহার করুন (ডিফল্টভাবে, শুধুমাত্র কয়েকটি সাধারণ অনুপাত মূল্যায়ন করা হয়)",
-                    "it_IT": "Usa la ricerca della sezione aurea per trovare il rapporto ottimale tra i framerate del video e dei sottotitoli (per impostazione predefinita, vengono valutati solo alcuni rapporti comuni)",
-                    "fr_FR": "Utiliser la recherche par section dorée pour trouver le rapport optimal entre les fréquences d'images de la vidéo et des sous-titres (par défaut, seuls quelques rapports courants sont évalués)",
-                    "de_DE": "Verwenden Sie die Goldenen-Schnitt-Suche, um das optimale Verhältnis zwischen Video- und Untertitel-Bildraten zu finden (standardmäßig werden nur wenige häufige Verhältnisse bewertet)",
-                    "pt_PT": "Use a pesquisa de secção dourada para encontrar a proporção ideal entre as taxas de quadros do vídeo e das legendas (por padrão, apenas algumas proporções comuns são avaliadas)",
-                    "ar_SA": "استخدم البحث بالقسم الذهبي للعثور على النسبة المثلى بين معدلات إطارات الفيديو والترجمات (افتراضيًا، يتم تقييم بعض النسب الشائعة فقط)",
-                    "vi_VN": "Sử dụng tìm kiếm tỷ lệ vàng để tìm tỷ lệ tối ưu giữa tốc độ khung hình video và phụ đề (theo mặc định, chỉ một vài tỷ lệ phổ biến được đánh giá)",
-                    "fa_IR": "از جستجوی نسبت طلایی برای یافتن نسبت بهینه بین نرخ فریم ویدیو و زیرنویس استفاده کنید (به طور پیش‌فرض، فقط چند نسبت رایج ارزیابی می‌شود)",
-                    "id_ID": "Gunakan pencarian bagian emas untuk menemukan rasio optimal antara framerate video dan subtitle (secara default, hanya beberapa rasio umum yang dievaluasi)",
-                    "ms_MY": "Gunakan carian bahagian emas untuk mencari nisbah optimum antara kadar bingkai video dan sarikata (secara lalai, hanya beberapa nisbah biasa yang dinilai)",
-                    "th_TH": "ใช้การค้นหาส่วนทองเพื่อหาอัตราส่วนที่เหมาะสมที่สุดระหว่างอัตราเฟรมของวิดีโอและคำบรรยาย (โดยค่าเริ่มต้น จะประเมินเพียงอัตราส่วนทั่วไปไม่กี่อัน)",
-                    "ur_PK": "ویڈیو اور سب ٹائٹل فریم ریٹس کے درمیان بہترین تناسب تلاش کرنے کے لیے گولڈن سیکشن سرچ استعمال کریں (ڈیفالٹ کے ذریعے، صرف کچھ عام تناسب کا جائزہ لیا جاتا ہے)",
-                    "zh_TW": "使用黃金分割搜尋來尋找影片和字幕幀率之間的最佳比例（預設情況下，僅評估幾個常見比例）",
+                "use_golden_section": {
+                    "type": "checkbox",
+                    "label": {
+                        "en_US": "Use golden section search",
+                        "es_ES": "Usar búsqueda de sección áurea",
+                        "tr_TR": "Altın oran araması kullan",
+                        "zh_CN": "使用黄金分割搜索",
+                        "ru_RU": "Использовать поиск золотого сечения",
+                        "pl_PL": "Użyj wyszukiwania złotego podziału",
+                        "uk_UA": "Використовувати пошук золотого перерізу",
+                        "ja_JP": "黄金分割探索を使用",
+                        "ko_KR": "황금비 검색 사용",
+                        "hi_IN": "स्वर्ण अनुभाग खोज का उपयोग करें",
+                        "bn_BD": "গোল্ডেন সেকশন অনুসন্ধান ব্যবহার করুন",
+                        "it_IT": "Usa ricerca sezione aurea",
+                        "fr_FR": "Utiliser la recherche par section dorée",
+                        "de_DE": "Goldenen Schnitt-Suche verwenden",
+                        "pt_PT": "Usar pesquisa de secção dourada",
+                        "ar_SA": "استخدم البحث بالقسم الذهبي",
+                        "vi_VN": "Sử dụng tìm kiếm tỷ lệ vàng",
+                        "fa_IR": "از جستجوی نسبت طلایی استفاده کنید",
+                        "id_ID": "Gunakan pencarian bagian emas",
+                        "ms_MY": "Gunakan carian bahagian emas",
+                        "th_TH": "ใช้การค้นหาส่วนทอง",
+                        "ur_PK": "گولڈن سیکشن سرچ استعمال کریں",
+                        "zh_TW": "使用黃金分割搜尋",
+                    },
+                    "tooltip": {
+                        "en_US": "Use golden-section search to find the optimal ratio between video and subtitle framerates (by default, only a few common ratios are evaluated)",
+                        "es_ES": "Usar búsqueda de sección áurea para encontrar la relación óptima entre las velocidades de fotogramas del video y los subtítulos (por defecto, solo se evalúan unas pocas relaciones comunes)",
+                        "tr_TR": "Video ve altyazı kare hızları arasındaki optimal oranı bulmak için altın oran araması kullanın (varsayılan olarak, sadece birkaç yaygın oran değerlendirilir)",
+                        "zh_CN": "使用黄金分割搜索来找到视频和字幕帧率之间的最佳比率（默认情况下，只评估几个常见比率）",
+                        "ru_RU": "Использовать поиск золотого сечения для нахождения оптимального соотношения между частотой кадров видео и субтитров (по умолчанию оценивается только несколько общих соотношений)",
+                        "pl_PL": "Użyj wyszukiwania złotego podziału, aby znaleźć optymalny stosunek między klatkami na sekundę wideo i napisów (domyślnie oceniane są tylko kilka powszechnych stosunków)",
+                        "uk_UA": "Використовувати пошук золотого перерізу для знаходження оптимального співвідношення між частотою кадрів відео та субтитрів (за замовчуванням оцінюється лише кілька загальних співвідношень)",
+                        "ja_JP": "ビデオと字幕のフレームレート間の最適な比率を見つけるために黄金分割探索を使用します（デフォルトでは、いくつかの一般的な比率のみが評価されます）",
+                        "ko_KR": "비디오와 자막 프레임레이트 간의 최적 비율을 찾기 위해 황금비 검색을 사용합니다（기본적으로 몇 가지 일반적인 비율만 평가됩니다）",
+                        "hi_IN": "वीडियो और उपशीर्षक फ्रेमरेट के बीच इष्टतम अनुपात खोजने के लिए स्वर्ण-अनुभाग खोज का उपयोग करें (डिफ़ॉल्ट रूप से, केवल कुछ सामान्य अनुपातों का मूल्यांकन किया जाता है)",
+                        "bn_BD": "ভিডিও এবং সাবটাইটেল ফ্রেমরেটের মধ্যে সর্বোত্তম অনুপাত খুঁজে পেতে গোল্ডেন-সেকশন অনুসন্ধান ব্যবহার করুন (ডিফল্টভাবে, শুধুমাত্র কয়েকটি সাধারণ অনুপাত মূল্যায়ন করা হয়)",
+                        "it_IT": "Usa la ricerca della sezione aurea per trovare il rapporto ottimale tra i framerate del video e dei sottotitoli (per impostazione predefinita, vengono valutati solo alcuni rapporti comuni)",
+                        "fr_FR": "Utiliser la recherche par section dorée pour trouver le rapport optimal entre les fréquences d'images de la vidéo et des sous-titres (par défaut, seuls quelques rapports courants sont évalués)",
+                        "de_DE": "Verwenden Sie die Goldenen-Schnitt-Suche, um das optimale Verhältnis zwischen Video- und Untertitel-Bildraten zu finden (standardmäßig werden nur wenige häufige Verhältnisse bewertet)",
+                        "pt_PT": "Use a pesquisa de secção dourada para encontrar a proporção ideal entre as taxas de quadros do vídeo e das legendas (por padrão, apenas algumas proporções comuns são avaliadas)",
+                        "ar_SA": "استخدم البحث بالقسم الذهبي للعثور على النسبة المثلى بين معدلات إطارات الفيديو والترجمات (افتراضيًا، يتم تقييم بعض النسب الشائعة فقط)",
+                        "vi_VN": "Sử dụng tìm kiếm tỷ lệ vàng để tìm tỷ lệ tối ưu giữa tốc độ khung hình video và phụ đề (theo mặc định, chỉ một vài tỷ lệ phổ biến được đánh giá)",
+                        "fa_IR": "از جستجوی نسبت طلایی برای یافتن نسبت بهینه بین نرخ فریم ویدیو و زیرنویس استفاده کنید (به طور پیش‌فرض، فقط چند نسبت رایج ارزیابی می‌شود)",
+                        "id_ID": "Gunakan pencarian bagian emas untuk menemukan rasio optimal antara framerate video dan subtitle (secara default, hanya beberapa rasio umum yang dievaluasi)",
+                        "ms_MY": "Gunakan carian bahagian emas untuk mencari nisbah optimum antara kadar bingkai video dan sarikata (secara lalai, hanya beberapa nisbah biasa yang dinilai)",
+                        "th_TH": "ใช้การค้นหาส่วนทองเพื่อหาอัตราส่วนที่เหมาะสมที่สุดระหว่างอัตราเฟรมของวิดีโอและคำบรรยาย (โดยค่าเริ่มต้น จะประเมินเพียงอัตราส่วนทั่วไปไม่กี่อัน)",
+                        "ur_PK": "ویڈیو اور سب ٹائٹل فریم ریٹس کے درمیان بہترین تناسب تلاش کرنے کے لیے گولڈن سیکشن سرچ استعمال کریں (ڈیفالٹ کے ذریعے، صرف کچھ عام تناسب کا جائزہ لیا جاتا ہے)",
+                        "zh_TW": "使用黃金分割搜尋來尋找影片和字幕幀率之間的最佳比例（預設情況下，僅評估幾個常見比例）",
+                    },
+                    "argument": "--gss",
+                    "default": False,
                 },
-                "argument": "--gss",
-                "default": False,
-            },
-            "use_pgs_subtitles": {
-                "type": "checkbox",
-                "label": {
-                    "en_US": "Use PGS subtitles as reference",
-                    "es_ES": "Usar subtítulos PGS como referencia",
-                    "tr_TR": "PGS altyazılarını referans olarak kullan",
-                    "zh_CN": "使用PGS字幕作为参考",
-                    "ru_RU": "Использовать субтитры PGS в качестве эталона",
-                    "pl_PL": "Użyj napisów PGS jako referencji",
-                    "uk_UA": "Використовувати субтитри PGS як еталон",
-                    "ja_JP": "PGS字幕を参照として使用",
-                    "ko_KR": "PGS 자막을 참조로 사용",
-                    "hi_IN": "संदर्भ के रूप में PGS उपशीर्षक का उपयोग करें",
-                    "bn_BD": "রেফারেন্স হিসেবে PGS সাবটাইটেল ব্যবহার করুন",
-                    "it_IT": "Usa i sottotitoli PGS come riferimento",
-                    "fr_FR": "Utiliser les sous-titres PGS comme référence",
-                    "de_DE": "PGS-Untertitel als Referenz verwenden",
-                    "pt_PT": "Usar legendas PGS como referência",
-                    "ar_SA": "استخدم ترجمات PGS كمرجع",
-                    "vi_VN": "Sử dụng phụ đề PGS làm tham chiếu",
-                    "fa_IR": "استفاده از زیرنویس‌های PGS به عنوان مرجع",
-                    "id_ID": "Gunakan subtitle PGS sebagai referensi",
-                    "ms_MY": "Gunakan sarikata PGS sebagai rujukan",
-                    "th_TH": "ใช้คำบรรยาย PGS เป็นข้อมูลอ้างอิง",
-                    "ur_PK": "پی جی ایس سب ٹائٹلز کو بطور ریفرنس استعمال کریں",
-                    "zh_TW": "使用 PGS 字幕作為參考",
+                "use_pgs_subtitles": {
+                    "type": "checkbox",
+                    "label": {
+                        "en_US": "Use PGS subtitles as reference",
+                        "es_ES": "Usar subtítulos PGS como referencia",
+                        "tr_TR": "PGS altyazılarını referans olarak kullan",
+                        "zh_CN": "使用PGS字幕作为参考",
+                        "ru_RU": "Использовать субтитры PGS в качестве эталона",
+                        "pl_PL": "Użyj napisów PGS jako referencji",
+                        "uk_UA": "Використовувати субтитри PGS як еталон",
+                        "ja_JP": "PGS字幕を参照として使用",
+                        "ko_KR": "PGS 자막을 참조로 사용",
+                        "hi_IN": "संदर्भ के रूप में PGS उपशीर्षक का उपयोग करें",
+                        "bn_BD": "রেফারেন্স হিসেবে PGS সাবটাইটেল ব্যবহার করুন",
+                        "it_IT": "Usa i sottotitoli PGS come riferimento",
+                        "fr_FR": "Utiliser les sous-titres PGS comme référence",
+                        "de_DE": "PGS-Untertitel als Referenz verwenden",
+                        "pt_PT": "Usar legendas PGS como referência",
+                        "ar_SA": "استخدم ترجمات PGS كمرجع",
+                        "vi_VN": "Sử dụng phụ đề PGS làm tham chiếu",
+                        "fa_IR": "استفاده از زیرنویس‌های PGS به عنوان مرجع",
+                        "id_ID": "Gunakan subtitle PGS sebagai referensi",
+                        "ms_MY": "Gunakan sarikata PGS sebagai rujukan",
+                        "th_TH": "ใช้คำบรรยาย PGS เป็นข้อมูลอ้างอิง",
+                        "ur_PK": "پی جی ایس سب ٹائٹلز کو بطور ریفرنس استعمال کریں",
+                        "zh_TW": "使用 PGS 字幕作為參考",
+                    },
+                    "tooltip": {
+                        "en_US": "Extract and use image-based PGS (Presentation Graphic Stream) subtitles embedded in the video (MKV, M2TS, Blu-ray) as the sync timing reference instead of audio voice activity detection.",
+                        "es_ES": "Extrae y utiliza subtítulos de imagen PGS incrustados en el vídeo (MKV, M2TS, Blu-ray) como referencia de sincronización en lugar de detección de voz por audio.",
+                        "tr_TR": "Videoya gömülü (MKV, M2TS, Blu-ray vb.) resim tabanlı PGS altyazılarını ses aktivite tespiti yerine zamanlama referansı olarak ayıklar ve kullanır.",
+                        "zh_CN": "提取并使用 视频（如 MKV、M2TS、Blu-ray）中内嵌的基于图像的 PGS 字幕作为同步时间参考，而不是音频语音活动检测。",
+                        "ru_RU": "Извлекает и использует графические субтитры PGS из видео (MKV, M2TS, Blu-ray) в качестве временного эталона вместо детектора голосовой активности.",
+                        "pl_PL": "Wyodrębnia i używa obrazkowych napisów PGS osadzonych w wideo (MKV, M2TS, Blu-ray) jako referencji czasowej zamiast detekcji aktywności głosu w audio.",
+                        "uk_UA": "Витягує та використовує графічні субтитри PGS з відео (MKV, M2TS, Blu-ray) як часовий еталон замість детектора голосової активності.",
+                        "ja_JP": "音声VADの代わりに、動画（MKV、M2TS、Blu-rayなど）に埋め込まれた画像ベースのPGS字幕を同期タイミングの参照として抽出して使用します。",
+                        "ko_KR": "오디오 음성 감지 대신 비디오(MKV, M2TS, Blu-ray 등)에 내장된 이미지 기반 PGS 자막을 추출하여 동기화 타이밍 참조로 사용합니다.",
+                        "hi_IN": "ऑडियो वॉयस एक्टिविटी डिटेक्शन के बजाय सिंक टाइमिंग संदर्भ के रूप में वीडियो (MKV, M2TS, Blu-ray) में एम्बेडेड छवि-आधारित PGS उपशीर्षक निकालें और उपयोग करें।",
+                        "bn_BD": "অডিও ভয়েস অ্যাক্টিভিটি ডিটেকশনের পরিবর্তে সিঙ্ক টাইমিং রেফারেন্স হিসেবে ভিডিওতে (MKV, M2TS, Blu-ray) এম্বেড করা ইমেজ-ভিত্তিক PGS সাবটাইটেল ব্যবহার করুন।",
+                        "it_IT": "Estrae e utilizza i sottotitoli grafici PGS incorporati nel video (MKV, M2TS, Blu-ray) come riferimento di sincronizzazione temporale al posto del rilevamento vocale.",
+                        "fr_FR": "Extrait et utilise les sous-titres graphiques PGS intégrés dans la vidéo (MKV, M2TS, Blu-ray) comme référence temporelle au lieu de la détection vocale audio.",
+                        "de_DE": "Extrahiert und verwendet im Video (MKV, M2TS, Blu-ray) eingebettete bildbasierte PGS-Untertitel als Synchronisationsreferenz anstelle der Sprachaktivitätserkennung.",
+                        "pt_PT": "Extrai e utiliza legendas gráficas PGS incorporadas no vídeo (MKV, M2TS, Blu-ray) como referência de tempo de sincronização em vez da deteção de voz por áudio.",
+                        "ar_SA": "استخراج واستخدام ترجمات PGS القائمة على الصور المضمنة في الفيديو (MKV، M2TS، Blu-ray) كمرجع لتوقيت المزامنة بدلاً من كشف النشاط الصوتي.",
+                        "vi_VN": "Trích xuất và sử dụng phụ đề dựa trên hình ảnh PGS nhúng trong video (MKV, M2TS, Blu-ray) làm tham chiếu thời gian đồng bộ hóa thay vì phát hiện giọng nói.",
+                        "fa_IR": "استخراج و استفاده از زیرنویس‌های تصویری PGS جاسازی‌شده در ویدیو (MKV، M2TS، Blu-ray) به عنوان مرجع زمان‌بندی همگام‌سازی به جای تشخیص صدای صوتی.",
+                        "id_ID": "Ekstrak dan gunakan subtitle PGS berbasis gambar yang tertanam di video (MKV, M2TS, Blu-ray) sebagai referensi waktu sinkronisasi daripada deteksi suara audio.",
+                        "ms_MY": "Ekstrak dan guna sarikata PGS berasaskan imej yang terbenam dalam video (MKV, M2TS, Blu-ray) sebagai rujukan masa segerak dan bukannya pengesanan aktiviti suara audio.",
+                        "th_TH": "แยกและใช้คำบรรยาย PGS แบบรูปภาพที่ฝังในวิดีโอ (MKV, M2TS, Blu-ray) เป็นการอ้างอิงเวลาซิงค์แทนการตรวจจับกิจกรรมเสียง",
+                        "ur_PK": "آڈیو وائس ایکٹیویٹی ڈیٹیکشن کے بجائے سنک ٹائمنگ ریفرنس کے طور پر ویڈیو (MKV, M2TS, Blu-ray) میں ایمبیڈڈ تصویر پر مبنی PGS سب ٹائٹلز نکالیں اور استعمال کریں۔",
+                        "zh_TW": "提取並使用 影片（如 MKV、M2TS、Blu-ray）中內嵌的圖像式 PGS 字幕作為同步時間參考，而非音訊語音活動偵測。",
+                    },
+                    "argument": "--pgs-ref-stream",
+                    "default": False,
                 },
-                "tooltip": {
-                    "en_US": "Extract and use image-based PGS (Presentation Graphic Stream) subtitles embedded in the video (MKV, M2TS, Blu-ray) as the sync timing reference instead of audio voice activity detection.",
-                    "es_ES": "Extrae y utiliza subtítulos de imagen PGS incrustados en el vídeo (MKV, M2TS, Blu-ray) como referencia de sincronización en lugar de detección de voz por audio.",
-                    "tr_TR": "Videoya gömülü (MKV, M2TS, Blu-ray vb.) resim tabanlı PGS altyazılarını ses aktivite tespiti yerine zamanlama referansı olarak ayıklar ve kullanır.",
-                    "zh_CN": "提取并使用 视频（如 MKV、M2TS、Blu-ray）中内嵌的基于图像的 PGS 字幕作为同步时间参考，而不是音频语音活动检测。",
-                    "ru_RU": "Извлекает и использует графические субтитры PGS из видео (MKV, M2TS, Blu-ray) в качестве временного эталона вместо детектора голосовой активности.",
-                    "pl_PL": "Wyodrębnia i używa obrazkowych napisów PGS osadzonych w wideo (MKV, M2TS, Blu-ray) jako referencji czasowej zamiast detekcji aktywności głosu w audio.",
-                    "uk_UA": "Витягує та використовує графічні субтитри PGS з відео (MKV, M2TS, Blu-ray) як часовий еталон замість детектора голосової активності.",
-                    "ja_JP": "音声VADの代わりに、動画（MKV、M2TS、Blu-rayなど）に埋め込まれた画像ベースのPGS字幕を同期タイミングの参照として抽出して使用します。",
-                    "ko_KR": "오디오 음성 감지 대신 비디오(MKV, M2TS, Blu-ray 등)에 내장된 이미지 기반 PGS 자막을 추출하여 동기화 타이밍 참조로 사용합니다.",
-                    "hi_IN": "ऑडियो वॉयस एक्टिविटी डिटेक्शन के बजाय सिंक टाइमिंग संदर्भ के रूप में वीडियो (MKV, M2TS, Blu-ray) में एम्बेडेड छवि-आधारित PGS उपशीर्षक निकालें और उपयोग करें।",
-                    "bn_BD": "অডিও ভয়েস অ্যাক্টিভিটি ডিটেকশনের পরিবর্তে সিঙ্ক টাইমিং রেফারেন্স হিসেবে ভিডিওতে (MKV, M2TS, Blu-ray) এম্বেড করা ইমেজ-ভিত্তিক PGS সাবটাইটেল ব্যবহার করুন।",
-                    "it_IT": "Estrae e utilizza i sottotitoli grafici PGS incorporati nel video (MKV, M2TS, Blu-ray) come riferimento di sincronizzazione temporale al posto del rilevamento vocale.",
-                    "fr_FR": "Extrait et utilise les sous-titres graphiques PGS intégrés dans la vidéo (MKV, M2TS, Blu-ray) comme référence temporelle au lieu de la détection vocale audio.",
-                    "de_DE": "Extrahiert und verwendet im Video (MKV, M2TS, Blu-ray) eingebettete bildbasierte PGS-Untertitel als Synchronisationsreferenz anstelle der Sprachaktivitätserkennung.",
-                    "pt_PT": "Extrai e utiliza legendas gráficas PGS incorporadas no vídeo (MKV, M2TS, Blu-ray) como referência de tempo de sincronização em vez da deteção de voz por áudio.",
-                    "ar_SA": "استخراج واستخدام ترجمات PGS القائمة على الصور المضمنة في الفيديو (MKV، M2TS، Blu-ray) كمرجع لتوقيت المزامنة بدلاً من كشف النشاط الصوتي.",
-                    "vi_VN": "Trích xuất và sử dụng phụ đề dựa trên hình ảnh PGS nhúng trong video (MKV, M2TS, Blu-ray) làm tham chiếu thời gian đồng bộ hóa thay vì phát hiện giọng nói.",
-                    "fa_IR": "استخراج و استفاده از زیرنویس‌های تصویری PGS جاسازی‌شده در ویدیو (MKV، M2TS، Blu-ray) به عنوان مرجع زمان‌بندی همگام‌سازی به جای تشخیص صدای صوتی.",
-                    "id_ID": "Ekstrak dan gunakan subtitle PGS berbasis gambar yang tertanam di video (MKV, M2TS, Blu-ray) sebagai referensi waktu sinkronisasi daripada deteksi suara audio.",
-                    "ms_MY": "Ekstrak dan guna sarikata PGS berasaskan imej yang terbenam dalam video (MKV, M2TS, Blu-ray) sebagai rujukan masa segerak dan bukannya pengesanan aktiviti suara audio.",
-                    "th_TH": "แยกและใช้คำบรรยาย PGS แบบรูปภาพที่ฝังในวิดีโอ (MKV, M2TS, Blu-ray) เป็นการอ้างอิงเวลาซิงค์แทนการตรวจจับกิจกรรมเสียง",
-                    "ur_PK": "آڈیو وائس ایکٹیویٹی ڈیٹیکشن کے بجائے سنک ٹائمنگ ریفرنس کے طور پر ویڈیو (MKV, M2TS, Blu-ray) میں ایمبیڈڈ تصویر پر مبنی PGS سب ٹائٹلز نکالیں اور استعمال کریں۔",
-                    "zh_TW": "提取並使用 影片（如 MKV、M2TS、Blu-ray）中內嵌的圖像式 PGS 字幕作為同步時間參考，而非音訊語音活動偵測。",
+                "multi_segment_sync": {
+                    "type": "checkbox",
+                    "label": {
+                        "en_US": "Multi-segment sync (fast mode)",
+                        "es_ES": "Sincronización multisegmento (modo rápido)",
+                        "tr_TR": "Çok parçalı senkronizasyon (hızlı mod)",
+                        "zh_CN": "多段抽样同步（快速模式）",
+                        "ru_RU": "Мультисегментная синхронизация (быстрый режим)",
+                        "pl_PL": "Synchronizacja wielosegmentowa (tryb szybki)",
+                        "uk_UA": "Мультисегментна синхронізація (швидкий режим)",
+                        "ja_JP": "マルチセグメント同期（高速モード）",
+                        "ko_KR": "다중 세그먼트 동기화 (고속 모드)",
+                        "hi_IN": "मल्टी-सेगमेंट सिंक (तेज़ मोड)",
+                        "bn_BD": "মাল্টি-সেগমেন্ট সিঙ্ক (দ্রুত মোড)",
+                        "it_IT": "Sincronizzazione multisegmento (modalità rapida)",
+                        "fr_FR": "Synchronisation multi-segments (mode rapide)",
+                        "de_DE": "Multi-Segment-Synchronisation (Schnellmodus)",
+                        "pt_PT": "Sincronização multisegmento (modo rápido)",
+                        "ar_SA": "مزامنة متعددة المقاطع (الوضع السريع)",
+                        "vi_VN": "Đồng bộ đa phân đoạn (chế độ nhanh)",
+                        "fa_IR": "همگام‌سازی چندبخشی (حالت سریع)",
+                        "id_ID": "Sinkronisasi multi-segmen (mode cepat)",
+                        "ms_MY": "Penyegerakan berbilang segmen (mod pantas)",
+                        "th_TH": "การซิงค์หลายส่วน (โหมดเร็ว)",
+                        "ur_PK": "ملٹی سیگمنٹ سنک (فاسٹ موڈ)",
+                        "zh_TW": "多段抽樣同步（快速模式）",
+                    },
+                    "tooltip": {
+                        "en_US": "Sample short segments spread across the reference video and compute a weighted median offset. Significantly speeds up sync for long videos or remote URLs.",
+                        "es_ES": "Muestrea segmentos cortos distribuidos a lo largo del vídeo y calcula una mediana ponderada. Acelera significativamente la sincronización de vídeos largos o URL remotas.",
+                        "tr_TR": "Referans video boyunca dağıtılmış kısa parçaları örnekler ve ağırlıklı medyan ofseti hesaplar. Uzun videolar veya uzak URL'ler için senkronizasyonu önemli ölçüde hızlandırır.",
+                        "zh_CN": "在参考视频中抽取分布的多段短片段并计算加权中位数偏移量。显著加快长视频或远程 URL 的同步速度。",
+                        "ru_RU": "Выбирает короткие фрагменты по всей длине видео и вычисляет взвешенное медианное смещение. Значительно ускоряет синхронизацию длинных видео и удаленных URL.",
+                        "pl_PL": "Pobiera krótkie próbki z całego wideo i oblicza ważoną medianę przesunięcia. Znacząco przyspiesza synchronizację długich filmów i zdalnych URL.",
+                        "uk_UA": "Вибирає короткі фрагменти по всій довжині відео та обчислює зважене медіанне зміщення. Значно прискорює синхронізацію довгих відео та віддалених URL.",
+                        "ja_JP": "動画全体に分散した短いセグメントをサンプリングし、加重中央値オフセットを計算します。長時間の動画やリモートURLの同期を大幅に高速化します。",
+                        "ko_KR": "비디오 전체에 분산된 짧은 구간들을 샘플링하여 가중 중앙값 오프셋을 계산합니다. 긴 비디오나 원격 URL의 동기화 속도를 크게 향상시킵니다.",
+                        "hi_IN": "वीडियो में फैले छोटे खंडों का नमूना लें और भारित माध्यिका ऑफ़सेट की गणना करें। लंबी वीडियो या रिमोट URL के लिए सिंक को काफी तेज़ करता है।",
+                        "bn_BD": "ভিডিও জুড়ে কয়েকটি ছোট সেগমেন্টের নমুনা নেয় এবং ওজনযুক্ত মধ্যক অফসেট গণনা করে। দীর্ঘ ভিডিও বা দূরবর্তী URL-এর জন্য সিঙ্ককে দ্রুত করে।",
+                        "it_IT": "Campiona brevi segmenti lungo il video e calcola un offset mediano ponderato. Velocizza notevolmente la sincronizzazione per video lunghi o URL remoti.",
+                        "fr_FR": "Échantillonne de courts segments répartis sur la vidéo et calcule un décalage médian pondéré. Accélère nettement la synchronisation pour les longues vidéos ou URL distantes.",
+                        "de_DE": "Nimmt kurze Stichproben über das Video verteilt und berechnet einen gewichteten Median-Offset. Beschleunigt die Synchronisation bei langen Videos oder Remote-URLs erheblich.",
+                        "pt_PT": "Amostra segmentos curtos distribuídos pelo vídeo e calcula um deslocamento mediano ponderado. Acelera significativamente a sincronização de vídeos longos ou URLs remotas.",
+                        "ar_SA": "يأخذ عينات من مقاطع قصيرة موزعة عبر الفيديو ويحسب متوسط الإزاحة الموزون. يسرع المزامنة بشكل ملحوظ للفيديوهات الطويلة أو الروابط البعيدة.",
+                        "vi_VN": "Lấy mẫu các đoạn ngắn phân bổ trên video và tính toán độ lệch trung vị có trọng số. Tăng tốc độ đồng bộ hóa đáng kể cho video dài hoặc URL từ xa.",
+                        "fa_IR": "از بخش‌های کوتاه در طول ویدیو نمونه‌برداری می‌کند و آفست میانه وزن‌دار را محاسبه می‌کند. همگام‌سازی را برای ویدیوهای طولانی یا URLهای راه دور بسیار سریع‌تر می‌کند.",
+                        "id_ID": "Mengambil sampel segmen pendek yang tersebar di video dan menghitung offset median tertimbang. Mempercepat sinkronisasi secara signifikan untuk video panjang atau URL jarak jauh.",
+                        "ms_MY": "Mengambil sampel segmen pendek yang tersebar di seluruh video dan mengira ofset median berpemberat. Mempercepatkan penyegerakan untuk video panjang atau URL jauh.",
+                        "th_TH": "สุ่มตัวอย่างช่วงสั้นๆ ทั่วทั้งวิดีโอและคำบรรยายแบบถ่วงน้ำหนัก ช่วยเพิ่มความเร็วในการซิงค์สำหรับวิดีโอยาวหรือ URL ระยะไกลได้อย่างมาก",
+                        "ur_PK": "ویڈیو میں پھیلے ہوئے مختصر حصوں کا نمونہ لیتا ہے اور ویٹڈ میڈین آفسیٹ کا حساب لگاتا ہے۔ لمبی ویڈیوز یا ریموٹ URLs کے لیے سنک کو کافی تیز کرتا ہے۔",
+                        "zh_TW": "在參考影片中抽樣分布的多段短片段並計算加權中位數偏移量。顯著加快長影片或遠端 URL 的同步速度。",
+                    },
+                    "argument": "--multi-segment-sync",
+                    "default": False,
                 },
-                "argument": "--pgs-ref-stream",
-                "default": False,
-            },
-            "multi_segment_sync": {
-                "type": "checkbox",
-                "label": {
-                    "en_US": "Multi-segment sync (fast mode)",
-                    "es_ES": "Sincronización multisegmento (modo rápido)",
-                    "tr_TR": "Çok parçalı senkronizasyon (hızlı mod)",
-                    "zh_CN": "多段抽样同步（快速模式）",
-                    "ru_RU": "Мультисегментная синхронизация (быстрый режим)",
-                    "pl_PL": "Synchronizacja wielosegmentowa (tryb szybki)",
-                    "uk_UA": "Мультисегментна синхронізація (швидкий режим)",
-                    "ja_JP": "マルチセグメント同期（高速モード）",
-                    "ko_KR": "다중 세그먼트 동기화 (고속 모드)",
-                    "hi_IN": "मल्टी-सेगमेंट सिंक (तेज़ मोड)",
-                    "bn_BD": "মাল্টি-সেগমেন্ট সিঙ্ক (দ্রুত মোড)",
-                    "it_IT": "Sincronizzazione multisegmento (modalità rapida)",
-                    "fr_FR": "Synchronisation multi-segments (mode rapide)",
-                    "de_DE": "Multi-Segment-Synchronisation (Schnellmodus)",
-                    "pt_PT": "Sincronização multisegmento (modo rápido)",
-                    "ar_SA": "مزامنة متعددة المقاطع (الوضع السريع)",
-                    "vi_VN": "Đồng bộ đa phân đoạn (chế độ nhanh)",
-                    "fa_IR": "همگام‌سازی چندبخشی (حالت سریع)",
-                    "id_ID": "Sinkronisasi multi-segmen (mode cepat)",
-                    "ms_MY": "Penyegerakan berbilang segmen (mod pantas)",
-                    "th_TH": "การซิงค์หลายส่วน (โหมดเร็ว)",
-                    "ur_PK": "ملٹی سیگمنٹ سنک (فاسٹ موڈ)",
-                    "zh_TW": "多段抽樣同步（快速模式）",
+                "split_penalty": {
+                    "type": "slider",
+                    "label": {
+                        "en_US": "Split penalty",
+                        "es_ES": "Penalización por división",
+                        "tr_TR": "Bölme cezası",
+                        "zh_CN": "分割惩罚",
+                        "ru_RU": "Штраф за разделение",
+                        "pl_PL": "Kara za podział",
+                        "uk_UA": "Штраф за розділення",
+                        "ja_JP": "分割ペナルティ",
+                        "ko_KR": "분할 패널티",
+                        "hi_IN": "विभाजन दंड",
+                        "bn_BD": "স্প্লিট পেনাল্টি",
+                        "it_IT": "Penalità di divisione",
+                        "fr_FR": "Pénalité de division",
+                        "de_DE": "Teilungsstrafe",
+                        "pt_PT": "Penalidade de divisão",
+                        "ar_SA": "عقوبة التقسيم",
+                        "vi_VN": "Phạt phân tách",
+                        "fa_IR": "جریمه تقسیم",
+                        "id_ID": "Penalti pemisahan",
+                        "ms_MY": "Penalti pemisahan",
+                        "th_TH": "บทลงโทษการแบ่ง",
+                        "ur_PK": "تقسیم کی سزا",
+                        "zh_TW": "分割懲罰",
+                    },
+                    "tooltip": {
+                        "en_US": "Enable piecewise alignment to correct mid-file sync breaks (commercials, scene cuts, multi-disc concatenations).\n(Default: No splits (-1), Recommended: 4-20)\n• Higher values (10-20): More conservative, fewer splits.\n• Lower values (2-5): More aggressive, allows more splits.",
+                        "es_ES": "Habilita la alineación por tramos para corregir desincronizaciones en el archivo (anuncios, cortes de escena, etc.).\n(Predeterminado: Sin divisiones (-1), Recomendado: 4-20)\n• Valores altos (10-20): Más conservador, menos divisiones.\n• Valores bajos (2-5): Más agresivo, permite más divisiones.",
+                        "tr_TR": "Ara sahne veya reklam kesintilerinden kaynaklanan senkronizasyon kaymalarını düzeltmek için parçalı hizalamayı etkinleştirir.\n(Varsayılan: Bölme yok (-1), Önerilen: 4-20)\n• Yüksek değerler (10-20): Daha temkinli, daha az bölme.\n• Düşük değerler (2-5): Daha hassas, daha fazla bölme.",
+                        "zh_CN": "启用分段对齐以修复片中同步断裂（广告插播、删减场景、多碟拼接）。\n（默认：无分割 (-1)，推荐：4-20）\n• 较高值 (10-20)：更保守，产生较少分割。\n• 较低值 (2-5)：更激进，允许更多分割。",
+                        "ru_RU": "Включить кусочное выравнивание для исправления рассинхронизации в середине файла (реклама, вырезанные сцены, склейки).\n(По умолчанию: Без разбиений (-1), Рекомендуется: 4-20)\n• Высокие значения (10-20): Меньше разбиений.\n• Низкие значения (2-5): Больше разбиений.",
+                        "pl_PL": "Włącz wyrównywanie fragmentami, aby naprawić przesunięcia w środku pliku (reklamy, cięcia scen, łączenia płyt).\n(Domyślnie: Brak podziałów (-1), Zalecane: 4-20)\n• Wyższe wartości (10-20): Mniej podziałów.\n• Niższe wartości (2-5): Więcej podziałów.",
+                        "uk_UA": "Увімкнути кускове вирівнювання для виправлення розсинхронізації в середині файлу (реклама, вирізані сцени, склейки).\n(За замовчуванням: Без розділень (-1), Рекомендовано: 4-20)\n• Вищі значення (10-20): Менше розділень.\n• Нижчі значення (2-5): Більше розділень.",
+                        "ja_JP": "ファイル途中のズレ（CM、シーンカット、複数ディスクの結合など）を修正するために区分アライメントを有効にします。\n（デフォルト：分割なし (-1)、推奨：4-20）\n• 高い値 (10-20)：保守的、分割数が減少。\n• 低い値 (2-5)：積極的、分割数を許容。",
+                        "ko_KR": "파일 중간의 싱크 끊김(광고, 장면 편집, 여러 디스크 병합)을 보정하기 위해 구간별 정렬을 활성화합니다.\n(기본값: 분할 없음 (-1), 권장: 4-20)\n• 높은 값 (10-20): 보수적, 적은 분할.\n• 낮은 값 (2-5): 적극적, 더 많은 분할.",
+                        "hi_IN": "फ़ाइल के मध्य में सिंक विसंगतियों (विज्ञापन, दृश्य कटौती) को ठीक करने के लिए टुकड़ा संरेखण सक्षम करें।\n(डिफ़ॉल्ट: कोई विभाजन नहीं (-1), अनुशंसित: 4-20)\n• उच्च मान (10-20): अधिक रूढ़िवादी, कम विभाजन।\n• निम्न मान (2-5): अधिक आक्रामक, अधिक विभाजन।",
+                        "bn_BD": "ফাইলের মধ্যবর্তী সিঙ্ক ত্রুটি (বিজ্ঞাপন, দৃশ্য ছাঁটাই) সংশোধন করতে খণ্ডভিত্তিক অ্যালাইনমেন্ট সক্ষম করুন।\n(ডিফল্ট: কোনো বিভাজন নেই (-1), প্রস্তাবিত: 4-20)\n• উচ্চ মান (10-20): কম বিভাজন।\n• নিম্ন মান (2-5): বেশি বিভাজন।",
+                        "it_IT": "Abilita l'allineamento a tratti per correggere desincronizzazioni a metà file (pubblicità, tagli di scena, concatenazioni).\n(Predefinito: Nessuna divisione (-1), Consigliato: 4-20)\n• Valori più alti (10-20): Più conservativo, meno divisioni.\n• Valori più bassi (2-5): Più aggressivo, più divisioni.",
+                        "fr_FR": "Active l'alignement par morceaux pour corriger les décalages en cours de vidéo (publicités, scènes coupées, disques concaténés).\n(Par défaut : Aucune division (-1), Recommandé : 4-20)\n• Valeurs élevées (10-20) : Plus conservateur, moins de découpes.\n• Valeurs basses (2-5) : Plus permissif, plus de découpes.",
+                        "de_DE": "Aktiviert die stückweise Ausrichtung, um Synchronisationsbrüche mitten in der Datei (Werbung, Szenenschnitte) zu korrigieren.\n(Standard: Keine Aufteilung (-1), Empfohlen: 4-20)\n• Höhere Werte (10-20): Konservativer, weniger Teilungen.\n• Niedrigere Werte (2-5): Aggressiver, mehr Teilungen.",
+                        "pt_PT": "Ativa o alinhamento por partes para corrigir desfasamentos a meio do ficheiro (intervalos comerciais, cortes de cenas).\n(Padrão: Sem divisões (-1), Recomendado: 4-20)\n• Valores altos (10-20): Mais conservador, menos divisões.\n• Valores baixos (2-5): Mais agressivo, permite mais divisões.",
+                        "ar_SA": "تمكين المحاذاة المجزأة لتصحيح انقطاعات المزامنة في منتصف الملف (الإعلانات، قص المشاهد).\n(افتراضي: لا تقسيمات (-1)، موصى به: 4-20)\n• القيم الأعلى (10-20): أكثر تحفظًا، تقسيمات أقل.\n• القيم الأقل (2-5): تقسيمات أكثر.",
+                        "vi_VN": "Bật căn chỉnh từng phần để sửa lỗi lệch đồng bộ giữa tệp (quảng cáo, cắt cảnh, nối đĩa).\n(Mặc định: Không chia nhỏ (-1), Khuyến nghị: 4-20)\n• Giá trị cao (10-20): Thận trọng hơn, ít đoạn cắt hơn.\n• Giá trị thấp (2-5): Cho phép nhiều đoạn cắt hơn.",
+                        "fa_IR": "همگام‌سازی تکه‌ای را برای رفع ناهماهنگی‌های میانه فایل (تبلیغات، برش صحنه) فعال می‌کند.\n(پیش‌فرض: بدون تقسیم (-1)، پیشنهادی: 4-20)\n• مقادیر بالاتر (10-20): تقسیمات کمتر.\n• مقادیر پایین‌تر (2-5): تقسیمات بیشتر.",
+                        "id_ID": "Aktifkan penyelarasan per bagian untuk memperbaiki jeda sinkronisasi di tengah file (iklan, potongan adegan, penggabungan disk).\n(Default: Tidak ada pemisahan (-1), Direkomendasikan: 4-20)\n• Nilai lebih tinggi (10-20): Lebih konservatif, lebih sedikit pemisahan.\n• Nilai lebih rendah (2-5): Lebih agresif, mengizinkan lebih banyak pemisahan.",
+                        "ms_MY": "Dayakan penjajaran cebisan untuk membetulkan gangguan segerak di tengah-tengah fail (iklan, potongan babak).\n(Lalai: Tiada pecahan (-1), Disyorkan: 4-20)\n• Nilai lebih tinggi (10-20): Kurang pecahan.\n• Nilai lebih rendah (2-5): Membenarkan lebih banyak pecahan.",
+                        "th_TH": "เปิดใช้การจัดตำแหน่งเป็นส่วนๆ เพื่อแก้ไขปัญหาการซิงค์ขาดตอนกลางไฟล์ (โฆษณา, ฉากที่ถูกตัด)\n(ค่าเริ่มต้น: ไม่มีการแบ่ง (-1), แนะนำ: 4-20)\n• ค่าสูง (10-20): แบ่งน้อยลง ปลอดภัยขึ้น\n• ค่าต่ำ (2-5): ยอมให้แบ่งได้มากขึ้น",
+                        "ur_PK": "درمیان میں سنک کے وقفوں (اشتہارات، کٹس) کو درست کرنے کے لیے پیس وائز الائنمنٹ فعال کریں۔\n(ڈیفالٹ: کوئی تقسیم نہیں (-1)، تجویز کردہ: 4-20)\n• اعلی اقدار (10-20): کم تقسیم۔\n• کم اقدار (2-5): زیادہ تقسیم۔",
+                        "zh_TW": "啟用分段對齊以修復片中同步中斷（廣告插播、刪減場景、多碟合併）。\n（預設：不分割 (-1)，建議：4-20）\n• 較高值 (10-20)：更保守，產生較少分割。\n• 較低值 (2-5)：更積極，允許更多分割。",
+                    },
+                    "argument": "--split-penalty",
+                    "range": [-1, 50],
+                    "default": -1,
                 },
-                "tooltip": {
-                    "en_US": "Sample short segments spread across the reference video and compute a weighted median offset. Significantly speeds up sync for long videos or remote URLs.",
-                    "es_ES": "Muestrea segmentos cortos distribuidos a lo largo del vídeo y calcula una mediana ponderada. Acelera significativamente la sincronización de vídeos largos o URL remotas.",
-                    "tr_TR": "Referans video boyunca dağıtılmış kısa parçaları örnekler ve ağırlıklı medyan ofseti hesaplar. Uzun videolar veya uzak URL'ler için senkronizasyonu önemli ölçüde hızlandırır.",
-                    "zh_CN": "在参考视频中抽取分布的多段短片段并计算加权中位数偏移量。显著加快长视频或远程 URL 的同步速度。",
-                    "ru_RU": "Выбирает короткие фрагменты по всей длине видео и вычисляет взвешенное медианное смещение. Значительно ускоряет синхронизацию длинных видео и удаленных URL.",
-                    "pl_PL": "Pobiera krótkie próbki z całego wideo i oblicza ważoną medianę przesunięcia. Znacząco przyspiesza synchronizację długich filmów i zdalnych URL.",
-                    "uk_UA": "Вибирає короткі фрагменти по всій довжині відео та обчислює зважене медіанне зміщення. Значно прискорює синхронізацію довгих відео та віддалених URL.",
-                    "ja_JP": "動画全体に分散した短いセグメントをサンプリングし、加重中央値オフセットを計算します。長時間の動画やリモートURLの同期を大幅に高速化します。",
-                    "ko_KR": "비디오 전체에 분산된 짧은 구간들을 샘플링하여 가중 중앙값 오프셋을 계산합니다. 긴 비디오나 원격 URL의 동기화 속도를 크게 향상시킵니다.",
-                    "hi_IN": "वीडियो में फैले छोटे खंडों का नमूना लें और भारित माध्यिका ऑफ़सेट की गणना करें। लंबी वीडियो या रिमोट URL के लिए सिंक को काफी तेज़ करता है।",
-                    "bn_BD": "ভিডিও জুড়ে কয়েকটি ছোট সেগমেন্টের নমুনা নেয় এবং ওজনযুক্ত মধ্যক অফসেট গণনা করে। দীর্ঘ ভিডিও বা দূরবর্তী URL-এর জন্য সিঙ্ককে দ্রুত করে।",
-                    "it_IT": "Campiona brevi segmenti lungo il video e calcola un offset mediano ponderato. Velocizza notevolmente la sincronizzazione per video lunghi o URL remoti.",
-                    "fr_FR": "Échantillonne de courts segments répartis sur la vidéo et calcule un décalage médian pondéré. Accélère nettement la synchronisation pour les longues vidéos ou URL distantes.",
-                    "de_DE": "Nimmt kurze Stichproben über das Video verteilt und berechnet einen gewichteten Median-Offset. Beschleunigt die Synchronisation bei langen Videos oder Remote-URLs erheblich.",
-                    "pt_PT": "Amostra segmentos curtos distribuídos pelo vídeo e calcula um deslocamento mediano ponderado. Acelera significativamente a sincronização de vídeos longos ou URLs remotas.",
-                    "ar_SA": "يأخذ عينات من مقاطع قصيرة موزعة عبر الفيديو ويحسب متوسط الإزاحة الموزون. يسرع المزامنة بشكل ملحوظ للفيديوهات الطويلة أو الروابط البعيدة.",
-                    "vi_VN": "Lấy mẫu các đoạn ngắn phân bổ trên video và tính toán độ lệch trung vị có trọng số. Tăng tốc độ đồng bộ hóa đáng kể cho video dài hoặc URL từ xa.",
-                    "fa_IR": "از بخش‌های کوتاه در طول ویدیو نمونه‌برداری می‌کند و آفست میانه وزن‌دار را محاسبه می‌کند. همگام‌سازی را برای ویدیوهای طولانی یا URLهای راه دور بسیار سریع‌تر می‌کند.",
-                    "id_ID": "Mengambil sampel segmen pendek yang tersebar di video dan menghitung offset median tertimbang. Mempercepat sinkronisasi secara signifikan untuk video panjang atau URL jarak jauh.",
-                    "ms_MY": "Mengambil sampel segmen pendek yang tersebar di seluruh video dan mengira ofset median berpemberat. Mempercepatkan penyegerakan untuk video panjang atau URL jauh.",
-                    "th_TH": "สุ่มตัวอย่างช่วงสั้นๆ ทั่วทั้งวิดีโอและคำบรรยายแบบถ่วงน้ำหนัก ช่วยเพิ่มความเร็วในการซิงค์สำหรับวิดีโอยาวหรือ URL ระยะไกลได้อย่างมาก",
-                    "ur_PK": "ویڈیو میں پھیلے ہوئے مختصر حصوں کا نمونہ لیتا ہے اور ویٹڈ میڈین آفسیٹ کا حساب لگاتا ہے۔ لمبی ویڈیوز یا ریموٹ URLs کے لیے سنک کو کافی تیز کرتا ہے۔",
-                    "zh_TW": "在參考影片中抽樣分布的多段短片段並計算加權中位數偏移量。顯著加快長影片或遠端 URL 的同步速度。",
+                "vad": {
+                    "type": "dropdown",
+                    "label": {
+                        "en_US": "Voice activity detector",
+                        "es_ES": "Detector de actividad de voz",
+                        "tr_TR": "Ses aktivite dedektörü",
+                        "zh_CN": "语音活动检测器",
+                        "ru_RU": "Детектор голосовой активности",
+                        "pl_PL": "Detektor aktywności głosu",
+                        "uk_UA": "Детектор голосової активності",
+                        "ja_JP": "音声活動検出器",
+                        "ko_KR": "음성 활동 감지기",
+                        "hi_IN": "आवाज गतिविधि डिटेक्टर",
+                        "bn_BD": "ভয়েস অ্যাক্টিভিটি ডিটেক্টর",
+                        "it_IT": "Rilevatore di attività vocale",
+                        "fr_FR": "Détecteur d'activité vocale",
+                        "de_DE": "Sprachaktivitätsdetektor",
+                        "pt_PT": "Detector de atividade de voz",
+                        "ar_SA": "كاشف نشاط الصوت",
+                        "vi_VN": "Bộ phát hiện hoạt động giọng nói",
+                        "fa_IR": "تشخیص‌دهنده فعالیت صوتی",
+                        "id_ID": "Detektor aktivitas suara",
+                        "ms_MY": "Pengesan aktiviti suara",
+                        "th_TH": "เครื่องตรวจจับกิจกรรมเสียง",
+                        "ur_PK": "آواز کی سرگرمی کا پتہ لگانے والا",
+                        "zh_TW": "語音活動偵測器",
+                    },
+                    "tooltip": {
+                        "en_US": "Which voice activity detector (VAD) to use for speech extraction (if using video / audio as a reference, default=subs_then_webrtc).\nAuditok can sometimes work better in the case of low-quality audio than WebRTC.",
+                        "es_ES": "Qué detector de actividad de voz (VAD) usar para la extracción de voz (si se usa video/audio como referencia, predeterminado=subs_then_webrtc).\nAuditok a veces puede funcionar mejor en el caso de audio de baja calidad que WebRTC.",
+                        "tr_TR": "Konuşma çıkarımı için hangi ses aktivite dedektörünü (VAD) kullanacağını belirler (video/ses referans olarak kullanılıyorsa, varsayılan=subs_then_webrtc).\nAuditok bazen düşük kaliteli ses durumunda WebRTC'den daha iyi çalışabilir.",
+                        "zh_CN": "用于语音提取的语音活动检测器（VAD）（如果使用视频/音频作为参考，默认=subs_then_webrtc）。\n在低质量音频情况下，Auditok有时比WebRTC工作得更好。",
+                        "ru_RU": "Какой детектор голосовой активности (VAD) использовать для извлечения речи (если используется видео/аудио в качестве эталона, по умолчанию=subs_then_webrtc).\nAuditok иногда может работать лучше в случае низкокачественного аудио, чем WebRTC.",
+                        "pl_PL": "Który detektor aktywności głosu (VAD) używać do ekstrakcji mowy (jeśli używasz wideo/audio jako referencji, domyślnie=subs_then_webrtc).\nAuditok czasami może działać lepiej w przypadku audio niskiej jakości niż WebRTC.",
+                        "uk_UA": "Який детектор голосової активності (VAD) використовувати для витягування мовлення (якщо використовується відео/аудіо як еталон, за замовчуванням=subs_then_webrtc).\nAuditok іноді може працювати краще у випадку низькоякісного аудіо, ніж WebRTC.",
+                        "ja_JP": "音声抽出に使用する音声活動検出器（VAD）（ビデオ/オーディオを参照として使用する場合、デフォルト=subs_then_webrtc）。\nAuditokは、低品質のオーディオの場合、WebRTCよりもうまく動作することがあります。",
+                        "ko_KR": "음성 추출에 사용할 음성 활동 감지기（VAD）（비디오/오디오를 참조로 사용하는 경우, 기본값=subs_then_webrtc）。\nAuditok은 때때로 저품질 오디오의 경우 WebRTC보다 더 잘 작동할 수 있습니다。",
+                        "hi_IN": "भाषण निष्कर्षण के लिए कौन सा आवाज गतिविधि डिटेक्टर (VAD) उपयोग करना है (यदि वीडियो/ऑडियो को संदर्भ के रूप में उपयोग कर रहे हैं, डिफ़ॉल्ट=subs_then_webrtc)।\nAuditok कभी-कभी कम गुणवत्ता वाले ऑडियो के मामले में WebRTC से बेहतर काम कर सकता है।",
+                        "bn_BD": "স্পিচ এক্সট্র্যাকশনের জন্য কোন ভয়েস অ্যাক্টিভিটি ডিটেক্টর (VAD) ব্যবহার করবেন (যদি ভিডিও/অডিও রেফারেন্স হিসেবে ব্যবহার করেন, ডিফল্ট=subs_then_webrtc)।\nAuditok কখনও কখনও কম মানের অডিওর ক্ষেত্রে WebRTC এর চেয়ে ভাল কাজ করতে পারে।",
+                        "it_IT": "Quale rilevatore di attività vocale (VAD) utilizzare per l'estrazione del parlato (se si utilizza video/audio come riferimento, predefinito=subs_then_webrtc).\nAuditok a volte può funzionare meglio nel caso di audio di bassa qualità rispetto a WebRTC.",
+                        "fr_FR": "Quel détecteur d'activité vocale (VAD) utiliser pour l'extraction de la parole (si vous utilisez vidéo/audio comme référence, par défaut=subs_then_webrtc).\nAuditok peut parfois mieux fonctionner dans le cas d'audio de faible qualité que WebRTC.",
+                        "de_DE": "Welcher Sprachaktivitätsdetektor (VAD) für die Sprachextraktion verwendet werden soll (falls Video/Audio als Referenz verwendet wird, Standard=subs_then_webrtc).\nAuditok kann manchmal bei Audio niedriger Qualität besser funktionieren als WebRTC.",
+                        "pt_PT": "Qual detector de atividade de voz (VAD) usar para extração de fala (se usar vídeo/áudio como referência, padrão=subs_then_webrtc).\nAuditok às vezes pode funcionar melhor no caso de áudio de baixa qualidade do que WebRTC.",
+                        "ar_SA": "أي كاشف نشاط صوتي (VAD) لاستخدامه لاستخراج الكلام (إذا كنت تستخدم فيديو/صوت كمرجع، افتراضي=subs_then_webrtc).\nيمكن أن يعمل Auditok أحيانًا بشكل أفضل في حالة الصوت منخفض الجودة من WebRTC.",
+                        "vi_VN": "Bộ phát hiện hoạt động giọng nói (VAD) nào để sử dụng cho việc trích xuất giọng nói (nếu sử dụng video/âm thanh làm tham chiếu, mặc định=subs_then_webrtc).\nAuditok đôi khi có thể hoạt động tốt hơn trong trường hợp âm thanh chất lượng thấp so với WebRTC.",
+                        "fa_IR": "کدام تشخیص‌دهنده فعالیت صوتی (VAD) برای استخراج گفتار استفاده شود (اگر از ویدیو/صدا به عنوان مرجع استفاده می‌کنید، پیش‌فرض=subs_then_webrtc).\nAuditok گاهی اوقات می‌تواند در مورد صدای کیفیت پایین بهتر از WebRTC عمل کند.",
+                        "id_ID": "Detektor aktivitas suara (VAD) mana yang digunakan untuk ekstraksi bicara (jika menggunakan video/audio sebagai referensi, default=subs_then_webrtc).\nAuditok terkadang dapat bekerja lebih baik dalam kasus audio berkualitas rendah daripada WebRTC.",
+                        "ms_MY": "Pengesan aktiviti suara (VAD) yang manakah untuk digunakan bagi pengekstrakan pertuturan (jika menggunakan video/audio sebagai rujukan, lalai=subs_then_webrtc).\nAuditok kadangkala boleh berfungsi lebih baik dalam kes audio berkualiti rendah berbanding WebRTC.",
+                        "th_TH": "เครื่องตรวจจับกิจกรรมเสียง (VAD) ไหนที่จะใช้สำหรับการแยกเสียงพูด (หากใช้วิดีโอ/เสียงเป็นอ้างอิง ค่าเริ่มต้น=subs_then_webrtc)\nAuditok บางครั้งอาจทำงานได้ดีกว่าในกรณีของเสียงคุณภาพต่ำกว่า WebRTC",
+                        "ur_PK": "تقریر نکالنے کے لیے کون سا آواز کی سرگرمی کا پتہ لگانے والا (VAD) استعمال کرنا ہے (اگر ویڈیو/آڈیو کو ریفرنس کے طور پر استعمال کر رہے ہیں، ڈیفالٹ=subs_then_webrtc)۔\nAuditok کبھی کبھی کم معیار کی آڈیو کے معاملے میں WebRTC سے بہتر کام کر سکتا ہے۔",
+                        "zh_TW": "用於語音提取的語音活動偵測器 (VAD)（如果使用影片/音訊作為參考，預設=subs_then_webrtc）。\n在低音質的情況下，Auditok 有時比 WebRTC 效果更好。",
+                    },
+                    "argument": "--vad",
+                    "default": "default",
+                    "values": [
+                        "default",
+                        "subs_then_webrtc",
+                        "subs_then_auditok",
+                        "subs_then_silero",
+                        "webrtc",
+                        "auditok",
+                        "silero",
+                    ],
+                    "value_labels": {
+                        "default": {
+                            "en_US": "Default",
+                            "es_ES": "Predeterminado",
+                            "tr_TR": "Varsayılan",
+                            "zh_CN": "默认",
+                            "ru_RU": "По умолчанию",
+                            "pl_PL": "Domyślny",
+                            "uk_UA": "За замовчуванням",
+                            "ja_JP": "デフォルト",
+                            "ko_KR": "기본값",
+                            "hi_IN": "डिफ़ॉल्ट",
+                            "bn_BD": "ডিফল্ট",
+                            "it_IT": "Predefinito",
+                            "fr_FR": "Par défaut",
+                            "de_DE": "Standard",
+                            "pt_PT": "Padrão",
+                            "ar_SA": "افتراضي",
+                            "vi_VN": "Mặc định",
+                            "fa_IR": "پیش‌فرض",
+                            "id_ID": "Default",
+                            "ms_MY": "Lalai",
+                            "th_TH": "ค่าเริ่มต้น",
+                            "ur_PK": "ڈیفالٹ",
+                            "zh_TW": "預設",
+                        },
+                        "subs_then_webrtc": {
+                            "en_US": "Subs then WebRTC",
+                            "es_ES": "Subtítulos y luego WebRTC",
+                            "tr_TR": "Önce altyazılar sonra WebRTC",
+                            "zh_CN": "字幕然后WebRTC",
+                            "ru_RU": "Субтитры, затем WebRTC",
+                            "pl_PL": "Napisy, potem WebRTC",
+                            "uk_UA": "Субтитри, потім WebRTC",
+                            "ja_JP": "字幕からWebRTC",
+                            "ko_KR": "자막 후 WebRTC",
+                            "hi_IN": "उपशीर्षक फिर WebRTC",
+                            "bn_BD": "সাবটাইটেল তারপর WebRTC",
+                            "it_IT": "Sottotitoli poi WebRTC",
+                            "fr_FR": "Sous-titres puis WebRTC",
+                            "de_DE": "Untertitel dann WebRTC",
+                            "pt_PT": "Legendas e depois WebRTC",
+                            "ar_SA": "الترجمات ثم WebRTC",
+                            "vi_VN": "Phụ đề rồi WebRTC",
+                            "fa_IR": "زیرنویس‌ها سپس WebRTC",
+                            "id_ID": "Subtitle lalu WebRTC",
+                            "ms_MY": "Sarikata kemudian WebRTC",
+                            "th_TH": "คำบรรยายแล้ว WebRTC",
+                            "ur_PK": "سب ٹائٹل پھر WebRTC",
+                            "zh_TW": "字幕然後 WebRTC",
+                        },
+                        "subs_then_auditok": {
+                            "en_US": "Subs then Auditok",
+                            "es_ES": "Subtítulos y luego Auditok",
+                            "tr_TR": "Önce altyazılar sonra Auditok",
+                            "zh_CN": "字幕然后Auditok",
+                            "ru_RU": "Субтитры, затем Auditok",
+                            "pl_PL": "Napisy, potem Auditok",
+                            "uk_UA": "Субтитри, потім Auditok",
+                            "ja_JP": "字幕からAuditok",
+                            "ko_KR": "자막 후 Auditok",
+                            "hi_IN": "उपशीर्षक फिर Auditok",
+                            "bn_BD": "সাবটাইটেল তারপর Auditok",
+                            "it_IT": "Sottotitoli poi Auditok",
+                            "fr_FR": "Sous-titres puis Auditok",
+                            "de_DE": "Untertitel dann Auditok",
+                            "pt_PT": "Legendas e depois Auditok",
+                            "ar_SA": "الترجمات ثم Auditok",
+                            "vi_VN": "Phụ đề rồi Auditok",
+                            "fa_IR": "زیرنویس‌ها سپس Auditok",
+                            "id_ID": "Subtitle lalu Auditok",
+                            "ms_MY": "Sarikata kemudian Auditok",
+                            "th_TH": "คำบรรยายแล้ว Auditok",
+                            "ur_PK": "سب ٹائٹل پھر Auditok",
+                            "zh_TW": "字幕然後 Auditok",
+                        },
+                        "subs_then_silero": {
+                            "en_US": "Subs then Silero",
+                            "es_ES": "Subtítulos y luego Silero",
+                            "tr_TR": "Önce altyazılar sonra Silero",
+                            "zh_CN": "字幕然后Silero",
+                            "ru_RU": "Субтитры, затем Silero",
+                            "pl_PL": "Napisy, potem Silero",
+                            "uk_UA": "Субтитри, потім Silero",
+                            "ja_JP": "字幕からSilero",
+                            "ko_KR": "자막 후 Silero",
+                            "hi_IN": "उपशीर्षक फिर Silero",
+                            "bn_BD": "সাবটাইটেল তারপর Silero",
+                            "it_IT": "Sottotitoli poi Silero",
+                            "fr_FR": "Sous-titres puis Silero",
+                            "de_DE": "Untertitel dann Silero",
+                            "pt_PT": "Legendas e depois Silero",
+                            "ar_SA": "الترجمات ثم Silero",
+                            "vi_VN": "Phụ đề rồi Silero",
+                            "fa_IR": "زیرنویس‌ها سپس Silero",
+                            "id_ID": "Subtitle lalu Silero",
+                            "ms_MY": "Sarikata kemudian Silero",
+                            "th_TH": "คำบรรยายแล้ว Silero",
+                            "ur_PK": "سب ٹائٹل پھر Silero",
+                            "zh_TW": "字幕然後 Silero",
+                        },
+                        "webrtc": "WebRTC",
+                        "auditok": "Auditok",
+                        "silero": "Silero",
+                    },
                 },
-                "argument": "--multi-segment-sync",
-                "default": False,
             },
-            "split_penalty": {
-                "type": "slider",
-                "label": {
-                    "en_US": "Split penalty",
-                    "es_ES": "Penalización por división",
-                    "tr_TR": "Bölme cezası",
-                    "zh_CN": "分割惩罚",
-                    "ru_RU": "Штраф за разделение",
-                    "pl_PL": "Kara za podział",
-                    "uk_UA": "Штраф за розділення",
-                    "ja_JP": "分割ペナルティ",
-                    "ko_KR": "분할 패널티",
-                    "hi_IN": "विभाजन दंड",
-                    "bn_BD": "স্প্লিট পেনাল্টি",
-                    "it_IT": "Penalità di divisione",
-                    "fr_FR": "Pénalité de division",
-                    "de_DE": "Teilungsstrafe",
-                    "pt_PT": "Penalidade de divisão",
-                    "ar_SA": "عقوبة التقسيم",
-                    "vi_VN": "Phạt phân tách",
-                    "fa_IR": "جریمه تقسیم",
-                    "id_ID": "Penalti pemisahan",
-                    "ms_MY": "Penalti pemisahan",
-                    "th_TH": "บทลงโทษการแบ่ง",
-                    "ur_PK": "تقسیم کی سزا",
-                    "zh_TW": "分割懲罰",
-                },
-                "tooltip": {
-                    "en_US": "Enable piecewise alignment to correct mid-file sync breaks (commercials, scene cuts, multi-disc concatenations).\n(Default: No splits (-1), Recommended: 4-20)\n• Higher values (10-20): More conservative, fewer splits.\n• Lower values (2-5): More aggressive, allows more splits.",
-                    "es_ES": "Habilita la alineación por tramos para corregir desincronizaciones en el archivo (anuncios, cortes de escena, etc.).\n(Predeterminado: Sin divisiones (-1), Recomendado: 4-20)\n• Valores altos (10-20): Más conservador, menos divisiones.\n• Valores bajos (2-5): Más agresivo, permite más divisiones.",
-                    "tr_TR": "Ara sahne veya reklam kesintilerinden kaynaklanan senkronizasyon kaymalarını düzeltmek için parçalı hizalamayı etkinleştirir.\n(Varsayılan: Bölme yok (-1), Önerilen: 4-20)\n• Yüksek değerler (10-20): Daha temkinli, daha az bölme.\n• Düşük değerler (2-5): Daha hassas, daha fazla bölme.",
-                    "zh_CN": "启用分段对齐以修复片中同步断裂（广告插播、删减场景、多碟拼接）。\n（默认：无分割 (-1)，推荐：4-20）\n• 较高值 (10-20)：更保守，产生较少分割。\n• 较低值 (2-5)：更激进，允许更多分割。",
-                    "ru_RU": "Включить кусочное выравнивание для исправления рассинхронизации в середине файла (реклама, вырезанные сцены, склейки).\n(По умолчанию: Без разбиений (-1), Рекомендуется: 4-20)\n• Высокие значения (10-20): Меньше разбиений.\n• Низкие значения (2-5): Больше разбиений.",
-                    "pl_PL": "Włącz wyrównywanie fragmentami, aby naprawić przesunięcia w środku pliku (reklamy, cięcia scen, łączenia płyt).\n(Domyślnie: Brak podziałów (-1), Zalecane: 4-20)\n• Wyższe wartości (10-20): Mniej podziałów.\n• Niższe wartości (2-5): Więcej podziałów.",
-                    "uk_UA": "Увімкнути кускове вирівнювання для виправлення розсинхронізації в середині файлу (реклама, вирізані сцени, склейки).\n(За замовчуванням: Без розділень (-1), Рекомендовано: 4-20)\n• Вищі значення (10-20): Менше розділень.\n• Нижчі значення (2-5): Більше розділень.",
-                    "ja_JP": "ファイル途中のズレ（CM、シーンカット、複数ディスクの結合など）を修正するために区分アライメントを有効にします。\n（デフォルト：分割なし (-1)、推奨：4-20）\n• 高い値 (10-20)：保守的、分割数が減少。\n• 低い値 (2-5)：積極的、分割数を許容。",
-                    "ko_KR": "파일 중간의 싱크 끊김(광고, 장면 편집, 여러 디스크 병합)을 보정하기 위해 구간별 정렬을 활성화합니다.\n(기본값: 분할 없음 (-1), 권장: 4-20)\n• 높은 값 (10-20): 보수적, 적은 분할.\n• 낮은 값 (2-5): 적극적, 더 많은 분할.",
-                    "hi_IN": "फ़ाइल के मध्य में सिंक विसंगतियों (विज्ञापन, दृश्य कटौती) को ठीक करने के लिए टुकड़ा संरेखण सक्षम करें।\n(डिफ़ॉल्ट: कोई विभाजन नहीं (-1), अनुशंसित: 4-20)\n• उच्च मान (10-20): अधिक रूढ़िवादी, कम विभाजन।\n• निम्न मान (2-5): अधिक आक्रामक, अधिक विभाजन।",
-                    "bn_BD": "ফাইলের মধ্যবর্তী সিঙ্ক ত্রুটি (বিজ্ঞাপন, দৃশ্য ছাঁটাই) সংশোধন করতে খণ্ডভিত্তিক অ্যালাইনমেন্ট সক্ষম করুন।\n(ডিফল্ট: কোনো বিভাজন নেই (-1), প্রস্তাবিত: 4-20)\n• উচ্চ মান (10-20): কম বিভাজন।\n• নিম্ন মান (2-5): বেশি বিভাজন।",
-                    "it_IT": "Abilita l'allineamento a tratti per correggere desincronizzazioni a metà file (pubblicità, tagli di scena, concatenazioni).\n(Predefinito: Nessuna divisione (-1), Consigliato: 4-20)\n• Valori più alti (10-20): Più conservativo, meno divisioni.\n• Valori più bassi (2-5): Più aggressivo, più divisioni.",
-                    "fr_FR": "Active l'alignement par morceaux pour corriger les décalages en cours de vidéo (publicités, scènes coupées, disques concaténés).\n(Par défaut : Aucune division (-1), Recommandé : 4-20)\n• Valeurs élevées (10-20) : Plus conservateur, moins de découpes.\n• Valeurs basses (2-5) : Plus permissif, plus de découpes.",
-                    "de_DE": "Aktiviert die stückweise Ausrichtung, um Synchronisationsbrüche mitten in der Datei (Werbung, Szenenschnitte) zu korrigieren.\n(Standard: Keine Aufteilung (-1), Empfohlen: 4-20)\n• Höhere Werte (10-20): Konservativer, weniger Teilungen.\n• Niedrigere Werte (2-5): Aggressiver, mehr Teilungen.",
-                    "pt_PT": "Ativa o alinhamento por partes para corrigir desfasamentos a meio do ficheiro (intervalos comerciais, cortes de cenas).\n(Padrão: Sem divisões (-1), Recomendado: 4-20)\n• Valores altos (10-20): Mais conservador, menos divisões.\n• Valores baixos (2-5): Mais agressivo, permite mais divisões.",
-                    "ar_SA": "تمكين المحاذاة المجزأة لتصحيح انقطاعات المزامنة في منتصف الملف (الإعلانات، قص المشاهد).\n(افتراضي: لا تقسيمات (-1)، موصى به: 4-20)\n• القيم الأعلى (10-20): أكثر تحفظًا، تقسيمات أقل.\n• القيم الأقل (2-5): تقسيمات أكثر.",
-                    "vi_VN": "Bật căn chỉnh từng phần để sửa lỗi lệch đồng bộ giữa tệp (quảng cáo, cắt cảnh, nối đĩa).\n(Mặc định: Không chia nhỏ (-1), Khuyến nghị: 4-20)\n• Giá trị cao (10-20): Thận trọng hơn, ít đoạn cắt hơn.\n• Giá trị thấp (2-5): Cho phép nhiều đoạn cắt hơn.",
-                    "fa_IR": "همگام‌سازی تکه‌ای را برای رفع ناهماهنگی‌های میانه فایل (تبلیغات، برش صحنه) فعال می‌کند.\n(پیش‌فرض: بدون تقسیم (-1)، پیشنهادی: 4-20)\n• مقادیر بالاتر (10-20): تقسیمات کمتر.\n• مقادیر پایین‌تر (2-5): تقسیمات بیشتر.",
-                    "id_ID": "Aktifkan penyelarasan per bagian untuk memperbaiki jeda sinkronisasi di tengah file (iklan, potongan adegan, penggabungan disk).\n(Default: Tidak ada pemisahan (-1), Direkomendasikan: 4-20)\n• Nilai lebih tinggi (10-20): Lebih konservatif, lebih sedikit pemisahan.\n• Nilai lebih rendah (2-5): Lebih agresif, mengizinkan lebih banyak pemisahan.",
-                    "ms_MY": "Dayakan penjajaran cebisan untuk membetulkan gangguan segerak di tengah-tengah fail (iklan, potongan babak).\n(Lalai: Tiada pecahan (-1), Disyorkan: 4-20)\n• Nilai lebih tinggi (10-20): Kurang pecahan.\n• Nilai lebih rendah (2-5): Membenarkan lebih banyak pecahan.",
-                    "th_TH": "เปิดใช้การจัดตำแหน่งเป็นส่วนๆ เพื่อแก้ไขปัญหาการซิงค์ขาดตอนกลางไฟล์ (โฆษณา, ฉากที่ถูกตัด)\n(ค่าเริ่มต้น: ไม่มีการแบ่ง (-1), แนะนำ: 4-20)\n• ค่าสูง (10-20): แบ่งน้อยลง ปลอดภัยขึ้น\n• ค่าต่ำ (2-5): ยอมให้แบ่งได้มากขึ้น",
-                    "ur_PK": "درمیان میں سنک کے وقفوں (اشتہارات، کٹس) کو درست کرنے کے لیے پیس وائز الائنمنٹ فعال کریں۔\n(ڈیفالٹ: کوئی تقسیم نہیں (-1)، تجویز کردہ: 4-20)\n• اعلی اقدار (10-20): کم تقسیم۔\n• کم اقدار (2-5): زیادہ تقسیم۔",
-                    "zh_TW": "啟用分段對齊以修復片中同步中斷（廣告插播、刪減場景、多碟合併）。\n（預設：不分割 (-1)，建議：4-20）\n• 較高值 (10-20)：更保守，產生較少分割。\n• 較低值 (2-5)：更積極，允許更多分割。",
-                },
-                "argument": "--split-penalty",
-                "range": [-1, 50],
-                "default": -1,
+        },
+        "lapse": {
+            "version": "2.0.1",
+            "description": {
+                "en_US": "Language-Agnostic Playback Synchronization Engine",
+                "es_ES": "Motor de sincronización de reproducción independiente del idioma",
+                "tr_TR": "Dil Bağımsız Oynatma Senkronizasyon Motoru",
+                "zh_CN": "语言无关播放同步引擎",
+                "ru_RU": "Языково-независимый движок синхронизации воспроизведения",
+                "pl_PL": "Niezależny od języka silnik synchronizacji odtwarzania",
+                "uk_UA": "Мовно-незалежний рушій синхронізації відтворення",
+                "ja_JP": "言語非依存の再生同期エンジン",
+                "ko_KR": "언어 비의존적 재생 동기화 엔진",
+                "hi_IN": "भाषा-अज्ञेयवादी प्लेबैक सिंक्रोनाइज़ेशन इंजन",
+                "bn_BD": "ভাষা-অজ্ঞেয়বাদী প্লেব্যাক সিঙ্ক্রোনাইজেশন ইঞ্জিন",
+                "it_IT": "Motore di sincronizzazione della riproduzione indipendente dalla lingua",
+                "fr_FR": "Moteur de synchronisation de lecture indépendant de la langue",
+                "de_DE": "Sprachunabhängige Wiedergabesynchronisations-Engine",
+                "pt_PT": "Motor de sincronização de reprodução independente de idioma",
+                "ar_SA": "محرك مزامنة التشغيل المستقل عن اللغة",
+                "vi_VN": "Công cụ đồng bộ phát lại không phụ thuộc vào ngôn ngữ",
+                "fa_IR": "موتور همگام‌سازی پخش مستقل از زبان",
+                "id_ID": "Mesin Sinkronisasi Pemutaran Independen Bahasa",
+                "ms_MY": "Enjin Penyelarasan Main Semula Bebas Bahasa",
+                "th_TH": "เครื่องมือซิงค์การเล่นที่ไม่ขึ้นกับภาษา",
+                "ur_PK": "زبان سے آزاد پلے بیک سنکرونائزیشن انجن",
+                "zh_TW": "語言無關播放同步引擎",
             },
-            "vad": {
-                "type": "dropdown",
-                "label": {
-                    "en_US": "Voice activity detector",
-                    "es_ES": "Detector de actividad de voz",
-                    "tr_TR": "Ses aktivite dedektörü",
-                    "zh_CN": "语音活动检测器",
-                    "ru_RU": "Детектор голосовой активности",
-                    "pl_PL": "Detektor aktywności głosu",
-                    "uk_UA": "Детектор голосової активності",
-                    "ja_JP": "音声活動検出器",
-                    "ko_KR": "음성 활동 감지기",
-                    "hi_IN": "आवाज गतिविधि डिटेक्टर",
-                    "bn_BD": "ভয়েস অ্যাক্টিভিটি ডিটেক্টর",
-                    "it_IT": "Rilevatore di attività vocale",
-                    "fr_FR": "Détecteur d'activité vocale",
-                    "de_DE": "Sprachaktivitätsdetektor",
-                    "pt_PT": "Detector de atividade de voz",
-                    "ar_SA": "كاشف نشاط الصوت",
-                    "vi_VN": "Bộ phát hiện hoạt động giọng nói",
-                    "fa_IR": "تشخیص‌دهنده فعالیت صوتی",
-                    "id_ID": "Detektor aktivitas suara",
-                    "ms_MY": "Pengesan aktiviti suara",
-                    "th_TH": "เครื่องตรวจจับกิจกรรมเสียง",
-                    "ur_PK": "آواز کی سرگرمی کا پتہ لگانے والا",
-                    "zh_TW": "語音活動偵測器",
-                },
-                "tooltip": {
-                    "en_US": "Which voice activity detector (VAD) to use for speech extraction (if using video / audio as a reference, default=subs_then_webrtc).\nAuditok can sometimes work better in the case of low-quality audio than WebRTC.",
-                    "es_ES": "Qué detector de actividad de voz (VAD) usar para la extracción de voz (si se usa video/audio como referencia, predeterminado=subs_then_webrtc).\nAuditok a veces puede funcionar mejor en el caso de audio de baja calidad que WebRTC.",
-                    "tr_TR": "Konuşma çıkarımı için hangi ses aktivite dedektörünü (VAD) kullanacağını belirler (video/ses referans olarak kullanılıyorsa, varsayılan=subs_then_webrtc).\nAuditok bazen düşük kaliteli ses durumunda WebRTC'den daha iyi çalışabilir.",
-                    "zh_CN": "用于语音提取的语音活动检测器（VAD）（如果使用视频/音频作为参考，默认=subs_then_webrtc）。\n在低质量音频情况下，Auditok有时比WebRTC工作得更好。",
-                    "ru_RU": "Какой детектор голосовой активности (VAD) использовать для извлечения речи (если используется видео/аудио в качестве эталона, по умолчанию=subs_then_webrtc).\nAuditok иногда может работать лучше в случае низкокачественного аудио, чем WebRTC.",
-                    "pl_PL": "Który detektor aktywności głosu (VAD) używać do ekstrakcji mowy (jeśli używasz wideo/audio jako referencji, domyślnie=subs_then_webrtc).\nAuditok czasami może działać lepiej w przypadku audio niskiej jakości niż WebRTC.",
-                    "uk_UA": "Який детектор голосової активності (VAD) використовувати для витягування мовлення (якщо використовується відео/аудіо як еталон, за замовчуванням=subs_then_webrtc).\nAuditok іноді може працювати краще у випадку низькоякісного аудіо, ніж WebRTC.",
-                    "ja_JP": "音声抽出に使用する音声活動検出器（VAD）（ビデオ/オーディオを参照として使用する場合、デフォルト=subs_then_webrtc）。\nAuditokは、低品質のオーディオの場合、WebRTCよりもうまく動作することがあります。",
-                    "ko_KR": "음성 추출에 사용할 음성 활동 감지기（VAD）（비디오/오디오를 참조로 사용하는 경우, 기본값=subs_then_webrtc）。\nAuditok은 때때로 저품질 오디오의 경우 WebRTC보다 더 잘 작동할 수 있습니다。",
-                    "hi_IN": "भाषण निष्कर्षण के लिए कौन सा आवाज गतिविधि डिटेक्टर (VAD) उपयोग करना है (यदि वीडियो/ऑडियो को संदर्भ के रूप में उपयोग कर रहे हैं, डिफ़ॉल्ट=subs_then_webrtc)।\nAuditok कभी-कभी कम गुणवत्ता वाले ऑडियो के मामले में WebRTC से बेहतर काम कर सकता है।",
-                    "bn_BD": "স্পিচ এক্সট্র্যাকশনের জন্য কোন ভয়েস অ্যাক্টিভিটি ডিটেক্টর (VAD) ব্যবহার করবেন (যদি ভিডিও/অডিও রেফারেন্স হিসেবে ব্যবহার করেন, ডিফল্ট=subs_then_webrtc)।\nAuditok কখনও কখনও কম মানের অডিওর ক্ষেত্রে WebRTC এর চেয়ে ভাল কাজ করতে পারে।",
-                    "it_IT": "Quale rilevatore di attività vocale (VAD) utilizzare per l'estrazione del parlato (se si utilizza video/audio come riferimento, predefinito=subs_then_webrtc).\nAuditok a volte può funzionare meglio nel caso di audio di bassa qualità rispetto a WebRTC.",
-                    "fr_FR": "Quel détecteur d'activité vocale (VAD) utiliser pour l'extraction de la parole (si vous utilisez vidéo/audio comme référence, par défaut=subs_then_webrtc).\nAuditok peut parfois mieux fonctionner dans le cas d'audio de faible qualité que WebRTC.",
-                    "de_DE": "Welcher Sprachaktivitätsdetektor (VAD) für die Sprachextraktion verwendet werden soll (falls Video/Audio als Referenz verwendet wird, Standard=subs_then_webrtc).\nAuditok kann manchmal bei Audio niedriger Qualität besser funktionieren als WebRTC.",
-                    "pt_PT": "Qual detector de atividade de voz (VAD) usar para extração de fala (se usar vídeo/áudio como referência, padrão=subs_then_webrtc).\nAuditok às vezes pode funcionar melhor no caso de áudio de baixa qualidade do que WebRTC.",
-                    "ar_SA": "أي كاشف نشاط صوتي (VAD) لاستخدامه لاستخراج الكلام (إذا كنت تستخدم فيديو/صوت كمرجع، افتراضي=subs_then_webrtc).\nيمكن أن يعمل Auditok أحيانًا بشكل أفضل في حالة الصوت منخفض الجودة من WebRTC.",
-                    "vi_VN": "Bộ phát hiện hoạt động giọng nói (VAD) nào để sử dụng cho việc trích xuất giọng nói (nếu sử dụng video/âm thanh làm tham chiếu, mặc định=subs_then_webrtc).\nAuditok đôi khi có thể hoạt động tốt hơn trong trường hợp âm thanh chất lượng thấp so với WebRTC.",
-                    "fa_IR": "کدام تشخیص‌دهنده فعالیت صوتی (VAD) برای استخراج گفتار استفاده شود (اگر از ویدیو/صدا به عنوان مرجع استفاده می‌کنید، پیش‌فرض=subs_then_webrtc).\nAuditok گاهی اوقات می‌تواند در مورد صدای کیفیت پایین بهتر از WebRTC عمل کند.",
-                    "id_ID": "Detektor aktivitas suara (VAD) mana yang digunakan untuk ekstraksi bicara (jika menggunakan video/audio sebagai referensi, default=subs_then_webrtc).\nAuditok terkadang dapat bekerja lebih baik dalam kasus audio berkualitas rendah daripada WebRTC.",
-                    "ms_MY": "Pengesan aktiviti suara (VAD) yang manakah untuk digunakan bagi pengekstrakan pertuturan (jika menggunakan video/audio sebagai rujukan, lalai=subs_then_webrtc).\nAuditok kadangkala boleh berfungsi lebih baik dalam kes audio berkualiti rendah berbanding WebRTC.",
-                    "th_TH": "เครื่องตรวจจับกิจกรรมเสียง (VAD) ไหนที่จะใช้สำหรับการแยกเสียงพูด (หากใช้วิดีโอ/เสียงเป็นอ้างอิง ค่าเริ่มต้น=subs_then_webrtc)\nAuditok บางครั้งอาจทำงานได้ดีกว่าในกรณีของเสียงคุณภาพต่ำกว่า WebRTC",
-                    "ur_PK": "تقریر نکالنے کے لیے کون سا آواز کی سرگرمی کا پتہ لگانے والا (VAD) استعمال کرنا ہے (اگر ویڈیو/آڈیو کو ریفرنس کے طور پر استعمال کر رہے ہیں، ڈیفالٹ=subs_then_webrtc)۔\nAuditok کبھی کبھی کم معیار کی آڈیو کے معاملے میں WebRTC سے بہتر کام کر سکتا ہے۔",
-                    "zh_TW": "用於語音提取的語音活動偵測器 (VAD)（如果使用影片/音訊作為參考，預設=subs_then_webrtc）。\n在低音質的情況下，Auditok 有時比 WebRTC 效果更好。",
-                },
-                "argument": "--vad",
-                "default": "default",
-                "values": [
-                    "default",
-                    "subs_then_webrtc",
-                    "subs_then_auditok",
-                    "subs_then_silero",
-                    "webrtc",
-                    "auditok",
-                    "silero",
-                ],
-                "value_labels": {
-                    "default": {
-                        "en_US": "Default",
-                        "es_ES": "Predeterminado",
-                        "tr_TR": "Varsayılan",
-                        "zh_CN": "默认",
-                        "ru_RU": "По умолчанию",
-                        "pl_PL": "Domyślny",
-                        "uk_UA": "За замовчуванням",
-                        "ja_JP": "デフォルト",
-                        "ko_KR": "기본값",
-                        "hi_IN": "डिफ़ॉल्ट",
-                        "bn_BD": "ডিফল্ট",
-                        "it_IT": "Predefinito",
-                        "fr_FR": "Par défaut",
-                        "de_DE": "Standard",
-                        "pt_PT": "Padrão",
-                        "ar_SA": "افتراضي",
-                        "vi_VN": "Mặc định",
-                        "fa_IR": "پیش‌فرض",
-                        "id_ID": "Default",
-                        "ms_MY": "Lalai",
-                        "th_TH": "ค่าเริ่มต้น",
-                        "ur_PK": "ڈیفالٹ",
-                        "zh_TW": "預設",
+            "github": "https://github.com/Schwponaco-org/lapse",
+            "documentation": "https://github.com/Schwponaco-org/lapse/blob/main/docs/benchmarks.md",
+            "supported_formats": [".srt", ".ass", ".ssa", ".vtt"],
+            "supports_subtitle_as_reference": True,
+            "type": "executable",
+            "executable": {
+                "Windows": get_resource_path(
+                    "autosubsyncapp.resources.lapse", "lapse.exe"
+                ),
+                "Linux": get_resource_path(
+                    "autosubsyncapp.resources.lapse", "lapse"
+                ),
+                "Darwin": get_resource_path(
+                    "autosubsyncapp.resources.lapse", "lapse"
+                ),
+            },
+            "cmd_structure": ["{reference}", "{subtitle}", "--output", "{output}", "--no-backup"],
+            "options": {
+                "check_video_for_subtitles": {
+                    "type": "checkbox",
+                    "label": {
+                        "en_US": "Use embedded subtitles in video",
+                        "es_ES": "Usar subtítulos incrustados en el vídeo",
+                        "tr_TR": "Videodaki gömülü altyazıları kullan",
+                        "zh_CN": "使用视频中的内嵌字幕",
+                        "ru_RU": "Использовать встроенные субтитры в видео",
+                        "pl_PL": "Użyj osadzonych napisów w wideo",
+                        "uk_UA": "Використовувати вбудовані субтитри у відео",
+                        "ja_JP": "ビデオ内の埋め込み字幕を使用",
+                        "ko_KR": "비디오에 내장된 자막 사용",
+                        "hi_IN": "वीडियो में एम्बेडेड उपशीर्षक का उपयोग करें",
+                        "bn_BD": "ভিডিওতে এম্বেড করা সাবটাইটেল ব্যবহার করুন",
+                        "it_IT": "Usa i sottotitoli incorporati nel video",
+                        "fr_FR": "Utiliser les sous-titres intégrés dans la vidéo",
+                        "de_DE": "Eingebettete Untertitel im Video verwenden",
+                        "pt_PT": "Usar legendas incorporadas no vídeo",
+                        "ar_SA": "استخدم الترجمات المضمنة في الفيديو",
+                        "vi_VN": "Sử dụng phụ đề nhúng trong video",
+                        "fa_IR": "استفاده از زیرنویس‌های جاسازی‌شده در ویدیو",
+                        "id_ID": "Gunakan subtitle tertanam di video",
+                        "ms_MY": "Guna sarikata terbenam dalam video",
+                        "th_TH": "ใช้คำบรรยายที่ฝังในวิดีโอ",
+                        "ur_PK": "ویڈیو میں ایمبیڈڈ سب ٹائٹلز استعمال کریں",
+                        "zh_TW": "使用影片中的內嵌字幕",
                     },
-                    "subs_then_webrtc": {
-                        "en_US": "Subs then WebRTC",
-                        "es_ES": "Subtítulos y luego WebRTC",
-                        "tr_TR": "Önce altyazılar sonra WebRTC",
-                        "zh_CN": "字幕然后WebRTC",
-                        "ru_RU": "Субтитры, затем WebRTC",
-                        "pl_PL": "Napisy, potem WebRTC",
-                        "uk_UA": "Субтитри, потім WebRTC",
-                        "ja_JP": "字幕からWebRTC",
-                        "ko_KR": "자막 후 WebRTC",
-                        "hi_IN": "उपशीर्षक फिर WebRTC",
-                        "bn_BD": "সাবটাইটেল তারপর WebRTC",
-                        "it_IT": "Sottotitoli poi WebRTC",
-                        "fr_FR": "Sous-titres puis WebRTC",
-                        "de_DE": "Untertitel dann WebRTC",
-                        "pt_PT": "Legendas e depois WebRTC",
-                        "ar_SA": "الترجمات ثم WebRTC",
-                        "vi_VN": "Phụ đề rồi WebRTC",
-                        "fa_IR": "زیرنویس‌ها سپس WebRTC",
-                        "id_ID": "Subtitle lalu WebRTC",
-                        "ms_MY": "Sarikata kemudian WebRTC",
-                        "th_TH": "คำบรรยายแล้ว WebRTC",
-                        "ur_PK": "سب ٹائٹل پھر WebRTC",
-                        "zh_TW": "字幕然後 WebRTC",
+                    "tooltip": {
+                        "en_US": 'Automatically checks for and uses text subtitles embedded in the video container (or sidecar files). When disabled, LAPSE aligns strictly against the audio track instead.',
+                        "es_ES": 'Comprueba y utiliza automáticamente subtítulos incrustados en el contenedor de vídeo (o archivos adjuntos). Si se desactiva, LAPSE se sincroniza exclusivamente con la pista de audio.',
+                        "tr_TR": 'Video içerisindeki gömülü metin altyazılarını (veya yan altyazı dosyalarını) otomatik algılayıp kullanır. Devre dışı bırakıldığında LAPSE doğrudan ses parçasıyla hizalama yapar.',
+                        "zh_CN": '自动检测并使用视频中内嵌的文本字幕（或同名字幕文件）。禁用时，LAPSE将直接对齐音频轨道。',
+                        "ru_RU": 'Автоматически находит и использует встроенные в видео текстовые субтитры (или внешние файлы). При отключении LAPSE выравнивает строго по аудиодорожке.',
+                        "pl_PL": 'Automatycznie sprawdza i używa napisów wbudowanych w plik wideo (lub plików zewnętrznych). Po wyłączeniu LAPSE synchronizuje wyłącznie ze ścieżką dźwiękową.',
+                        "uk_UA": 'Автоматично знаходить і використовує вбудовані у відео текстові субтитри (або зовнішні файли). Якщо вимкнено, LAPSE синхронізує виключно з аудіодоріжкою.',
+                        "ja_JP": '動画コンテナ内の埋め込みテキスト字幕（または付属字幕）を自動検出して使用します。無効にすると、LAPSEは音声トラックのみと直接同期します。',
+                        "ko_KR": '비디오 컨테이너에 포함된 텍스트 자막(또는 사이드카 자막)을 자동 감지하여 사용합니다. 비활성화하면 LAPSE가 오디오 트랙을 기준으로 직접 동기화합니다.',
+                        "hi_IN": 'वीडियो में एम्बेडेड टेक्स्ट उपशीर्षक (या साइडकार फ़ाइलों) को स्वचालित रूप से ढूंढता और उपयोग करता है। अक्षम होने पर, LAPSE सीधे ऑडियो ट्रैक से सिंक करता है।',
+                        "bn_BD": 'ভিডিওতে থাকা এম্বেডেড টেক্সট সাবটাইটেল (বা সাইডকার ফাইল) স্বয়ংক্রিয়ভাবে শনাক্ত করে ব্যবহার করে। নিষ্ক্রিয় থাকলে LAPSE সরাসরি অডিও ট্র্যাকের সাথে সিঙ্ক করে।',
+                        "it_IT": 'Controlla e utilizza automaticamente i sottotitoli incorporati nel video (o file esterni). Se disabilitato, LAPSE sincronizza direttamente con la traccia audio.',
+                        "fr_FR": "Détecte et utilise automatiquement les sous-titres intégrés à la vidéo (ou fichiers externes). Si désactivé, LAPSE s'aligne strictement sur la piste audio.",
+                        "de_DE": 'Erkennt und verwendet automatisch eingebettete Untertitel im Video (oder Begleitdateien). Bei Deaktivierung synchronisiert LAPSE ausschließlich mit der Tonspur.',
+                        "pt_PT": 'Deteta e utiliza automaticamente legendas incorporadas no vídeo (ou ficheiros adjacentes). Quando desativado, o LAPSE alinha exclusivamente com a faixa de áudio.',
+                        "ar_SA": 'يفحص ويستخدم تلقائيًا الترجمات النصية المضمنة في الفيديو (أو الملفات المجاورة). عند التعطيل، تتم المزامنة مباشرة مع المسار الصوتي.',
+                        "vi_VN": 'Tự động kiểm tra và sử dụng phụ đề văn bản nhúng trong video (hoặc tệp phụ đề kèm theo). Khi tắt, LAPSE sẽ đồng bộ hóa trực tiếp theo âm thanh.',
+                        "fa_IR": 'زیرنویس\u200cهای متنی موجود در ویدیو (یا فایل\u200cهای جانبی) را به طور خودکار شناسایی و استفاده می\u200cکند. در صورت غیرفعال بودن، مستقیماً با صدا همگام می\u200cشود.',
+                        "id_ID": 'Secara otomatis memeriksa dan menggunakan subtitle teks tertanam dalam video (atau file eksternal). Jika dinonaktifkan, LAPSE akan menyelaraskan langsung dengan trek audio.',
+                        "ms_MY": 'Memeriksa dan menggunakan sarikata teks terbenam dalam video (atau fail luaran) secara automatik. Jika dilumpuhkan, LAPSE menyegerak terus dengan trek audio.',
+                        "th_TH": 'ตรวจสอบและใช้คำบรรยายที่ฝังในวิดีโอ (หรือไฟล์คำบรรยายภายนอก) โดยอัตโนมัติ หากปิดใช้งาน LAPSE จะซิงค์กับแทร็กเสียงโดยตรง',
+                        "ur_PK": 'ویڈیو میں ایمبیڈڈ ٹیکسٹ سب ٹائٹلز کو خودکار طور پر تلاش اور استعمال کرتا ہے۔ غیر فعال ہونے پر، LAPSE براہ راست آڈیو ٹریک کے ساتھ سنک کرتا ہے۔',
+                        "zh_TW": '自動偵測並使用影片中內嵌的文字字幕（或同名字幕檔）。停用時，LAPSE將直接對齊音訊軌道。',
                     },
-                    "subs_then_auditok": {
-                        "en_US": "Subs then Auditok",
-                        "es_ES": "Subtítulos y luego Auditok",
-                        "tr_TR": "Önce altyazılar sonra Auditok",
-                        "zh_CN": "字幕然后Auditok",
-                        "ru_RU": "Субтитры, затем Auditok",
-                        "pl_PL": "Napisy, potem Auditok",
-                        "uk_UA": "Субтитри, потім Auditok",
-                        "ja_JP": "字幕からAuditok",
-                        "ko_KR": "자막 후 Auditok",
-                        "hi_IN": "उपशीर्षक फिर Auditok",
-                        "bn_BD": "সাবটাইটেল তারপর Auditok",
-                        "it_IT": "Sottotitoli poi Auditok",
-                        "fr_FR": "Sous-titres puis Auditok",
-                        "de_DE": "Untertitel dann Auditok",
-                        "pt_PT": "Legendas e depois Auditok",
-                        "ar_SA": "الترجمات ثم Auditok",
-                        "vi_VN": "Phụ đề rồi Auditok",
-                        "fa_IR": "زیرنویس‌ها سپس Auditok",
-                        "id_ID": "Subtitle lalu Auditok",
-                        "ms_MY": "Sarikata kemudian Auditok",
-                        "th_TH": "คำบรรยายแล้ว Auditok",
-                        "ur_PK": "سب ٹائٹل پھر Auditok",
-                        "zh_TW": "字幕然後 Auditok",
+                    "argument": "--no-embedded",
+                    "default": True,
+                },
+                "full_scan": {
+                    "type": "checkbox",
+                    "label": {
+                        "en_US": "Full video scan",
+                        "es_ES": "Escaneo completo de video",
+                        "tr_TR": "Tam video taraması",
+                        "zh_CN": "完整视频扫描",
+                        "ru_RU": "Полное сканирование видео",
+                        "pl_PL": "Pełne skanowanie wideo",
+                        "uk_UA": "Повне сканування відео",
+                        "ja_JP": "完全な動画スキャン",
+                        "ko_KR": "전체 비디오 스캔",
+                        "hi_IN": "पूर्ण वीडियो स्कैन",
+                        "bn_BD": "সম্পূর্ণ ভিডিও স্ক্যান",
+                        "it_IT": "Scansione completa del video",
+                        "fr_FR": "Analyse complète de la vidéo",
+                        "de_DE": "Vollständiger Video-Scan",
+                        "pt_PT": "Verificação completa do vídeo",
+                        "ar_SA": "مسح الفيديو بالكامل",
+                        "vi_VN": "Quét toàn bộ video",
+                        "fa_IR": "اسکن کامل ویدیو",
+                        "id_ID": "Pemindaian video penuh",
+                        "ms_MY": "Imbasan video penuh",
+                        "th_TH": "สแกนวิดีโอแบบเต็ม",
+                        "ur_PK": "مکمل ویڈیو اسکین",
+                        "zh_TW": "完整影片掃描",
                     },
-                    "subs_then_silero": {
-                        "en_US": "Subs then Silero",
-                        "es_ES": "Subtítulos y luego Silero",
-                        "tr_TR": "Önce altyazılar sonra Silero",
-                        "zh_CN": "字幕然后Silero",
-                        "ru_RU": "Субтитры, затем Silero",
-                        "pl_PL": "Napisy, potem Silero",
-                        "uk_UA": "Субтитри, потім Silero",
-                        "ja_JP": "字幕からSilero",
-                        "ko_KR": "자막 후 Silero",
-                        "hi_IN": "उपशीर्षक फिर Silero",
-                        "bn_BD": "সাবটাইটেল তারপর Silero",
-                        "it_IT": "Sottotitoli poi Silero",
-                        "fr_FR": "Sous-titres puis Silero",
-                        "de_DE": "Untertitel dann Silero",
-                        "pt_PT": "Legendas e depois Silero",
-                        "ar_SA": "الترجمات ثم Silero",
-                        "vi_VN": "Phụ đề rồi Silero",
-                        "fa_IR": "زیرنویس‌ها سپس Silero",
-                        "id_ID": "Subtitle lalu Silero",
-                        "ms_MY": "Sarikata kemudian Silero",
-                        "th_TH": "คำบรรยายแล้ว Silero",
-                        "ur_PK": "سب ٹائٹل پھر Silero",
-                        "zh_TW": "字幕然後 Silero",
+                    "tooltip": {
+                        "en_US": 'Scans the entire video file for embedded subtitle streams instead of fast-probing only the first 100MB. Useful if subtitles appear later in the container.',
+                        "es_ES": 'Escanea todo el archivo de vídeo para buscar subtítulos incrustados en lugar de examinar solo los primeros 100MB. Útil si los subtítulos aparecen más adelante.',
+                        "tr_TR": "Yalnızca ilk 100MB'ı hızlıca incelemek yerine gömülü altyazılar için tüm video dosyasını tarar. Altyazılar dosyanın ilerleyen kısımlarındaysa faydalıdır.",
+                        "zh_CN": '扫描整个视频文件以查找嵌入的字幕流，而不是仅快速探测前100MB。在字幕流出现在文件较后位置时很有用。',
+                        "ru_RU": 'Сканирует весь видеофайл на наличие встроенных субтитров вместо быстрой проверки первых 100 МБ. Полезно, если дорожка субтитров расположена дальше.',
+                        "pl_PL": 'Skanuje cały plik wideo w poszukiwaniu osadzonych napisów zamiast szybkiego sprawdzania pierwszych 100 MB. Przydatne, gdy napisy pojawiają się później.',
+                        "uk_UA": 'Сканує весь відеофайл на наявність вбудованих субтитрів замість швидкої перевірки перших 100 МБ. Корисно, якщо доріжка субтитрів розташована далі.',
+                        "ja_JP": '最初の100MBのみを高速プローブするのではなく、動画全体をスキャンして埋め込み字幕を探します。字幕がファイルの後方にある場合に便利です。',
+                        "ko_KR": '처음 100MB만 빠르게 검사하는 대신 전체 비디오를 검색하여 내장 자막을 찾습니다. 자막 스트림이 파일 뒷부분에 위치할 때 유용합니다.',
+                        "hi_IN": 'केवल पहले 100MB की त्वरित जांच करने के बजाय एम्बेडेड उपशीर्षक के लिए पूरी वीडियो फ़ाइल को स्कैन करता है। यदि उपशीर्षक फ़ाइल में बाद में दिखाई देते हैं तो उपयोगी है।',
+                        "bn_BD": 'শুধুমাত্র প্রথম 100MB দ্রুত স্ক্যান করার পরিবর্তে সম্পূর্ণ ভিডিও ফাইল স্ক্যান করে। সাবটাইটেল ফাইলের পেছনের অংশে থাকলে কার্যকর।',
+                        "it_IT": "Scansiona l'intero file video alla ricerca di sottotitoli incorporati invece di analizzare solo i primi 100MB. Utile se i sottotitoli compaiono più avanti.",
+                        "fr_FR": "Analyse l'intégralité de la vidéo au lieu de sonder rapidement les 100 premiers Mo. Utile si les sous-titres se trouvent plus loin dans le fichier.",
+                        "de_DE": 'Durchsucht die gesamte Videodatei nach Untertiteln, anstatt nur die ersten 100 MB zu prüfen. Nützlich, wenn Untertitel erst später im Container liegen.',
+                        "pt_PT": 'Analisa todo o ficheiro de vídeo à procura de legendas em vez de verificar apenas os primeiros 100MB. Útil se as legendas estiverem mais à frente no ficheiro.',
+                        "ar_SA": 'يفحص ملف الفيديو بالكامل بحثًا عن الترجمات المضمنة بدلاً من أول 100 ميجابايت فقط. مفيد إذا كانت الترجمة موجودة في موضع لاحق.',
+                        "vi_VN": 'Quét toàn bộ tệp video để tìm luồng phụ đề nhúng thay vì chỉ quét nhanh 100MB đầu. Hữu ích nếu phụ đề xuất hiện ở phần sau của tệp.',
+                        "fa_IR": 'کل فایل ویدیو را برای یافتن زیرنویس\u200cها اسکن می\u200cکند به جای اینکه فقط ۱۰۰ مگابایت اول را بررسی کند. مناسب برای فایل\u200cهایی با زیرنویس در بخش\u200cهای بعدی.',
+                        "id_ID": 'Memindai seluruh file video untuk mencari aliran subtitle daripada hanya memeriksa 100MB pertama. Berguna jika subtitle berada di bagian belakang file.',
+                        "ms_MY": 'Mengimbas seluruh fail video untuk mencari sarikata daripada menyiasat 100MB pertama sahaja. Berguna jika sarikata terletak di bahagian belakang fail.',
+                        "th_TH": 'สแกนไฟล์วิดีโอทั้งหมดเพื่อค้นหาคำบรรยายที่ฝังไว้ แทนที่จะตรวจสอบเฉพาะ 100MB แรก มีประโยชน์หากคำบรรยายอยู่ช่วงท้ายไฟล์',
+                        "ur_PK": 'صرف پہلے 100MB کی فوری جانچ کے بجائے پوری ویڈیو فائل کو اسکین کرتا ہے۔ اگر سب ٹائٹلز فائل میں بعد میں ظاہر ہوں تو مفید ہے۔',
+                        "zh_TW": '掃描整個影片檔案以尋找內嵌的字幕流，而非僅快速探測前100MB。在字幕流出現在檔案較後位置時很有用。',
                     },
-                    "webrtc": "WebRTC",
-                    "auditok": "Auditok",
-                    "silero": "Silero",
-                },
-            },
-        },
-    },
-    "lapse": {
-        "version": "2.0.1",
-        "description": {
-            "en_US": "Language-Agnostic Playback Synchronization Engine",
-            "es_ES": "Motor de sincronización de reproducción independiente del idioma",
-            "tr_TR": "Dil Bağımsız Oynatma Senkronizasyon Motoru",
-            "zh_CN": "语言无关播放同步引擎",
-            "ru_RU": "Языково-независимый движок синхронизации воспроизведения",
-            "pl_PL": "Niezależny od języka silnik synchronizacji odtwarzania",
-            "uk_UA": "Мовно-незалежний рушій синхронізації відтворення",
-            "ja_JP": "言語非依存の再生同期エンジン",
-            "ko_KR": "언어 비의존적 재생 동기화 엔진",
-            "hi_IN": "भाषा-अज्ञेयवादी प्लेबैक सिंक्रोनाइज़ेशन इंजन",
-            "bn_BD": "ভাষা-অজ্ঞেয়বাদী প্লেব্যাক সিঙ্ক্রোনাইজেশন ইঞ্জিন",
-            "it_IT": "Motore di sincronizzazione della riproduzione indipendente dalla lingua",
-            "fr_FR": "Moteur de synchronisation de lecture indépendant de la langue",
-            "de_DE": "Sprachunabhängige Wiedergabesynchronisations-Engine",
-            "pt_PT": "Motor de sincronização de reprodução independente de idioma",
-            "ar_SA": "محرك مزامنة التشغيل المستقل عن اللغة",
-            "vi_VN": "Công cụ đồng bộ phát lại không phụ thuộc vào ngôn ngữ",
-            "fa_IR": "موتور همگام‌سازی پخش مستقل از زبان",
-            "id_ID": "Mesin Sinkronisasi Pemutaran Independen Bahasa",
-            "ms_MY": "Enjin Penyelarasan Main Semula Bebas Bahasa",
-            "th_TH": "เครื่องมือซิงค์การเล่นที่ไม่ขึ้นกับภาษา",
-            "ur_PK": "زبان سے آزاد پلے بیک سنکرونائزیشن انجن",
-            "zh_TW": "語言無關播放同步引擎",
-        },
-        "github": "https://github.com/Schwponaco-org/lapse",
-        "documentation": "https://github.com/Schwponaco-org/lapse/blob/main/docs/benchmarks.md",
-        "supported_formats": [".srt", ".ass", ".ssa", ".vtt"],
-        "supports_subtitle_as_reference": True,
-        "type": "executable",
-        "executable": {
-            "Windows": get_resource_path(
-                "autosubsyncapp.resources.lapse", "lapse.exe"
-            ),
-            "Linux": get_resource_path(
-                "autosubsyncapp.resources.lapse", "lapse"
-            ),
-            "Darwin": get_resource_path(
-                "autosubsyncapp.resources.lapse", "lapse"
-            ),
-        },
-        "cmd_structure": ["{reference}", "{subtitle}", "--output", "{output}", "--no-backup"],
-        "options": {
-            "check_video_for_subtitles": {
-                "type": "checkbox",
-                "label": {
-                    "en_US": "Use embedded subtitles in video",
-                    "es_ES": "Usar subtítulos incrustados en el vídeo",
-                    "tr_TR": "Videodaki gömülü altyazıları kullan",
-                    "zh_CN": "使用视频中的内嵌字幕",
-                    "ru_RU": "Использовать встроенные субтитры в видео",
-                    "pl_PL": "Użyj osadzonych napisów w wideo",
-                    "uk_UA": "Використовувати вбудовані субтитри у відео",
-                    "ja_JP": "ビデオ内の埋め込み字幕を使用",
-                    "ko_KR": "비디오에 내장된 자막 사용",
-                    "hi_IN": "वीडियो में एम्बेडेड उपशीर्षक का उपयोग करें",
-                    "bn_BD": "ভিডিওতে এম্বেড করা সাবটাইটেল ব্যবহার করুন",
-                    "it_IT": "Usa i sottotitoli incorporati nel video",
-                    "fr_FR": "Utiliser les sous-titres intégrés dans la vidéo",
-                    "de_DE": "Eingebettete Untertitel im Video verwenden",
-                    "pt_PT": "Usar legendas incorporadas no vídeo",
-                    "ar_SA": "استخدم الترجمات المضمنة في الفيديو",
-                    "vi_VN": "Sử dụng phụ đề nhúng trong video",
-                    "fa_IR": "استفاده از زیرنویس‌های جاسازی‌شده در ویدیو",
-                    "id_ID": "Gunakan subtitle tertanam di video",
-                    "ms_MY": "Guna sarikata terbenam dalam video",
-                    "th_TH": "ใช้คำบรรยายที่ฝังในวิดีโอ",
-                    "ur_PK": "ویڈیو میں ایمبیڈڈ سب ٹائٹلز استعمال کریں",
-                    "zh_TW": "使用影片中的內嵌字幕",
+                    "argument": "--full-scan",
+                    "default": False,
                 },
-                "tooltip": {
-                    "en_US": 'Automatically checks for and uses text subtitles embedded in the video container (or sidecar files). When disabled, LAPSE aligns strictly against the audio track instead.',
-                    "es_ES": 'Comprueba y utiliza automáticamente subtítulos incrustados en el contenedor de vídeo (o archivos adjuntos). Si se desactiva, LAPSE se sincroniza exclusivamente con la pista de audio.',
-                    "tr_TR": 'Video içerisindeki gömülü metin altyazılarını (veya yan altyazı dosyalarını) otomatik algılayıp kullanır. Devre dışı bırakıldığında LAPSE doğrudan ses parçasıyla hizalama yapar.',
-                    "zh_CN": '自动检测并使用视频中内嵌的文本字幕（或同名字幕文件）。禁用时，LAPSE将直接对齐音频轨道。',
-                    "ru_RU": 'Автоматически находит и использует встроенные в видео текстовые субтитры (или внешние файлы). При отключении LAPSE выравнивает строго по аудиодорожке.',
-                    "pl_PL": 'Automatycznie sprawdza i używa napisów wbudowanych w plik wideo (lub plików zewnętrznych). Po wyłączeniu LAPSE synchronizuje wyłącznie ze ścieżką dźwiękową.',
-                    "uk_UA": 'Автоматично знаходить і використовує вбудовані у відео текстові субтитри (або зовнішні файли). Якщо вимкнено, LAPSE синхронізує виключно з аудіодоріжкою.',
-                    "ja_JP": '動画コンテナ内の埋め込みテキスト字幕（または付属字幕）を自動検出して使用します。無効にすると、LAPSEは音声トラックのみと直接同期します。',
-                    "ko_KR": '비디오 컨테이너에 포함된 텍스트 자막(또는 사이드카 자막)을 자동 감지하여 사용합니다. 비활성화하면 LAPSE가 오디오 트랙을 기준으로 직접 동기화합니다.',
-                    "hi_IN": 'वीडियो में एम्बेडेड टेक्स्ट उपशीर्षक (या साइडकार फ़ाइलों) को स्वचालित रूप से ढूंढता और उपयोग करता है। अक्षम होने पर, LAPSE सीधे ऑडियो ट्रैक से सिंक करता है।',
-                    "bn_BD": 'ভিডিওতে থাকা এম্বেডেড টেক্সট সাবটাইটেল (বা সাইডকার ফাইল) স্বয়ংক্রিয়ভাবে শনাক্ত করে ব্যবহার করে। নিষ্ক্রিয় থাকলে LAPSE সরাসরি অডিও ট্র্যাকের সাথে সিঙ্ক করে।',
-                    "it_IT": 'Controlla e utilizza automaticamente i sottotitoli incorporati nel video (o file esterni). Se disabilitato, LAPSE sincronizza direttamente con la traccia audio.',
-                    "fr_FR": "Détecte et utilise automatiquement les sous-titres intégrés à la vidéo (ou fichiers externes). Si désactivé, LAPSE s'aligne strictement sur la piste audio.",
-                    "de_DE": 'Erkennt und verwendet automatisch eingebettete Untertitel im Video (oder Begleitdateien). Bei Deaktivierung synchronisiert LAPSE ausschließlich mit der Tonspur.',
-                    "pt_PT": 'Deteta e utiliza automaticamente legendas incorporadas no vídeo (ou ficheiros adjacentes). Quando desativado, o LAPSE alinha exclusivamente com a faixa de áudio.',
-                    "ar_SA": 'يفحص ويستخدم تلقائيًا الترجمات النصية المضمنة في الفيديو (أو الملفات المجاورة). عند التعطيل، تتم المزامنة مباشرة مع المسار الصوتي.',
-                    "vi_VN": 'Tự động kiểm tra và sử dụng phụ đề văn bản nhúng trong video (hoặc tệp phụ đề kèm theo). Khi tắt, LAPSE sẽ đồng bộ hóa trực tiếp theo âm thanh.',
-                    "fa_IR": 'زیرنویس\u200cهای متنی موجود در ویدیو (یا فایل\u200cهای جانبی) را به طور خودکار شناسایی و استفاده می\u200cکند. در صورت غیرفعال بودن، مستقیماً با صدا همگام می\u200cشود.',
-                    "id_ID": 'Secara otomatis memeriksa dan menggunakan subtitle teks tertanam dalam video (atau file eksternal). Jika dinonaktifkan, LAPSE akan menyelaraskan langsung dengan trek audio.',
-                    "ms_MY": 'Memeriksa dan menggunakan sarikata teks terbenam dalam video (atau fail luaran) secara automatik. Jika dilumpuhkan, LAPSE menyegerak terus dengan trek audio.',
-                    "th_TH": 'ตรวจสอบและใช้คำบรรยายที่ฝังในวิดีโอ (หรือไฟล์คำบรรยายภายนอก) โดยอัตโนมัติ หากปิดใช้งาน LAPSE จะซิงค์กับแทร็กเสียงโดยตรง',
-                    "ur_PK": 'ویڈیو میں ایمبیڈڈ ٹیکسٹ سب ٹائٹلز کو خودکار طور پر تلاش اور استعمال کرتا ہے۔ غیر فعال ہونے پر، LAPSE براہ راست آڈیو ٹریک کے ساتھ سنک کرتا ہے۔',
-                    "zh_TW": '自動偵測並使用影片中內嵌的文字字幕（或同名字幕檔）。停用時，LAPSE將直接對齊音訊軌道。',
+                "no_cache": {
+                    "type": "checkbox",
+                    "label": {
+                        "en_US": "Disable cache",
+                        "es_ES": "Desactivar caché",
+                        "tr_TR": "Önbelleği devre dışı bırak",
+                        "zh_CN": "禁用缓存",
+                        "ru_RU": "Отключить кэш",
+                        "pl_PL": "Wyłącz pamięć podręczną",
+                        "uk_UA": "Вимкнути кеш",
+                        "ja_JP": "キャッシュを無効にする",
+                        "ko_KR": "캐시 비활성화",
+                        "hi_IN": "कैश अक्षम करें",
+                        "bn_BD": "ক্যাশে নিষ্ক্রিয় করুন",
+                        "it_IT": "Disabilita cache",
+                        "fr_FR": "Désactiver le cache",
+                        "de_DE": "Cache deaktivieren",
+                        "pt_PT": "Desativar cache",
+                        "ar_SA": "تعطيل الذاكرة المؤقتة",
+                        "vi_VN": "Tắt bộ nhớ đệm",
+                        "fa_IR": "غیرفعال کردن حافظه پنهان",
+                        "id_ID": "Nonaktifkan cache",
+                        "ms_MY": "Lumpuhkan cache",
+                        "th_TH": "ปิดการใช้งานแคช",
+                        "ur_PK": "کیشے غیر فعال کریں",
+                        "zh_TW": "停用快取",
+                    },
+                    "tooltip": {
+                        "en_US": 'Disables saving and reusing voice detection profiles (~/.cache/lapse/). When caching is enabled, re-syncing the same movie is nearly instantaneous (~0.6s).',
+                        "es_ES": 'Desactiva guardar y reutilizar perfiles de voz (~/.cache/lapse/). Con la caché activa, resincronizar la misma película es casi instantáneo (~0,6s).',
+                        "tr_TR": 'Ses algılama profillerini kaydetmeyi ve yeniden kullanmayı devre dışı bırakır (~/.cache/lapse/). Önbellek etkinken aynı filmi tekrar senkronize etmek anında biter (~0.6sn).',
+                        "zh_CN": '禁用保存和复用语音检测特征（~/.cache/lapse/）。启用缓存时，重新同步同一部电影几乎是瞬间完成的（约0.6秒）。',
+                        "ru_RU": 'Отключает сохранение и повторное использование профилей речи (~/.cache/lapse/). При включенном кэше повторная синхронизация занимает ~0.6 сек.',
+                        "pl_PL": 'Wyłącza zapisywanie i ponowne używanie profili mowy (~/.cache/lapse/). Przy włączonej pamięci podręcznej ponowna synchronizacja trwa zaledwie ~0,6 s.',
+                        "uk_UA": 'Вимикає збереження та повторне використання профілів мовлення (~/.cache/lapse/). З увімкненим кешем повторна синхронізація триває ~0,6 с.',
+                        "ja_JP": '音声プロファイルの保存と再利用（~/.cache/lapse/）を無効にします。キャッシュが有効な場合、同じ映画の再同期はほぼ一瞬（約0.6秒）です。',
+                        "ko_KR": '음성 감지 프로필의 저장 및 재사용(~/.cache/lapse/)을 비활성화합니다. 캐시가 켜져 있으면 동일한 영화의 재동기화가 거의 즉시 완료됩니다(~0.6초).',
+                        "hi_IN": 'वॉयस डिटेक्शन प्रोफाइल (~/.cache/lapse/) को सहेजना और पुन: उपयोग करना अक्षम करता है। कैश सक्षम होने पर, उसी मूवी को दोबारा सिंक करना बहुत तेज़ (~0.6s) होता है।',
+                        "bn_BD": 'ভয়েস প্রোফাইল সংরক্ষণ ও পুনঃব্যবহার (~/.cache/lapse/) নিষ্ক্রিয় করে। ক্যাশে সক্রিয় থাকলে একই মুভি পুনরায় সিঙ্ক করা প্রায় তাৎক্ষণিক (~০.৬ সেকেন্ড) হয়।',
+                        "it_IT": 'Disabilita il salvataggio e il riutilizzo dei profili vocali (~/.cache/lapse/). Con la cache attiva, la risincronizzazione dello stesso film è istantanea (~0,6s).',
+                        "fr_FR": "Désactive l'enregistrement et la réutilisation des profils vocaux (~/.cache/lapse/). Avec le cache, resynchroniser le même film est quasi instantané (~0,6s).",
+                        "de_DE": 'Deaktiviert das Speichern und Wiederverwenden von Sprachprofilen (~/.cache/lapse/). Bei aktivem Cache erfolgt eine erneute Synchronisation sofort (~0,6s).',
+                        "pt_PT": 'Desativa o armazenamento e reutilização de perfis de voz (~/.cache/lapse/). Com a cache ativa, ressincronizar o mesmo filme é quase instantâneo (~0,6s).',
+                        "ar_SA": 'يعطل حفظ وإعادة استخدام ملفات تعريف الصوت (~/.cache/lapse/). عند تفعيل الذاكرة المؤقتة، تكون إعادة المزامنة لنفس الفيلم فورية تقريبًا (~0.6 ثانية).',
+                        "vi_VN": 'Tắt tính năng lưu và sử dụng lại cấu hình giọng nói (~/.cache/lapse/). Khi bật bộ nhớ đệm, việc đồng bộ lại cùng một phim diễn ra gần như tức thì (~0,6s).',
+                        "fa_IR": 'ذخیره و استفاده مجدد از پروفایل\u200cهای گفتاری را غیرفعال می\u200cکند (~/.cache/lapse/). با فعال بودن کش، همگام\u200cسازی مجدد همان فیلم فوری است (~۰.۶ ثانیه).',
+                        "id_ID": 'Menonaktifkan penyimpanan dan penggunaan ulang profil suara (~/.cache/lapse/). Saat cache aktif, sinkronisasi ulang film yang sama hampir instan (~0,6 detik).',
+                        "ms_MY": 'Melumpuhkan penyimpanan dan penggunaan semula profil suara (~/.cache/lapse/). Apabila cache aktif, penyegerakan semula filem yang sama adalah serta-merta (~0.6s).',
+                        "th_TH": 'ปิดการบันทึกและนำโปรไฟล์เสียงกลับมาใช้ใหม่ (~/.cache/lapse/) เมื่อเปิดแคช การซิงค์ภาพยนตร์เรื่องเดิมซ้ำจะเสร็จทันที (~0.6 วินาที)',
+                        "ur_PK": 'صوتی پروفائلز کو محفوظ اور دوبارہ استعمال کرنے کو غیر فعال کرتا ہے (~/.cache/lapse/)۔ کیشے فعال ہونے پر، اسی فلم کی دوبارہ سنکنگ فوری ہوتی ہے (~0.6 سیکنڈ)۔',
+                        "zh_TW": '停用儲存和重複使用語音偵測特徵（~/.cache/lapse/）。啟用快取時，重新同步同一部電影幾乎是瞬間完成的（約0.6秒）。',
+                    },
+                    "argument": "--no-cache",
+                    "default": False,
                 },
-                "argument": "--no-embedded",
-                "default": True,
-            },
-            "full_scan": {
-                "type": "checkbox",
-                "label": {
-                    "en_US": "Full video scan",
-                    "es_ES": "Escaneo completo de video",
-                    "tr_TR": "Tam video taraması",
-                    "zh_CN": "完整视频扫描",
-                    "ru_RU": "Полное сканирование видео",
-                    "pl_PL": "Pełne skanowanie wideo",
-                    "uk_UA": "Повне сканування відео",
-                    "ja_JP": "完全な動画スキャン",
-                    "ko_KR": "전체 비디오 스캔",
-                    "hi_IN": "पूर्ण वीडियो स्कैन",
-                    "bn_BD": "সম্পূর্ণ ভিডিও স্ক্যান",
-                    "it_IT": "Scansione completa del video",
-                    "fr_FR": "Analyse complète de la vidéo",
-                    "de_DE": "Vollständiger Video-Scan",
-                    "pt_PT": "Verificação completa do vídeo",
-                    "ar_SA": "مسح الفيديو بالكامل",
-                    "vi_VN": "Quét toàn bộ video",
-                    "fa_IR": "اسکن کامل ویدیو",
-                    "id_ID": "Pemindaian video penuh",
-                    "ms_MY": "Imbasan video penuh",
-                    "th_TH": "สแกนวิดีโอแบบเต็ม",
-                    "ur_PK": "مکمل ویڈیو اسکین",
-                    "zh_TW": "完整影片掃描",
+                "split_penalty": {
+                    "type": "slider",
+                    "label": {
+                        "en_US": "Split penalty",
+                        "es_ES": "Penalización por división",
+                        "tr_TR": "Bölme cezası",
+                        "zh_CN": "分割惩罚",
+                        "ru_RU": "Штраф за разделение",
+                        "pl_PL": "Kara za podział",
+                        "uk_UA": "Штраф за розділення",
+                        "ja_JP": "分割ペナルティ",
+                        "ko_KR": "분할 패널티",
+                        "hi_IN": "विभाजन दंड",
+                        "bn_BD": "স্প্লিট পেনাল্টি",
+                        "it_IT": "Penalità di divisione",
+                        "fr_FR": "Pénalité de division",
+                        "de_DE": "Teilungsstrafe",
+                        "pt_PT": "Penalidade de divisão",
+                        "ar_SA": "عقوبة التقسيم",
+                        "vi_VN": "Phạt phân tách",
+                        "fa_IR": "جریمه تقسیم",
+                        "id_ID": "Penalti pemisahan",
+                        "ms_MY": "Penalti pemisahan",
+                        "th_TH": "บทลงโทษการแบ่ง",
+                        "ur_PK": "تقسیم کی سزا",
+                        "zh_TW": "分割懲罰",
+                    },
+                    "tooltip": {
+                        "en_US": 'Controls how easily LAPSE splits subtitles into multiple segments to fix scene changes or TV commercial cuts (default: 6).\n• Used in Auto and Split modes.\n• Higher values (10–20): More conservative, fewer splits.\n• Lower values (2–5): More aggressive, allows more splits.',
+                        "es_ES": 'Controla la facilidad con la que LAPSE divide los subtítulos en segmentos para corregir cortes de escena o pausas comerciales (predeterminado: 6).\n• Usado en modos Auto y División.\n• Valores altos (10–20): Más conservador, menos divisiones.\n• Valores bajos (2–5): Más agresivo, permite más divisiones.',
+                        "tr_TR": "LAPSE'in sahne kesintilerini veya reklam aralarını düzeltmek için altyazıyı ne kadar kolay parçalara böleceğini belirler (varsayılan: 6).\n• Otomatik ve Bölme modlarında kullanılır.\n• Yüksek değerler (10–20): Daha temkinli, daha az bölme.\n• Düşük değerler (2–5): Daha hassas, daha fazla bölmeye izin verir.",
+                        "zh_CN": '控制LAPSE将字幕分割为多个片段以修复场景剪辑或电视广告间隙的灵敏度（默认：6）。\n• 用于自动和分割模式。\n• 较高值（10–20）：更保守，产生较少分割。\n• 较低值（2–5）：更激进，允许更多分割。',
+                        "ru_RU": 'Управляет тем, насколько легко LAPSE разделяет субтитры на части для исправления склеек и рекламы (по умолчанию: 6).\n• Используется в режимах Авто и Разделение.\n• Высокие значения (10–20): Меньше разделений.\n• Низкие значения (2–5): Больше разделений.',
+                        "pl_PL": 'Określa, jak łatwo LAPSE dzieli napisy na segmenty w celu naprawy cięć scen lub reklam (domyślnie: 6).\n• Używane w trybach Auto i Podział.\n• Wyższe wartości (10–20): Bardziej ostrożny, mniej podziałów.\n• Niższe wartości (2–5): Bardziej agresywny, więcej podziałów.',
+                        "uk_UA": 'Керує тим, наскільки легко LAPSE розділяє субтитри на частини для виправлення склейок та реклами (за замовчуванням: 6).\n• Використовується в режимах Авто та Розділення.\n• Вищі значення (10–20): Менше розділень.\n• Нижчі значення (2–5): Більше розділень.',
+                        "ja_JP": 'シーン変更やCMカットを修正するためにLAPSEが字幕を複数セグメントに分割するしきい値を制御します（デフォルト：6）。\n• 自動および分割モードで使用。\n• 高い値（10〜20）：保守的、分割数が減少。\n• 低い値（2〜5）：積極的、分割数を許容。',
+                        "ko_KR": '장면 전환이나 TV 광고 구간을 맞추기 위해 자막을 여러 구간으로 분할하는 민감도를 조절합니다(기본값: 6).\n• 자동 및 분할 모드에서 사용.\n• 높은 값(10–20): 보수적, 분할 감소.\n• 낮은 값(2–5): 적극적, 더 많은 분할 허용.',
+                        "hi_IN": 'यह नियंत्रित करता है कि दृश्य परिवर्तनों या विज्ञापनों को ठीक करने के लिए LAPSE उपशीर्षक को कितने खंडों में विभाजित करता है (डिफ़ॉल्ट: 6)।\n• ऑटो और स्प्लिट मोड में उपयोग किया जाता है।\n• उच्च मान (10–20): कम विभाजन।\n• निम्न मान (2–5): अधिक विभाजन।',
+                        "bn_BD": 'দৃশ্য পরিবর্তন বা বিজ্ঞাপন কাটের জন্য LAPSE কত সহজে সাবটাইটেলকে বিভক্ত করবে তা নিয়ন্ত্রণ করে (ডিফল্ট: 6)।\n• অটো এবং স্প্লিট মোডে ব্যবহৃত হয়।\n• উচ্চ মান (10–20): কম বিভাজন।\n• নিম্ন মান (2–5): বেশি বিভাজন।',
+                        "it_IT": 'Controlla la facilità con cui LAPSE suddivide i sottotitoli in segmenti per correggere tagli o pubblicità (predefinito: 6).\n• Utilizzato in modalità Auto e Divisione.\n• Valori più alti (10–20): Più conservativo, meno divisioni.\n• Valori più bassi (2–5): Più aggressivo, più divisioni.',
+                        "fr_FR": 'Contrôle la facilité avec laquelle LAPSE segmente les sous-titres pour corriger les coupures ou publicités (par défaut : 6).\n• Utilisé en modes Auto et Division.\n• Valeurs élevées (10–20) : Plus conservateur, moins de découpes.\n• Valeurs basses (2–5) : Plus permissif, plus de découpes.',
+                        "de_DE": 'Steuert, wie leicht LAPSE Untertitel in Segmente teilt, um Schnitte oder Werbeunterbrechungen anzupassen (Standard: 6).\n• Im Auto- und Teilungsmodus verwendet.\n• Höhere Werte (10–20): Konservativer, weniger Teilungen.\n• Niedrigere Werte (2–5): Aggressiver, mehr Teilungen.',
+                        "pt_PT": 'Controla a facilidade com que o LAPSE divide as legendas em segmentos para corrigir cortes de cena ou comerciais (padrão: 6).\n• Usado nos modos Auto e Divisão.\n• Valores altos (10–20): Mais conservador, menos divisões.\n• Valores baixos (2–5): Mais agressivo, permite mais divisões.',
+                        "ar_SA": 'يتحكم في مدى سهولة تقسيم الترجمة إلى مقاطع لمعالجة الفواصل الإعلانية أو القطوع (افتراضي: 6).\n• يُستخدم في الوضعين التلقائي والتقسيم.\n• القيم الأعلى (10-20): أكثر تحفظًا، تقسيمات أقل.\n• القيم الأقل (2-5): تقسيمات أكثر.',
+                        "vi_VN": 'Kiểm soát độ nhạy khi LAPSE chia phụ đề thành nhiều đoạn để sửa các vết cắt cảnh hoặc quảng cáo (mặc định: 6).\n• Dùng trong chế độ Tự động và Phân tách.\n• Giá trị cao (10–20): Thận trọng hơn, ít đoạn cắt hơn.\n• Giá trị thấp (2–5): Cho phép nhiều đoạn cắt hơn.',
+                        "fa_IR": 'میزان حساسیت LAPSE را برای تقسیم زیرنویس به بخش\u200cهای مختلف جهت اصلاح برش\u200cها یا تبلیغات کنترل می\u200cکند (پیش\u200cفرض: 6).\n• در حالت خودکار و تقسیم استفاده می\u200cشود.\n• مقادیر بالاتر (10-20): تقسیمات کمتر.\n• مقادیر پایین\u200cتر (2-5): تقسیمات بیشتر.',
+                        "id_ID": 'Mengontrol seberapa mudah LAPSE membagi subtitle menjadi beberapa segmen untuk memperbaiki potongan adegan atau iklan (default: 6).\n• Digunakan dalam mode Auto dan Pemisahan.\n• Nilai lebih tinggi (10–20): Lebih konservatif, lebih sedikit pemisahan.\n• Nilai lebih rendah (2–5): Mengizinkan lebih banyak pemisahan.',
+                        "ms_MY": 'Mengawal kelonggaran LAPSE membahagikan sarikata kepada beberapa segmen untuk membetulkan potongan adegan atau iklan (lalai: 6).\n• Digunakan dalam mod Auto dan Pemisahan.\n• Nilai lebih tinggi (10–20): Kurang pemisahan.\n• Nilai lebih rendah (2–5): Membenarkan lebih banyak pemisahan.',
+                        "th_TH": 'ควบคุมความง่ายในการตัดแบ่งคำบรรยายเพื่อแก้ไขการตัดต่อฉากหรือโฆษณา (ค่าเริ่มต้น: 6)\n• ใช้ในโหมดอัตโนมัติและการแบ่ง\n• ค่าสูง (10–20): แบ่งน้อยลง ปลอดภัยขึ้น\n• ค่าต่ำ (2–5): ยอมให้แบ่งได้มากขึ้น',
+                        "ur_PK": 'منظر کی تبدیلیوں یا اشتہارات کو درست کرنے کے لیے LAPSE سب ٹائٹلز کو کتنی آسانی سے تقسیم کرتا ہے اسے کنٹرول کرتا ہے (ڈیفالٹ: 6)۔\n• آٹو اور اسپلٹ موڈز میں استعمال ہوتا ہے۔\n• اعلی اقدار (10–20): کم تقسیم۔\n• کم اقدار (2–5): زیادہ تقسیم۔',
+                        "zh_TW": '控制LAPSE將字幕分割為多個片段以修復場景剪輯或電視廣告間隙的靈敏度（預設：6）。\n• 用於自動和分割模式。\n• 較高值（10–20）：更保守，產生較少分割。\n• 較低值（2–5）：更積極，允許更多分割。',
+                    },
+                    "range": [1, 50],
+                    "default": 6,
                 },
-                "tooltip": {
-                    "en_US": 'Scans the entire video file for embedded subtitle streams instead of fast-probing only the first 100MB. Useful if subtitles appear later in the container.',
-                    "es_ES": 'Escanea todo el archivo de vídeo para buscar subtítulos incrustados en lugar de examinar solo los primeros 100MB. Útil si los subtítulos aparecen más adelante.',
-                    "tr_TR": "Yalnızca ilk 100MB'ı hızlıca incelemek yerine gömülü altyazılar için tüm video dosyasını tarar. Altyazılar dosyanın ilerleyen kısımlarındaysa faydalıdır.",
-                    "zh_CN": '扫描整个视频文件以查找嵌入的字幕流，而不是仅快速探测前100MB。在字幕流出现在文件较后位置时很有用。',
-                    "ru_RU": 'Сканирует весь видеофайл на наличие встроенных субтитров вместо быстрой проверки первых 100 МБ. Полезно, если дорожка субтитров расположена дальше.',
-                    "pl_PL": 'Skanuje cały plik wideo w poszukiwaniu osadzonych napisów zamiast szybkiego sprawdzania pierwszych 100 MB. Przydatne, gdy napisy pojawiają się później.',
-                    "uk_UA": 'Сканує весь відеофайл на наявність вбудованих субтитрів замість швидкої перевірки перших 100 МБ. Корисно, якщо доріжка субтитрів розташована далі.',
-                    "ja_JP": '最初の100MBのみを高速プローブするのではなく、動画全体をスキャンして埋め込み字幕を探します。字幕がファイルの後方にある場合に便利です。',
-                    "ko_KR": '처음 100MB만 빠르게 검사하는 대신 전체 비디오를 검색하여 내장 자막을 찾습니다. 자막 스트림이 파일 뒷부분에 위치할 때 유용합니다.',
-                    "hi_IN": 'केवल पहले 100MB की त्वरित जांच करने के बजाय एम्बेडेड उपशीर्षक के लिए पूरी वीडियो फ़ाइल को स्कैन करता है। यदि उपशीर्षक फ़ाइल में बाद में दिखाई देते हैं तो उपयोगी है।',
-                    "bn_BD": 'শুধুমাত্র প্রথম 100MB দ্রুত স্ক্যান করার পরিবর্তে সম্পূর্ণ ভিডিও ফাইল স্ক্যান করে। সাবটাইটেল ফাইলের পেছনের অংশে থাকলে কার্যকর।',
-                    "it_IT": "Scansiona l'intero file video alla ricerca di sottotitoli incorporati invece di analizzare solo i primi 100MB. Utile se i sottotitoli compaiono più avanti.",
-                    "fr_FR": "Analyse l'intégralité de la vidéo au lieu de sonder rapidement les 100 premiers Mo. Utile si les sous-titres se trouvent plus loin dans le fichier.",
-                    "de_DE": 'Durchsucht die gesamte Videodatei nach Untertiteln, anstatt nur die ersten 100 MB zu prüfen. Nützlich, wenn Untertitel erst später im Container liegen.',
-                    "pt_PT": 'Analisa todo o ficheiro de vídeo à procura de legendas em vez de verificar apenas os primeiros 100MB. Útil se as legendas estiverem mais à frente no ficheiro.',
-                    "ar_SA": 'يفحص ملف الفيديو بالكامل بحثًا عن الترجمات المضمنة بدلاً من أول 100 ميجابايت فقط. مفيد إذا كانت الترجمة موجودة في موضع لاحق.',
-                    "vi_VN": 'Quét toàn bộ tệp video để tìm luồng phụ đề nhúng thay vì chỉ quét nhanh 100MB đầu. Hữu ích nếu phụ đề xuất hiện ở phần sau của tệp.',
-                    "fa_IR": 'کل فایل ویدیو را برای یافتن زیرنویس\u200cها اسکن می\u200cکند به جای اینکه فقط ۱۰۰ مگابایت اول را بررسی کند. مناسب برای فایل\u200cهایی با زیرنویس در بخش\u200cهای بعدی.',
-                    "id_ID": 'Memindai seluruh file video untuk mencari aliran subtitle daripada hanya memeriksa 100MB pertama. Berguna jika subtitle berada di bagian belakang file.',
-                    "ms_MY": 'Mengimbas seluruh fail video untuk mencari sarikata daripada menyiasat 100MB pertama sahaja. Berguna jika sarikata terletak di bahagian belakang fail.',
-                    "th_TH": 'สแกนไฟล์วิดีโอทั้งหมดเพื่อค้นหาคำบรรยายที่ฝังไว้ แทนที่จะตรวจสอบเฉพาะ 100MB แรก มีประโยชน์หากคำบรรยายอยู่ช่วงท้ายไฟล์',
-                    "ur_PK": 'صرف پہلے 100MB کی فوری جانچ کے بجائے پوری ویڈیو فائل کو اسکین کرتا ہے۔ اگر سب ٹائٹلز فائل میں بعد میں ظاہر ہوں تو مفید ہے۔',
-                    "zh_TW": '掃描整個影片檔案以尋找內嵌的字幕流，而非僅快速探測前100MB。在字幕流出現在檔案較後位置時很有用。',
+                "mode": {
+                    "type": "dropdown",
+                    "label": {
+                        "en_US": "Sync mode",
+                        "es_ES": "Modo de sincronización",
+                        "tr_TR": "Senkronizasyon modu",
+                        "zh_CN": "同步模式",
+                        "ru_RU": "Режим синхронизации",
+                        "pl_PL": "Tryb synchronizacji",
+                        "uk_UA": "Режим синхронізації",
+                        "ja_JP": "同期モード",
+                        "ko_KR": "동기화 모드",
+                        "hi_IN": "सिंक मोड",
+                        "bn_BD": "সিঙ্ক মোড",
+                        "it_IT": "Modalità di sincronizzazione",
+                        "fr_FR": "Mode de synchronisation",
+                        "de_DE": "Synchronisationsmodus",
+                        "pt_PT": "Modo de sincronização",
+                        "ar_SA": "وضع المزامنة",
+                        "vi_VN": "Chế độ đồng bộ",
+                        "fa_IR": "حالت همگام‌سازی",
+                        "id_ID": "Mode sinkronisasi",
+                        "ms_MY": "Mod penyelarasan",
+                        "th_TH": "โหมดการซิงค์",
+                        "ur_PK": "سنک موڈ",
+                        "zh_TW": "同步模式",
+                    },
+                    "tooltip": {
+                        "en_US": 'Synchronization algorithm:\n• Auto (Recommended): Automatically analyzes the video to determine if subtitles need a simple shift, framerate correction, or segment splits.\n• Split Mode: Splits subtitles into multiple segments to handle TV commercials, recuts, and scene cuts. (Uses the Split penalty setting above).\n• No Split: Applies a single constant time offset shift for the entire file. Fastest and safest for uncut theatrical releases. (Disables split penalty).\n• OLS: Corrects progressive framerate drift across the video (e.g., 23.976 fps to 25 fps PAL conversions) using linear regression. (Disables split penalty).',
+                        "es_ES": 'Algoritmo de sincronización:\n• Automático (Recomendado): Analiza automáticamente el vídeo para determinar si los subtítulos necesitan un desplazamiento simple, corrección de fps o división por segmentos.\n• Modo división: Divide los subtítulos en múltiples segmentos para pausas publicitarias, cortes de emisión y escenas añadidas. (Utiliza la penalización por división).\n• Sin división: Aplica un único desplazamiento temporal constante a todo el archivo. El más rápido y seguro para versiones de cine sin cortes. (Desactiva la penalización).\n• OLS: Corrige la desviación progresiva de fotogramas a lo largo del vídeo (p. ej. conversión de 23.976 fps a 25 fps PAL) mediante regresión lineal. (Desactiva la penalización).',
+                        "tr_TR": "Senkronizasyon algoritması:\n• Otomatik (Önerilen): Altyazının basit bir kaydırmaya, kare hızı düzeltmesine mi yoksa parça bölmelerine mi ihtiyacı olduğunu videoyu analiz ederek otomatik belirler.\n• Bölme Modu: Reklam aralarını, yeniden kurgulanmış sahneleri ve kesintileri düzeltmek için altyazıyı parçalara böler. (Yukarıdaki Bölme cezası ayarını kullanır).\n• Bölme Yok: Dosyanın tamamına tek ve sabit bir zaman kaydırması uygular. Kesintisiz sinema sürümleri için en hızlı ve güvenli moddur. (Bölme cezasını devre dışı bırakır).\n• OLS: Doğrusal regresyon kullanarak video boyunca oluşan kademeli kare hızı sapmasını düzeltir (örn. 23.976 fps'den 25 fps PAL dönüşümleri). (Bölme cezasını devre dışı bırakır).",
+                        "zh_CN": '同步算法：\n• 自动（推荐）：自动分析视频以确定字幕需要简单的平移、帧率校正还是分段切割。\n• 分割模式：将字幕分割为多个片段以处理电视广告插播、重新剪辑和删减场景。（使用上方的分割惩罚设置）。\n• 不分割：对整个文件应用单次恒定时间偏移。对于未删减的完整片源最快且最安全。（禁用分割惩罚）。\n• OLS：通过线性回归修复整部视频中渐进式的帧率漂移（例如 23.976 fps 转 25 fps PAL）。（禁用分割惩罚）。',
+                        "ru_RU": 'Алгоритм синхронизации:\n• Авто (Рекомендуется): Автоматически анализирует видео, определяя, требуется ли простой сдвиг, коррекция частоты кадров или разделение на части.\n• Режим разделения: Разделяет субтитры на фрагменты для исправления рекламных пауз, перемонтажа и вырезанных сцен. (Использует настройку штрафа за разделение).\n• Без разделения: Применяет единый постоянный временной сдвиг ко всему файлу. Самый быстрый и надежный для полных версий без склеек. (Отключает штраф).\n• OLS: Исправляет постепенный дрейф частоты кадров по всему видео (например, преобразование 23.976 fps в 25 fps PAL) с помощью линейной регрессии. (Отключает штраф).',
+                        "pl_PL": 'Algorytm synchronizacji:\n• Automatyczny (Zalecany): Automatycznie analizuje wideo, aby ustalić, czy napisy wymagają prostego przesunięcia, korekty klatek czy podziału na segmenty.\n• Tryb podziału: Dzieli napisy na wiele segmentów, aby obsłużyć przerwy reklamowe, wersje przemontowane i cięcia scen. (Używa kary za podział).\n• Bez podziału: Stosuje jedno stałe przesunięcie czasowe dla całego pliku. Najszybszy i najbezpieczniejszy dla wydań kinowych bez cięć. (Wyłącza karę za podział).\n• OLS: Koryguje stopniowy dryf klatek na sekundę w całym wideo (np. konwersje 23.976 fps na 25 fps PAL) za pomocą regresji liniowej. (Wyłącza karę za podział).',
+                        "uk_UA": 'Алгоритм синхронізації:\n• Авто (Рекомендовано): Автоматично аналізує відео, визначаючи, чи потрібен простий зсув, корекція частоти кадрів або поділ на частини.\n• Режим розділення: Розділяє субтитри на кілька фрагментів для обробки реклами, перемонтажу та вирізаних сцен. (Використовує налаштування штрафу за розділення).\n• Без розділення: Застосовує один постійний часовий зсув до всього файлу. Найшвидший і найбезпечніший для повних версій без вирізок. (Вимикає штраф).\n• OLS: Виправляє поступовий дрейф частоти кадрів у всьому відео (наприклад, перетворення 23.976 fps на 25 fps PAL) за допомогою лінійної регресії. (Вимикає штраф).',
+                        "ja_JP": '同期アルゴリズム：\n• 自動（推奨）：字幕に単純なシフト、フレームレート補正、またはセグメント分割が必要かを動画から自動解析して判定します。\n• 分割モード：CMカット、再編集版、シーンカットに対応するために字幕を複数セグメントに分割します。（上記の分割ペナルティ設定を使用）。\n• 分割なし：ファイル全体に単一の一定時間オフセットを適用します。ノーカットの劇場版などに最速かつ安全です。（分割ペナルティを無効化）。\n• OLS：線形回帰を使用して、動画全体の段階的なフレームレートのズレを修正します（例：23.976 fpsから25 fps PALへの変換）。（分割ペナルティを無効化）。',
+                        "ko_KR": '동기화 알고리즘:\n• 자동 (권장): 비디오를 자동 분석하여 단순 이동, 프레임레이트 보정, 또는 구간 분할 중 필요한 방식을 결정합니다.\n• 분할 모드: TV 광고, 재편집 컷, 장면 삭제에 맞춰 자막을 여러 구간으로 분할 동기화합니다. (위의 분할 패널티 설정 사용).\n• 분할 없음: 파일 전체에 단일 고정 시간 이동만 적용합니다. 무삭제 정본 파일에 가장 빠르고 안전합니다. (분할 패널티 비활성화).\n• OLS: 선형 회귀를 사용하여 비디오 전체의 점진적 프레임레이트 드리프트를 보정합니다 (예: 23.976 fps -> 25 fps PAL 변환). (분할 패널티 비활성화).',
+                        "hi_IN": 'सिंक्रनाइज़ेशन एल्गोरिथ्म:\n• ऑटो (अनुशंसित): स्वचालित रूप से वीडियो का विश्लेषण करता है कि क्या उपशीर्षक को सरल शिफ्ट, फ्रेमरेट सुधार या खंड विभाजन की आवश्यकता है।\n• विभाजन मोड: विज्ञापनों, रीकट और दृश्य कट्स को संभालने के लिए उपशीर्षक को कई खंडों में विभाजित करता है। (ऊपर दिए गए विभाजन दंड का उपयोग करता है)।\n• कोई विभाजन नहीं: पूरी फ़ाइल के लिए एकल निरंतर समय ऑफसेट शिफ्ट लागू करता है। अनकट संस्करणों के लिए सबसे तेज़ और सुरक्षित। (विभाजन दंड अक्षम करता है)।\n• OLS: रैखिक प्रतिगमन का उपयोग करके पूरे वीडियो में क्रमिक फ्रेमरेट अंतर को ठीक करता है (उदा. 23.976 fps से 25 fps PAL)। (विभाजन दंड अक्षम करता है)।',
+                        "bn_BD": 'সিঙ্ক্রোনাইজেশন অ্যালগরিদম:\n• অটো (প্রস্তাবিত): ভিডিও বিশ্লেষণ করে স্বয়ংক্রিয়ভাবে নির্ধারণ করে যে সাবটাইটেলের সহজ শিফট, ফ্রেমরেট সংশোধন নাকি খণ্ড বিভাজন প্রয়োজন।\n• বিভাজন মোড: বিজ্ঞাপন বিরতি, পুনঃসম্পাদনা এবং দৃশ্য কাটের জন্য সাবটাইটেলকে একাধিক খণ্ডে বিভক্ত করে। (উপরের বিভাজন দণ্ড ব্যবহার করে)।\n• বিভাজন নেই: সম্পূর্ণ ফাইলের জন্য একটি একক স্থির সময় অফসেট শিফট প্রয়োগ করে। সম্পূর্ণ কাটারহিত ফিল্মের জন্য সবচেয়ে দ্রুত ও নিরাপদ। (বিভাজন দণ্ড নিষ্ক্রিয় করে)।\n• OLS: লিনিয়ার রিগ্রেশন ব্যবহার করে ভিডিও জুড়ে ক্রমান্বয়ে ফ্রেমরেট ড্রিফট সংশোধন করে (যেমন ২৩.৯৭৬ fps থেকে ২৫ fps PAL)। (বিভাজন দণ্ড নিষ্ক্রিয় করে)।',
+                        "it_IT": "Algoritmo di sincronizzazione:\n• Automatico (Consigliato): Analizza automaticamente il video per determinare se i sottotitoli richiedono un semplice scostamento, correzione del framerate o suddivisione in segmenti.\n• Modalità divisione: Suddivide i sottotitoli in più segmenti per gestire interruzioni pubblicitarie, versioni rimontate e tagli di scena. (Utilizza la penalità di divisione).\n• Senza divisione: Applica un unico scostamento temporale costante all'intero file. Il più rapido e sicuro per versioni integrali senza tagli. (Disabilita la penalità).\n• OLS: Corregge la deriva progressiva del framerate lungo tutto il video (es. conversioni da 23.976 fps a 25 fps PAL) tramite regressione lineare. (Disabilita la penalità).",
+                        "fr_FR": 'Algorithme de synchronisation :\n• Automatique (Recommandé) : Analyse automatiquement la vidéo pour déterminer si les sous-titres nécessitent un décalage simple, une correction de fréquence ou des découpes.\n• Mode division : Segmente les sous-titres en plusieurs parties pour gérer les coupures publicitaires, remontages et scènes coupées. (Utilise la pénalité de division).\n• Sans division : Applique un décalage temporel unique et constant à tout le fichier. Le plus rapide et sûr pour les versions intégrales. (Désactive la pénalité).\n• OLS : Corrige la dérive progressive de cadence sur toute la vidéo (ex. conversion 23.976 fps en 25 fps PAL) par régression linéaire. (Désactive la pénalité).',
+                        "de_DE": 'Synchronisations-Algorithmus:\n• Automatisch (Empfohlen): Analysiert das Video automatisch, um festzustellen, ob eine einfache Verschiebung, Bildratenanpassung oder Segmentteilung erforderlich ist.\n• Teilungsmodus: Teilt Untertitel in mehrere Segmente, um Werbepausen, Neuschnitte und Schnittfassungen anzupassen. (Nutzt die obige Teilungsstrafe).\n• Keine Teilung: Wendet eine einzelne konstante Zeitverschiebung auf die gesamte Datei an. Am schnellsten und sichersten für ungeschnittene Kinofassungen. (Deaktiviert die Teilungsstrafe).\n• OLS: Korrigiert allmähliche Bildraten-Abweichungen über das gesamte Video (z. B. 23.976 fps zu 25 fps PAL) mittels linearer Regression. (Deaktiviert die Teilungsstrafe).',
+                        "pt_PT": 'Algoritmo de sincronização:\n• Automático (Recomendado): Analisa automaticamente o vídeo para determinar se as legendas precisam de um deslocamento simples, correção de taxa de quadros ou divisão em segmentos.\n• Modo divisão: Divide as legendas em múltiplos segmentos para lidar com intervalos comerciais, reedições e cortes de cena. (Utiliza a penalidade de divisão).\n• Sem divisão: Aplica um único deslocamento temporal constante a todo o ficheiro. O mais rápido e seguro para lançamentos de cinema sem cortes. (Desativa a penalidade).\n• OLS: Corrige a deriva progressiva da taxa de quadros ao longo do vídeo (ex.: conversão de 23.976 fps para 25 fps PAL) através de regressão linear. (Desativa a penalidade).',
+                        "ar_SA": 'خوارزمية المزامنة:\n• تلقائي (موصى به): يحلل الفيديو تلقائيًا لتحديد ما إذا كانت الترجمة تحتاج إلى إزاحة بسيطة، أو تصحيح معدل الإطارات، أو تقسيم إلى أجزاء.\n• وضع التقسيم: يقسم الترجمة إلى مقاطع متعددة للتعامل مع الفواصل الإعلانية، والنسخ المعاد مونتاجها، ومشاهد القطع. (يستخدم عقوبة التقسيم أعلاه).\n• بدون تقسيم: يطبق إزاحة زمنية ثابتة واحدة للملف بأكمله. الأسرع والأكثر أمانًا للنسخ السينمائية الكاملة دون قطع. (يعطل عقوبة التقسيم).\n• OLS: يصحح انحراف معدل الإطارات التدريجي عبر الفيديو (مثل تحويل 23.976 إلى 25 إطار/ثانية PAL) باستخدام الانحدار الخطي. (يعطل عقوبة التقسيم).',
+                        "vi_VN": 'Thuật toán đồng bộ hóa:\n• Tự động (Khuyên dùng): Tự động phân tích video để xác định phụ đề cần dịch chuyển đơn giản, sửa tốc độ khung hình hay phân đoạn cắt.\n• Chế độ phân tách: Chia phụ đề thành nhiều đoạn để xử lý quảng cáo truyền hình, bản dựng lại và các đoạn cắt cảnh. (Sử dụng mức phạt phân tách ở trên).\n• Không phân tách: Áp dụng một độ lệch thời gian cố định duy nhất cho toàn bộ tệp. Nhanh nhất và an toàn nhất cho các bản phát hành đầy đủ. (Tắt mức phạt phân tách).\n• OLS: Sửa lỗi trôi tốc độ khung hình dần dần trong toàn bộ video (ví dụ: chuyển đổi từ 23.976 fps sang 25 fps PAL) bằng hồi quy tuyến tính. (Tắt mức phạt phân tách).',
+                        "fa_IR": 'الگوریتم همگام\u200cسازی:\n• خودکار (پیشنهادی): ویدیو را خودکار تحلیل می\u200cکند تا مشخص شود زیرنویس به جابجایی ساده، اصلاح نرخ فریم یا تقسیم بخش\u200cها نیاز دارد.\n• حالت تقسیم: زیرنویس را به بخش\u200cهای متعدد تقسیم می\u200cکند تا تبلیغات تلویزیونی، نسخه\u200cهای بازتدوین\u200cشده و برش\u200cها اصلاح شوند. (از جریمه تقسیم بالا استفاده می\u200cکند).\n• بدون تقسیم: یک جابجایی زمانی ثابت را روی کل فایل اعمال می\u200cکند. سریع\u200cترین و مطمئن\u200cترین حالت برای نسخه\u200cهای سینمایی بدون برش. (جریمه تقسیم را غیرفعال می\u200cکند).\n• OLS: انحراف تدریجی نرخ فریم را در طول ویدیو (مانند تبدیل ۲۳.۹۷۶ به ۲۵ فریم PAL) با رگرسیون خطی اصلاح می\u200cکند. (جریمه تقسیم را غیرفعال می\u200cکند).',
+                        "id_ID": 'Algoritma sinkronisasi:\n• Otomatis (Disarankan): Menganalisis video secara otomatis untuk menentukan apakah subtitle memerlukan pergeseran sederhana, koreksi framerate, atau pemisahan segmen.\n• Mode Pemisahan: Membagi subtitle menjadi beberapa segmen untuk menangani jeda iklan, pemotongan ulang, dan adegan yang dipotong. (Menggunakan penalti pemisahan di atas).\n• Tanpa Pemisahan: Menerapkan satu pergeseran offset waktu konstan untuk seluruh file. Tercepat dan teraman untuk rilis utuh tanpa potongan. (Menonaktifkan penalti pemisahan).\n• OLS: Mengoreksi penyimpangan framerate bertahap di seluruh video (misalnya konversi 23.976 fps ke 25 fps PAL) menggunakan regresi linier. (Menonaktifkan penalti pemisahan).',
+                        "ms_MY": 'Algoritma penyegerakan:\n• Automatik (Disyorkan): Menganalisis video secara automatik untuk menentukan sama ada sarikata memerlukan anjakan mudah, pembetulan kadar bingkai atau pemisahan segmen.\n• Mod Pemisahan: Membahagikan sarikata kepada beberapa segmen untuk mengendalikan iklan televisyen, suntingan semula dan potongan babak. (Menggunakan penalti pemisahan di atas).\n• Tiada Pemisahan: Menggunakan satu anjakan ofset masa malar untuk keseluruhan fail. Paling pantas dan selamat untuk keluaran tanpa potongan. (Melumpuhkan penalti pemisahan).\n• OLS: Membetulkan hanyutan kadar bingkai beransur-ansur sepanjang video (cth. penukaran 23.976 fps kepada 25 fps PAL) menggunakan regresi linear. (Melumpuhkan penalti pemisahan).',
+                        "th_TH": 'อัลกอริทึมการซิงค์:\n• อัตโนมัติ (แนะนำ): วิเคราะห์วิดีโอโดยอัตโนมัติเพื่อตรวจสอบว่าคำบรรยายต้องการการเลื่อนอย่างง่าย, การแก้ไขอัตราเฟรม หรือการตัดแบ่งเป็นส่วนๆ\n• โหมดการแบ่ง: ตัดแบ่งคำบรรยายเป็นหลายส่วนเพื่อรองรับช่วงโฆษณา, เวอร์ชันตัดต่อใหม่ และฉากที่ถูกตัด (ใช้การตั้งค่าบทลงโทษการแบ่งด้านบน)\n• ไม่แบ่ง: เลื่อนเวลาชดเชยแบบคงที่เพียงค่าเดียวตลอดทั้งไฟล์ รวดเร็วและปลอดภัยที่สุดสำหรับภาพยนตร์ฉบับเต็มไม่ตัดต่อ (ปิดการใช้งานบทลงโทษการแบ่ง)\n• OLS: แก้ไขการคลาดเคลื่อนของอัตราเฟรมอย่างค่อยเป็นค่อยไปตลอดทั้งวิดีโอ (เช่น การแปลงจาก 23.976 fps เป็น 25 fps PAL) โดยใช้การถดถอยเชิงเส้น (ปิดการใช้งานบทลงโทษการแบ่ง)',
+                        "ur_PK": 'سنکرونائزیشن کا طریقہ کار:\n• خودکار (تجویز کردہ): ویڈیو کا خودکار تجزیہ کرتا ہے تاکہ معلوم کیا جا سکے کہ آیا سب ٹائٹلز کو سادہ شفٹ، فریم ریٹ کی درستگی یا حصوں میں تقسیم کی ضرورت ہے۔\n• تقسیم کا موڈ: ٹی وی اشتہارات، دوبارہ تدوین شدہ ورژنز اور کٹس کو سنبھالنے کے لیے سب ٹائٹلز کو متعدد حصوں میں تقسیم کرتا ہے۔ (اوپر دی گئی تقسیم کی سزا استعمال کرتا ہے)۔\n• بغیر تقسیم: پوری فائل کے لیے ایک مستقل ٹائم آفسیٹ شفٹ لاگو کرتا ہے۔ بغیر کٹوتی والی مکمل ریلیزز کے لیے تیز ترین اور محفوظ ترین۔ (تقسیم کی سزا کو غیر فعال کرتا ہے)۔\n• OLS: لکیری ریگریشن کا استعمال کرتے ہوئے پوری ویڈیو میں بتدریج فریم ریٹ کے ڈرفٹ کو درست کرتا ہے (جیسے 23.976 fps سے 25 fps PAL کنورژن)۔ (تقسیم کی سزا کو غیر فعال کرتا ہے)۔',
+                        "zh_TW": '同步演算法：\n• 自動（推薦）：自動分析影片以確定字幕需要簡單的平移、幀率校正還是分段切割。\n• 分割模式：將字幕分割為多個片段以處理電視廣告插播、重新剪輯和刪減場景。（使用上方的分割懲罰設定）。\n• 不分割：對整個檔案套用單次恆定時間偏移。對於未刪減的完整片源最快且最安全。（停用分割懲罰）。\n• OLS：透過線性迴歸修復整部影片中漸進式的幀率漂移（例如 23.976 fps 轉 25 fps PAL）。（停用分割懲罰）。',
+                    },
+                    "default": "auto",
+                    "values": ["auto", "split", "nosplit", "ols"],
+                    "value_labels": {
+                        "auto": {
+                            "en_US": "Auto (Shift, Drift or Split)",
+                            "es_ES": "Automático (Desplazamiento, Deriva o División)",
+                            "tr_TR": "Otomatik (Kaydırma, Sapma veya Bölme)",
+                            "zh_CN": "自动（偏移、漂移或分割）",
+                            "ru_RU": "Авто (Сдвиг, Дрейф или Разделение)",
+                            "pl_PL": "Automatyczny (Przesunięcie, Dryf lub Podział)",
+                            "uk_UA": "Авто (Зсув, Дрейф або Розділення)",
+                            "ja_JP": "自動（シフト、ドリフト、または分割）",
+                            "ko_KR": "자동 (이동, 드리프트 또는 분할)",
+                            "hi_IN": "स्वचालित (शिफ्ट, ड्रिफ्ट या विभाजन)",
+                            "bn_BD": "স্বয়ংক্রিয় (শিফট, ড্রিফট বা বিভাজন)",
+                            "it_IT": "Automatico (Spostamento, Deriva o Divisione)",
+                            "fr_FR": "Automatique (Décalage, Dérive ou Division)",
+                            "de_DE": "Automatisch (Verschiebung, Drift oder Teilung)",
+                            "pt_PT": "Automático (Deslocamento, Deriva ou Divisão)",
+                            "ar_SA": "تلقائي (إزاحة، انحراف أو تقسيم)",
+                            "vi_VN": "Tự động (Dịch chuyển, Trôi dạt hoặc Phân tách)",
+                            "fa_IR": "خودکار (جابجایی، انحراف یا تقسیم)",
+                            "id_ID": "Otomatis (Pergeseran, Penyimpangan atau Pemisahan)",
+                            "ms_MY": "Automatik (Anjakan, Hanyutan atau Pemisahan)",
+                            "th_TH": "อัตโนมัติ (เลื่อน, คลาดเคลื่อน หรือแบ่ง)",
+                            "ur_PK": "خودکار (شفٹ، ڈرفٹ یا تقسیم)",
+                            "zh_TW": "自動（偏移、漂移或分割）",
+                        },
+                        "split": {
+                            "en_US": "Split Mode",
+                            "es_ES": "Modo de división",
+                            "tr_TR": "Bölme Modu",
+                            "zh_CN": "分割模式",
+                            "ru_RU": "Режим разделения",
+                            "pl_PL": "Tryb podziału",
+                            "uk_UA": "Режим розділення",
+                            "ja_JP": "分割モード",
+                            "ko_KR": "분할 모드",
+                            "hi_IN": "विभाजन मोड",
+                            "bn_BD": "বিভাজন মোড",
+                            "it_IT": "Modalità divisione",
+                            "fr_FR": "Mode division",
+                            "de_DE": "Teilungsmodus",
+                            "pt_PT": "Modo de divisão",
+                            "ar_SA": "وضع التقسيم",
+                            "vi_VN": "Chế độ phân tách",
+                            "fa_IR": "حالت تقسیم",
+                            "id_ID": "Mode Pemisahan",
+                            "ms_MY": "Mod Pemisahan",
+                            "th_TH": "โหมดการแบ่ง",
+                            "ur_PK": "تقسیم کا موڈ",
+                            "zh_TW": "分割模式",
+                        },
+                        "nosplit": {
+                            "en_US": "No Split (Single Shift)",
+                            "es_ES": "Sin división (Desplazamiento único)",
+                            "tr_TR": "Bölme Yok (Tek Kaydırma)",
+                            "zh_CN": "不分割（单次偏移）",
+                            "ru_RU": "Без разделения (Одиночный сдвиг)",
+                            "pl_PL": "Bez podziału (Pojedyncze przesunięcie)",
+                            "uk_UA": "Без розділення (Одинарний зсув)",
+                            "ja_JP": "分割なし（単一シフト）",
+                            "ko_KR": "분할 없음 (단일 이동)",
+                            "hi_IN": "कोई विभाजन नहीं (एकल शिफ्ट)",
+                            "bn_BD": "বিভাজন নেই (একক শিফট)",
+                            "it_IT": "Nessuna divisione (Singolo spostamento)",
+                            "fr_FR": "Pas de division (Décalage unique)",
+                            "de_DE": "Keine Teilung (Einzelne Verschiebung)",
+                            "pt_PT": "Sem divisão (Deslocamento único)",
+                            "ar_SA": "بدون تقسيم (إزاحة مفردة)",
+                            "vi_VN": "Không phân tách (Dịch chuyển đơn)",
+                            "fa_IR": "بدون تقسیم (جابجایی تکی)",
+                            "id_ID": "Tanpa Pemisahan (Pergeseran Tunggal)",
+                            "ms_MY": "Tiada Pemisahan (Anjakan Tunggal)",
+                            "th_TH": "ไม่แบ่ง (เลื่อนเดียว)",
+                            "ur_PK": "کوئی تقسیم نہیں (سنگل شفٹ)",
+                            "zh_TW": "不分割（單次偏移）",
+                        },
+                        "ols": {
+                            "en_US": "OLS (Framerate Drift)",
+                            "es_ES": "OLS (Desviación de velocidad de fotogramas)",
+                            "tr_TR": "OLS (Kare Hızı Sapması)",
+                            "zh_CN": "OLS（帧率漂移）",
+                            "ru_RU": "OLS (Дрейф частоты кадров)",
+                            "pl_PL": "OLS (Dryf klatek na sekundę)",
+                            "uk_UA": "OLS (Дрейф частоти кадрів)",
+                            "ja_JP": "OLS（フレームレートドリフト）",
+                            "ko_KR": "OLS (프레임레이트 드리프트)",
+                            "hi_IN": "OLS (फ्रेमरेट ड्रिफ्ट)",
+                            "bn_BD": "OLS (ফ্রেমরেট ড্রিフト)",
+                            "it_IT": "OLS (Deriva del framerate)",
+                            "fr_FR": "OLS (Dérive de fréquence d'images)",
+                            "de_DE": "OLS (Bildfrequenz-Drift)",
+                            "pt_PT": "OLS (Deriva de taxa de quadros)",
+                            "ar_SA": "OLS (انحراف معدل الإطارات)",
+                            "vi_VN": "OLS (Trôi dạt tốc độ khung hình)",
+                            "fa_IR": "OLS (انحراف نرخ فریم)",
+                            "id_ID": "OLS (Penyimpangan Framerate)",
+                            "ms_MY": "OLS (Hanyutan Kadar Bingkai)",
+                            "th_TH": "OLS (การคลาดเคลื่อนของอัตราเฟรม)",
+                            "ur_PK": "OLS (فریم ریٹ ڈرفٹ)",
+                            "zh_TW": "OLS（幀率漂移）",
+                        },
+                    },
                 },
-                "argument": "--full-scan",
-                "default": False,
             },
-            "no_cache": {
-                "type": "checkbox",
-                "label": {
-                    "en_US": "Disable cache",
-                    "es_ES": "Desactivar caché",
-                    "tr_TR": "Önbelleği devre dışı bırak",
-                    "zh_CN": "禁用缓存",
-                    "ru_RU": "Отключить кэш",
-                    "pl_PL": "Wyłącz pamięć podręczną",
-                    "uk_UA": "Вимкнути кеш",
-                    "ja_JP": "キャッシュを無効にする",
-                    "ko_KR": "캐시 비활성화",
-                    "hi_IN": "कैश अक्षम करें",
-                    "bn_BD": "ক্যাশে নিষ্ক্রিয় করুন",
-                    "it_IT": "Disabilita cache",
-                    "fr_FR": "Désactiver le cache",
-                    "de_DE": "Cache deaktivieren",
-                    "pt_PT": "Desativar cache",
-                    "ar_SA": "تعطيل الذاكرة المؤقتة",
-                    "vi_VN": "Tắt bộ nhớ đệm",
-                    "fa_IR": "غیرفعال کردن حافظه پنهان",
-                    "id_ID": "Nonaktifkan cache",
-                    "ms_MY": "Lumpuhkan cache",
-                    "th_TH": "ปิดการใช้งานแคช",
-                    "ur_PK": "کیشے غیر فعال کریں",
-                    "zh_TW": "停用快取",
-                },
-                "tooltip": {
-                    "en_US": 'Disables saving and reusing voice detection profiles (~/.cache/lapse/). When caching is enabled, re-syncing the same movie is nearly instantaneous (~0.6s).',
-                    "es_ES": 'Desactiva guardar y reutilizar perfiles de voz (~/.cache/lapse/). Con la caché activa, resincronizar la misma película es casi instantáneo (~0,6s).',
-                    "tr_TR": 'Ses algılama profillerini kaydetmeyi ve yeniden kullanmayı devre dışı bırakır (~/.cache/lapse/). Önbellek etkinken aynı filmi tekrar senkronize etmek anında biter (~0.6sn).',
-                    "zh_CN": '禁用保存和复用语音检测特征（~/.cache/lapse/）。启用缓存时，重新同步同一部电影几乎是瞬间完成的（约0.6秒）。',
-                    "ru_RU": 'Отключает сохранение и повторное использование профилей речи (~/.cache/lapse/). При включенном кэше повторная синхронизация занимает ~0.6 сек.',
-                    "pl_PL": 'Wyłącza zapisywanie i ponowne używanie profili mowy (~/.cache/lapse/). Przy włączonej pamięci podręcznej ponowna synchronizacja trwa zaledwie ~0,6 s.',
-                    "uk_UA": 'Вимикає збереження та повторне використання профілів мовлення (~/.cache/lapse/). З увімкненим кешем повторна синхронізація триває ~0,6 с.',
-                    "ja_JP": '音声プロファイルの保存と再利用（~/.cache/lapse/）を無効にします。キャッシュが有効な場合、同じ映画の再同期はほぼ一瞬（約0.6秒）です。',
-                    "ko_KR": '음성 감지 프로필의 저장 및 재사용(~/.cache/lapse/)을 비활성화합니다. 캐시가 켜져 있으면 동일한 영화의 재동기화가 거의 즉시 완료됩니다(~0.6초).',
-                    "hi_IN": 'वॉयस डिटेक्शन प्रोफाइल (~/.cache/lapse/) को सहेजना और पुन: उपयोग करना अक्षम करता है। कैश सक्षम होने पर, उसी मूवी को दोबारा सिंक करना बहुत तेज़ (~0.6s) होता है।',
-                    "bn_BD": 'ভয়েস প্রোফাইল সংরক্ষণ ও পুনঃব্যবহার (~/.cache/lapse/) নিষ্ক্রিয় করে। ক্যাশে সক্রিয় থাকলে একই মুভি পুনরায় সিঙ্ক করা প্রায় তাৎক্ষণিক (~০.৬ সেকেন্ড) হয়।',
-                    "it_IT": 'Disabilita il salvataggio e il riutilizzo dei profili vocali (~/.cache/lapse/). Con la cache attiva, la risincronizzazione dello stesso film è istantanea (~0,6s).',
-                    "fr_FR": "Désactive l'enregistrement et la réutilisation des profils vocaux (~/.cache/lapse/). Avec le cache, resynchroniser le même film est quasi instantané (~0,6s).",
-                    "de_DE": 'Deaktiviert das Speichern und Wiederverwenden von Sprachprofilen (~/.cache/lapse/). Bei aktivem Cache erfolgt eine erneute Synchronisation sofort (~0,6s).',
-                    "pt_PT": 'Desativa o armazenamento e reutilização de perfis de voz (~/.cache/lapse/). Com a cache ativa, ressincronizar o mesmo filme é quase instantâneo (~0,6s).',
-                    "ar_SA": 'يعطل حفظ وإعادة استخدام ملفات تعريف الصوت (~/.cache/lapse/). عند تفعيل الذاكرة المؤقتة، تكون إعادة المزامنة لنفس الفيلم فورية تقريبًا (~0.6 ثانية).',
-                    "vi_VN": 'Tắt tính năng lưu và sử dụng lại cấu hình giọng nói (~/.cache/lapse/). Khi bật bộ nhớ đệm, việc đồng bộ lại cùng một phim diễn ra gần như tức thì (~0,6s).',
-                    "fa_IR": 'ذخیره و استفاده مجدد از پروفایل\u200cهای گفتاری را غیرفعال می\u200cکند (~/.cache/lapse/). با فعال بودن کش، همگام\u200cسازی مجدد همان فیلم فوری است (~۰.۶ ثانیه).',
-                    "id_ID": 'Menonaktifkan penyimpanan dan penggunaan ulang profil suara (~/.cache/lapse/). Saat cache aktif, sinkronisasi ulang film yang sama hampir instan (~0,6 detik).',
-                    "ms_MY": 'Melumpuhkan penyimpanan dan penggunaan semula profil suara (~/.cache/lapse/). Apabila cache aktif, penyegerakan semula filem yang sama adalah serta-merta (~0.6s).',
-                    "th_TH": 'ปิดการบันทึกและนำโปรไฟล์เสียงกลับมาใช้ใหม่ (~/.cache/lapse/) เมื่อเปิดแคช การซิงค์ภาพยนตร์เรื่องเดิมซ้ำจะเสร็จทันที (~0.6 วินาที)',
-                    "ur_PK": 'صوتی پروفائلز کو محفوظ اور دوبارہ استعمال کرنے کو غیر فعال کرتا ہے (~/.cache/lapse/)۔ کیشے فعال ہونے پر، اسی فلم کی دوبارہ سنکنگ فوری ہوتی ہے (~0.6 سیکنڈ)۔',
-                    "zh_TW": '停用儲存和重複使用語音偵測特徵（~/.cache/lapse/）。啟用快取時，重新同步同一部電影幾乎是瞬間完成的（約0.6秒）。',
-                },
-                "argument": "--no-cache",
-                "default": False,
+        },
+        "alass": {
+            "version": "2.0",
+            "description": {
+                "en_US": "Automatic Language-Agnostic Subtitle Synchronization",
+                "es_ES": "Sincronización Automática de Subtítulos Agnóstica del Idioma",
+                "tr_TR": "Otomatik Dil Bağımsız Altyazı Senkronizasyonu",
+                "zh_CN": "自动语言无关字幕同步",
+                "ru_RU": "Автоматическая языково-независимая синхронизация субтитров",
+                "pl_PL": "Automatyczna synchronizacja napisów niezależna od języka",
+                "uk_UA": "Автоматична мовно-незалежна синхронізація субтитрів",
+                "ja_JP": "自動言語非依存字幕同期",
+                "ko_KR": "자동 언어 비의존적 자막 동기화",
+                "hi_IN": "स्वचालित भाषा-अज्ञेयवादी उपशीर्षक सिंक्रनाइज़ेशन",
+                "bn_BD": "স্বয়ংক্রিয় ভাষা-অজ্ঞেয়বাদী সাবটাইটেল সিঙ্ক্রোনাইজেশন",
+                "it_IT": "Sincronizzazione automatica dei sottotitoli indipendente dalla lingua",
+                "fr_FR": "Synchronisation automatique de sous-titres indépendante de la langue",
+                "de_DE": "Automatische sprachunabhängige Untertitelsynchronisation",
+                "pt_PT": "Sincronização automática de legendas independente de idioma",
+                "ar_SA": "مزامنة الترجمات التلقائية المستقلة عن اللغة",
+                "vi_VN": "Đồng bộ phụ đề tự động không phụ thuộc vào ngôn ngữ",
+                "fa_IR": "همگام‌سازی خودکار زیرنویس مستقل از زبان",
+                "id_ID": "Sinkronisasi subtitle otomatis yang tidak bergantung pada bahasa",
+                "ms_MY": "Segerak sarikata automatik yang tidak bergantung pada bahasa",
+                "th_TH": "การซิงค์คำบรรยายอัตโนมัติที่ไม่ขึ้นกับภาษา",
+                "ur_PK": "خودکار زبان سے آزاد سب ٹائٹل سنکرونائزیشن",
+                "zh_TW": "自動語言無關字幕同步",
             },
-            "split_penalty": {
-                "type": "slider",
-                "label": {
-                    "en_US": "Split penalty",
-                    "es_ES": "Penalización por división",
-                    "tr_TR": "Bölme cezası",
-                    "zh_CN": "分割惩罚",
-                    "ru_RU": "Штраф за разделение",
-                    "pl_PL": "Kara za podział",
-                    "uk_UA": "Штраф за розділення",
-                    "ja_JP": "分割ペナルティ",
-                    "ko_KR": "분할 패널티",
-                    "hi_IN": "विभाजन दंड",
-                    "bn_BD": "স্প্লিট পেনাল্টি",
-                    "it_IT": "Penalità di divisione",
-                    "fr_FR": "Pénalité de division",
-                    "de_DE": "Teilungsstrafe",
-                    "pt_PT": "Penalidade de divisão",
-                    "ar_SA": "عقوبة التقسيم",
-                    "vi_VN": "Phạt phân tách",
-                    "fa_IR": "جریمه تقسیم",
-                    "id_ID": "Penalti pemisahan",
-                    "ms_MY": "Penalti pemisahan",
-                    "th_TH": "บทลงโทษการแบ่ง",
-                    "ur_PK": "تقسیم کی سزا",
-                    "zh_TW": "分割懲罰",
-                },
-                "tooltip": {
-                    "en_US": 'Controls how easily LAPSE splits subtitles into multiple segments to fix scene changes or TV commercial cuts (default: 6).\n• Used in Auto and Split modes.\n• Higher values (10–20): More conservative, fewer splits.\n• Lower values (2–5): More aggressive, allows more splits.',
-                    "es_ES": 'Controla la facilidad con la que LAPSE divide los subtítulos en segmentos para corregir cortes de escena o pausas comerciales (predeterminado: 6).\n• Usado en modos Auto y División.\n• Valores altos (10–20): Más conservador, menos divisiones.\n• Valores bajos (2–5): Más agresivo, permite más divisiones.',
-                    "tr_TR": "LAPSE'in sahne kesintilerini veya reklam aralarını düzeltmek için altyazıyı ne kadar kolay parçalara böleceğini belirler (varsayılan: 6).\n• Otomatik ve Bölme modlarında kullanılır.\n• Yüksek değerler (10–20): Daha temkinli, daha az bölme.\n• Düşük değerler (2–5): Daha hassas, daha fazla bölmeye izin verir.",
-                    "zh_CN": '控制LAPSE将字幕分割为多个片段以修复场景剪辑或电视广告间隙的灵敏度（默认：6）。\n• 用于自动和分割模式。\n• 较高值（10–20）：更保守，产生较少分割。\n• 较低值（2–5）：更激进，允许更多分割。',
-                    "ru_RU": 'Управляет тем, насколько легко LAPSE разделяет субтитры на части для исправления склеек и рекламы (по умолчанию: 6).\n• Используется в режимах Авто и Разделение.\n• Высокие значения (10–20): Меньше разделений.\n• Низкие значения (2–5): Больше разделений.',
-                    "pl_PL": 'Określa, jak łatwo LAPSE dzieli napisy na segmenty w celu naprawy cięć scen lub reklam (domyślnie: 6).\n• Używane w trybach Auto i Podział.\n• Wyższe wartości (10–20): Bardziej ostrożny, mniej podziałów.\n• Niższe wartości (2–5): Bardziej agresywny, więcej podziałów.',
-                    "uk_UA": 'Керує тим, наскільки легко LAPSE розділяє субтитри на частини для виправлення склейок та реклами (за замовчуванням: 6).\n• Використовується в режимах Авто та Розділення.\n• Вищі значення (10–20): Менше розділень.\n• Нижчі значення (2–5): Більше розділень.',
-                    "ja_JP": 'シーン変更やCMカットを修正するためにLAPSEが字幕を複数セグメントに分割するしきい値を制御します（デフォルト：6）。\n• 自動および分割モードで使用。\n• 高い値（10〜20）：保守的、分割数が減少。\n• 低い値（2〜5）：積極的、分割数を許容。',
-                    "ko_KR": '장면 전환이나 TV 광고 구간을 맞추기 위해 자막을 여러 구간으로 분할하는 민감도를 조절합니다(기본값: 6).\n• 자동 및 분할 모드에서 사용.\n• 높은 값(10–20): 보수적, 분할 감소.\n• 낮은 값(2–5): 적극적, 더 많은 분할 허용.',
-                    "hi_IN": 'यह नियंत्रित करता है कि दृश्य परिवर्तनों या विज्ञापनों को ठीक करने के लिए LAPSE उपशीर्षक को कितने खंडों में विभाजित करता है (डिफ़ॉल्ट: 6)।\n• ऑटो और स्प्लिट मोड में उपयोग किया जाता है।\n• उच्च मान (10–20): कम विभाजन।\n• निम्न मान (2–5): अधिक विभाजन।',
-                    "bn_BD": 'দৃশ্য পরিবর্তন বা বিজ্ঞাপন কাটের জন্য LAPSE কত সহজে সাবটাইটেলকে বিভক্ত করবে তা নিয়ন্ত্রণ করে (ডিফল্ট: 6)।\n• অটো এবং স্প্লিট মোডে ব্যবহৃত হয়।\n• উচ্চ মান (10–20): কম বিভাজন।\n• নিম্ন মান (2–5): বেশি বিভাজন।',
-                    "it_IT": 'Controlla la facilità con cui LAPSE suddivide i sottotitoli in segmenti per correggere tagli o pubblicità (predefinito: 6).\n• Utilizzato in modalità Auto e Divisione.\n• Valori più alti (10–20): Più conservativo, meno divisioni.\n• Valori più bassi (2–5): Più aggressivo, più divisioni.',
-                    "fr_FR": 'Contrôle la facilité avec laquelle LAPSE segmente les sous-titres pour corriger les coupures ou publicités (par défaut : 6).\n• Utilisé en modes Auto et Division.\n• Valeurs élevées (10–20) : Plus conservateur, moins de découpes.\n• Valeurs basses (2–5) : Plus permissif, plus de découpes.',
-                    "de_DE": 'Steuert, wie leicht LAPSE Untertitel in Segmente teilt, um Schnitte oder Werbeunterbrechungen anzupassen (Standard: 6).\n• Im Auto- und Teilungsmodus verwendet.\n• Höhere Werte (10–20): Konservativer, weniger Teilungen.\n• Niedrigere Werte (2–5): Aggressiver, mehr Teilungen.',
-                    "pt_PT": 'Controla a facilidade com que o LAPSE divide as legendas em segmentos para corrigir cortes de cena ou comerciais (padrão: 6).\n• Usado nos modos Auto e Divisão.\n• Valores altos (10–20): Mais conservador, menos divisões.\n• Valores baixos (2–5): Mais agressivo, permite mais divisões.',
-                    "ar_SA": 'يتحكم في مدى سهولة تقسيم الترجمة إلى مقاطع لمعالجة الفواصل الإعلانية أو القطوع (افتراضي: 6).\n• يُستخدم في الوضعين التلقائي والتقسيم.\n• القيم الأعلى (10-20): أكثر تحفظًا، تقسيمات أقل.\n• القيم الأقل (2-5): تقسيمات أكثر.',
-                    "vi_VN": 'Kiểm soát độ nhạy khi LAPSE chia phụ đề thành nhiều đoạn để sửa các vết cắt cảnh hoặc quảng cáo (mặc định: 6).\n• Dùng trong chế độ Tự động và Phân tách.\n• Giá trị cao (10–20): Thận trọng hơn, ít đoạn cắt hơn.\n• Giá trị thấp (2–5): Cho phép nhiều đoạn cắt hơn.',
-                    "fa_IR": 'میزان حساسیت LAPSE را برای تقسیم زیرنویس به بخش\u200cهای مختلف جهت اصلاح برش\u200cها یا تبلیغات کنترل می\u200cکند (پیش\u200cفرض: 6).\n• در حالت خودکار و تقسیم استفاده می\u200cشود.\n• مقادیر بالاتر (10-20): تقسیمات کمتر.\n• مقادیر پایین\u200cتر (2-5): تقسیمات بیشتر.',
-                    "id_ID": 'Mengontrol seberapa mudah LAPSE membagi subtitle menjadi beberapa segmen untuk memperbaiki potongan adegan atau iklan (default: 6).\n• Digunakan dalam mode Auto dan Pemisahan.\n• Nilai lebih tinggi (10–20): Lebih konservatif, lebih sedikit pemisahan.\n• Nilai lebih rendah (2–5): Mengizinkan lebih banyak pemisahan.',
-                    "ms_MY": 'Mengawal kelonggaran LAPSE membahagikan sarikata kepada beberapa segmen untuk membetulkan potongan adegan atau iklan (lalai: 6).\n• Digunakan dalam mod Auto dan Pemisahan.\n• Nilai lebih tinggi (10–20): Kurang pemisahan.\n• Nilai lebih rendah (2–5): Membenarkan lebih banyak pemisahan.',
-                    "th_TH": 'ควบคุมความง่ายในการตัดแบ่งคำบรรยายเพื่อแก้ไขการตัดต่อฉากหรือโฆษณา (ค่าเริ่มต้น: 6)\n• ใช้ในโหมดอัตโนมัติและการแบ่ง\n• ค่าสูง (10–20): แบ่งน้อยลง ปลอดภัยขึ้น\n• ค่าต่ำ (2–5): ยอมให้แบ่งได้มากขึ้น',
-                    "ur_PK": 'منظر کی تبدیلیوں یا اشتہارات کو درست کرنے کے لیے LAPSE سب ٹائٹلز کو کتنی آسانی سے تقسیم کرتا ہے اسے کنٹرول کرتا ہے (ڈیفالٹ: 6)۔\n• آٹو اور اسپلٹ موڈز میں استعمال ہوتا ہے۔\n• اعلی اقدار (10–20): کم تقسیم۔\n• کم اقدار (2–5): زیادہ تقسیم۔',
-                    "zh_TW": '控制LAPSE將字幕分割為多個片段以修復場景剪輯或電視廣告間隙的靈敏度（預設：6）。\n• 用於自動和分割模式。\n• 較高值（10–20）：更保守，產生較少分割。\n• 較低值（2–5）：更積極，允許更多分割。',
-                },
-                "range": [1, 50],
-                "default": 6,
+            "github": "https://github.com/kaegi/alass",
+            "documentation": "https://github.com/kaegi/alass/blob/master/documentation/slides.pdf",
+            "supported_formats": [".srt", ".ass", ".ssa", ".sub", ".idx"],
+            "supports_subtitle_as_reference": True,
+            "type": "executable",
+            "executable": {
+                "Windows": get_resource_path(
+                    "autosubsyncapp.resources.alass-bin", "alass-cli.exe"
+                ),
+                "Linux": get_resource_path(
+                    "autosubsyncapp.resources.alass-bin", "alass-linux64"
+                ),
+                "Darwin": "alass-cli",
             },
-            "mode": {
-                "type": "dropdown",
-                "label": {
-                    "en_US": "Sync mode",
-                    "es_ES": "Modo de sincronización",
-                    "tr_TR": "Senkronizasyon modu",
-                    "zh_CN": "同步模式",
-                    "ru_RU": "Режим синхронизации",
-                    "pl_PL": "Tryb synchronizacji",
-                    "uk_UA": "Режим синхронізації",
-                    "ja_JP": "同期モード",
-                    "ko_KR": "동기화 모드",
-                    "hi_IN": "सिंक मोड",
-                    "bn_BD": "সিঙ্ক মোড",
-                    "it_IT": "Modalità di sincronizzazione",
-                    "fr_FR": "Mode de synchronisation",
-                    "de_DE": "Synchronisationsmodus",
-                    "pt_PT": "Modo de sincronização",
-                    "ar_SA": "وضع المزامنة",
-                    "vi_VN": "Chế độ đồng bộ",
-                    "fa_IR": "حالت همگام‌سازی",
-                    "id_ID": "Mode sinkronisasi",
-                    "ms_MY": "Mod penyelarasan",
-                    "th_TH": "โหมดการซิงค์",
-                    "ur_PK": "سنک موڈ",
-                    "zh_TW": "同步模式",
+            "cmd_structure": ["{reference}", "{subtitle}", "{output}"],
+            "options": {
+                "check_video_for_subtitles": {
+                    "type": "checkbox",
+                    "label": {
+                        "en_US": "Use embedded subtitles in video",
+                        "es_ES": "Usar subtítulos incrustados en el vídeo",
+                        "tr_TR": "Videodaki gömülü altyazıları kullan",
+                        "zh_CN": "使用视频中的内嵌字幕",
+                        "ru_RU": "Использовать встроенные субтитры в видео",
+                        "pl_PL": "Użyj osadzonych napisów w wideo",
+                        "uk_UA": "Використовувати вбудовані субтитри у відео",
+                        "ja_JP": "ビデオ内の埋め込み字幕を使用",
+                        "ko_KR": "비디오에 내장된 자막 사용",
+                        "hi_IN": "वीडियो में एम्बेडेड उपशीर्षक का उपयोग करें",
+                        "bn_BD": "ভিডিওতে এম্বেড করা সাবটাইটেল ব্যবহার করুন",
+                        "it_IT": "Usa i sottotitoli incorporati nel video",
+                        "fr_FR": "Utiliser les sous-titres intégrés dans la vidéo",
+                        "de_DE": "Eingebettete Untertitel im Video verwenden",
+                        "pt_PT": "Usar legendas incorporadas no vídeo",
+                        "ar_SA": "استخدم الترجمات المضمنة في الفيديو",
+                        "vi_VN": "Sử dụng phụ đề nhúng trong video",
+                        "fa_IR": "استفاده از زیرنویس‌های جاسازی‌شده در ویدیو",
+                        "id_ID": "Gunakan subtitle tertanam di video",
+                        "ms_MY": "Guna sarikata terbenam dalam video",
+                        "th_TH": "ใช้คำบรรยายที่ฝังในวิดีโอ",
+                        "ur_PK": "ویڈیو میں ایمبیڈڈ سب ٹائٹلز استعمال کریں",
+                        "zh_TW": "使用影片中的內嵌字幕",
+                    },
+                    "tooltip": {
+                        "en_US": "Extract the embedded subtitles in the video and perform synchronization with these subtitles.",
+                        "es_ES": "Extrae los subtítulos incrustados en el vídeo y realiza la sincronización con estos subtítulos.",
+                        "tr_TR": "Videodaki gömülü altyazıları çıkarır ve bu altyazılarla senkronizasyon yapar.",
+                        "zh_CN": "提取视频中的内嵌字幕并与这些字幕进行同步。",
+                        "ru_RU": "Извлекает встроенные субтитры из видео и выполняет синхронизацию с ними.",
+                        "pl_PL": "Wyodrębnia osadzone napisy z wideo i synchronizuje z nimi.",
+                        "uk_UA": "Витягує вбудовані субтитри з відео та виконує синхронізацію з ними.",
+                        "ja_JP": "ビデオ内の埋め込み字幕を抽出し、それらの字幕と同期します。",
+                        "ko_KR": "비디오에 내장된 자막을 추출하고 해당 자막과 동기화합니다.",
+                        "hi_IN": "वीडियो में एम्बेडेड उपशीर्षकों को निकालें और उनके साथ सिंक्रनाइज़ करें।",
+                        "bn_BD": "ভিডিওতে এম্বেড করা সাবটাইটেল বের করুন এবং সেগুলোর সাথে সিঙ্ক করুন।",
+                        "it_IT": "Estrae i sottotitoli incorporati nel video ed esegue la sincronizzazione con questi sottotitoli.",
+                        "fr_FR": "Extrait les sous-titres intégrés dans la vidéo et effectue la synchronisation avec ces sous-titres.",
+                        "de_DE": "Extrahiert die eingebetteten Untertitel aus dem Video und synchronisiert mit diesen Untertiteln.",
+                        "pt_PT": "Extrai as legendas incorporadas no vídeo e sincroniza com essas legendas.",
+                        "ar_SA": "يستخرج الترجمات المضمنة في الفيديو ويقوم بمزامنتها مع هذه الترجمات.",
+                        "vi_VN": "Trích xuất phụ đề nhúng trong video và đồng bộ hóa với các phụ đề này.",
+                        "fa_IR": "زیرنویس‌های جاسازی‌شده در ویدیو را استخراج کرده و با آن‌ها همگام‌سازی می‌کند.",
+                        "id_ID": "Ekstrak subtitle tertanam di video dan lakukan sinkronisasi dengan subtitle tersebut.",
+                        "ms_MY": "Ekstrak sarikata terbenam dalam video dan lakukan penyegerakan dengan sarikata tersebut.",
+                        "th_TH": "แยกคำบรรยายที่ฝังในวิดีโอและซิงค์กับคำบรรยายนั้น",
+                        "ur_PK": "ویڈیو میں ایمبیڈڈ سب ٹائٹلز نکالیں اور ان کے ساتھ سنکرونائز کریں۔",
+                        "zh_TW": "提取影片中的內嵌字幕並與這些字幕進行同步。",
+                    },
+                    "default": True,
                 },
-                "tooltip": {
-                    "en_US": 'Synchronization algorithm:\n• Auto (Recommended): Automatically analyzes the video to determine if subtitles need a simple shift, framerate correction, or segment splits.\n• Split Mode: Splits subtitles into multiple segments to handle TV commercials, recuts, and scene cuts. (Uses the Split penalty setting above).\n• No Split: Applies a single constant time offset shift for the entire file. Fastest and safest for uncut theatrical releases. (Disables split penalty).\n• OLS: Corrects progressive framerate drift across the video (e.g., 23.976 fps to 25 fps PAL conversions) using linear regression. (Disables split penalty).',
-                    "es_ES": 'Algoritmo de sincronización:\n• Automático (Recomendado): Analiza automáticamente el vídeo para determinar si los subtítulos necesitan un desplazamiento simple, corrección de fps o división por segmentos.\n• Modo división: Divide los subtítulos en múltiples segmentos para pausas publicitarias, cortes de emisión y escenas añadidas. (Utiliza la penalización por división).\n• Sin división: Aplica un único desplazamiento temporal constante a todo el archivo. El más rápido y seguro para versiones de cine sin cortes. (Desactiva la penalización).\n• OLS: Corrige la desviación progresiva de fotogramas a lo largo del vídeo (p. ej. conversión de 23.976 fps a 25 fps PAL) mediante regresión lineal. (Desactiva la penalización).',
-                    "tr_TR": "Senkronizasyon algoritması:\n• Otomatik (Önerilen): Altyazının basit bir kaydırmaya, kare hızı düzeltmesine mi yoksa parça bölmelerine mi ihtiyacı olduğunu videoyu analiz ederek otomatik belirler.\n• Bölme Modu: Reklam aralarını, yeniden kurgulanmış sahneleri ve kesintileri düzeltmek için altyazıyı parçalara böler. (Yukarıdaki Bölme cezası ayarını kullanır).\n• Bölme Yok: Dosyanın tamamına tek ve sabit bir zaman kaydırması uygular. Kesintisiz sinema sürümleri için en hızlı ve güvenli moddur. (Bölme cezasını devre dışı bırakır).\n• OLS: Doğrusal regresyon kullanarak video boyunca oluşan kademeli kare hızı sapmasını düzeltir (örn. 23.976 fps'den 25 fps PAL dönüşümleri). (Bölme cezasını devre dışı bırakır).",
-                    "zh_CN": '同步算法：\n• 自动（推荐）：自动分析视频以确定字幕需要简单的平移、帧率校正还是分段切割。\n• 分割模式：将字幕分割为多个片段以处理电视广告插播、重新剪辑和删减场景。（使用上方的分割惩罚设置）。\n• 不分割：对整个文件应用单次恒定时间偏移。对于未删减的完整片源最快且最安全。（禁用分割惩罚）。\n• OLS：通过线性回归修复整部视频中渐进式的帧率漂移（例如 23.976 fps 转 25 fps PAL）。（禁用分割惩罚）。',
-                    "ru_RU": 'Алгоритм синхронизации:\n• Авто (Рекомендуется): Автоматически анализирует видео, определяя, требуется ли простой сдвиг, коррекция частоты кадров или разделение на части.\n• Режим разделения: Разделяет субтитры на фрагменты для исправления рекламных пауз, перемонтажа и вырезанных сцен. (Использует настройку штрафа за разделение).\n• Без разделения: Применяет единый постоянный временной сдвиг ко всему файлу. Самый быстрый и надежный для полных версий без склеек. (Отключает штраф).\n• OLS: Исправляет постепенный дрейф частоты кадров по всему видео (например, преобразование 23.976 fps в 25 fps PAL) с помощью линейной регрессии. (Отключает штраф).',
-                    "pl_PL": 'Algorytm synchronizacji:\n• Automatyczny (Zalecany): Automatycznie analizuje wideo, aby ustalić, czy napisy wymagają prostego przesunięcia, korekty klatek czy podziału na segmenty.\n• Tryb podziału: Dzieli napisy na wiele segmentów, aby obsłużyć przerwy reklamowe, wersje przemontowane i cięcia scen. (Używa kary za podział).\n• Bez podziału: Stosuje jedno stałe przesunięcie czasowe dla całego pliku. Najszybszy i najbezpieczniejszy dla wydań kinowych bez cięć. (Wyłącza karę za podział).\n• OLS: Koryguje stopniowy dryf klatek na sekundę w całym wideo (np. konwersje 23.976 fps na 25 fps PAL) za pomocą regresji liniowej. (Wyłącza karę za podział).',
-                    "uk_UA": 'Алгоритм синхронізації:\n• Авто (Рекомендовано): Автоматично аналізує відео, визначаючи, чи потрібен простий зсув, корекція частоти кадрів або поділ на частини.\n• Режим розділення: Розділяє субтитри на кілька фрагментів для обробки реклами, перемонтажу та вирізаних сцен. (Використовує налаштування штрафу за розділення).\n• Без розділення: Застосовує один постійний часовий зсув до всього файлу. Найшвидший і найбезпечніший для повних версій без вирізок. (Вимикає штраф).\n• OLS: Виправляє поступовий дрейф частоти кадрів у всьому відео (наприклад, перетворення 23.976 fps на 25 fps PAL) за допомогою лінійної регресії. (Вимикає штраф).',
-                    "ja_JP": '同期アルゴリズム：\n• 自動（推奨）：字幕に単純なシフト、フレームレート補正、またはセグメント分割が必要かを動画から自動解析して判定します。\n• 分割モード：CMカット、再編集版、シーンカットに対応するために字幕を複数セグメントに分割します。（上記の分割ペナルティ設定を使用）。\n• 分割なし：ファイル全体に単一の一定時間オフセットを適用します。ノーカットの劇場版などに最速かつ安全です。（分割ペナルティを無効化）。\n• OLS：線形回帰を使用して、動画全体の段階的なフレームレートのズレを修正します（例：23.976 fpsから25 fps PALへの変換）。（分割ペナルティを無効化）。',
-                    "ko_KR": '동기화 알고리즘:\n• 자동 (권장): 비디오를 자동 분석하여 단순 이동, 프레임레이트 보정, 또는 구간 분할 중 필요한 방식을 결정합니다.\n• 분할 모드: TV 광고, 재편집 컷, 장면 삭제에 맞춰 자막을 여러 구간으로 분할 동기화합니다. (위의 분할 패널티 설정 사용).\n• 분할 없음: 파일 전체에 단일 고정 시간 이동만 적용합니다. 무삭제 정본 파일에 가장 빠르고 안전합니다. (분할 패널티 비활성화).\n• OLS: 선형 회귀를 사용하여 비디오 전체의 점진적 프레임레이트 드리프트를 보정합니다 (예: 23.976 fps -> 25 fps PAL 변환). (분할 패널티 비활성화).',
-                    "hi_IN": 'सिंक्रनाइज़ेशन एल्गोरिथ्म:\n• ऑटो (अनुशंसित): स्वचालित रूप से वीडियो का विश्लेषण करता है कि क्या उपशीर्षक को सरल शिफ्ट, फ्रेमरेट सुधार या खंड विभाजन की आवश्यकता है।\n• विभाजन मोड: विज्ञापनों, रीकट और दृश्य कट्स को संभालने के लिए उपशीर्षक को कई खंडों में विभाजित करता है। (ऊपर दिए गए विभाजन दंड का उपयोग करता है)।\n• कोई विभाजन नहीं: पूरी फ़ाइल के लिए एकल निरंतर समय ऑफसेट शिफ्ट लागू करता है। अनकट संस्करणों के लिए सबसे तेज़ और सुरक्षित। (विभाजन दंड अक्षम करता है)।\n• OLS: रैखिक प्रतिगमन का उपयोग करके पूरे वीडियो में क्रमिक फ्रेमरेट अंतर को ठीक करता है (उदा. 23.976 fps से 25 fps PAL)। (विभाजन दंड अक्षम करता है)।',
-                    "bn_BD": 'সিঙ্ক্রোনাইজেশন অ্যালগরিদম:\n• অটো (প্রস্তাবিত): ভিডিও বিশ্লেষণ করে স্বয়ংক্রিয়ভাবে নির্ধারণ করে যে সাবটাইটেলের সহজ শিফট, ফ্রেমরেট সংশোধন নাকি খণ্ড বিভাজন প্রয়োজন।\n• বিভাজন মোড: বিজ্ঞাপন বিরতি, পুনঃসম্পাদনা এবং দৃশ্য কাটের জন্য সাবটাইটেলকে একাধিক খণ্ডে বিভক্ত করে। (উপরের বিভাজন দণ্ড ব্যবহার করে)।\n• বিভাজন নেই: সম্পূর্ণ ফাইলের জন্য একটি একক স্থির সময় অফসেট শিফট প্রয়োগ করে। সম্পূর্ণ কাটারহিত ফিল্মের জন্য সবচেয়ে দ্রুত ও নিরাপদ। (বিভাজন দণ্ড নিষ্ক্রিয় করে)।\n• OLS: লিনিয়ার রিগ্রেশন ব্যবহার করে ভিডিও জুড়ে ক্রমান্বয়ে ফ্রেমরেট ড্রিফট সংশোধন করে (যেমন ২৩.৯৭৬ fps থেকে ২৫ fps PAL)। (বিভাজন দণ্ড নিষ্ক্রিয় করে)।',
-                    "it_IT": "Algoritmo di sincronizzazione:\n• Automatico (Consigliato): Analizza automaticamente il video per determinare se i sottotitoli richiedono un semplice scostamento, correzione del framerate o suddivisione in segmenti.\n• Modalità divisione: Suddivide i sottotitoli in più segmenti per gestire interruzioni pubblicitarie, versioni rimontate e tagli di scena. (Utilizza la penalità di divisione).\n• Senza divisione: Applica un unico scostamento temporale costante all'intero file. Il più rapido e sicuro per versioni integrali senza tagli. (Disabilita la penalità).\n• OLS: Corregge la deriva progressiva del framerate lungo tutto il video (es. conversioni da 23.976 fps a 25 fps PAL) tramite regressione lineare. (Disabilita la penalità).",
-                    "fr_FR": 'Algorithme de synchronisation :\n• Automatique (Recommandé) : Analyse automatiquement la vidéo pour déterminer si les sous-titres nécessitent un décalage simple, une correction de fréquence ou des découpes.\n• Mode division : Segmente les sous-titres en plusieurs parties pour gérer les coupures publicitaires, remontages et scènes coupées. (Utilise la pénalité de division).\n• Sans division : Applique un décalage temporel unique et constant à tout le fichier. Le plus rapide et sûr pour les versions intégrales. (Désactive la pénalité).\n• OLS : Corrige la dérive progressive de cadence sur toute la vidéo (ex. conversion 23.976 fps en 25 fps PAL) par régression linéaire. (Désactive la pénalité).',
-                    "de_DE": 'Synchronisations-Algorithmus:\n• Automatisch (Empfohlen): Analysiert das Video automatisch, um festzustellen, ob eine einfache Verschiebung, Bildratenanpassung oder Segmentteilung erforderlich ist.\n• Teilungsmodus: Teilt Untertitel in mehrere Segmente, um Werbepausen, Neuschnitte und Schnittfassungen anzupassen. (Nutzt die obige Teilungsstrafe).\n• Keine Teilung: Wendet eine einzelne konstante Zeitverschiebung auf die gesamte Datei an. Am schnellsten und sichersten für ungeschnittene Kinofassungen. (Deaktiviert die Teilungsstrafe).\n• OLS: Korrigiert allmähliche Bildraten-Abweichungen über das gesamte Video (z. B. 23.976 fps zu 25 fps PAL) mittels linearer Regression. (Deaktiviert die Teilungsstrafe).',
-                    "pt_PT": 'Algoritmo de sincronização:\n• Automático (Recomendado): Analisa automaticamente o vídeo para determinar se as legendas precisam de um deslocamento simples, correção de taxa de quadros ou divisão em segmentos.\n• Modo divisão: Divide as legendas em múltiplos segmentos para lidar com intervalos comerciais, reedições e cortes de cena. (Utiliza a penalidade de divisão).\n• Sem divisão: Aplica um único deslocamento temporal constante a todo o ficheiro. O mais rápido e seguro para lançamentos de cinema sem cortes. (Desativa a penalidade).\n• OLS: Corrige a deriva progressiva da taxa de quadros ao longo do vídeo (ex.: conversão de 23.976 fps para 25 fps PAL) através de regressão linear. (Desativa a penalidade).',
-                    "ar_SA": 'خوارزمية المزامنة:\n• تلقائي (موصى به): يحلل الفيديو تلقائيًا لتحديد ما إذا كانت الترجمة تحتاج إلى إزاحة بسيطة، أو تصحيح معدل الإطارات، أو تقسيم إلى أجزاء.\n• وضع التقسيم: يقسم الترجمة إلى مقاطع متعددة للتعامل مع الفواصل الإعلانية، والنسخ المعاد مونتاجها، ومشاهد القطع. (يستخدم عقوبة التقسيم أعلاه).\n• بدون تقسيم: يطبق إزاحة زمنية ثابتة واحدة للملف بأكمله. الأسرع والأكثر أمانًا للنسخ السينمائية الكاملة دون قطع. (يعطل عقوبة التقسيم).\n• OLS: يصحح انحراف معدل الإطارات التدريجي عبر الفيديو (مثل تحويل 23.976 إلى 25 إطار/ثانية PAL) باستخدام الانحدار الخطي. (يعطل عقوبة التقسيم).',
-                    "vi_VN": 'Thuật toán đồng bộ hóa:\n• Tự động (Khuyên dùng): Tự động phân tích video để xác định phụ đề cần dịch chuyển đơn giản, sửa tốc độ khung hình hay phân đoạn cắt.\n• Chế độ phân tách: Chia phụ đề thành nhiều đoạn để xử lý quảng cáo truyền hình, bản dựng lại và các đoạn cắt cảnh. (Sử dụng mức phạt phân tách ở trên).\n• Không phân tách: Áp dụng một độ lệch thời gian cố định duy nhất cho toàn bộ tệp. Nhanh nhất và an toàn nhất cho các bản phát hành đầy đủ. (Tắt mức phạt phân tách).\n• OLS: Sửa lỗi trôi tốc độ khung hình dần dần trong toàn bộ video (ví dụ: chuyển đổi từ 23.976 fps sang 25 fps PAL) bằng hồi quy tuyến tính. (Tắt mức phạt phân tách).',
-                    "fa_IR": 'الگوریتم همگام\u200cسازی:\n• خودکار (پیشنهادی): ویدیو را خودکار تحلیل می\u200cکند تا مشخص شود زیرنویس به جابجایی ساده، اصلاح نرخ فریم یا تقسیم بخش\u200cها نیاز دارد.\n• حالت تقسیم: زیرنویس را به بخش\u200cهای متعدد تقسیم می\u200cکند تا تبلیغات تلویزیونی، نسخه\u200cهای بازتدوین\u200cشده و برش\u200cها اصلاح شوند. (از جریمه تقسیم بالا استفاده می\u200cکند).\n• بدون تقسیم: یک جابجایی زمانی ثابت را روی کل فایل اعمال می\u200cکند. سریع\u200cترین و مطمئن\u200cترین حالت برای نسخه\u200cهای سینمایی بدون برش. (جریمه تقسیم را غیرفعال می\u200cکند).\n• OLS: انحراف تدریجی نرخ فریم را در طول ویدیو (مانند تبدیل ۲۳.۹۷۶ به ۲۵ فریم PAL) با رگرسیون خطی اصلاح می\u200cکند. (جریمه تقسیم را غیرفعال می\u200cکند).',
-                    "id_ID": 'Algoritma sinkronisasi:\n• Otomatis (Disarankan): Menganalisis video secara otomatis untuk menentukan apakah subtitle memerlukan pergeseran sederhana, koreksi framerate, atau pemisahan segmen.\n• Mode Pemisahan: Membagi subtitle menjadi beberapa segmen untuk menangani jeda iklan, pemotongan ulang, dan adegan yang dipotong. (Menggunakan penalti pemisahan di atas).\n• Tanpa Pemisahan: Menerapkan satu pergeseran offset waktu konstan untuk seluruh file. Tercepat dan teraman untuk rilis utuh tanpa potongan. (Menonaktifkan penalti pemisahan).\n• OLS: Mengoreksi penyimpangan framerate bertahap di seluruh video (misalnya konversi 23.976 fps ke 25 fps PAL) menggunakan regresi linier. (Menonaktifkan penalti pemisahan).',
-                    "ms_MY": 'Algoritma penyegerakan:\n• Automatik (Disyorkan): Menganalisis video secara automatik untuk menentukan sama ada sarikata memerlukan anjakan mudah, pembetulan kadar bingkai atau pemisahan segmen.\n• Mod Pemisahan: Membahagikan sarikata kepada beberapa segmen untuk mengendalikan iklan televisyen, suntingan semula dan potongan babak. (Menggunakan penalti pemisahan di atas).\n• Tiada Pemisahan: Menggunakan satu anjakan ofset masa malar untuk keseluruhan fail. Paling pantas dan selamat untuk keluaran tanpa potongan. (Melumpuhkan penalti pemisahan).\n• OLS: Membetulkan hanyutan kadar bingkai beransur-ansur sepanjang video (cth. penukaran 23.976 fps kepada 25 fps PAL) menggunakan regresi linear. (Melumpuhkan penalti pemisahan).',
-                    "th_TH": 'อัลกอริทึมการซิงค์:\n• อัตโนมัติ (แนะนำ): วิเคราะห์วิดีโอโดยอัตโนมัติเพื่อตรวจสอบว่าคำบรรยายต้องการการเลื่อนอย่างง่าย, การแก้ไขอัตราเฟรม หรือการตัดแบ่งเป็นส่วนๆ\n• โหมดการแบ่ง: ตัดแบ่งคำบรรยายเป็นหลายส่วนเพื่อรองรับช่วงโฆษณา, เวอร์ชันตัดต่อใหม่ และฉากที่ถูกตัด (ใช้การตั้งค่าบทลงโทษการแบ่งด้านบน)\n• ไม่แบ่ง: เลื่อนเวลาชดเชยแบบคงที่เพียงค่าเดียวตลอดทั้งไฟล์ รวดเร็วและปลอดภัยที่สุดสำหรับภาพยนตร์ฉบับเต็มไม่ตัดต่อ (ปิดการใช้งานบทลงโทษการแบ่ง)\n• OLS: แก้ไขการคลาดเคลื่อนของอัตราเฟรมอย่างค่อยเป็นค่อยไปตลอดทั้งวิดีโอ (เช่น การแปลงจาก 23.976 fps เป็น 25 fps PAL) โดยใช้การถดถอยเชิงเส้น (ปิดการใช้งานบทลงโทษการแบ่ง)',
-                    "ur_PK": 'سنکرونائزیشن کا طریقہ کار:\n• خودکار (تجویز کردہ): ویڈیو کا خودکار تجزیہ کرتا ہے تاکہ معلوم کیا جا سکے کہ آیا سب ٹائٹلز کو سادہ شفٹ، فریم ریٹ کی درستگی یا حصوں میں تقسیم کی ضرورت ہے۔\n• تقسیم کا موڈ: ٹی وی اشتہارات، دوبارہ تدوین شدہ ورژنز اور کٹس کو سنبھالنے کے لیے سب ٹائٹلز کو متعدد حصوں میں تقسیم کرتا ہے۔ (اوپر دی گئی تقسیم کی سزا استعمال کرتا ہے)۔\n• بغیر تقسیم: پوری فائل کے لیے ایک مستقل ٹائم آفسیٹ شفٹ لاگو کرتا ہے۔ بغیر کٹوتی والی مکمل ریلیزز کے لیے تیز ترین اور محفوظ ترین۔ (تقسیم کی سزا کو غیر فعال کرتا ہے)۔\n• OLS: لکیری ریگریشن کا استعمال کرتے ہوئے پوری ویڈیو میں بتدریج فریم ریٹ کے ڈرفٹ کو درست کرتا ہے (جیسے 23.976 fps سے 25 fps PAL کنورژن)۔ (تقسیم کی سزا کو غیر فعال کرتا ہے)۔',
-                    "zh_TW": '同步演算法：\n• 自動（推薦）：自動分析影片以確定字幕需要簡單的平移、幀率校正還是分段切割。\n• 分割模式：將字幕分割為多個片段以處理電視廣告插播、重新剪輯和刪減場景。（使用上方的分割懲罰設定）。\n• 不分割：對整個檔案套用單次恆定時間偏移。對於未刪減的完整片源最快且最安全。（停用分割懲罰）。\n• OLS：透過線性迴歸修復整部影片中漸進式的幀率漂移（例如 23.976 fps 轉 25 fps PAL）。（停用分割懲罰）。',
+                "disable_fps_guessing": {
+                    "type": "checkbox",
+                    "label": {
+                        "en_US": "Disable FPS guessing",
+                        "es_ES": "Desactivar estimación de FPS",
+                        "tr_TR": "FPS tahmini devre dışı bırak",
+                        "zh_CN": "禁用帧率猜测",
+                        "ru_RU": "Отключить угадывание FPS",
+                        "pl_PL": "Wyłącz zgadywanie FPS",
+                        "uk_UA": "Вимкнути вгадування FPS",
+                        "ja_JP": "FPS推測を無効にする",
+                        "ko_KR": "FPS 추측 비활성화",
+                        "hi_IN": "FPS अनुमान अक्षम करें",
+                        "bn_BD": "FPS অনুমান নিষ্ক্রিয় করুন",
+                        "it_IT": "Disabilita previsione FPS",
+                        "fr_FR": "Désactiver l'estimation des FPS",
+                        "de_DE": "FPS-Schätzung deaktivieren",
+                        "pt_PT": "Desativar suposição de FPS",
+                        "ar_SA": "تعطيل تخمين معدل الإطارات",
+                        "vi_VN": "Tắt đoán tốc độ khung hình",
+                        "fa_IR": "غیرفعال کردن حدس FPS",
+                        "id_ID": "Nonaktifkan penebakan FPS",
+                        "ms_MY": "Lumpuhkan tekaan FPS",
+                        "th_TH": "ปิดการคาดเดาอัตราเฟรม",
+                        "ur_PK": "FPS اندازہ غیر فعال کریں",
+                        "zh_TW": "停用 FPS 猜測",
+                    },
+                    "tooltip": {
+                        "en_US": "Disables guessing and correcting of framerate differences between reference file and input file.",
+                        "es_ES": "Desactiva la estimación y corrección de diferencias en la velocidad de fotogramas entre el archivo de referencia y el archivo de entrada.",
+                        "tr_TR": "Referans dosya ve girdi dosyası arasındaki kare hızı farklılıklarının tahmin edilmesini ve düzeltilmesini devre dışı bırakır.",
+                        "zh_CN": "禁用猜测和校正参考文件和输入文件之间的帧率差异。",
+                        "ru_RU": "Отключает угадывание и исправление различий частоты кадров между эталонным файлом и входным файлом.",
+                        "pl_PL": "Wyłącza zgadywanie i korygowanie różnic w liczbie klatek na sekundę między plikiem referencyjnym a plikiem wejściowym.",
+                        "uk_UA": "Вимикає вгадування та виправлення відмінностей частоти кадрів між еталонним файлом і вхідним файлом.",
+                        "ja_JP": "参照ファイルと入力ファイル間のフレームレートの違いの推測と修正を無効にします。",
+                        "ko_KR": "참조 파일과 입력 파일 간의 프레임 레이트 차이를 추측하고 수정하는 기능을 비활성화합니다.",
+                        "hi_IN": "संदर्भ फ़ाइल और इनपुट फ़ाइल के बीच फ्रेमरेट अंतर का अनुमान और सुधार अक्षम करता है।",
+                        "bn_BD": "রেফারেন্স ফাইল এবং ইনপুট ফাইলের মধ্যে ফ্রেমরেট পার্থক্যের অনুমান এবং সংশোধন নিষ্ক্রিয় করে।",
+                        "it_IT": "Disabilita la previsione e la correzione delle differenze di framerate tra il file di riferimento e il file di input.",
+                        "fr_FR": "Désactive l'estimation et la correction des différences de fréquence d'images entre le fichier de référence et le fichier d'entrée.",
+                        "de_DE": "Deaktiviert das Erraten und Korrigieren von Bildfrequenzunterschieden zwischen Referenzdatei und Eingabedatei.",
+                        "pt_PT": "Desativa a suposição e correção de diferenças de taxa de quadros entre o ficheiro de referência e o ficheiro de entrada.",
+                        "ar_SA": "يعطل تخمين وتصحيح اختلافات معدل الإطارات بين ملف المرجع وملف الإدخال.",
+                        "vi_VN": "Tắt đoán và sửa sự khác biệt tốc độ khung hình giữa tệp tham chiếu và tệp đầu vào.",
+                        "fa_IR": "حدس زدن و تصحیح تفاوت‌های نرخ فریم بین فایل مرجع و فایل ورودی را غیرفعال می‌کند.",
+                        "id_ID": "Menonaktifkan penebakan dan koreksi perbedaan framerate antara file referensi dan file input.",
+                        "ms_MY": "Melumpuhkan tekaan dan pembetulan perbezaan kadar bingkai antara fail rujukan dan fail input.",
+                        "th_TH": "ปิดการคาดเดาและการแก้ไขความแตกต่างของอัตราเฟรมระหว่างไฟล์อ้างอิงและไฟล์อินพุต",
+                        "ur_PK": "حوالہ فائل اور ان پٹ فائل کے درمیان فریم ریٹ کے فرق کا اندازہ لگانا اور درست کرنا غیر فعال کرتا ہے۔",
+                        "zh_TW": "停用參考檔和輸入檔之間幀率差異的猜測和修正。",
+                    },
+                    "argument": "--disable-fps-guessing",
+                    "default": False,
                 },
-                "default": "auto",
-                "values": ["auto", "split", "nosplit", "ols"],
-                "value_labels": {
-                    "auto": {
-                        "en_US": "Auto (Shift, Drift or Split)",
-                        "es_ES": "Automático (Desplazamiento, Deriva o División)",
-                        "tr_TR": "Otomatik (Kaydırma, Sapma veya Bölme)",
-                        "zh_CN": "自动（偏移、漂移或分割）",
-                        "ru_RU": "Авто (Сдвиг, Дрейф или Разделение)",
-                        "pl_PL": "Automatyczny (Przesunięcie, Dryf lub Podział)",
-                        "uk_UA": "Авто (Зсув, Дрейф або Розділення)",
-                        "ja_JP": "自動（シフト、ドリフト、または分割）",
-                        "ko_KR": "자동 (이동, 드리프트 또는 분할)",
-                        "hi_IN": "स्वचालित (शिफ्ट, ड्रिफ्ट या विभाजन)",
-                        "bn_BD": "স্বয়ংক্রিয় (শিফট, ড্রিফট বা বিভাজন)",
-                        "it_IT": "Automatico (Spostamento, Deriva o Divisione)",
-                        "fr_FR": "Automatique (Décalage, Dérive ou Division)",
-                        "de_DE": "Automatisch (Verschiebung, Drift oder Teilung)",
-                        "pt_PT": "Automático (Deslocamento, Deriva ou Divisão)",
-                        "ar_SA": "تلقائي (إزاحة، انحراف أو تقسيم)",
-                        "vi_VN": "Tự động (Dịch chuyển, Trôi dạt hoặc Phân tách)",
-                        "fa_IR": "خودکار (جابجایی، انحراف یا تقسیم)",
-                        "id_ID": "Otomatis (Pergeseran, Penyimpangan atau Pemisahan)",
-                        "ms_MY": "Automatik (Anjakan, Hanyutan atau Pemisahan)",
-                        "th_TH": "อัตโนมัติ (เลื่อน, คลาดเคลื่อน หรือแบ่ง)",
-                        "ur_PK": "خودکار (شفٹ، ڈرفٹ یا تقسیم)",
-                        "zh_TW": "自動（偏移、漂移或分割）",
+                "disable_speed_optimization": {
+                    "type": "checkbox",
+                    "label": {
+                        "en_US": "Disable speed optimization",
+                        "es_ES": "Desactivar optimización de velocidad",
+                        "tr_TR": "Hız optimizasyonunu devre dışı bırak",
+                        "zh_CN": "禁用速度优化",
+                        "ru_RU": "Отключить оптимизацию скорости",
+                        "pl_PL": "Wyłącz optymalizację prędkości",
+                        "uk_UA": "Вимкнути оптимізацію швидкості",
+                        "ja_JP": "速度最適化を無効にする",
+                        "ko_KR": "속도 최적화 비활성화",
+                        "hi_IN": "गति अनुकूलन अक्षम करें",
+                        "bn_BD": "গতি অপ্টিমাইজেশন নিষ্ক্রিয় করুন",
+                        "it_IT": "Disabilita ottimizzazione velocità",
+                        "fr_FR": "Désactiver l'optimisation de la vitesse",
+                        "de_DE": "Geschwindigkeitsoptimierung deaktivieren",
+                        "pt_PT": "Desativar otimização de velocidade",
+                        "ar_SA": "تعطيل تحسين السرعة",
+                        "vi_VN": "Tắt tối ưu hóa tốc độ",
+                        "fa_IR": "غیرفعال کردن بهینه‌سازی سرعت",
+                        "id_ID": "Nonaktifkan optimasi kecepatan",
+                        "ms_MY": "Lumpuhkan pengoptimuman kelajuan",
+                        "th_TH": "ปิดการเพิ่มประสิทธิภาพความเร็ว",
+                        "ur_PK": "رفتار کی بہتری غیر فعال کریں",
+                        "zh_TW": "停用速度最佳化",
                     },
-                    "split": {
-                        "en_US": "Split Mode",
-                        "es_ES": "Modo de división",
-                        "tr_TR": "Bölme Modu",
-                        "zh_CN": "分割模式",
-                        "ru_RU": "Режим разделения",
-                        "pl_PL": "Tryb podziału",
-                        "uk_UA": "Режим розділення",
-                        "ja_JP": "分割モード",
-                        "ko_KR": "분할 모드",
-                        "hi_IN": "विभाजन मोड",
-                        "bn_BD": "বিভাজন মোড",
-                        "it_IT": "Modalità divisione",
-                        "fr_FR": "Mode division",
-                        "de_DE": "Teilungsmodus",
-                        "pt_PT": "Modo de divisão",
-                        "ar_SA": "وضع التقسيم",
-                        "vi_VN": "Chế độ phân tách",
-                        "fa_IR": "حالت تقسیم",
-                        "id_ID": "Mode Pemisahan",
-                        "ms_MY": "Mod Pemisahan",
-                        "th_TH": "โหมดการแบ่ง",
-                        "ur_PK": "تقسیم کا موڈ",
-                        "zh_TW": "分割模式",
+                    "tooltip": {
+                        "en_US": "Disable speed optimization for better accuracy. This will increase the processing time.",
+                        "es_ES": "Desactiva la optimización de velocidad para mejorar la precisión. Esto aumentará el tiempo de procesamiento.",
+                        "tr_TR": "Daha iyi doğruluk için hız optimizasyonunu devre dışı bırakın. Bu, işlem süresini artıracaktır.",
+                        "zh_CN": "禁用速度优化以提高准确性。这将增加处理时间。",
+                        "ru_RU": "Отключите оптимизацию скорости для лучшей точности. Это увеличит время обработки.",
+                        "pl_PL": "Wyłącz optymalizację prędkości dla lepszej dokładności. Wydłuży to czas przetwarzania.",
+                        "uk_UA": "Вимкніть оптимізацію швидкості для кращої точності. Це збільшить час обробки.",
+                        "ja_JP": "精度を向上させるために速度最適化を無効にします。これにより処理時間が長くなります。",
+                        "ko_KR": "더 나은 정확도를 위해 속도 최적화를 비활성화합니다. 이렇게 하면 처리 시간이 증가합니다.",
+                        "hi_IN": "बेहतर सटीकता के लिए गति अनुकूलन अक्षम करें। यह प्रसंस्करण समय बढ़ा देगा।",
+                        "bn_BD": "আরো ভাল নির্ভুলতার জন্য গতি অপ্টিমাইজেশন নিষ্ক্রিয় করুন। এটি প্রক্রিয়াকরণের সময় বাড়িয়ে দেবে।",
+                        "it_IT": "Disabilita l'ottimizzazione della velocità per una maggiore precisione. Questo aumenterà il tempo di elaborazione.",
+                        "fr_FR": "Désactivez l'optimisation de la vitesse pour une meilleure précision. Cela augmentera le temps de traitement.",
+                        "de_DE": "Deaktivieren Sie die Geschwindigkeitsoptimierung für eine bessere Genauigkeit. Dies erhöht die Verarbeitungszeit.",
+                        "pt_PT": "Desative a otimização de velocidade para obter melhor precisão. Isto aumentará o tempo de processamento.",
+                        "ar_SA": "قم بتعطيل تحسين السرعة للحصول على دقة أفضل. سيؤدي هذا إلى زيادة وقت المعالجة.",
+                        "vi_VN": "Tắt tối ưu hóa tốc độ để có độ chính xác tốt hơn. Điều này sẽ làm tăng thời gian xử lý.",
+                        "fa_IR": "بهینه‌سازی سرعت را برای دقت بهتر غیرفعال کنید. این زمان پردازش را افزایش می‌دهد.",
+                        "id_ID": "Nonaktifkan optimasi kecepatan untuk akurasi yang lebih baik. Ini akan meningkatkan waktu pemrosesan.",
+                        "ms_MY": "Lumpuhkan pengoptimuman kelajuan untuk ketepatan yang lebih baik. Ini akan meningkatkan masa pemprosesan.",
+                        "th_TH": "ปิดการเพิ่มประสิทธิภาพความเร็วเพื่อความแม่นยำที่ดีขึ้น ซึ่งจะเพิ่มเวลาการประมวลผล",
+                        "ur_PK": "بہتر درستگی کے لیے رفتار کی بہتری کو غیر فعال کریں۔ یہ پروسیسنگ کا وقت بڑھا دے گا۔",
+                        "zh_TW": "停用速度最佳化以獲得更好的準確性。這將增加處理時間。",
                     },
-                    "nosplit": {
-                        "en_US": "No Split (Single Shift)",
-                        "es_ES": "Sin división (Desplazamiento único)",
-                        "tr_TR": "Bölme Yok (Tek Kaydırma)",
-                        "zh_CN": "不分割（单次偏移）",
-                        "ru_RU": "Без разделения (Одиночный сдвиг)",
-                        "pl_PL": "Bez podziału (Pojedyncze przesunięcie)",
-                        "uk_UA": "Без розділення (Одинарний зсув)",
-                        "ja_JP": "分割なし（単一シフト）",
-                        "ko_KR": "분할 없음 (단일 이동)",
-                        "hi_IN": "कोई विभाजन नहीं (एकल शिफ्ट)",
-                        "bn_BD": "বিভাজন নেই (একক শিফট)",
-                        "it_IT": "Nessuna divisione (Singolo spostamento)",
-                        "fr_FR": "Pas de division (Décalage unique)",
-                        "de_DE": "Keine Teilung (Einzelne Verschiebung)",
-                        "pt_PT": "Sem divisão (Deslocamento único)",
-                        "ar_SA": "بدون تقسيم (إزاحة مفردة)",
-                        "vi_VN": "Không phân tách (Dịch chuyển đơn)",
-                        "fa_IR": "بدون تقسیم (جابجایی تکی)",
-                        "id_ID": "Tanpa Pemisahan (Pergeseran Tunggal)",
-                        "ms_MY": "Tiada Pemisahan (Anjakan Tunggal)",
-                        "th_TH": "ไม่แบ่ง (เลื่อนเดียว)",
-                        "ur_PK": "کوئی تقسیم نہیں (سنگل شفٹ)",
-                        "zh_TW": "不分割（單次偏移）",
+                    "argument": "--speed-optimization=0",
+                    "default": False,
+                },
+                "split_penalty": {
+                    "type": "slider",
+                    "label": {
+                        "en_US": "Split penalty",
+                        "es_ES": "Penalización por división",
+                        "tr_TR": "Bölme cezası",
+                        "zh_CN": "分割惩罚",
+                        "ru_RU": "Штраф за разделение",
+                        "pl_PL": "Kara za podział",
+                        "uk_UA": "Штраф за розділення",
+                        "ja_JP": "分割ペナルティ",
+                        "ko_KR": "분할 패널티",
+                        "hi_IN": "विभाजन दंड",
+                        "bn_BD": "স্প্লিট পেনাল্টি",
+                        "it_IT": "Penalità di divisione",
+                        "fr_FR": "Pénalité de division",
+                        "de_DE": "Teilungsstrafe",
+                        "pt_PT": "Penalidade de divisão",
+                        "ar_SA": "عقوبة التقسيم",
+                        "vi_VN": "Phạt phân tách",
+                        "fa_IR": "جریمه تقسیم",
+                        "id_ID": "Penalti pemisahan",
+                        "ms_MY": "Penalti pemisahan",
+                        "th_TH": "บทลงโทษการแบ่ง",
+                        "ur_PK": "تقسیم کی سزا",
+                        "zh_TW": "分割懲罰",
                     },
-                    "ols": {
-                        "en_US": "OLS (Framerate Drift)",
-                        "es_ES": "OLS (Desviación de velocidad de fotogramas)",
-                        "tr_TR": "OLS (Kare Hızı Sapması)",
-                        "zh_CN": "OLS（帧率漂移）",
-                        "ru_RU": "OLS (Дрейф частоты кадров)",
-                        "pl_PL": "OLS (Dryf klatek na sekundę)",
-                        "uk_UA": "OLS (Дрейф частоти кадрів)",
-                        "ja_JP": "OLS（フレームレートドリフト）",
-                        "ko_KR": "OLS (프레임레이트 드리프트)",
-                        "hi_IN": "OLS (फ्रेमरेट ड्रिफ्ट)",
-                        "bn_BD": "OLS (ফ্রেমরেট ড্রিフト)",
-                        "it_IT": "OLS (Deriva del framerate)",
-                        "fr_FR": "OLS (Dérive de fréquence d'images)",
-                        "de_DE": "OLS (Bildfrequenz-Drift)",
-                        "pt_PT": "OLS (Deriva de taxa de quadros)",
-                        "ar_SA": "OLS (انحراف معدل الإطارات)",
-                        "vi_VN": "OLS (Trôi dạt tốc độ khung hình)",
-                        "fa_IR": "OLS (انحراف نرخ فریم)",
-                        "id_ID": "OLS (Penyimpangan Framerate)",
-                        "ms_MY": "OLS (Hanyutan Kadar Bingkai)",
-                        "th_TH": "OLS (การคลาดเคลื่อนของอัตราเฟรม)",
-                        "ur_PK": "OLS (فریم ریٹ ڈرفٹ)",
-                        "zh_TW": "OLS（幀率漂移）",
+                    "argument": "--split-penalty",
+                    "tooltip": {
+                        "en_US": "Penalty for splitting subtitles during alignment\n(Default: 7, Recommended: 5-20, No splits: -1)",
+                        "es_ES": "Penalización por dividir subtítulos durante la alineación\n(Predeterminado: 7, Recomendado: 5-20, Sin divisiones: -1)",
+                        "tr_TR": "Hizalama sırasında altyazıları bölme cezası\n(Varsayılan: 7, Önerilen: 5-20, Bölme yok: -1)",
+                        "zh_CN": "在对齐过程中分割字幕的惩罚值\n（默认：7，推荐：5-20，不分割：-1）",
+                        "ru_RU": "Штраф за разделение субтитров во время выравнивания\n(По умолчанию: 7, Рекомендуется: 5-20, Без разделения: -1)",
+                        "pl_PL": "Kara za dzielenie napisów podczas wyrównywania\n(Domyślnie: 7, Zalecane: 5-20, Brak podziałów: -1)",
+                        "uk_UA": "Штраф за розділення субтитрів під час вирівнювання\n(За замовчуванням: 7, Рекомендовано: 5-20, Без розділення: -1)",
+                        "ja_JP": "アライメント中に字幕を分割するためのペナルティ\n（デフォルト：7、推奨：5-20、分割なし：-1）",
+                        "ko_KR": "정렬 중 자막 분할에 대한 패널티\n(기본값: 7, 권장: 5-20, 분할 없음: -1)",
+                        "hi_IN": "संरेखण के दौरान उपशीर्षकों को विभाजित करने का दंड\n(डिफ़ॉल्ट: 7, अनुशंसित: 5-20, कोई विभाजन नहीं: -1)",
+                        "bn_BD": "অ্যালাইনমেন্ট চলাকালীন সাবটাইটেল বিভাজনের জন্য পেনাল্টি\n(ডিফল্ট: 7, প্রস্তাবিত: 5-20, বিভাজন নেই: -1)",
+                        "it_IT": "Penalità per la divisione dei sottotitoli durante l'allineamento\n(Predefinito: 7, Consigliato: 5-20, Nessuna divisione: -1)",
+                        "fr_FR": "Pénalité pour la division des sous-titres pendant l'alignement\n(Par défaut : 7, Recommandé : 5-20, Pas de divisions : -1)",
+                        "de_DE": "Strafe für die Teilung von Untertiteln während der Ausrichtung\n(Standard: 7, Empfohlen: 5-20, Keine Teilung: -1)",
+                        "pt_PT": "Penalidade por dividir legendas durante o alinhamento\n(Padrão: 7, Recomendado: 5-20, Sem divisões: -1)",
+                        "ar_SA": "عقوبة تقسيم الترجمات أثناء المحاذاة\n(افتراضي: 7، موصى به: 5-20، بدون تقسيم: -1)",
+                        "vi_VN": "Hình phạt cho việc phân tách phụ đề trong quá trình căn chỉnh\n(Mặc định: 7, Khuyến nghị: 5-20, Không phân tách: -1)",
+                        "fa_IR": "جریمه تقسیم زیرنویس‌ها در حین تراز کردن\n(پیش‌فرض: 7، پیشنهادی: 5-20، بدون تقسیم: -1)",
+                        "id_ID": "Penalti untuk memisahkan subtitle selama penyelarasan\n(Default: 7, Direkomendasikan: 5-20, Tanpa pemisahan: -1)",
+                        "ms_MY": "Penalti untuk memisahkan sarikata semasa penjajaran\n(Lalai: 7, Disyorkan: 5-20, Tiada pemisahan: -1)",
+                        "th_TH": "บทลงโทษสำหรับการแบ่งคำบรรยายระหว่างการปรับแนว\n(ค่าเริ่มต้น: 7, แนะนำ: 5-20, ไม่แบ่ง: -1)",
+                        "ur_PK": "ہم آہنگی کے دوران سب ٹائٹلز کو تقسیم کرنے کی سزا\n(ڈیفالٹ: 7، تجویز کردہ: 5-20، کوئی تقسیم نہیں: -1)",
+                        "zh_TW": "對齊期間分割字幕的懲罰\n（預設：7，建議：5-20，不分割：-1）",
                     },
+                    "no_split_argument": "--no-split",
+                    "range": [-1, 100],
+                    "default": 7,
                 },
             },
         },
-    },
-    "alass": {
-        "version": "2.0",
-        "description": {
-            "en_US": "Automatic Language-Agnostic Subtitle Synchronization",
-            "es_ES": "Sincronización Automática de Subtítulos Agnóstica del Idioma",
-            "tr_TR": "Otomatik Dil Bağımsız Altyazı Senkronizasyonu",
-            "zh_CN": "自动语言无关字幕同步",
-            "ru_RU": "Автоматическая языково-независимая синхронизация субтитров",
-            "pl_PL": "Automatyczna synchronizacja napisów niezależna od języka",
-            "uk_UA": "Автоматична мовно-незалежна синхронізація субтитрів",
-            "ja_JP": "自動言語非依存字幕同期",
-            "ko_KR": "자동 언어 비의존적 자막 동기화",
-            "hi_IN": "स्वचालित भाषा-अज्ञेयवादी उपशीर्षक सिंक्रनाइज़ेशन",
-            "bn_BD": "স্বয়ংক্রিয় ভাষা-অজ্ঞেয়বাদী সাবটাইটেল সিঙ্ক্রোনাইজেশন",
-            "it_IT": "Sincronizzazione automatica dei sottotitoli indipendente dalla lingua",
-            "fr_FR": "Synchronisation automatique de sous-titres indépendante de la langue",
-            "de_DE": "Automatische sprachunabhängige Untertitelsynchronisation",
-            "pt_PT": "Sincronização automática de legendas independente de idioma",
-            "ar_SA": "مزامنة الترجمات التلقائية المستقلة عن اللغة",
-            "vi_VN": "Đồng bộ phụ đề tự động không phụ thuộc vào ngôn ngữ",
-            "fa_IR": "همگام‌سازی خودکار زیرنویس مستقل از زبان",
-            "id_ID": "Sinkronisasi subtitle otomatis yang tidak bergantung pada bahasa",
-            "ms_MY": "Segerak sarikata automatik yang tidak bergantung pada bahasa",
-            "th_TH": "การซิงค์คำบรรยายอัตโนมัติที่ไม่ขึ้นกับภาษา",
-            "ur_PK": "خودکار زبان سے آزاد سب ٹائٹل سنکرونائزیشن",
-            "zh_TW": "自動語言無關字幕同步",
-        },
-        "github": "https://github.com/kaegi/alass",
-        "documentation": "https://github.com/kaegi/alass/blob/master/documentation/slides.pdf",
-        "supported_formats": [".srt", ".ass", ".ssa", ".sub", ".idx"],
-        "supports_subtitle_as_reference": True,
-        "type": "executable",
-        "executable": {
-            "Windows": get_resource_path(
-                "autosubsyncapp.resources.alass-bin", "alass-cli.exe"
-            ),
-            "Linux": get_resource_path(
-                "autosubsyncapp.resources.alass-bin", "alass-linux64"
-            ),
-            "Darwin": "alass-cli",
-        },
-        "cmd_structure": ["{reference}", "{subtitle}", "{output}"],
-        "options": {
-            "check_video_for_subtitles": {
-                "type": "checkbox",
-                "label": {
-                    "en_US": "Use embedded subtitles in video",
-                    "es_ES": "Usar subtítulos incrustados en el vídeo",
-                    "tr_TR": "Videodaki gömülü altyazıları kullan",
-                    "zh_CN": "使用视频中的内嵌字幕",
-                    "ru_RU": "Использовать встроенные субтитры в видео",
-                    "pl_PL": "Użyj osadzonych napisów w wideo",
-                    "uk_UA": "Використовувати вбудовані субтитри у відео",
-                    "ja_JP": "ビデオ内の埋め込み字幕を使用",
-                    "ko_KR": "비디오에 내장된 자막 사용",
-                    "hi_IN": "वीडियो में एम्बेडेड उपशीर्षक का उपयोग करें",
-                    "bn_BD": "ভিডিওতে এম্বেড করা সাবটাইটেল ব্যবহার করুন",
-                    "it_IT": "Usa i sottotitoli incorporati nel video",
-                    "fr_FR": "Utiliser les sous-titres intégrés dans la vidéo",
-                    "de_DE": "Eingebettete Untertitel im Video verwenden",
-                    "pt_PT": "Usar legendas incorporadas no vídeo",
-                    "ar_SA": "استخدم الترجمات المضمنة في الفيديو",
-                    "vi_VN": "Sử dụng phụ đề nhúng trong video",
-                    "fa_IR": "استفاده از زیرنویس‌های جاسازی‌شده در ویدیو",
-                    "id_ID": "Gunakan subtitle tertanam di video",
-                    "ms_MY": "Guna sarikata terbenam dalam video",
-                    "th_TH": "ใช้คำบรรยายที่ฝังในวิดีโอ",
-                    "ur_PK": "ویڈیو میں ایمبیڈڈ سب ٹائٹلز استعمال کریں",
-                    "zh_TW": "使用影片中的內嵌字幕",
-                },
-                "tooltip": {
-                    "en_US": "Extract the embedded subtitles in the video and perform synchronization with these subtitles.",
-                    "es_ES": "Extrae los subtítulos incrustados en el vídeo y realiza la sincronización con estos subtítulos.",
-                    "tr_TR": "Videodaki gömülü altyazıları çıkarır ve bu altyazılarla senkronizasyon yapar.",
-                    "zh_CN": "提取视频中的内嵌字幕并与这些字幕进行同步。",
-                    "ru_RU": "Извлекает встроенные субтитры из видео и выполняет синхронизацию с ними.",
-                    "pl_PL": "Wyodrębnia osadzone napisy z wideo i synchronizuje z nimi.",
-                    "uk_UA": "Витягує вбудовані субтитри з відео та виконує синхронізацію з ними.",
-                    "ja_JP": "ビデオ内の埋め込み字幕を抽出し、それらの字幕と同期します。",
-                    "ko_KR": "비디오에 내장된 자막을 추출하고 해당 자막과 동기화합니다.",
-                    "hi_IN": "वीडियो में एम्बेडेड उपशीर्षकों को निकालें और उनके साथ सिंक्रनाइज़ करें।",
-                    "bn_BD": "ভিডিওতে এম্বেড করা সাবটাইটেল বের করুন এবং সেগুলোর সাথে সিঙ্ক করুন।",
-                    "it_IT": "Estrae i sottotitoli incorporati nel video ed esegue la sincronizzazione con questi sottotitoli.",
-                    "fr_FR": "Extrait les sous-titres intégrés dans la vidéo et effectue la synchronisation avec ces sous-titres.",
-                    "de_DE": "Extrahiert die eingebetteten Untertitel aus dem Video und synchronisiert mit diesen Untertiteln.",
-                    "pt_PT": "Extrai as legendas incorporadas no vídeo e sincroniza com essas legendas.",
-                    "ar_SA": "يستخرج الترجمات المضمنة في الفيديو ويقوم بمزامنتها مع هذه الترجمات.",
-                    "vi_VN": "Trích xuất phụ đề nhúng trong video và đồng bộ hóa với các phụ đề này.",
-                    "fa_IR": "زیرنویس‌های جاسازی‌شده در ویدیو را استخراج کرده و با آن‌ها همگام‌سازی می‌کند.",
-                    "id_ID": "Ekstrak subtitle tertanam di video dan lakukan sinkronisasi dengan subtitle tersebut.",
-                    "ms_MY": "Ekstrak sarikata terbenam dalam video dan lakukan penyegerakan dengan sarikata tersebut.",
-                    "th_TH": "แยกคำบรรยายที่ฝังในวิดีโอและซิงค์กับคำบรรยายนั้น",
-                    "ur_PK": "ویڈیو میں ایمبیڈڈ سب ٹائٹلز نکالیں اور ان کے ساتھ سنکرونائز کریں۔",
-                    "zh_TW": "提取影片中的內嵌字幕並與這些字幕進行同步。",
-                },
-                "default": True,
+        "autosubsync": {
+            "version": get_version_info("autosubsync"),
+            "description": {
+                "en_US": "Automatically synchronize subtitles with audio using machine learning",
+                "es_ES": "Sincroniza automáticamente subtítulos con audio usando aprendizaje automático",
+                "tr_TR": "Makine öğrenmesi kullanarak altyazıları sesle otomatik olarak senkronize edin",
+                "zh_CN": "使用机器学习自动将字幕与音频同步",
+                "ru_RU": "Автоматически синхронизируйте субтитры с аудио с помощью машинного обучения",
+                "pl_PL": "Automatycznie synchronizuj napisy z dźwiękiem za pomocą uczenia maszynowego",
+                "uk_UA": "Автоматично синхронізуйте субтитри з аудіо за допомогою машинного навчання",
+                "ja_JP": "機械学習を使用して字幕を音声と自動的に同期します",
+                "ko_KR": "머신러닝을 사용하여 자막을 오디오와 자동으로 동기화합니다",
+                "hi_IN": "मशीन लर्निंग का उपयोग करके स्वचालित रूप से ऑडियो के साथ उपशीर्षक सिंक्रनाइज़ करें",
+                "bn_BD": "মেশিন লার্নিং ব্যবহার করে স্বয়ংক্রিয়ভাবে অডিওর সাথে সাবটাইটেল সিঙ্ক করুন",
+                "it_IT": "Sincronizza automaticamente i sottotitoli con l'audio utilizzando l'apprendimento automatico",
+                "fr_FR": "Synchronisez automatiquement les sous-titres avec l'audio en utilisant l'apprentissage automatique",
+                "de_DE": "Synchronisieren Sie Untertitel automatisch mit Audio mithilfe von maschinellem Lernen",
+                "pt_PT": "Sincronize automaticamente legendas com áudio usando aprendizado de máquina",
+                "ar_SA": "قم بمزامنة الترجمات مع الصوت تلقائيًا باستخدام التعلم الآلي",
+                "vi_VN": "Tự động đồng bộ phụ đề với âm thanh bằng cách sử dụng máy học",
+                "fa_IR": "با استفاده از یادگیری ماشین، زیرنویس‌ها را به طور خودکار با صدا همگام‌سازی کنید",
+                "id_ID": "Sinkronkan subtitle dengan audio secara otomatis menggunakan pembelajaran mesin",
+                "ms_MY": "Segerakkan sarikata dengan audio secara automatik menggunakan pembelajaran mesin",
+                "th_TH": "ซิงค์คำบรรยายกับเสียงโดยอัตโนมัติโดยใช้การเรียนรู้ของเครื่อง",
+                "ur_PK": "مشین لرننگ کا استعمال کرتے ہوئے خودکار طور پر آڈیو کے ساتھ سب ٹائٹلز کو سنکرونائز کریں",
+                "zh_TW": "使用機器學習自動將字幕與音訊同步",
             },
-            "disable_fps_guessing": {
-                "type": "checkbox",
-                "label": {
-                    "en_US": "Disable FPS guessing",
-                    "es_ES": "Desactivar estimación de FPS",
-                    "tr_TR": "FPS tahmini devre dışı bırak",
-                    "zh_CN": "禁用帧率猜测",
-                    "ru_RU": "Отключить угадывание FPS",
-                    "pl_PL": "Wyłącz zgadywanie FPS",
-                    "uk_UA": "Вимкнути вгадування FPS",
-                    "ja_JP": "FPS推測を無効にする",
-                    "ko_KR": "FPS 추측 비활성화",
-                    "hi_IN": "FPS अनुमान अक्षम करें",
-                    "bn_BD": "FPS অনুমান নিষ্ক্রিয় করুন",
-                    "it_IT": "Disabilita previsione FPS",
-                    "fr_FR": "Désactiver l'estimation des FPS",
-                    "de_DE": "FPS-Schätzung deaktivieren",
-                    "pt_PT": "Desativar suposição de FPS",
-                    "ar_SA": "تعطيل تخمين معدل الإطارات",
-                    "vi_VN": "Tắt đoán tốc độ khung hình",
-                    "fa_IR": "غیرفعال کردن حدس FPS",
-                    "id_ID": "Nonaktifkan penebakan FPS",
-                    "ms_MY": "Lumpuhkan tekaan FPS",
-                    "th_TH": "ปิดการคาดเดาอัตราเฟรม",
-                    "ur_PK": "FPS اندازہ غیر فعال کریں",
-                    "zh_TW": "停用 FPS 猜測",
+            "github": "https://github.com/oseiskar/autosubsync",
+            "documentation": "https://github.com/oseiskar/autosubsync?tab=readme-ov-file#usage",
+            "supported_formats": [".srt"],
+            "supports_subtitle_as_reference": False,
+            "type": "module",
+            "module": "call_autosubsync",
+            "cmd_structure": ["{reference}", "{subtitle}", "{output}"],
+            "options": {
+                "spacer1": {
+                    "type": "spacer",
+                    "value": 2,
                 },
-                "tooltip": {
-                    "en_US": "Disables guessing and correcting of framerate differences between reference file and input file.",
-                    "es_ES": "Desactiva la estimación y corrección de diferencias en la velocidad de fotogramas entre el archivo de referencia y el archivo de entrada.",
-                    "tr_TR": "Referans dosya ve girdi dosyası arasındaki kare hızı farklılıklarının tahmin edilmesini ve düzeltilmesini devre dışı bırakır.",
-                    "zh_CN": "禁用猜测和校正参考文件和输入文件之间的帧率差异。",
-                    "ru_RU": "Отключает угадывание и исправление различий частоты кадров между эталонным файлом и входным файлом.",
-                    "pl_PL": "Wyłącza zgadywanie i korygowanie różnic w liczbie klatek na sekundę między plikiem referencyjnym a plikiem wejściowym.",
-                    "uk_UA": "Вимикає вгадування та виправлення відмінностей частоти кадрів між еталонним файлом і вхідним файлом.",
-                    "ja_JP": "参照ファイルと入力ファイル間のフレームレートの違いの推測と修正を無効にします。",
-                    "ko_KR": "참조 파일과 입력 파일 간의 프레임 레이트 차이를 추측하고 수정하는 기능을 비활성화합니다.",
-                    "hi_IN": "संदर्भ फ़ाइल और इनपुट फ़ाइल के बीच फ्रेमरेट अंतर का अनुमान और सुधार अक्षम करता है।",
-                    "bn_BD": "রেফারেন্স ফাইল এবং ইনপুট ফাইলের মধ্যে ফ্রেমরেট পার্থক্যের অনুমান এবং সংশোধন নিষ্ক্রিয় করে।",
-                    "it_IT": "Disabilita la previsione e la correzione delle differenze di framerate tra il file di riferimento e il file di input.",
-                    "fr_FR": "Désactive l'estimation et la correction des différences de fréquence d'images entre le fichier de référence et le fichier d'entrée.",
-                    "de_DE": "Deaktiviert das Erraten und Korrigieren von Bildfrequenzunterschieden zwischen Referenzdatei und Eingabedatei.",
-                    "pt_PT": "Desativa a suposição e correção de diferenças de taxa de quadros entre o ficheiro de referência e o ficheiro de entrada.",
-                    "ar_SA": "يعطل تخمين وتصحيح اختلافات معدل الإطارات بين ملف المرجع وملف الإدخال.",
-                    "vi_VN": "Tắt đoán và sửa sự khác biệt tốc độ khung hình giữa tệp tham chiếu và tệp đầu vào.",
-                    "fa_IR": "حدس زدن و تصحیح تفاوت‌های نرخ فریم بین فایل مرجع و فایل ورودی را غیرفعال می‌کند.",
-                    "id_ID": "Menonaktifkan penebakan dan koreksi perbedaan framerate antara file referensi dan file input.",
-                    "ms_MY": "Melumpuhkan tekaan dan pembetulan perbezaan kadar bingkai antara fail rujukan dan fail input.",
-                    "th_TH": "ปิดการคาดเดาและการแก้ไขความแตกต่างของอัตราเฟรมระหว่างไฟล์อ้างอิงและไฟล์อินพุต",
-                    "ur_PK": "حوالہ فائل اور ان پٹ فائل کے درمیان فریم ریٹ کے فرق کا اندازہ لگانا اور درست کرنا غیر فعال کرتا ہے۔",
-                    "zh_TW": "停用參考檔和輸入檔之間幀率差異的猜測和修正。",
-                },
-                "argument": "--disable-fps-guessing",
-                "default": False,
-            },
-            "disable_speed_optimization": {
-                "type": "checkbox",
-                "label": {
-                    "en_US": "Disable speed optimization",
-                    "es_ES": "Desactivar optimización de velocidad",
-                    "tr_TR": "Hız optimizasyonunu devre dışı bırak",
-                    "zh_CN": "禁用速度优化",
-                    "ru_RU": "Отключить оптимизацию скорости",
-                    "pl_PL": "Wyłącz optymalizację prędkości",
-                    "uk_UA": "Вимкнути оптимізацію швидкості",
-                    "ja_JP": "速度最適化を無効にする",
-                    "ko_KR": "속도 최적화 비활성화",
-                    "hi_IN": "गति अनुकूलन अक्षम करें",
-                    "bn_BD": "গতি অপ্টিমাইজেশন নিষ্ক্রিয় করুন",
-                    "it_IT": "Disabilita ottimizzazione velocità",
-                    "fr_FR": "Désactiver l'optimisation de la vitesse",
-                    "de_DE": "Geschwindigkeitsoptimierung deaktivieren",
-                    "pt_PT": "Desativar otimização de velocidade",
-                    "ar_SA": "تعطيل تحسين السرعة",
-                    "vi_VN": "Tắt tối ưu hóa tốc độ",
-                    "fa_IR": "غیرفعال کردن بهینه‌سازی سرعت",
-                    "id_ID": "Nonaktifkan optimasi kecepatan",
-                    "ms_MY": "Lumpuhkan pengoptimuman kelajuan",
-                    "th_TH": "ปิดการเพิ่มประสิทธิภาพความเร็ว",
-                    "ur_PK": "رفتار کی بہتری غیر فعال کریں",
-                    "zh_TW": "停用速度最佳化",
+                "check_video_for_subtitles": {
+                    "type": "checkbox",
+                    "label": {
+                        "en_US": "Use embedded subtitles in video",
+                        "es_ES": "Usar subtítulos incrustados en el vídeo",
+                        "tr_TR": "Videodaki gömülü altyazıları kullan",
+                        "zh_CN": "使用视频中的内嵌字幕",
+                        "ru_RU": "Использовать встроенные субтитры в видео",
+                        "pl_PL": "Użyj osadzonych napisów w wideo",
+                        "uk_UA": "Використовувати вбудовані субтитри у відео",
+                        "ja_JP": "ビデオ内の埋め込み字幕を使用",
+                        "ko_KR": "비디오에 내장된 자막 사용",
+                        "hi_IN": "वीडियो में एम्बेडेड उपशीर्षक का उपयोग करें",
+                        "bn_BD": "ভিডিওতে এম্বেড করা সাবটাইটেল ব্যবহার করুন",
+                        "it_IT": "Usa i sottotitoli incorporati nel video",
+                        "fr_FR": "Utiliser les sous-titres intégrés dans la vidéo",
+                        "de_DE": "Eingebettete Untertitel im Video verwenden",
+                        "pt_PT": "Usar legendas incorporadas no vídeo",
+                        "ar_SA": "استخدم الترجمات المضمنة في الفيديو",
+                        "vi_VN": "Sử dụng phụ đề nhúng trong video",
+                        "fa_IR": "استفاده از زیرنویس‌های جاسازی‌شده در ویدیو",
+                        "id_ID": "Gunakan subtitle tertanam di video",
+                        "ms_MY": "Guna sarikata terbenam dalam video",
+                        "th_TH": "ใช้คำบรรยายที่ฝังในวิดีโอ",
+                        "ur_PK": "ویڈیو میں ایمبیڈڈ سب ٹائٹلز استعمال کریں",
+                        "zh_TW": "使用影片中的內嵌字幕",
+                    },
+                    "tooltip": {
+                        "en_US": "Extract the embedded subtitles in the video and perform synchronization with these subtitles.",
+                        "es_ES": "Extrae los subtítulos incrustados en el vídeo y realiza la sincronización con estos subtítulos.",
+                        "tr_TR": "Videodaki gömülü altyazıları çıkarır ve bu altyazılarla senkronizasyon yapar.",
+                        "zh_CN": "提取视频中的内嵌字幕并与这些字幕进行同步。",
+                        "ru_RU": "Извлекает встроенные субтитры из видео и выполняет синхронизацию с ними.",
+                        "pl_PL": "Wyodrębnia osadzone napisy z wideo i synchronizuje z nimi.",
+                        "uk_UA": "Витягує вбудовані субтитри з відео та виконує синхронізацію з ними.",
+                        "ja_JP": "ビデオ内の埋め込み字幕を抽出し、それらの字幕と同期します。",
+                        "ko_KR": "비디오에 내장된 자막을 추출하고 해당 자막과 동기화합니다.",
+                        "hi_IN": "वीडियो में एम्बेडेड उपशीर्षकों को निकालें और उनके साथ सिंक्रनाइज़ करें।",
+                        "bn_BD": "ভিডিওতে এম্বেড করা সাবটাইটেল বের করুন এবং সেগুলোর সাথে সিঙ্ক করুন।",
+                        "it_IT": "Estrae i sottotitoli incorporati nel video ed esegue la sincronizzazione con questi sottotitoli.",
+                        "fr_FR": "Extrait les sous-titres intégrés dans la vidéo et effectue la synchronisation avec ces sous-titres.",
+                        "de_DE": "Extrahiert die eingebetteten Untertitel aus dem Video und synchronisiert mit diesen Untertiteln.",
+                        "pt_PT": "Extrai as legendas incorporadas no vídeo e sincroniza com essas legendas.",
+                        "ar_SA": "يستخرج الترجمات المضمنة في الفيديو ويقوم بمزامنتها مع هذه الترجمات.",
+                        "vi_VN": "Trích xuất phụ đề nhúng trong video và đồng bộ hóa với các phụ đề này.",
+                        "fa_IR": "زیرنویس‌های جاسازی‌شده در ویدیو را استخراج کرده و با آن‌ها همگام‌سازی می‌کند.",
+                        "id_ID": "Ekstrak subtitle tertanam di video dan lakukan sinkronisasi dengan subtitle tersebut.",
+                        "ms_MY": "Ekstrak sarikata terbenam dalam video dan lakukan penyegerakan dengan sarikata tersebut.",
+                        "th_TH": "แยกคำบรรยายที่ฝังในวิดีโอและซิงค์กับคำบรรยายนั้น",
+                        "ur_PK": "ویڈیو میں ایمبیڈڈ سب ٹائٹلز نکالیں اور ان کے ساتھ سنکرونائز کریں۔",
+                        "zh_TW": "提取影片中的內嵌字幕並與這些字幕進行同步。",
+                    },
+                    "default": True,
                 },
-                "tooltip": {
-                    "en_US": "Disable speed optimization for better accuracy. This will increase the processing time.",
-                    "es_ES": "Desactiva la optimización de velocidad para mejorar la precisión. Esto aumentará el tiempo de procesamiento.",
-                    "tr_TR": "Daha iyi doğruluk için hız optimizasyonunu devre dışı bırakın. Bu, işlem süresini artıracaktır.",
-                    "zh_CN": "禁用速度优化以提高准确性。这将增加处理时间。",
-                    "ru_RU": "Отключите оптимизацию скорости для лучшей точности. Это увеличит время обработки.",
-                    "pl_PL": "Wyłącz optymalizację prędkości dla lepszej dokładności. Wydłuży to czas przetwarzania.",
-                    "uk_UA": "Вимкніть оптимізацію швидкості для кращої точності. Це збільшить час обробки.",
-                    "ja_JP": "精度を向上させるために速度最適化を無効にします。これにより処理時間が長くなります。",
-                    "ko_KR": "더 나은 정확도를 위해 속도 최적화를 비활성화합니다. 이렇게 하면 처리 시간이 증가합니다.",
-                    "hi_IN": "बेहतर सटीकता के लिए गति अनुकूलन अक्षम करें। यह प्रसंस्करण समय बढ़ा देगा।",
-                    "bn_BD": "আরো ভাল নির্ভুলতার জন্য গতি অপ্টিমাইজেশন নিষ্ক্রিয় করুন। এটি প্রক্রিয়াকরণের সময় বাড়িয়ে দেবে।",
-                    "it_IT": "Disabilita l'ottimizzazione della velocità per una maggiore precisione. Questo aumenterà il tempo di elaborazione.",
-                    "fr_FR": "Désactivez l'optimisation de la vitesse pour une meilleure précision. Cela augmentera le temps de traitement.",
-                    "de_DE": "Deaktivieren Sie die Geschwindigkeitsoptimierung für eine bessere Genauigkeit. Dies erhöht die Verarbeitungszeit.",
-                    "pt_PT": "Desative a otimização de velocidade para obter melhor precisão. Isto aumentará o tempo de processamento.",
-                    "ar_SA": "قم بتعطيل تحسين السرعة للحصول على دقة أفضل. سيؤدي هذا إلى زيادة وقت المعالجة.",
-                    "vi_VN": "Tắt tối ưu hóa tốc độ để có độ chính xác tốt hơn. Điều này sẽ làm tăng thời gian xử lý.",
-                    "fa_IR": "بهینه‌سازی سرعت را برای دقت بهتر غیرفعال کنید. این زمان پردازش را افزایش می‌دهد.",
-                    "id_ID": "Nonaktifkan optimasi kecepatan untuk akurasi yang lebih baik. Ini akan meningkatkan waktu pemrosesan.",
-                    "ms_MY": "Lumpuhkan pengoptimuman kelajuan untuk ketepatan yang lebih baik. Ini akan meningkatkan masa pemprosesan.",
-                    "th_TH": "ปิดการเพิ่มประสิทธิภาพความเร็วเพื่อความแม่นยำที่ดีขึ้น ซึ่งจะเพิ่มเวลาการประมวลผล",
-                    "ur_PK": "بہتر درستگی کے لیے رفتار کی بہتری کو غیر فعال کریں۔ یہ پروسیسنگ کا وقت بڑھا دے گا۔",
-                    "zh_TW": "停用速度最佳化以獲得更好的準確性。這將增加處理時間。",
+                "spacer2": {
+                    "type": "spacer",
+                    "value": 9,
                 },
-                "argument": "--speed-optimization=0",
-                "default": False,
-            },
-            "split_penalty": {
-                "type": "slider",
-                "label": {
-                    "en_US": "Split penalty",
-                    "es_ES": "Penalización por división",
-                    "tr_TR": "Bölme cezası",
-                    "zh_CN": "分割惩罚",
-                    "ru_RU": "Штраф за разделение",
-                    "pl_PL": "Kara za podział",
-                    "uk_UA": "Штраф за розділення",
-                    "ja_JP": "分割ペナルティ",
-                    "ko_KR": "분할 패널티",
-                    "hi_IN": "विभाजन दंड",
-                    "bn_BD": "স্প্লিট পেনাল্টি",
-                    "it_IT": "Penalità di divisione",
-                    "fr_FR": "Pénalité de division",
-                    "de_DE": "Teilungsstrafe",
-                    "pt_PT": "Penalidade de divisão",
-                    "ar_SA": "عقوبة التقسيم",
-                    "vi_VN": "Phạt phân tách",
-                    "fa_IR": "جریمه تقسیم",
-                    "id_ID": "Penalti pemisahan",
-                    "ms_MY": "Penalti pemisahan",
-                    "th_TH": "บทลงโทษการแบ่ง",
-                    "ur_PK": "تقسیم کی سزا",
-                    "zh_TW": "分割懲罰",
+                "max_shift_secs": {
+                    "type": "slider",
+                    "label": {
+                        "en_US": "Maximum shift (seconds)",
+                        "es_ES": "Desplazamiento máximo (segundos)",
+                        "tr_TR": "Maksimum kaydırma (saniye)",
+                        "zh_CN": "最大位移（秒）",
+                        "ru_RU": "Максимальный сдвиг (секунды)",
+                        "pl_PL": "Maksymalne przesunięcie (sekundy)",
+                        "uk_UA": "Максимальний зсув (секунди)",
+                        "ja_JP": "最大シフト（秒）",
+                        "ko_KR": "최대 이동 (초)",
+                        "hi_IN": "अधिकतम शिफ्ट (सेकंड)",
+                        "bn_BD": "সর্বাধিক শিফট (সেকেন্ড)",
+                        "it_IT": "Spostamento massimo (secondi)",
+                        "fr_FR": "Décalage maximum (secondes)",
+                        "de_DE": "Maximale Verschiebung (Sekunden)",
+                        "pt_PT": "Deslocamento máximo (segundos)",
+                        "ar_SA": "الإزاحة القصوى (ثواني)",
+                        "vi_VN": "Dịch chuyển tối đa (giây)",
+                        "fa_IR": "حداکثر جابجایی (ثانیه)",
+                        "id_ID": "Pergeseran maksimum (detik)",
+                        "ms_MY": "Anjakan maksimum (saat)",
+                        "th_TH": "การเลื่อนสูงสุด (วินาที)",
+                        "ur_PK": "زیادہ سے زیادہ شفٹ (سیکنڈز)",
+                        "zh_TW": "最大偏移（秒）",
+                    },
+                    "tooltip": {
+                        "en_US": "Maximum subtitle shift in seconds (default 20)",
+                        "es_ES": "Desplazamiento máximo de subtítulos en segundos (predeterminado 20)",
+                        "tr_TR": "Saniye cinsinden maksimum altyazı kaydırma (varsayılan 20)",
+                        "zh_CN": "字幕最大位移秒数（默认20）",
+                        "ru_RU": "Максимальный сдвиг субтитров в секундах (по умолчанию 20)",
+                        "pl_PL": "Maksymalne przesunięcie napisów w sekundach (domyślnie 20)",
+                        "uk_UA": "Максимальний зсув субтитрів у секундах (за замовчуванням 20)",
+                        "ja_JP": "字幕の最大シフト秒数（デフォルト20）",
+                        "ko_KR": "초 단위의 최대 자막 이동 (기본값 20)",
+                        "hi_IN": "सेकंड में अधिकतम उपशीर्षक शिफ्ट (डिफ़ॉल्ट 20)",
+                        "bn_BD": "সেকেন্ডে সর্বাধিক সাবটাইটেল শিফট (ডিফল্ট 20)",
+                        "it_IT": "Spostamento massimo dei sottotitoli in secondi (predefinito 20)",
+                        "fr_FR": "Décalage maximum des sous-titres en secondes (par défaut 20)",
+                        "de_DE": "Maximale Untertitelverschiebung in Sekunden (Standard 20)",
+                        "pt_PT": "Deslocamento máximo de legendas em segundos (padrão 20)",
+                        "ar_SA": "الإزاحة القصوى للترجمات بالثواني (الافتراضي 20)",
+                        "vi_VN": "Dịch chuyển phụ đề tối đa tính bằng giây (mặc định 20)",
+                        "fa_IR": "حداکثر جابجایی زیرنویس به ثانیه (پیش‌فرض 20)",
+                        "id_ID": "Pergeseran maksimum subtitle dalam detik (default 20)",
+                        "ms_MY": "Anjakan maksimum sarikata dalam saat (lalai 20)",
+                        "th_TH": "การเลื่อนคำบรรยายสูงสุดเป็นวินาที (ค่าเริ่มต้น 20)",
+                        "ur_PK": "سیکنڈز میں زیادہ سے زیادہ سب ٹائٹل شفٹ (ڈیفالٹ 20)",
+                        "zh_TW": "字幕最大偏移秒數（預設 20）",
+                    },
+                    "argument": "--max_shift_secs",
+                    "range": [1, 120],
+                    "default": 20,
                 },
-                "argument": "--split-penalty",
-                "tooltip": {
-                    "en_US": "Penalty for splitting subtitles during alignment\n(Default: 7, Recommended: 5-20, No splits: -1)",
-                    "es_ES": "Penalización por dividir subtítulos durante la alineación\n(Predeterminado: 7, Recomendado: 5-20, Sin divisiones: -1)",
-                    "tr_TR": "Hizalama sırasında altyazıları bölme cezası\n(Varsayılan: 7, Önerilen: 5-20, Bölme yok: -1)",
-                    "zh_CN": "在对齐过程中分割字幕的惩罚值\n（默认：7，推荐：5-20，不分割：-1）",
-                    "ru_RU": "Штраф за разделение субтитров во время выравнивания\n(По умолчанию: 7, Рекомендуется: 5-20, Без разделения: -1)",
-                    "pl_PL": "Kara za dzielenie napisów podczas wyrównywania\n(Domyślnie: 7, Zalecane: 5-20, Brak podziałów: -1)",
-                    "uk_UA": "Штраф за розділення субтитрів під час вирівнювання\n(За замовчуванням: 7, Рекомендовано: 5-20, Без розділення: -1)",
-                    "ja_JP": "アライメント中に字幕を分割するためのペナルティ\n（デフォルト：7、推奨：5-20、分割なし：-1）",
-                    "ko_KR": "정렬 중 자막 분할에 대한 패널티\n(기본값: 7, 권장: 5-20, 분할 없음: -1)",
-                    "hi_IN": "संरेखण के दौरान उपशीर्षकों को विभाजित करने का दंड\n(डिफ़ॉल्ट: 7, अनुशंसित: 5-20, कोई विभाजन नहीं: -1)",
-                    "bn_BD": "অ্যালাইনমেন্ট চলাকালীন সাবটাইটেল বিভাজনের জন্য পেনাল্টি\n(ডিফল্ট: 7, প্রস্তাবিত: 5-20, বিভাজন নেই: -1)",
-                    "it_IT": "Penalità per la divisione dei sottotitoli durante l'allineamento\n(Predefinito: 7, Consigliato: 5-20, Nessuna divisione: -1)",
-                    "fr_FR": "Pénalité pour la division des sous-titres pendant l'alignement\n(Par défaut : 7, Recommandé : 5-20, Pas de divisions : -1)",
-                    "de_DE": "Strafe für die Teilung von Untertiteln während der Ausrichtung\n(Standard: 7, Empfohlen: 5-20, Keine Teilung: -1)",
-                    "pt_PT": "Penalidade por dividir legendas durante o alinhamento\n(Padrão: 7, Recomendado: 5-20, Sem divisões: -1)",
-                    "ar_SA": "عقوبة تقسيم الترجمات أثناء المحاذاة\n(افتراضي: 7، موصى به: 5-20، بدون تقسيم: -1)",
-                    "vi_VN": "Hình phạt cho việc phân tách phụ đề trong quá trình căn chỉnh\n(Mặc định: 7, Khuyến nghị: 5-20, Không phân tách: -1)",
-                    "fa_IR": "جریمه تقسیم زیرنویس‌ها در حین تراز کردن\n(پیش‌فرض: 7، پیشنهادی: 5-20، بدون تقسیم: -1)",
-                    "id_ID": "Penalti untuk memisahkan subtitle selama penyelarasan\n(Default: 7, Direkomendasikan: 5-20, Tanpa pemisahan: -1)",
-                    "ms_MY": "Penalti untuk memisahkan sarikata semasa penjajaran\n(Lalai: 7, Disyorkan: 5-20, Tiada pemisahan: -1)",
-                    "th_TH": "บทลงโทษสำหรับการแบ่งคำบรรยายระหว่างการปรับแนว\n(ค่าเริ่มต้น: 7, แนะนำ: 5-20, ไม่แบ่ง: -1)",
-                    "ur_PK": "ہم آہنگی کے دوران سب ٹائٹلز کو تقسیم کرنے کی سزا\n(ڈیفالٹ: 7، تجویز کردہ: 5-20، کوئی تقسیم نہیں: -1)",
-                    "zh_TW": "對齊期間分割字幕的懲罰\n（預設：7，建議：5-20，不分割：-1）",
+                "parallelism": {
+                    "type": "slider",
+                    "label": {
+                        "en_US": "Parallelism",
+                        "es_ES": "Paralelismo",
+                        "tr_TR": "Paralellik",
+                        "zh_CN": "并行度",
+                        "ru_RU": "Параллелизм",
+                        "pl_PL": "Równoległość",
+                        "uk_UA": "Паралелізм",
+                        "ja_JP": "並列処理",
+                        "ko_KR": "병렬 처리",
+                        "hi_IN": "समानांतरता",
+                        "bn_BD": "সমান্তরালতা",
+                        "it_IT": "Parallelismo",
+                        "fr_FR": "Parallélisme",
+                        "de_DE": "Parallelität",
+                        "pt_PT": "Paralelismo",
+                        "ar_SA": "التوازي",
+                        "vi_VN": "Xử lý song song",
+                        "fa_IR": "پردازش موازی",
+                        "id_ID": "Paralelisme",
+                        "ms_MY": "Keselarian",
+                        "th_TH": "การประมวลผลแบบขนาน",
+                        "ur_PK": "متوازی پن",
+                        "zh_TW": "平行處理",
+                    },
+                    "tooltip": {
+                        "en_US": "Number of parallel worker processes (default 3)",
+                        "es_ES": "Número de procesos de trabajo en paralelo (predeterminado 3)",
+                        "tr_TR": "Paralel çalışan işlem sayısı (varsayılan 3)",
+                        "zh_CN": "并行工作进程数量（默认3）",
+                        "ru_RU": "Количество параллельных рабочих процессов (по умолчанию 3)",
+                        "pl_PL": "Liczba równoległych procesów roboczych (domyślnie 3)",
+                        "uk_UA": "Кількість паралельних робочих процесів (за замовчуванням 3)",
+                        "ja_JP": "並列ワーカープロセスの数（デフォルト3）",
+                        "ko_KR": "병렬 작업자 프로세스 수 (기본값 3)",
+                        "hi_IN": "समानांतर कार्यकर्ता प्रक्रियाओं की संख्या (डिफ़ॉल्ट 3)",
+                        "bn_BD": "সমান্তরাল ওয়ার্কার প্রসেসের সংখ্যা (ডিফল্ট 3)",
+                        "it_IT": "Numero di processi lavoratori paralleli (predefinito 3)",
+                        "fr_FR": "Nombre de processus de travail parallèles (par défaut 3)",
+                        "de_DE": "Anzahl der parallelen Arbeitsprozesse (Standard 3)",
+                        "pt_PT": "Número de processos de trabalho paralelos (padrão 3)",
+                        "ar_SA": "عدد عمليات العمل المتوازية (الافتراضي 3)",
+                        "vi_VN": "Số lượng quy trình công việc song song (mặc định 3)",
+                        "fa_IR": "تعداد فرآیندهای کارگر موازی (پیش‌فرض 3)",
+                        "id_ID": "Jumlah proses pekerja paralel (default 3)",
+                        "ms_MY": "Bilangan proses pekerja selari (lalai 3)",
+                        "th_TH": "จำนวนกระบวนการทำงานแบบขนาน (ค่าเริ่มต้น 3)",
+                        "ur_PK": "متوازی ورکر پروسیسز کی تعداد (ڈیفالٹ 3)",
+                        "zh_TW": "平行工作程序的數量（預設 3）",
+                    },
+                    "argument": "--parallelism",
+                    "range": [1, 16],
+                    "default": 3,
                 },
-                "no_split_argument": "--no-split",
-                "range": [-1, 100],
-                "default": 7,
             },
         },
-    },
-    "autosubsync": {
-        "version": get_version_info("autosubsync"),
-        "description": {
-            "en_US": "Automatically synchronize subtitles with audio using machine learning",
-            "es_ES": "Sincroniza automáticamente subtítulos con audio usando aprendizaje automático",
-            "tr_TR": "Makine öğrenmesi kullanarak altyazıları sesle otomatik olarak senkronize edin",
-            "zh_CN": "使用机器学习自动将字幕与音频同步",
-            "ru_RU": "Автоматически синхронизируйте субтитры с аудио с помощью машинного обучения",
-            "pl_PL": "Automatycznie synchronizuj napisy z dźwiękiem za pomocą uczenia maszynowego",
-            "uk_UA": "Автоматично синхронізуйте субтитри з аудіо за допомогою машинного навчання",
-            "ja_JP": "機械学習を使用して字幕を音声と自動的に同期します",
-            "ko_KR": "머신러닝을 사용하여 자막을 오디오와 자동으로 동기화합니다",
-            "hi_IN": "मशीन लर्निंग का उपयोग करके स्वचालित रूप से ऑडियो के साथ उपशीर्षक सिंक्रनाइज़ करें",
-            "bn_BD": "মেশিন লার্নিং ব্যবহার করে স্বয়ংক্রিয়ভাবে অডিওর সাথে সাবটাইটেল সিঙ্ক করুন",
-            "it_IT": "Sincronizza automaticamente i sottotitoli con l'audio utilizzando l'apprendimento automatico",
-            "fr_FR": "Synchronisez automatiquement les sous-titres avec l'audio en utilisant l'apprentissage automatique",
-            "de_DE": "Synchronisieren Sie Untertitel automatisch mit Audio mithilfe von maschinellem Lernen",
-            "pt_PT": "Sincronize automaticamente legendas com áudio usando aprendizado de máquina",
-            "ar_SA": "قم بمزامنة الترجمات مع الصوت تلقائيًا باستخدام التعلم الآلي",
-            "vi_VN": "Tự động đồng bộ phụ đề với âm thanh bằng cách sử dụng máy học",
-            "fa_IR": "با استفاده از یادگیری ماشین، زیرنویس‌ها را به طور خودکار با صدا همگام‌سازی کنید",
-            "id_ID": "Sinkronkan subtitle dengan audio secara otomatis menggunakan pembelajaran mesin",
-            "ms_MY": "Segerakkan sarikata dengan audio secara automatik menggunakan pembelajaran mesin",
-            "th_TH": "ซิงค์คำบรรยายกับเสียงโดยอัตโนมัติโดยใช้การเรียนรู้ของเครื่อง",
-            "ur_PK": "مشین لرننگ کا استعمال کرتے ہوئے خودکار طور پر آڈیو کے ساتھ سب ٹائٹلز کو سنکرونائز کریں",
-            "zh_TW": "使用機器學習自動將字幕與音訊同步",
-        },
-        "github": "https://github.com/oseiskar/autosubsync",
-        "documentation": "https://github.com/oseiskar/autosubsync?tab=readme-ov-file#usage",
-        "supported_formats": [".srt"],
-        "supports_subtitle_as_reference": False,
-        "type": "module",
-        "module": "call_autosubsync",
-        "cmd_structure": ["{reference}", "{subtitle}", "{output}"],
-        "options": {
-            "spacer1": {
-                "type": "spacer",
-                "value": 2,
-            },
-            "check_video_for_subtitles": {
-                "type": "checkbox",
-                "label": {
-                    "en_US": "Use embedded subtitles in video",
-                    "es_ES": "Usar subtítulos incrustados en el vídeo",
-                    "tr_TR": "Videodaki gömülü altyazıları kullan",
-                    "zh_CN": "使用视频中的内嵌字幕",
-                    "ru_RU": "Использовать встроенные субтитры в видео",
-                    "pl_PL": "Użyj osadzonych napisów w wideo",
-                    "uk_UA": "Використовувати вбудовані субтитри у відео",
-                    "ja_JP": "ビデオ内の埋め込み字幕を使用",
-                    "ko_KR": "비디오에 내장된 자막 사용",
-                    "hi_IN": "वीडियो में एम्बेडेड उपशीर्षक का उपयोग करें",
-                    "bn_BD": "ভিডিওতে এম্বেড করা সাবটাইটেল ব্যবহার করুন",
-                    "it_IT": "Usa i sottotitoli incorporati nel video",
-                    "fr_FR": "Utiliser les sous-titres intégrés dans la vidéo",
-                    "de_DE": "Eingebettete Untertitel im Video verwenden",
-                    "pt_PT": "Usar legendas incorporadas no vídeo",
-                    "ar_SA": "استخدم الترجمات المضمنة في الفيديو",
-                    "vi_VN": "Sử dụng phụ đề nhúng trong video",
-                    "fa_IR": "استفاده از زیرنویس‌های جاسازی‌شده در ویدیو",
-                    "id_ID": "Gunakan subtitle tertanam di video",
-                    "ms_MY": "Guna sarikata terbenam dalam video",
-                    "th_TH": "ใช้คำบรรยายที่ฝังในวิดีโอ",
-                    "ur_PK": "ویڈیو میں ایمبیڈڈ سب ٹائٹلز استعمال کریں",
-                    "zh_TW": "使用影片中的內嵌字幕",
-                },
-                "tooltip": {
-                    "en_US": "Extract the embedded subtitles in the video and perform synchronization with these subtitles.",
-                    "es_ES": "Extrae los subtítulos incrustados en el vídeo y realiza la sincronización con estos subtítulos.",
-                    "tr_TR": "Videodaki gömülü altyazıları çıkarır ve bu altyazılarla senkronizasyon yapar.",
-                    "zh_CN": "提取视频中的内嵌字幕并与这些字幕进行同步。",
-                    "ru_RU": "Извлекает встроенные субтитры из видео и выполняет синхронизацию с ними.",
-                    "pl_PL": "Wyodrębnia osadzone napisy z wideo i synchronizuje z nimi.",
-                    "uk_UA": "Витягує вбудовані субтитри з відео та виконує синхронізацію з ними.",
-                    "ja_JP": "ビデオ内の埋め込み字幕を抽出し、それらの字幕と同期します。",
-                    "ko_KR": "비디오에 내장된 자막을 추출하고 해당 자막과 동기화합니다.",
-                    "hi_IN": "वीडियो में एम्बेडेड उपशीर्षकों को निकालें और उनके साथ सिंक्रनाइज़ करें।",
-                    "bn_BD": "ভিডিওতে এম্বেড করা সাবটাইটেল বের করুন এবং সেগুলোর সাথে সিঙ্ক করুন।",
-                    "it_IT": "Estrae i sottotitoli incorporati nel video ed esegue la sincronizzazione con questi sottotitoli.",
-                    "fr_FR": "Extrait les sous-titres intégrés dans la vidéo et effectue la synchronisation avec ces sous-titres.",
-                    "de_DE": "Extrahiert die eingebetteten Untertitel aus dem Video und synchronisiert mit diesen Untertiteln.",
-                    "pt_PT": "Extrai as legendas incorporadas no vídeo e sincroniza com essas legendas.",
-                    "ar_SA": "يستخرج الترجمات المضمنة في الفيديو ويقوم بمزامنتها مع هذه الترجمات.",
-                    "vi_VN": "Trích xuất phụ đề nhúng trong video và đồng bộ hóa với các phụ đề này.",
-                    "fa_IR": "زیرنویس‌های جاسازی‌شده در ویدیو را استخراج کرده و با آن‌ها همگام‌سازی می‌کند.",
-                    "id_ID": "Ekstrak subtitle tertanam di video dan lakukan sinkronisasi dengan subtitle tersebut.",
-                    "ms_MY": "Ekstrak sarikata terbenam dalam video dan lakukan penyegerakan dengan sarikata tersebut.",
-                    "th_TH": "แยกคำบรรยายที่ฝังในวิดีโอและซิงค์กับคำบรรยายนั้น",
-                    "ur_PK": "ویڈیو میں ایمبیڈڈ سب ٹائٹلز نکالیں اور ان کے ساتھ سنکرونائز کریں۔",
-                    "zh_TW": "提取影片中的內嵌字幕並與這些字幕進行同步。",
-                },
-                "default": True,
+        "fftalign": {
+            "version": _lazy("VERSION"),
+            "description": {
+                "en_US": "Fast built-in aligner for subtitle references using FFT cross-correlation",
+                "es_ES": "Alineador integrado rápido para referencias de subtítulos mediante correlación cruzada FFT",
+                "tr_TR": "FFT çapraz korelasyonu kullanan, altyazı referansları için hızlı yerleşik hizalayıcı",
+                "zh_CN": "使用 FFT 互相关的快速内置字幕参考对齐器",
+                "ru_RU": "Быстрый встроенный выравниватель для эталонных субтитров на основе взаимной корреляции FFT",
+                "pl_PL": "Szybkie wbudowane wyrównywanie do napisów referencyjnych z użyciem korelacji wzajemnej FFT",
+                "uk_UA": "Швидкий вбудований вирівнювач для еталонних субтитрів на основі взаємної кореляції FFT",
+                "ja_JP": "FFT 相互相関を使用した、字幕参照用の高速な内蔵アライナー",
+                "ko_KR": "FFT 교차 상관을 사용하는 자막 참조용 고속 내장 정렬기",
+                "hi_IN": "FFT क्रॉस-सहसंबंध का उपयोग करने वाला उपशीर्षक संदर्भों के लिए तेज़ अंतर्निहित संरेखक",
+                "bn_BD": "FFT ক্রস-কোরিলেশন ব্যবহার করে সাবটাইটেল রেফারেন্সের জন্য দ্রুত বিল্ট-ইন অ্যালাইনার",
+                "it_IT": "Allineatore integrato veloce per sottotitoli di riferimento tramite correlazione incrociata FFT",
+                "fr_FR": "Aligneur intégré rapide pour les sous-titres de référence par corrélation croisée FFT",
+                "de_DE": "Schneller integrierter Aligner für Referenzuntertitel mittels FFT-Kreuzkorrelation",
+                "pt_PT": "Alinhador integrado rápido para legendas de referência usando correlação cruzada FFT",
+                "ar_SA": "أداة محاذاة مدمجة سريعة لمراجع الترجمة باستخدام الارتباط المتبادل FFT",
+                "vi_VN": "Bộ căn chỉnh tích hợp nhanh cho phụ đề tham chiếu bằng tương quan chéo FFT",
+                "fa_IR": "هم‌تراز کننده داخلی سریع برای زیرنویس‌های مرجع با استفاده از همبستگی متقابل FFT",
+                "id_ID": "Penyelaras bawaan cepat untuk referensi subtitle menggunakan korelasi silang FFT",
+                "ms_MY": "Penjajar terbina dalam pantas untuk rujukan sarikata menggunakan korelasi silang FFT",
+                "th_TH": "ตัวจัดตำแหน่งในตัวที่รวดเร็วสำหรับคำบรรยายอ้างอิงโดยใช้สหสัมพันธ์ไขว้ FFT",
+                "ur_PK": "FFT کراس کوریلیشن استعمال کرنے والا سب ٹائٹل ریفرنس کے لیے تیز بلٹ اِن الائنر",
+                "zh_TW": "使用 FFT 互相關的快速內建字幕參考對齊器",
             },
-            "spacer2": {
-                "type": "spacer",
-                "value": 9,
-            },
-            "max_shift_secs": {
-                "type": "slider",
-                "label": {
-                    "en_US": "Maximum shift (seconds)",
-                    "es_ES": "Desplazamiento máximo (segundos)",
-                    "tr_TR": "Maksimum kaydırma (saniye)",
-                    "zh_CN": "最大位移（秒）",
-                    "ru_RU": "Максимальный сдвиг (секунды)",
-                    "pl_PL": "Maksymalne przesunięcie (sekundy)",
-                    "uk_UA": "Максимальний зсув (секунди)",
-                    "ja_JP": "最大シフト（秒）",
-                    "ko_KR": "최대 이동 (초)",
-                    "hi_IN": "अधिकतम शिफ्ट (सेकंड)",
-                    "bn_BD": "সর্বাধিক শিফট (সেকেন্ড)",
-                    "it_IT": "Spostamento massimo (secondi)",
-                    "fr_FR": "Décalage maximum (secondes)",
-                    "de_DE": "Maximale Verschiebung (Sekunden)",
-                    "pt_PT": "Deslocamento máximo (segundos)",
-                    "ar_SA": "الإزاحة القصوى (ثواني)",
-                    "vi_VN": "Dịch chuyển tối đa (giây)",
-                    "fa_IR": "حداکثر جابجایی (ثانیه)",
-                    "id_ID": "Pergeseran maksimum (detik)",
-                    "ms_MY": "Anjakan maksimum (saat)",
-                    "th_TH": "การเลื่อนสูงสุด (วินาที)",
-                    "ur_PK": "زیادہ سے زیادہ شفٹ (سیکنڈز)",
-                    "zh_TW": "最大偏移（秒）",
-                },
-                "tooltip": {
-                    "en_US": "Maximum subtitle shift in seconds (default 20)",
-                    "es_ES": "Desplazamiento máximo de subtítulos en segundos (predeterminado 20)",
-                    "tr_TR": "Saniye cinsinden maksimum altyazı kaydırma (varsayılan 20)",
-                    "zh_CN": "字幕最大位移秒数（默认20）",
-                    "ru_RU": "Максимальный сдвиг субтитров в секундах (по умолчанию 20)",
-                    "pl_PL": "Maksymalne przesunięcie napisów w sekundach (domyślnie 20)",
-                    "uk_UA": "Максимальний зсув субтитрів у секундах (за замовчуванням 20)",
-                    "ja_JP": "字幕の最大シフト秒数（デフォルト20）",
-                    "ko_KR": "초 단위의 최대 자막 이동 (기본값 20)",
-                    "hi_IN": "सेकंड में अधिकतम उपशीर्षक शिफ्ट (डिफ़ॉल्ट 20)",
-                    "bn_BD": "সেকেন্ডে সর্বাধিক সাবটাইটেল শিফট (ডিফল্ট 20)",
-                    "it_IT": "Spostamento massimo dei sottotitoli in secondi (predefinito 20)",
-                    "fr_FR": "Décalage maximum des sous-titres en secondes (par défaut 20)",
-                    "de_DE": "Maximale Untertitelverschiebung in Sekunden (Standard 20)",
-                    "pt_PT": "Deslocamento máximo de legendas em segundos (padrão 20)",
-                    "ar_SA": "الإزاحة القصوى للترجمات بالثواني (الافتراضي 20)",
-                    "vi_VN": "Dịch chuyển phụ đề tối đa tính bằng giây (mặc định 20)",
-                    "fa_IR": "حداکثر جابجایی زیرنویس به ثانیه (پیش‌فرض 20)",
-                    "id_ID": "Pergeseran maksimum subtitle dalam detik (default 20)",
-                    "ms_MY": "Anjakan maksimum sarikata dalam saat (lalai 20)",
-                    "th_TH": "การเลื่อนคำบรรยายสูงสุดเป็นวินาที (ค่าเริ่มต้น 20)",
-                    "ur_PK": "سیکنڈز میں زیادہ سے زیادہ سب ٹائٹل شفٹ (ڈیفالٹ 20)",
-                    "zh_TW": "字幕最大偏移秒數（預設 20）",
+            "github": GITHUB_URL,
+            "documentation": GITHUB_URL,
+            "supported_formats": [
+                ".srt",
+                ".vtt",
+                ".sbv",
+                ".sub",
+                ".ass",
+                ".ssa",
+                ".dfxp",
+                ".ttml",
+                ".itt",
+                ".stl",
+                ".smi",
+            ],
+            "supports_subtitle_as_reference": True,
+            "supports_video_as_reference": False,
+            "type": "native",
+            "module": "fft_align",
+            "cmd_structure": ["{reference}", "{subtitle}", "{output}"],
+            "options": {
+                "check_video_for_subtitles": {
+                    "type": "checkbox",
+                    "label": {
+                        "en_US": "Use embedded subtitles in video",
+                        "es_ES": "Usar subtítulos incrustados en el vídeo",
+                        "tr_TR": "Videodaki gömülü altyazıları kullan",
+                        "zh_CN": "使用视频中的内嵌字幕",
+                        "ru_RU": "Использовать встроенные субтитры в видео",
+                        "pl_PL": "Użyj osadzonych napisów w wideo",
+                        "uk_UA": "Використовувати вбудовані субтитри у відео",
+                        "ja_JP": "ビデオ内の埋め込み字幕を使用",
+                        "ko_KR": "비디오에 내장된 자막 사용",
+                        "hi_IN": "वीडियो में एम्बेडेड उपशीर्षक का उपयोग करें",
+                        "bn_BD": "ভিডিওতে এম্বেড করা সাবটাইটেল ব্যবহার করুন",
+                        "it_IT": "Usa i sottotitoli incorporati nel video",
+                        "fr_FR": "Utiliser les sous-titres intégrés dans la vidéo",
+                        "de_DE": "Eingebettete Untertitel im Video verwenden",
+                        "pt_PT": "Usar legendas incorporadas no vídeo",
+                        "ar_SA": "استخدم الترجمات المضمنة في الفيديو",
+                        "vi_VN": "Sử dụng phụ đề nhúng trong video",
+                        "fa_IR": "استفاده از زیرنویس‌های جاسازی‌شده در ویدیو",
+                        "id_ID": "Gunakan subtitle tertanam di video",
+                        "ms_MY": "Guna sarikata terbenam dalam video",
+                        "th_TH": "ใช้คำบรรยายที่ฝังในวิดีโอ",
+                        "ur_PK": "ویڈیو میں ایمبیڈڈ سب ٹائٹلز استعمال کریں",
+                        "zh_TW": "使用影片中的內嵌字幕",
+                    },
+                    "tooltip": {
+                        "en_US": "Extract the embedded subtitles in the video and perform synchronization with these subtitles.",
+                        "es_ES": "Extrae los subtítulos incrustados en el vídeo y realiza la sincronización con estos subtítulos.",
+                        "tr_TR": "Videodaki gömülü altyazıları çıkarır ve bu altyazılarla senkronizasyon yapar.",
+                        "zh_CN": "提取视频中的内嵌字幕并与这些字幕进行同步。",
+                        "ru_RU": "Извлекает встроенные субтитры из видео и выполняет синхронизацию с ними.",
+                        "pl_PL": "Wyodrębnia osadzone napisy z wideo i synchronizuje z nimi.",
+                        "uk_UA": "Витягує вбудовані субтитри з відео та виконує синхронізацію з ними.",
+                        "ja_JP": "ビデオ内の埋め込み字幕を抽出し、それらの字幕と同期します。",
+                        "ko_KR": "비디오에 내장된 자막을 추출하고 해당 자막과 동기화합니다.",
+                        "hi_IN": "वीडियो में एम्बेडेड उपशीर्षकों को निकालें और उनके साथ सिंक्रनाइज़ करें।",
+                        "bn_BD": "ভিডিওতে এম্বেড করা সাবটাইটেল বের করুন এবং সেগুলোর সাথে সিঙ্ক করুন।",
+                        "it_IT": "Estrae i sottotitoli incorporati nel video ed esegue la sincronizzazione con questi sottotitoli.",
+                        "fr_FR": "Extrait les sous-titres intégrés dans la vidéo et effectue la synchronisation avec ces sous-titres.",
+                        "de_DE": "Extrahiert die eingebetteten Untertitel aus dem Video und synchronisiert mit diesen Untertiteln.",
+                        "pt_PT": "Extrai as legendas incorporadas no vídeo e sincroniza com essas legendas.",
+                        "ar_SA": "يستخرج الترجمات المضمنة في الفيديو ويقوم بمزامنتها مع هذه الترجمات.",
+                        "vi_VN": "Trích xuất phụ đề nhúng trong video và đồng bộ hóa với các phụ đề này.",
+                        "fa_IR": "زیرنویس‌های جاسازی‌شده در ویدیو را استخراج کرده و با آن‌ها همگام‌سازی می‌کند.",
+                        "id_ID": "Ekstrak subtitle tertanam di video dan lakukan sinkronisasi dengan subtitle tersebut.",
+                        "ms_MY": "Ekstrak sarikata terbenam dalam video dan lakukan penyegerakan dengan sarikata tersebut.",
+                        "th_TH": "แยกคำบรรยายที่ฝังในวิดีโอและซิงค์กับคำบรรยายนั้น",
+                        "ur_PK": "ویڈیو میں ایمبیڈڈ سب ٹائٹلز نکالیں اور ان کے ساتھ سنکرونائز کریں۔",
+                        "zh_TW": "提取影片中的內嵌字幕並與這些字幕進行同步。",
+                    },
+                    "default": True,
                 },
-                "argument": "--max_shift_secs",
-                "range": [1, 120],
-                "default": 20,
-            },
-            "parallelism": {
-                "type": "slider",
-                "label": {
-                    "en_US": "Parallelism",
-                    "es_ES": "Paralelismo",
-                    "tr_TR": "Paralellik",
-                    "zh_CN": "并行度",
-                    "ru_RU": "Параллелизм",
-                    "pl_PL": "Równoległość",
-                    "uk_UA": "Паралелізм",
-                    "ja_JP": "並列処理",
-                    "ko_KR": "병렬 처리",
-                    "hi_IN": "समानांतरता",
-                    "bn_BD": "সমান্তরালতা",
-                    "it_IT": "Parallelismo",
-                    "fr_FR": "Parallélisme",
-                    "de_DE": "Parallelität",
-                    "pt_PT": "Paralelismo",
-                    "ar_SA": "التوازي",
-                    "vi_VN": "Xử lý song song",
-                    "fa_IR": "پردازش موازی",
-                    "id_ID": "Paralelisme",
-                    "ms_MY": "Keselarian",
-                    "th_TH": "การประมวลผลแบบขนาน",
-                    "ur_PK": "متوازی پن",
-                    "zh_TW": "平行處理",
+                "disable_fps_guessing": {
+                    "type": "checkbox",
+                    "label": {
+                        "en_US": "Disable FPS guessing",
+                        "es_ES": "Desactivar estimación de FPS",
+                        "tr_TR": "FPS tahmini devre dışı bırak",
+                        "zh_CN": "禁用帧率猜测",
+                        "ru_RU": "Отключить угадывание FPS",
+                        "pl_PL": "Wyłącz zgadywanie FPS",
+                        "uk_UA": "Вимкнути вгадування FPS",
+                        "ja_JP": "FPS推測を無効にする",
+                        "ko_KR": "FPS 추측 비활성화",
+                        "hi_IN": "FPS अनुमान अक्षम करें",
+                        "bn_BD": "FPS অনুমান নিষ্ক্রিয় করুন",
+                        "it_IT": "Disabilita previsione FPS",
+                        "fr_FR": "Désactiver l'estimation des FPS",
+                        "de_DE": "FPS-Schätzung deaktivieren",
+                        "pt_PT": "Desativar suposição de FPS",
+                        "ar_SA": "تعطيل تخمين معدل الإطارات",
+                        "vi_VN": "Tắt đoán tốc độ khung hình",
+                        "fa_IR": "غیرفعال کردن حدس FPS",
+                        "id_ID": "Nonaktifkan penebakan FPS",
+                        "ms_MY": "Lumpuhkan tekaan FPS",
+                        "th_TH": "ปิดการคาดเดาอัตราเฟรม",
+                        "ur_PK": "FPS اندازہ غیر فعال کریں",
+                        "zh_TW": "停用 FPS 猜測",
+                    },
+                    "tooltip": {
+                        "en_US": "Disables guessing and correcting of framerate differences between reference file and input file.",
+                        "es_ES": "Desactiva la estimación y corrección de diferencias en la velocidad de fotogramas entre el archivo de referencia y el archivo de entrada.",
+                        "tr_TR": "Referans dosya ve girdi dosyası arasındaki kare hızı farklılıklarının tahmin edilmesini ve düzeltilmesini devre dışı bırakır.",
+                        "zh_CN": "禁用猜测和校正参考文件和输入文件之间的帧率差异。",
+                        "ru_RU": "Отключает угадывание и исправление различий частоты кадров между эталонным файлом и входным файлом.",
+                        "pl_PL": "Wyłącza zgadywanie i korygowanie różnic w liczbie klatek na sekundę między plikiem referencyjnym a plikiem wejściowym.",
+                        "uk_UA": "Вимикає вгадування та виправлення відмінностей частоти кадрів між еталонним файлом і вхідним файлом.",
+                        "ja_JP": "参照ファイルと入力ファイル間のフレームレートの違いの推測と修正を無効にします。",
+                        "ko_KR": "참조 파일과 입력 파일 간의 프레임 레이트 차이를 추측하고 수정하는 기능을 비활성화합니다.",
+                        "hi_IN": "संदर्भ फ़ाइल और इनपुट फ़ाइल के बीच फ्रेमरेट अंतर का अनुमान और सुधार अक्षम करता है।",
+                        "bn_BD": "রেফারেন্স ফাইল এবং ইনপুট ফাইলের মধ্যে ফ্রেমরেট পার্থক্যের অনুমান এবং সংশোধন নিষ্ক্রিয় করে।",
+                        "it_IT": "Disabilita la previsione e la correzione delle differenze di framerate tra il file di riferimento e il file di input.",
+                        "fr_FR": "Désactive l'estimation et la correction des différences de fréquence d'images entre le fichier de référence et le fichier d'entrée.",
+                        "de_DE": "Deaktiviert das Erraten und Korrigieren von Bildfrequenzunterschieden zwischen Referenzdatei und Eingabedatei.",
+                        "pt_PT": "Desativa a suposição e correção de diferenças de taxa de quadros entre o ficheiro de referência e o ficheiro de entrada.",
+                        "ar_SA": "يعطل تخمين وتصحيح اختلافات معدل الإطارات بين ملف المرجع وملف الإدخال.",
+                        "vi_VN": "Tắt đoán và sửa sự khác biệt tốc độ khung hình giữa tệp tham chiếu và tệp đầu vào.",
+                        "fa_IR": "حدس زدن و تصحیح تفاوت‌های نرخ فریم بین فایل مرجع و فایل ورودی را غیرفعال می‌کند.",
+                        "id_ID": "Menonaktifkan penebakan dan koreksi perbedaan framerate antara file referensi dan file input.",
+                        "ms_MY": "Melumpuhkan tekaan dan pembetulan perbezaan kadar bingkai antara fail rujukan dan fail input.",
+                        "th_TH": "ปิดการคาดเดาและการแก้ไขความแตกต่างของอัตราเฟรมระหว่างไฟล์อ้างอิงและไฟล์อินพุต",
+                        "ur_PK": "حوالہ فائل اور ان پٹ فائل کے درمیان فریم ریٹ کے فرق کا اندازہ لگانا اور درست کرنا غیر فعال کرتا ہے۔",
+                        "zh_TW": "停用參考檔和輸入檔之間幀率差異的猜測和修正。",
+                    },
+                    "default": False,
                 },
-                "tooltip": {
-                    "en_US": "Number of parallel worker processes (default 3)",
-                    "es_ES": "Número de procesos de trabajo en paralelo (predeterminado 3)",
-                    "tr_TR": "Paralel çalışan işlem sayısı (varsayılan 3)",
-                    "zh_CN": "并行工作进程数量（默认3）",
-                    "ru_RU": "Количество параллельных рабочих процессов (по умолчанию 3)",
-                    "pl_PL": "Liczba równoległych procesów roboczych (domyślnie 3)",
-                    "uk_UA": "Кількість паралельних робочих процесів (за замовчуванням 3)",
-                    "ja_JP": "並列ワーカープロセスの数（デフォルト3）",
-                    "ko_KR": "병렬 작업자 프로세스 수 (기본값 3)",
-                    "hi_IN": "समानांतर कार्यकर्ता प्रक्रियाओं की संख्या (डिफ़ॉल्ट 3)",
-                    "bn_BD": "সমান্তরাল ওয়ার্কার প্রসেসের সংখ্যা (ডিফল্ট 3)",
-                    "it_IT": "Numero di processi lavoratori paralleli (predefinito 3)",
-                    "fr_FR": "Nombre de processus de travail parallèles (par défaut 3)",
-                    "de_DE": "Anzahl der parallelen Arbeitsprozesse (Standard 3)",
-                    "pt_PT": "Número de processos de trabalho paralelos (padrão 3)",
-                    "ar_SA": "عدد عمليات العمل المتوازية (الافتراضي 3)",
-                    "vi_VN": "Số lượng quy trình công việc song song (mặc định 3)",
-                    "fa_IR": "تعداد فرآیندهای کارگر موازی (پیش‌فرض 3)",
-                    "id_ID": "Jumlah proses pekerja paralel (default 3)",
-                    "ms_MY": "Bilangan proses pekerja selari (lalai 3)",
-                    "th_TH": "จำนวนกระบวนการทำงานแบบขนาน (ค่าเริ่มต้น 3)",
-                    "ur_PK": "متوازی ورکر پروسیسز کی تعداد (ڈیفالٹ 3)",
-                    "zh_TW": "平行工作程序的數量（預設 3）",
+                "max_offset_seconds": {
+                    "type": "slider",
+                    "label": {
+                        "en_US": "Maximum shift (seconds)",
+                        "es_ES": "Desplazamiento máximo (segundos)",
+                        "tr_TR": "Maksimum kaydırma (saniye)",
+                        "zh_CN": "最大位移（秒）",
+                        "ru_RU": "Максимальный сдвиг (секунды)",
+                        "pl_PL": "Maksymalne przesunięcie (sekundy)",
+                        "uk_UA": "Максимальний зсув (секунди)",
+                        "ja_JP": "最大シフト（秒）",
+                        "ko_KR": "최대 이동 (초)",
+                        "hi_IN": "अधिकतम शिफ्ट (सेकंड)",
+                        "bn_BD": "সর্বাধিক শিফট (সেকেন্ড)",
+                        "it_IT": "Spostamento massimo (secondi)",
+                        "fr_FR": "Décalage maximum (secondes)",
+                        "de_DE": "Maximale Verschiebung (Sekunden)",
+                        "pt_PT": "Deslocamento máximo (segundos)",
+                        "ar_SA": "الإزاحة القصوى (ثواني)",
+                        "vi_VN": "Dịch chuyển tối đa (giây)",
+                        "fa_IR": "حداکثر جابجایی (ثانیه)",
+                        "id_ID": "Pergeseran maksimum (detik)",
+                        "ms_MY": "Anjakan maksimum (saat)",
+                        "th_TH": "การเลื่อนสูงสุด (วินาที)",
+                        "ur_PK": "زیادہ سے زیادہ شفٹ (سیکنڈز)",
+                        "zh_TW": "最大偏移（秒）",
+                    },
+                    "tooltip": {
+                        "en_US": "Maximum subtitle shift in seconds (default 60)",
+                        "es_ES": "Desplazamiento máximo de subtítulos en segundos (predeterminado 60)",
+                        "tr_TR": "Saniye cinsinden maksimum altyazı kaydırma (varsayılan 60)",
+                        "zh_CN": "字幕最大位移秒数（默认60）",
+                        "ru_RU": "Максимальный сдвиг субтитров в секундах (по умолчанию 60)",
+                        "pl_PL": "Maksymalne przesunięcie napisów w sekundach (domyślnie 60)",
+                        "uk_UA": "Максимальний зсув субтитрів у секундах (за замовчуванням 60)",
+                        "ja_JP": "字幕の最大シフト秒数（デフォルト60）",
+                        "ko_KR": "초 단위의 최대 자막 이동 (기본값 60)",
+                        "hi_IN": "सेकंड में अधिकतम उपशीर्षक शिफ्ट (डिफ़ॉल्ट 60)",
+                        "bn_BD": "সেকেন্ডে সর্বাধিক সাবটাইটেল শিফট (ডিফল্ট 60)",
+                        "it_IT": "Spostamento massimo dei sottotitoli in secondi (predefinito 60)",
+                        "fr_FR": "Décalage maximum des sous-titres en secondes (par défaut 60)",
+                        "de_DE": "Maximale Untertitelverschiebung in Sekunden (Standard 60)",
+                        "pt_PT": "Deslocamento máximo de legendas em segundos (padrão 60)",
+                        "ar_SA": "الإزاحة القصوى للترجمات بالثواني (الافتراضي 60)",
+                        "vi_VN": "Dịch chuyển phụ đề tối đa tính bằng giây (mặc định 60)",
+                        "fa_IR": "حداکثر جابجایی زیرنویس به ثانیه (پیش‌فرض 60)",
+                        "id_ID": "Pergeseran maksimum subtitle dalam detik (default 60)",
+                        "ms_MY": "Anjakan maksimum sarikata dalam saat (lalai 60)",
+                        "th_TH": "การเลื่อนคำบรรยายสูงสุดเป็นวินาที (ค่าเริ่มต้น 60)",
+                        "ur_PK": "سیکنڈز میں زیادہ سے زیادہ سب ٹائٹل شفٹ (ڈیفالٹ 60)",
+                        "zh_TW": "字幕最大偏移秒數（預設 60）",
+                    },
+                                    "range": [1, 600],
+                    "default": 60,
                 },
-                "argument": "--parallelism",
-                "range": [1, 16],
-                "default": 3,
             },
         },
-    },
-}
+    }
+
+    return SYNC_TOOLS
 
-AUTOMATIC_SAVE_MAP = {
+
+_AUTOMATIC_SAVE_MAP = {
     "save_next_to_input_subtitle": {
         "en_US": "Save next to input subtitle",
         "es_ES": "Guardar junto al subtítulo de entrada",
@@ -1746,7 +1921,7 @@ AUTOMATIC_SAVE_MAP = {
     },
 }
 
-MANUAL_SAVE_MAP = {
+_MANUAL_SAVE_MAP = {
     "save_next_to_input_subtitle": {
         "en_US": "Save next to input subtitle",
         "es_ES": "Guardar junto al subtítulo de entrada",
@@ -1915,55 +2090,89 @@ EXTRACTABLE_SUBTITLE_EXTENSIONS = {
     "mov_text": "srt",
 }
 
-# Convert translation dictionaries to TranslationDict objects
-translation_dicts = ["PROGRAM_TAGLINE", "PROGRAM_DESCRIPTION"]
-for name in translation_dicts:
-    if name in globals() and isinstance(globals()[name], dict):
-        globals()[name] = TranslationDict(globals()[name])
 
-# Convert save location dictionaries
-for key in AUTOMATIC_SAVE_MAP:
-    if isinstance(AUTOMATIC_SAVE_MAP[key], dict):
-        AUTOMATIC_SAVE_MAP[key] = TranslationDict(AUTOMATIC_SAVE_MAP[key])
+def translation_sources():
+    """The translated texts defined here, compiled into the translation catalogs."""
+    return {
+        "PROGRAM_TAGLINE": _PROGRAM_TAGLINE,
+        "PROGRAM_DESCRIPTION": _PROGRAM_DESCRIPTION,
+        "AUTOMATIC_SAVE_MAP": _AUTOMATIC_SAVE_MAP,
+        "MANUAL_SAVE_MAP": _MANUAL_SAVE_MAP,
+        "SYNC_TOOLS": _sync_tools_source(),
+    }
+
+
+def _build_sync_tools():
+    # The texts are resolved from the catalogs of the languages in use
+    return {"SYNC_TOOLS": translate_tree(_sync_tools_source(), "SYNC_TOOLS")}
+
+
+def _build_translations():
+    """TranslationDict objects for the texts above."""
+    return {
+        "PROGRAM_TAGLINE": TranslationDict(key="PROGRAM_TAGLINE"),
+        "PROGRAM_DESCRIPTION": TranslationDict(key="PROGRAM_DESCRIPTION"),
+        "AUTOMATIC_SAVE_MAP": translate_tree(
+            dict(_AUTOMATIC_SAVE_MAP), "AUTOMATIC_SAVE_MAP"
+        ),
+        "MANUAL_SAVE_MAP": translate_tree(dict(_MANUAL_SAVE_MAP), "MANUAL_SAVE_MAP"),
+    }
+
+
+def _build_default_options():
+    options = dict(_DEFAULT_OPTIONS)
+    # Add sync tool options to DEFAULT_OPTIONS
+    for tool_name, tool_data in _lazy("SYNC_TOOLS").items():
+        for opt_name, opt_data in tool_data.get("options", {}).items():
+            key = f"{tool_name}_{opt_name}"
+            if "default" in opt_data and key not in options:
+                options[key] = opt_data["default"]
+    try:
+        from utils import get_locale
+
+        options["language"] = get_locale()
+    except Exception:
+        # Fallback to en_US if the locale can't be determined
+        options["language"] = "en_US"
+    return {"DEFAULT_OPTIONS": options}
+
+
+def _build_version():
+    from utils import get_version
 
-for key in MANUAL_SAVE_MAP:
-    if isinstance(MANUAL_SAVE_MAP[key], dict):
-        MANUAL_SAVE_MAP[key] = TranslationDict(MANUAL_SAVE_MAP[key])
+    return {"VERSION": get_version()}
+
+
+# Names whose values are expensive to compute (tool versions, resource lookups,
+# the locale) are built on first access, so that importing constants stays
+# cheap for the CLI. Each builder returns all the names it resolves.
+_LAZY_BUILDERS = {
+    "VERSION": _build_version,
+    "SYNC_TOOLS": _build_sync_tools,
+    "DEFAULT_OPTIONS": _build_default_options,
+    "FFMPEG_EXECUTABLE": _resolve_ffmpeg,
+    "FFPROBE_EXECUTABLE": _resolve_ffmpeg,
+    "FFMPEG_DIR": _resolve_ffmpeg,
+    "NEEDS_STATIC_FFMPEG": _resolve_ffmpeg,
+    "PROGRAM_TAGLINE": _build_translations,
+    "PROGRAM_DESCRIPTION": _build_translations,
+    "AUTOMATIC_SAVE_MAP": _build_translations,
+    "MANUAL_SAVE_MAP": _build_translations,
+}
 
-# Convert SYNC_TOOLS descriptions and options to TranslationDict objects
-for tool_name, tool_data in SYNC_TOOLS.items():
-    if isinstance(tool_data.get("description"), dict):
-        tool_data["description"] = TranslationDict(tool_data["description"])
 
-    # Convert options labels and tooltips
-    if "options" in tool_data:
-        for option_name, option_data in tool_data["options"].items():
-            if isinstance(option_data.get("label"), dict):
-                option_data["label"] = TranslationDict(option_data["label"])
-            if isinstance(option_data.get("tooltip"), dict):
-                option_data["tooltip"] = TranslationDict(option_data["tooltip"])
+def _lazy(name):
+    if name not in globals():
+        globals().update(_LAZY_BUILDERS[name]())
+    return globals()[name]
 
-            # Convert value_labels if present
-            if "value_labels" in option_data:
-                for value, label in option_data["value_labels"].items():
-                    if isinstance(label, dict):
-                        option_data["value_labels"][value] = TranslationDict(label)
 
-# Add sync tool options to DEFAULT_OPTIONS
-for tool_name, tool_data in SYNC_TOOLS.items():
-    for opt_name, opt_data in tool_data.get("options", {}).items():
-        key = f"{tool_name}_{opt_name}"
-        if "default" in opt_data and key not in DEFAULT_OPTIONS:
-            DEFAULT_OPTIONS[key] = opt_data["default"]
+def __getattr__(name):
+    if name in _LAZY_BUILDERS:
+        return _lazy(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Set proper default language after LANGUAGES is defined
-try:
-    from utils import get_locale
 
-    DEFAULT_OPTIONS["language"] = get_locale()
-except ImportError:
-    # Fallback to en_US if circular import occurs during initialization
-    DEFAULT_OPTIONS["language"] = "en_US"
-except Exception:
-    # Fallback to en_US if any other error occurs during initialization
-    DEFAULT_OPTIONS["language"] = "en_US"
+# The lazy names are left out so that star imports don't build them all;
+# import them by name instead
+__all__ = [name for name in globals() if not name.startswith("_")]
@@ -0,0 +1,166 @@
+"""Text encoding detection for subtitle files, memoized per file version.
+
+Most subtitles are UTF-8 (or plain ASCII), which is recognised without the
+statistical detectors: a BOM decides immediately, otherwise a strict UTF-8
+decode of the file either succeeds or rules UTF-8 out. Only then are
+cchardet, charset_normalizer and chardet tried, in that order, on a bounded
+sample (head, middle and tail of large files). The detectors are imported
+on first use, since most files never need them.
+
+Results are memoized by (path, size, mtime_ns), so the repeated lookups of
+one sync (tool command building, conversion, parsing, encoding matching)
+read and analyse each file once, and a rewritten file is detected again.
+"""
+
+import os
+import codecs
+import threading
+from collections import OrderedDict
+
+# Bytes handed to the statistical detectors.
+SAMPLE_BYTES = 256 * 1024
+# Files up to this size are checked for UTF-8 in full, larger ones by sample.
+FULL_UTF8_CHECK_BYTES = 16 * 1024 * 1024
+MAX_CACHE_ENTRIES = 4096
+
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+_cache = OrderedDict()
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+_detectors = None
+
+
+def _bom_encoding(head: bytes):
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    return None
+
+
+def _sample_chunks(data: bytes, size: int) -> list:
+    """Head, middle and tail of data, size bytes in total."""
+    if len(data) <= size:
+        return [data]
+    part = size // 3
+    middle = (len(data) - part) // 2
+    return [data[:part], data[middle : middle + part], data[-part:]]
+
+
+def _read_chunks(file_path: str, file_size: int) -> list:
+    """Whole file if it is small enough to check in full, else a sample."""
+    with open(file_path, "rb") as f:
+        if file_size <= FULL_UTF8_CHECK_BYTES:
+            return [f.read()]
+        part = SAMPLE_BYTES // 3
+        chunks = []
+        for offset in (0, (file_size - part) // 2, file_size - part):
+            f.seek(offset)
+            chunks.append(f.read(part))
+        return chunks
+
+
+def _is_utf8(chunks: list) -> bool:
+    """Strict UTF-8 check that tolerates characters cut at chunk boundaries."""
+    whole = len(chunks) == 1
+    for i, chunk in enumerate(chunks):
+        if i > 0:
+            # Skip continuation bytes of a character started before the cut.
+            skip = 0
+            while skip < min(3, len(chunk)) and chunk[skip] & 0xC0 == 0x80:
+                skip += 1
+            chunk = chunk[skip:]
+        decoder = codecs.getincrementaldecoder("utf-8")("strict")
+        try:
+            decoder.decode(chunk, final=whole)
+        except UnicodeDecodeError:
+            return False
+    return True
+
+
+def _load_detectors() -> list:
+    """The installed detector modules, in order of preference."""
+    global _detectors
+    if _detectors is None:
+        import importlib
+
+        detectors = []
+        for name in ("cchardet", "charset_normalizer", "chardet"):
+            try:
+                detectors.append(importlib.import_module(name))
+            except ImportError:
+                pass
+        _detectors = detectors
+    return _detectors
+
+
+def _run_detectors(sample: bytes):
+    for detector in _load_detectors():
+        try:
+            result = detector.detect(sample)["encoding"]
+        except Exception:
+            continue
+        if result is not None:
+            return result
+    return None
+
+
+def detect_bytes_encoding(chunks) -> str:
+    """Encoding of raw bytes, or of head/middle/tail chunks of a large file."""
+    if isinstance(chunks, (bytes, bytearray)):
+        chunks = [bytes(chunks)]
+    bom = _bom_encoding(chunks[0][:4]) if chunks else None
+    if bom:
+        return bom
+    if _is_utf8(chunks):
+        return "ascii" if all(chunk.isascii() for chunk in chunks) else "utf-8"
+    if len(chunks) == 1:
+        chunks = _sample_chunks(chunks[0], SAMPLE_BYTES)
+    encoding = _run_detectors(b"\n".join(chunk[:SAMPLE_BYTES] for chunk in chunks))
+    return (encoding or "utf-8").lower()
+
+
+def detect_encoding(file_path, data=None) -> str:
+    """Encoding of a file, memoized by (path, size, mtime_ns).
+
+    data may hold the file's bytes if the caller already read them.
+    """
+    st = os.stat(file_path)
+    key = (os.path.abspath(file_path), st.st_size, st.st_mtime_ns)
+    with _lock:
+        encoding = _cache.get(key)
+        if encoding is not None:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            return encoding
+        _stats["misses"] += 1
+    if data is None:
+        chunks = _read_chunks(file_path, st.st_size)
+    elif len(data) > FULL_UTF8_CHECK_BYTES:
+        chunks = _sample_chunks(data, SAMPLE_BYTES)
+    else:
+        chunks = [data]
+    encoding = detect_bytes_encoding(chunks)
+    with _lock:
+        _cache[key] = encoding
+        while len(_cache) > MAX_CACHE_ENTRIES:
+            _cache.popitem(last=False)
+    return encoding
+
+
+def cache_stats() -> dict:
+    """Hit/miss counters and current size of the memo, for profiling."""
+    with _lock:
+        return {**_stats, "size": len(_cache)}
+
+
+def clear_cache():
+    with _lock:
+        _cache.clear()
+        _stats["hits"] = _stats["misses"] = 0
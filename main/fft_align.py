@@ -0,0 +1,184 @@
+"""Built-in subtitle-to-subtitle aligner.
+
+Both subtitles are rasterised into +-1 speech masks and the offset is found
+with an FFT cross-correlation, the same scoring ffsubsync uses for subtitle
+references. Common framerate ratios are tried as well unless FPS
+guessing is disabled. Runs in-process, so there is no tool process to start and
+no temporary files: a pair aligns in milliseconds.
+"""
+
+import logging
+from typing import Optional, Tuple
+
+import numpy as np
+
+from subtitle_ir import SubtitleDocument, format_for_path, load_subtitle, save_subtitle
+from subtitle_transform import AffineTransform
+
+logger = logging.getLogger(__name__)
+
+BIN_MS = 10
+COARSE_BIN_MS = 100
+# Coarse candidates (offset + ratio) re-scored at full resolution.
+REFINE_CANDIDATES = 2
+DEFAULT_MAX_OFFSET_SECONDS = 60
+# Same candidates as ffsubsync: 23.976/24/25 fps in both directions.
+FRAMERATE_RATIOS = [24.0 / 23.976, 25.0 / 23.976, 25.0 / 24.0]
+
+
+class AlignmentCancelled(Exception):
+    """Raised by find_alignment when is_cancelled reports a user cancel."""
+
+
+def speech_mask(starts: np.ndarray, ends: np.ndarray, bin_ms: int = BIN_MS):
+    """Rasterise cues into a float32 mask: +1 for speech bins, -1 elsewhere."""
+    start_bins = np.maximum(starts, 0) // bin_ms
+    end_bins = np.maximum(ends, 0) // bin_ms
+    length = int(end_bins.max()) + 1 if len(end_bins) else 0
+    edges = np.zeros(length + 1, dtype=np.int32)
+    np.add.at(edges, start_bins, 1)
+    np.add.at(edges, end_bins, -1)
+    return np.where(np.cumsum(edges[:-1]) > 0, 1.0, -1.0).astype(np.float32)
+
+
+def _best_lag(corr, ref_len, sub_len, max_lag):
+    """Best (lag, score) of a circular cross-correlation within +-max_lag."""
+    pos = corr[: min(ref_len, max_lag + 1)]
+    neg_count = min(sub_len - 1, max_lag)
+    neg = corr[len(corr) - neg_count :] if neg_count > 0 else corr[:0]
+    best_pos = int(np.argmax(pos))
+    if len(neg) and neg.max() > pos[best_pos]:
+        idx = int(np.argmax(neg))
+        return idx - neg_count, float(neg[idx])
+    return best_pos, float(pos[best_pos])
+
+
+def _score_lags(ref, sub, lags):
+    """Exact correlation of the two masks at each lag (sub shifted by +lag)."""
+    scores = np.empty(len(lags))
+    for i, lag in enumerate(lags):
+        lo, hi = max(0, lag), min(len(ref), len(sub) + lag)
+        if hi <= lo:
+            scores[i] = -np.inf
+        else:
+            scores[i] = np.dot(ref[lo:hi], sub[lo - lag : hi - lag])
+    return scores
+
+
+def find_alignment(
+    ref_starts,
+    ref_ends,
+    sub_starts,
+    sub_ends,
+    *,
+    max_offset_ms: Optional[int] = DEFAULT_MAX_OFFSET_SECONDS * 1000,
+    ratios=None,
+    is_cancelled=None,
+) -> Tuple[int, float, float]:
+    """Find the (offset_ms, ratio, score) that best maps subtitle onto reference.
+
+    A subtitle time t maps to t * ratio + offset_ms. Every candidate ratio is
+    scored by FFT cross-correlation of COARSE_BIN_MS masks (the reference
+    spectrum is shared); the best candidates are then refined at BIN_MS by
+    scoring the lags around their coarse peak directly.
+    """
+    ratios = [1.0] if ratios is None else list(ratios)
+    if len(ref_starts) == 0 or len(sub_starts) == 0:
+        raise ValueError("cannot align empty subtitles")
+    scale = COARSE_BIN_MS // BIN_MS
+    ref = speech_mask(ref_starts, ref_ends, COARSE_BIN_MS)
+    scaled = [
+        (
+            ratio,
+            np.rint(sub_starts * ratio).astype(np.int64),
+            np.rint(sub_ends * ratio).astype(np.int64),
+        )
+        for ratio in ratios
+    ]
+    sub_len = max(int(ends.max()) // COARSE_BIN_MS + 1 for _, _, ends in scaled)
+    size = 1 << (len(ref) + sub_len - 1).bit_length()
+    ref_ft = np.fft.rfft(ref, size)
+    if max_offset_ms is None:
+        max_lag = size
+    else:
+        max_lag = max_offset_ms // COARSE_BIN_MS
+
+    coarse = []
+    for ratio, starts, ends in scaled:
+        if is_cancelled is not None and is_cancelled():
+            raise AlignmentCancelled()
+        sub = speech_mask(starts, ends, COARSE_BIN_MS)
+        corr = np.fft.irfft(ref_ft * np.conj(np.fft.rfft(sub, size)), size)
+        lag, score = _best_lag(corr, len(ref), len(sub), max_lag)
+        coarse.append((score, lag, ratio, starts, ends))
+    coarse.sort(key=lambda c: c[0], reverse=True)
+
+    fine_ref = speech_mask(ref_starts, ref_ends)
+    best = None
+    for _, lag, ratio, starts, ends in coarse[:REFINE_CANDIDATES]:
+        sub = speech_mask(starts, ends)
+        lags = np.arange((lag - 1) * scale, (lag + 1) * scale + 1)
+        if max_offset_ms is not None:
+            lags = lags[np.abs(lags) * BIN_MS <= max_offset_ms]
+        if not len(lags):
+            continue
+        scores = _score_lags(fine_ref, sub, lags)
+        idx = int(np.argmax(scores))
+        if best is None or scores[idx] > best[0]:
+            best = (float(scores[idx]), int(lags[idx]) * BIN_MS, ratio)
+    if best is None:
+        raise ValueError("no alignment within the maximum offset")
+    score, offset_ms, ratio = best
+    return offset_ms, ratio, score
+
+
+def apply_alignment(
+    doc: SubtitleDocument, offset_ms: int, ratio: float
+) -> SubtitleDocument:
+    """Map every timestamp of doc to t * ratio + offset_ms."""
+    return doc.map_times(AffineTransform(ratio, offset_ms))
+
+
+def sync(reference: str, subtitle: str, output: str, *, config: dict, callbacks) -> int:
+    """Align subtitle to a subtitle reference and write output. Returns an exit code."""
+    from constants import DEFAULT_OPTIONS
+
+    def option(name):
+        key = f"fftalign_{name}"
+        return config.get(key, DEFAULT_OPTIONS.get(key))
+
+    try:
+        ref_doc = load_subtitle(reference)
+        sub_doc = load_subtitle(subtitle)
+        if len(ref_doc) == 0 or len(sub_doc) == 0:
+            callbacks._error("No subtitle cues found to align.")
+            return 1
+        ratios = [1.0]
+        if not option("disable_fps_guessing"):
+            ratios += FRAMERATE_RATIOS + [1.0 / r for r in FRAMERATE_RATIOS]
+        max_offset = option("max_offset_seconds")
+        offset_ms, ratio, score = find_alignment(
+            ref_doc.starts,
+            ref_doc.ends,
+            sub_doc.starts,
+            sub_doc.ends,
+            max_offset_ms=int(max_offset * 1000) if max_offset else None,
+            ratios=ratios,
+            is_cancelled=callbacks._cancelled,
+        )
+    except AlignmentCancelled:
+        return 1
+    except (OSError, ValueError, SyntaxError) as e:
+        callbacks._error(str(e))
+        return 1
+    if callbacks._cancelled():
+        return 1
+    callbacks._subprocess_line(f"score: {score:.0f}", False)
+    callbacks._subprocess_line(f"offset seconds: {offset_ms / 1000:.3f}", False)
+    callbacks._subprocess_line(f"framerate scale factor: {ratio:.3f}", False)
+    save_subtitle(
+        apply_alignment(sub_doc, offset_ms, ratio), output, format_for_path(output)
+    )
+    callbacks._progress(100.0)
+    logger.info(f"Aligned {subtitle} by {offset_ms}ms (ratio {ratio:.4f}): {output}")
+    return 0
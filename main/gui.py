@@ -23,6 +23,7 @@ from PyQt6.QtGui import QIcon, QDragEnterEvent, QDropEvent, QAction, QActionGrou
 
 from utils import *
 from constants import *
+from constants import DEFAULT_OPTIONS, VERSION
 
 # Import batch mode functionality
 from gui_batch_mode import (
@@ -834,6 +835,11 @@ class autosubsyncapp(QWidget):
         self.add_custom_suffix_action.triggered.connect(self.set_custom_suffix)
         self.settings_menu.addAction(self.add_custom_suffix_action)
 
+        self.batch_concurrency_action = QAction(texts.BATCH_CONCURRENT_JOBS, self)
+        self.update_batch_concurrency_text()
+        self.batch_concurrency_action.triggered.connect(self.set_batch_concurrency)
+        self.settings_menu.addAction(self.batch_concurrency_action)
+
         self.settings_menu.addSeparator()
 
         # Add 'Open config directory' option at the top
@@ -1042,6 +1048,30 @@ class autosubsyncapp(QWidget):
         else:
             self.add_custom_suffix_action.setText(base_text)
 
+    def set_batch_concurrency(self):
+        from PyQt6.QtWidgets import QInputDialog
+
+        current = self.config.get(
+            "batch_concurrency", DEFAULT_OPTIONS["batch_concurrency"]
+        )
+        value, ok = QInputDialog.getInt(
+            self,
+            str(texts.BATCH_CONCURRENT_JOBS),
+            str(texts.ENTER_BATCH_CONCURRENT_JOBS),
+            value=max(1, int(current or 1)),
+            min=1,
+            max=max(1, os.cpu_count() or 1),
+        )
+        if ok:
+            update_config(self, "batch_concurrency", value)
+            self.update_batch_concurrency_text()
+
+    def update_batch_concurrency_text(self):
+        val = self.config.get("batch_concurrency", DEFAULT_OPTIONS["batch_concurrency"])
+        self.batch_concurrency_action.setText(
+            f"{texts.BATCH_CONCURRENT_JOBS} ({val})"
+        )
+
     def show_settings_menu(self):
         # Show the menu at the right position below the button
         self.settings_menu.popup(
@@ -1184,6 +1214,7 @@ class autosubsyncapp(QWidget):
         """Backup the processed items database to a user-selected location."""
         from processed_items_manager import get_processed_items_manager
         import shutil
+        import tempfile
 
         manager = get_processed_items_manager()
         db_path = manager.get_db_path()
@@ -1204,7 +1235,25 @@ class autosubsyncapp(QWidget):
 
         if save_path:
             try:
-                shutil.copy2(db_path, save_path)
+                # The SQLite backup API includes writes still in the WAL file,
+                # which a plain file copy would miss
+                if os.path.exists(save_path) and os.path.samefile(save_path, db_path):
+                    raise shutil.SameFileError(
+                        f"{db_path!r} and {save_path!r} are the same file"
+                    )
+                # Write next to the destination and swap it in only once the
+                # backup succeeded, so a failure keeps the previous backup
+                fd, tmp_path = tempfile.mkstemp(
+                    suffix=".db", dir=os.path.dirname(os.path.abspath(save_path))
+                )
+                os.close(fd)
+                try:
+                    if not manager.backup_to(tmp_path):
+                        raise OSError(db_path)
+                    os.replace(tmp_path, save_path)
+                finally:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
                 QMessageBox.information(
                     self,
                     texts.BACKUP_PROCESSED_DATABASE,
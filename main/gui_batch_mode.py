@@ -8,8 +8,8 @@ The module exports:
 """
 
 from PyQt6.QtWidgets import (
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTableView,
+    QHeaderView,
     QAbstractItemView,
     QMenu,
     QMessageBox,
@@ -25,7 +25,10 @@ from PyQt6.QtGui import QCursor, QColor, QShortcut, QKeySequence
 import os
 import re
 import logging
+from contextlib import contextmanager
 import texts
+import batch_model
+from batch_model import BatchCommand, BatchItem, BatchItemDelegate, BatchModel
 from constants import VIDEO_EXTENSIONS, SUBTITLE_EXTENSIONS, COLORS, DEFAULT_OPTIONS
 from utils import update_config, open_filedialog, open_folder, load_config
 
@@ -70,34 +73,30 @@ def get_basename(file_path):
     return os.path.basename(file_path) if file_path else ""
 
 
-from pairing import effective_basename, calculate_file_similarity, pair_paths  # noqa: E402,F401
+from pairing import effective_basename, calculate_file_similarity, pair_exact, pair_paths  # noqa: E402,F401
 
 
-def create_tree_widget_item(file_path, parent=None, icon_provider=None, item_id=None):
-    """Create a QTreeWidgetItem for a file path.
+def create_tree_widget_item(file_path, parent=None, item_id=None):
+    """Create a batch list item for a file path.
+
+    The file icon is not looked up here; the model resolves it when the row
+    is first painted.
 
     Args:
         file_path: Path to the file
         parent: Optional parent item
-        icon_provider: Optional QFileIconProvider for file icons
         item_id: Optional ID for the item
 
     Returns:
-        A configured QTreeWidgetItem
+        A configured BatchItem
     """
-    basename = get_basename(file_path)
-    if parent:
-        item = QTreeWidgetItem(parent, [basename])
-    else:
-        item = QTreeWidgetItem([basename])
-
+    item = BatchItem(get_basename(file_path))
     item.setData(0, Qt.ItemDataRole.UserRole, file_path)
     if item_id is not None:
         item.setData(0, BatchTreeView.ITEM_ID_ROLE, item_id)
 
-    # Add icon if provider is available
-    if icon_provider:
-        item.setIcon(0, icon_provider.icon(QFileInfo(file_path)))
+    if parent:
+        parent.addChild(item)
 
     return item
 
@@ -131,6 +130,8 @@ class ProcessedItemsScanner(QObject):
     item_scanned = pyqtSignal(str, bool)  # filepath, is_processed
     scan_finished = pyqtSignal(dict)  # results: {filepath: is_processed}
 
+    CHUNK_SIZE = 256  # Files checked per bulk database lookup
+
     def __init__(self):
         super().__init__()
         self._files_to_scan = []
@@ -157,14 +158,19 @@ class ProcessedItemsScanner(QObject):
         manager = get_processed_items_manager()
         total = len(self._files_to_scan)
 
-        for i, filepath in enumerate(self._files_to_scan):
+        # Check files in chunks so progress is reported and stop requests are
+        # honoured while each chunk is hashed in parallel.
+        for start in range(0, total, self.CHUNK_SIZE):
             if self._should_stop:
                 break
 
-            is_processed = manager.is_processed(filepath)
-            results[filepath] = is_processed
-            self.item_scanned.emit(filepath, is_processed)
-            self.scan_progress.emit(i + 1, total)
+            chunk = self._files_to_scan[start : start + self.CHUNK_SIZE]
+            chunk_results = manager.is_processed_many(chunk)
+            for filepath in chunk:
+                is_processed = chunk_results.get(filepath, False)
+                results[filepath] = is_processed
+                self.item_scanned.emit(filepath, is_processed)
+            self.scan_progress.emit(min(start + len(chunk), total), total)
 
         self._is_running = False
         self.scan_finished.emit(results)
@@ -184,6 +190,8 @@ class DatabaseOperationWorker(QObject):
         int, str
     )  # count, operation_type ('add' or 'remove')
 
+    CHUNK_SIZE = 256  # Files written per database transaction
+
     def __init__(self):
         super().__init__()
         self._file_paths = []
@@ -212,36 +220,85 @@ class DatabaseOperationWorker(QObject):
         total = len(self._file_paths)
         success_count = 0
 
-        for i, filepath in enumerate(self._file_paths):
+        # One transaction per chunk instead of one per file
+        for start in range(0, total, self.CHUNK_SIZE):
             if self._should_stop:
                 break
 
+            chunk = self._file_paths[start : start + self.CHUNK_SIZE]
             if self._operation == "add":
-                success = manager.mark_as_processed(filepath, silent=True)
+                chunk_results = manager.mark_many(chunk)
             else:  # remove
-                success = manager.remove_from_processed(filepath, silent=True)
-
-            if success:
-                success_count += 1
+                chunk_results = manager.remove_many(chunk)
 
-            self.item_processed.emit(filepath, success)
-            self.operation_progress.emit(i + 1, total)
+            for filepath in chunk:
+                success = chunk_results.get(filepath, False)
+                if success:
+                    success_count += 1
+                self.item_processed.emit(filepath, success)
+            self.operation_progress.emit(min(start + len(chunk), total), total)
 
         self._is_running = False
         self.operation_finished.emit(success_count, self._operation)
 
 
-class BatchTreeView(QTreeWidget):
+class _ProcessedItemsCache(dict):
+    """filepath -> is_processed dict that reports which paths changed.
+
+    The batch view uses this to restyle just the items whose entry changed.
+    clear() reports None, meaning every path.
+    """
+
+    def __init__(self, on_change):
+        super().__init__()
+        self._on_change = on_change
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._on_change((key,))
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._on_change((key,))
+
+    def update(self, *args, **kwargs):
+        changes = dict(*args, **kwargs)
+        super().update(changes)
+        self._on_change(changes)
+
+    def pop(self, key, *default):
+        value = super().pop(key, *default)
+        self._on_change((key,))
+        return value
+
+    def clear(self):
+        super().clear()
+        self._on_change(None)
+
+
+class BatchTreeView(QTableView):
+    """The batch list: reference files with their subtitles as children.
+
+    Items are BatchItem objects held by a BatchModel, which shows the tree as
+    a flat list of rows with the indentation drawn by BatchItemDelegate. The
+    QTreeWidget-style helpers (topLevelItem, selectedItems, ...) keep the
+    rest of the batch code independent of that.
+    """
+
     VALID_STATE_ROLE = (
-        Qt.ItemDataRole.UserRole + 10
+        batch_model.VALID_STATE_ROLE
     )  # Role to store parent item's validity state
-    ITEM_ID_ROLE = Qt.ItemDataRole.UserRole + 11  # Role to store the item's unique ID
+    ITEM_ID_ROLE = batch_model.ITEM_ID_ROLE  # Role to store the item's unique ID
     PROCESSED_STATE_ROLE = (
-        Qt.ItemDataRole.UserRole + 12
+        batch_model.PROCESSED_STATE_ROLE
     )  # Role to store if item is already processed
     FORCE_PROCESS_ROLE = (
-        Qt.ItemDataRole.UserRole + 13
+        batch_model.FORCE_PROCESS_ROLE
     )  # Role to store if item should be force processed
+    INDENTATION = 20  # Pixels per tree level
+    ROW_HEIGHT = 32
+
+    itemSelectionChanged = pyqtSignal()
 
     def _is_parent_item_valid(self, item):
         """Helper to determine if a parent item is valid.
@@ -271,23 +328,47 @@ class BatchTreeView(QTreeWidget):
     def is_duplicate_pair(self, reference_path, sub_path):
         """Return True if (reference_path, sub_path) matches an existing valid top-level pair."""
         norm_v, norm_s = os.path.normpath(reference_path), os.path.normpath(sub_path)
+        self._refresh_changed_items()  # Include pairs added since the last update
         return (norm_v, norm_s) in self._current_pair_id_set
 
     def __init__(self, parent_app=None):  # parent_app is the autosubsyncapp instance
         super().__init__(parent_app)
         self.app_parent = parent_app
         self._next_item_id = 1  # Initialize the ID counter
-        self.setColumnCount(1)
-        self.setHeaderHidden(False)  # Show header to display pair counts
-        # self.headerItem().setTextAlignment(0, Qt.AlignCenter)
+        self._model = BatchModel(self)
+        self.setModel(self._model)
+        self._delegate = BatchItemDelegate(self, self.INDENTATION)
+        self.setItemDelegate(self._delegate)
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        header = self.horizontalHeader()  # Header displays pair counts
+        header.setStretchLastSection(True)
+        header.setHighlightSections(False)
+        header.setSectionsClickable(False)
+        header.setDefaultAlignment(
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        )
+        rows = self.verticalHeader()
+        rows.hide()
+        rows.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        rows.setDefaultSectionSize(self.ROW_HEIGHT)
         self.setAcceptDrops(True)
         self.setDragEnabled(True)
         self.setDropIndicatorShown(True)
+        self.setDragDropOverwriteMode(False)  # Allow drops between rows
         self.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
         self.icon_provider = QFileIconProvider()
+        self._model.icon_provider = self.icon_provider
         self.setSelectionMode(
             QAbstractItemView.SelectionMode.ExtendedSelection
         )  # Allow multi-selection for removal
+        self.selectionModel().selectionChanged.connect(
+            lambda *args: self.itemSelectionChanged.emit()
+        )
+        self.doubleClicked.connect(self._toggle_expanded)
 
         self._update_ui_timer = QTimer(self)
         self._update_ui_timer.setSingleShot(True)
@@ -295,7 +376,9 @@ class BatchTreeView(QTreeWidget):
         self._update_ui_timer.timeout.connect(self._perform_actual_ui_update)
 
         # Smart Deduplication - async scanning setup
-        self._processed_items_cache = {}  # Cache: filepath -> is_processed
+        self._processed_items_cache = _ProcessedItemsCache(
+            self._on_processed_cache_changed
+        )  # Cache: filepath -> is_processed
         self._scanner_thread = None
         self._scanner = None
         self._is_scanning = False
@@ -305,30 +388,32 @@ class BatchTreeView(QTreeWidget):
         self._scan_debounce_timer.setInterval(100)  # Debounce scan requests
         self._scan_debounce_timer.timeout.connect(self._start_pending_scan)
 
-        self._items_to_re_expand_paths = (
-            set()
-        )  # For preserving expansion state during moves
-
-        # Cache for performance optimization
+        # Validation state, updated incrementally by _refresh_changed_items
         self._current_pair_id_set = set()
-        self._item_to_pair_id_map = {}
+        self._item_to_pair_id_map = {}  # top-level item -> its pair ids
+        self._pair_owners = {}  # pair id -> top-level items holding it
+        self._items_by_path = {}  # normalized path -> top-level items
+        self._item_paths = {}  # top-level item -> normalized path
+        self._item_counts = {}  # top-level item -> (valid, invalid, skipped)
+        self._pair_counts = (0, 0, 0)  # Header totals
+        self._colors = None  # Parsed background colors, see _style_colors
 
         # Drag state management
         self._is_drag_highlighted = False
-        self._base_stylesheet = "QTreeView::item { height: 32px; }"
+        self._base_stylesheet = ""
         self._update_stylesheet()
 
-        # Connect model signals to schedule UI update
-        model = self.model()
-        model.rowsInserted.connect(self._schedule_ui_update)
-        model.rowsRemoved.connect(self._schedule_ui_update)
-        model.modelReset.connect(self._schedule_ui_update)
+        # Schedule a UI update whenever items are added, removed or moved
+        self._model.structure_changed.connect(self._schedule_ui_update)
 
         # Undo/Redo stacks
-        self._undo_stack = []  # Stack of saved states for undo
-        self._redo_stack = []  # Stack of saved states for redo
-        self._max_undo_levels = 100  # Maximum number of undo levels
+        self._undo_stack = []  # Stack of BatchCommand entries for undo
+        self._redo_stack = []  # Stack of BatchCommand entries for redo
+        self._undo_memory_budget = (
+            64 * 1024 * 1024
+        )  # Bytes the undo/redo entries may keep alive
         self._is_restoring_state = False  # Flag to prevent saving state during restore
+        self._undo_depth = 0  # Nesting of _undo_step blocks
 
         # Track if library has been loaded (for Load/Reload library text)
         self._library_loaded = False
@@ -423,6 +508,62 @@ class BatchTreeView(QTreeWidget):
         self._next_item_id += 1
         return current_id
 
+    # --- QTreeWidget-style item access ---
+
+    def invisibleRootItem(self):
+        """The parent of all top-level items."""
+        return self._model.root
+
+    def topLevelItemCount(self):
+        return self._model.root.childCount()
+
+    def topLevelItem(self, index):
+        return self._model.root.child(index)
+
+    def indexOfTopLevelItem(self, item):
+        return self._model.root.indexOfChild(item)
+
+    def insertTopLevelItem(self, index, item):
+        self._model.root.insertChild(index, item)
+
+    def insertTopLevelItems(self, index, items):
+        self._model.root.insertChildren(index, items)
+
+    def addTopLevelItem(self, item):
+        self._model.root.addChild(item)
+
+    def addTopLevelItems(self, items):
+        self._model.root.addChildren(items)
+
+    def takeTopLevelItem(self, index):
+        return self._model.root.takeChild(index)
+
+    def clear(self):
+        self._model.clear()
+
+    def itemAt(self, pos):
+        return self._model.item_from_index(self.indexAt(pos))
+
+    def currentItem(self):
+        return self._model.item_from_index(self.currentIndex())
+
+    def setCurrentItem(self, item):
+        self.setCurrentIndex(self._model.index_from_item(item))
+
+    def selectedItems(self):
+        """Selected items in display order."""
+        rows = sorted(
+            (selection_range.top(), selection_range.bottom())
+            for selection_range in self.selectionModel().selection()
+        )
+        items = []
+        for top, bottom in rows:
+            items.extend(self._model.items_in_rows(top, bottom))
+        return list(dict.fromkeys(items))
+
+    def setHeaderLabel(self, text):
+        self._model.set_header_label(text)
+
     # --- Smart Deduplication Methods ---
 
     def _is_skip_processed_enabled(self):
@@ -527,17 +668,21 @@ class BatchTreeView(QTreeWidget):
 
     def _mark_item_as_processed(self, filepath):
         """Mark a specific item as processed based on filepath."""
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            if item:
-                item_path = item.data(0, Qt.ItemDataRole.UserRole)
-                if item_path and os.path.normpath(item_path) == os.path.normpath(
-                    filepath
-                ):
-                    # Check if not force processed
-                    if not item.data(0, self.FORCE_PROCESS_ROLE):
-                        item.setData(0, self.PROCESSED_STATE_ROLE, True)
-                        self._apply_processed_style(item, True)
+        self._refresh_changed_items()  # Index items added since the last update
+        for item in list(self._items_by_path.get(os.path.normpath(filepath), ())):
+            # Check if not force processed
+            if not item.data(0, self.FORCE_PROCESS_ROLE):
+                item.setData(0, self.PROCESSED_STATE_ROLE, True)
+                self._apply_processed_style(item, True)
+
+    def _on_processed_cache_changed(self, paths):
+        """Mark items whose processed cache entry changed for restyling."""
+        if paths is None:
+            self._model.mark_all_changed()
+            return
+        for path in paths:
+            for item in self._items_by_path.get(path, ()):
+                self._model.mark_changed(item)
 
     def _update_processed_visual_state(self):
         """Update visual state for all items based on processed status."""
@@ -574,7 +719,7 @@ class BatchTreeView(QTreeWidget):
     def _apply_processed_style(self, item, is_processed):
         """Apply visual styling to indicate an item is already processed."""
         if is_processed and self._is_skip_processed_enabled():
-            processed_color = self._parse_rgba_to_qcolor(COLORS["PROCESSED_BACKGROUND"])
+            processed_color = self._style_colors()[2]
             item.setBackground(0, processed_color)
             # Set tooltip
             item.setToolTip(0, str(texts.ITEM_ALREADY_PROCESSED))
@@ -650,221 +795,233 @@ class BatchTreeView(QTreeWidget):
         Args:
             folders: List of folder paths to scan
         """
-        # First, remove items that no longer exist on disk
-        items_to_remove = []
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            if item:
-                item_path = item.data(0, Qt.ItemDataRole.UserRole)
-                if item_path and not os.path.exists(item_path):
-                    items_to_remove.append(item)
-                # Also check children (subtitles) - if subtitle is missing, just clear it
-                for j in range(item.childCount()):
-                    child = item.child(j)
-                    if child:
-                        child_path = child.data(0, Qt.ItemDataRole.UserRole)
-                        if child_path and not os.path.exists(child_path):
-                            # Mark for removal from parent
-                            item.removeChild(child)
-
-        if items_to_remove:
-            self._save_state_for_undo()
-            for item in items_to_remove:
-                index = self.indexOfTopLevelItem(item)
-                if index >= 0:
-                    self.takeTopLevelItem(index)
-            logger.info(
-                f"Removed {len(items_to_remove)} items - files no longer exist on disk"
-            )
-            self._update_header_pair_counts()
-
-        if not folders:
-            return
-
-        # Get valid folders that exist
-        valid_folders = [f for f in folders if os.path.isdir(f)]
-        if not valid_folders:
-            return
-
-        # Collect all existing file paths in the batch list (both references and subtitles)
-        existing_files = set()
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            if item:
-                item_path = item.data(0, Qt.ItemDataRole.UserRole)
-                if item_path:
-                    existing_files.add(os.path.normpath(item_path))
-                # Also check children (subtitles)
-                for j in range(item.childCount()):
-                    child = item.child(j)
-                    if child:
-                        child_path = child.data(0, Qt.ItemDataRole.UserRole)
-                        if child_path:
-                            existing_files.add(os.path.normpath(child_path))
-
-        # Collect new files from library folders
-        new_files = []
-        for folder in valid_folders:
-            for root, _, filenames in os.walk(folder):
-                for filename in filenames:
-                    file_path = os.path.join(root, filename)
-                    norm_path = os.path.normpath(file_path)
-                    ext = os.path.splitext(file_path)[1].lower()
-                    if ext in VIDEO_EXTENSIONS or ext in SUBTITLE_EXTENSIONS:
-                        if norm_path not in existing_files:
-                            new_files.append(file_path)
+        with self._undo_step():
+            # Get valid folders that exist and list them through the scan index,
+            # which only re-reads directories whose mtime changed since last time
+            from scan_index import get_scan_index
+
+            valid_folders = [f for f in folders if os.path.isdir(f)] if folders else []
+            scan_index = get_scan_index()
+            library_files = []
+            listed_dirs = set()
+            for folder in valid_folders:
+                for root, filenames in scan_index.walk(folder):
+                    listed_dirs.add(os.path.normcase(os.path.normpath(root)))
+                    library_files.extend(os.path.join(root, f) for f in filenames)
+            scan_index.save()
+            library_set = {os.path.normcase(os.path.normpath(f)) for f in library_files}
+
+            def file_exists(path):
+                # Files in listed library directories are checked against the
+                # listing; anything else falls back to a stat
+                norm_path = os.path.normcase(os.path.normpath(path))
+                if os.path.dirname(norm_path) in listed_dirs:
+                    return norm_path in library_set
+                return os.path.exists(path)
+
+            # First, remove items that no longer exist on disk
+            items_to_remove = []
+            for i in range(self.topLevelItemCount()):
+                item = self.topLevelItem(i)
+                if item:
+                    item_path = item.data(0, Qt.ItemDataRole.UserRole)
+                    if item_path and not file_exists(item_path):
+                        items_to_remove.append(item)
+                    # Also check children (subtitles) - if subtitle is missing, just clear it
+                    for j in range(item.childCount()):
+                        child = item.child(j)
+                        if child:
+                            child_path = child.data(0, Qt.ItemDataRole.UserRole)
+                            if child_path and not file_exists(child_path):
+                                # Mark for removal from parent
+                                item.removeChild(child)
+
+            if items_to_remove:
+                self._save_state_for_undo()
+                self._model.remove_items(items_to_remove)
+                logger.info(
+                    f"Removed {len(items_to_remove)} items - files no longer exist on disk"
+                )
+                self._update_header_pair_counts()
 
-        if not new_files:
-            return
+            if not valid_folders:
+                return
 
-        # Save state for undo before making changes
-        self._save_state_for_undo()
+            # Collect all existing file paths in the batch list (both references and subtitles)
+            existing_files = set()
+            for i in range(self.topLevelItemCount()):
+                item = self.topLevelItem(i)
+                if item:
+                    item_path = item.data(0, Qt.ItemDataRole.UserRole)
+                    if item_path:
+                        existing_files.add(os.path.normpath(item_path))
+                    # Also check children (subtitles)
+                    for j in range(item.childCount()):
+                        child = item.child(j)
+                        if child:
+                            child_path = child.data(0, Qt.ItemDataRole.UserRole)
+                            if child_path:
+                                existing_files.add(os.path.normpath(child_path))
+
+            # Collect new files from library folders
+            new_files = []
+            for file_path in library_files:
+                norm_path = os.path.normpath(file_path)
+                ext = os.path.splitext(file_path)[1].lower()
+                if ext in VIDEO_EXTENSIONS or ext in SUBTITLE_EXTENSIONS:
+                    if norm_path not in existing_files:
+                        new_files.append(file_path)
 
-        # Process and pair the new files, then insert at the beginning
-        logger.info(f"Found {len(new_files)} new files in library folders")
+            if not new_files:
+                return
 
-        # Separate into videos and subtitles
-        new_videos = [f for f in new_files if get_file_extension(f) in VIDEO_EXTENSIONS]
-        new_subs = [
-            f for f in new_files if get_file_extension(f) in SUBTITLE_EXTENSIONS
-        ]
+            # Save state for undo before making changes
+            self._save_state_for_undo()
 
-        # Pair them using the existing pairing logic
-        paired_references = set()
-        paired_subs = set()
-        pairs_to_add = []
+            # Process and pair the new files, then insert at the beginning
+            logger.info(f"Found {len(new_files)} new files in library folders")
+
+            # Separate into videos and subtitles
+            new_videos = [f for f in new_files if get_file_extension(f) in VIDEO_EXTENSIONS]
+            new_subs = [
+                f for f in new_files if get_file_extension(f) in SUBTITLE_EXTENSIONS
+            ]
+
+            # Pair them using the existing pairing logic (exact name matches)
+            exact_pairs, _, paired_subs = pair_exact(new_videos, new_subs)
+            pairs_to_add = []
+            matches = iter(exact_pairs)
+            match = next(matches, None)
+            for video in new_videos:
+                if match is not None and match[0] == video:
+                    pairs_to_add.append(match)
+                    match = next(matches, None)
+                else:
+                    # Add video without subtitle
+                    pairs_to_add.append((video, None))
 
-        # Try to pair videos with subtitles
-        for video in new_videos:
-            video_base = effective_basename(video).lower().strip(".-_ [](){}")
-            best_match = None
+            # Add remaining unpaired subtitles as standalone items
             for sub in new_subs:
-                if sub in paired_subs:
-                    continue
-                sub_base = effective_basename(sub).lower().strip(".-_ [](){}")
-                if video_base == sub_base:
-                    best_match = sub
-                    break
-
-            if best_match:
-                pairs_to_add.append((video, best_match))
-                paired_references.add(video)
-                paired_subs.add(best_match)
-            else:
-                # Add video without subtitle
-                pairs_to_add.append((video, None))
-                paired_references.add(video)
-
-        # Add remaining unpaired subtitles as standalone items
-        for sub in new_subs:
-            if sub not in paired_subs:
-                pairs_to_add.append((None, sub))
-
-        # Create all items first, then sort them
-        newly_created_items = []
-        for video, sub in pairs_to_add:
-            if video and sub:
-                # Create paired item
-                if not self.is_duplicate_pair(video, sub):
+                if sub not in paired_subs:
+                    pairs_to_add.append((None, sub))
+
+            # Create all items first, then sort them
+            newly_created_items = []
+            for video, sub in pairs_to_add:
+                if video and sub:
+                    # Create paired item
+                    if not self.is_duplicate_pair(video, sub):
+                        item = self._create_tree_item(video)
+                        sub_item = self._create_tree_item(sub)
+                        item.addChild(sub_item)
+                        item.setExpanded(True)
+                        # Track the pair
+                        norm_v, norm_s = os.path.normpath(video), os.path.normpath(sub)
+                        self._current_pair_id_set.add((norm_v, norm_s))
+                        newly_created_items.append(item)
+                elif video:
+                    # Add video without subtitle
                     item = self._create_tree_item(video)
-                    sub_item = self._create_tree_item(sub)
-                    item.addChild(sub_item)
-                    item.setExpanded(True)
-                    # Track the pair
-                    norm_v, norm_s = os.path.normpath(video), os.path.normpath(sub)
-                    self._current_pair_id_set.add((norm_v, norm_s))
                     newly_created_items.append(item)
-            elif video:
-                # Add video without subtitle
-                item = self._create_tree_item(video)
-                newly_created_items.append(item)
-            elif sub:
-                # Add subtitle without video (rare case)
-                item = self._create_tree_item(sub)
-                newly_created_items.append(item)
-
-        if newly_created_items:
-            # Check processed status directly from database for sorting
-            from processed_items_manager import get_processed_items_manager
-
-            manager = get_processed_items_manager()
-
-            # Sort items: invalid not-skipped (0), valid not-skipped (1), invalid skipped (2), valid skipped (3)
-            def get_sort_key(item):
-                is_valid = self._get_provisional_validity(item) == "valid"
-                # Check if item is processed (will be skipped) - check for all video files
-                item_path = item.data(0, Qt.ItemDataRole.UserRole)
-                is_processed = False
-                if item_path and is_video_file(item_path):
-                    # Check database directly for accurate status
-                    is_processed = manager.is_processed(item_path)
-                    # Also update cache
-                    norm_path = os.path.normpath(item_path)
-                    self._processed_items_cache[norm_path] = is_processed
+                elif sub:
+                    # Add subtitle without video (rare case)
+                    item = self._create_tree_item(sub)
+                    newly_created_items.append(item)
 
-                # Sorting priority:
-                # 0: Invalid not-skipped (need attention first)
-                # 1: Valid not-skipped (ready to process)
-                # 2: Invalid skipped
-                # 3: Valid skipped (last)
-                if not is_valid and not is_processed:
-                    return (0, os.path.basename(item_path or "").lower())
-                elif is_valid and not is_processed:
-                    return (1, os.path.basename(item_path or "").lower())
-                elif not is_valid and is_processed:
-                    return (2, os.path.basename(item_path or "").lower())
-                else:  # is_valid and is_processed
-                    return (3, os.path.basename(item_path or "").lower())
+            if newly_created_items:
+                # Check processed status directly from database for sorting
+                from processed_items_manager import get_processed_items_manager
 
-            newly_created_items.sort(key=get_sort_key)
+                manager = get_processed_items_manager()
 
-            # Insert items at the beginning of the list (in reverse order to maintain sort)
-            # Also apply processed state immediately based on cache
-            for item in reversed(newly_created_items):
-                self.insertTopLevelItem(0, item)
-                # Apply processed visual state if applicable
-                item_path = item.data(0, Qt.ItemDataRole.UserRole)
-                if item_path:
-                    norm_path = os.path.normpath(item_path)
-                    is_processed = self._processed_items_cache.get(norm_path, False)
-                    if is_processed:
-                        item.setData(0, self.PROCESSED_STATE_ROLE, True)
-                        self._apply_processed_style(item, True)
+                # Check database directly for accurate status, for all video files at once
+                video_paths = [
+                    path
+                    for path in (
+                        item.data(0, Qt.ItemDataRole.UserRole)
+                        for item in newly_created_items
+                    )
+                    if path and is_video_file(path)
+                ]
+                processed_status = manager.is_processed_many(video_paths)
+
+                # Sort items: invalid not-skipped (0), valid not-skipped (1), invalid skipped (2), valid skipped (3)
+                def get_sort_key(item):
+                    is_valid = self._get_provisional_validity(item) == "valid"
+                    # Check if item is processed (will be skipped) - check for all video files
+                    item_path = item.data(0, Qt.ItemDataRole.UserRole)
+                    is_processed = False
+                    if item_path and is_video_file(item_path):
+                        is_processed = processed_status.get(item_path, False)
+                        # Also update cache
+                        norm_path = os.path.normpath(item_path)
+                        self._processed_items_cache[norm_path] = is_processed
+
+                    # Sorting priority:
+                    # 0: Invalid not-skipped (need attention first)
+                    # 1: Valid not-skipped (ready to process)
+                    # 2: Invalid skipped
+                    # 3: Valid skipped (last)
+                    if not is_valid and not is_processed:
+                        return (0, os.path.basename(item_path or "").lower())
+                    elif is_valid and not is_processed:
+                        return (1, os.path.basename(item_path or "").lower())
+                    elif not is_valid and is_processed:
+                        return (2, os.path.basename(item_path or "").lower())
+                    else:  # is_valid and is_processed
+                        return (3, os.path.basename(item_path or "").lower())
+
+                newly_created_items.sort(key=get_sort_key)
+
+                # Insert items at the beginning of the list in one step, keeping the sort
+                self.insertTopLevelItems(0, newly_created_items)
+                # Also apply processed state immediately based on cache
+                for item in newly_created_items:
+                    # Apply processed visual state if applicable
+                    item_path = item.data(0, Qt.ItemDataRole.UserRole)
+                    if item_path:
+                        norm_path = os.path.normpath(item_path)
+                        is_processed = self._processed_items_cache.get(norm_path, False)
+                        if is_processed:
+                            item.setData(0, self.PROCESSED_STATE_ROLE, True)
+                            self._apply_processed_style(item, True)
 
-            # Mark library as loaded
-            self._library_loaded = True
+                # Mark library as loaded
+                self._library_loaded = True
 
-            logger.info(
-                f"Added {len(newly_created_items)} new items from library folders"
-            )
-            self._update_header_pair_counts()
+                logger.info(
+                    f"Added {len(newly_created_items)} new items from library folders"
+                )
+                self._update_header_pair_counts()
 
     def force_process_items(self, items):
         """Mark items to be force processed, ignoring their processed status."""
-        self._save_state_for_undo()  # Save state before modifying
-        for item in items:
-            if item and not item.parent():  # Only top-level items
-                item.setData(0, self.FORCE_PROCESS_ROLE, True)
-                item.setData(0, self.PROCESSED_STATE_ROLE, False)
-                # Clear the processed tooltip
-                item.setToolTip(0, "")
+        with self._undo_step():
+            self._save_state_for_undo()  # Save state before modifying
+            for item in items:
+                if item and not item.parent():  # Only top-level items
+                    item.setData(0, self.FORCE_PROCESS_ROLE, True)
+                    item.setData(0, self.PROCESSED_STATE_ROLE, False)
+                    # Clear the processed tooltip
+                    item.setToolTip(0, "")
 
-        # Trigger UI update to restore proper styling
-        self._schedule_ui_update()
+            # Trigger UI update to restore proper styling
+            self._schedule_ui_update()
 
     def skip_process_items(self, items):
         """Mark items to be skipped (not processed), applying processed status."""
-        self._save_state_for_undo()  # Save state before modifying
-        for item in items:
-            if item and not item.parent():  # Only top-level items
-                item.setData(0, self.FORCE_PROCESS_ROLE, False)
-                item.setData(0, self.PROCESSED_STATE_ROLE, True)
-                self._apply_processed_style(item, True)
+        with self._undo_step():
+            self._save_state_for_undo()  # Save state before modifying
+            for item in items:
+                if item and not item.parent():  # Only top-level items
+                    item.setData(0, self.FORCE_PROCESS_ROLE, False)
+                    item.setData(0, self.PROCESSED_STATE_ROLE, True)
+                    self._apply_processed_style(item, True)
 
-        # Update header to reflect skipped items
-        self._update_header_pair_counts()
-        # Trigger UI update
-        self._schedule_ui_update()
+            # Update header to reflect skipped items
+            self._update_header_pair_counts()
+            # Trigger UI update
+            self._schedule_ui_update()
 
     def add_items_to_processed_database(self, items):
         """Add selected video items to the processed items database asynchronously."""
@@ -1081,47 +1238,8 @@ class BatchTreeView(QTreeWidget):
         # Check if this is an internal drag/drop operation
         is_internal_move = hasattr(self, "_in_internal_drag") and self._in_internal_drag
 
-        # Phase 1: Rebuild pair ID set and item-to-pair_id map for efficient validation
-        # Now supports one-to-many: a single parent can have multiple subtitle children
-        self._current_pair_id_set.clear()
-        self._item_to_pair_id_map.clear()
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            if (
-                item and item.childCount() >= 1
-            ):  # Potential pair structure (one or more children)
-                parent_path = item.data(0, Qt.ItemDataRole.UserRole)
-                if not parent_path:
-                    continue
-
-                norm_parent = os.path.normpath(parent_path)
-                item_pairs = []  # Store all valid pairs for this parent item
-
-                # Process all children of this parent
-                for j in range(item.childCount()):
-                    child_item = item.child(j)
-                    child_path = (
-                        child_item.data(0, Qt.ItemDataRole.UserRole)
-                        if child_item
-                        else None
-                    )
-
-                    if (
-                        child_path
-                        and not child_item.childCount()
-                        and is_subtitle_file(child_path)
-                    ):
-                        norm_child = os.path.normpath(child_path)
-                        if (
-                            norm_parent != norm_child
-                        ):  # Ensure parent and child are not the same file
-                            pair_id = (norm_parent, norm_child)
-                            self._current_pair_id_set.add(pair_id)
-                            item_pairs.append(pair_id)
-
-                # Store all pairs for this item (for duplicate detection)
-                if item_pairs:
-                    self._item_to_pair_id_map[id(item)] = item_pairs
+        # Revalidate and restyle only the items that changed since the last update
+        self._refresh_changed_items()
 
         # Continue with existing UI update logic - but ONLY trigger app parent updates if not an internal move
         if (
@@ -1131,16 +1249,7 @@ class BatchTreeView(QTreeWidget):
         ):
             self.app_parent.update_auto_sync_ui_for_batch()
 
-        # Re-apply expansion state for items that were moved
-        if self._items_to_re_expand_paths:
-            self._apply_expansion_recursive(
-                self
-            )  # Start recursion from the tree itself
-            self._items_to_re_expand_paths.clear()  # Clear after use
-
-        self._update_parent_item_style()  # Update styles for all parent items
         self._update_header_pair_counts()  # Update header with valid/invalid pair counts
-        self._sort_top_level_items()  # Sort/expand items after updates
 
         # Log appropriate message based on operation type
         if is_internal_move:
@@ -1156,21 +1265,102 @@ class BatchTreeView(QTreeWidget):
         if hasattr(self, "_in_internal_drag"):
             self._in_internal_drag = False
 
-    def _sort_top_level_items(self):
-        # Expand all top-level items
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            if item:  # Ensure item is valid
-                item.setExpanded(True)
+    def _refresh_changed_items(self):
+        """Bring pair ids, validation, styles and header counts up to date.
 
-    def _get_provisional_validity(self, item):
-        # This method determines 'validity' based on the item's current children structure.
-        # Use the helper function for validity
-        is_valid = self._is_parent_item_valid(item)
-        return "valid" if is_valid else "invalid"
+        Only the top-level items the model reports as changed are revisited,
+        plus the items sharing a pair with them, since which of several
+        duplicate pairs is invalid depends on all of them.
+        """
+        changed, removed, was_reset = self._model.take_changes()
+        if was_reset:
+            self._current_pair_id_set.clear()
+            self._item_to_pair_id_map.clear()
+            self._pair_owners.clear()
+            self._items_by_path.clear()
+            self._item_paths.clear()
+            self._item_counts.clear()
+            self._pair_counts = (0, 0, 0)
+        if not changed and not removed:
+            return
 
-    def _update_header_pair_counts(self):
-        """Updates the header with counts of valid, invalid, and skipped pairs.
+        affected_pairs = set()
+        for item in removed:
+            self._unindex_item(item, affected_pairs)
+        for item in changed:
+            self._unindex_item(item, affected_pairs)
+            self._index_item(item, affected_pairs)
+
+        items_to_update = dict.fromkeys(changed)
+        for pair_id in affected_pairs:
+            items_to_update.update(self._pair_owners.get(pair_id, {}))
+
+        # Styling writes item state that the model would report as new changes
+        self._model.track_changes = False
+        try:
+            for item in items_to_update:
+                self._style_item_recursive(item)
+                self._count_item(item)
+        finally:
+            self._model.track_changes = True
+
+    def _index_item(self, item, affected_pairs):
+        """Record the path and pair ids of a top-level item.
+
+        Supports one-to-many: a single parent can have multiple subtitle children.
+        """
+        parent_path = item.data(0, Qt.ItemDataRole.UserRole)
+        if not parent_path:
+            return
+
+        norm_parent = os.path.normpath(parent_path)
+        self._item_paths[item] = norm_parent
+        self._items_by_path.setdefault(norm_parent, {})[item] = None
+
+        item_pairs = []  # Store all valid pairs for this parent item
+        for j in range(item.childCount()):
+            child_item = item.child(j)
+            child_path = child_item.data(0, Qt.ItemDataRole.UserRole)
+            if child_path and not child_item.childCount() and is_subtitle_file(child_path):
+                norm_child = os.path.normpath(child_path)
+                if (
+                    norm_parent != norm_child
+                ):  # Ensure parent and child are not the same file
+                    pair_id = (norm_parent, norm_child)
+                    self._current_pair_id_set.add(pair_id)
+                    self._pair_owners.setdefault(pair_id, {})[item] = None
+                    item_pairs.append(pair_id)
+
+        # Store all pairs for this item (for duplicate detection)
+        if item_pairs:
+            self._item_to_pair_id_map[item] = item_pairs
+            affected_pairs.update(item_pairs)
+
+    def _unindex_item(self, item, affected_pairs):
+        """Forget the path, pair ids and counts recorded for a top-level item."""
+        for pair_id in self._item_to_pair_id_map.pop(item, ()):
+            affected_pairs.add(pair_id)
+            owners = self._pair_owners.get(pair_id)
+            if owners is None:
+                continue
+            owners.pop(item, None)
+            if not owners:
+                del self._pair_owners[pair_id]
+                self._current_pair_id_set.discard(pair_id)
+
+        norm_path = self._item_paths.pop(item, None)
+        if norm_path is not None:
+            items = self._items_by_path[norm_path]
+            items.pop(item, None)
+            if not items:
+                del self._items_by_path[norm_path]
+
+        counts = self._item_counts.pop(item, None)
+        if counts:
+            self._pair_counts = tuple(t - c for t, c in zip(self._pair_counts, counts))
+
+    def _count_item(self, item):
+        """Update the header totals with a top-level item's counts.
 
         For one-to-many relationships, each child subtitle under a valid parent
         counts as one valid pair. Invalid parents count as one invalid entry.
@@ -1180,67 +1370,60 @@ class BatchTreeView(QTreeWidget):
         invalid_parents = 0
         skipped_pairs = 0
 
-        skip_enabled = self._is_skip_processed_enabled()
-
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            is_valid = item.data(0, self.VALID_STATE_ROLE) == "valid"
+        is_valid = item.data(0, self.VALID_STATE_ROLE) == "valid"
 
-            # Check processed status from both item data and cache
-            is_processed_data = item.data(0, self.PROCESSED_STATE_ROLE)
-            is_force_process = item.data(0, self.FORCE_PROCESS_ROLE)
+        # Check processed status from both item data and cache
+        is_processed_data = item.data(0, self.PROCESSED_STATE_ROLE)
+        is_force_process = item.data(0, self.FORCE_PROCESS_ROLE)
 
-            # Also check cache for processed status
-            item_path = item.data(0, Qt.ItemDataRole.UserRole)
-            is_processed_cache = False
-            if item_path:
-                norm_path = os.path.normpath(item_path)
-                is_processed_cache = self._processed_items_cache.get(norm_path, False)
+        # Also check cache for processed status
+        item_path = item.data(0, Qt.ItemDataRole.UserRole)
+        is_processed_cache = False
+        if item_path:
+            norm_path = os.path.normpath(item_path)
+            is_processed_cache = self._processed_items_cache.get(norm_path, False)
 
-            is_processed = (
-                is_processed_data or is_processed_cache
-            ) and not is_force_process
+        is_processed = (
+            is_processed_data or is_processed_cache
+        ) and not is_force_process
 
-            if is_valid:
-                child_count = item.childCount()
-                if skip_enabled and is_processed:
-                    # Count as skipped
-                    skipped_pairs += child_count
-                else:
-                    # Count as valid
-                    valid_pairs += child_count
+        if is_valid:
+            child_count = item.childCount()
+            if self._is_skip_processed_enabled() and is_processed:
+                # Count as skipped
+                skipped_pairs += child_count
             else:
-                invalid_parents += 1
+                # Count as valid
+                valid_pairs += child_count
+        else:
+            invalid_parents += 1
 
+        counts = (valid_pairs, invalid_parents, skipped_pairs)
+        old_counts = self._item_counts.get(item, (0, 0, 0))
+        self._item_counts[item] = counts
+        self._pair_counts = tuple(
+            t - o + c for t, o, c in zip(self._pair_counts, old_counts, counts)
+        )
+
+    def _get_provisional_validity(self, item):
+        # This method determines 'validity' based on the item's current children structure.
+        # Use the helper function for validity
+        is_valid = self._is_parent_item_valid(item)
+        return "valid" if is_valid else "invalid"
+
+    def _update_header_pair_counts(self):
+        """Updates the header with counts of valid, invalid, and skipped pairs.
+
+        The counts are kept per top-level item (see _count_item), so only
+        items that changed since the last update are counted again.
+        """
+        self._refresh_changed_items()
+        valid_pairs, invalid_parents, skipped_pairs = self._pair_counts
         header_text = texts.PAIRS_HEADER_LABEL.format(
             valid=valid_pairs, invalid=invalid_parents, skipped=skipped_pairs
         )
         self.setHeaderLabel(header_text)
 
-    def _apply_expansion_recursive(self, parent_item_or_tree):
-        """Recursively expand items whose paths are in the re-expansion set."""
-        # Determine if we're processing a tree widget or a tree item
-        is_tree = not isinstance(parent_item_or_tree, QTreeWidgetItem)
-        get_child = (
-            parent_item_or_tree.topLevelItem if is_tree else parent_item_or_tree.child
-        )
-        child_count = (
-            parent_item_or_tree.topLevelItemCount()
-            if is_tree
-            else parent_item_or_tree.childCount()
-        )
-
-        # Process all children
-        for i in range(child_count):
-            if item := get_child(i):
-                # Re-expand if needed
-                if path := item.data(0, Qt.ItemDataRole.UserRole):
-                    if path in self._items_to_re_expand_paths:
-                        item.setExpanded(True)
-                # Process children recursively
-                if item.childCount() > 0:
-                    self._apply_expansion_recursive(item)
-
     def _parse_rgba_to_qcolor(self, rgba_str):
         """Helper to convert "rgba(R,G,B,A_float)" string to QColor."""
         match = re.match(r"rgba\((\d+),\s*(\d+),\s*(\d+),\s*([\d.]+)\)", rgba_str)
@@ -1254,6 +1437,17 @@ class BatchTreeView(QTreeWidget):
         # For now, returning transparent, but you might want to log an error.
         return Qt.GlobalColor.transparent
 
+    def _style_colors(self):
+        """(valid, invalid, processed, default) background colors, parsed once."""
+        if self._colors is None:
+            self._colors = (
+                self._parse_rgba_to_qcolor(COLORS["GREEN_BACKGROUND_HOVER"]),
+                self._parse_rgba_to_qcolor(COLORS["RED_BACKGROUND_HOVER"]),
+                self._parse_rgba_to_qcolor(COLORS["PROCESSED_BACKGROUND"]),
+                QColor(Qt.GlobalColor.transparent),
+            )
+        return self._colors
+
     def _set_item_tooltip(self, item, message=None):
         """Set tooltip for items - only show validity status for parent items."""
         if not item:
@@ -1307,7 +1501,7 @@ class BatchTreeView(QTreeWidget):
         Supports one-to-many relationships: a parent can have multiple subtitle children.
         Each child must be a subtitle file (not video), and must not be nested.
         Also checks for duplicate children within the same parent and marks them.
-        Uses precomputed _current_pair_id_set for duplicate checks.
+        Uses the pair index built by _index_item for duplicate checks.
         """
 
         # Check if item has at least one child
@@ -1385,26 +1579,16 @@ class BatchTreeView(QTreeWidget):
         if has_duplicates:
             return False, texts.BATCH_VALIDATE_DUPLICATE_CHILD
 
-        # Check for duplicates using the precomputed set
+        # Check for duplicates using the pair index
         # For one-to-many, check if any pair in this item duplicates another item's pair
-        current_item_pairs = self._item_to_pair_id_map.get(id(item), [])
-        if current_item_pairs:
-            for pair_id in current_item_pairs:
-                # Count how many times this pair appears across all items
-                duplicate_count = 0
-                duplicate_item_ids = []
-                for j in range(self.topLevelItemCount()):
-                    top = self.topLevelItem(j)
-                    top_pairs = self._item_to_pair_id_map.get(id(top), [])
-                    if pair_id in top_pairs:
-                        duplicate_count += 1
-                        duplicate_item_ids.append(top.data(0, self.ITEM_ID_ROLE))
-
-                if duplicate_count > 1:
-                    # Only invalidate the newest duplicate (highest ITEM_ID_ROLE)
-                    current_id = item.data(0, self.ITEM_ID_ROLE)
-                    if current_id == max(duplicate_item_ids):
-                        return False, texts.BATCH_VALIDATE_DUPLICATE_PAIR
+        for pair_id in self._item_to_pair_id_map.get(item, ()):
+            owners = self._pair_owners.get(pair_id, ())
+            if len(owners) > 1:
+                # Only invalidate the newest duplicate (highest ITEM_ID_ROLE)
+                current_id = item.data(0, self.ITEM_ID_ROLE)
+                duplicate_item_ids = [top.data(0, self.ITEM_ID_ROLE) for top in owners]
+                if current_id == max(duplicate_item_ids):
+                    return False, texts.BATCH_VALIDATE_DUPLICATE_PAIR
 
         return True, None
 
@@ -1412,13 +1596,12 @@ class BatchTreeView(QTreeWidget):
         """Apply styling to an item based on its validity.
 
         Args:
-            item: QTreeWidgetItem to style
+            item: BatchItem to style
             is_valid: Boolean indicating if the item is valid
         """
-        green_qcolor = self._parse_rgba_to_qcolor(COLORS["GREEN_BACKGROUND_HOVER"])
-        red_qcolor = self._parse_rgba_to_qcolor(COLORS["RED_BACKGROUND_HOVER"])
-        processed_qcolor = self._parse_rgba_to_qcolor(COLORS["PROCESSED_BACKGROUND"])
-        default_qcolor = QColor(Qt.GlobalColor.transparent)
+        green_qcolor, red_qcolor, processed_qcolor, default_qcolor = (
+            self._style_colors()
+        )
 
         if not item.parent():  # Top-level item
             item.setData(0, self.VALID_STATE_ROLE, "valid" if is_valid else "invalid")
@@ -1470,55 +1653,43 @@ class BatchTreeView(QTreeWidget):
         self, specific_items_affected=None, old_parents_affected=None
     ):
         """Update item background colors based on validity state.
-        Efficiently updates specific items if provided, otherwise full scan.
+        Updates the top-level items containing the given items if provided,
+        otherwise every top-level item.
         """
-
-        def process_item_recursive(item_to_process):
-            is_top_level = not item_to_process.parent()
-
-            # Apply appropriate styling based on item type
-            if is_top_level:
-                is_valid, message = self._validate_item(item_to_process)
-                self._apply_item_styles(item_to_process, is_valid)
-            else:
-                self._apply_item_styles(item_to_process, False)
-
-            # Update tooltip
-            self._set_item_tooltip(
-                item_to_process, message if is_top_level and not is_valid else None
-            )
-
-            # Process all children
-            for i in range(item_to_process.childCount()):
-                if child := item_to_process.child(i):
-                    process_item_recursive(child)
-
-        # Determine which items to process
         if specific_items_affected:
-            # Get unique root ancestors from affected items and old parents
-            # Use a list instead of a set since QTreeWidgetItem is not hashable
-            roots_to_process = []
-
             for item_list in (specific_items_affected, old_parents_affected or []):
                 for item in item_list:
-                    if root := self._find_root_ancestor(item):
-                        if root.treeWidget() == self and root not in roots_to_process:
-                            roots_to_process.append(root)
+                    if item:
+                        self._model.mark_changed(item)
+        else:
+            self._model.mark_all_changed()
+        self._refresh_changed_items()
 
-            # Process identified root items
-            for root_item in roots_to_process:
-                process_item_recursive(root_item)
+    def _style_item_recursive(self, item):
+        """Validate a top-level item and style it and all its descendants."""
+        is_top_level = not item.parent()
+
+        # Apply appropriate styling based on item type
+        if is_top_level:
+            is_valid, message = self._validate_item(item)
+            self._apply_item_styles(item, is_valid)
         else:
-            # Process all top-level items
-            for i in range(self.topLevelItemCount()):
-                if top_item := self.topLevelItem(i):
-                    process_item_recursive(top_item)
+            is_valid, message = False, None
+            self._apply_item_styles(item, False)
+
+        # Update tooltip
+        self._set_item_tooltip(item, message if is_top_level and not is_valid else None)
+
+        # Process all children
+        for i in range(item.childCount()):
+            if child := item.child(i):
+                self._style_item_recursive(child)
 
     def _update_stylesheet(self):
         """Update the stylesheet based on current drag state."""
         if self._is_drag_highlighted:
             drag_style = f"""
-                QTreeWidget {{
+                QTableView {{
                     background-color: {COLORS['BLUE_BACKGROUND_HOVER']};
                 }}
             """
@@ -1556,22 +1727,57 @@ class BatchTreeView(QTreeWidget):
             super().dragMoveEvent(event)
 
     def dropEvent(self, event):
-        if event.mimeData().hasUrls():
-            self._set_drag_highlight(False)
-            # Not an internal operation if we're dropping URLs
-            self._in_internal_drag = False
-            # Process the dropped files/folders
-            urls = event.mimeData().urls()
-            paths = [url.toLocalFile() for url in urls if url.isLocalFile()]
-            if paths:
-                drop_target_item = self.itemAt(event.position().toPoint())
-                self.add_files_or_folders(paths, drop_target_item=drop_target_item)
-            event.acceptProposedAction()
+        with self._undo_step():
+            if event.mimeData().hasUrls():
+                self._set_drag_highlight(False)
+                # Not an internal operation if we're dropping URLs
+                self._in_internal_drag = False
+                # Process the dropped files/folders
+                urls = event.mimeData().urls()
+                paths = [url.toLocalFile() for url in urls if url.isLocalFile()]
+                if paths:
+                    drop_target_item = self.itemAt(event.position().toPoint())
+                    self.add_files_or_folders(paths, drop_target_item=drop_target_item)
+                event.acceptProposedAction()
+            else:
+                # Internal drag-and-drop move - save state for undo
+                self._save_state_for_undo()
+                self._move_dropped_items(event)
+
+    def _move_dropped_items(self, event):
+        """Move the selected items to where they were dropped.
+
+        Like QTreeWidget's internal move: dropping onto an item makes the
+        selection its children, dropping between rows places it there.
+        """
+        self.setState(QAbstractItemView.State.NoState)
+        self.viewport().update()
+        if event.source() != self:
+            event.ignore()
+            return
+
+        root = self.invisibleRootItem()
+        target = self.itemAt(event.position().toPoint())
+        position = self.dropIndicatorPosition()
+        Position = QAbstractItemView.DropIndicatorPosition
+        if target is None or position == Position.OnViewport:
+            parent, before = root, None
+        elif position == Position.OnItem:
+            parent, before = target, None
         else:
-            # Internal drag-and-drop move - save state for undo
-            self._save_state_for_undo()
-            # This is still an internal drop even if we're calling super
-            super().dropEvent(event)
+            parent = target.parent() or root
+            if position == Position.AboveItem:
+                before = target
+            else:
+                before = parent.child(parent.indexOfChild(target) + 1)
+
+        if self._model.move_items(self.selectedItems(), parent, before):
+            # The items are already moved; reporting a copy keeps the drag
+            # source from removing the dragged rows afterwards
+            event.setDropAction(Qt.DropAction.CopyAction)
+            event.accept()
+        else:
+            event.ignore()
 
     def contextMenuEvent(self, event):
         menu = QMenu(self)
@@ -1772,20 +1978,46 @@ class BatchTreeView(QTreeWidget):
 
     def keyPressEvent(self, event):
         """Handle keyboard events."""
+        item = self.currentItem()
         if event.key() == Qt.Key.Key_Delete:
             # Delete key pressed - remove selected items
             self.remove_selected_items()
+        elif event.key() == Qt.Key.Key_Right and item is not None:
+            # Expand a collapsed parent, or step into an expanded one
+            if item.childCount() and not item.isExpanded():
+                item.setExpanded(True)
+            elif item.childCount():
+                self.setCurrentItem(item.child(0))
+        elif event.key() == Qt.Key.Key_Left and item is not None:
+            # Collapse an expanded parent, or step out to a child's parent
+            if item.childCount() and item.isExpanded():
+                item.setExpanded(False)
+            elif item.parent() is not None:
+                self.setCurrentItem(item.parent())
         else:
             # Pass other key events to the parent class
             super().keyPressEvent(event)
 
+    def _toggle_expanded(self, index):
+        """Expand or collapse a double-clicked parent row."""
+        item = self._model.item_from_index(index)
+        if item is not None and item.childCount():
+            item.setExpanded(not item.isExpanded())
+
     def mousePressEvent(self, event):
         """Handle mouse press events to clear selection when clicking empty area."""
-        item = self.itemAt(event.position().toPoint())
+        pos = event.position().toPoint()
+        item = self.itemAt(pos)
         if item is None:
             # Clicked on empty area - clear selection
             self.clearSelection()
             self.setCurrentItem(None)
+        elif item.childCount() and self._delegate.branch_rect(
+            self.visualRect(self.indexAt(pos)), item
+        ).contains(pos):
+            # Clicked the expand/collapse arrow
+            item.setExpanded(not item.isExpanded())
+            return
 
         # Call parent implementation to handle normal clicking behavior
         super().mousePressEvent(event)
@@ -1800,91 +2032,92 @@ class BatchTreeView(QTreeWidget):
         Returns:
             True if files were added successfully, False if no supported files found
         """
-        logger.info(f"Adding files/folders: {len(paths)} items")
-        # Save state for undo before making changes
-        self._save_state_for_undo()
-        # Special case: Check if there are exactly 2 files, one video and one subtitle
-        if len(paths) == 2 and all(os.path.isfile(p) for p in paths):
-            if paths[0] == paths[1]:
-                QMessageBox.warning(
-                    self.app_parent,
-                    texts.INVALID_PAIR_TITLE,
-                    texts.CANNOT_PAIR_FILE_WITH_ITSELF,
-                )
-                return False
-            exts = [os.path.splitext(path)[1].lower() for path in paths]
-            # Check if we have one video and one subtitle file
-            if exts[0] in VIDEO_EXTENSIONS and exts[1] in SUBTITLE_EXTENSIONS:
-                if self.is_duplicate_pair(paths[0], paths[1]):
+        with self._undo_step():
+            logger.info(f"Adding files/folders: {len(paths)} items")
+            # Save state for undo before making changes
+            self._save_state_for_undo()
+            # Special case: Check if there are exactly 2 files, one video and one subtitle
+            if len(paths) == 2 and all(os.path.isfile(p) for p in paths):
+                if paths[0] == paths[1]:
                     QMessageBox.warning(
                         self.app_parent,
-                        texts.BATCH_VALIDATE_DUPLICATE_PAIR,
-                        texts.BATCH_VALIDATE_DUPLICATE_PAIR,
+                        texts.INVALID_PAIR_TITLE,
+                        texts.CANNOT_PAIR_FILE_WITH_ITSELF,
                     )
                     return False
-                reference_path, sub_path = paths[0], paths[1]
-                self.add_explicit_pair(reference_path, sub_path)
-                logger.info(
-                    f"Added pair: {os.path.basename(reference_path)} + {os.path.basename(sub_path)}"
+                exts = [os.path.splitext(path)[1].lower() for path in paths]
+                # Check if we have one video and one subtitle file
+                if exts[0] in VIDEO_EXTENSIONS and exts[1] in SUBTITLE_EXTENSIONS:
+                    if self.is_duplicate_pair(paths[0], paths[1]):
+                        QMessageBox.warning(
+                            self.app_parent,
+                            texts.BATCH_VALIDATE_DUPLICATE_PAIR,
+                            texts.BATCH_VALIDATE_DUPLICATE_PAIR,
+                        )
+                        return False
+                    reference_path, sub_path = paths[0], paths[1]
+                    self.add_explicit_pair(reference_path, sub_path)
+                    logger.info(
+                        f"Added pair: {os.path.basename(reference_path)} + {os.path.basename(sub_path)}"
+                    )
+                    return True
+                elif exts[1] in VIDEO_EXTENSIONS and exts[0] in SUBTITLE_EXTENSIONS:
+                    if self.is_duplicate_pair(paths[1], paths[0]):
+                        QMessageBox.warning(
+                            self.app_parent,
+                            texts.BATCH_VALIDATE_DUPLICATE_PAIR,
+                            texts.BATCH_VALIDATE_DUPLICATE_PAIR,
+                        )
+                        return False
+                    reference_path, sub_path = paths[1], paths[0]
+                    self.add_explicit_pair(reference_path, sub_path)
+                    logger.info(
+                        f"Added pair: {os.path.basename(reference_path)} + {os.path.basename(sub_path)}"
+                    )
+                    return True
+
+            # Standard processing for all other cases
+            files_to_process = []
+            for path in paths:
+                if os.path.isdir(path):
+                    for root, _, filenames in os.walk(path):
+                        for filename in filenames:
+                            file_path = os.path.join(root, filename)
+                            ext = os.path.splitext(file_path)[1].lower()
+                            if ext in VIDEO_EXTENSIONS or ext in SUBTITLE_EXTENSIONS:
+                                files_to_process.append(file_path)
+                elif os.path.isfile(path):
+                    ext = os.path.splitext(path)[1].lower()
+                    if ext in VIDEO_EXTENSIONS or ext in SUBTITLE_EXTENSIONS:
+                        files_to_process.append(path)
+
+            if not files_to_process:
+                logger.warning("No supported media files found in dropped/added paths.")
+                QMessageBox.warning(
+                    self.app_parent,
+                    texts.NO_MEDIA_FILES_FOUND_TITLE,
+                    texts.NO_MEDIA_FILES_FOUND_MESSAGE,
                 )
-                return True
-            elif exts[1] in VIDEO_EXTENSIONS and exts[0] in SUBTITLE_EXTENSIONS:
-                if self.is_duplicate_pair(paths[1], paths[0]):
-                    QMessageBox.warning(
+                return False
+
+            if files_to_process:
+                logger.info(f"Processing {len(files_to_process)} files for pairing")
+                skipped = 0
+                self.add_paired_files(files_to_process, drop_target_item=drop_target_item)
+                if skipped:
+                    QMessageBox.information(
                         self.app_parent,
-                        texts.BATCH_VALIDATE_DUPLICATE_PAIR,
-                        texts.BATCH_VALIDATE_DUPLICATE_PAIR,
+                        texts.DUPLICATES_SKIPPED_TITLE,
+                        texts.DUPLICATES_SKIPPED_MESSAGE.format(count=skipped),
                     )
-                    return False
-                reference_path, sub_path = paths[1], paths[0]
-                self.add_explicit_pair(reference_path, sub_path)
-                logger.info(
-                    f"Added pair: {os.path.basename(reference_path)} + {os.path.basename(sub_path)}"
-                )
                 return True
-
-        # Standard processing for all other cases
-        files_to_process = []
-        for path in paths:
-            if os.path.isdir(path):
-                for root, _, filenames in os.walk(path):
-                    for filename in filenames:
-                        file_path = os.path.join(root, filename)
-                        ext = os.path.splitext(file_path)[1].lower()
-                        if ext in VIDEO_EXTENSIONS or ext in SUBTITLE_EXTENSIONS:
-                            files_to_process.append(file_path)
-            elif os.path.isfile(path):
-                ext = os.path.splitext(path)[1].lower()
-                if ext in VIDEO_EXTENSIONS or ext in SUBTITLE_EXTENSIONS:
-                    files_to_process.append(path)
-
-        if not files_to_process:
-            logger.warning("No supported media files found in dropped/added paths.")
-            QMessageBox.warning(
-                self.app_parent,
-                texts.NO_MEDIA_FILES_FOUND_TITLE,
-                texts.NO_MEDIA_FILES_FOUND_MESSAGE,
-            )
             return False
 
-        if files_to_process:
-            logger.info(f"Processing {len(files_to_process)} files for pairing")
-            skipped = 0
-            self.add_paired_files(files_to_process, drop_target_item=drop_target_item)
-            if skipped:
-                QMessageBox.information(
-                    self.app_parent,
-                    texts.DUPLICATES_SKIPPED_TITLE,
-                    texts.DUPLICATES_SKIPPED_MESSAGE.format(count=skipped),
-                )
-            return True
-        return False
-
     def _create_tree_item(self, file_path):
         """Helper to create a new tree item for a file."""
         item_id = self._get_next_id()
         item = create_tree_widget_item(
-            file_path, icon_provider=self.icon_provider, item_id=item_id
+            file_path, item_id=item_id
         )
         return item
 
@@ -1918,7 +2151,6 @@ class BatchTreeView(QTreeWidget):
             child_item = create_tree_widget_item(
                 sub_file_path,
                 parent=parent_item,
-                icon_provider=self.icon_provider,
                 item_id=self._get_next_id(),
             )
             parent_item.setExpanded(True)
@@ -1941,6 +2173,17 @@ class BatchTreeView(QTreeWidget):
 
             manager = get_processed_items_manager()
 
+            # Check database directly for accurate status, for all video files at once
+            video_paths = [
+                path
+                for path in (
+                    item.data(0, Qt.ItemDataRole.UserRole)
+                    for item in newly_created_items
+                )
+                if path and is_video_file(path)
+            ]
+            processed_status = manager.is_processed_many(video_paths)
+
             # Sort items: invalid not-skipped (0), valid not-skipped (1), invalid skipped (2), valid skipped (3)
             def get_sort_key(item):
                 is_valid = self._get_provisional_validity(item) == "valid"
@@ -1948,8 +2191,7 @@ class BatchTreeView(QTreeWidget):
                 item_path = item.data(0, Qt.ItemDataRole.UserRole)
                 is_processed = False
                 if item_path and is_video_file(item_path):
-                    # Check database directly for accurate status
-                    is_processed = manager.is_processed(item_path)
+                    is_processed = processed_status.get(item_path, False)
                     # Also update cache
                     norm_path = os.path.normpath(item_path)
                     self._processed_items_cache[norm_path] = is_processed
@@ -1970,10 +2212,10 @@ class BatchTreeView(QTreeWidget):
 
             newly_created_items.sort(key=get_sort_key)
 
-            # Add to tree (in reverse order to maintain sort when inserting at beginning)
+            # Add to the top of the tree in one step, keeping the sort
+            self.insertTopLevelItems(0, newly_created_items)
             # Also apply processed visual state immediately based on cache
-            for item in reversed(newly_created_items):
-                self.insertTopLevelItem(0, item)
+            for item in newly_created_items:
                 # Apply processed visual state if applicable
                 item_path = item.data(0, Qt.ItemDataRole.UserRole)
                 if item_path:
@@ -2000,86 +2242,88 @@ class BatchTreeView(QTreeWidget):
         )
 
     def add_explicit_pair(self, video_ref_path, sub_path):
-        logger.info(
-            f"Adding pair: {os.path.basename(video_ref_path)} + {os.path.basename(sub_path)}"
-        )
-        # Save state for undo before making changes
-        self._save_state_for_undo()
-        parent_item_id = self._get_next_id()
-        parent_item = create_tree_widget_item(
-            video_ref_path, None, self.icon_provider, item_id=parent_item_id
-        )
+        with self._undo_step():
+            logger.info(
+                f"Adding pair: {os.path.basename(video_ref_path)} + {os.path.basename(sub_path)}"
+            )
+            # Save state for undo before making changes
+            self._save_state_for_undo()
+            parent_item_id = self._get_next_id()
+            parent_item = create_tree_widget_item(
+                video_ref_path, item_id=parent_item_id
+            )
 
-        child_item_id = self._get_next_id()
-        child_item = create_tree_widget_item(
-            sub_path, parent_item, self.icon_provider, item_id=child_item_id
-        )
+            child_item_id = self._get_next_id()
+            child_item = create_tree_widget_item(
+                sub_path, parent_item, item_id=child_item_id
+            )
 
-        parent_item.setExpanded(True)
-        self.insertTopLevelItem(
-            0, parent_item
-        )  # Insert the configured parent item at the top
-        # UI update (including sort) will be scheduled by model signals
+            parent_item.setExpanded(True)
+            self.insertTopLevelItem(
+                0, parent_item
+            )  # Insert the configured parent item at the top
+            # UI update (including sort) will be scheduled by model signals
 
-        # Queue for Smart Deduplication scan
-        self._queue_files_for_scan([video_ref_path])
+            # Queue for Smart Deduplication scan
+            self._queue_files_for_scan([video_ref_path])
 
     def add_parent_with_children(self, reference_path, subtitle_paths):
         """Add a parent (video/reference subtitle) with multiple subtitle children.
 
         Returns tuple: (added_count, skipped_same_count, skipped_duplicate_count)
         """
-        logger.info(
-            f"Adding parent with {len(subtitle_paths)} children: {os.path.basename(reference_path)}"
-        )
-
-        added = 0
-        skipped_same = 0
-        skipped_dups = 0
+        with self._undo_step():
+            logger.info(
+                f"Adding parent with {len(subtitle_paths)} children: {os.path.basename(reference_path)}"
+            )
 
-        # Filter out invalid subtitles first
-        valid_subs = []
-        for sub_path in subtitle_paths:
-            norm_ref = os.path.normpath(reference_path)
-            norm_sub = os.path.normpath(sub_path)
+            added = 0
+            skipped_same = 0
+            skipped_dups = 0
 
-            # Cannot pair file with itself
-            if norm_ref == norm_sub:
-                skipped_same += 1
-                continue
+            # Filter out invalid subtitles first
+            valid_subs = []
+            for sub_path in subtitle_paths:
+                norm_ref = os.path.normpath(reference_path)
+                norm_sub = os.path.normpath(sub_path)
 
-            # Check if this pair already exists
-            if self.is_duplicate_pair(reference_path, sub_path):
-                skipped_dups += 1
-                continue
+                # Cannot pair file with itself
+                if norm_ref == norm_sub:
+                    skipped_same += 1
+                    continue
 
-            valid_subs.append(sub_path)
+                # Check if this pair already exists
+                if self.is_duplicate_pair(reference_path, sub_path):
+                    skipped_dups += 1
+                    continue
 
-        if not valid_subs:
-            return (0, skipped_same, skipped_dups)
+                valid_subs.append(sub_path)
 
-        # Save state for undo before making changes
-        self._save_state_for_undo()
+            if not valid_subs:
+                return (0, skipped_same, skipped_dups)
 
-        # Create parent item
-        parent_item_id = self._get_next_id()
-        parent_item = create_tree_widget_item(
-            reference_path, None, self.icon_provider, item_id=parent_item_id
-        )
+            # Save state for undo before making changes
+            self._save_state_for_undo()
 
-        # Add all valid children
-        for sub_path in valid_subs:
-            child_item_id = self._get_next_id()
-            child_item = create_tree_widget_item(
-                sub_path, parent_item, self.icon_provider, item_id=child_item_id
+            # Create parent item
+            parent_item_id = self._get_next_id()
+            parent_item = create_tree_widget_item(
+                reference_path, item_id=parent_item_id
             )
-            added += 1
 
-        parent_item.setExpanded(True)
-        self.insertTopLevelItem(0, parent_item)
-        # UI update (including sort) will be scheduled by model signals
+            # Add all valid children
+            for sub_path in valid_subs:
+                child_item_id = self._get_next_id()
+                child_item = create_tree_widget_item(
+                    sub_path, parent_item, item_id=child_item_id
+                )
+                added += 1
+
+            parent_item.setExpanded(True)
+            self.insertTopLevelItem(0, parent_item)
+            # UI update (including sort) will be scheduled by model signals
 
-        return (added, skipped_same, skipped_dups)
+            return (added, skipped_same, skipped_dups)
 
     def find_parent_by_path(self, reference_path):
         """Find an existing top-level parent item by its file path."""
@@ -2096,330 +2340,333 @@ class BatchTreeView(QTreeWidget):
 
         Returns tuple: (added_count, skipped_same_count, skipped_duplicate_count)
         """
-        if not parent_item:
-            return (0, 0, 0)
+        with self._undo_step():
+            if not parent_item:
+                return (0, 0, 0)
 
-        reference_path = parent_item.data(0, Qt.ItemDataRole.UserRole)
-        logger.info(
-            f"Adding {len(subtitle_paths)} children to existing parent: {os.path.basename(reference_path)}"
-        )
+            reference_path = parent_item.data(0, Qt.ItemDataRole.UserRole)
+            logger.info(
+                f"Adding {len(subtitle_paths)} children to existing parent: {os.path.basename(reference_path)}"
+            )
 
-        added = 0
-        skipped_same = 0
-        skipped_dups = 0
+            added = 0
+            skipped_same = 0
+            skipped_dups = 0
 
-        valid_subs = []
-        for sub_path in subtitle_paths:
-            norm_ref = os.path.normpath(reference_path)
-            norm_sub = os.path.normpath(sub_path)
+            valid_subs = []
+            for sub_path in subtitle_paths:
+                norm_ref = os.path.normpath(reference_path)
+                norm_sub = os.path.normpath(sub_path)
 
-            # Cannot pair file with itself
-            if norm_ref == norm_sub:
-                skipped_same += 1
-                continue
+                # Cannot pair file with itself
+                if norm_ref == norm_sub:
+                    skipped_same += 1
+                    continue
 
-            # Check if this pair already exists
-            if self.is_duplicate_pair(reference_path, sub_path):
-                skipped_dups += 1
-                continue
+                # Check if this pair already exists
+                if self.is_duplicate_pair(reference_path, sub_path):
+                    skipped_dups += 1
+                    continue
 
-            valid_subs.append(sub_path)
+                valid_subs.append(sub_path)
 
-        if not valid_subs:
-            return (0, skipped_same, skipped_dups)
+            if not valid_subs:
+                return (0, skipped_same, skipped_dups)
 
-        # Save state for undo before making changes
-        self._save_state_for_undo()
+            # Save state for undo before making changes
+            self._save_state_for_undo()
 
-        # Add all valid children
-        for sub_path in valid_subs:
-            child_item_id = self._get_next_id()
-            child_item = create_tree_widget_item(
-                sub_path, parent_item, self.icon_provider, item_id=child_item_id
-            )
-            added += 1
+            # Add all valid children
+            for sub_path in valid_subs:
+                child_item_id = self._get_next_id()
+                child_item = create_tree_widget_item(
+                    sub_path, parent_item, item_id=child_item_id
+                )
+                added += 1
 
-        parent_item.setExpanded(True)
-        self._schedule_ui_update()
+            parent_item.setExpanded(True)
+            self._schedule_ui_update()
 
-        return (added, skipped_same, skipped_dups)
+            return (added, skipped_same, skipped_dups)
 
     def add_subtitle_to_item_dialog(self, parent_item):
-        logger.info(
-            f"Adding subtitle to item: {os.path.basename(parent_item.data(0, Qt.ItemDataRole.UserRole)) if parent_item and parent_item.data(0, Qt.ItemDataRole.UserRole) else None}"
-        )
-        if not parent_item or parent_item.parent():  # Must be a top-level item
-            QMessageBox.warning(
+        with self._undo_step():
+            logger.info(
+                f"Adding subtitle to item: {os.path.basename(parent_item.data(0, Qt.ItemDataRole.UserRole)) if parent_item and parent_item.data(0, Qt.ItemDataRole.UserRole) else None}"
+            )
+            if not parent_item or parent_item.parent():  # Must be a top-level item
+                QMessageBox.warning(
+                    self.app_parent,
+                    texts.SELECTION_ERROR_TITLE,
+                    texts.SELECT_TOP_LEVEL_ITEM_MESSAGE,
+                )
+                return
+
+            file_paths = open_filedialog(
                 self.app_parent,
-                texts.SELECTION_ERROR_TITLE,
-                texts.SELECT_TOP_LEVEL_ITEM_MESSAGE,
+                "files-open",
+                texts.SELECT_SUBTITLE_FILE_TITLE,
+                SUBTITLE_FILTER,
             )
-            return
 
-        file_paths = open_filedialog(
-            self.app_parent,
-            "files-open",
-            texts.SELECT_SUBTITLE_FILE_TITLE,
-            SUBTITLE_FILTER,
-        )
+            if file_paths:
+                # Save state for undo before making changes
+                self._save_state_for_undo()
+                # Set internal operation flag to prevent full UI updates
+                self._in_internal_drag = True
 
-        if file_paths:
-            # Save state for undo before making changes
-            self._save_state_for_undo()
-            # Set internal operation flag to prevent full UI updates
-            self._in_internal_drag = True
+                skipped = 0
+                any_subtitle_added = False
+                child_items_added = []
 
-            skipped = 0
-            any_subtitle_added = False
-            child_items_added = []
+                for file_path in file_paths:
+                    if file_path == parent_item.data(0, Qt.ItemDataRole.UserRole):
+                        skipped += 1
+                        continue
+                    if not is_subtitle_file(file_path):
+                        QMessageBox.warning(
+                            self.app_parent,
+                            texts.INVALID_FILE_TITLE,
+                            texts.INVALID_SUBTITLE_FILE_MESSAGE.format(
+                                filename=get_basename(file_path)
+                            ),
+                        )
+                        continue
+                    if self.is_duplicate_pair(
+                        parent_item.data(0, Qt.ItemDataRole.UserRole), file_path
+                    ):
+                        skipped += 1
+                        continue
+                    # Ensure child gets an ID
+                    child_item = create_tree_widget_item(
+                        file_path,
+                        parent_item,
+                        item_id=self._get_next_id(),
+                    )
+                    child_items_added.append(child_item)
+                    any_subtitle_added = True
 
-            for file_path in file_paths:
-                if file_path == parent_item.data(0, Qt.ItemDataRole.UserRole):
-                    skipped += 1
-                    continue
-                if not is_subtitle_file(file_path):
-                    QMessageBox.warning(
+                if skipped:
+                    QMessageBox.information(
                         self.app_parent,
-                        texts.INVALID_FILE_TITLE,
-                        texts.INVALID_SUBTITLE_FILE_MESSAGE.format(
-                            filename=get_basename(file_path)
-                        ),
+                        texts.DUPLICATES_SKIPPED_TITLE,
+                        texts.DUPLICATES_SKIPPED_MESSAGE.format(count=skipped),
                     )
-                    continue
-                if self.is_duplicate_pair(
-                    parent_item.data(0, Qt.ItemDataRole.UserRole), file_path
-                ):
-                    skipped += 1
-                    continue
-                # Ensure child gets an ID
-                child_item = create_tree_widget_item(
-                    file_path,
-                    parent_item,
-                    self.icon_provider,
-                    item_id=self._get_next_id(),
-                )
-                child_items_added.append(child_item)
-                any_subtitle_added = True
-
-            if skipped:
-                QMessageBox.information(
-                    self.app_parent,
-                    texts.DUPLICATES_SKIPPED_TITLE,
-                    texts.DUPLICATES_SKIPPED_MESSAGE.format(count=skipped),
-                )
-            if any_subtitle_added:
-                parent_item.setExpanded(True)
+                if any_subtitle_added:
+                    parent_item.setExpanded(True)
 
-                # Only update the specific item that was modified
-                self._update_parent_item_style([parent_item])
-                self._schedule_ui_update()
+                    # Only update the specific item that was modified
+                    self._update_parent_item_style([parent_item])
+                    self._schedule_ui_update()
 
     def add_video_to_subtitle_dialog(self, subtitle_item):
         """Add a video file as parent to an existing subtitle item, maintaining item position."""
+        with self._undo_step():
+            logger.info(
+                f"Adding video to subtitle item: {os.path.basename(subtitle_item.data(0, Qt.ItemDataRole.UserRole)) if subtitle_item and subtitle_item.data(0, Qt.ItemDataRole.UserRole) else None}"
+            )
 
-        logger.info(
-            f"Adding video to subtitle item: {os.path.basename(subtitle_item.data(0, Qt.ItemDataRole.UserRole)) if subtitle_item and subtitle_item.data(0, Qt.ItemDataRole.UserRole) else None}"
-        )
+            # Verify the item is actually a subtitle
+            item_path = subtitle_item.data(0, Qt.ItemDataRole.UserRole)
+            if not item_path or not is_subtitle_file(item_path):
+                QMessageBox.warning(
+                    self.app_parent,
+                    texts.INVALID_FILE_TITLE,
+                    texts.INVALID_SUBTITLE_FILE_MESSAGE.format(
+                        filename=get_basename(item_path)
+                    ),
+                )
+                return
 
-        # Verify the item is actually a subtitle
-        item_path = subtitle_item.data(0, Qt.ItemDataRole.UserRole)
-        if not item_path or not is_subtitle_file(item_path):
-            QMessageBox.warning(
-                self.app_parent,
-                texts.INVALID_FILE_TITLE,
-                texts.INVALID_SUBTITLE_FILE_MESSAGE.format(
-                    filename=get_basename(item_path)
-                ),
+            reference_path = open_filedialog(
+                self.app_parent, "file-open", texts.SELECT_VIDEO_FILE_TITLE, VIDEO_FILTER
             )
-            return
-
-        reference_path = open_filedialog(
-            self.app_parent, "file-open", texts.SELECT_VIDEO_FILE_TITLE, VIDEO_FILTER
-        )
 
-        if not reference_path:
-            return
+            if not reference_path:
+                return
 
-        if reference_path == subtitle_item.data(0, Qt.ItemDataRole.UserRole):
-            QMessageBox.warning(
-                self.app_parent,
-                texts.INVALID_PAIR_TITLE,
-                texts.CANNOT_PAIR_FILE_WITH_ITSELF,
-            )
-            return
+            if reference_path == subtitle_item.data(0, Qt.ItemDataRole.UserRole):
+                QMessageBox.warning(
+                    self.app_parent,
+                    texts.INVALID_PAIR_TITLE,
+                    texts.CANNOT_PAIR_FILE_WITH_ITSELF,
+                )
+                return
 
-        if self.is_duplicate_pair(
-            reference_path, subtitle_item.data(0, Qt.ItemDataRole.UserRole)
-        ):
-            QMessageBox.warning(
-                self.app_parent,
-                texts.BATCH_VALIDATE_DUPLICATE_PAIR,
-                texts.BATCH_VALIDATE_DUPLICATE_PAIR,
-            )
-            return
+            if self.is_duplicate_pair(
+                reference_path, subtitle_item.data(0, Qt.ItemDataRole.UserRole)
+            ):
+                QMessageBox.warning(
+                    self.app_parent,
+                    texts.BATCH_VALIDATE_DUPLICATE_PAIR,
+                    texts.BATCH_VALIDATE_DUPLICATE_PAIR,
+                )
+                return
 
-        # Save state for undo before making changes
-        self._save_state_for_undo()
+            # Save state for undo before making changes
+            self._save_state_for_undo()
 
-        # Set internal operation flag to prevent full UI updates
-        self._in_internal_drag = True
+            # Set internal operation flag to prevent full UI updates
+            self._in_internal_drag = True
 
-        # Find the index of the subtitle item to preserve position
-        root = self.invisibleRootItem()
-        sub_index = -1
-        for i in range(root.childCount()):
-            if root.child(i) == subtitle_item:
-                sub_index = i
-                break
+            # Find the index of the subtitle item to preserve position
+            root = self.invisibleRootItem()
+            sub_index = -1
+            for i in range(root.childCount()):
+                if root.child(i) == subtitle_item:
+                    sub_index = i
+                    break
 
-        if sub_index == -1:
-            return  # Item not found, should not happen
+            if sub_index == -1:
+                return  # Item not found, should not happen
 
-        # Create new video parent item with an ID
-        video_item_id = self._get_next_id()
-        video_item = create_tree_widget_item(
-            reference_path, None, self.icon_provider, item_id=video_item_id
-        )
+            # Create new video parent item with an ID
+            video_item_id = self._get_next_id()
+            video_item = create_tree_widget_item(
+                reference_path, item_id=video_item_id
+            )
 
-        # Preserve subtitle's existing ID or assign a new one if it doesn't have one
-        subtitle_item_id = subtitle_item.data(0, self.ITEM_ID_ROLE)
-        if subtitle_item_id is None:
-            subtitle_item_id = self._get_next_id()
-            subtitle_item.setData(0, self.ITEM_ID_ROLE, subtitle_item_id)
+            # Preserve subtitle's existing ID or assign a new one if it doesn't have one
+            subtitle_item_id = subtitle_item.data(0, self.ITEM_ID_ROLE)
+            if subtitle_item_id is None:
+                subtitle_item_id = self._get_next_id()
+                subtitle_item.setData(0, self.ITEM_ID_ROLE, subtitle_item_id)
 
-        # Take the subtitle item from its current position
-        root.removeChild(subtitle_item)
+            # Take the subtitle item from its current position
+            root.removeChild(subtitle_item)
 
-        # Add the subtitle as a child of the video item
-        video_item.addChild(subtitle_item)
+            # Add the subtitle as a child of the video item
+            video_item.addChild(subtitle_item)
 
-        # Insert the video item back at the same position
-        root.insertChild(sub_index, video_item)
+            # Insert the video item back at the same position
+            root.insertChild(sub_index, video_item)
 
-        # Expand the new video parent
-        video_item.setExpanded(True)
+            # Expand the new video parent
+            video_item.setExpanded(True)
 
-        # Only update this specific item
-        self._update_parent_item_style([video_item])
-        self._schedule_ui_update()
+            # Only update this specific item
+            self._update_parent_item_style([video_item])
+            self._schedule_ui_update()
 
     def remove_item(self, item):
-        if item:
-            logger.info(
-                f"Removing item: {os.path.basename(item.data(0, Qt.ItemDataRole.UserRole)) if item.data(0, Qt.ItemDataRole.UserRole) else None}"
-            )
-            # Save state for undo before making changes
-            self._save_state_for_undo()
-            # Set internal operation flag to prevent full UI updates
-            self._in_internal_drag = True
-            root = self.invisibleRootItem()
-            (item.parent() or root).removeChild(item)
-            # Only schedule a targeted UI update
-            self._schedule_ui_update()
+        with self._undo_step():
+            if item:
+                logger.info(
+                    f"Removing item: {os.path.basename(item.data(0, Qt.ItemDataRole.UserRole)) if item.data(0, Qt.ItemDataRole.UserRole) else None}"
+                )
+                # Save state for undo before making changes
+                self._save_state_for_undo()
+                # Set internal operation flag to prevent full UI updates
+                self._in_internal_drag = True
+                root = self.invisibleRootItem()
+                (item.parent() or root).removeChild(item)
+                # Only schedule a targeted UI update
+                self._schedule_ui_update()
 
     def remove_selected_items(self):
-        selected = self.selectedItems()
-        logger.info(f"Removing selected items: {len(selected)}")
-        if not selected:
-            current = self.currentItem()
-            if current:
-                selected = [current]
-            else:
-                return
+        with self._undo_step():
+            selected = self.selectedItems()
+            logger.info(f"Removing selected items: {len(selected)}")
+            if not selected:
+                current = self.currentItem()
+                if current:
+                    selected = [current]
+                else:
+                    return
 
-        if len(selected) > 9:
-            reply = QMessageBox.question(
-                self.app_parent,
-                texts.CONFIRM_REMOVE_SELECTED_TITLE,
-                texts.CONFIRM_REMOVE_SELECTED_MESSAGE.format(count=len(selected)),
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No,
-            )
-            if reply != QMessageBox.StandardButton.Yes:
-                return
+            if len(selected) > 9:
+                reply = QMessageBox.question(
+                    self.app_parent,
+                    texts.CONFIRM_REMOVE_SELECTED_TITLE,
+                    texts.CONFIRM_REMOVE_SELECTED_MESSAGE.format(count=len(selected)),
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                    QMessageBox.StandardButton.No,
+                )
+                if reply != QMessageBox.StandardButton.Yes:
+                    return
 
-        # Save state for undo before making changes
-        self._save_state_for_undo()
+            # Save state for undo before making changes
+            self._save_state_for_undo()
 
-        # Set internal operation flag to prevent full UI updates
-        self._in_internal_drag = True
+            # Set internal operation flag to prevent full UI updates
+            self._in_internal_drag = True
 
-        # We'll process as a batch removal
-        root = self.invisibleRootItem()
-        for item in selected:
-            (item.parent() or root).removeChild(item)
+            # We'll process as a batch removal
+            self._model.remove_items(selected)
 
-        # Schedule a single UI update after all removals
-        self._schedule_ui_update()
+            # Schedule a single UI update after all removals
+            self._schedule_ui_update()
 
     def change_file_for_item(self, item):
-        if not item:
-            return
-        logger.info(
-            f"Changing file for item: {os.path.basename(item.data(0, Qt.ItemDataRole.UserRole)) if item.data(0, Qt.ItemDataRole.UserRole) else None}"
-        )
-        current_file_path = item.data(0, Qt.ItemDataRole.UserRole)
-        is_parent = not item.parent()
+        with self._undo_step():
+            if not item:
+                return
+            logger.info(
+                f"Changing file for item: {os.path.basename(item.data(0, Qt.ItemDataRole.UserRole)) if item.data(0, Qt.ItemDataRole.UserRole) else None}"
+            )
+            current_file_path = item.data(0, Qt.ItemDataRole.UserRole)
+            is_parent = not item.parent()
 
-        if is_parent:
-            file_filter = VIDEO_SUBTITLE_FILTER
-            dialog_title = texts.SELECT_REPLACEMENT_VIDEO_OR_SUBTITLE_TITLE
-        else:
-            file_filter = SUBTITLE_FILTER
-            dialog_title = texts.SELECT_REPLACEMENT_SUBTITLE_TITLE
-
-        # Use the centralized function for file selection
-        initial_dir = (
-            os.path.dirname(current_file_path)
-            if current_file_path and os.path.exists(os.path.dirname(current_file_path))
-            else None
-        )
-        new_file_path = open_filedialog(
-            self.app_parent, "file-open", dialog_title, file_filter, initial_dir
-        )
+            if is_parent:
+                file_filter = VIDEO_SUBTITLE_FILTER
+                dialog_title = texts.SELECT_REPLACEMENT_VIDEO_OR_SUBTITLE_TITLE
+            else:
+                file_filter = SUBTITLE_FILTER
+                dialog_title = texts.SELECT_REPLACEMENT_SUBTITLE_TITLE
+
+            # Use the centralized function for file selection
+            initial_dir = (
+                os.path.dirname(current_file_path)
+                if current_file_path and os.path.exists(os.path.dirname(current_file_path))
+                else None
+            )
+            new_file_path = open_filedialog(
+                self.app_parent, "file-open", dialog_title, file_filter, initial_dir
+            )
 
-        if new_file_path:
-            new_ext = os.path.splitext(new_file_path)[1].lower()
-            valid_new_type = False
-            if is_parent and new_ext in (VIDEO_EXTENSIONS + SUBTITLE_EXTENSIONS):
-                valid_new_type = True
-            elif not is_parent and new_ext in SUBTITLE_EXTENSIONS:
-                valid_new_type = True
+            if new_file_path:
+                new_ext = os.path.splitext(new_file_path)[1].lower()
+                valid_new_type = False
+                if is_parent and new_ext in (VIDEO_EXTENSIONS + SUBTITLE_EXTENSIONS):
+                    valid_new_type = True
+                elif not is_parent and new_ext in SUBTITLE_EXTENSIONS:
+                    valid_new_type = True
 
-            if not valid_new_type:
-                QMessageBox.warning(
-                    self.app_parent,
-                    texts.INVALID_FILE_TYPE_TITLE,
-                    texts.INVALID_FILE_TYPE_MESSAGE,
-                )
-                return
+                if not valid_new_type:
+                    QMessageBox.warning(
+                        self.app_parent,
+                        texts.INVALID_FILE_TYPE_TITLE,
+                        texts.INVALID_FILE_TYPE_MESSAGE,
+                    )
+                    return
 
-            # Save state for undo before making changes
-            self._save_state_for_undo()
+                # Save state for undo before making changes
+                self._save_state_for_undo()
 
-            item.setText(0, os.path.basename(new_file_path))
-            item.setData(0, Qt.ItemDataRole.UserRole, new_file_path)
-            item.setIcon(0, self._get_file_icon(new_file_path))
+                item.setText(0, os.path.basename(new_file_path))
+                item.setData(0, Qt.ItemDataRole.UserRole, new_file_path)
+                item.setIcon(0, self._get_file_icon(new_file_path))
 
     def clear_all_items(self):
-        pair_count = self.topLevelItemCount()
-        logger.info(f"Clearing all items. Count: {pair_count}")
-        if pair_count > 9:
-            reply = QMessageBox.question(
-                self.app_parent,
-                texts.CONFIRM_CLEAR_ALL_TITLE,
-                texts.CONFIRM_CLEAR_ALL_MESSAGE,
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No,
-            )
-            if reply != QMessageBox.StandardButton.Yes:
-                return
-        if pair_count > 0:
-            # Save state for undo before making changes
-            self._save_state_for_undo()
-            self.clear()
-            # Reset library loaded flag when tree is cleared
-            self._library_loaded = False
+        with self._undo_step():
+            pair_count = self.topLevelItemCount()
+            logger.info(f"Clearing all items. Count: {pair_count}")
+            if pair_count > 9:
+                reply = QMessageBox.question(
+                    self.app_parent,
+                    texts.CONFIRM_CLEAR_ALL_TITLE,
+                    texts.CONFIRM_CLEAR_ALL_MESSAGE,
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                    QMessageBox.StandardButton.No,
+                )
+                if reply != QMessageBox.StandardButton.Yes:
+                    return
+            if pair_count > 0:
+                # Save state for undo before making changes
+                self._save_state_for_undo()
+                self.clear()
+                # Reset library loaded flag when tree is cleared
+                self._library_loaded = False
 
     def open_item_folder(self, item):
         """Open the folder containing the file for the given item."""
@@ -2491,152 +2738,127 @@ class BatchTreeView(QTreeWidget):
 
     # ==================== Undo/Redo System ====================
 
+    @contextmanager
+    def _undo_step(self):
+        """Group the changes made inside the block into one undo entry.
+
+        _save_state_for_undo() inside the block starts the entry and leaving
+        the outermost block closes it, so dialogs that run a nested event
+        loop mid-action don't split it. Nested blocks join the entry of the
+        enclosing one.
+        """
+        self._undo_depth += 1
+        try:
+            yield
+        finally:
+            self._undo_depth -= 1
+            if self._undo_depth == 0:
+                self._end_undo_step()
+
     def _save_state_for_undo(self):
-        """Save the current tree state to the undo stack.
+        """Start recording an undo entry for the action that follows.
 
-        Only saves state if the tree has items. This prevents undoing
+        The model records what the action inserts, removes or changes into a
+        BatchCommand until the enclosing _undo_step ends (or, outside one,
+        until _end_undo_step, undo or redo), so one entry costs memory in
+        proportion to the change, not to the list.
+
+        Only records if the tree has items. This prevents undoing
         back to an empty state when first adding files.
         """
         if self._is_restoring_state:
             return  # Don't save state while restoring
+        if self._model.journal is not None:
+            return  # Already recording this action
 
         # Don't save empty state - we don't want to undo back to empty
         if self.topLevelItemCount() == 0:
             return
 
-        state = self._serialize_tree_state()
-        self._undo_stack.append(state)
-
-        # Limit undo stack size
-        if len(self._undo_stack) > self._max_undo_levels:
-            self._undo_stack.pop(0)
+        command = BatchCommand()
+        self._model.journal = command
+        self._undo_stack.append(command)
 
         # Clear redo stack when a new action is performed
         self._redo_stack.clear()
 
-        logger.info(f"State saved for undo. Undo stack size: {len(self._undo_stack)}")
-
-    def _serialize_tree_state(self):
-        """Serialize the current tree state to a list of dictionaries."""
-        state = {"next_item_id": self._next_item_id, "items": []}
-
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            if item:
-                state["items"].append(self._serialize_item(item))
-
-        return state
-
-    def _serialize_item(self, item):
-        """Serialize a single tree item and its children."""
-        item_data = {
-            "file_path": item.data(0, Qt.ItemDataRole.UserRole),
-            "item_id": item.data(0, self.ITEM_ID_ROLE),
-            "text": item.text(0),
-            "force_process": item.data(0, self.FORCE_PROCESS_ROLE) or False,
-            "manually_skipped": item.data(0, self.PROCESSED_STATE_ROLE) or False,
-            "children": [],
-        }
+    def _end_undo_step(self):
+        """Stop recording the current undo entry and enforce the memory budget."""
+        command = self._model.journal
+        if command is None:
+            return
+        self._model.journal = None
+        if not command:
+            # Nothing changed (e.g. the action was cancelled)
+            if self._undo_stack and self._undo_stack[-1] is command:
+                self._undo_stack.pop()
+            return
 
-        for i in range(item.childCount()):
-            child = item.child(i)
-            if child:
-                item_data["children"].append(self._serialize_item(child))
+        # Drop the oldest entries beyond the budget, always keeping the newest
+        used = sum(c.cost for c in self._undo_stack) + sum(
+            c.cost for c in self._redo_stack
+        )
+        while used > self._undo_memory_budget and len(self._undo_stack) > 1:
+            used -= self._undo_stack.pop(0).cost
 
-        return item_data
+        logger.info(
+            f"State saved for undo. Undo stack size: {len(self._undo_stack)}, ~{used // 1024} KiB"
+        )
 
-    def _restore_tree_state(self, state):
-        """Restore the tree state from a serialized state dictionary."""
+    def _apply_command(self, command, undo):
+        """Undo or redo a recorded command in place."""
         self._is_restoring_state = True
-
         try:
-            # Clear current tree without triggering undo save
-            self.clear()
-
-            # Restore next_item_id
-            self._next_item_id = state.get("next_item_id", 1)
-
-            # Restore all items
-            for item_data in state.get("items", []):
-                item = self._deserialize_item(item_data)
-                if item:
-                    self.addTopLevelItem(item)
-                    item.setExpanded(True)
+            if undo:
+                restored = command.undo(self._model)
+            else:
+                restored = command.redo(self._model)
 
             # Trigger UI update
             self._schedule_ui_update()
 
-            # Re-apply processed states from cache after restore
-            self._reapply_processed_states_from_cache()
-
+            # Re-apply processed states from cache to items put back
+            self._reapply_processed_states_from_cache(restored)
         finally:
             self._is_restoring_state = False
 
-    def _reapply_processed_states_from_cache(self):
+    def _reapply_processed_states_from_cache(self, items):
         """Re-apply processed states and styles to items after undo/redo."""
         if not self._is_skip_processed_enabled():
             return
 
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            if item:
-                # Check if force process is set (takes priority)
-                if item.data(0, self.FORCE_PROCESS_ROLE):
-                    item.setData(0, self.PROCESSED_STATE_ROLE, False)
-                    continue
-
-                # Check if manually skipped (from undo state)
-                if item.data(0, self.PROCESSED_STATE_ROLE):
-                    self._apply_processed_style(item, True)
-                    continue
-
-                # Otherwise check cache for processed status
-                item_path = item.data(0, Qt.ItemDataRole.UserRole)
-                if item_path:
-                    norm_path = os.path.normpath(item_path)
-                    is_processed = self._processed_items_cache.get(norm_path, False)
-                    if is_processed:
-                        item.setData(0, self.PROCESSED_STATE_ROLE, True)
-                        self._apply_processed_style(item, True)
-
-    def _deserialize_item(self, item_data):
-        """Deserialize a single tree item and its children from saved data."""
-        file_path = item_data.get("file_path")
-        if not file_path:
-            return None
-
-        item = QTreeWidgetItem([item_data.get("text", get_basename(file_path))])
-        item.setData(0, Qt.ItemDataRole.UserRole, file_path)
-        item.setData(0, self.ITEM_ID_ROLE, item_data.get("item_id"))
-        item.setIcon(0, self.icon_provider.icon(QFileInfo(file_path)))
-
-        # Restore force_process and manually_skipped states
-        if item_data.get("force_process", False):
-            item.setData(0, self.FORCE_PROCESS_ROLE, True)
-        if item_data.get("manually_skipped", False):
-            item.setData(0, self.PROCESSED_STATE_ROLE, True)
+        for item in items:
+            if item.parent() is not None:
+                continue
+            # Check if force process is set (takes priority)
+            if item.data(0, self.FORCE_PROCESS_ROLE):
+                item.setData(0, self.PROCESSED_STATE_ROLE, False)
+                continue
 
-        # Restore children
-        for child_data in item_data.get("children", []):
-            child = self._deserialize_item(child_data)
-            if child:
-                item.addChild(child)
+            # Check if manually skipped (from undo state)
+            if item.data(0, self.PROCESSED_STATE_ROLE):
+                self._apply_processed_style(item, True)
+                continue
 
-        return item
+            # Otherwise check cache for processed status
+            item_path = item.data(0, Qt.ItemDataRole.UserRole)
+            if item_path:
+                norm_path = os.path.normpath(item_path)
+                is_processed = self._processed_items_cache.get(norm_path, False)
+                if is_processed:
+                    item.setData(0, self.PROCESSED_STATE_ROLE, True)
+                    self._apply_processed_style(item, True)
 
     def undo(self):
-        """Undo the last action by restoring the previous state."""
+        """Undo the last action by reverting its recorded changes."""
+        self._end_undo_step()
         if not self._undo_stack:
             logger.info("Nothing to undo")
             return False
 
-        # Save current state to redo stack before undoing
-        current_state = self._serialize_tree_state()
-        self._redo_stack.append(current_state)
-
-        # Pop and restore the previous state
-        previous_state = self._undo_stack.pop()
-        self._restore_tree_state(previous_state)
+        command = self._undo_stack.pop()
+        self._apply_command(command, undo=True)
+        self._redo_stack.append(command)
 
         logger.info(
             f"Undo performed. Undo stack: {len(self._undo_stack)}, Redo stack: {len(self._redo_stack)}"
@@ -2644,18 +2866,15 @@ class BatchTreeView(QTreeWidget):
         return True
 
     def redo(self):
-        """Redo the last undone action by restoring the next state."""
+        """Redo the last undone action by applying its changes again."""
+        self._end_undo_step()
         if not self._redo_stack:
             logger.info("Nothing to redo")
             return False
 
-        # Save current state to undo stack before redoing
-        current_state = self._serialize_tree_state()
-        self._undo_stack.append(current_state)
-
-        # Pop and restore the next state
-        next_state = self._redo_stack.pop()
-        self._restore_tree_state(next_state)
+        command = self._redo_stack.pop()
+        self._apply_command(command, undo=False)
+        self._undo_stack.append(command)
 
         logger.info(
             f"Redo performed. Undo stack: {len(self._undo_stack)}, Redo stack: {len(self._redo_stack)}"
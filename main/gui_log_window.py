@@ -1,6 +1,9 @@
 import os
+import shutil
 import logging
+import tempfile
 import texts
+from collections import deque
 from datetime import datetime
 from PyQt6.QtWidgets import (
     QWidget,
@@ -10,14 +13,18 @@ from PyQt6.QtWidgets import (
     QSizePolicy,
     QPushButton,
     QProgressBar,
+    QLabel,
 )
-from PyQt6.QtCore import pyqtSignal, QObject
+from PyQt6.QtCore import pyqtSignal, QObject, QTimer
 from PyQt6.QtGui import QTextCursor, QColor, QFont, QTextCharFormat, QFontDatabase
 from constants import DEFAULT_OPTIONS, COLORS, SYNC_TOOLS, AUTOMATIC_SAVE_MAP
 from utils import get_resource_path, get_logs_directory, open_folder
 
 logger = logging.getLogger(__name__)
 
+LOG_FLUSH_INTERVAL_MS = 50  # Buffered lines are rendered at most this often
+LOG_MAX_BLOCKS = 10000  # Lines kept in the view; the full log is spooled to disk
+
 
 _log_font_family = None
 _log_font_loaded = False
@@ -50,6 +57,7 @@ from PyQt6.QtCore import pyqtSignal, QObject, QThread
 
 class LogSignalRelay(QObject):
     append_message_signal = pyqtSignal(str, bool, object, bool, str)
+    flush_requested = pyqtSignal()
 
 
 class LogWindow(QWidget):
@@ -59,38 +67,54 @@ class LogWindow(QWidget):
         super().__init__(parent)
         self._config_printed = False
         self.signal_relay = LogSignalRelay()
-        self.signal_relay.append_message_signal.connect(self._do_append_message)
+        self.signal_relay.append_message_signal.connect(self.append_message)
+        self.signal_relay.flush_requested.connect(self._schedule_flush)
         self._last_line_is_update = False  # Initialize state for overwrite logic
+        # Messages waiting to be rendered; appended from any thread
+        self._pending = deque()
+        self._flush_scheduled = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
+        self._formats = {}  # (bold, color) -> QTextCharFormat
+        # Full log text, since the view only keeps the last LOG_MAX_BLOCKS lines
+        self._spool = None
+        self._spool_update = None  # Last overwrite line, not yet final
         self._user_scrolled_up = False  # Track if user scrolled up
+        self._job_progress = {}  # idx -> (total, percent) for concurrent batch jobs
         self._setup_ui()
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(15)
-        self.log_text = QTextEdit(readOnly=True)
-        self.log_text.setFont(_get_log_font())
-
-        self.log_text.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
-        self.log_text.setSizePolicy(
+        self._log_text = QTextEdit(readOnly=True)
+        self._log_text.setFont(_get_log_font())
+        document = self._log_text.document()
+        document.setMaximumBlockCount(LOG_MAX_BLOCKS)
+        document.setUndoRedoEnabled(False)
+
+        self._log_text.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
+        self._log_text.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
         )
-        layout.addWidget(self.log_text, 1)
+        layout.addWidget(self._log_text, 1)
 
         # floating scroll-to-bottom button
-        self.scroll_button = QPushButton("↓", self.log_text)
+        self.scroll_button = QPushButton("↓", self._log_text)
         self.scroll_button.setVisible(False)
         self.scroll_button.setFixedSize(35, 35)
         self.scroll_button.clicked.connect(
-            lambda: self.log_text.verticalScrollBar().setValue(
-                self.log_text.verticalScrollBar().maximum()
+            lambda: self._log_text.verticalScrollBar().setValue(
+                self._log_text.verticalScrollBar().maximum()
             )
         )
-        self.log_text.verticalScrollBar().valueChanged.connect(
+        self._log_text.verticalScrollBar().valueChanged.connect(
             self._update_scroll_button
         )
 
-        self.default_char_format = self.log_text.currentCharFormat()
+        self.default_char_format = self._log_text.currentCharFormat()
 
         # Bottom button layout - using vertical layout for buttons in rows
         bottom = QVBoxLayout()
@@ -123,6 +147,12 @@ class LogWindow(QWidget):
         progress_layout.addWidget(self.progress_bar)
         bottom.addLayout(progress_layout)
 
+        # One row per in-flight job when batch pairs run concurrently
+        self.job_progress_label = QLabel()
+        self.job_progress_label.setFont(_get_log_font())
+        self.job_progress_label.setVisible(False)
+        bottom.addWidget(self.job_progress_label)
+
         # Initially setup with just cancel button
         self.cancel_button = create_btn(texts.CANCEL, h=40)
         self.cancel_button.clicked.connect(self.cancel_clicked.emit)
@@ -133,7 +163,7 @@ class LogWindow(QWidget):
     def print_config(self, app):
         if self._config_printed:
             return
-        self.log_text.clear()
+        self._log_text.clear()
         cfg = app.config
         get = lambda k: cfg.get(k, DEFAULT_OPTIONS.get(k))
         sync_tool = get("sync_tool")
@@ -145,6 +175,10 @@ class LogWindow(QWidget):
             self.append_message(texts.BATCH_MODE, bold=True, color=COLORS["GREEN"])
             self.append_message(f"{texts.TOTAL_PAIRS_LABEL} ", end="")
             self.append_message(str(n), bold=True, color=COLORS["GREEN"])
+            self.append_message(f"{texts.BATCH_CONCURRENT_JOBS}: ", end="")
+            self.append_message(
+                str(get("batch_concurrency")), bold=True, color=COLORS["GREEN"]
+            )
         else:
             self.append_message(texts.MODE_LABEL, end="")
             self.append_message(texts.NORMAL_MODE, bold=True, color=COLORS["GREEN"])
@@ -264,71 +298,170 @@ class LogWindow(QWidget):
         # Force scroll to bottom after initial configuration is printed
         self._scroll_to_bottom()
 
+    @property
+    def log_text(self):
+        """The log view, with any buffered messages rendered first."""
+        self.flush()
+        return self._log_text
+
     def append_message(
         self, message, bold=False, color=None, overwrite=False, end="\n"
     ):
-        if QThread.currentThread() != self.thread():
-            self.signal_relay.append_message_signal.emit(
-                str(message), bool(bold), color, bool(overwrite), str(end)
-            )
-            return
-        self._do_append_message(message, bold, color, overwrite, end)
+        """Queue a message for the log; safe to call from any thread.
 
-    def _do_append_message(
-        self, message, bold=False, color=None, overwrite=False, end="\n"
-    ):
-        txt = self.log_text
-        cursor = txt.textCursor()
+        Messages are rendered in batches every LOG_FLUSH_INTERVAL_MS.
+        """
+        self._pending.append(
+            (str(message), bool(bold), color, bool(overwrite), str(end))
+        )
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            if QThread.currentThread() != self.thread():
+                self.signal_relay.flush_requested.emit()
+            else:
+                self._flush_timer.start()
+
+    def _schedule_flush(self):
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self):
+        """Render all queued messages now."""
+        self._flush_timer.stop()
+        self._flush_scheduled = False
+        entries = []
+        pending = self._pending
+        while pending:
+            entries.append(pending.popleft())
+        if entries:
+            self._spool_messages(entries)
+            self._render_messages(entries)
+
+    def _char_format(self, bold, color):
+        fmt = self._formats.get((bold, color))
+        if fmt is None:
+            fmt = QTextCharFormat(self.default_char_format)
+            if bold:
+                fmt.setFontWeight(QFont.Weight.Bold)
+            if color:
+                fmt.setForeground(QColor(color))
+            self._formats[(bold, color)] = fmt
+        return fmt
+
+    def _render_messages(self, entries):
+        txt = self._log_text
         scrollbar = txt.verticalScrollBar()
         # Only auto-scroll if user is at bottom or hasn't scrolled up
         at_bottom = scrollbar.value() >= (scrollbar.maximum() - 10)
-        # Set format
-        fmt = QTextCharFormat(self.default_char_format)
-        if bold:
-            fmt.setFontWeight(QFont.Weight.Bold)
-        if color:
-            fmt.setForeground(QColor(color))
+
+        # An overwrite line followed by another one is never seen; keep the last
+        collapsed = []
+        for entry in entries:
+            if entry[3]:
+                if not entry[0]:
+                    continue
+                if collapsed and collapsed[-1][3]:
+                    collapsed[-1] = entry
+                    continue
+            collapsed.append(entry)
+
+        cursor = QTextCursor(txt.document())
         cursor.movePosition(QTextCursor.MoveOperation.End)
-        cursor.setCharFormat(fmt)
-        if overwrite:
-            if not message:
-                return
-            if self._last_line_is_update:
-                cursor.movePosition(QTextCursor.MoveOperation.StartOfBlock)
-                cursor.movePosition(
-                    QTextCursor.MoveOperation.EndOfBlock,
-                    QTextCursor.MoveMode.KeepAnchor,
-                )
-                cursor.removeSelectedText()
-            cursor.insertText(str(message))
-        else:
-            if self._last_line_is_update:
-                cursor.insertText("\n")
-            cursor.insertText(str(message) + end)
-        self._last_line_is_update = overwrite
+        cursor.beginEditBlock()
+        # Consecutive text with the same format is inserted in one go
+        run, run_format = [], None
+
+        def insert_run():
+            if run:
+                cursor.insertText("".join(run), self._char_format(*run_format))
+                run.clear()
+
+        for message, bold, color, overwrite, end in collapsed:
+            if (bold, color) != run_format:
+                insert_run()
+                run_format = (bold, color)
+            if overwrite:
+                if self._last_line_is_update:
+                    insert_run()
+                    cursor.movePosition(QTextCursor.MoveOperation.StartOfBlock)
+                    cursor.movePosition(
+                        QTextCursor.MoveOperation.EndOfBlock,
+                        QTextCursor.MoveMode.KeepAnchor,
+                    )
+                    cursor.removeSelectedText()
+                run.append(message)
+            else:
+                if self._last_line_is_update:
+                    run.append("\n")
+                run.append(message + end)
+            self._last_line_is_update = overwrite
+        insert_run()
+        cursor.endEditBlock()
+
         # Always auto-scroll unless user has scrolled up
         if at_bottom or not self._user_scrolled_up or txt.document().blockCount() <= 30:
             scrollbar.setValue(scrollbar.maximum())
             self._user_scrolled_up = False
 
+    def _spool_messages(self, entries):
+        """Append the final text of the messages to the full log spool file."""
+        parts = []
+        for message, bold, color, overwrite, end in entries:
+            if overwrite:
+                if message:
+                    self._spool_update = message
+                continue
+            if self._spool_update is not None:
+                parts.append(self._spool_update + "\n")
+                self._spool_update = None
+            parts.append(message + end)
+        if not parts:
+            return
+        try:
+            if self._spool is None:
+                self._spool = tempfile.TemporaryFile(
+                    "w+", encoding="utf-8", errors="replace"
+                )
+            self._spool.write("".join(parts))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to spool log output: {e}")
+
+    def _write_full_log(self, log_file):
+        """Write everything logged since the last clear() to log_file."""
+        self.flush()
+        if self._spool is None:
+            log_file.write(self._log_text.toPlainText())
+            return
+        self._spool.flush()
+        self._spool.seek(0)
+        shutil.copyfileobj(self._spool, log_file)
+        self._spool.seek(0, os.SEEK_END)
+        if self._spool_update is not None:
+            log_file.write(self._spool_update)
+
     def clear(self):
-        self.log_text.clear()
+        self._pending.clear()
+        self._log_text.clear()
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+        self._spool_update = None
         self._config_printed = False
         self._last_line_is_update = False  # Reset overwrite state
         self._user_scrolled_up = False
 
     def _position_scroll_button(self):
         margin = 10
-        lw = self.log_text.width()
-        lh = self.log_text.height()
+        lw = self._log_text.width()
+        lh = self._log_text.height()
         sw = self.scroll_button.width()
         sh = self.scroll_button.height()
-        sb = self.log_text.verticalScrollBar()
+        sb = self._log_text.verticalScrollBar()
         scrollbar_width = sb.sizeHint().width()
         self.scroll_button.move(lw - sw - margin - scrollbar_width, lh - sh - margin)
 
     def _update_scroll_button(self):
-        sb = self.log_text.verticalScrollBar()
+        sb = self._log_text.verticalScrollBar()
         at_bottom = sb.value() >= (sb.maximum() - 10)
         if at_bottom:
             self.scroll_button.hide()
@@ -352,6 +485,31 @@ class LogWindow(QWidget):
         else:
             self.progress_bar.setFormat("%p%")
 
+    def update_job_progress(self, idx, total, percent):
+        """Update the progress row of one in-flight batch job."""
+        self._job_progress[idx] = (total, percent)
+        self._render_job_progress()
+
+    def clear_job_progress(self, idx=None):
+        """Remove the progress row of a finished job, or all rows if idx is None."""
+        if idx is None:
+            self._job_progress.clear()
+        else:
+            self._job_progress.pop(idx, None)
+        self._render_job_progress()
+
+    def _render_job_progress(self):
+        if not self._job_progress:
+            self.job_progress_label.clear()
+            self.job_progress_label.setVisible(False)
+            return
+        rows = [
+            f"[{idx}/{total}] {int(percent):3d}%"
+            for idx, (total, percent) in sorted(self._job_progress.items())
+        ]
+        self.job_progress_label.setText("\n".join(rows))
+        self.job_progress_label.setVisible(True)
+
     def handle_sync_completion(self, success, output, post_success_callback=None):
         """Handle completion of a synchronization process
 
@@ -467,7 +625,7 @@ class LogWindow(QWidget):
             )
 
         # Force scroll to bottom only if at bottom
-        scrollbar = self.log_text.verticalScrollBar()
+        scrollbar = self._log_text.verticalScrollBar()
         if scrollbar.value() == scrollbar.maximum():
             scrollbar.setValue(scrollbar.maximum())
 
@@ -481,6 +639,7 @@ class LogWindow(QWidget):
         """Update buttons for batch sync completion."""
         app = self.window()
         self.progress_bar.setVisible(False)
+        self.clear_job_progress()
 
         # Save batch log output to file if keep_log_records is enabled
         self._save_log_output_to_file(app, success=True, mode="batch")
@@ -512,7 +671,8 @@ class LogWindow(QWidget):
 
     def _scroll_to_bottom(self):
         """Scroll to the bottom of the log text."""
-        scrollbar = self.log_text.verticalScrollBar()
+        self.flush()
+        scrollbar = self._log_text.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
         self.scroll_button.hide()
         self._user_scrolled_up = False
@@ -569,9 +729,6 @@ class LogWindow(QWidget):
             filename = f"{mode}_{status}_{current_date}.txt"
             log_file_path = os.path.join(logs_dir, filename)
 
-            # Get the plain text content from the log window
-            log_content = self.log_text.toPlainText()
-
             # Write to file
             with open(
                 log_file_path, "w", encoding="utf-8", errors="replace"
@@ -584,7 +741,8 @@ class LogWindow(QWidget):
                     f"Status: {'Success' if success else 'Failed/Canceled'}\n"
                 )
                 log_file.write("=" * 50 + "\n\n")
-                log_file.write(log_content)
+                # The full log, including lines the view no longer shows
+                self._write_full_log(log_file)
 
             logger.info(f"Log output saved to: {log_file_path}")
 
@@ -607,6 +765,7 @@ class LogWindow(QWidget):
         # Reset progress bar
         self.progress_bar.setValue(0)
         self.progress_bar.setVisible(False)
+        self.clear_job_progress()
 
         # Reset signal handlers to default
         try:
@@ -633,6 +792,4 @@ class LogWindowHandler(logging.Handler):
         elif record.levelno >= logging.WARNING:
             color = COLORS["ORANGE"]
             bold = False
-        self.log_window.signal_relay.append_message_signal.emit(
-            msg, bool(bold), color, False, "\n"
-        )
+        self.log_window.append_message(msg, bold=bool(bold), color=color)
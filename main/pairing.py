@@ -6,6 +6,8 @@ and pair_paths from this module.
 """
 
 import os
+from bisect import bisect_left
+from itertools import chain
 from typing import Iterable
 
 from constants import VIDEO_EXTENSIONS, SUBTITLE_EXTENSIONS
@@ -28,21 +30,25 @@ def effective_basename(file_path: str) -> str:
     return base
 
 
-def calculate_file_similarity(reference_name: str, sub_name: str) -> int:
-    """Score how likely two filenames are a video/subtitle pair.
+_STRIP_CHARS = ".-_ [](){}"
+# Pairs scoring below this are not matched by similarity
+SIMILARITY_THRESHOLD = 30
 
-    Higher is better. The batch matcher uses a threshold of 30.
-    """
-    reference_base = effective_basename(reference_name).lower().strip(".-_ [](){}")
-    sub_base = effective_basename(sub_name).lower().strip(".-_ [](){}")
 
-    common_len = 0
-    for i in range(min(len(reference_base), len(sub_base))):
-        if reference_base[i] == sub_base[i]:
-            common_len += 1
-        else:
-            break
+def normalized_basename(file_path: str) -> str:
+    """Effective basename, lowercased and stripped of separators/brackets."""
+    return effective_basename(file_path).lower().strip(_STRIP_CHARS)
+
 
+def _common_prefix_length(a: str, b: str) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def _similarity(reference_base: str, sub_base: str, common_len: int) -> int:
     similarity = common_len * 10
     length_diff = abs(len(reference_base) - len(sub_base))
     similarity -= min(length_diff * 2, similarity // 2)
@@ -51,77 +57,171 @@ def calculate_file_similarity(reference_name: str, sub_name: str) -> int:
     return max(0, similarity)
 
 
+def calculate_file_similarity(reference_name: str, sub_name: str) -> int:
+    """Score how likely two filenames are a video/subtitle pair.
+
+    Higher is better. The batch matcher uses a threshold of 30.
+    """
+    reference_base = normalized_basename(reference_name)
+    sub_base = normalized_basename(sub_name)
+    common_len = _common_prefix_length(reference_base, sub_base)
+    return _similarity(reference_base, sub_base, common_len)
+
+
+def _prefix_end(prefix: str) -> str:
+    """Smallest string greater than every string starting with prefix."""
+    last = ord(prefix[-1])
+    if last == 0x10FFFF:
+        return prefix + chr(0x10FFFF)
+    return prefix[:-1] + chr(last + 1)
+
+
+class _SubtitleIndex:
+    """Normalized subtitle names indexed for exact and prefix lookups.
+
+    Entries keep their position in the input list, which decides ties the
+    same way a linear scan over the subtitles would.
+    """
+
+    def __init__(self, subs, paired_subs):
+        self.subs = subs
+        self.paired_subs = paired_subs
+        self.bases = [normalized_basename(sub) for sub in subs]
+        self.by_base = {}
+        for i, base in enumerate(self.bases):
+            self.by_base.setdefault(base, []).append(i)
+        self.order = sorted(range(len(subs)), key=self.bases.__getitem__)
+        self.keys = [self.bases[i] for i in self.order]
+
+    def first_exact(self, base):
+        """Input position of the first unpaired subtitle named base, or None."""
+        candidates = self.by_base.get(base)
+        while candidates:
+            i = candidates[0]
+            if self.subs[i] not in self.paired_subs:
+                return i
+            # Paired subtitles never become available again.
+            candidates.pop(0)
+        return None
+
+    def _range(self, prefix):
+        lo = bisect_left(self.keys, prefix)
+        return lo, bisect_left(self.keys, _prefix_end(prefix), lo)
+
+    def best_similar(self, base):
+        """Position of the unpaired subtitle scoring highest against base.
+
+        Subtitles sharing a k-character prefix with base form one range of
+        the sorted index, and a common prefix of k scores at most 10 * k.
+        Ranges are therefore visited from the longest shared prefix down,
+        stopping once no shorter prefix can reach the best score so far.
+        """
+        best_score, best = 0, None
+        inner = None
+        min_common = -(-SIMILARITY_THRESHOLD // 10)
+        for common_len in range(len(base), max(min_common, 1) - 1, -1):
+            if common_len * 10 < best_score:
+                break
+            lo, hi = self._range(base[:common_len])
+            if inner is None:
+                positions = range(lo, hi)
+            else:
+                # Only entries whose common prefix is exactly common_len
+                positions = chain(range(lo, inner[0]), range(inner[1], hi))
+            for pos in positions:
+                i = self.order[pos]
+                if self.subs[i] in self.paired_subs:
+                    continue
+                score = _similarity(base, self.bases[i], common_len)
+                if score > best_score or (
+                    score == best_score and best is not None and i < best
+                ):
+                    best_score, best = score, i
+            inner = (lo, hi)
+        return best, best_score
+
+
+def pair_exact(references: Iterable[str], subs: Iterable[str]):
+    """Pair each reference with the first unpaired subtitle of the same name.
+
+    Names are compared by normalized_basename. Returns (pairs,
+    paired_references, paired_subs) like pair_paths.
+    """
+    references = list(references)
+    index = _SubtitleIndex(list(subs), set())
+    return _pair_exact(references, index)
+
+
+def _pair_exact(references, index):
+    paired_references = set()
+    pairs = []
+    for reference in references:
+        i = index.first_exact(normalized_basename(reference))
+        if i is not None:
+            sub = index.subs[i]
+            pairs.append((reference, sub))
+            paired_references.add(reference)
+            index.paired_subs.add(sub)
+    return pairs, paired_references, index.paired_subs
+
+
 def pair_paths(references: Iterable[str], subs: Iterable[str]):
     """Pair video references to subtitle files.
 
     Two-pass: (1) exact effective-basename match, (2) similarity score >= 30.
     Returns (pairs, paired_references, paired_subs) where pairs is a list of
     (reference, subtitle) tuples and the two sets contain the matched inputs.
+
+    Every name is normalized once; exact matches come from a hash map and
+    similarity candidates from a sorted prefix index, so large libraries
+    pair in O(n log n) for typical names instead of comparing every
+    reference with every subtitle.
     """
     references = list(references)
-    subs = list(subs)
-    paired_references = set()
-    paired_subs = set()
-    pairs = []
-
-    for reference in references:
-        reference_base = effective_basename(reference).lower().strip(".-_ [](){}")
-        for sub in subs:
-            if sub in paired_subs:
-                continue
-            sub_base = effective_basename(sub).lower().strip(".-_ [](){}")
-            if reference_base == sub_base:
-                pairs.append((reference, sub))
-                paired_references.add(reference)
-                paired_subs.add(sub)
-                break
+    index = _SubtitleIndex(list(subs), set())
+    pairs, paired_references, paired_subs = _pair_exact(references, index)
 
     for reference in references:
         if reference in paired_references:
             continue
-        best_match = None
-        best_score = 0
-        for sub in subs:
-            if sub in paired_subs:
-                continue
-            similarity = calculate_file_similarity(reference, sub)
-            if similarity > best_score:
-                best_score = similarity
-                best_match = sub
-        if best_match and best_score >= 30:
+        best, best_score = index.best_similar(normalized_basename(reference))
+        if best is not None and best_score >= SIMILARITY_THRESHOLD:
+            best_match = index.subs[best]
             pairs.append((reference, best_match))
             paired_references.add(reference)
             paired_subs.add(best_match)
     return pairs, paired_references, paired_subs
 
 
-def _scan_dir(folder: str, recursive: bool):
-    """Yield absolute paths to files in folder (optionally recursive)."""
-    if recursive:
-        for root, _dirs, files in os.walk(folder):
-            for name in files:
-                yield os.path.join(root, name)
-    else:
-        for name in os.listdir(folder):
-            full = os.path.join(folder, name)
-            if os.path.isfile(full):
-                yield full
+def _scan_media(folder: str, recursive: bool, index=None):
+    """List folder once and split its files into (videos, subtitles), sorted.
+
+    index is an optional scan_index.ScanIndex; by default the folder is
+    listed without persisting a snapshot.
+    """
+    from scan_index import ScanIndex
+
+    paths = (index or ScanIndex()).files(folder, recursive)
+    videos = sorted(p for p in paths if is_video_file(p))
+    subs = sorted(p for p in paths if is_subtitle_file(p))
+    return videos, subs
 
 
-def pair_folder(folder: str, *, recursive: bool = False):
+def pair_folder(folder: str, *, recursive: bool = False, index=None):
     """Find video+subtitle files in one folder and pair them.
 
     Returns a list of (video_path, subtitle_path) tuples.
     """
     if not os.path.isdir(folder):
         raise FileNotFoundError(f"Not a directory: {folder}")
-    videos = sorted(p for p in _scan_dir(folder, recursive) if is_video_file(p))
-    subs = sorted(p for p in _scan_dir(folder, recursive) if is_subtitle_file(p))
+    videos, subs = _scan_media(folder, recursive, index)
     pairs, _, _ = pair_paths(videos, subs)
     return pairs
 
 
-def pair_folders(video_dir: str, subtitle_dir: str, *, recursive: bool = False):
+def pair_folders(
+    video_dir: str, subtitle_dir: str, *, recursive: bool = False, index=None
+):
     """Pair videos from one directory with subtitles from another.
 
     Returns a list of (video_path, subtitle_path) tuples.
@@ -129,7 +229,7 @@ def pair_folders(video_dir: str, subtitle_dir: str, *, recursive: bool = False):
     for d in (video_dir, subtitle_dir):
         if not os.path.isdir(d):
             raise FileNotFoundError(f"Not a directory: {d}")
-    videos = sorted(p for p in _scan_dir(video_dir, recursive) if is_video_file(p))
-    subs = sorted(p for p in _scan_dir(subtitle_dir, recursive) if is_subtitle_file(p))
+    videos, _ = _scan_media(video_dir, recursive, index)
+    _, subs = _scan_media(subtitle_dir, recursive, index)
     pairs, _, _ = pair_paths(videos, subs)
     return pairs
@@ -0,0 +1,208 @@
+"""Resource usage of the child processes a sync runs.
+
+ProcessUsage records what one child consumed: wall time, CPU user and system
+time, peak RSS and block I/O. The CPU, memory and I/O figures come from
+os.wait4, so such children have to be reaped here instead of by Popen.wait()
+or asyncio's child watcher: wait_process() reaps a Popen child, and
+AsyncProcess drives one from asyncio. Module tools run inside worker
+processes that outlive the job, so those measure themselves with snapshot()
+and usage_since(). Where os.wait4 and the resource module are missing
+(Windows), only the wall time is known.
+"""
+
+import os
+import sys
+import time
+import asyncio
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+# ru_maxrss is in bytes on macOS and kilobytes elsewhere
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+# How often a child is checked for exit where it cannot be waited on
+EXIT_POLL_SECONDS = 0.05
+
+
+@dataclass
+class ProcessUsage:
+    """Resources used by one child process; None where not measured."""
+
+    name: str
+    wall_ms: float
+    returncode: Optional[int] = None
+    user_ms: Optional[float] = None
+    sys_ms: Optional[float] = None
+    max_rss_bytes: Optional[int] = None
+    block_in: Optional[int] = None
+    block_out: Optional[int] = None
+
+    @classmethod
+    def from_rusage(cls, name, started, returncode, rusage=None):
+        """Usage of a child started at monotonic time started.
+
+        rusage is the child's os.wait4 result, or None if it was not
+        available.
+        """
+        usage = cls(name, _ms_since(started), returncode)
+        if rusage is not None:
+            usage.user_ms = round(rusage.ru_utime * 1000, 3)
+            usage.sys_ms = round(rusage.ru_stime * 1000, 3)
+            usage.max_rss_bytes = rusage.ru_maxrss * _MAXRSS_UNIT
+            usage.block_in = rusage.ru_inblock
+            usage.block_out = rusage.ru_oublock
+        return usage
+
+    @classmethod
+    def from_report(cls, name, started, returncode, report=None):
+        """Usage of a job whose process measured itself with usage_since."""
+        return cls(name, _ms_since(started), returncode, **(report or {}))
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def _ms_since(started):
+    return round((time.monotonic() - started) * 1000, 3)
+
+
+def wait_process(process, name, started):
+    """Wait for a Popen child and reap it; returns (returncode, ProcessUsage)."""
+    rusage = None
+    if hasattr(os, "wait4") and process.returncode is None:
+        try:
+            _, status, rusage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+        except ChildProcessError:
+            pass  # Already reaped, e.g. by Popen.poll() in a cancel handler
+    returncode = process.wait()
+    return returncode, ProcessUsage.from_rusage(name, started, returncode, rusage)
+
+
+def communicate(process, name, started):
+    """Read a create_process child's output until it exits.
+
+    Like Popen.communicate() for children whose stderr goes to stdout, but
+    reaps them with wait_process. Returns (output, ProcessUsage).
+    """
+    with process.stdout:
+        output = process.stdout.read()
+    _, usage = wait_process(process, name, started)
+    return output, usage
+
+
+class AsyncProcess:
+    """A Popen child driven from asyncio and reaped with os.wait4.
+
+    Offers what sync_core uses of asyncio.subprocess.Process: stdout (a
+    StreamReader), pid, returncode, wait(), send_signal(), terminate() and
+    kill(). Once wait() returns, rusage holds the child's resource usage.
+    Create it with AsyncProcess.start(popen) from a running event loop.
+    """
+
+    def __init__(self, popen, stdout, transport):
+        self.popen = popen
+        self.pid = popen.pid
+        self.stdout = stdout
+        self.rusage = None
+        self._transport = transport
+
+    @classmethod
+    async def start(cls, popen):
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        transport, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), popen.stdout
+        )
+        return cls(popen, reader, transport)
+
+    @property
+    def returncode(self):
+        return self.popen.returncode
+
+    async def wait(self):
+        """Wait for the child to exit, then close its output pipe.
+
+        Read stdout to the end first: output still unread is discarded.
+        """
+        pidfd = None
+        try:
+            pidfd = os.pidfd_open(self.pid)
+        except (AttributeError, OSError):
+            pass  # Not Linux 5.3+: poll for the exit instead
+        try:
+            while self.popen.returncode is None:
+                try:
+                    pid, status, rusage = os.wait4(self.pid, os.WNOHANG)
+                except ChildProcessError:
+                    self.popen.wait()  # Reaped elsewhere; rusage is lost
+                    break
+                if pid:
+                    self.rusage = rusage
+                    self.popen.returncode = os.waitstatus_to_exitcode(status)
+                    break
+                if pidfd is None:
+                    await asyncio.sleep(EXIT_POLL_SECONDS)
+                else:
+                    await _readable(pidfd)
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
+        self._transport.close()
+        return self.popen.returncode
+
+    def send_signal(self, sig):
+        self.popen.send_signal(sig)
+
+    def terminate(self):
+        self.popen.terminate()
+
+    def kill(self):
+        self.popen.kill()
+
+
+async def _readable(fd):
+    loop = asyncio.get_running_loop()
+    ready = loop.create_future()
+    loop.add_reader(fd, lambda: ready.done() or ready.set_result(None))
+    try:
+        await ready
+    finally:
+        loop.remove_reader(fd)
+
+
+def snapshot():
+    """Resource usage so far of this process and of its reaped children.
+
+    Returns None where the resource module is not available.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    return (
+        resource.getrusage(resource.RUSAGE_SELF),
+        resource.getrusage(resource.RUSAGE_CHILDREN),
+    )
+
+
+def usage_since(before) -> Optional[dict]:
+    """ProcessUsage fields for the work done since snapshot() returned before.
+
+    Covers this process and the children it reaped meanwhile (e.g. the ffmpeg
+    that ffsubsync runs). ru_maxrss is a lifetime peak, so max_rss_bytes is
+    the larger of the two peaks rather than the job's own.
+    """
+    after = snapshot()
+    if before is None or after is None:
+        return None
+    return {
+        "user_ms": round(
+            sum(a.ru_utime - b.ru_utime for a, b in zip(after, before)) * 1000, 3
+        ),
+        "sys_ms": round(
+            sum(a.ru_stime - b.ru_stime for a, b in zip(after, before)) * 1000, 3
+        ),
+        "max_rss_bytes": max(a.ru_maxrss for a in after) * _MAXRSS_UNIT,
+        "block_in": sum(a.ru_inblock - b.ru_inblock for a, b in zip(after, before)),
+        "block_out": sum(a.ru_oublock - b.ru_oublock for a, b in zip(after, before)),
+    }
@@ -10,12 +10,107 @@ import sqlite3
 import hashlib
 import logging
 import threading
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 # Chunk size for partial hashing (64KB)
 HASH_CHUNK_SIZE = 64 * 1024  # 64KB
+# Threads used to fingerprint many files at once (I/O bound, so more threads
+# than cores helps on network shares)
+HASH_WORKERS = min(16, (os.cpu_count() or 1) * 4)
+# Hashes per "IN (...)" query, below SQLite's host parameter limit
+SQL_BATCH_SIZE = 500
+
+
+def calculate_partial_hash(filepath: str) -> Optional[Tuple[str, int]]:
+    """
+    Calculate a partial hash of a file for efficient fingerprinting.
+
+    Strategy: File Size + First 64KB + Last 64KB
+
+    Args:
+        filepath: Path to the file to hash
+
+    Returns:
+        Tuple of (hash_string, file_size) or None if file cannot be read
+    """
+    try:
+        if not os.path.exists(filepath):
+            logger.warning(f"File does not exist: {filepath}")
+            return None
+
+        file_size = os.path.getsize(filepath)
+        hasher = hashlib.sha256()
+
+        # Include file size in hash
+        hasher.update(str(file_size).encode("utf-8"))
+
+        with open(filepath, "rb") as f:
+            # Read first 64KB
+            first_chunk = f.read(HASH_CHUNK_SIZE)
+            hasher.update(first_chunk)
+
+            # Read last 64KB (if file is large enough)
+            if file_size > HASH_CHUNK_SIZE * 2:
+                f.seek(-HASH_CHUNK_SIZE, os.SEEK_END)
+                last_chunk = f.read(HASH_CHUNK_SIZE)
+                hasher.update(last_chunk)
+            elif file_size > HASH_CHUNK_SIZE:
+                # File is between 64KB and 128KB, read the remaining part
+                last_chunk = f.read()
+                hasher.update(last_chunk)
+
+        return (hasher.hexdigest(), file_size)
+
+    except PermissionError:
+        logger.error(f"Permission denied reading file: {filepath}")
+        return None
+    except Exception as e:
+        logger.error(f"Error calculating hash for {filepath}: {e}")
+        return None
+
+
+def calculate_partial_hashes(
+    filepaths: Iterable[str], max_workers: Optional[int] = None
+) -> Dict[str, Optional[Tuple[str, int]]]:
+    """
+    Calculate partial hashes of many files concurrently.
+
+    Args:
+        filepaths: Paths of the files to hash
+        max_workers: Number of hashing threads (defaults to HASH_WORKERS)
+
+    Returns:
+        Dict mapping each path to calculate_partial_hash's result
+    """
+    paths = list(dict.fromkeys(filepaths))
+    workers = min(max_workers or HASH_WORKERS, len(paths))
+    if workers <= 1:
+        return {path: calculate_partial_hash(path) for path in paths}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(paths, executor.map(calculate_partial_hash, paths)))
+
+
+def _stat_key(filepath: str) -> Optional[Tuple[str, int, int, int, int]]:
+    """(normalized path, size, mtime_ns, inode, device) of a file, or None."""
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return (
+        os.path.normcase(os.path.abspath(filepath)),
+        st.st_size,
+        st.st_mtime_ns,
+        st.st_ino,
+        st.st_dev,
+    )
+
+
+def _batches(items: List, size: int = SQL_BATCH_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
 
 
 class ProcessedItemsManager:
@@ -68,6 +163,7 @@ class ProcessedItemsManager:
         try:
             db_path = self._get_db_path()
             self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._configure_connection()
 
             cursor = self._conn.cursor()
             cursor.execute(
@@ -86,58 +182,48 @@ class ProcessedItemsManager:
                 CREATE INDEX IF NOT EXISTS idx_file_hash ON processed_items(file_hash)
             """
             )
+            # Fingerprints of files seen before, so unchanged files are
+            # recognised from their stat data without reading them again
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS file_fingerprints (
+                    path TEXT PRIMARY KEY,
+                    file_size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    device INTEGER NOT NULL,
+                    file_hash TEXT NOT NULL
+                )
+            """
+            )
             self._conn.commit()
             logger.info(f"Processed items database initialized at: {db_path}")
         except Exception as e:
             logger.error(f"Failed to initialize processed items database: {e}")
             raise
 
-    def _calculate_partial_hash(self, filepath: str) -> Optional[Tuple[str, int]]:
+    def _configure_connection(self):
         """
-        Calculate a partial hash of a file for efficient fingerprinting.
-
-        Strategy: File Size + First 64KB + Last 64KB
+        Use write-ahead logging with synchronous=NORMAL.
 
-        Args:
-            filepath: Path to the file to hash
-
-        Returns:
-            Tuple of (hash_string, file_size) or None if file cannot be read
+        Commits then append to the WAL without an fsync each (only
+        checkpoints sync), and readers never block the writer. A crash can
+        lose the last commits but never corrupts the database. Filesystems
+        without shared memory support (some network shares) keep the
+        default rollback journal.
         """
         try:
-            if not os.path.exists(filepath):
-                logger.warning(f"File does not exist: {filepath}")
-                return None
-
-            file_size = os.path.getsize(filepath)
-            hasher = hashlib.sha256()
-
-            # Include file size in hash
-            hasher.update(str(file_size).encode("utf-8"))
-
-            with open(filepath, "rb") as f:
-                # Read first 64KB
-                first_chunk = f.read(HASH_CHUNK_SIZE)
-                hasher.update(first_chunk)
-
-                # Read last 64KB (if file is large enough)
-                if file_size > HASH_CHUNK_SIZE * 2:
-                    f.seek(-HASH_CHUNK_SIZE, os.SEEK_END)
-                    last_chunk = f.read(HASH_CHUNK_SIZE)
-                    hasher.update(last_chunk)
-                elif file_size > HASH_CHUNK_SIZE:
-                    # File is between 64KB and 128KB, read the remaining part
-                    last_chunk = f.read()
-                    hasher.update(last_chunk)
-
-            return (hasher.hexdigest(), file_size)
-
-        except PermissionError:
-            logger.error(f"Permission denied reading file: {filepath}")
-            return None
-        except Exception as e:
-            logger.error(f"Error calculating hash for {filepath}: {e}")
-            return None
+            mode = self._conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            if mode.lower() == "wal":
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+            else:
+                logger.info(f"WAL not available, using journal mode: {mode}")
+        except sqlite3.Error as e:
+            logger.warning(f"Could not enable WAL for processed items database: {e}")
+
+    def _calculate_partial_hash(self, filepath: str) -> Optional[Tuple[str, int]]:
+        """Partial hash of a file, from the fingerprint cache when unchanged."""
+        return self._hash_many([filepath]).get(filepath)
 
     def is_processed(self, filepath: str) -> bool:
         """
@@ -206,6 +292,241 @@ class ProcessedItemsManager:
                 logger.error(f"Error marking file as processed: {e}")
                 return False
 
+    def _hash_many(
+        self, filepaths: Iterable[str]
+    ) -> Dict[str, Optional[Tuple[str, int]]]:
+        """
+        Partial hashes of many files.
+
+        A file whose path, size, mtime, inode and device match its cached
+        fingerprint is resolved without being opened. Other files are hashed
+        (see calculate_partial_hashes) and their fingerprints stored.
+        """
+        paths = list(dict.fromkeys(filepaths))
+        keys = {path: _stat_key(path) for path in paths}
+        cached = self._lookup_fingerprints([k[0] for k in keys.values() if k])
+
+        results = {}
+        misses = []
+        for path in paths:
+            key = keys[path]
+            entry = cached.get(key[0]) if key else None
+            if entry is not None and entry[:4] == key[1:]:
+                results[path] = (entry[4], key[1])
+            else:
+                misses.append(path)
+        if not misses:
+            return results
+
+        hashed = calculate_partial_hashes(misses)
+        results.update(hashed)
+        stale = []
+        rows = []
+        for path in misses:
+            key = keys[path]
+            if key is None:
+                continue
+            if hashed[path] is None:
+                stale.append(key[0])
+            else:
+                rows.append(key + (hashed[path][0],))
+        with self._db_lock:
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        """
+                        INSERT OR REPLACE INTO file_fingerprints
+                        (path, file_size, mtime_ns, inode, device, file_hash)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        """,
+                        rows,
+                    )
+                    self._conn.executemany(
+                        "DELETE FROM file_fingerprints WHERE path = ?",
+                        [(path,) for path in stale],
+                    )
+            except Exception as e:
+                logger.warning(f"Error storing file fingerprints: {e}")
+        return results
+
+    def _lookup_fingerprints(self, norm_paths: List[str]) -> Dict[str, Tuple]:
+        """Cached (size, mtime_ns, inode, device, hash) by normalized path."""
+        found = {}
+        with self._db_lock:
+            try:
+                cursor = self._conn.cursor()
+                for batch in _batches(list(dict.fromkeys(norm_paths))):
+                    placeholders = ",".join("?" * len(batch))
+                    cursor.execute(
+                        "SELECT path, file_size, mtime_ns, inode, device, file_hash "
+                        f"FROM file_fingerprints WHERE path IN ({placeholders})",
+                        batch,
+                    )
+                    for row in cursor.fetchall():
+                        found[row[0]] = row[1:]
+            except Exception as e:
+                logger.warning(f"Error reading file fingerprints: {e}")
+        return found
+
+    def prune_fingerprints(self) -> int:
+        """
+        Remove cached fingerprints of files that vanished or changed on disk.
+
+        Returns:
+            Number of removed entries, or -1 on error
+        """
+        with self._db_lock:
+            try:
+                rows = self._conn.execute(
+                    "SELECT path, file_size, mtime_ns, inode, device "
+                    "FROM file_fingerprints"
+                ).fetchall()
+            except Exception as e:
+                logger.error(f"Error reading file fingerprints: {e}")
+                return -1
+        stale = [(row[0],) for row in rows if _stat_key(row[0]) != row]
+        with self._db_lock:
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "DELETE FROM file_fingerprints WHERE path = ?", stale
+                    )
+            except Exception as e:
+                logger.error(f"Error pruning file fingerprints: {e}")
+                return -1
+        logger.info(f"Pruned {len(stale)} stale file fingerprints.")
+        return len(stale)
+
+    def get_fingerprint_count(self) -> int:
+        """
+        Get the count of cached file fingerprints.
+
+        Returns:
+            Number of cached fingerprints
+        """
+        with self._db_lock:
+            try:
+                cursor = self._conn.cursor()
+                cursor.execute("SELECT COUNT(*) FROM file_fingerprints")
+                result = cursor.fetchone()
+                return result[0] if result else 0
+            except Exception as e:
+                logger.error(f"Error getting fingerprint count: {e}")
+                return 0
+
+    def is_processed_many(self, filepaths: Iterable[str]) -> Dict[str, bool]:
+        """
+        Check many files at once.
+
+        Files are hashed in a thread pool and the hashes are looked up with
+        one query per SQL_BATCH_SIZE hashes.
+
+        Args:
+            filepaths: Paths of the files to check
+
+        Returns:
+            Dict mapping each path to True if it was processed before
+        """
+        hashes = self._hash_many(filepaths)
+        unique = list({r[0] for r in hashes.values() if r is not None})
+        found = set()
+        with self._db_lock:
+            try:
+                cursor = self._conn.cursor()
+                for batch in _batches(unique):
+                    placeholders = ",".join("?" * len(batch))
+                    cursor.execute(
+                        "SELECT file_hash FROM processed_items "
+                        f"WHERE file_hash IN ({placeholders})",
+                        batch,
+                    )
+                    found.update(row[0] for row in cursor.fetchall())
+            except Exception as e:
+                logger.error(f"Error checking processed status: {e}")
+                found.clear()
+        return {
+            path: result is not None and result[0] in found
+            for path, result in hashes.items()
+        }
+
+    def mark_many(self, filepaths: Iterable[str]) -> Dict[str, bool]:
+        """
+        Mark many files as processed in a single transaction.
+
+        Args:
+            filepaths: Paths of the files to mark
+
+        Returns:
+            Dict mapping each path to True if it was marked
+        """
+        hashes = self._hash_many(filepaths)
+        rows = [
+            (result[0], result[1], os.path.basename(path))
+            for path, result in hashes.items()
+            if result is not None
+        ]
+        with self._db_lock:
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        """
+                        INSERT OR REPLACE INTO processed_items
+                        (file_hash, file_size, original_filename, processed_at)
+                        VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                        """,
+                        rows,
+                    )
+            except Exception as e:
+                logger.error(f"Error marking files as processed: {e}")
+                return {path: False for path in hashes}
+        if rows:
+            logger.info(
+                f"[Sync Tracking] {len(rows)} items added to processed items database."
+            )
+        return {path: result is not None for path, result in hashes.items()}
+
+    def remove_many(self, filepaths: Iterable[str]) -> Dict[str, bool]:
+        """
+        Remove many files from the processed database in a single transaction.
+
+        Args:
+            filepaths: Paths of the files to remove
+
+        Returns:
+            Dict mapping each path to True if an entry was removed for it
+        """
+        hashes = self._hash_many(filepaths)
+        unique = list({r[0] for r in hashes.values() if r is not None})
+        removed = set()
+        with self._db_lock:
+            try:
+                with self._conn:
+                    cursor = self._conn.cursor()
+                    for batch in _batches(unique):
+                        placeholders = ",".join("?" * len(batch))
+                        cursor.execute(
+                            "SELECT file_hash FROM processed_items "
+                            f"WHERE file_hash IN ({placeholders})",
+                            batch,
+                        )
+                        removed.update(row[0] for row in cursor.fetchall())
+                        cursor.execute(
+                            "DELETE FROM processed_items "
+                            f"WHERE file_hash IN ({placeholders})",
+                            batch,
+                        )
+            except Exception as e:
+                logger.error(f"Error removing files from processed database: {e}")
+                return {path: False for path in hashes}
+        if removed:
+            logger.info(
+                f"[Sync Tracking] {len(removed)} items removed from processed items database."
+            )
+        return {
+            path: result is not None and result[0] in removed
+            for path, result in hashes.items()
+        }
+
     def remove_from_processed(self, filepath: str, silent: bool = False) -> bool:
         """
         Remove a file from the processed database.
@@ -283,76 +604,90 @@ class ProcessedItemsManager:
                 self._conn = None
                 logger.info("Processed items database connection closed.")
 
+    def backup_to(self, backup_path: str) -> bool:
+        """
+        Write a consistent copy of the database, including WAL contents.
+
+        Args:
+            backup_path: Path of the backup file to create
+
+        Returns:
+            True if the backup was written, False otherwise
+        """
+        with self._db_lock:
+            try:
+                target = sqlite3.connect(backup_path)
+                try:
+                    self._conn.backup(target)
+                finally:
+                    target.close()
+                return True
+            except Exception as e:
+                logger.error(f"Error backing up processed items database: {e}")
+                return False
+
     def import_from_database(self, import_path: str) -> Tuple[int, int]:
         """
         Import items from another processed items database.
 
+        The other database is attached and merged with a single
+        INSERT ... SELECT, so no rows pass through Python.
+
         Args:
             import_path: Path to the database file to import from
 
         Returns:
             Tuple of (imported_count, skipped_count), or (-1, -1) on error
         """
-        import sqlite3
-
-        try:
-            # Connect to the import database
-            import_conn = sqlite3.connect(import_path)
-            import_cursor = import_conn.cursor()
+        if not os.path.isfile(import_path):
+            logger.error(f"Import database does not exist: {import_path}")
+            return (-1, -1)
 
-            # Check if the table exists
-            import_cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='processed_items'"
-            )
-            if not import_cursor.fetchone():
-                logger.error(
-                    f"Import database does not contain processed_items table: {import_path}"
-                )
-                import_conn.close()
+        with self._db_lock:
+            try:
+                self._conn.execute("ATTACH DATABASE ? AS import_db", (import_path,))
+            except Exception as e:
+                logger.error(f"Failed to import from database {import_path}: {e}")
                 return (-1, -1)
-
-            # Get all items from import database
-            import_cursor.execute(
-                "SELECT file_hash, file_size, original_filename FROM processed_items"
-            )
-            items_to_import = import_cursor.fetchall()
-            import_conn.close()
-
-            imported = 0
-            skipped = 0
-
-            with self._db_lock:
-                cursor = self._conn.cursor()
-                for file_hash, file_size, original_filename in items_to_import:
-                    try:
-                        cursor.execute(
-                            """
-                            INSERT OR IGNORE INTO processed_items 
-                            (file_hash, file_size, original_filename, processed_at)
-                            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-                            """,
-                            (file_hash, file_size, original_filename),
-                        )
-                        if cursor.rowcount > 0:
-                            imported += 1
-                        else:
-                            skipped += 1
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to import item {original_filename}: {e}"
-                        )
-                        skipped += 1
-
-                self._conn.commit()
-
-            logger.info(
-                f"Imported {imported} items, skipped {skipped} duplicates from {import_path}"
-            )
-            return (imported, skipped)
-
-        except Exception as e:
-            logger.error(f"Failed to import from database {import_path}: {e}")
-            return (-1, -1)
+            try:
+                # Check if the table exists
+                if not self._conn.execute(
+                    "SELECT name FROM import_db.sqlite_master "
+                    "WHERE type='table' AND name='processed_items'"
+                ).fetchone():
+                    logger.error(
+                        f"Import database does not contain processed_items table: {import_path}"
+                    )
+                    return (-1, -1)
+
+                with self._conn:
+                    total = self._conn.execute(
+                        "SELECT COUNT(*) FROM import_db.processed_items"
+                    ).fetchone()[0]
+                    # OR IGNORE skips known hashes and invalid rows alike
+                    cursor = self._conn.execute(
+                        """
+                        INSERT OR IGNORE INTO main.processed_items
+                        (file_hash, file_size, original_filename, processed_at)
+                        SELECT file_hash, file_size, original_filename, CURRENT_TIMESTAMP
+                        FROM import_db.processed_items
+                        """
+                    )
+                    imported = max(cursor.rowcount, 0)
+                skipped = total - imported
+            except Exception as e:
+                logger.error(f"Failed to import from database {import_path}: {e}")
+                return (-1, -1)
+            finally:
+                try:
+                    self._conn.execute("DETACH DATABASE import_db")
+                except Exception:
+                    pass
+
+        logger.info(
+            f"Imported {imported} items, skipped {skipped} duplicates from {import_path}"
+        )
+        return (imported, skipped)
 
 
 # Convenience function to get the singleton instance
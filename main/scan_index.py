@@ -0,0 +1,182 @@
+"""Persistent directory snapshots for incremental library scans.
+
+A library rescan normally lists every directory again, which is slow on large
+libraries and network shares. This index remembers, for each directory, its
+mtime and the names of the files and subdirectories it contained. Adding,
+removing or renaming an entry updates the directory's mtime, so a directory
+whose mtime is unchanged is served from the snapshot with a single stat and
+only changed directories are listed again with os.scandir.
+
+Directories modified within RACY_WINDOW_NS of the scan are not trusted on
+the next scan, since a later change could land within the same mtime tick.
+"""
+
+import os
+import json
+import time
+import logging
+import tempfile
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+INDEX_FILENAME = "scan_index.json"
+RACY_WINDOW_NS = 2 * 10**9
+
+
+class ScanIndex:
+    """Directory snapshots keyed by path, optionally persisted to a JSON file."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._dirs: Dict[str, Tuple[int, List[str], List[str]]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if path:
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION:
+                return
+            self._dirs = {
+                directory: (int(mtime_ns), list(files), list(subdirs))
+                for directory, (mtime_ns, files, subdirs) in data["dirs"].items()
+            }
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable scan index {self.path}: {e}")
+            self._dirs = {}
+
+    def save(self) -> bool:
+        """Write the index if it changed since it was loaded or last saved."""
+        with self._lock:
+            if not self.path or not self._dirty:
+                return True
+            data = {
+                "version": INDEX_VERSION,
+                "dirs": {d: list(entry) for d, entry in self._dirs.items()},
+            }
+            directory = os.path.dirname(self.path)
+            try:
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+                    os.replace(tmp_path, self.path)
+                except BaseException:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                    raise
+            except OSError as e:
+                logger.warning(f"Failed to write scan index: {e}")
+                return False
+            self._dirty = False
+            return True
+
+    def list_dir(self, directory: str) -> Optional[Tuple[List[str], List[str]]]:
+        """(file names, subdirectory names) of a directory, or None if unreadable.
+
+        Like os.walk, symlinks to directories are neither files nor descended
+        into.
+        """
+        with self._lock:
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                self._forget(directory)
+                return None
+            cached = self._dirs.get(directory)
+            if cached is not None and cached[0] == mtime_ns:
+                self.hits += 1
+                return cached[1], cached[2]
+
+            files, subdirs = [], []
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if not is_dir:
+                            files.append(entry.name)
+                        elif not entry.is_symlink():
+                            subdirs.append(entry.name)
+            except OSError:
+                self._forget(directory)
+                return None
+            if time.time_ns() - mtime_ns < RACY_WINDOW_NS:
+                mtime_ns = -1
+            self._dirs[directory] = (mtime_ns, files, subdirs)
+            self._dirty = True
+            self.misses += 1
+            return files, subdirs
+
+    def _forget(self, directory: str):
+        if self._dirs.pop(directory, None) is not None:
+            self._dirty = True
+
+    def walk(
+        self, folder: str, recursive: bool = True
+    ) -> Iterator[Tuple[str, List[str]]]:
+        """Yield (directory, file names) top-down, like os.walk.
+
+        Snapshots of directories below folder that were not reached (deleted
+        or moved away) are dropped once a recursive walk completes.
+        """
+        visited = set()
+        stack = [folder]
+        while stack:
+            directory = stack.pop()
+            listing = self.list_dir(directory)
+            if listing is None:
+                continue
+            visited.add(directory)
+            files, subdirs = listing
+            yield directory, files
+            if recursive:
+                stack.extend(os.path.join(directory, d) for d in reversed(subdirs))
+        if recursive:
+            self._prune(folder, visited)
+
+    def _prune(self, folder: str, visited: set):
+        prefix = os.path.join(folder, "")
+        with self._lock:
+            stale = [d for d in self._dirs if d.startswith(prefix) and d not in visited]
+            for directory in stale:
+                del self._dirs[directory]
+            if stale:
+                self._dirty = True
+
+    def files(self, folder: str, recursive: bool = True) -> List[str]:
+        """Paths of all files in folder (and its subdirectories if recursive)."""
+        return [
+            os.path.join(directory, name)
+            for directory, names in self.walk(folder, recursive)
+            for name in names
+        ]
+
+
+_default_index = None
+_default_index_lock = threading.Lock()
+
+
+def get_scan_index() -> ScanIndex:
+    """The scan index persisted next to the user config."""
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None:
+            from utils import get_user_config_path
+
+            config_dir = os.path.dirname(get_user_config_path())
+            _default_index = ScanIndex(os.path.join(config_dir, INDEX_FILENAME))
+        return _default_index
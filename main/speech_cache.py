@@ -0,0 +1,183 @@
+"""Content-addressed on-disk cache of reference speech timelines.
+
+Decoding a reference video and running VAD over it dominates an ffsubsync run,
+and the same reference is often synced against several subtitles (languages,
+retries, batch runs). The resulting speech array only depends on the
+reference's content and the VAD parameters, so it is stored as a .npy file
+named after a hash of both and memory-mapped back on the next run.
+
+Files are keyed with the same partial hash ProcessedItemsManager uses (size +
+first/last 64KB), so renamed or moved references still hit the cache. The
+directory is bounded by size; the least recently used entries are evicted
+first.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import tempfile
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the detectors change in a way that alters their output.
+CACHE_VERSION = 1
+DEFAULT_MAX_SIZE_MB = 512
+CACHE_SIZE_ENV = "ASSY_SPEECH_CACHE_MB"
+CACHE_DIR_ENV = "ASSY_SPEECH_CACHE_DIR"
+# First argument that makes call_ffsubsync only fill the cache for a reference.
+PRIME_SPEECH_CACHE_FLAG = "--prime-speech-cache"
+
+
+def get_cache_dir() -> str:
+    """Directory holding the cached speech arrays."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return override
+    from constants import PROGRAM_NAME
+    from platformdirs import user_cache_dir
+
+    return os.path.join(user_cache_dir(PROGRAM_NAME, appauthor=False), "speech_cache")
+
+
+class SpeechCache:
+    """Size-bounded directory of memory-mappable speech arrays."""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, reference: str, **params) -> Optional[str]:
+        """Cache key for a local reference file and the VAD parameters.
+
+        Returns None if the file cannot be hashed (e.g. remote URLs).
+        """
+        from processed_items_manager import calculate_partial_hash
+
+        if not os.path.isfile(reference):
+            return None
+        hashed = calculate_partial_hash(reference)
+        if hashed is None:
+            return None
+        payload = json.dumps(
+            {"version": CACHE_VERSION, "file": hashed[0], **params},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.npy")
+
+    def get(self, key: str):
+        """Memory-map a cached array, or return None on a miss."""
+        import numpy as np
+
+        path = self._path(key)
+        try:
+            # Copy-on-write: callers may modify the array without touching the file.
+            array = np.load(path, mmap_mode="c", allow_pickle=False)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable speech cache entry {path}: {e}")
+            self._remove(path)
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)  # Mark as recently used for eviction
+        except OSError:
+            pass
+        self.hits += 1
+        return array
+
+    def put(self, key: str, array) -> bool:
+        """Store an array atomically, then evict old entries if over budget."""
+        import numpy as np
+
+        array = np.asarray(array)
+        if array.nbytes > self.max_bytes:
+            return False
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    np.save(f, array, allow_pickle=False)
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                self._remove(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write speech cache entry: {e}")
+            return False
+        self.evict()
+        return True
+
+    def entries(self):
+        """List (mtime, size, path) of cached arrays, oldest first."""
+        entries = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if not entry.name.endswith(".npy"):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+        except FileNotFoundError:
+            pass
+        entries.sort()
+        return entries
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits its budget."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if self._remove(path):
+                total -= size
+
+    def clear(self):
+        for _, _, path in self.entries():
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            # Already evicted by another process, or still mapped on Windows.
+            return False
+
+
+_cache = None
+
+
+def get_speech_cache() -> Optional[SpeechCache]:
+    """Shared cache configured from the environment, or None if disabled.
+
+    ASSY_SPEECH_CACHE_MB sets the size budget (0 disables the cache) and
+    ASSY_SPEECH_CACHE_DIR overrides the location.
+    """
+    global _cache
+    try:
+        size_mb = int(os.environ.get(CACHE_SIZE_ENV, DEFAULT_MAX_SIZE_MB))
+    except ValueError:
+        size_mb = DEFAULT_MAX_SIZE_MB
+    if size_mb <= 0:
+        return None
+    directory = get_cache_dir()
+    max_bytes = size_mb * 1024 * 1024
+    if _cache is None or _cache.directory != directory or _cache.max_bytes != max_bytes:
+        _cache = SpeechCache(directory, max_bytes)
+    return _cache
@@ -1,10 +1,13 @@
 import os
+import time
 import shutil
 from dataclasses import dataclass, field
 from typing import Optional
 
 import texts
-from utils import create_process, detect_encoding
+import process_usage
+from utils import create_process
+from subtitle_ir import format_for_path, load_subtitle
 from constants import (
     DEFAULT_OPTIONS,
     FFMPEG_EXECUTABLE,
@@ -27,6 +30,10 @@ class SubtitleExtractionResult:
     score: object = None
     messages: list = field(default_factory=list)
     cleanup_dir: Optional[str] = None
+    # Milliseconds per stage, like SyncResult.timings
+    timings: dict = field(default_factory=dict)
+    # ProcessUsage of the ffprobe/ffmpeg runs, like SyncResult.processes
+    processes: list = field(default_factory=list)
 
 
 def should_extract_subtitles(reference, tool, config, override=None):
@@ -68,7 +75,8 @@ def prepare_sync_reference(
     """Prepare a video reference, optionally replacing it with an embedded subtitle.
 
     Extraction failures are deliberately non-fatal: callers always receive the
-    original reference as a fallback.
+    original reference as a fallback. The time spent extracting is recorded
+    as the "extraction" stage in the result's timings.
     """
     enabled = should_extract_subtitles(reference, tool, config, override)
     result = SubtitleExtractionResult(
@@ -87,8 +95,11 @@ def prepare_sync_reference(
         result.cleanup_dir = os.path.join(
             output_dir, "extracted_subtitles_" + os.path.basename(reference)
         )
+    start = time.monotonic()
     try:
-        extracted, score, messages = extract_subtitles(reference, subtitle, output_dir)
+        extracted, score, messages = extract_subtitles(
+            reference, subtitle, output_dir, usage=result.processes
+        )
         result.messages.extend(messages)
         result.score = score
         if extracted:
@@ -106,6 +117,8 @@ def prepare_sync_reference(
     except BaseException:
         cleanup_extracted_subtitles(result)
         raise
+    finally:
+        result.timings["extraction"] = round((time.monotonic() - start) * 1000, 3)
     return result
 
 
@@ -123,34 +136,9 @@ def cleanup_extracted_subtitles(result):
 def parse_timestamps(subtitle_file):
     # Fast timestamp extraction for comparison
     try:
-        sub_encoding = detect_encoding(subtitle_file)
-        ext = os.path.splitext(subtitle_file)[1].lower()
-
-        with open(subtitle_file, "r", encoding=sub_encoding, errors="replace") as file:
-            # Read file once and process efficiently
-            if ext in (".srt", ".vtt"):
-                return [
-                    float(line.split("-->")[0].strip().replace(",", ".").split(":")[0])
-                    * 3600
-                    + float(
-                        line.split("-->")[0].strip().replace(",", ".").split(":")[1]
-                    )
-                    * 60
-                    + float(
-                        line.split("-->")[0].strip().replace(",", ".").split(":")[2]
-                    )
-                    for line in file
-                    if "-->" in line
-                ]
-            elif ext in (".ass", ".ssa"):
-                return [
-                    float(line.split(",")[1].strip().split(":")[0]) * 3600
-                    + float(line.split(",")[1].strip().split(":")[1]) * 60
-                    + float(line.split(",")[1].strip().split(":")[2])
-                    for line in file
-                    if line.startswith("Dialogue")
-                ]
-        return []
+        if format_for_path(subtitle_file) is None:
+            return []
+        return (load_subtitle(subtitle_file).starts / 1000.0).tolist()
     except Exception:
         return None
 
@@ -183,7 +171,7 @@ def choose_best_subtitle(subtitle_file, extracted_subtitles_folder):
     return best_subtitle, best_score
 
 
-def extract_subtitles(video_file, subtitle_file, output_dir):
+def extract_subtitles(video_file, subtitle_file, output_dir, usage=None):
     """
     Extract subtitles from video and choose the best match.
 
@@ -191,6 +179,7 @@ def extract_subtitles(video_file, subtitle_file, output_dir):
         video_file: Path to the video file
         subtitle_file: Path to the reference subtitle file
         output_dir: Directory to extract subtitles to
+        usage: Optional list the ProcessUsage of ffprobe and ffmpeg is appended to
 
     Returns:
         tuple: (best_subtitle_path, best_score, log_messages) or (None, None, log_messages) if failed
@@ -215,8 +204,13 @@ def extract_subtitles(video_file, subtitle_file, output_dir):
     ]
     try:
         # Use create_process for ffprobe
+        started = time.monotonic()
         probe_process = create_process(ffprobe_cmd)
-        output, _ = probe_process.communicate()
+        output, probe_usage = process_usage.communicate(
+            probe_process, "ffprobe", started
+        )
+        if usage is not None:
+            usage.append(probe_usage)
 
         if probe_process.returncode != 0:
             log_messages.append(texts.FFPROBE_FAILED_TO_ANALYZE_VIDEO)
@@ -268,8 +262,13 @@ def extract_subtitles(video_file, subtitle_file, output_dir):
         if not output_files:
             return None, None, log_messages
         # Execute FFmpeg using create_process
+        started = time.monotonic()
         ffmpeg_process = create_process(ffmpeg_base_cmd)
-        output, _ = ffmpeg_process.communicate()
+        output, ffmpeg_usage = process_usage.communicate(
+            ffmpeg_process, "ffmpeg", started
+        )
+        if usage is not None:
+            usage.append(ffmpeg_usage)
         if ffmpeg_process.returncode == 0:
             for output_file in output_files:
                 log_messages.append(
@@ -0,0 +1,851 @@
+"""Array-backed intermediate representation shared by the subtitle readers.
+
+Every supported format is decoded once and parsed in a single pass into a
+SubtitleDocument: cue start/end times as int64 millisecond arrays, all cue
+text in one string buffer sliced by an offsets array, and per-cue indices into
+a style table. Time transforms work on whole arrays at once.
+
+Readers also record where each timestamp sits in the decoded source. Writing a
+document back to its own format only replaces those timestamps, so headers,
+styles and markup survive untouched; writing to any other format goes through
+the canonical writers below.
+
+Cue text is normalised to SRT markup (newlines plus <i>/<b>/<u>/<font> tags).
+"""
+
+import os
+import re
+import html
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from encoding_detection import detect_encoding
+
+# File extension -> reader format. DFXP and ITT are TTML dialects.
+FORMATS = {
+    ".srt": "srt",
+    ".vtt": "vtt",
+    ".sbv": "sbv",
+    ".sub": "sub",
+    ".ass": "ass",
+    ".ssa": "ssa",
+    ".stl": "stl",
+    ".smi": "smi",
+    ".ttml": "ttml",
+    ".dfxp": "ttml",
+    ".itt": "ttml",
+}
+
+STL_FRAME_RATE = 30
+TTML_FRAME_RATE = 25
+# MicroDVD .sub values are frame numbers; this rate is used unless the file
+# starts with a "{1}{1}<fps>" header.
+MICRODVD_FRAME_RATE = 23.976
+# Duration of the last SMI cue, which has no following SYNC to end it.
+SMI_LAST_CUE_MS = 5000
+
+_ASS_EVENT_FIELDS = [
+    "Layer",
+    "Start",
+    "End",
+    "Style",
+    "Name",
+    "MarginL",
+    "MarginR",
+    "MarginV",
+    "Effect",
+    "Text",
+]
+
+_EMPTY = np.zeros(0, dtype=np.int64)
+
+
+@dataclass
+class SubtitleDocument:
+    """Cues of one subtitle file as parallel arrays.
+
+    Cue i spans starts[i]..ends[i] (ms), its text is
+    text[offsets[i]:offsets[i + 1]] and its style is styles[style_ids[i]].
+    marks holds timestamps that belong to no cue but must move with the
+    timeline (ASS comments, SMI clearing syncs, empty STL lines).
+    """
+
+    format: str
+    starts: np.ndarray = field(default_factory=lambda: _EMPTY)
+    ends: np.ndarray = field(default_factory=lambda: _EMPTY)
+    text: str = ""
+    offsets: np.ndarray = field(default_factory=lambda: np.zeros(1, dtype=np.int64))
+    style_ids: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int32))
+    styles: List[str] = field(default_factory=list)
+    marks: np.ndarray = field(default_factory=lambda: _EMPTY)
+    encoding: str = "utf-8"
+    # Decoded file plus the (begin, end) character span of every timestamp in
+    # it and the index of its value in concat(starts, ends, marks).
+    source: Optional[str] = None
+    slot_spans: np.ndarray = field(
+        default_factory=lambda: np.zeros((0, 2), dtype=np.int64)
+    )
+    slot_refs: np.ndarray = field(default_factory=lambda: _EMPTY)
+    meta: Dict = field(default_factory=dict)
+
+    @classmethod
+    def from_cues(cls, fmt, starts, ends, texts, styles=None) -> "SubtitleDocument":
+        """Build a document (without source) from per-cue sequences."""
+        builder = _Builder(fmt, None)
+        for i, (start, end, text) in enumerate(zip(starts, ends, texts)):
+            builder.cue(int(start), int(end), text, styles[i] if styles else "")
+        return builder.build()
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def cue_text(self, index: int) -> str:
+        return self.text[self.offsets[index] : self.offsets[index + 1]]
+
+    def texts(self) -> List[str]:
+        bounds = self.offsets.tolist()
+        return [self.text[a:b] for a, b in zip(bounds, bounds[1:])]
+
+    def style(self, index: int) -> str:
+        return self.styles[self.style_ids[index]] if self.styles else ""
+
+    def map_times(
+        self, transform: Callable[[np.ndarray], np.ndarray]
+    ) -> "SubtitleDocument":
+        """Return a copy with transform applied to every timestamp at once."""
+        n = len(self.starts)
+        times = np.concatenate([self.starts, self.ends, self.marks])
+        times = np.asarray(transform(times), dtype=np.int64)
+        return replace(
+            self, starts=times[:n], ends=times[n : 2 * n], marks=times[2 * n :]
+        )
+
+    def shifted(self, milliseconds: int) -> "SubtitleDocument":
+        """Return a copy delayed by milliseconds, clamping times at zero."""
+        return self.map_times(lambda t: np.maximum(t + int(milliseconds), 0))
+
+
+class _Builder:
+    """Collects cues while a reader scans the source."""
+
+    def __init__(self, fmt: str, source: str):
+        self.format = fmt
+        self.source = source
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        self.texts: List[str] = []
+        self.style_ids: List[int] = []
+        self.styles: Dict[str, int] = {}
+        self.marks: List[int] = []
+        self.spans: List[tuple] = []
+        self.refs: List[tuple] = []
+
+    def cue(self, start, end, text, style="", start_span=None, end_span=None):
+        index = len(self.starts)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.texts.append(text)
+        self.style_ids.append(self.styles.setdefault(style, len(self.styles)))
+        if start_span is not None:
+            self.spans.append(start_span)
+            self.refs.append((0, index))
+        if end_span is not None:
+            self.spans.append(end_span)
+            self.refs.append((1, index))
+
+    def mark(self, time, span=None):
+        if span is not None:
+            self.spans.append(span)
+            self.refs.append((2, len(self.marks)))
+        self.marks.append(time)
+
+    def build(self, **meta) -> SubtitleDocument:
+        n = len(self.starts)
+        lengths = np.fromiter((len(t) for t in self.texts), dtype=np.int64, count=n)
+        base = {0: 0, 1: n, 2: 2 * n}
+        return SubtitleDocument(
+            format=self.format,
+            starts=np.array(self.starts, dtype=np.int64),
+            ends=np.array(self.ends, dtype=np.int64),
+            text="".join(self.texts),
+            offsets=np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64),
+            style_ids=np.array(self.style_ids, dtype=np.int32),
+            styles=list(self.styles),
+            marks=np.array(self.marks, dtype=np.int64),
+            source=self.source,
+            slot_spans=np.array(self.spans, dtype=np.int64).reshape(-1, 2),
+            slot_refs=np.array([base[k] + i for k, i in self.refs], dtype=np.int64),
+            meta=meta,
+        )
+
+
+# --- Timestamp parsing ------------------------------------------------------
+
+_CLOCK_RE = re.compile(r"(?:(\d+):)?(\d{1,2}):(\d{2})(?:[.,](\d+))?$")
+
+
+def _parse_clock(token: str) -> int:
+    """H:MM:SS[.fff] (hours optional, any fraction length) to milliseconds."""
+    match = _CLOCK_RE.match(token.strip())
+    if not match:
+        raise ValueError(f"Invalid timestamp: {token!r}")
+    h, m, s, frac = match.groups()
+    ms = int(frac[:3].ljust(3, "0")) if frac else 0
+    return ((int(h or 0) * 60 + int(m)) * 60 + int(s)) * 1000 + ms
+
+
+def _parse_frames(token: str, frame_rate: float) -> int:
+    """HH:MM:SS:FF to milliseconds."""
+    h, m, s, f = map(int, token.strip().split(":"))
+    return ((h * 60 + m) * 60 + s) * 1000 + int(f * 1000 // frame_rate)
+
+
+def _parse_ttml_time(token: str, meta: dict) -> int:
+    token = token.strip()
+    metric = re.match(r"([\d.]+)(h|ms|m|s|f|t)$", token)
+    if metric:
+        value, unit = float(metric.group(1)), metric.group(2)
+        if unit == "f":
+            return int(value * 1000 // meta["frame_rate"])
+        if unit == "t":
+            return int(value * 1000 // meta["tick_rate"])
+        scale = {"h": 3600000, "m": 60000, "s": 1000, "ms": 1}[unit]
+        return int(round(value * scale))
+    if token.count(":") == 3:
+        return _parse_frames(token, meta["frame_rate"])
+    if ":" not in token:
+        return int(round(float(token) * 1000))
+    return _parse_clock(token)
+
+
+# --- Timestamp formatting ---------------------------------------------------
+
+
+def _split_ms(values):
+    """Vectorised (h, m, s, ms) decomposition of millisecond values."""
+    values = np.maximum(np.asarray(values, dtype=np.int64), 0)
+    h, rem = np.divmod(values, 3600000)
+    m, rem = np.divmod(rem, 60000)
+    s, ms = np.divmod(rem, 1000)
+    return zip(h.tolist(), m.tolist(), s.tolist(), ms.tolist())
+
+
+def _clocks(values, sep=",", hour_width=2, frac_digits=3) -> List[str]:
+    div = 10 ** (3 - frac_digits)
+    return [
+        f"{h:0{hour_width}}:{m:02}:{s:02}{sep}{ms // div:0{frac_digits}}"
+        for h, m, s, ms in _split_ms(values)
+    ]
+
+
+def _frame_clocks(values, frame_rate) -> List[str]:
+    return [
+        f"{h:02}:{m:02}:{s:02}:{int(ms * frame_rate // 1000):02}"
+        for h, m, s, ms in _split_ms(values)
+    ]
+
+
+def _format_like(ms: int, original: str, meta: dict) -> str:
+    """Format ms with the same shape (units, hour width, fraction) as original."""
+    ms = max(0, int(ms))
+    if original.isdigit() and "unit_ms" in meta:
+        return str(round(ms / meta["unit_ms"]))
+    metric = re.match(r"[\d.]+(h|ms|m|s|f|t)$", original)
+    if metric:
+        unit = metric.group(1)
+        if unit == "ms":
+            return f"{ms}ms"
+        if unit == "t":
+            return f"{int(round(ms * meta['tick_rate'] / 1000))}t"
+        if unit == "f":
+            return f"{int(ms * meta['frame_rate'] // 1000)}f"
+        return f"{ms / 1000:.3f}".rstrip("0").rstrip(".") + "s"
+    if ":" not in original:
+        return f"{ms / 1000:.3f}".rstrip("0").rstrip(".")
+    parts = original.split(":")
+    if len(parts) == 4:
+        (clock,) = _frame_clocks([ms], meta["frame_rate"])
+        return clock
+    frac_match = re.search(r"([.,])(\d+)$", original)
+    sep, digits = (
+        (frac_match.group(1), min(len(frac_match.group(2)), 3))
+        if frac_match
+        else ("", 0)
+    )
+    h, m, s, rem = next(_split_ms([ms]))
+    frac = f"{sep}{rem // 10 ** (3 - digits):0{digits}}" if digits else ""
+    if len(parts) == 2 and h == 0:
+        return f"{m:02}:{s:02}{frac}"
+    return f"{h:0{len(parts[0]) if len(parts) == 3 else 2}}:{m:02}:{s:02}{frac}"
+
+
+# --- Readers ------------------------------------------------------------------
+
+_BLANK_LINE_RE = re.compile(r"\n[ \t\r]*\n")
+_NON_BASIC_TAG_RE = re.compile(r"</?(?!b|i|u|font)\w+[^>]*>")
+_ARROW_CLOCK = r"(?:\d+:)?\d{1,2}:\d{2}[,.]\d{1,3}"
+_ARROW_TIMING_RE = re.compile(
+    rf"^\ufeff?[ \t]*({_ARROW_CLOCK})[ \t]*-->[ \t]*({_ARROW_CLOCK})[^\n]*", re.M
+)
+_SBV_TIMING_RE = re.compile(
+    r"^\ufeff?[ \t]*(\d+:\d{2}:\d{2}\.\d+),(\d+:\d{2}:\d{2}\.\d+)[ \t\r]*$", re.M
+)
+_MICRODVD_RE = re.compile(r"^\ufeff?[ \t]*\{(\d+)\}\{(\d*)\}([^\r\n]*)", re.M)
+_SUBVIEWER_RE = re.compile(
+    r"^\ufeff?[ \t]*(\d{1,2}:\d{2}:\d{2}\.\d{2})[ \t]*,[ \t]*(\d{1,2}:\d{2}:\d{2}\.\d{2})[ \t\r]*$",
+    re.M,
+)
+_STL_RE = re.compile(
+    r"^\ufeff?[ \t]*(\d{1,2}:\d{2}:\d{2}:\d{2})[ \t]*,[ \t]*(\d{1,2}:\d{2}:\d{2}:\d{2})[ \t]*,([^\r\n]*)",
+    re.M,
+)
+_ASS_EVENT_RE = re.compile(r"^(Dialogue|Comment):[ \t]*([^\r\n]*)", re.M)
+_ASS_FORMAT_RE = re.compile(
+    r"^\[Events\][^\[]*?^Format:[ \t]*([^\r\n]*)", re.M | re.S | re.I
+)
+_SMI_SYNC_RE = re.compile(
+    r"<SYNC\s+Start\s*=\s*[\"']?(\d+)[^>]*>(.*?)(?=<SYNC|</BODY|\Z)", re.S | re.I
+)
+_SMI_P_RE = re.compile(r"<P([^>]*)>(.*?)(?=</P>|<P[\s>]|$)", re.S | re.I)
+_SMI_CLASS_RE = re.compile(r"Class\s*=\s*[\"']?([\w-]+)", re.I)
+_TTML_P_TAG_RE = re.compile(r"<(?:[\w.-]+:)?p\b[^>]*>")
+_TTML_TIME_ATTR_RE = re.compile(r"\b(begin|end)\s*=\s*([\"'])(.*?)\2")
+
+
+def _paragraph(body: str) -> List[str]:
+    """Stripped lines of the first paragraph of a cue body."""
+    return [line.strip() for line in _BLANK_LINE_RE.split(body, 1)[0].splitlines()]
+
+
+def _following_bodies(source, matches):
+    """Yield (match, text between this match and the next one)."""
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(source)
+        yield match, source[match.end() : end]
+
+
+def _read_arrow(source: str, fmt: str, clean_tags: bool) -> _Builder:
+    """SRT and WebVTT: a "start --> end" line followed by text lines."""
+    builder = _Builder(fmt, source)
+    for match, body in _following_bodies(
+        source, list(_ARROW_TIMING_RE.finditer(source))
+    ):
+        lines = _paragraph(body)
+        if clean_tags:
+            lines = [_NON_BASIC_TAG_RE.sub("", line) for line in lines]
+        builder.cue(
+            _parse_clock(match.group(1)),
+            _parse_clock(match.group(2)),
+            "\n".join(lines).strip(),
+            start_span=match.span(1),
+            end_span=match.span(2),
+        )
+    return builder
+
+
+def _read_srt(source):
+    return _read_arrow(source, "srt", clean_tags=False).build()
+
+
+def _read_vtt(source):
+    return _read_arrow(source, "vtt", clean_tags=True).build()
+
+
+def _read_sbv(source):
+    builder = _Builder("sbv", source)
+    for match, body in _following_bodies(source, list(_SBV_TIMING_RE.finditer(source))):
+        lines = [_NON_BASIC_TAG_RE.sub("", line) for line in _paragraph(body)]
+        builder.cue(
+            _parse_clock(match.group(1)),
+            _parse_clock(match.group(2)),
+            "\n".join(lines).strip(),
+            start_span=match.span(1),
+            end_span=match.span(2),
+        )
+    return builder.build()
+
+
+def _microdvd_frame_rate(match) -> Optional[float]:
+    """Frame rate given by a "{1}{1}<fps>" header line, or None."""
+    if match.group(1) not in ("0", "1") or match.group(2) != match.group(1):
+        return None
+    try:
+        frame_rate = float(match.group(3).strip())
+    except ValueError:
+        return None
+    return frame_rate if frame_rate > 0 else None
+
+
+def _read_sub(source):
+    builder = _Builder("sub", source)
+    microdvd = list(_MICRODVD_RE.finditer(source))
+    if microdvd:
+        frame_rate = _microdvd_frame_rate(microdvd[0])
+        if frame_rate is not None:
+            microdvd = microdvd[1:]
+        unit_ms = 1000 / (frame_rate or MICRODVD_FRAME_RATE)
+        for match in microdvd:
+            start = round(int(match.group(1)) * unit_ms)
+            end = round(int(match.group(2) or match.group(1)) * unit_ms)
+            builder.cue(
+                start,
+                end,
+                match.group(3).strip().replace("|", "\n"),
+                start_span=match.span(1),
+                end_span=match.span(2) if match.group(2) else None,
+            )
+        return builder.build(unit_ms=unit_ms)
+    for match, body in _following_bodies(source, list(_SUBVIEWER_RE.finditer(source))):
+        text = "\n".join(_paragraph(body)).replace("[br]", "\n").strip()
+        builder.cue(
+            _parse_clock(match.group(1)),
+            _parse_clock(match.group(2)),
+            text,
+            start_span=match.span(1),
+            end_span=match.span(2),
+        )
+    return builder.build()
+
+
+def _ass_text(text: str) -> str:
+    text = text.replace("\\N", "\n").strip()
+    for tag in ("i", "u", "b"):
+        text = text.replace(f"{{{tag}}}", f"<{tag}>").replace(
+            f"{{/{tag}}}", f"</{tag}>"
+        )
+    return text
+
+
+def _read_ass(source, fmt="ass"):
+    builder = _Builder(fmt, source)
+    fmt_match = _ASS_FORMAT_RE.search(source)
+    fields = (
+        [f.strip().lower() for f in fmt_match.group(1).split(",")]
+        if fmt_match
+        else [f.lower() for f in _ASS_EVENT_FIELDS]
+    )
+    start_idx, end_idx = fields.index("start"), fields.index("end")
+    style_idx = fields.index("style") if "style" in fields else None
+    text_idx = len(fields) - 1
+    for match in _ASS_EVENT_RE.finditer(source):
+        values = match.group(2).split(",", text_idx)
+        if len(values) <= text_idx:
+            continue
+        # Character positions of every field, for the timestamp spans.
+        positions, pos = [], match.start(2)
+        for value in values:
+            positions.append(pos)
+            pos += len(value) + 1
+
+        def span(idx):
+            value = values[idx]
+            begin = positions[idx] + len(value) - len(value.lstrip())
+            return begin, begin + len(value.strip())
+
+        try:
+            start, end = _parse_clock(values[start_idx]), _parse_clock(values[end_idx])
+        except ValueError:
+            continue
+        if match.group(1) == "Comment":
+            builder.mark(start, span(start_idx))
+            builder.mark(end, span(end_idx))
+            continue
+        builder.cue(
+            start,
+            end,
+            _ass_text(values[text_idx]),
+            style=values[style_idx].strip() if style_idx is not None else "",
+            start_span=span(start_idx),
+            end_span=span(end_idx),
+        )
+    return builder.build()
+
+
+def _read_ssa(source):
+    return _read_ass(source, "ssa")
+
+
+def _read_stl(source):
+    builder = _Builder("stl", source)
+    for match in _STL_RE.finditer(source):
+        start = _parse_frames(match.group(1), STL_FRAME_RATE)
+        end = _parse_frames(match.group(2), STL_FRAME_RATE)
+        text = "\n".join(part.strip() for part in match.group(3).split("|")).strip()
+        if text:
+            builder.cue(
+                start, end, text, start_span=match.span(1), end_span=match.span(2)
+            )
+        else:
+            builder.mark(start, match.span(1))
+            builder.mark(end, match.span(2))
+    return builder.build(frame_rate=STL_FRAME_RATE)
+
+
+_SMI_ENTITIES = {
+    "&nbsp;": " ",
+    "&hellip;": "...",
+    "&mdash;": "—",
+    "&ndash;": "–",
+    "&lsquo;": "‘",
+    "&rsquo;": "’",
+    "&ldquo;": '"',
+    "&rdquo;": '"',
+}
+
+
+def _smi_text(block: str):
+    """(text, class) of a SYNC block; text is empty for clearing blocks."""
+    lines, cls = [], ""
+    for match in _SMI_P_RE.finditer(block):
+        class_match = _SMI_CLASS_RE.search(match.group(1))
+        if class_match and not cls:
+            cls = class_match.group(1)
+        content = re.sub(r"<br\s*/?>", "\n", match.group(2).strip(), flags=re.I)
+        content = re.sub(r"<(?!/?(?:i|b|u|font)\b)[^>]*>", "", content, flags=re.I)
+        for entity, replacement in _SMI_ENTITIES.items():
+            content = content.replace(entity, replacement)
+        content = html.unescape(content)
+        lines.extend(
+            line
+            for line in (re.sub(r"\s+", " ", l).strip() for l in content.split("\n"))
+            if line
+        )
+    return "\n".join(lines), cls
+
+
+def _read_smi(source):
+    builder = _Builder("smi", source)
+    blocks = list(_SMI_SYNC_RE.finditer(source))
+    for i, match in enumerate(blocks):
+        start = int(match.group(1))
+        text, cls = _smi_text(match.group(2))
+        if not text:
+            builder.mark(start, match.span(1))
+            continue
+        end = (
+            int(blocks[i + 1].group(1))
+            if i + 1 < len(blocks)
+            else start + SMI_LAST_CUE_MS
+        )
+        builder.cue(start, end, text, style=cls, start_span=match.span(1))
+    return builder.build(unit_ms=1)
+
+
+def _local_name(tag: str) -> str:
+    return tag.split("}", 1)[1] if "}" in tag else tag
+
+
+def _ttml_text(elem) -> str:
+    """Text of a TTML element with <br/> and bold/italic/underline/color spans."""
+    text, end_tags = "", []
+    tag = _local_name(elem.tag)
+    if tag == "br":
+        text += "\n"
+    elif tag in ("b", "i", "u", "font"):
+        text += f"<{tag}>"
+        end_tags.insert(0, f"</{tag}>")
+    elif tag == "span":
+        for style in elem.attrib.get("style", "").strip().lower().split():
+            short = {"bold": "b", "italic": "i", "underline": "u"}.get(style)
+            if short:
+                text += f"<{short}>"
+                end_tags.insert(0, f"</{short}>")
+        if "color" in elem.attrib:
+            text += f'<font color="{elem.attrib["color"]}">'
+            end_tags.insert(0, "</font>")
+    if elem.text:
+        text += elem.text
+    for child in elem:
+        text += _ttml_text(child)
+    text += "".join(end_tags)
+    if elem.tail:
+        text += elem.tail
+    return text
+
+
+def _read_ttml(source):
+    root = ET.fromstring(source.lstrip("\ufeff"))
+    meta = {"frame_rate": TTML_FRAME_RATE, "tick_rate": 1}
+    for key, value in root.attrib.items():
+        name = _local_name(key)
+        if name == "frameRate":
+            meta["frame_rate"] = float(value)
+        elif name == "tickRate":
+            meta["tick_rate"] = float(value)
+    captions = [elem for elem in root.iter() if _local_name(elem.tag) == "p"]
+    # ElementTree has no source positions; pair the <p> tags found by regex
+    # with the parsed elements, and drop in-place writing if they disagree.
+    tags = list(_TTML_P_TAG_RE.finditer(source))
+    spans_ok = len(tags) == len(captions)
+    builder = _Builder("ttml", source if spans_ok else None)
+    for idx, caption in enumerate(captions):
+        begin = caption.attrib.get("begin")
+        if begin is None:
+            continue
+        start = _parse_ttml_time(begin, meta)
+        if caption.attrib.get("end") is not None:
+            end = _parse_ttml_time(caption.attrib["end"], meta)
+        elif caption.attrib.get("dur") is not None:
+            end = start + _parse_ttml_time(caption.attrib["dur"], meta)
+        else:
+            end = start
+        spans = {}
+        if spans_ok:
+            tag = tags[idx]
+            for attr in _TTML_TIME_ATTR_RE.finditer(tag.group(0)):
+                spans[attr.group(1)] = (
+                    tag.start() + attr.start(3),
+                    tag.start() + attr.end(3),
+                )
+        builder.cue(
+            start,
+            end,
+            _ttml_text(caption).strip(),
+            start_span=spans.get("begin"),
+            end_span=spans.get("end"),
+        )
+    return builder.build(**meta)
+
+
+_READERS = {
+    "srt": _read_srt,
+    "vtt": _read_vtt,
+    "sbv": _read_sbv,
+    "sub": _read_sub,
+    "ass": _read_ass,
+    "ssa": _read_ssa,
+    "stl": _read_stl,
+    "smi": _read_smi,
+    "ttml": _read_ttml,
+}
+
+
+def format_for_path(path: str) -> Optional[str]:
+    """Reader format for a file name, or None if it is not supported."""
+    return FORMATS.get(os.path.splitext(path)[1].lower())
+
+
+def parse_subtitle(source: str, fmt: str, encoding: str = "utf-8") -> SubtitleDocument:
+    """Parse decoded subtitle text of the given format ("srt", "ass", ...)."""
+    if fmt not in _READERS:
+        raise ValueError(f"Unsupported subtitle format: {fmt}")
+    doc = _READERS[fmt](source)
+    doc.encoding = encoding
+    return doc
+
+
+def load_subtitle(
+    path: str, fmt: Optional[str] = None, errors: str = "replace"
+) -> SubtitleDocument:
+    """Read and parse a subtitle file, detecting its encoding."""
+    fmt = fmt or format_for_path(path)
+    if fmt is None:
+        raise ValueError(f"Unsupported subtitle format: {os.path.splitext(path)[1]}")
+    with open(path, "rb") as f:
+        data = f.read()
+    encoding = detect_encoding(path, data)
+    source = data.decode(encoding, errors=errors)
+    return parse_subtitle(source, fmt, encoding)
+
+
+# --- Writers ------------------------------------------------------------------
+
+_ANY_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _write_srt(doc):
+    clocks = _clocks(np.concatenate([doc.starts, doc.ends]))
+    n = len(doc)
+    return "".join(
+        f"{i}\n{clocks[i - 1]} --> {clocks[n + i - 1]}\n{text}\n\n"
+        for i, text in enumerate(doc.texts(), 1)
+    )
+
+
+def _write_vtt(doc):
+    clocks = _clocks(np.concatenate([doc.starts, doc.ends]), sep=".")
+    n = len(doc)
+    cues = "".join(
+        f"{clocks[i]} --> {clocks[n + i]}\n{text}\n\n"
+        for i, text in enumerate(doc.texts())
+    )
+    return "WEBVTT\n\n" + cues
+
+
+def _write_sbv(doc):
+    clocks = _clocks(np.concatenate([doc.starts, doc.ends]), sep=".", hour_width=1)
+    n = len(doc)
+    return "".join(
+        f"{clocks[i]},{clocks[n + i]}\n{text}\n\n" for i, text in enumerate(doc.texts())
+    )
+
+
+def _write_sub(doc):
+    clocks = _clocks(np.concatenate([doc.starts, doc.ends]), sep=".", frac_digits=2)
+    n = len(doc)
+    texts = [text.replace("\n", "[br]") for text in doc.texts()]
+    return "".join(
+        f"{clocks[i]},{clocks[n + i]}\n{text}\n\n" for i, text in enumerate(texts)
+    )
+
+
+def _write_stl(doc):
+    clocks = _frame_clocks(np.concatenate([doc.starts, doc.ends]), STL_FRAME_RATE)
+    n = len(doc)
+    texts = [text.replace("\n", " | ") for text in doc.texts()]
+    return "".join(
+        f"{clocks[i]} , {clocks[n + i]} , {text}\n" for i, text in enumerate(texts)
+    )
+
+
+def _srt_to_ass_markup(text: str) -> str:
+    for tag in ("i", "b", "u"):
+        text = text.replace(f"<{tag}>", f"{{\\{tag}1}}").replace(
+            f"</{tag}>", f"{{\\{tag}0}}"
+        )
+    return _ANY_TAG_RE.sub("", text).replace("\n", "\\N")
+
+
+def _write_ass(doc, ssa=False):
+    clocks = _clocks(
+        np.concatenate([doc.starts, doc.ends]), sep=".", hour_width=1, frac_digits=2
+    )
+    n = len(doc)
+    styles = doc.styles or ["Default"]
+    if ssa:
+        header = "[Script Info]\nScriptType: v4.00\n\n[V4 Styles]\n"
+        header += (
+            "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, TertiaryColour, "
+            "BackColour, Bold, Italic, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, "
+            "MarginV, AlphaLevel, Encoding\n"
+        )
+        style_line = (
+            "Style: {},Arial,20,16777215,65535,65535,0,0,0,1,2,2,2,10,10,10,0,1\n"
+        )
+        marked = "Marked=0"
+    else:
+        header = "[Script Info]\nScriptType: v4.00+\n\n[V4+ Styles]\n"
+        header += (
+            "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, "
+            "BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, "
+            "BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding\n"
+        )
+        style_line = (
+            "Style: {},Arial,20,&H00FFFFFF,&H0000FFFF,&H00000000,&H00000000,"
+            "0,0,0,0,100,100,0,0,1,2,2,2,10,10,10,1\n"
+        )
+        marked = "0"
+    header += "".join(style_line.format(name or "Default") for name in styles)
+    fields = ["Marked" if ssa else "Layer"] + _ASS_EVENT_FIELDS[1:]
+    header += "\n[Events]\nFormat: " + ", ".join(fields) + "\n"
+    events = "".join(
+        f"Dialogue: {marked},{clocks[i]},{clocks[n + i]},{doc.style(i) or 'Default'},,0,0,0,,"
+        f"{_srt_to_ass_markup(text)}\n"
+        for i, text in enumerate(doc.texts())
+    )
+    return header + events
+
+
+def _write_smi(doc):
+    lines = [
+        "<SAMI>",
+        "<HEAD>",
+        '<STYLE TYPE="text/css">',
+        "<!--",
+        "P { margin-left:8pt; margin-right:8pt; text-align:center; font-family:Arial; }",
+        ".ENCC { Name:English; lang:en-US; SAMIType:CC; }",
+        "-->",
+        "</STYLE>",
+        "</HEAD>",
+        "<BODY>",
+    ]
+    starts, ends = doc.starts.tolist(), doc.ends.tolist()
+    for i, text in enumerate(doc.texts()):
+        cls = doc.style(i) or "ENCC"
+        text = text.replace("\n", "<br>")
+        lines.append(f"<SYNC Start={starts[i]}><P Class={cls}>{text}")
+        if i + 1 == len(starts) or starts[i + 1] != ends[i]:
+            lines.append(f"<SYNC Start={ends[i]}><P Class={cls}>&nbsp;")
+    lines += ["</BODY>", "</SAMI>"]
+    return "\n".join(lines) + "\n"
+
+
+def _write_ttml(doc):
+    clocks = _clocks(np.concatenate([doc.starts, doc.ends]), sep=".")
+    n = len(doc)
+    texts = [
+        "<br/>".join(
+            html.escape(_ANY_TAG_RE.sub("", line), quote=False)
+            for line in text.split("\n")
+        )
+        for text in doc.texts()
+    ]
+    paragraphs = "".join(
+        f'      <p begin="{clocks[i]}" end="{clocks[n + i]}">{text}</p>\n'
+        for i, text in enumerate(texts)
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<tt xmlns="http://www.w3.org/ns/ttml">\n'
+        "  <body>\n    <div>\n" + paragraphs + "    </div>\n  </body>\n</tt>\n"
+    )
+
+
+_WRITERS = {
+    "srt": _write_srt,
+    "vtt": _write_vtt,
+    "sbv": _write_sbv,
+    "sub": _write_sub,
+    "ass": _write_ass,
+    "ssa": lambda doc: _write_ass(doc, ssa=True),
+    "stl": _write_stl,
+    "smi": _write_smi,
+    "ttml": _write_ttml,
+}
+
+
+def _splice(doc: SubtitleDocument) -> str:
+    """Source text with every recorded timestamp replaced by its current value."""
+    values = np.concatenate([doc.starts, doc.ends, doc.marks])[doc.slot_refs].tolist()
+    spans = doc.slot_spans.tolist()
+    order = sorted(range(len(spans)), key=lambda k: spans[k][0])
+    pieces, pos = [], 0
+    for k in order:
+        begin, end = spans[k]
+        pieces.append(doc.source[pos:begin])
+        pieces.append(_format_like(values[k], doc.source[begin:end], doc.meta))
+        pos = end
+    pieces.append(doc.source[pos:])
+    return "".join(pieces)
+
+
+def can_write_in_place(doc: SubtitleDocument, fmt: Optional[str] = None) -> bool:
+    return doc.source is not None and (fmt is None or fmt == doc.format)
+
+
+def dumps(doc: SubtitleDocument, fmt: Optional[str] = None) -> str:
+    """Render a document. Without fmt (or with its own format) the original
+    source is kept and only timestamps are rewritten."""
+    if can_write_in_place(doc, fmt):
+        return _splice(doc)
+    fmt = fmt or doc.format
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unsupported subtitle format: {fmt}")
+    return _WRITERS[fmt](doc)
+
+
+def save_subtitle(doc: SubtitleDocument, path: str, fmt: Optional[str] = None) -> None:
+    """Write a document to path.
+
+    In-place rewrites keep the source encoding and line endings; documents
+    rendered into another format are written as UTF-8.
+    """
+    if can_write_in_place(doc, fmt):
+        with open(path, "w", encoding=doc.encoding, errors="replace", newline="") as f:
+            f.write(_splice(doc))
+        return
+    with open(path, "w", encoding="utf-8", errors="replace") as f:
+        f.write(dumps(doc, fmt))
@@ -0,0 +1,103 @@
+"""Timeline transforms applied to whole subtitle timestamp arrays.
+
+A transform is a callable that maps an int64 array of millisecond timestamps
+to a new array in one numpy operation, so it can be passed straight to
+SubtitleDocument.map_times. Results are clamped at zero.
+
+- AffineTransform: t * scale + offset_ms. A plain shift is scale 1, and a
+  framerate conversion such as 23.976 -> 25 fps is scale 23.976 / 25.
+- PiecewiseTransform: anchors (source_ms, target_ms). The offset is
+  interpolated linearly between anchors. Before the first anchor and after
+  the last, the nearest anchor's offset applies.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Sequence, Tuple
+
+import numpy as np
+
+_TIME_RE = re.compile(r"([+-])?(?:(\d+):)?(\d{1,2}):(\d{2})(?:[.,](\d{1,3}))?$")
+
+
+def parse_time(value: str) -> int:
+    """Milliseconds from "1500", "-1500" or a [H:]MM:SS[,mmm] timestamp."""
+    value = value.strip()
+    if re.fullmatch(r"[+-]?\d+", value):
+        return int(value)
+    match = _TIME_RE.match(value)
+    if not match:
+        raise ValueError(f"Invalid time: {value!r}")
+    sign, h, m, s, frac = match.groups()
+    ms = ((int(h or 0) * 60 + int(m)) * 60 + int(s)) * 1000
+    ms += int(frac.ljust(3, "0")) if frac else 0
+    return -ms if sign == "-" else ms
+
+
+@dataclass(frozen=True)
+class AffineTransform:
+    """t -> t * scale + offset_ms."""
+
+    scale: float = 1.0
+    offset_ms: int = 0
+
+    def __call__(self, times: np.ndarray) -> np.ndarray:
+        times = np.asarray(times, dtype=np.int64)
+        if self.scale == 1.0:
+            result = times + int(self.offset_ms)
+        else:
+            result = np.rint(times * self.scale).astype(np.int64) + int(self.offset_ms)
+        return np.maximum(result, 0)
+
+    def describe(self) -> str:
+        parts = []
+        if self.scale != 1.0:
+            parts.append(f"x{self.scale:.6g}")
+        if self.offset_ms or not parts:
+            parts.append(f"{self.offset_ms:+d}ms")
+        return " ".join(parts)
+
+
+@dataclass(frozen=True)
+class PiecewiseTransform:
+    """Piecewise-linear mapping through (source_ms, target_ms) anchors."""
+
+    anchors: Tuple[Tuple[int, int], ...]
+
+    def __post_init__(self):
+        if not self.anchors:
+            raise ValueError("A piecewise transform needs at least one anchor")
+        anchors = tuple(sorted((int(s), int(t)) for s, t in self.anchors))
+        sources = [s for s, _ in anchors]
+        if len(set(sources)) != len(sources):
+            raise ValueError("Piecewise anchors must have distinct source times")
+        object.__setattr__(self, "anchors", anchors)
+
+    def __call__(self, times: np.ndarray) -> np.ndarray:
+        times = np.asarray(times, dtype=np.int64)
+        sources = np.array([s for s, _ in self.anchors], dtype=np.float64)
+        offsets = np.array([t - s for s, t in self.anchors], dtype=np.float64)
+        # np.interp holds the end values outside the anchors, which gives
+        # the constant-offset behaviour before the first and after the last.
+        shift = np.rint(np.interp(times, sources, offsets)).astype(np.int64)
+        return np.maximum(times + shift, 0)
+
+    def describe(self) -> str:
+        return ", ".join(f"{s}ms->{t}ms" for s, t in self.anchors)
+
+
+def offset(milliseconds: int) -> AffineTransform:
+    return AffineTransform(1.0, int(milliseconds))
+
+
+def framerate(
+    source_fps: float, target_fps: float, offset_ms: int = 0
+) -> AffineTransform:
+    """Retime subtitles made for source_fps video to play with target_fps."""
+    if source_fps <= 0 or target_fps <= 0:
+        raise ValueError("Frame rates must be positive")
+    return AffineTransform(source_fps / target_fps, int(offset_ms))
+
+
+def piecewise(anchors: Sequence[Tuple[int, int]]) -> PiecewiseTransform:
+    return PiecewiseTransform(tuple(anchors))
@@ -340,6 +340,48 @@ def handle_completion(app, ok, out, in_path):
     return ok
 
 
+def get_batch_concurrency(app):
+    """Number of batch pairs the GUI may sync at once (0 = one per CPU core)."""
+    try:
+        value = int(
+            app.config.get("batch_concurrency", DEFAULT_OPTIONS["batch_concurrency"])
+        )
+    except (TypeError, ValueError):
+        value = DEFAULT_OPTIONS["batch_concurrency"]
+    if value <= 0:
+        value = os.cpu_count() or 1
+    return value
+
+
+def _log_batch_summary(app, total_items, success_count, fail_count, failed_pairs):
+    append_log(app, texts.BATCH_SYNC_COMPLETED, COLORS["BLUE"], True)
+    append_log(app, f"{texts.TOTAL_PAIRS_LABEL} {total_items}", COLORS["BLUE"])
+    append_log(
+        app,
+        texts.BATCH_SYNC_SUCCESSFUL.format(count=success_count),
+        COLORS["GREEN"],
+    )
+    if fail_count > 0:
+        append_log(
+            app,
+            texts.BATCH_SYNC_FAILED.format(count=fail_count),
+            COLORS["RED"],
+            end="\n\n",
+        )
+        for fail_idx, v, s in sorted(failed_pairs, key=lambda pair: pair[0]):
+            append_log(
+                app,
+                texts.BATCH_SYNC_FAILED_PAIR.format(
+                    idx=fail_idx + 1, total=total_items
+                ),
+                COLORS["RED"],
+            )
+            append_log(app, f"{texts.REFERENCE_LABEL} ", end="")
+            append_log(app, v, COLORS["ORANGE"], end="\n")
+            append_log(app, f"{texts.SUBTITLE_LABEL} ", end="")
+            append_log(app, s, COLORS["ORANGE"], end="\n\n")
+
+
 # --- SIGNALS ---
 class SyncSignals(QObject):
     finished = pyqtSignal(bool, object)
@@ -362,12 +404,15 @@ class SyncProcess:
         self.signals = SyncSignals()
         self.signals.log.connect(
             lambda msg, color: append_log(
-                self.app, msg, COLORS.get(color.upper()) if color else None
+                self.app,
+                f"{self.log_prefix}{msg}",
+                COLORS.get(color.upper()) if color else None,
             )
         )
+        self.log_prefix = ""  # e.g. "[3/20] " for concurrent batch jobs
         self.should_cancel = False
         self._process_lock = threading.Lock()
-        self._process_holder = {}  # populated by sync_core: {"process": Popen, "module_proc": Process}
+        self._process_holder = {}  # populated by sync_core: {"process": asyncio Process, "module_proc": Process}
 
     # Back-compat aliases for any external readers (no external consumers found,
     # but kept to avoid surprising attribute access on the legacy class shape).
@@ -385,6 +430,8 @@ class SyncProcess:
         def _cancel():
             try:
                 with self._process_lock:
+                    # sync_core stops tool executables itself once
+                    # should_cancel is set; only Popen handles are killed here.
                     proc = self._process_holder.get("process")
                     if proc and hasattr(proc, "poll") and proc.poll() is None:
                         from utils import terminate_process_safely
@@ -567,11 +614,14 @@ def start_sync_process(app):
                 )
                 if reply == QMessageBox.StandardButton.No:
                     return
-                if hasattr(app, "_batch_state"):
-                    app._batch_state["should_cancel"] = True
-                    current_proc = app._batch_state.get("current_process")
-                if current_proc:
-                    current_proc.cancel()
+                state = getattr(app, "_batch_state", None)
+                if state:
+                    state["should_cancel"] = True
+                    in_flight = list(state.get("active_processes", {}).values())
+                    in_flight.append(state.get("current_process"))
+                    for running_proc in in_flight:
+                        if running_proc:
+                            running_proc.cancel()
                 if hasattr(app, "log_window"):
                     from PyQt6.QtCore import QTimer
 
@@ -597,6 +647,11 @@ def start_sync_process(app):
             app.log_window.cancel_clicked.disconnect()
             app.log_window.cancel_clicked.connect(cancel_single)
 
+        concurrency = get_batch_concurrency(app)
+        if app.batch_mode_enabled and len(items) > 1 and concurrency > 1:
+            _run_concurrent_batch(app, items, tool, concurrency)
+            return
+
         def process_next_item():
             nonlocal current_item_idx, batch_success_count, batch_fail_count, failed_pairs
             converted_files_to_clean = []
@@ -609,34 +664,13 @@ def start_sync_process(app):
                 return
             if current_item_idx >= len(items):
                 if app.batch_mode_enabled and total_items > 1:
-                    append_log(app, texts.BATCH_SYNC_COMPLETED, COLORS["BLUE"], True)
-                    append_log(
-                        app, f"{texts.TOTAL_PAIRS_LABEL} {total_items}", COLORS["BLUE"]
-                    )
-                    append_log(
+                    _log_batch_summary(
                         app,
-                        texts.BATCH_SYNC_SUCCESSFUL.format(count=batch_success_count),
-                        COLORS["GREEN"],
+                        total_items,
+                        batch_success_count,
+                        batch_fail_count,
+                        failed_pairs,
                     )
-                    if batch_fail_count > 0:
-                        append_log(
-                            app,
-                            texts.BATCH_SYNC_FAILED.format(count=batch_fail_count),
-                            COLORS["RED"],
-                            end="\n\n",
-                        )
-                        for fail_idx, v, s in failed_pairs:
-                            append_log(
-                                app,
-                                texts.BATCH_SYNC_FAILED_PAIR.format(
-                                    idx=fail_idx + 1, total=total_items
-                                ),
-                                COLORS["RED"],
-                            )
-                            append_log(app, f"{texts.REFERENCE_LABEL} ", end="")
-                            append_log(app, v, COLORS["ORANGE"], end="\n")
-                            append_log(app, f"{texts.SUBTITLE_LABEL} ", end="")
-                            append_log(app, s, COLORS["ORANGE"], end="\n\n")
                     app.log_window.finish_batch_sync()
                 if hasattr(app, "_batch_state"):
                     del app._batch_state
@@ -872,6 +906,239 @@ def start_sync_process(app):
             app.log_window.handle_sync_completion(False, None)
 
 
+def _convert_for_tool(app, tool, file_path, output_dir, to_clean, log):
+    """Convert a subtitle to SRT when the tool cannot read its format."""
+    ext = os.path.splitext(file_path)[-1].lower()
+    supported = SYNC_TOOLS[tool].get("supported_formats", [])
+    if ext not in SUBTITLE_EXTENSIONS or ext in supported:
+        return file_path
+    converted, msgs = convert_to_srt(file_path, output_dir)
+    for msg in msgs:
+        log(msg, "grey")
+    if converted:
+        if not app.config.get(
+            "keep_converted_subtitles", DEFAULT_OPTIONS["keep_converted_subtitles"]
+        ):
+            to_clean.append(converted)
+        return converted
+    log(
+        texts.CONVERSION_FAILED_FOR_FILE.format(filename=os.path.basename(file_path)),
+        "red",
+    )
+    return None
+
+
+def _prepare_and_run(app, proc, tool, reference, subtitle, output, job):
+    """Worker-thread body of a concurrent batch job: convert, extract, sync.
+
+    Runs the same preparation as the serial pipeline, but off the GUI thread so
+    several pairs can prepare at once. output is the path reserved for the pair
+    by _run_concurrent_batch. Files to clean up are recorded in `job` before
+    finished is emitted, so the completion handler always sees them.
+    """
+    log = proc.signals.log.emit
+    try:
+        output_dir = os.path.dirname(output)
+        subtitle_path = _convert_for_tool(
+            app, tool, subtitle, output_dir, job["converted"], log
+        )
+        reference_path = None
+        if subtitle_path and not proc.should_cancel:
+            extraction = prepare_sync_reference(
+                reference, subtitle_path, output_dir, tool=tool, config=app.config
+            )
+            job["extraction"] = extraction
+            for message in extraction.messages:
+                log(message, "grey")
+            reference_path = _convert_for_tool(
+                app,
+                tool,
+                extraction.effective_reference,
+                output_dir,
+                job["converted"],
+                log,
+            )
+        if not reference_path or not subtitle_path or proc.should_cancel:
+            proc.signals.finished.emit(False, None)
+            return
+        tool_local, _, _ = sync_core.get_tool_with_fallback(
+            reference_path,
+            config=app.config,
+            callbacks=sync_core.SyncCallbacks(on_log=log),
+        )
+        proc._run(reference_path, subtitle_path, tool_local, output)
+    except Exception as e:
+        logger.exception(f"Batch job failed: {e}")
+        proc.signals.error.emit(f"{texts.ERROR_PREFIX} {e}")
+        proc.signals.finished.emit(False, None)
+
+
+def _run_concurrent_batch(app, items, tool, concurrency):
+    """Sync batch pairs with up to `concurrency` SyncProcess instances at once.
+
+    Pairs start in list order as slots free up. Two pairs that share a reference
+    are never in flight together, because their extraction folders would
+    collide, and each pair's output is reserved when it starts, because a job
+    writes it only when its tool finishes. Results are reported one pair at a time on the GUI thread through
+    handle_batch_completion, the same as the serial pipeline.
+    """
+    total = len(items)
+    state = app._batch_state
+    active = state["active_processes"] = {}
+    pending = list(range(total))
+    busy_refs, job_percent, failed_pairs = set(), {}, []
+    taken_outputs = set()
+    counts = {"success": 0, "fail": 0, "done": 0}
+
+    def drop_state():
+        if getattr(app, "_batch_state", None) is state:
+            del app._batch_state
+
+    def report_progress():
+        running = sum(job_percent.values())
+        update_progress(
+            app, int((counts["done"] * 100 + running) / total), counts["done"], total
+        )
+
+    def record_failure(idx, ref, sub):
+        counts["fail"] += 1
+        counts["done"] += 1
+        failed_pairs.append((idx, ref, sub))
+        report_progress()
+
+    def on_percent(idx, percent):
+        if percent is None or idx not in active:
+            return
+        job_percent[idx] = max(0.0, min(100.0, float(percent)))
+        app.log_window.update_job_progress(idx + 1, total, job_percent[idx])
+        report_progress()
+
+    def on_finished(idx, ref, sub, ref_key, job, ok, out):
+        active.pop(idx, None)
+        busy_refs.discard(ref_key)
+        job_percent.pop(idx, None)
+        app.log_window.clear_job_progress(idx + 1)
+        if state.get("should_cancel", False):
+            cleanup_files(job["converted"])
+            cleanup_extracted_subtitles(job["extraction"])
+            if not active:
+                logger.info("Batch sync cancelled by user")
+                drop_state()
+            return
+        append_log(
+            app,
+            texts.BATCH_SYNC_FINISHED_PAIR.format(idx=idx + 1, total=total),
+            COLORS["BLUE"],
+            True,
+        )
+        ok = handle_completion(app, ok, out, sub)
+        counts["done"] += 1
+        if ok:
+            counts["success"] += 1
+        else:
+            counts["fail"] += 1
+            failed_pairs.append((idx, ref, sub))
+        cleanup_files(job["converted"])
+        cleanup_extracted_subtitles(job["extraction"])
+        report_progress()
+        post_success_cb = (lambda: _mark_item_as_processed(app, ref)) if ok else None
+        app.log_window.handle_batch_completion(ok, out, pump, post_success_cb)
+
+    def launch(idx, ref, sub, ref_key):
+        label = f"[{idx + 1}/{total}] "
+        append_log(
+            app,
+            texts.BATCH_SYNC_PROCESSING_PAIR.format(idx=idx + 1, total=total),
+            COLORS["BLUE"],
+            True,
+        )
+        append_log(app, f"{texts.REFERENCE_LABEL} ", end="")
+        append_log(app, ref, COLORS["GREY"])
+        append_log(app, f"{texts.SUBTITLE_LABEL} ", end="")
+        append_log(app, sub, COLORS["GREY"], end="\n\n")
+        sub_ext = os.path.splitext(sub)[1].lower()
+        output = sync_core.reserve_output_path(
+            ref,
+            sub,
+            config=app.config,
+            taken=taken_outputs,
+            subtitle_was_converted=(
+                sub_ext in SUBTITLE_EXTENSIONS
+                and sub_ext not in SYNC_TOOLS[tool].get("supported_formats", [])
+            ),
+        )
+        proc = SyncProcess(app)
+        proc.log_prefix = label
+        job = {"extraction": None, "converted": []}
+        active[idx] = proc
+        busy_refs.add(ref_key)
+        job_percent[idx] = 0.0
+        app.log_window.update_job_progress(idx + 1, total, 0)
+        # Overwrite lines (progress bars) of parallel jobs would clobber each
+        # other; their percentages are shown in the per-job rows instead.
+        proc.signals.progress.connect(
+            lambda msg, is_overwrite: (
+                None if is_overwrite else append_log(app, f"{label}{msg}")
+            )
+        )
+        proc.signals.error.connect(
+            lambda msg: append_log(app, f"{label}{msg}", COLORS["RED"])
+        )
+        proc.signals.progress_percent.connect(
+            lambda percent: on_percent(idx, percent)
+        )
+        proc.signals.finished.connect(
+            lambda ok, out: on_finished(idx, ref, sub, ref_key, job, ok, out)
+        )
+        threading.Thread(
+            target=_prepare_and_run,
+            args=(app, proc, tool, ref, sub, output, job),
+            daemon=True,
+        ).start()
+
+    def pump():
+        if state.get("finished") or state.get("should_cancel", False):
+            return
+        while pending and len(active) < concurrency:
+            idx = next(
+                (
+                    i
+                    for i in pending
+                    if _reference_key(items[i]["reference_path"]) not in busy_refs
+                ),
+                None,
+            )
+            if idx is None:
+                break
+            pending.remove(idx)
+            it = items[idx]
+            ref, sub = (
+                os.path.normpath(p) if p else p
+                for p in (it.get("reference_path"), it.get("subtitle_path"))
+            )
+            ref_key = _reference_key(ref)
+            if tool == "alass":
+                ok_paths, ref, sub = _ensure_alass_safe_paths(app, ref, sub)
+                if not ok_paths:
+                    record_failure(idx, ref, sub)
+                    continue
+            launch(idx, ref, sub, ref_key)
+        if not pending and not active:
+            state["finished"] = True
+            _log_batch_summary(
+                app, total, counts["success"], counts["fail"], failed_pairs
+            )
+            app.log_window.finish_batch_sync()
+            drop_state()
+
+    app.log_window.cancel_button.setEnabled(True)
+    pump()
+
+
+def _reference_key(path):
+    return os.path.normcase(os.path.normpath(path)) if path else path
+
+
 def get_tool_with_fallback(app, ref_path):
     """GUI-facing wrapper that routes the orange fallback log through append_log."""
     cb = sync_core.SyncCallbacks(
@@ -3,25 +3,30 @@
 No PyQt6, no GUI dependencies. Consumed by both the GUI (via the SyncProcess
 adapter in sync_auto.py) and the CLI (cli.py). Progress, log lines, errors,
 and cancellation flow through the SyncCallbacks dataclass.
+
+run_sync_async is the sync itself, driven by asyncio: tool processes and
+module workers are awaited on the event loop, so one loop can run many syncs
+at once. run_sync runs it to completion for synchronous callers.
 """
 
 import os
 import re
 import sys
 import time
+import asyncio
+import inspect
 import shutil
 import logging
 import platform
+import threading
 import importlib
 import multiprocessing
-from dataclasses import dataclass
-from typing import Callable, Optional
+from dataclasses import dataclass, field, fields
+from typing import Callable, Dict, List, Optional, Sequence
 
-import platformdirs
 import texts
 from constants import SYNC_TOOLS, DEFAULT_OPTIONS, SUBTITLE_EXTENSIONS
 from utils import (
-    create_process,
     create_backup,
     default_encoding,
     detect_encoding,
@@ -31,6 +36,7 @@ from utils import (
 )
 from subtitle_converter import convert_to_srt
 from alass_encodings import enc_list
+from process_usage import ProcessUsage, snapshot, usage_since
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +50,34 @@ class SyncResult:
     returncode: Optional[int]
     elapsed_ms: int
     cancelled: bool = False
+    # Milliseconds spent per stage of run_sync, in the order they ran
+    timings: Dict[str, float] = field(default_factory=dict)
+    # Resources used by the tool processes the sync ran
+    processes: List[ProcessUsage] = field(default_factory=list)
+
+
+class _StageClock:
+    """Adds up monotonic time per stage into a {stage: milliseconds} dict.
+
+    Only one stage runs at a time: starting a stage ends the previous one,
+    and a stage started again keeps adding to its total.
+    """
+
+    def __init__(self, timings):
+        self.timings = timings
+        self._stage = None
+        self._started = 0.0
+
+    def start(self, stage):
+        self.stop()
+        self._stage, self._started = stage, time.monotonic()
+
+    def stop(self):
+        if self._stage is None:
+            return
+        ms = (time.monotonic() - self._started) * 1000
+        self.timings[self._stage] = round(self.timings.get(self._stage, 0) + ms, 3)
+        self._stage = None
 
 
 @dataclass
@@ -51,7 +85,9 @@ class SyncCallbacks:
     """Optional hooks for progress reporting, logging, error reporting, and cancellation.
 
     Any field left as None is treated as a no-op. is_cancelled returning True
-    causes the sync to short-circuit at the next poll point.
+    causes the sync to short-circuit at the next poll point. With
+    run_sync_async, the hooks may also be coroutine functions; they are
+    awaited before the sync goes on.
     """
 
     on_log: Optional[Callable[[str, Optional[str]], None]] = None
@@ -79,6 +115,63 @@ class SyncCallbacks:
     def _cancelled(self):
         return bool(self.is_cancelled() if self.is_cancelled else False)
 
+    async def _alog(self, msg, color=None):
+        if self.on_log:
+            await _resolve(self.on_log(msg, color))
+
+    async def _aprogress(self, percent):
+        if self.on_progress:
+            await _resolve(self.on_progress(percent))
+
+    async def _asubprocess_line(self, line, is_overwrite):
+        if self.on_subprocess_line:
+            await _resolve(self.on_subprocess_line(line, is_overwrite))
+
+    async def _aerror(self, msg):
+        if self.on_error:
+            await _resolve(self.on_error(msg))
+
+    async def _acancelled(self):
+        if not self.is_cancelled:
+            return False
+        return bool(await _resolve(self.is_cancelled()))
+
+    def _for_thread(self, loop, stop):
+        """Copies of the hooks for code running in a worker thread of loop.
+
+        Coroutine hooks are run on loop and waited for. is_cancelled also
+        reports True once the threading.Event stop is set.
+        """
+
+        def bridge(hook):
+            if hook is None:
+                return None
+
+            def call(*args):
+                result = hook(*args)
+                if inspect.isawaitable(result):
+                    future = asyncio.run_coroutine_threadsafe(_resolve(result), loop)
+                    result = future.result()
+                return result
+
+            return call
+
+        bridged = SyncCallbacks(
+            **{field.name: bridge(getattr(self, field.name)) for field in fields(self)}
+        )
+        is_cancelled = bridged.is_cancelled
+        bridged.is_cancelled = lambda: stop.is_set() or bool(
+            is_cancelled and is_cancelled()
+        )
+        return bridged
+
+
+async def _resolve(value):
+    """value, awaited first if a hook returned an awaitable."""
+    if inspect.isawaitable(value):
+        value = await value
+    return value
+
 
 def shorten_progress_bar(line: str) -> str:
     """Compress an alass-style progress bar line down to 25-char width."""
@@ -134,8 +227,9 @@ def get_tool_with_fallback(
     ref_path: str, *, config: dict, callbacks: Optional[SyncCallbacks] = None
 ):
     """Resolve the configured sync tool. Falls back to the default if the
-    configured tool does not support subtitle-as-reference and a subtitle
-    reference was provided. Returns (tool_name, tool_info, tool_type).
+    configured tool does not support the reference type (a subtitle for
+    audio-only tools, a video for subtitle-only tools).
+    Returns (tool_name, tool_info, tool_type).
     """
     t = config.get("sync_tool", DEFAULT_OPTIONS["sync_tool"])
     info = SYNC_TOOLS[t]
@@ -143,17 +237,18 @@ def get_tool_with_fallback(
     supports_sub_ref = info.get("supports_subtitle_as_reference", True)
     ref_ext = os.path.splitext(ref_path)[1].lower()
     is_video = ref_ext not in SUBTITLE_EXTENSIONS
-    if not supports_sub_ref and not is_video:
+    supports_video_ref = info.get("supports_video_as_reference", True)
+    if (not supports_sub_ref and not is_video) or (not supports_video_ref and is_video):
         fallback = DEFAULT_OPTIONS["sync_tool"]
+        message = (
+            texts.TOOL_DOES_NOT_SUPPORT_VIDEO_REFERENCE
+            if is_video
+            else texts.TOOL_DOES_NOT_SUPPORT_SUBTITLE_REFERENCE
+        )
         if callbacks:
-            callbacks._log(
-                str(texts.TOOL_DOES_NOT_SUPPORT_SUBTITLE_REFERENCE).format(
-                    tool=t, fallback=fallback
-                ),
-                "orange",
-            )
+            callbacks._log(str(message).format(tool=t, fallback=fallback), "orange")
         logger.info(
-            f"{t} does not support subtitle files as reference. Falling back to {fallback}."
+            f"{t} does not support this reference type. Falling back to {fallback}."
         )
         t = fallback
         info = SYNC_TOOLS[t]
@@ -161,14 +256,24 @@ def get_tool_with_fallback(
     return t, info, t_type
 
 
+def _path_key(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
 def determine_output_path(
     reference: str,
     subtitle: str,
     *,
     config: dict,
     subtitle_was_converted: bool = False,
+    taken: Optional[set] = None,
 ) -> str:
-    """Compute the output subtitle path according to the config's save mode."""
+    """Compute the output subtitle path according to the config's save mode.
+
+    Where the save mode numbers the name instead of replacing a file, the
+    _2, _3... counter also skips the paths in taken (os.path.normcase'd
+    absolute paths), which concurrent callers use to reserve outputs.
+    """
     save_loc = config.get(
         "automatic_save_location", DEFAULT_OPTIONS["automatic_save_location"]
     )
@@ -207,6 +312,8 @@ def determine_output_path(
     elif save_loc == "save_next_to_video_with_same_filename":
         out_dir, out_name = ref_dir, f"{ref_name}{suffix}{sub_ext}"
     elif save_loc == "save_to_desktop":
+        import platformdirs
+
         out_dir, out_name = (
             platformdirs.user_desktop_path(),
             f"{prefix}{sub_name}{suffix}{sub_ext}",
@@ -224,7 +331,9 @@ def determine_output_path(
     ):
         base, ext = os.path.splitext(out_name)
         counter = 2
-        while os.path.exists(output_path):
+        while os.path.exists(output_path) or (
+            taken and _path_key(output_path) in taken
+        ):
             out_name = f"{base}_{counter}{ext}"
             output_path = os.path.join(out_dir, out_name)
             counter += 1
@@ -327,6 +436,18 @@ def module_worker(module_name, args, conn, idx, total):
     can pickle the target. idx and total are kept for call-site API stability;
     they aren't used internally.
     """
+    execute_module_job(module_name, args, conn)
+
+
+def execute_module_job(module_name, args, conn, report_rss=False):
+    """Run one module tool job, streaming progress/error/finished over conn.
+
+    Shared by the one-shot module_worker and the warm workers in worker_pool.
+    The finished message is ("finished", returncode, rss, usage): rss is the
+    worker's RSS with report_rss, else None, and usage is the job's resource
+    usage as process_usage.usage_since reports it.
+    """
+    before = snapshot()
     try:
         module = importlib.import_module(module_name)
 
@@ -393,10 +514,15 @@ def module_worker(module_name, args, conn, idx, total):
             log_stream.flush()
             root_logger.handlers = old_handlers
             sys.stdout, sys.stderr = old_stdout, old_stderr
-        conn.send(("finished", rc))
     except Exception as e:
         conn.send(("error", f"Failed to import module '{module_name}': {e}"))
-        conn.send(("finished", 1))
+        rc = 1
+    rss = None
+    if report_rss:
+        from worker_pool import current_rss_bytes
+
+        rss = current_rss_bytes()
+    conn.send(("finished", rc, rss, usage_since(before)))
 
 
 def run_module_tool(
@@ -406,118 +532,411 @@ def run_module_tool(
     *,
     sync_tool: str,
     process_holder: Optional[dict] = None,
+    usage: Optional[list] = None,
 ):
-    """Run a module-based sync tool (autosubsync) in a child process.
-
-    Streams progress/error/finished messages back via Pipe and forwards them
-    through callbacks. Returns the child's returncode. If process_holder is
-    given, the multiprocessing.Process handle is stored at key "module_proc"
-    so an external cancel can call .terminate().
+    """Run a module-based sync tool (ffsubsync, autosubsync) in a child process.
+
+    Jobs go to a warm worker from worker_pool when the shared pool is enabled,
+    otherwise to a fresh multiprocessing.Process. Progress/error/finished
+    messages are streamed back via Pipe and forwarded through callbacks.
+    Returns the child's returncode. If process_holder is given, the child's
+    multiprocessing.Process handle is stored at key "module_proc" so an
+    external cancel can call .terminate(); a pool worker's handle is removed
+    again before the worker is returned to the pool. If usage is given, the job's
+    ProcessUsage is appended to it.
     """
-    parent_conn, child_conn = multiprocessing.Pipe()
-    proc = multiprocessing.Process(
-        target=module_worker,
-        args=(module_name, args, child_conn, None, None),
-    )
+    from worker_pool import get_module_worker_pool
+
+    started = time.monotonic()
+    pool = get_module_worker_pool()
+    if pool is None:
+        parent_conn, child_conn = multiprocessing.Pipe()
+        proc = multiprocessing.Process(
+            target=module_worker,
+            args=(module_name, args, child_conn, None, None),
+        )
+        if process_holder is not None:
+            process_holder["module_proc"] = proc
+        proc.start()
+        rc, _, report = _relay_module_messages(parent_conn, proc, callbacks, sync_tool)
+        if callbacks._cancelled() and proc.is_alive():
+            # Cancellation must stop the child, not just stop listening to it.
+            proc.terminate()
+        proc.join(timeout=1)
+        if usage is not None:
+            usage.append(ProcessUsage.from_report(sync_tool, started, rc, report))
+        return rc
+
+    worker = pool.acquire(module_name)
     if process_holder is not None:
-        process_holder["module_proc"] = proc
-    proc.start()
-    rc = 1
+        process_holder["module_proc"] = worker.process
+    try:
+        worker.submit(module_name, args)
+        rc, rss, report = _relay_module_messages(
+            worker.conn, worker.process, callbacks, sync_tool
+        )
+    except (OSError, EOFError) as e:
+        callbacks._error(f"Module worker failed: {e}")
+        rc, rss, report = 1, None, None
+    if process_holder is not None:
+        # The worker goes back to the pool; a late cancel must not kill it
+        process_holder.pop("module_proc", None)
+    if rss is False:
+        # Cancelled, crashed or killed mid-job: only this worker is discarded.
+        pool.discard(worker)
+    else:
+        pool.release(worker, rss)
+    if usage is not None:
+        usage.append(ProcessUsage.from_report(sync_tool, started, rc, report))
+    return rc
+
+
+def _relay_module_messages(conn, proc, callbacks, sync_tool):
+    """Forward a module job's messages until it finishes.
+
+    Returns (returncode, rss, usage) where rss is the RSS reported with the
+    finished message (None if not reported), or False if the job never
+    finished, and usage is the job's reported resource usage or None.
+    """
+    rc, rss, report = 1, False, None
     while True:
         if callbacks._cancelled():
             break
-        if parent_conn.poll(0.1):
-            msg = parent_conn.recv()
-            if msg[0] == "progress":
-                cleaned, percent = process_output(msg[1], sync_tool)
-                if cleaned:
-                    callbacks._subprocess_line(cleaned, msg[2])
-                if percent is not None:
-                    callbacks._progress(percent)
-            elif msg[0] == "error":
-                callbacks._error(msg[1])
-            elif msg[0] == "finished":
-                rc = msg[1]
-                break
-    proc.join(timeout=1)
-    return rc
+        try:
+            ready = conn.poll(0.1)
+            if not ready:
+                if not proc.is_alive() and not conn.poll():
+                    callbacks._error("Module worker exited unexpectedly")
+                    break
+                continue
+            msg = conn.recv()
+        except (EOFError, OSError):
+            break
+        if msg[0] == "progress":
+            cleaned, percent = process_output(msg[1], sync_tool)
+            if cleaned:
+                callbacks._subprocess_line(cleaned, msg[2])
+            if percent is not None:
+                callbacks._progress(percent)
+        elif msg[0] == "error":
+            callbacks._error(msg[1])
+        elif msg[0] == "finished":
+            rc = msg[1]
+            rss = msg[2] if len(msg) > 2 else None
+            report = msg[3] if len(msg) > 3 else None
+            break
+    return rc, rss, report
 
 
-def run_executable_tool(
-    cmd,
+async def run_module_tool_async(
+    module_name: str,
+    args,
     callbacks: SyncCallbacks,
     *,
     sync_tool: str,
     process_holder: Optional[dict] = None,
+    usage: Optional[list] = None,
 ):
-    """Run an external sync tool binary, streaming its stdout/stderr.
+    """Async counterpart of run_module_tool, used by run_sync_async.
 
-    Reads in 128-byte chunks and handles CRLF (\\r\\n), LF (\\n), and standalone CR (\\r)
-    so progress bars that rewrite the same line are forwarded with is_overwrite=True,
-    while standard CRLF/LF newlines are forwarded with is_overwrite=False.
+    The worker's pipe is watched by the event loop instead of a blocked
+    thread. If the task is cancelled, the job's process is stopped (a pool
+    worker is discarded) before CancelledError propagates.
     """
-    process = create_process(cmd)
+    from worker_pool import get_module_worker_pool
+
+    started = time.monotonic()
+    pool = get_module_worker_pool()
+    if pool is None:
+        parent_conn, child_conn = multiprocessing.Pipe()
+        proc = multiprocessing.Process(
+            target=module_worker,
+            args=(module_name, args, child_conn, None, None),
+        )
+        if process_holder is not None:
+            process_holder["module_proc"] = proc
+        proc.start()
+        rc, report, finished = 1, None, False
+        try:
+            rc, _, report = await _relay_module_messages_async(
+                parent_conn, proc, callbacks, sync_tool
+            )
+            finished = not await callbacks._acancelled()
+        finally:
+            if not finished and proc.is_alive():
+                proc.terminate()
+            await asyncio.to_thread(proc.join, 1)
+            if usage is not None:
+                usage.append(ProcessUsage.from_report(sync_tool, started, rc, report))
+        return rc
+
+    # acquire() blocks while the pool is busy. If this task is cancelled
+    # meanwhile, the worker it still gets is handed back.
+    acquiring = asyncio.ensure_future(asyncio.to_thread(pool.acquire, module_name))
+    try:
+        worker = await asyncio.shield(acquiring)
+    except asyncio.CancelledError:
+        acquiring.add_done_callback(
+            lambda f: f.exception() is None and pool.release(f.result())
+        )
+        raise
     if process_holder is not None:
-        process_holder["process"] = process
-    buffer = b""
-    last_was_cr = False
+        process_holder["module_proc"] = worker.process
+    rc, rss, report = 1, False, None
+    try:
+        worker.submit(module_name, args)
+        rc, rss, report = await _relay_module_messages_async(
+            worker.conn, worker.process, callbacks, sync_tool
+        )
+    except (OSError, EOFError) as e:
+        await callbacks._aerror(f"Module worker failed: {e}")
+        rc, rss = 1, None
+    finally:
+        if process_holder is not None:
+            # The worker goes back to the pool; a late cancel must not kill it
+            process_holder.pop("module_proc", None)
+        if rss is False:
+            await asyncio.to_thread(pool.discard, worker)
+        else:
+            await asyncio.to_thread(pool.release, worker, rss)
+        if usage is not None:
+            usage.append(ProcessUsage.from_report(sync_tool, started, rc, report))
+    return rc
+
+
+async def _relay_module_messages_async(conn, proc, callbacks, sync_tool):
+    """_relay_module_messages, waiting for messages on the event loop."""
+    rc, rss, report = 1, False, None
     while True:
-        if callbacks._cancelled():
+        if await callbacks._acancelled():
             break
-        chunk = process.stdout.read(128)
-        if not chunk:
-            break
-        buffer += chunk
-        while True:
-            cr_pos = buffer.find(b"\r")
-            lf_pos = buffer.find(b"\n")
-            if cr_pos == -1 and lf_pos == -1:
-                break
-
-            if cr_pos != -1 and lf_pos == cr_pos + 1:
-                # CRLF (\r\n): standard Windows newline
-                part = buffer[:cr_pos]
-                buffer = buffer[cr_pos + 2 :]
-                is_overwrite = last_was_cr
-                last_was_cr = False
-            elif cr_pos != -1 and (lf_pos == -1 or cr_pos < lf_pos):
-                if cr_pos == len(buffer) - 1:
-                    # Trailing \r at end of chunk: wait for next read to see if \n follows
+        try:
+            if not await _wait_readable(conn, 0.1):
+                if not proc.is_alive() and not conn.poll():
+                    await callbacks._aerror("Module worker exited unexpectedly")
                     break
-                part = buffer[:cr_pos]
-                buffer = buffer[cr_pos + 1 :]
-                is_overwrite = True
+                continue
+            msg = conn.recv()
+        except (EOFError, OSError):
+            break
+        if msg[0] == "progress":
+            await _forward_line_async(callbacks, sync_tool, msg[1], msg[2])
+        elif msg[0] == "error":
+            await callbacks._aerror(msg[1])
+        elif msg[0] == "finished":
+            rc = msg[1]
+            rss = msg[2] if len(msg) > 2 else None
+            report = msg[3] if len(msg) > 3 else None
+            break
+    return rc, rss, report
+
+
+async def _wait_readable(conn, timeout):
+    """conn.poll(timeout), waiting on the event loop."""
+    if conn.poll():
+        return True
+    loop = asyncio.get_running_loop()
+    ready = loop.create_future()
+    fd = conn.fileno()
+    try:
+        loop.add_reader(fd, lambda: ready.done() or ready.set_result(True))
+    except NotImplementedError:
+        # The Windows event loop cannot watch pipe handles
+        await asyncio.sleep(min(timeout, CANCEL_POLL_SECONDS))
+        return conn.poll()
+    try:
+        await asyncio.wait_for(ready, timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        loop.remove_reader(fd)
+    return conn.poll()
+
+
+async def _forward_line_async(callbacks, sync_tool, line, is_overwrite):
+    cleaned, percent = process_output(line, sync_tool)
+    if cleaned:
+        await callbacks._asubprocess_line(cleaned, is_overwrite)
+    if percent is not None:
+        await callbacks._aprogress(percent)
+
+
+# Bytes requested per read of a tool's output.
+OUTPUT_READ_SIZE = 64 * 1024
+# Longest wait for tool output before is_cancelled is polled again.
+CANCEL_POLL_SECONDS = 0.05
+
+_LINE_END = re.compile(r"(\r\n|\r|\n)")
+
+
+class _LineSplitter:
+    """Split a tool's output stream into lines.
+
+    CRLF (\\r\\n) and LF (\\n) end a line; a standalone CR (\\r) ends a
+    line that the next one overwrites (progress bars), reported with
+    is_overwrite=True. A line ended by a newline right after such updates is
+    still part of them, so it is reported as an overwrite too.
+
+    Output is collected in one bytearray. Each feed decodes and splits all of
+    its complete lines at once and drops them from the buffer, so the cost
+    is linear in the output size however it is chunked.
+    """
+
+    def __init__(self, encoding):
+        self._encoding = encoding
+        self._buffer = bytearray()
+        self._scanned = 0  # The buffer holds no line end before this offset
+        self._last_was_cr = False
+
+    def feed(self, data):
+        """Add data; returns the (line, is_overwrite) pairs it completes."""
+        buffer = self._buffer
+        scan_from = self._scanned
+        buffer += data
+        # A trailing \r may be the start of a CRLF split across reads
+        limit = len(buffer) - 1 if buffer.endswith(b"\r") else len(buffer)
+        self._scanned = limit
+        cut = max(
+            buffer.rfind(b"\n", scan_from, limit),
+            buffer.rfind(b"\r", scan_from, limit),
+        )
+        if cut == -1:
+            return []
+        cut += 1
+        with memoryview(buffer) as view:
+            text = str(view[:cut], self._encoding, "replace")
+        del buffer[:cut]
+        self._scanned -= cut
+
+        parts = _LINE_END.split(text)
+        lines = []
+        last_was_cr = self._last_was_cr
+        for i in range(0, len(parts) - 1, 2):
+            if parts[i + 1] == "\r":
+                lines.append((parts[i], True))
                 last_was_cr = True
-            elif lf_pos != -1:
-                # LF (\n): standard Unix newline
-                part = buffer[:lf_pos]
-                buffer = buffer[lf_pos + 1 :]
-                is_overwrite = last_was_cr
-                last_was_cr = False
             else:
-                break
+                lines.append((parts[i], last_was_cr))
+                last_was_cr = False
+        self._last_was_cr = last_was_cr
+        return lines
+
+    def flush(self):
+        """The unterminated rest of the output, as a (line, is_overwrite) pair."""
+        rest = self._buffer.decode(self._encoding, errors="replace").rstrip("\r\n")
+        self._buffer.clear()
+        self._scanned = 0
+        return rest, self._last_was_cr
+
+
+def _run_blocking(coroutine, async_name):
+    """asyncio.run(coroutine), refusing to nest inside a running event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    coroutine.close()
+    raise RuntimeError(
+        f"Cannot block inside a running event loop; await {async_name} instead"
+    )
 
-            cleaned, percent = process_output(
-                part.decode(default_encoding, errors="replace"), sync_tool
+
+def run_executable_tool(
+    cmd,
+    callbacks: SyncCallbacks,
+    *,
+    sync_tool: str,
+    process_holder: Optional[dict] = None,
+    usage: Optional[list] = None,
+):
+    """Blocking run_executable_tool_async, on an event loop of its own.
+
+    Raises RuntimeError if the calling thread is already running an event
+    loop; await run_executable_tool_async there instead.
+    """
+    return _run_blocking(
+        run_executable_tool_async(
+            cmd,
+            callbacks,
+            sync_tool=sync_tool,
+            process_holder=process_holder,
+            usage=usage,
+        ),
+        "run_executable_tool_async",
+    )
+
+
+async def run_executable_tool_async(
+    cmd,
+    callbacks: SyncCallbacks,
+    *,
+    sync_tool: str,
+    process_holder: Optional[dict] = None,
+    usage: Optional[list] = None,
+):
+    """Run an external sync tool binary, streaming its stdout/stderr.
+
+    Output is read as it arrives and split into lines by _LineSplitter, so
+    progress bars that rewrite the same line are forwarded with
+    is_overwrite=True, while CRLF/LF newlines are forwarded with
+    is_overwrite=False.
+
+    The tool is started with utils.create_process_async and its output is
+    read on the event loop. If is_cancelled returns True or the task is
+    cancelled (e.g. by asyncio.wait_for), the tool's process group is
+    terminated before returning 1 or re-raising CancelledError. Either way,
+    if usage is given, the tool's ProcessUsage is appended to it.
+    """
+    from utils import create_process_async, terminate_process_async
+
+    started = time.monotonic()
+    process = await create_process_async(cmd)
+    if process_holder is not None:
+        process_holder["process"] = process
+    try:
+        splitter = _LineSplitter(default_encoding)
+        async for chunk in _read_output_async(process.stdout, callbacks):
+            for line, is_overwrite in splitter.feed(chunk):
+                await _forward_line_async(callbacks, sync_tool, line, is_overwrite)
+        if await callbacks._acancelled():
+            return 1
+        rest, is_overwrite = splitter.flush()
+        if rest:
+            await _forward_line_async(callbacks, sync_tool, rest, is_overwrite)
+        return await process.wait()
+    finally:
+        if process.returncode is None:
+            await terminate_process_async(process)
+        if usage is not None:
+            rusage = getattr(process, "rusage", None)
+            usage.append(
+                ProcessUsage.from_rusage(sync_tool, started, process.returncode, rusage)
             )
-            if cleaned:
-                callbacks._subprocess_line(cleaned, is_overwrite)
-            if percent is not None:
-                callbacks._progress(percent)
 
-    if buffer and not callbacks._cancelled():
-        cleaned, percent = process_output(
-            buffer.decode(default_encoding, errors="replace").rstrip("\r\n"),
-            sync_tool,
-        )
-        if cleaned:
-            callbacks._subprocess_line(cleaned, last_was_cr)
-        if percent is not None:
-            callbacks._progress(percent)
-    return process.wait() if not callbacks._cancelled() else 1
 
+async def _read_output_async(stream, callbacks):
+    """Yield chunks of an asyncio stream until EOF or until cancelled.
 
-def run_sync(
+    is_cancelled, if set, is polled every CANCEL_POLL_SECONDS.
+    """
+    while True:
+        if callbacks.is_cancelled is None:
+            chunk = await stream.read(OUTPUT_READ_SIZE)
+        elif await callbacks._acancelled():
+            return
+        else:
+            try:
+                chunk = await asyncio.wait_for(
+                    stream.read(OUTPUT_READ_SIZE), CANCEL_POLL_SECONDS
+                )
+            except asyncio.TimeoutError:
+                continue
+        if not chunk:
+            return
+        yield chunk
+
+
+async def run_sync_async(
     reference: str,
     subtitle: str,
     *,
@@ -533,27 +952,76 @@ def run_sync(
     backup, autosubsync overwrite-protection, tool execution, and post-replace of the
     temp output file. Returns a SyncResult; errors/progress are also reported
     through callbacks as they happen.
+
+    Tool processes and module workers are awaited without blocking the event
+    loop, so many syncs can run concurrently on one loop. In-process tools
+    and other blocking steps (probing for PGS subtitles, downloading lapse)
+    run in the loop's default executor. Cancelling the task, e.g. with
+    asyncio.wait_for, stops the tool, removes temporary files and re-raises
+    CancelledError.
+
+    SyncResult.timings records how long each stage took: validation,
+    conversion (to a format the tool supports), output (resolving, checking
+    and backing up the output path), pgs_probe, tool_setup (locating the
+    tool and building its arguments, which includes detecting the subtitle
+    encodings for alass), tool, and postprocess (checking and moving the
+    tool's output). Stages that did not run are left out.
+    SyncResult.processes holds the ProcessUsage of the tool processes.
     """
-    callbacks = callbacks or SyncCallbacks()
+    timings = {}
+    processes = []
+    clock = _StageClock(timings)
+    try:
+        result = await _run_sync_stages(
+            reference,
+            subtitle,
+            tool=tool,
+            output=output,
+            config=config,
+            callbacks=callbacks or SyncCallbacks(),
+            process_holder=process_holder,
+            clock=clock,
+            usage=processes,
+        )
+    finally:
+        clock.stop()
+    result.timings = timings
+    result.processes = processes
+    return result
+
+
+async def _run_sync_stages(
+    reference,
+    subtitle,
+    *,
+    tool,
+    output,
+    config,
+    callbacks,
+    process_holder,
+    clock,
+    usage,
+):
     start = time.monotonic()
+    clock.start("validation")
 
     from constants import is_remote_url
 
     ref_is_url = is_remote_url(reference)
     if not ref_is_url and not os.path.exists(reference) and not os.path.exists(subtitle):
-        callbacks._error(str(texts.SKIPPING_BOTH_FILES_DO_NOT_EXIST))
+        await callbacks._aerror(str(texts.SKIPPING_BOTH_FILES_DO_NOT_EXIST))
         return SyncResult(
             False, None, tool, "both files missing", None, _elapsed(start)
         )
     if not ref_is_url and not os.path.exists(reference):
-        callbacks._error(str(texts.SKIPPING_REFERENCE_FILE_DOES_NOT_EXIST))
+        await callbacks._aerror(str(texts.SKIPPING_REFERENCE_FILE_DOES_NOT_EXIST))
         return SyncResult(False, None, tool, "reference missing", None, _elapsed(start))
     if not os.path.exists(subtitle):
-        callbacks._error(str(texts.SKIPPING_SUBTITLE_FILE_DOES_NOT_EXIST))
+        await callbacks._aerror(str(texts.SKIPPING_SUBTITLE_FILE_DOES_NOT_EXIST))
         return SyncResult(False, None, tool, "subtitle missing", None, _elapsed(start))
     if tool not in SYNC_TOOLS:
         msg = str(texts.UNKNOWN_SYNC_TOOL).format(tool=tool)
-        callbacks._error(msg)
+        await callbacks._aerror(msg)
         return SyncResult(False, None, tool, "unknown tool", None, _elapsed(start))
 
     # Validate file readability
@@ -562,7 +1030,7 @@ def run_sync(
         err_msg = str(texts.COULD_NOT_ACCESS_REFERENCE_FILE).format(
             path=reference, error=ref_err
         )
-        callbacks._error(err_msg)
+        await callbacks._aerror(err_msg)
         return SyncResult(False, None, tool, err_msg, None, _elapsed(start))
 
     sub_readable, sub_err = check_file_readable(subtitle)
@@ -570,7 +1038,7 @@ def run_sync(
         err_msg = str(texts.COULD_NOT_ACCESS_OR_WRITE_SUBTITLE).format(
             path=subtitle, error=sub_err
         )
-        callbacks._error(err_msg)
+        await callbacks._aerror(err_msg)
         return SyncResult(False, None, tool, err_msg, None, _elapsed(start))
 
     current_tool = tool
@@ -583,22 +1051,28 @@ def run_sync(
         else os.path.splitext(reference)[1].lower()
     )
     is_video_ref = ref_ext not in SUBTITLE_EXTENSIONS
-    if not supports_sub_ref and not is_video_ref:
+    supports_video_ref = current_tool_info.get("supports_video_as_reference", True)
+    if (not supports_sub_ref and not is_video_ref) or (
+        not supports_video_ref and is_video_ref
+    ):
         default_tool = DEFAULT_OPTIONS["sync_tool"]
-        callbacks._log(
-            str(texts.TOOL_DOES_NOT_SUPPORT_SUBTITLE_REFERENCE).format(
-                tool=current_tool, fallback=default_tool
-            ),
-            "orange",
+        message = (
+            texts.TOOL_DOES_NOT_SUPPORT_VIDEO_REFERENCE
+            if is_video_ref
+            else texts.TOOL_DOES_NOT_SUPPORT_SUBTITLE_REFERENCE
+        )
+        await callbacks._alog(
+            str(message).format(tool=current_tool, fallback=default_tool), "orange"
         )
         logger.info(
-            f"{current_tool} does not support subtitle files as reference. "
+            f"{current_tool} does not support this reference type. "
             f"Falling back to {default_tool}."
         )
         current_tool = default_tool
         current_tool_info = SYNC_TOOLS[current_tool]
         current_tool_type = current_tool_info.get("type", "executable")
 
+    clock.start("conversion")
     supported_formats = current_tool_info.get("supported_formats", [])
     converted_files_to_clean = []
     effective_subtitle = subtitle
@@ -614,12 +1088,12 @@ def run_sync(
         )
         converted, msgs = convert_to_srt(subtitle, temp_dir)
         for msg in msgs:
-            callbacks._log(msg, "grey")
+            await callbacks._alog(msg, "grey")
         if not converted:
             err_msg = str(texts.CONVERSION_FAILED_FOR_FILE).format(
                 filename=os.path.basename(subtitle)
             )
-            callbacks._error(err_msg)
+            await callbacks._aerror(err_msg)
             return SyncResult(False, None, current_tool, err_msg, 1, _elapsed(start))
         effective_subtitle = converted
         subtitle_was_converted = True
@@ -639,12 +1113,12 @@ def run_sync(
         )
         converted, msgs = convert_to_srt(reference, temp_dir)
         for msg in msgs:
-            callbacks._log(msg, "grey")
+            await callbacks._alog(msg, "grey")
         if not converted:
             err_msg = str(texts.CONVERSION_FAILED_FOR_FILE).format(
                 filename=os.path.basename(reference)
             )
-            callbacks._error(err_msg)
+            await callbacks._aerror(err_msg)
             return SyncResult(False, None, current_tool, err_msg, 1, _elapsed(start))
         effective_reference = converted
         if not config.get(
@@ -653,6 +1127,7 @@ def run_sync(
         ):
             converted_files_to_clean.append(converted)
 
+    clock.start("output")
     effective_config = dict(config or DEFAULT_OPTIONS)
 
     if not output:
@@ -669,7 +1144,7 @@ def run_sync(
         err_msg = str(texts.COULD_NOT_WRITE_OUTPUT_FILE).format(
             path=output, error=out_err
         )
-        callbacks._error(err_msg)
+        await callbacks._aerror(err_msg)
         for f in converted_files_to_clean:
             try:
                 if os.path.exists(f):
@@ -690,11 +1165,14 @@ def run_sync(
 
     # If ffsubsync with PGS subtitles is enabled, verify the reference contains usable PGS timings
     if current_tool == "ffsubsync" and effective_config.get("ffsubsync_use_pgs_subtitles", False):
-        callbacks._log(str(texts.CHECKING_VIDEO_FOR_PGS_SUBTITLES), "grey")
+        clock.start("pgs_probe")
+        await callbacks._alog(str(texts.CHECKING_VIDEO_FOR_PGS_SUBTITLES), "grey")
         from utils import check_pgs_subtitles_usable
-        usable, reason = check_pgs_subtitles_usable(effective_reference)
+        usable, reason = await asyncio.to_thread(
+            check_pgs_subtitles_usable, effective_reference
+        )
         if not usable:
-            callbacks._log(
+            await callbacks._alog(
                 f"PGS subtitles enabled, but reference has no usable PGS stream ({reason}). "
                 "Falling back to audio voice activity detection.",
                 "orange",
@@ -705,9 +1183,10 @@ def run_sync(
             )
             effective_config["ffsubsync_use_pgs_subtitles"] = False
         else:
-            callbacks._log(f"Using PGS subtitles as reference ({reason}).", "green")
+            await callbacks._alog(f"Using PGS subtitles as reference ({reason}).", "green")
             logger.info("Found usable PGS stream in reference: %s", reason)
 
+    clock.start("output")
     effective_output = output
     use_temp_output = False
     temp_output_path = None
@@ -727,9 +1206,33 @@ def run_sync(
             "Autosubsync overwrite avoided: using temp output '%s'", effective_output
         )
 
+    clock.start("tool_setup")
     rc = None
     try:
-        if current_tool_type == "module":
+        if current_tool_type == "native":
+            module = importlib.import_module(current_tool_info["module"])
+            logger.info(
+                f"Running {current_tool} in-process: {effective_reference} {effective_subtitle}"
+            )
+            if await callbacks._acancelled():
+                return SyncResult(
+                    False, None, current_tool, "cancelled", None, _elapsed(start), True
+                )
+            clock.start("tool")
+            stop = threading.Event()
+            try:
+                rc = await asyncio.to_thread(
+                    module.sync,
+                    effective_reference,
+                    effective_subtitle,
+                    effective_output,
+                    config=effective_config,
+                    callbacks=callbacks._for_thread(asyncio.get_running_loop(), stop),
+                )
+            finally:
+                # Lets the tool stop early if this task was cancelled
+                stop.set()
+        elif current_tool_type == "module":
             module_name = current_tool_info.get("module")
             cmd_args = build_cmd(
                 current_tool,
@@ -740,12 +1243,14 @@ def run_sync(
                 config=effective_config,
             )
             logger.info(f"Executing: {module_name} {' '.join(cmd_args)}")
-            rc = run_module_tool(
+            clock.start("tool")
+            rc = await run_module_tool_async(
                 module_name,
                 cmd_args,
                 callbacks,
                 sync_tool=current_tool,
                 process_holder=process_holder,
+                usage=usage,
             )
         else:
             exe_info = current_tool_info["executable"]
@@ -765,8 +1270,8 @@ def run_sync(
                             exe = cached_exe
                         else:
                             if callbacks:
-                                callbacks._log("Lapse executable not found. Downloading...", "grey")
-                            downloaded = lapse_download.download()
+                                await callbacks._alog("Lapse executable not found. Downloading...", "grey")
+                            downloaded = await asyncio.to_thread(lapse_download.download)
                             if downloaded and os.path.isfile(downloaded):
                                 exe = downloaded
                     except Exception as e:
@@ -775,7 +1280,7 @@ def run_sync(
                 msg = str(texts.NO_EXECUTABLE_FOUND).format(
                     tool=current_tool, os=current_os
                 )
-                callbacks._error(msg)
+                await callbacks._aerror(msg)
                 return SyncResult(
                     False, None, current_tool, msg, None, _elapsed(start)
                 )
@@ -787,33 +1292,36 @@ def run_sync(
                 effective_output,
                 config=effective_config,
             )
-            if callbacks._cancelled():
+            if await callbacks._acancelled():
                 return SyncResult(
                     False, None, current_tool, "cancelled", None, _elapsed(start), True
                 )
-            rc = run_executable_tool(
+            clock.start("tool")
+            rc = await run_executable_tool_async(
                 cmd,
                 callbacks,
                 sync_tool=current_tool,
                 process_holder=process_holder,
+                usage=usage,
             )
 
+        clock.start("postprocess")
         if current_tool == "lapse" and rc == 3:
             if os.path.exists(effective_output) and os.path.getsize(effective_output) > 0:
                 logger.info("Lapse produced output with low-confidence/unsure verdict (code 3)")
-                callbacks._log("Lapse synced subtitles with low-confidence/unsure verdict.", "orange")
+                await callbacks._alog("Lapse synced subtitles with low-confidence/unsure verdict.", "orange")
                 rc = 0
 
         # Check output file existence and non-zero size
-        if rc == 0 and not callbacks._cancelled():
+        if rc == 0 and not await callbacks._acancelled():
             if not os.path.exists(effective_output) or os.path.getsize(effective_output) == 0:
-                callbacks._error("Sync tool produced an empty or missing output file.")
+                await callbacks._aerror("Sync tool produced an empty or missing output file.")
                 rc = 1
 
-        if rc == 0 and use_temp_output and not callbacks._cancelled():
+        if rc == 0 and use_temp_output and not await callbacks._acancelled():
             try:
                 if not os.path.exists(temp_output_path):
-                    callbacks._error("Autosubsync did not produce an output file.")
+                    await callbacks._aerror("Autosubsync did not produce an output file.")
                     rc = 1
                 else:
                     logger.info(
@@ -824,12 +1332,12 @@ def run_sync(
                     os.replace(temp_output_path, output)
                     logger.info("Replacement successful")
             except Exception as e:
-                callbacks._error(f"Failed to replace original subtitle: {e}")
+                await callbacks._aerror(f"Failed to replace original subtitle: {e}")
                 logger.error("Replacement failed: %s", e)
                 rc = 1
 
         if (
-            (rc != 0 or callbacks._cancelled())
+            (rc != 0 or await callbacks._acancelled())
             and use_temp_output
             and temp_output_path
             and os.path.exists(temp_output_path)
@@ -840,17 +1348,24 @@ def run_sync(
             except Exception:
                 logger.warning("Failed to remove temp output '%s'", temp_output_path)
 
-        if callbacks._cancelled():
+        if await callbacks._acancelled():
             return SyncResult(
                 False, None, current_tool, "cancelled", rc, _elapsed(start), True
             )
         if rc != 0:
             msg = str(texts.TOOL_FAILED_WITH_CODE).format(tool=tool, code=rc)
-            callbacks._error(msg)
+            await callbacks._aerror(msg)
             return SyncResult(False, None, current_tool, msg, rc, _elapsed(start))
         return SyncResult(True, output, current_tool, "ok", rc, _elapsed(start))
+    except asyncio.CancelledError:
+        if use_temp_output and temp_output_path and os.path.exists(temp_output_path):
+            try:
+                os.remove(temp_output_path)
+            except OSError:
+                logger.warning("Failed to remove temp output '%s'", temp_output_path)
+        raise
     except Exception as e:
-        if callbacks._cancelled():
+        if await callbacks._acancelled():
             return SyncResult(
                 False, None, current_tool, "cancelled", rc, _elapsed(start), True
             )
@@ -858,7 +1373,7 @@ def run_sync(
         if tool == "alass" and "could not convert string to float" in str(e):
             if any(c in reference or c in subtitle for c in ["[", "]"]):
                 error_msg += "\n\n" + str(texts.ALASS_BRACKETS_ERROR)
-        callbacks._error(error_msg)
+        await callbacks._aerror(error_msg)
         return SyncResult(False, None, current_tool, error_msg, rc, _elapsed(start))
     finally:
         for f in converted_files_to_clean:
@@ -870,5 +1385,193 @@ def run_sync(
                 logger.warning("Failed to remove converted subtitle '%s': %s", f, e)
 
 
+def run_sync(
+    reference: str,
+    subtitle: str,
+    *,
+    tool: str,
+    output: Optional[str] = None,
+    config: dict,
+    callbacks: Optional[SyncCallbacks] = None,
+    process_holder: Optional[dict] = None,
+) -> SyncResult:
+    """Blocking run_sync_async, on an event loop of its own.
+
+    Safe to call from any thread that is not already running an event loop,
+    e.g. the GUI's worker threads or run_sync_many's pool. Raises
+    RuntimeError when called from a running event loop (a coroutine or a
+    loop callback); await run_sync_async there instead.
+    """
+    return _run_blocking(
+        run_sync_async(
+            reference,
+            subtitle,
+            tool=tool,
+            output=output,
+            config=config,
+            callbacks=callbacks,
+            process_holder=process_holder,
+        ),
+        "run_sync_async",
+    )
+
+
+def prime_reference_speech(
+    reference: str,
+    *,
+    tool: str,
+    config: dict,
+    callbacks: Optional[SyncCallbacks] = None,
+) -> bool:
+    """Decode a video reference's speech once into the speech cache.
+
+    Only applies to ffsubsync with a local video reference and the speech
+    cache enabled; later ffsubsync runs with the same options then load the
+    cached array instead of running ffmpeg and VAD again. Returns True if the
+    reference was primed.
+    """
+    callbacks = callbacks or SyncCallbacks()
+    from constants import is_remote_url
+    from speech_cache import PRIME_SPEECH_CACHE_FLAG, get_speech_cache
+
+    if tool != "ffsubsync" or is_remote_url(reference) or not os.path.isfile(reference):
+        return False
+    if os.path.splitext(reference)[1].lower() in SUBTITLE_EXTENSIONS:
+        return False
+    if config.get("ffsubsync_use_pgs_subtitles", False) or get_speech_cache() is None:
+        return False
+    tool_info = SYNC_TOOLS[tool]
+    args = [PRIME_SPEECH_CACHE_FLAG, reference] + _append_opts([], tool, config)
+    callbacks._log(f"Extracting reference speech once: {reference}", "grey")
+    logger.info(f"Executing: {tool_info['module']} {' '.join(args)}")
+    rc = run_module_tool(tool_info["module"], args, callbacks, sync_tool=tool)
+    if rc != 0 and not callbacks._cancelled():
+        logger.warning(f"Priming reference speech failed with code {rc}")
+    return rc == 0
+
+
+def reserve_output_path(
+    reference: str,
+    subtitle: str,
+    *,
+    config: dict,
+    taken: set,
+    subtitle_was_converted: bool = False,
+) -> str:
+    """determine_output_path for one of several concurrent jobs.
+
+    The name is numbered past the paths already in taken, in every save mode,
+    and the result is added to taken.
+    """
+    output = determine_output_path(
+        reference,
+        subtitle,
+        config=config,
+        subtitle_was_converted=subtitle_was_converted,
+        taken=taken,
+    )
+    base, ext = os.path.splitext(output)
+    counter = 2
+    while _path_key(output) in taken:
+        output = f"{base}_{counter}{ext}"
+        counter += 1
+    taken.add(_path_key(output))
+    return output
+
+
+def plan_output_paths(pairs, *, tool, config, outputs=None):
+    """Output paths for (reference, subtitle) pairs that are synced concurrently.
+
+    Each pair gets the path run_sync would pick for it, except that paths
+    planned for earlier pairs count as taken: run_sync only checks which files
+    exist, and a concurrent job writes its output when its tool finishes.
+    Paths given in outputs are kept.
+    """
+    tool_config = dict(config, sync_tool=tool) if tool in SYNC_TOOLS else config
+    outputs = list(outputs) if outputs is not None else [None] * len(pairs)
+    planned, taken = [], set()
+    for (reference, subtitle), output in zip(pairs, outputs):
+        if output:
+            taken.add(_path_key(output))
+        else:
+            _, tool_info, _ = get_tool_with_fallback(reference, config=tool_config)
+            supported_formats = tool_info.get("supported_formats", [])
+            sub_ext = os.path.splitext(subtitle)[1].lower()
+            output = reserve_output_path(
+                reference,
+                subtitle,
+                config=config,
+                taken=taken,
+                subtitle_was_converted=(
+                    sub_ext in SUBTITLE_EXTENSIONS and sub_ext not in supported_formats
+                ),
+            )
+        planned.append(output)
+    return planned
+
+
+def run_sync_many(
+    reference: str,
+    subtitles: Sequence[str],
+    *,
+    tool: str,
+    outputs: Optional[Sequence[Optional[str]]] = None,
+    config: dict,
+    callbacks: Optional[SyncCallbacks] = None,
+    job_callbacks: Optional[Callable[[int, str], SyncCallbacks]] = None,
+    jobs: Optional[int] = None,
+) -> List[SyncResult]:
+    """Sync several subtitles against one reference.
+
+    The reference speech is extracted once (see prime_reference_speech) and the
+    alignments then run on up to `jobs` threads, each driving its own tool
+    process. job_callbacks(index, subtitle) may supply per-subtitle callbacks;
+    otherwise `callbacks` is shared. Results are returned in input order.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    callbacks = callbacks or SyncCallbacks()
+    subtitles = list(subtitles)
+    if not subtitles:
+        return []
+    outputs = list(outputs) if outputs is not None else [None] * len(subtitles)
+    if len(outputs) != len(subtitles):
+        raise ValueError("outputs must have one entry per subtitle")
+    if tool in SYNC_TOOLS and os.path.exists(reference):
+        outputs = plan_output_paths(
+            [(reference, subtitle) for subtitle in subtitles],
+            tool=tool,
+            config=config,
+            outputs=outputs,
+        )
+    if len(subtitles) > 1 and tool in SYNC_TOOLS:
+        effective_tool, _, _ = get_tool_with_fallback(reference, config=config)
+        prime_reference_speech(
+            reference, tool=effective_tool, config=config, callbacks=callbacks
+        )
+
+    def run_one(idx):
+        subtitle = subtitles[idx]
+        job_cb = job_callbacks(idx, subtitle) if job_callbacks else callbacks
+        if job_cb.is_cancelled is None:
+            job_cb.is_cancelled = callbacks.is_cancelled
+        if job_cb._cancelled():
+            return SyncResult(False, None, tool, "cancelled", None, 0, True)
+        return run_sync(
+            reference,
+            subtitle,
+            tool=tool,
+            output=outputs[idx],
+            config=config,
+            callbacks=job_cb,
+        )
+
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(subtitles)))
+    if jobs == 1:
+        return [run_one(idx) for idx in range(len(subtitles))]
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="assy-sync") as ex:
+        return list(ex.map(run_one, range(len(subtitles))))
+
+
 def _elapsed(start: float) -> int:
     return int((time.monotonic() - start) * 1000)
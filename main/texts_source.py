@@ -0,0 +1,8533 @@
+#######################################################################################
+# All translations are made by AI. If you find any errors, feel free to contribute.   #
+# You can contribute in GitHub by forking the repository and making a pull request.   #
+# Note: There are also translations in "constants.py", so please check there as well. #
+#######################################################################################
+
+# Source of the user-facing texts. The app reads them from the per-language
+# catalogs in resources/translations, compiled with `python translations.py`;
+# see translations.py.
+
+
+############### gui.py ###############
+
+
+CHANGE_LANGUAGE_TITLE = {
+    "en_US": "Change Language",
+    "es_ES": "Cambiar idioma",
+    "tr_TR": "Dil Değiştir",
+    "zh_CN": "更改语言",
+    "zh_TW": "更改語言",
+    "ru_RU": "Изменить язык",
+    "pl_PL": "Zmień język",
+    "uk_UA": "Змінити мову",
+    "ja_JP": "言語を変更",
+    "ko_KR": "언어 변경",
+    "hi_IN": "भाषा बदलें",
+    "bn_BD": "ভাষা পরিবর্তন করুন",
+    "it_IT": "Cambia lingua",
+    "fr_FR": "Changer de langue",
+    "de_DE": "Sprache ändern",
+    "pt_PT": "Alterar idioma",
+    "ar_SA": "تغيير اللغة",
+    "vi_VN": "Đổi ngôn ngữ",
+    "fa_IR": "تغییر زبان",
+    "id_ID": "Ubah bahasa",
+    "ms_MY": "Tukar bahasa",
+    "th_TH": "เปลี่ยนภาษา",
+    "ur_PK": "زبان تبدیل کریں",
+}
+
+RESTART_APPLICATION_FOR_LANGUAGE_CHANGE = {
+    "en_US": "The application needs to restart to apply the language change. Do you want to restart now?",
+    "es_ES": "La aplicación necesita reiniciarse para aplicar el cambio de idioma. ¿Desea reiniciar ahora?",
+    "tr_TR": "Dil değişikliğini uygulamak için uygulamanın yeniden başlatılması gerekiyor. Şimdi yeniden başlatmak istiyor musunuz?",
+    "zh_CN": "应用程序需要重启以应用语言更改。您想现在重启吗？",
+    "zh_TW": "應用程式需要重新啟動以套用語言變更。您想現在重新啟動嗎？",
+    "ru_RU": "Приложение должно быть перезапущено для применения изменения языка. Хотите перезапустить сейчас?",
+    "pl_PL": "Aplikacja musi zostać uruchomiona ponownie, aby zastosować zmianę języka. Czy chcesz uruchomić ponownie teraz?",
+    "uk_UA": "Додаток потрібно перезапустити для застосування зміни мови. Хочете перезапустити зараз?",
+    "ja_JP": "言語変更を適用するにはアプリケーションの再起動が必要です。今すぐ再起動しますか？",
+    "ko_KR": "언어 변경을 적용하려면 애플리케이션을 다시 시작해야 합니다. 지금 다시 시작하시겠습니까?",
+    "hi_IN": "भाषा परिवर्तन लागू करने के लिए एप्लिकेशन को पुनः आरंभ करना होगा। क्या आप अभी पुनः आरंभ करना चाहते हैं?",
+    "bn_BD": "ভাষা পরিবর্তন প্রয়োগ করতে অ্যাপ্লিকেশনটি পুনরায় চালু করতে হবে। আপনি কি এখনই পুনরায় চালু করতে চান?",
+    "it_IT": "L'applicazione deve essere riavviata per applicare il cambio di lingua. Vuoi riavviare ora?",
+    "fr_FR": "L'application doit redémarrer pour appliquer le changement de langue. Voulez-vous redémarrer maintenant ?",
+    "de_DE": "Die Anwendung muss neu gestartet werden, um die Sprachänderung anzuwenden. Möchten Sie jetzt neu starten?",
+    "pt_PT": "A aplicação precisa ser reiniciada para aplicar a mudança de idioma. Deseja reiniciar agora?",
+    "ar_SA": "يحتاج التطبيق إلى إعادة تشغيل لتطبيق تغيير اللغة. هل تريد إعادة التشغيل الآن؟",
+    "vi_VN": "Ứng dụng cần khởi động lại để áp dụng thay đổi ngôn ngữ. Bạn có muốn khởi động lại ngay bây giờ không?",
+    "fa_IR": "برنامه باید مجدداً راه‌اندازی شود تا تغییر زبان اعمال گردد. آیا می‌خواهید اکنون مجدداً راه‌اندازی کنید؟",
+    "id_ID": "Aplikasi perlu dimulai ulang untuk menerapkan perubahan bahasa. Apakah Anda ingin memulai ulang sekarang?",
+    "ms_MY": "Aplikasi perlu dimulakan semula untuk melaksanakan perubahan bahasa. Adakah anda mahu memulakan semula sekarang?",
+    "th_TH": "แอปพลิเคชันต้องเริ่มต้นใหม่เพื่อใช้การเปลี่ยนแปลงภาษา คุณต้องการเริ่มต้นใหม่ตอนนี้หรือไม่?",
+    "ur_PK": "زبان کی تبدیلی کو لاگو کرنے کے لیے ایپلیکیشن کو دوبارہ شروع کرنا ہوگا۔ کیا آپ اب دوبارہ شروع کرنا چاہتے ہیں؟",
+}
+
+DRAG_DROP_FILE = {
+    "en_US": "Drag and drop files or folders here or click to browse.",
+    "es_ES": "Arrastra y suelta archivos o carpetas aquí o haz clic para buscar.",
+    "tr_TR": "Dosyaları veya klasörleri buraya sürükleyip bırakın veya göz atmak için tıklayın.",
+    "zh_CN": "将文件或文件夹拖放到此处或点击浏览。",
+    "zh_TW": "將檔案或資料夾拖放到此處，或點擊瀏覽。",
+    "ru_RU": "Перетащите файлы или папки сюда или нажмите для обзора.",
+    "pl_PL": "Przeciągnij i upuść pliki lub foldery tutaj lub kliknij, aby przeglądać.",
+    "uk_UA": "Перетягніть файли або папки сюди або натисніть для перегляду.",
+    "ja_JP": "ファイルまたはフォルダーをここにドラッグ＆ドロップするか、クリックして参照してください。",
+    "ko_KR": "파일이나 폴더를 여기에 드래그 앤 드롭하거나 클릭하여 찾아보세요.",
+    "hi_IN": "फ़ाइलों या फ़ोल्डरों को यहाँ ड्रैग और ड्रॉप करें या ब्राउज़ करने के लिए क्लिक करें।",
+    "bn_BD": "ফাইল বা ফোল্ডারগুলি এখানে ড্র্যাগ এবং ড্রপ করুন বা ব্রাউজ করতে ক্লিক করুন।",
+    "it_IT": "Trascina e rilascia file o cartelle qui o fai clic per sfogliare.",
+    "fr_FR": "Glissez et déposez des fichiers ou dossiers ici ou cliquez pour parcourir.",
+    "de_DE": "Dateien oder Ordner hier hineinziehen oder zum Durchsuchen klicken.",
+    "pt_PT": "Arraste e solte arquivos ou pastas aqui ou clique para navegar.",
+    "ar_SA": "اسحب وأفلت الملفات أو المجلدات هنا أو انقر للتصفح.",
+    "vi_VN": "Kéo và thả tệp hoặc thư mục vào đây hoặc nhấp để duyệt.",
+    "fa_IR": "فایل‌ها یا پوشه‌ها را اینجا بکشید و رها کنید یا برای مرور کلیک کنید.",
+    "id_ID": "Seret dan lepas file atau folder di sini atau klik untuk menelusuri.",
+    "ms_MY": "Seret dan lepas fail atau folder di sini atau klik untuk semak imbas.",
+    "th_TH": "ลากและวางไฟล์หรือโฟลเดอร์ที่นี่หรือคลิกเพื่อเรียกดู",
+    "ur_PK": "فائلوں یا فولڈرز کو یہاں ڈریگ اور ڈراپ کریں یا براؤز کرنے کے لیے کلک کریں۔",
+}
+
+GO_TO_FOLDER = {
+    "en_US": "Go to folder",
+    "es_ES": "Ir a la carpeta",
+    "tr_TR": "Klasöre git",
+    "zh_CN": "转到文件夹",
+    "zh_TW": "前往資料夾",
+    "ru_RU": "Перейти в папку",
+    "pl_PL": "Przejdź do folderu",
+    "uk_UA": "Перейти до папки",
+    "ja_JP": "フォルダーに移動",
+    "ko_KR": "폴더로 이동",
+    "hi_IN": "फ़ोल्डर पर जाएं",
+    "bn_BD": "ফোল্ডারে যান",
+    "it_IT": "Vai alla cartella",
+    "fr_FR": "Aller au dossier",
+    "de_DE": "Zum Ordner gehen",
+    "pt_PT": "Ir para pasta",
+    "ar_SA": "الذهاب إلى المجلد",
+    "vi_VN": "Đi đến thư mục",
+    "fa_IR": "رفتن به پوشه",
+    "id_ID": "Pergi ke folder",
+    "ms_MY": "Pergi ke folder",
+    "th_TH": "ไปที่โฟลเดอร์",
+    "ur_PK": "فولڈر میں جائیں",
+}
+
+SELECT_SUBTITLE_FILE_TITLE = {
+    "en_US": "Select Subtitle File",
+    "es_ES": "Seleccionar archivo de subtítulos",
+    "tr_TR": "Altyazı Dosyasını Seç",
+    "zh_CN": "选择字幕文件",
+    "zh_TW": "選擇字幕檔案",
+    "ru_RU": "Выберите файл субтитров",
+    "pl_PL": "Wybierz plik napisów",
+    "uk_UA": "Виберіть файл субтитрів",
+    "ja_JP": "字幕ファイルを選択",
+    "ko_KR": "자막 파일 선택",
+    "hi_IN": "सबटाइटल फ़ाइल चुनें",
+    "bn_BD": "সাবটাইটেল ফাইল নির্বাচন করুন",
+    "it_IT": "Seleziona file dei sottotitoli",
+    "fr_FR": "Sélectionner le fichier de sous-titres",
+    "de_DE": "Untertiteldatei auswählen",
+    "pt_PT": "Selecionar arquivo de legenda",
+    "ar_SA": "اختر ملف الترجمة",
+    "vi_VN": "Chọn tệp phụ đề",
+    "fa_IR": "انتخاب فایل زیرنویس",
+    "id_ID": "Pilih file subtitle",
+    "ms_MY": "Pilih fail sari kata",
+    "th_TH": "เลือกไฟล์คำบรรยาย",
+    "ur_PK": "سب ٹائٹل فائل منتخب کریں",
+}
+
+SELECT_VIDEO_OR_SUBTITLE_FILE_TITLE = {
+    "en_US": "Select Video or Subtitle File",
+    "es_ES": "Seleccionar archivo de vídeo o subtítulos",
+    "tr_TR": "Video veya Altyazı Dosyasını Seç",
+    "zh_CN": "选择视频或字幕文件",
+    "zh_TW": "選擇影片或字幕檔案",
+    "ru_RU": "Выберите видео или файл субтитров",
+    "pl_PL": "Wybierz plik wideo lub napisów",
+    "uk_UA": "Виберіть відео або файл субтитрів",
+    "ja_JP": "ビデオまたは字幕ファイルを選択",
+    "ko_KR": "비디오 또는 자막 파일 선택",
+    "hi_IN": "वीडियो या सबटाइटल फ़ाइल चुनें",
+    "bn_BD": "ভিডিও বা সাবটাইটেল ফাইল নির্বাচন করুন",
+    "it_IT": "Seleziona file video o sottotitoli",
+    "fr_FR": "Sélectionner un fichier vidéo ou de sous-titres",
+    "de_DE": "Video- oder Untertiteldatei auswählen",
+    "pt_PT": "Selecionar arquivo de vídeo ou legenda",
+    "ar_SA": "اختر ملف فيديو أو ترجمة",
+    "vi_VN": "Chọn tệp video hoặc phụ đề",
+    "fa_IR": "انتخاب فایل ویدیو یا زیرنویس",
+    "id_ID": "Pilih file video atau subtitle",
+    "ms_MY": "Pilih fail video atau sari kata",
+    "th_TH": "เลือกไฟล์วิดีโอหรือคำบรรยาย",
+    "ur_PK": "ویڈیو یا سب ٹائٹل فائل منتخب کریں",
+}
+
+SELECT_VIDEO_FILE_TITLE = {
+    "en_US": "Select Video File",
+    "es_ES": "Seleccionar archivo de vídeo",
+    "tr_TR": "Video Dosyasını Seç",
+    "zh_CN": "选择视频文件",
+    "zh_TW": "選擇影片檔案",
+    "ru_RU": "Выберите видеофайл",
+    "pl_PL": "Wybierz plik wideo",
+    "uk_UA": "Виберіть відеофайл",
+    "ja_JP": "ビデオファイルを選択",
+    "ko_KR": "비디오 파일 선택",
+    "hi_IN": "वीडियो फ़ाइल चुनें",
+    "bn_BD": "ভিডিও ফাইল নির্বাচন করুন",
+    "it_IT": "Seleziona file video",
+    "fr_FR": "Sélectionner le fichier vidéo",
+    "de_DE": "Videodatei auswählen",
+    "pt_PT": "Selecionar arquivo de vídeo",
+    "ar_SA": "اختر ملف فيديو",
+    "vi_VN": "Chọn tệp video",
+    "fa_IR": "انتخاب فایل ویدیو",
+    "id_ID": "Pilih file video",
+    "ms_MY": "Pilih fail video",
+    "th_TH": "เลือกไฟล์วิดีโอ",
+    "ur_PK": "ویڈیو فائل منتخب کریں",
+}
+
+SUBTITLE_FILES_LABEL = {
+    "en_US": "Subtitle Files",
+    "es_ES": "Archivos de subtítulos",
+    "tr_TR": "Altyazı Dosyaları",
+    "zh_CN": "字幕文件",
+    "zh_TW": "字幕檔案",
+    "ru_RU": "Файлы субтитров",
+    "pl_PL": "Pliki napisów",
+    "uk_UA": "Файли субтитрів",
+    "ja_JP": "字幕ファイル",
+    "ko_KR": "자막 파일",
+    "hi_IN": "सबटाइटल फ़ाइलें",
+    "bn_BD": "সাবটাইটেল ফাইল",
+    "it_IT": "File sottotitoli",
+    "fr_FR": "Fichiers de sous-titres",
+    "de_DE": "Untertiteldateien",
+    "pt_PT": "Arquivos de legenda",
+    "ar_SA": "ملفات الترجمة",
+    "vi_VN": "Tệp phụ đề",
+    "fa_IR": "فایل‌های زیرنویس",
+    "id_ID": "File subtitle",
+    "ms_MY": "Fail sari kata",
+    "th_TH": "ไฟล์คำบรรยาย",
+    "ur_PK": "سب ٹائٹل فائلیں",
+}
+
+VIDEO_OR_SUBTITLE_FILES_LABEL = {
+    "en_US": "Video/Reference Subtitle",
+    "es_ES": "Video/Subtítulo de referencia",
+    "tr_TR": "Video/Referans Altyazı",
+    "zh_CN": "视频/参考字幕",
+    "zh_TW": "影片/參考字幕",
+    "ru_RU": "Видео/Эталонные субтитры",
+    "pl_PL": "Wideo/Napisy referencyjne",
+    "uk_UA": "Відео/Еталонні субтитри",
+    "ja_JP": "ビデオ/参照字幕",
+    "ko_KR": "비디오/참조 자막",
+    "hi_IN": "वीडियो/संदर्भ सबटाइटल",
+    "bn_BD": "ভিডিও/রেফারেন্স সাবটাইটেল",
+    "it_IT": "Video/Sottotitolo di riferimento",
+    "fr_FR": "Vidéo/Sous-titre de référence",
+    "de_DE": "Video/Referenz-Untertitel",
+    "pt_PT": "Vídeo/Legenda de referência",
+    "ar_SA": "فيديو/ترجمة مرجعية",
+    "vi_VN": "Video/Phụ đề tham chiếu",
+    "fa_IR": "ویدیو/زیرنویس مرجع",
+    "id_ID": "Video/Subtitle Referensi",
+    "ms_MY": "Video/Sari Kata Rujukan",
+    "th_TH": "วิดีโอ/คำบรรยายอ้างอิง",
+    "ur_PK": "ویڈیو/ریفرنس سب ٹائٹل",
+}
+
+VIDEO_FILES_LABEL = {
+    "en_US": "Video Files",
+    "es_ES": "Archivos de vídeo",
+    "tr_TR": "Video Dosyaları",
+    "zh_CN": "视频文件",
+    "zh_TW": "影片檔案",
+    "ru_RU": "Видеофайлы",
+    "pl_PL": "Pliki wideo",
+    "uk_UA": "Відеофайли",
+    "ja_JP": "ビデオファイル",
+    "ko_KR": "비디오 파일",
+    "hi_IN": "वीडियो फ़ाइलें",
+    "bn_BD": "ভিডিও ফাইল",
+    "it_IT": "File video",
+    "fr_FR": "Fichiers vidéo",
+    "de_DE": "Videodateien",
+    "pt_PT": "Arquivos de vídeo",
+    "ar_SA": "ملفات الفيديو",
+    "vi_VN": "Tệp video",
+    "fa_IR": "فایل‌های ویدیو",
+    "id_ID": "File video",
+    "ms_MY": "Fail video",
+    "th_TH": "ไฟล์วิดีโอ",
+    "ur_PK": "ویڈیو فائلیں",
+}
+
+UNSUPPORTED_SUBTITLE_FORMAT = {
+    "en_US": "This is not a supported subtitle format.",
+    "es_ES": "Este no es un formato de subtítulo compatible.",
+    "tr_TR": "Bu desteklenen bir altyazı formatı değil.",
+    "zh_CN": "这不是受支持的字幕格式。",
+    "zh_TW": "這是不支援的字幕格式。",
+    "ru_RU": "Это неподдерживаемый формат субтитров.",
+    "pl_PL": "To nie jest obsługiwany format napisów.",
+    "uk_UA": "Це непідтримуваний формат субтитрів.",
+    "ja_JP": "これはサポートされていない字幕形式です。",
+    "ko_KR": "지원되지 않는 자막 형식입니다.",
+    "hi_IN": "यह समर्थित सबटाइटल फ़ॉर्मेट नहीं है।",
+    "bn_BD": "এটি একটি সমর্থিত সাবটাইটেল ফরম্যাট নয়।",
+    "it_IT": "Questo non è un formato di sottotitoli supportato.",
+    "fr_FR": "Ce format de sous-titres n'est pas pris en charge.",
+    "de_DE": "Dies ist kein unterstütztes Untertitelformat.",
+    "pt_PT": "Este não é um formato de legenda suportado.",
+    "ar_SA": "هذا ليس تنسيق ترجمة مدعومًا.",
+    "vi_VN": "Đây không phải là định dạng phụ đề được hỗ trợ.",
+    "fa_IR": "این یک فرمت زیرنویس پشتیبانی‌شده نیست.",
+    "id_ID": "Ini bukan format subtitle yang didukung.",
+    "ms_MY": "Ini bukan format sari kata yang disokong.",
+    "th_TH": "นี่ไม่ใช่รูปแบบคำบรรยายที่รองรับ",
+    "ur_PK": "یہ ایک معاون سب ٹائٹل فارمیٹ نہیں ہے۔",
+}
+
+UNSUPPORTED_SUBTITLE_FORMAT_WITH_EXT = {
+    "en_US": '"{ext}" is not a supported subtitle format.',
+    "es_ES": '"{ext}" no es un formato de subtítulo compatible.',
+    "tr_TR": '"{ext}" desteklenen bir altyazı formatı değil.',
+    "zh_CN": '"{ext}" 不是受支持的字幕格式。',
+    "zh_TW": '"{ext}" 是不支援的字幕格式。',
+    "ru_RU": '"{ext}" — неподдерживаемый формат субтитров.',
+    "pl_PL": '"{ext}" to nieobsługiwany format napisów.',
+    "uk_UA": '"{ext}" — це непідтримуваний формат субтитрів.',
+    "ja_JP": '"{ext}" はサポートされていない字幕形式です。',
+    "ko_KR": '"{ext}"는 지원되지 않는 자막 형식입니다.',
+    "hi_IN": '"{ext}" समर्थित सबटाइटल फ़ॉर्मेट नहीं है।',
+    "bn_BD": '"{ext}" একটি সমর্থিত সাবটাইটেল ফরম্যাট নয়।',
+    "it_IT": '"{ext}" non è un formato di sottotitoli supportato.',
+    "fr_FR": '"{ext}" n\'est pas un format de sous-titres pris en charge.',
+    "de_DE": '"{ext}" ist kein unterstütztes Untertitelformat.',
+    "pt_PT": '"{ext}" não é um formato de legenda suportado.',
+    "ar_SA": '"{ext}" ليس تنسيق ترجمة مدعومًا.',
+    "vi_VN": '"{ext}" không phải là định dạng phụ đề được hỗ trợ.',
+    "fa_IR": '"{ext}" یک فرمت زیرنویس پشتیبانی‌شده نیست.',
+    "id_ID": '"{ext}" bukan format subtitle yang didukung.',
+    "ms_MY": '"{ext}" bukan format sari kata yang disokong.',
+    "th_TH": '"{ext}" ไม่ใช่รูปแบบคำบรรยายที่รองรับ',
+    "ur_PK": '"{ext}" ایک معاون سب ٹائٹل فارمیٹ نہیں ہے۔',
+}
+
+UNSUPPORTED_VIDEO_OR_SUBTITLE_FORMAT_WITH_EXT = {
+    "en_US": '"{ext}" is not a supported video or subtitle format.',
+    "es_ES": '"{ext}" no es un formato de vídeo o subtítulo compatible.',
+    "tr_TR": '"{ext}" desteklenen bir video veya altyazı formatı değil.',
+    "zh_CN": '"{ext}" 不是受支持的视频或字幕格式。',
+    "zh_TW": '"{ext}" 是不支援的影片或字幕格式。',
+    "ru_RU": '"{ext}" — неподдерживаемый формат видео или субтитров.',
+    "pl_PL": '"{ext}" to nieobsługiwany format wideo lub napisów.',
+    "uk_UA": '"{ext}" — це непідтримуваний формат відео або субтитрів.',
+    "ja_JP": '"{ext}" はサポートされていないビデオまたは字幕形式です。',
+    "ko_KR": '"{ext}"는 지원되지 않는 비디오 또는 자막 형식입니다.',
+    "hi_IN": '"{ext}" समर्थित वीडियो या सबटाइटल फ़ॉर्मेट नहीं है।',
+    "bn_BD": '"{ext}" একটি সমর্থিত ভিডিও বা সাবটাইটেল ফরম্যাট নয়।',
+    "it_IT": '"{ext}" non è un formato video o sottotitoli supportato.',
+    "fr_FR": '"{ext}" n\'est pas un format vidéo ou de sous-titres pris en charge.',
+    "de_DE": '"{ext}" ist kein unterstütztes Video- oder Untertitelformat.',
+    "pt_PT": '"{ext}" não é um formato de vídeo ou legenda suportado.',
+    "ar_SA": '"{ext}" ليس تنسيق فيديو أو ترجمة مدعومًا.',
+    "vi_VN": '"{ext}" không phải là định dạng video hoặc phụ đề được hỗ trợ.',
+    "fa_IR": '"{ext}" یک فرمت ویدیو یا زیرنویس پشتیبانی‌شده نیست.',
+    "id_ID": '"{ext}" bukan format video atau subtitle yang didukung.',
+    "ms_MY": '"{ext}" bukan format video atau sari kata yang disokong.',
+    "th_TH": '"{ext}" ไม่ใช่รูปแบบวิดีโอหรือคำบรรยายที่รองรับ',
+    "ur_PK": '"{ext}" ایک معاون ویڈیو یا سب ٹائٹل فارمیٹ نہیں ہے۔',
+}
+
+ERROR = {
+    "en_US": "Error",
+    "es_ES": "Error",
+    "tr_TR": "Hata",
+    "zh_CN": "错误",
+    "zh_TW": "錯誤",
+    "ru_RU": "Ошибка",
+    "pl_PL": "Błąd",
+    "uk_UA": "Помилка",
+    "ja_JP": "エラー",
+    "ko_KR": "오류",
+    "hi_IN": "त्रुटि",
+    "bn_BD": "ত্রুটি",
+    "it_IT": "Errore",
+    "fr_FR": "Erreur",
+    "de_DE": "Fehler",
+    "pt_PT": "Erro",
+    "ar_SA": "خطأ",
+    "vi_VN": "Lỗi",
+    "fa_IR": "خطا",
+    "id_ID": "Kesalahan",
+    "ms_MY": "Ralat",
+    "th_TH": "ข้อผิดพลาด",
+    "ur_PK": "خرابی",
+}
+
+FILE_DOES_NOT_EXIST = {
+    "en_US": "File does not exist.",
+    "es_ES": "El archivo no existe.",
+    "tr_TR": "Dosya mevcut değil.",
+    "zh_CN": "文件不存在。",
+    "zh_TW": "檔案不存在。",
+    "ru_RU": "Файл не существует.",
+    "pl_PL": "Plik nie istnieje.",
+    "uk_UA": "Файл не існує.",
+    "ja_JP": "ファイルが存在しません。",
+    "ko_KR": "파일이 존재하지 않습니다.",
+    "hi_IN": "फ़ाइल मौजूद नहीं है।",
+    "bn_BD": "ফাইল বিদ্যমান নেই।",
+    "it_IT": "Il file non esiste.",
+    "fr_FR": "Le fichier n'existe pas.",
+    "de_DE": "Die Datei existiert nicht.",
+    "pt_PT": "O arquivo não existe.",
+    "ar_SA": "الملف غير موجود.",
+    "vi_VN": "Tệp không tồn tại.",
+    "fa_IR": "فایل وجود ندارد.",
+    "id_ID": "File tidak ada.",
+    "ms_MY": "Fail tidak wujud.",
+    "th_TH": "ไฟล์ไม่มีอยู่",
+    "ur_PK": "فائل موجود نہیں ہے۔",
+}
+
+SETTINGS = {
+    "en_US": "Settings",
+    "es_ES": "Configuraciones",
+    "tr_TR": "Ayarlar",
+    "zh_CN": "设置",
+    "zh_TW": "設定",
+    "ru_RU": "Настройки",
+    "pl_PL": "Ustawienia",
+    "uk_UA": "Налаштування",
+    "ja_JP": "設定",
+    "ko_KR": "설정",
+    "hi_IN": "सेटिंग्स",
+    "bn_BD": "সেটিংস",
+    "it_IT": "Impostazioni",
+    "fr_FR": "Paramètres",
+    "de_DE": "Einstellungen",
+    "pt_PT": "Configurações",
+    "ar_SA": "الإعدادات",
+    "vi_VN": "Cài đặt",
+    "fa_IR": "تنظیمات",
+    "id_ID": "Pengaturan",
+    "ms_MY": "Tetapan",
+    "th_TH": "การตั้งค่า",
+    "ur_PK": "ترتیبات",
+}
+
+LANGUAGE = {
+    "en_US": "Language",
+    "es_ES": "Idioma",
+    "tr_TR": "Dil",
+    "zh_CN": "语言",
+    "zh_TW": "語言",
+    "ru_RU": "Язык",
+    "pl_PL": "Język",
+    "uk_UA": "Мова",
+    "ja_JP": "言語",
+    "ko_KR": "언어",
+    "hi_IN": "भाषा",
+    "bn_BD": "ভাষা",
+    "it_IT": "Lingua",
+    "fr_FR": "Langue",
+    "de_DE": "Sprache",
+    "pt_PT": "Idioma",
+    "ar_SA": "اللغة",
+    "vi_VN": "Ngôn ngữ",
+    "fa_IR": "زبان",
+    "id_ID": "Bahasa",
+    "ms_MY": "Bahasa",
+    "th_TH": "ภาษา",
+    "ur_PK": "زبان",
+}
+
+THEME = {
+    "en_US": "Theme",
+    "es_ES": "Tema",
+    "tr_TR": "Tema",
+    "zh_CN": "主题",
+    "zh_TW": "主題",
+    "ru_RU": "Тема",
+    "pl_PL": "Motyw",
+    "uk_UA": "Тема",
+    "ja_JP": "テーマ",
+    "ko_KR": "테마",
+    "hi_IN": "थीम",
+    "bn_BD": "থিম",
+    "it_IT": "Tema",
+    "fr_FR": "Thème",
+    "de_DE": "Thema",
+    "pt_PT": "Tema",
+    "ar_SA": "المظهر",
+    "vi_VN": "Giao diện",
+    "fa_IR": "تم",
+    "id_ID": "Tema",
+    "ms_MY": "Tema",
+    "th_TH": "ธีม",
+    "ur_PK": "تھیم",
+}
+
+SYSTEM = {
+    "en_US": "System",
+    "es_ES": "Sistema",
+    "tr_TR": "Sistem",
+    "zh_CN": "系统",
+    "zh_TW": "系統",
+    "ru_RU": "Система",
+    "pl_PL": "System",
+    "uk_UA": "Система",
+    "ja_JP": "システム",
+    "ko_KR": "시스템",
+    "hi_IN": "सिस्टम",
+    "bn_BD": "সিস্টেম",
+    "it_IT": "Sistema",
+    "fr_FR": "Système",
+    "de_DE": "System",
+    "pt_PT": "Sistema",
+    "ar_SA": "النظام",
+    "vi_VN": "Hệ thống",
+    "fa_IR": "سیستم",
+    "id_ID": "Sistem",
+    "ms_MY": "Sistem",
+    "th_TH": "ระบบ",
+    "ur_PK": "سسٹم",
+}
+
+DARK = {
+    "en_US": "Dark",
+    "es_ES": "Oscuro",
+    "tr_TR": "Koyu",
+    "zh_CN": "深色",
+    "zh_TW": "深色",
+    "ru_RU": "Темный",
+    "pl_PL": "Ciemny",
+    "uk_UA": "Темний",
+    "ja_JP": "ダーク",
+    "ko_KR": "어두운",
+    "hi_IN": "डार्क",
+    "bn_BD": "ডার্ক",
+    "it_IT": "Scuro",
+    "fr_FR": "Sombre",
+    "de_DE": "Dunkel",
+    "pt_PT": "Escuro",
+    "ar_SA": "داكن",
+    "vi_VN": "Tối",
+    "fa_IR": "تیره",
+    "id_ID": "Gelap",
+    "ms_MY": "Gelap",
+    "th_TH": "มืด",
+    "ur_PK": "گہرا",
+}
+
+LIGHT = {
+    "en_US": "Light",
+    "es_ES": "Claro",
+    "tr_TR": "Açık",
+    "zh_CN": "浅色",
+    "zh_TW": "淺色",
+    "ru_RU": "Светлый",
+    "pl_PL": "Jasny",
+    "uk_UA": "Світлий",
+    "ja_JP": "ライト",
+    "ko_KR": "밝은",
+    "hi_IN": "लाइट",
+    "bn_BD": "লাইট",
+    "it_IT": "Chiaro",
+    "fr_FR": "Clair",
+    "de_DE": "Hell",
+    "pt_PT": "Claro",
+    "ar_SA": "فاتح",
+    "vi_VN": "Sáng",
+    "fa_IR": "روشن",
+    "id_ID": "Cerah",
+    "ms_MY": "Cerah",
+    "th_TH": "สว่าง",
+    "ur_PK": "ہلکا",
+}
+
+CHANGE_OUTPUT_SUBTITLE_ENCODING = {
+    "en_US": "Change output subtitle encoding",
+    "es_ES": "Cambiar la codificación de subtítulos de salida",
+    "tr_TR": "Çıktı altyazı kodlamasını değiştir",
+    "zh_CN": "更改输出字幕编码",
+    "zh_TW": "更改輸出字幕編碼",
+    "ru_RU": "Изменить кодировку выходных субтитров",
+    "pl_PL": "Zmień kodowanie wyjściowych napisów",
+    "uk_UA": "Змінити кодування вихідних субтитрів",
+    "ja_JP": "出力字幕のエンコーディングを変更",
+    "ko_KR": "출력 자막 인코딩 변경",
+    "hi_IN": "आउटपुट सबटाइटल एन्कोडिंग बदलें",
+    "bn_BD": "আউটপুট সাবটাইটেল এনকোডিং পরিবর্তন করুন",
+    "it_IT": "Cambia la codifica dei sottotitoli di output",
+    "fr_FR": "Changer l'encodage des sous-titres de sortie",
+    "de_DE": "Ausgabe-Untertitel-Kodierung ändern",
+    "pt_PT": "Alterar a codificação dos subtítulos de saída",
+    "ar_SA": "تغيير ترميز الترجمة الناتجة",
+    "vi_VN": "Thay đổi mã hóa phụ đề đầu ra",
+    "fa_IR": "تغییر کدگذاری زیرنویس خروجی",
+    "id_ID": "Ubah pengkodean subtitle keluaran",
+    "ms_MY": "Tukar pengekodan sari kata output",
+    "th_TH": "เปลี่ยนการเข้ารหัสคำบรรยายผลลัพธ์",
+    "ur_PK": "آؤٹ پٹ سب ٹائٹل انکوڈنگ تبدیل کریں",
+}
+
+ENABLED = {
+    "en_US": "Enabled",
+    "es_ES": "Habilitado",
+    "tr_TR": "Etkin",
+    "zh_CN": "已启用",
+    "zh_TW": "已啟用",
+    "ru_RU": "Включено",
+    "pl_PL": "Włączone",
+    "uk_UA": "Увімкнено",
+    "ja_JP": "有効",
+    "ko_KR": "활성화됨",
+    "hi_IN": "सक्रिय",
+    "bn_BD": "সক্রিয়",
+    "it_IT": "Abilitato",
+    "fr_FR": "Activé",
+    "de_DE": "Aktiviert",
+    "pt_PT": "Ativado",
+    "ar_SA": "مفعل",
+    "vi_VN": "Đã bật",
+    "fa_IR": "فعال",
+    "id_ID": "Diaktifkan",
+    "ms_MY": "Diaktifkan",
+    "th_TH": "เปิดใช้งานแล้ว",
+    "ur_PK": "فعال",
+}
+
+DISABLED = {
+    "en_US": "Disabled",
+    "es_ES": "Deshabilitado",
+    "tr_TR": "Devre Dışı",
+    "zh_CN": "已禁用",
+    "zh_TW": "已停用",
+    "ru_RU": "Отключено",
+    "pl_PL": "Wyłączone",
+    "uk_UA": "Вимкнено",
+    "ja_JP": "無効",
+    "ko_KR": "비활성화됨",
+    "hi_IN": "अक्षम",
+    "bn_BD": "অক্ষম",
+    "it_IT": "Disabilitato",
+    "fr_FR": "Désactivé",
+    "de_DE": "Deaktiviert",
+    "pt_PT": "Desativado",
+    "ar_SA": "معطل",
+    "vi_VN": "Đã tắt",
+    "fa_IR": "غیرفعال شده است",
+    "id_ID": "Dinonaktifkan",
+    "ms_MY": "Dilumpuhkan",
+    "th_TH": "ปิดใช้งานแล้ว",
+    "ur_PK": "غیر فعال",
+}
+
+SAME_AS_INPUT_SUBTITLE = {
+    "en_US": "Same as input subtitle",
+    "es_ES": "Igual que el subtítulo de entrada",
+    "tr_TR": "Girdi altyazı ile aynı",
+    "zh_CN": "与输入字幕相同",
+    "zh_TW": "與輸入字幕相同",
+    "ru_RU": "То же, что и входные субтитры",
+    "pl_PL": "Taki sam jak napisy wejściowe",
+    "uk_UA": "Такий самий, як вхідні субтитри",
+    "ja_JP": "入力字幕と同じ",
+    "ko_KR": "입력 자막과 동일",
+    "hi_IN": "इनपुट सबटाइटल के समान",
+    "bn_BD": "ইনপুট সাবটাইটেলের মতোই",
+    "it_IT": "Uguale ai sottotitoli di input",
+    "fr_FR": "Identique au sous-titre d'entrée",
+    "de_DE": "Gleich wie Eingabeuntertitel",
+    "pt_PT": "Igual ao subtítulo de entrada",
+    "ar_SA": "نفس الترجمة المدخلة",
+    "vi_VN": "Giống như phụ đề đầu vào",
+    "fa_IR": "همانند زیرنویس ورودی",
+    "id_ID": "Sama seperti subtitle input",
+    "ms_MY": "Sama seperti sari kata input",
+    "th_TH": "เหมือนกับคำบรรยายที่ป้อนเข้า",
+    "ur_PK": "ان پٹ سب ٹائٹل جیسا ہی",
+}
+
+BACKUP_SUBTITLES_BEFORE_OVERWRITING = {
+    "en_US": "Backup subtitles before overwriting",
+    "es_ES": "Hacer copia de seguridad de los subtítulos antes de sobrescribir",
+    "tr_TR": "Üzerine yazmadan önce altyazıları yedekle",
+    "zh_CN": "覆盖前备份字幕",
+    "zh_TW": "覆寫前備份字幕",
+    "ru_RU": "Создать резервную копию субтитров перед перезаписью",
+    "pl_PL": "Utwórz kopię zapasową napisów przed nadpisaniem",
+    "uk_UA": "Створити резервну копію субтитрів перед перезаписом",
+    "ja_JP": "上書き前に字幕をバックアップ",
+    "ko_KR": "덮어쓰기 전에 자막 백업",
+    "hi_IN": "ओवरराइट करने से पहले सबटाइटल का बैकअप लें",
+    "bn_BD": "ওভাররাইট করার আগে সাবটাইটেল ব্যাকআপ করুন",
+    "it_IT": "Esegui il backup dei sottotitoli prima di sovrascrivere",
+    "fr_FR": "Sauvegarder les sous-titres avant d'écraser",
+    "de_DE": "Untertitel vor dem Überschreiben sichern",
+    "pt_PT": "Fazer backup das legendas antes de sobrescrever",
+    "ar_SA": "نسخ احتياطي للترجمات قبل الكتابة فوقها",
+    "vi_VN": "Sao lưu phụ đề trước khi ghi đè",
+    "fa_IR": "پشتیبان‌گیری از زیرنویس‌ها قبل از بازنویسی",
+    "id_ID": "Cadangkan subtitle sebelum menimpa",
+    "ms_MY": "Sandarkan sari kata sebelum menimpa",
+    "th_TH": "สำรองคำบรรยายก่อนเขียนทับ",
+    "ur_PK": "اووررائٹ کرنے سے پہلے سب ٹائٹلز کا بیک اپ لیں",
+}
+
+KEEP_EXTRACTED_SUBTITLES = {
+    "en_US": "Keep extracted subtitles",
+    "es_ES": "Mantener subtítulos extraídos",
+    "tr_TR": "Çıkarılan altyazıları sakla",
+    "zh_CN": "保留提取的字幕",
+    "zh_TW": "保留提取的字幕",
+    "ru_RU": "Сохранить извлеченные субтитры",
+    "pl_PL": "Zachowaj wyodrębnione napisy",
+    "uk_UA": "Зберегти витягнуті субтитри",
+    "ja_JP": "抽出された字幕を保持",
+    "ko_KR": "추출된 자막 유지",
+    "hi_IN": "निकाले गए सबटाइटल रखें",
+    "bn_BD": "নিষ্কাশিত সাবটাইটেল রাখুন",
+    "it_IT": "Mantieni sottotitoli estratti",
+    "fr_FR": "Conserver les sous-titres extraits",
+    "de_DE": "Extrahierte Untertitel behalten",
+    "pt_PT": "Manter legendas extraídas",
+    "ar_SA": "احتفظ بالترجمات المستخرجة",
+    "vi_VN": "Giữ phụ đề đã trích xuất",
+    "fa_IR": "حفظ زیرنویس‌های استخراج‌شده",
+    "id_ID": "Simpan subtitle yang diekstrak",
+    "ms_MY": "Simpan sari kata yang diekstrak",
+    "th_TH": "เก็บคำบรรยายที่แยกออกมา",
+    "ur_PK": "نکالے گئے سب ٹائٹلز محفوظ رکھیں",
+}
+
+KEEP_CONVERTED_SUBTITLES = {
+    "en_US": "Keep converted subtitles",
+    "es_ES": "Mantener subtítulos convertidos",
+    "tr_TR": "Dönüştürülen altyazıları sakla",
+    "zh_CN": "保留转换的字幕",
+    "zh_TW": "保留轉換的字幕",
+    "ru_RU": "Сохранить конвертированные субтитры",
+    "pl_PL": "Zachowaj konwertowane napisy",
+    "uk_UA": "Зберегти конвертовані субтитри",
+    "ja_JP": "変換された字幕を保持",
+    "ko_KR": "변환된 자막 유지",
+    "hi_IN": "परिवर्तित सबटाइटल रखें",
+    "bn_BD": "রূপান্তরিত সাবটাইটেল রাখুন",
+    "it_IT": "Mantieni sottotitoli convertiti",
+    "fr_FR": "Conserver les sous-titres convertis",
+    "de_DE": "Konvertierte Untertitel behalten",
+    "pt_PT": "Manter legendas convertidas",
+    "ar_SA": "احتفظ بالترجمات المحولة",
+    "vi_VN": "Giữ phụ đề đã chuyển đổi",
+    "fa_IR": "حفظ زیرنویس‌های تبدیل‌شده",
+    "id_ID": "Simpan subtitle yang dikonversi",
+    "ms_MY": "Simpan sari kata yang ditukar",
+    "th_TH": "เก็บคำบรรยายที่แปลงแล้ว",
+    "ur_PK": "تبدیل شدہ سب ٹائٹلز محفوظ رکھیں",
+}
+
+ADD_TOOL_PREFIX_TO_SUBTITLES = {
+    "en_US": 'Add "tool_" prefix to subtitles',
+    "es_ES": 'Agregar prefijo "tool_" a los subtítulos',
+    "tr_TR": 'Altyazılara "tool_" öneki ekle',
+    "zh_CN": '为字幕添加 "tool_" 前缀',
+    "zh_TW": '為字幕添加 "tool_" 前綴',
+    "ru_RU": 'Добавить префикс "tool_" к субтитрам',
+    "pl_PL": 'Dodaj prefiks "tool_" do napisów',
+    "uk_UA": 'Додати префікс "tool_" до субтитрів',
+    "ja_JP": '字幕に "tool_" プレフィックスを追加',
+    "ko_KR": '자막에 "tool_" 접두사 추가',
+    "hi_IN": 'सबटाइटल में "tool_" उपसर्ग जोड़ें',
+    "bn_BD": 'সাবটাইটেলে "tool_" উপসর্গ যোগ করুন',
+    "it_IT": 'Aggiungi prefisso "tool_" ai sottotitoli',
+    "fr_FR": 'Ajouter le préfixe "tool_" aux sous-titres',
+    "de_DE": 'Präfix "tool_" zu Untertiteln hinzufügen',
+    "pt_PT": 'Adicionar prefixo "tool_" às legendas',
+    "ar_SA": 'إضافة بادئة "tool_" للترجمات',
+    "vi_VN": 'Thêm tiền tố "tool_" vào phụ đề',
+    "fa_IR": 'اضافه کردن پیشوند "tool_" به زیرنویس‌ها',
+    "id_ID": 'Tambahkan awalan "tool_" ke subtitle',
+    "ms_MY": 'Tambah awalan "tool_" pada sari kata',
+    "th_TH": 'เพิ่มคำนำหน้า "tool_" ให้กับคำบรรยาย',
+    "ur_PK": 'سب ٹائٹلز میں "tool_" پریفکس شامل کریں',
+}
+
+ADD_CUSTOM_SUFFIX_FOR_SUBTITLES = {
+    "en_US": 'Add custom suffix for subtitles',
+    "es_ES": 'Agregar sufijo personalizado a los subtítulos',
+    "tr_TR": 'Altyazılara özel sonek ekle',
+    "zh_CN": '为字幕添加自定义后缀',
+    "zh_TW": '為字幕添加自定義後綴',
+    "ru_RU": 'Добавить пользовательский суффикс к субтитрам',
+    "pl_PL": 'Dodaj niestandardowy sufiks do napisów',
+    "uk_UA": 'Додати власний суфікс до субтитрів',
+    "ja_JP": '字幕にカスタムサフィックスを追加する',
+    "ko_KR": '자막에 사용자 정의 접미사 추가',
+    "hi_IN": 'उपशीर्षक के लिए कस्टम प्रत्यय जोड़ें',
+    "bn_BD": 'সাবটাইটেলের জন্য কাস্টম সাফিক্স যোগ করুন',
+    "it_IT": 'Aggiungi suffisso personalizzato ai sottotitoli',
+    "fr_FR": 'Ajouter un suffixe personnalisé aux sous-titres',
+    "de_DE": 'Benutzerdefiniertes Suffix zu Untertiteln hinzufügen',
+    "pt_PT": 'Adicionar sufixo personalizado às legendas',
+    "ar_SA": 'إضافة لاحقة مخصصة للترجمات',
+    "vi_VN": 'Thêm hậu tố tùy chỉnh cho phụ đề',
+    "fa_IR": 'افزودن پسوند سفارشی به زیرنویس‌ها',
+    "id_ID": 'Tambahkan akhiran kustom ke subtitle',
+    "ms_MY": 'Tambah akhiran tersuai ke sari kata',
+    "th_TH": 'เพิ่มคำต่อท้ายแบบกำหนดเองสำหรับคำบรรยาย',
+    "ur_PK": 'سب ٹائٹلز کے لیے حسب ضرورت لاحقہ شامل کریں',
+}
+
+ENTER_CUSTOM_SUFFIX = {
+    "en_US": "Enter custom suffix:",
+    "es_ES": "Ingrese el sufijo personalizado:",
+    "tr_TR": "Özel soneki girin:",
+    "zh_CN": "输入自定义后缀：",
+    "zh_TW": "輸入自定義後綴：",
+    "ru_RU": "Введите пользовательский суффикс:",
+    "pl_PL": "Wprowadź niestandardowy sufiks:",
+    "uk_UA": "Введіть власний суфікс:",
+    "ja_JP": "カスタムサフィックスを入力してください：",
+    "ko_KR": "사용자 정의 접미사 입력:",
+    "hi_IN": "कस्टम प्रत्यय दर्ज करें:",
+    "bn_BD": "কাস্টম সাফিক্স লিখুন:",
+    "it_IT": "Inserisci il suffisso personalizzato:",
+    "fr_FR": "Entrez le suffixe personnalisé :",
+    "de_DE": "Benutzerdefiniertes Suffix eingeben:",
+    "pt_PT": "Insira o sufixo personalizado:",
+    "ar_SA": "أدخل اللاحقة المخصصة:",
+    "vi_VN": "Nhập hậu tố tùy chỉnh:",
+    "fa_IR": "پسوند سفارشی را وارد کنید:",
+    "id_ID": "Masukkan akhiran kustom:",
+    "ms_MY": "Masukkan akhiran tersuai:",
+    "th_TH": "ใส่คำต่อท้ายที่ระบุเอง:",
+    "ur_PK": "حسب ضرورت لاحقہ درج کریں:",
+}
+
+BATCH_CONCURRENT_JOBS = {
+    "en_US": "Concurrent batch jobs",
+    "es_ES": "Trabajos simultáneos en lote",
+    "tr_TR": "Eşzamanlı toplu işler",
+    "zh_CN": "批量并发任务数",
+    "zh_TW": "批次並行任務數",
+    "ru_RU": "Параллельные пакетные задания",
+    "pl_PL": "Równoczesne zadania wsadowe",
+    "uk_UA": "Паралельні пакетні завдання",
+    "ja_JP": "バッチの同時実行ジョブ数",
+    "ko_KR": "동시 일괄 작업 수",
+    "hi_IN": "समवर्ती बैच कार्य",
+    "bn_BD": "একযোগে ব্যাচ কাজ",
+    "it_IT": "Processi batch simultanei",
+    "fr_FR": "Tâches par lot simultanées",
+    "de_DE": "Gleichzeitige Stapelaufträge",
+    "pt_PT": "Tarefas em lote simultâneas",
+    "ar_SA": "المهام المتزامنة في الدفعة",
+    "vi_VN": "Số tác vụ hàng loạt đồng thời",
+    "fa_IR": "کارهای دسته‌ای هم‌زمان",
+    "id_ID": "Pekerjaan batch bersamaan",
+    "ms_MY": "Kerja kelompok serentak",
+    "th_TH": "งานแบบกลุ่มที่ทำพร้อมกัน",
+    "ur_PK": "بیک وقت بیچ کام",
+}
+
+ENTER_BATCH_CONCURRENT_JOBS = {
+    "en_US": "Number of pairs to sync at the same time:",
+    "es_ES": "Número de pares a sincronizar al mismo tiempo:",
+    "tr_TR": "Aynı anda senkronize edilecek eş sayısı:",
+    "zh_CN": "同时同步的配对数量：",
+    "zh_TW": "同時同步的配對數量：",
+    "ru_RU": "Количество пар для одновременной синхронизации:",
+    "pl_PL": "Liczba par synchronizowanych jednocześnie:",
+    "uk_UA": "Кількість пар для одночасної синхронізації:",
+    "ja_JP": "同時に同期するペアの数：",
+    "ko_KR": "동시에 동기화할 쌍의 수:",
+    "hi_IN": "एक साथ सिंक की जाने वाली जोड़ियों की संख्या:",
+    "bn_BD": "একসাথে সিঙ্ক করার জোড়ার সংখ্যা:",
+    "it_IT": "Numero di coppie da sincronizzare contemporaneamente:",
+    "fr_FR": "Nombre de paires à synchroniser simultanément :",
+    "de_DE": "Anzahl gleichzeitig zu synchronisierender Paare:",
+    "pt_PT": "Número de pares a sincronizar ao mesmo tempo:",
+    "ar_SA": "عدد الأزواج المراد مزامنتها في نفس الوقت:",
+    "vi_VN": "Số cặp đồng bộ cùng lúc:",
+    "fa_IR": "تعداد جفت‌هایی که هم‌زمان همگام‌سازی می‌شوند:",
+    "id_ID": "Jumlah pasangan yang disinkronkan bersamaan:",
+    "ms_MY": "Bilangan pasangan untuk disegerakkan serentak:",
+    "th_TH": "จำนวนคู่ที่จะซิงค์พร้อมกัน:",
+    "ur_PK": "ایک ساتھ ہم آہنگ کیے جانے والے جوڑوں کی تعداد:",
+}
+
+OPEN_CONFIG_FILE_DIRECTORY = {
+    "en_US": "Open config file directory",
+    "es_ES": "Abrir directorio del archivo de configuración",
+    "tr_TR": "Ayarlar dosyası dizinini aç",
+    "zh_CN": "打开配置文件所在目录",
+    "zh_TW": "開啟設定檔目錄",
+    "ru_RU": "Открыть папку с файлом конфигурации",
+    "pl_PL": "Otwórz katalog pliku konfiguracyjnego",
+    "uk_UA": "Відкрити папку файлу конфігурації",
+    "ja_JP": "構成ファイルのディレクトリを開く",
+    "ko_KR": "설정 파일 디렉토리 열기",
+    "hi_IN": "कॉन्फ़िग फ़ाइल डायरेक्टरी खोलें",
+    "bn_BD": "কনফিগ ফাইলের ডিরেক্টরি খুলুন",
+    "it_IT": "Apri la directory del file di configurazione",
+    "fr_FR": "Ouvrir le répertoire du fichier de configuration",
+    "de_DE": "Konfigurationsdatei-Verzeichnis öffnen",
+    "pt_PT": "Abrir diretório do arquivo de configuração",
+    "ar_SA": "فتح دليل ملف الإعدادات",
+    "vi_VN": "Mở thư mục file cấu hình",
+    "fa_IR": "باز کردن پوشه فایل تنظیمات",
+    "id_ID": "Buka direktori file konfigurasi",
+    "ms_MY": "Buka direktori fail konfigurasi",
+    "th_TH": "เปิดไดเรกทอรีไฟล์การตั้งค่า",
+    "ur_PK": "کنفیگ فائل کی ڈائرکٹری کھولیں",
+}
+
+OPEN_LOGS_DIRECTORY = {
+    "en_US": "Open logs directory",
+    "es_ES": "Abrir directorio de registros",
+    "tr_TR": "Günlük kayıtları dizinini aç",
+    "zh_CN": "打开日志目录",
+    "zh_TW": "開啟日誌目錄",
+    "ru_RU": "Открыть папку логов",
+    "pl_PL": "Otwórz katalog logów",
+    "uk_UA": "Відкрити папку логів",
+    "ja_JP": "ログディレクトリを開く",
+    "ko_KR": "로그 디렉토리 열기",
+    "hi_IN": "लॉग डायरेक्टरी खोलें",
+    "bn_BD": "লগ ডিরেক্টরি খুলুন",
+    "it_IT": "Apri directory dei log",
+    "fr_FR": "Ouvrir le répertoire des journaux",
+    "de_DE": "Log-Verzeichnis öffnen",
+    "pt_PT": "Abrir diretório de logs",
+    "ar_SA": "فتح دليل السجلات",
+    "vi_VN": "Mở thư mục nhật ký",
+    "fa_IR": "باز کردن پوشه گزارش‌ها",
+    "id_ID": "Buka direktori log",
+    "ms_MY": "Buka direktori log",
+    "th_TH": "เปิดไดเรกทอรีบันทึก",
+    "ur_PK": "لاگ ڈائرکٹری کھولیں",
+}
+
+KEEP_LOG_RECORDS = {
+    "en_US": "Keep log records",
+    "es_ES": "Mantener registros de logs",
+    "tr_TR": "Günlük kayıtlarını sakla",
+    "zh_CN": "保留日志记录",
+    "zh_TW": "保留日誌記錄",
+    "ru_RU": "Сохранять журналы",
+    "pl_PL": "Zachowaj zapisy logów",
+    "uk_UA": "Зберігати записи журналів",
+    "ja_JP": "ログ記録を保持",
+    "ko_KR": "로그 기록 유지",
+    "hi_IN": "लॉग रिकॉर्ड रखें",
+    "bn_BD": "লগ রেকর্ড রাখুন",
+    "it_IT": "Mantieni i record dei log",
+    "fr_FR": "Conserver les enregistrements de journaux",
+    "de_DE": "Log-Aufzeichnungen behalten",
+    "pt_PT": "Manter registros de log",
+    "ar_SA": "الاحتفاظ بسجلات التسجيل",
+    "vi_VN": "Giữ bản ghi nhật ký",
+    "fa_IR": "حفظ رکوردهای گزارش",
+    "id_ID": "Simpan catatan log",
+    "ms_MY": "Simpan rekod log",
+    "th_TH": "เก็บบันทึกล็อก",
+    "ur_PK": "لاگ ریکارڈز محفوظ رکھیں",
+}
+
+CLEAR_ALL_LOGS = {
+    "en_US": "Clear all logs",
+    "es_ES": "Borrar todos los registros",
+    "tr_TR": "Tüm günlük kayıtlarını temizle",
+    "zh_CN": "清除所有日志",
+    "zh_TW": "清除所有日誌",
+    "ru_RU": "Очистить все логи",
+    "pl_PL": "Wyczyść wszystkie logi",
+    "uk_UA": "Очистити всі логи",
+    "ja_JP": "すべてのログをクリア",
+    "ko_KR": "모든 로그 지우기",
+    "hi_IN": "सभी लॉग साफ़ करें",
+    "bn_BD": "সব লগ সাফ করুন",
+    "it_IT": "Cancella tutti i log",
+    "fr_FR": "Effacer tous les journaux",
+    "de_DE": "Alle Logs löschen",
+    "pt_PT": "Limpar todos os logs",
+    "ar_SA": "مسح جميع السجلات",
+    "vi_VN": "Xóa tất cả nhật ký",
+    "fa_IR": "پاک کردن همه گزارش‌ها",
+    "id_ID": "Hapus semua log",
+    "ms_MY": "Kosongkan semua log",
+    "th_TH": "ล้างบันทึกทั้งหมด",
+    "ur_PK": "تمام لاگز صاف کریں",
+}
+
+REMEMBER_THE_CHANGES = {
+    "en_US": "Remember the changes",
+    "es_ES": "Recordar los cambios",
+    "tr_TR": "Değişiklikleri hatırla",
+    "zh_CN": "记住更改",
+    "zh_TW": "記住變更",
+    "ru_RU": "Запомнить изменения",
+    "pl_PL": "Zapamiętaj zmiany",
+    "uk_UA": "Запам'ятати зміни",
+    "ja_JP": "変更を記憶",
+    "ko_KR": "변경 사항 기억",
+    "hi_IN": "परिवर्तन याद रखें",
+    "bn_BD": "পরিবর্তনগুলি মনে রাখুন",
+    "it_IT": "Ricorda le modifiche",
+    "fr_FR": "Se souvenir des modifications",
+    "de_DE": "Änderungen merken",
+    "pt_PT": "Lembrar das alterações",
+    "ar_SA": "تذكر التغييرات",
+    "vi_VN": "Ghi nhớ các thay đổi",
+    "fa_IR": "به خاطر سپردن تغییرات",
+    "id_ID": "Ingat perubahan",
+    "ms_MY": "Ingat perubahan",
+    "th_TH": "จดจำการเปลี่ยนแปลง",
+    "ur_PK": "تبدیلیاں یاد رکھیں",
+}
+
+CHECK_FOR_UPDATES_AT_STARTUP = {
+    "en_US": "Check for updates at startup",
+    "es_ES": "Buscar actualizaciones al iniciar",
+    "tr_TR": "Başlangıçta güncellemeleri kontrol et",
+    "zh_CN": "启动时检查更新",
+    "zh_TW": "啟動時檢查更新",
+    "ru_RU": "Проверять обновления при запуске",
+    "pl_PL": "Sprawdzaj aktualizacje przy uruchomieniu",
+    "uk_UA": "Перевіряти оновлення при запуску",
+    "ja_JP": "起動時に更新を確認",
+    "ko_KR": "시작 시 업데이트 확인",
+    "hi_IN": "स्टार्टअप पर अपडेट की जांच करें",
+    "bn_BD": "স্টার্টআপে আপডেট চেক করুন",
+    "it_IT": "Controlla aggiornamenti all'avvio",
+    "fr_FR": "Vérifier les mises à jour au démarrage",
+    "de_DE": "Beim Start nach Updates suchen",
+    "pt_PT": "Verificar atualizações na inicialização",
+    "ar_SA": "فحص التحديثات عند البدء",
+    "vi_VN": "Kiểm tra cập nhật khi khởi động",
+    "fa_IR": "بررسی به‌روزرسانی در هنگام راه‌اندازی",
+    "id_ID": "Periksa pembaruan saat startup",
+    "ms_MY": "Semak kemas kini semasa permulaan",
+    "th_TH": "ตรวจสอบการอัปเดตเมื่อเริ่มต้น",
+    "ur_PK": "سٹارٹ اپ پر اپڈیٹس چیک کریں",
+}
+
+RESET_TO_DEFAULT_SETTINGS = {
+    "en_US": "Reset to default settings",
+    "es_ES": "Restablecer configuración por defecto",
+    "tr_TR": "Varsayılan ayarlara sıfırla",
+    "zh_CN": "重置为默认设置",
+    "zh_TW": "重置為預設設定",
+    "ru_RU": "Сбросить к настройкам по умолчанию",
+    "pl_PL": "Przywróć ustawienia domyślne",
+    "uk_UA": "Скинути до налаштувань за замовчуванням",
+    "ja_JP": "デフォルト設定にリセット",
+    "ko_KR": "기본 설정으로 재설정",
+    "hi_IN": "डिफ़ॉल्ट सेटिंग्स पर रीसेट करें",
+    "bn_BD": "ডিফল্ট সেটিংসে রিসেট করুন",
+    "it_IT": "Ripristina impostazioni predefinite",
+    "fr_FR": "Réinitialiser aux paramètres par défaut",
+    "de_DE": "Auf Standardeinstellungen zurücksetzen",
+    "pt_PT": "Restaurar configurações padrão",
+    "ar_SA": "إعادة تعيين إلى الإعدادات الافتراضية",
+    "vi_VN": "Đặt lại về cài đặt mặc định",
+    "fa_IR": "بازنشانی به تنظیمات پیش‌فرض",
+    "id_ID": "Reset ke pengaturan default",
+    "ms_MY": "Set semula kepada tetapan lalai",
+    "th_TH": "รีเซ็ตเป็นการตั้งค่าเริ่มต้น",
+    "ur_PK": "ڈیفالٹ سیٹنگز پر ری سیٹ کریں",
+}
+
+ABOUT = {
+    "en_US": "About",
+    "es_ES": "Acerca de",
+    "tr_TR": "Hakkında",
+    "zh_CN": "关于",
+    "zh_TW": "關於",
+    "ru_RU": "О программе",
+    "pl_PL": "O programie",
+    "uk_UA": "Про програму",
+    "ja_JP": "バージョン情報",
+    "ko_KR": "정보",
+    "hi_IN": "के बारे में",
+    "bn_BD": "সম্পর্কে",
+    "it_IT": "Informazioni",
+    "fr_FR": "À propos",
+    "de_DE": "Über",
+    "pt_PT": "Sobre",
+    "ar_SA": "حول",
+    "vi_VN": "Giới thiệu",
+    "fa_IR": "درباره",
+    "id_ID": "Tentang",
+    "ms_MY": "Mengenai",
+    "th_TH": "เกี่ยวกับ",
+    "ur_PK": "کے بارے میں",
+}
+
+FILE_SIZE = {
+    "en_US": "File size",
+    "es_ES": "Tamaño del archivo",
+    "tr_TR": "Dosya boyutu",
+    "zh_CN": "文件大小",
+    "zh_TW": "檔案大小",
+    "ru_RU": "Размер файла",
+    "pl_PL": "Rozmiar pliku",
+    "uk_UA": "Розмір файлу",
+    "ja_JP": "ファイルサイズ",
+    "ko_KR": "파일 크기",
+    "hi_IN": "फाइल का आकार",
+    "bn_BD": "ফাইলের আয়তন",
+    "it_IT": "Dimensioni del file",
+    "fr_FR": "Taille du fichier",
+    "de_DE": "Dateigröße",
+    "pt_PT": "Tamanho do arquivo",
+    "ar_SA": "حجم الملف",
+    "vi_VN": "Kích thước tệp",
+    "fa_IR": "اندازه فایل",
+    "id_ID": "Ukuran file",
+    "ms_MY": "Saiz fail",
+    "th_TH": "ขนาดไฟล์",
+    "ur_PK": "فائل کا سائز",
+}
+
+
+############### gui_manual_tab.py ###############
+
+
+UNEXPECTED_ERROR_DURING_SYNC = {
+    "en_US": "Unexpected error during sync: {error}",
+    "es_ES": "Error inesperado durante la sincronización: {error}",
+    "tr_TR": "Senkronizasyon sırasında beklenmeyen hata: {error}",
+    "zh_CN": "同步过程中发生意外错误：{error}",
+    "zh_TW": "同步過程中發生意外錯誤：{error}",
+    "ru_RU": "Неожиданная ошибка во время синхронизации: {error}",
+    "pl_PL": "Nieoczekiwany błąd podczas synchronizacji: {error}",
+    "uk_UA": "Непередбачена помилка під час синхронізації: {error}",
+    "ja_JP": "同期中に予期しないエラーが発生しました: {error}",
+    "ko_KR": "동기화 중 예기치 않은 오류가 발생했습니다: {error}",
+    "hi_IN": "सिंक के दौरान अप्रत्याशित त्रुटि: {error}",
+    "bn_BD": "সমন্বয়কালে অপ্রত্যাশিত ত্রুটি: {error}",
+    "it_IT": "Errore imprevisto durante la sincronizzazione: {error}",
+    "fr_FR": "Erreur inattendue lors de la synchronisation : {error}",
+    "de_DE": "Unerwarteter Fehler während der Synchronisierung: {error}",
+    "pt_PT": "Erro inesperado durante a sincronização: {error}",
+    "ar_SA": "خطأ غير متوقع أثناء المزامنة: {error}",
+    "vi_VN": "Lỗi không mong đợi trong khi đồng bộ: {error}",
+    "fa_IR": "خطای غیرمنتظره در طول همگام‌سازی: {error}",
+    "id_ID": "Kesalahan tak terduga selama sinkronisasi: {error}",
+    "ms_MY": "Ralat tidak dijangka semasa penyelarasan: {error}",
+    "th_TH": "ข้อผิดพลาดที่ไม่คาดคิดระหว่างการซิงค์: {error}",
+    "ur_PK": "ہم آہنگی کے دوران غیرمتوقع خرابی: {error}",
+}
+
+DRAG_DROP_SUBTITLE_OR_BROWSE = {
+    "en_US": "Drag and drop subtitle file here or click to browse.",
+    "es_ES": "Arrastra y suelta el archivo de subtítulos aquí o haz clic para buscar.",
+    "tr_TR": "Altyazı dosyasını buraya sürükleyip bırakın veya göz atmak için tıklayın.",
+    "zh_CN": "将字幕文件拖放到此处或单击以浏览。",
+    "zh_TW": "將字幕檔案拖放到此處，或點擊瀏覽。",
+    "ru_RU": "Перетащите файл субтитров сюда или нажмите, чтобы выбрать.",
+    "pl_PL": "Przeciągnij i upuść tutaj plik z napisami lub kliknij, aby przeglądać.",
+    "uk_UA": "Перетягніть файл субтитрів сюди або натисніть, щоб вибрати.",
+    "ja_JP": "字幕ファイルをここにドラッグ＆ドロップするか、クリックして参照。",
+    "ko_KR": "자막 파일을 여기로 드래그 앤 드롭하거나 클릭하여 찾아보기.",
+    "hi_IN": "सबटाइटल फ़ाइल को यहाँ खींचें या ब्राउज़ करने के लिए क्लिक करें।",
+    "bn_BD": "সাবটাইটেল ফাইল এখানে টেনে আনুন অথবা ব্রাউজ করতে ক্লিক করুন।",
+    "it_IT": "Trascina qui il file dei sottotitoli o fai clic per sfogliare.",
+    "fr_FR": "Glissez-déposez le fichier de sous-titres ici ou cliquez pour parcourir.",
+    "de_DE": "Ziehen Sie die Untertiteldatei hierher oder klicken Sie, um zu durchsuchen.",
+    "pt_PT": "Arraste e solte o arquivo de legendas aqui ou clique para navegar.",
+    "ar_SA": "اسحب وأفلت ملف الترجمة هنا أو انقر للتصفح.",
+    "vi_VN": "Kéo và thả tệp phụ đề vào đây hoặc nhấp để duyệt.",
+    "fa_IR": "فایل زیرنویس را به اینجا بکشید یا برای مرور کلیک کنید.",
+    "id_ID": "Seret dan lepas file subtitle di sini atau klik untuk menelusuri.",
+    "ms_MY": "Seret dan lepaskan fail sari kata di sini atau klik untuk semak imbas.",
+    "th_TH": "ลากและวางไฟล์คำบรรยายที่นี่ หรือคลิกเพื่อเรียกดู",
+    "ur_PK": "سب ٹائٹل فائل یہاں ڈریگ اور ڈراپ کریں یا براؤز کرنے کے لیے کلک کریں۔",
+}
+
+INPUT_SUBTITLE_LABEL = {
+    "en_US": "Input Subtitle",
+    "es_ES": "Subtítulo de entrada",
+    "tr_TR": "Girdi Altyazı",
+    "zh_CN": "输入字幕",
+    "zh_TW": "輸入字幕",
+    "ru_RU": "Ввод субтитров",
+    "pl_PL": "Napisy wejściowe",
+    "uk_UA": "Вхідні субтитри",
+    "ja_JP": "入力字幕",
+    "ko_KR": "입력 자막",
+    "hi_IN": "इनपुट सबटाइटल",
+    "bn_BD": "ইনপুট সাবটাইটেল",
+    "it_IT": "Sottotitoli di input",
+    "fr_FR": "Sous-titre d'entrée",
+    "de_DE": "Eingabe-Untertitel",
+    "pt_PT": "Legenda de entrada",
+    "ar_SA": "الترجمة المدخلة",
+    "vi_VN": "Phụ đề đầu vào",
+    "fa_IR": "زیرنویس ورودی",
+    "id_ID": "Subtitle Masukan",
+    "ms_MY": "Sari kata input",
+    "th_TH": "คำบรรยายเข้า",
+    "ur_PK": "ان پٹ سب ٹائٹل",
+}
+
+ADD_MS_PREFIX_TO_FILENAME = {
+    "en_US": "Add millisecond prefix to filename",
+    "es_ES": "Agregar prefijo de milisegundos al nombre de archivo",
+    "tr_TR": "Dosya adına milisaniye öneki ekle",
+    "zh_CN": "为文件名添加毫秒前缀",
+    "zh_TW": "為檔名添加毫秒前綴",
+    "ru_RU": "Добавить префикс миллисекунд к имени файла",
+    "pl_PL": "Dodaj prefiks milisekund do nazwy pliku",
+    "uk_UA": "Додати префікс мілісекунд до імені файлу",
+    "ja_JP": "ファイル名にミリ秒プレフィックスを追加",
+    "ko_KR": "파일 이름에 밀리초 접두사 추가",
+    "hi_IN": "फ़ाइल नाम में मिलीसेकंड उपसर्ग जोड़ें",
+    "bn_BD": "ফাইলের নামের সাথে মিলিসেকেন্ড উপসর্গ যোগ করুন",
+    "it_IT": "Aggiungi prefisso di millisecondi al nome del file",
+    "fr_FR": "Ajouter un préfixe de millisecondes au nom de fichier",
+    "de_DE": "Millisekunden‐Präfix zum Dateinamen hinzufügen",
+    "pt_PT": "Adicionar prefixo de milissegundos ao nome do arquivo",
+    "ar_SA": "إضافة بادئة مللي ثانية إلى اسم الملف",
+    "vi_VN": "Thêm tiền tố mili giây vào tên tệp",
+    "fa_IR": "پیشوند میلی‌ثانیه را به نام فایل اضافه کنید",
+    "id_ID": "Tambahkan awalan milidetik ke nama file",
+    "ms_MY": "Tambah awalan milisaat ke nama fail",
+    "th_TH": "เพิ่มคำนำหน้ามิลลิวินาทีไปยังชื่อไฟล์",
+    "ur_PK": "فائل کے نام میں ملی سیکنڈ پریفکس شامل کریں",
+}
+
+SHIFT_SUBTITLE_LABEL = {
+    "en_US": "Shift subtitle (ms)",
+    "es_ES": "Desplazar subtítulo (ms)",
+    "tr_TR": "Altyazıyı kaydır (ms)",
+    "zh_CN": "移动字幕（毫秒）",
+    "zh_TW": "移動字幕 (毫秒)",
+    "ru_RU": "Сдвиг субтитров (мс)",
+    "pl_PL": "Przesunięcie napisów (ms)",
+    "uk_UA": "Зсув субтитрів (мс)",
+    "ja_JP": "字幕をずらす（ミリ秒）",
+    "ko_KR": "자막 이동 (밀리초)",
+    "hi_IN": "सबटाइटल शिफ्ट करें (ms)",
+    "bn_BD": "সাবটাইটেল সরান (মি.সেকেন্ড)",
+    "it_IT": "Sposta sottotitolo (ms)",
+    "fr_FR": "Décaler le sous-titre (ms)",
+    "de_DE": "Untertitel verschieben (ms)",
+    "pt_PT": "Deslocar legenda (ms)",
+    "ar_SA": "تحريك الترجمة (مللي ثانية)",
+    "vi_VN": "Dịch phụ đề (ms)",
+    "fa_IR": "شیفت زیرنویس (میلی‌ثانیه)",
+    "id_ID": "Geser subtitle (ms)",
+    "ms_MY": "Gerakkan sari kata (ms)",
+    "th_TH": "เลื่อนคำบรรยาย (มิลลิวินาที)",
+    "ur_PK": "سب ٹائٹل شفٹ کریں (ملی سیکنڈ)",
+}
+
+SECOND_MS_TOOLTIP = {
+    "en_US": "1 second = 1000ms",
+    "es_ES": "1 segundo = 1000 ms",
+    "tr_TR": "1 saniye = 1000 ms",
+    "zh_CN": "1秒 = 1000毫秒",
+    "zh_TW": "1 秒 = 1000 毫秒",
+    "ru_RU": "1 секунда = 1000 мс",
+    "pl_PL": "1 sekunda = 1000 ms",
+    "uk_UA": "1 секунда = 1000 мс",
+    "ja_JP": "1秒 = 1000ミリ秒",
+    "ko_KR": "1초 = 1000밀리초",
+    "hi_IN": "1 सेकंड = 1000 मि.से.",
+    "bn_BD": "1 সেকেন্ড = 1000 মিলি সেকেন্ড",
+    "it_IT": "1 secondo = 1000 ms",
+    "fr_FR": "1 seconde = 1000 ms",
+    "de_DE": "1 Sekunde = 1000 ms",
+    "pt_PT": "1 segundo = 1000 ms",
+    "ar_SA": "1 ثانية = 1000 مللي ثانية",
+    "vi_VN": "1 giây = 1000 ms",
+    "fa_IR": "1 ثانیه = 1000 میلی‌ثانیه",
+    "id_ID": "1 detik = 1000 ms",
+    "ms_MY": "1 saat = 1000 ms",
+    "th_TH": "1 วินาที = 1000 มิลลิวินาที",
+    "ur_PK": "1 سیکنڈ = 1000 ملی سیکنڈ",
+}
+
+SAVE_LOCATION_LABEL = {
+    "en_US": "Save location:",
+    "es_ES": "Ubicación de guardado:",
+    "tr_TR": "Kaydetme konumu:",
+    "zh_CN": "保存位置：",
+    "zh_TW": "儲存位置：",
+    "ru_RU": "Расположение сохранения:",
+    "pl_PL": "Lokalizacja zapisu:",
+    "uk_UA": "Розташування збереження:",
+    "ja_JP": "保存先：",
+    "ko_KR": "저장 위치:",
+    "hi_IN": "सहेजने का स्थान:",
+    "bn_BD": "সংরক্ষণ অবস্থান:",
+    "it_IT": "Posizione di salvataggio:",
+    "fr_FR": "Emplacement de sauvegarde :",
+    "de_DE": "Speicherort:",
+    "pt_PT": "Local de salvamento:",
+    "ar_SA": "موقع الحفظ:",
+    "vi_VN": "Vị trí lưu:",
+    "fa_IR": "محل ذخیره:",
+    "id_ID": "Lokasi penyimpanan:",
+    "ms_MY": "Lokasi simpan:",
+    "th_TH": "ตำแหน่งบันทึก:",
+    "ur_PK": "محفوظ کرنے کی جگہ:",
+}
+
+START = {
+    "en_US": "Start",
+    "es_ES": "Iniciar",
+    "tr_TR": "Başlat",
+    "zh_CN": "开始",
+    "zh_TW": "開始",
+    "ru_RU": "Запустить",
+    "pl_PL": "Rozpocznij",
+    "uk_UA": "Почати",
+    "ja_JP": "開始",
+    "ko_KR": "시작",
+    "hi_IN": "शुरू करें",
+    "bn_BD": "শুরু করুন",
+    "it_IT": "Avvia",
+    "fr_FR": "Démarrer",
+    "de_DE": "Starten",
+    "pt_PT": "Iniciar",
+    "ar_SA": "ابدأ",
+    "vi_VN": "Bắt đầu",
+    "fa_IR": "شروع",
+    "id_ID": "Mulai",
+    "ms_MY": "Mula",
+    "th_TH": "เริ่มต้น",
+    "ur_PK": "شروع کریں",
+}
+
+AUTOMATIC_SYNC_TAB_LABEL = {
+    "en_US": "Automatic Sync",
+    "es_ES": "Sinc. Automática",
+    "tr_TR": "Otomatik Senkr.",
+    "zh_CN": "自动同步",
+    "zh_TW": "自動同步",
+    "ru_RU": "Автомат. синхр.",
+    "pl_PL": "Autom. Synchr.",
+    "uk_UA": "Автом. Синхр.",
+    "ja_JP": "自動同期",
+    "ko_KR": "자동 동기화",
+    "hi_IN": "स्वचालित सिंक",
+    "bn_BD": "স্বয়ংক্রিয় সিঙ্ক",
+    "it_IT": "Sincr. Autom.",
+    "fr_FR": "Sync. Auto.",
+    "de_DE": "Autom. Sync.",
+    "pt_PT": "Sincr. Autom.",
+    "ar_SA": "المزامنة التلقائية",
+    "vi_VN": "Tự Động Đồng Bộ",
+    "fa_IR": "هماهنگی خودکار",
+    "id_ID": "Sinkron Auto",
+    "ms_MY": "Auto Segerak",
+    "th_TH": "ซิงค์อัตโนมัติ",
+    "ur_PK": "خودکار ہمآہنگ",
+}
+
+MANUAL_SYNC_TAB_LABEL = {
+    "en_US": "Manual Sync",
+    "es_ES": "Sinc. Manual",
+    "tr_TR": "Manuel Senk.",
+    "zh_CN": "手动同步",
+    "zh_TW": "手動同步",
+    "ru_RU": "Ручная синхр.",
+    "pl_PL": "Ręczna Synchr.",
+    "uk_UA": "Ручна Синхр.",
+    "ja_JP": "手動同期",
+    "ko_KR": "수동 동기화",
+    "hi_IN": "मैनुअल सिंक",
+    "bn_BD": "ম্যানুয়াল সিঙ্ক",
+    "it_IT": "Sincr. Manuale",
+    "fr_FR": "Sync. Manuelle",
+    "de_DE": "Manuelle Sync.",
+    "pt_PT": "Sincr. Manual",
+    "ar_SA": "المزامنة اليدوية",
+    "vi_VN": "Đồng Bộ Thủ Công",
+    "fa_IR": "هماهنگی دستی",
+    "id_ID": "Sinkron Manual",
+    "ms_MY": "Segerak Manual",
+    "th_TH": "ซิงค์ด้วยตนเอง",
+    "ur_PK": "دستی ہمآہنگ",
+}
+
+PLEASE_SELECT_VIDEO_OR_REFERENCE_SUBTITLE = {
+    "en_US": "Please select a video or reference subtitle.",
+    "es_ES": "Por favor selecciona un video o subtítulo de referencia.",
+    "tr_TR": "Lütfen bir video veya referans altyazı seçin.",
+    "zh_CN": "请选择视频或参考字幕。",
+    "zh_TW": "請選擇影片或參考字幕。",
+    "ru_RU": "Пожалуйста, выберите видео или эталонные субтитры.",
+    "pl_PL": "Proszę wybrać wideo lub napisy referencyjne.",
+    "uk_UA": "Будь ласка, виберіть відео або еталонні субтитри.",
+    "ja_JP": "ビデオまたは参照字幕を選択してください。",
+    "ko_KR": "비디오 또는 참조 자막을 선택하세요.",
+    "hi_IN": "कृपया एक वीडियो या संदर्भ सबटाइटल चुनें।",
+    "bn_BD": "অনুগ্রহ করে একটি ভিডিও বা রেফারেন্স সাবটাইটেল নির্বাচন করুন।",
+    "it_IT": "Si prega di selezionare un video o sottotitolo di riferimento.",
+    "fr_FR": "Veuillez sélectionner une vidéo ou un sous-titre de référence.",
+    "de_DE": "Bitte wählen Sie ein Video oder Referenz-Untertitel aus.",
+    "pt_PT": "Por favor, selecione um vídeo ou legenda de referência.",
+    "ar_SA": "يرجى تحديد فيديو أو ترجمة مرجعية.",
+    "vi_VN": "Vui lòng chọn video hoặc phụ đề tham chiếu.",
+    "fa_IR": "لطفاً یک ویدیو یا زیرنویس مرجع انتخاب کنید.",
+    "id_ID": "Silakan pilih video atau subtitle referensi.",
+    "ms_MY": "Sila pilih video atau sari kata rujukan.",
+    "th_TH": "โปรดเลือกวิดีโอหรือคำบรรยายอ้างอิง",
+    "ur_PK": "براہ کرم ویڈیو یا ریفرنس سب ٹائٹل منتخب کریں۔",
+}
+
+PLEASE_SELECT_SUBTITLE_FILE = {
+    "en_US": "Please select a subtitle file.",
+    "es_ES": "Por favor, seleccione un archivo de subtítulos.",
+    "tr_TR": "Lütfen bir altyazı dosyası seçin.",
+    "zh_CN": "请选择字幕文件。",
+    "zh_TW": "請選擇字幕檔案。",
+    "ru_RU": "Пожалуйста, выберите файл субтитров.",
+    "pl_PL": "Proszę wybrać plik z napisami.",
+    "uk_UA": "Будь ласка, виберіть файл субтитрів.",
+    "ja_JP": "字幕ファイルを選択してください。",
+    "ko_KR": "자막 파일을 선택하세요.",
+    "hi_IN": "कृपया एक उपशीर्षक फ़ाइल चुनें।",
+    "bn_BD": "দয়া করে একটি সাবটাইটেল ফাইল নির্বাচন করুন।",
+    "it_IT": "Seleziona un file di sottotitoli.",
+    "fr_FR": "Veuillez sélectionner un fichier de sous-titres.",
+    "de_DE": "Bitte wählen Sie eine Untertiteldatei aus.",
+    "pt_PT": "Por favor, selecione um arquivo de legendas.",
+    "ar_SA": "يرجى تحديد ملف الترجمة.",
+    "vi_VN": "Vui lòng chọn tệp phụ đề.",
+    "fa_IR": "لطفاً یک فایل زیرنویس را انتخاب کنید.",
+    "id_ID": "Silakan pilih file subtitle.",
+    "ms_MY": "Sila pilih fail sari kata.",
+    "th_TH": "โปรดเลือกไฟล์คำบรรยาย",
+    "ur_PK": "براہ کرم ایک سب ٹائٹل فائل منتخب کریں۔",
+}
+
+PLEASE_ENTER_NON_ZERO_VALUE = {
+    "en_US": "Please enter a non-zero value.",
+    "es_ES": "Por favor, ingrese un valor distinto de cero.",
+    "tr_TR": "Lütfen sıfır olmayan bir değer girin.",
+    "zh_CN": "请输入非零值。",
+    "zh_TW": "請輸入非零數值。",
+    "ru_RU": "Пожалуйста, введите ненулевое значение.",
+    "pl_PL": "Wprowadź wartość różną od zera.",
+    "uk_UA": "Введіть значення, відмінне від нуля.",
+    "ja_JP": "0以外の値を入力してください。",
+    "ko_KR": "0이 아닌 값을 입력하세요.",
+    "hi_IN": "कृपया शून्य से भिन्न मान दर्ज करें।",
+    "bn_BD": "অনুগ্রহ করে শূন্য নয় এমন একটি মান লিখুন।",
+    "it_IT": "Inserisci un valore diverso da zero.",
+    "fr_FR": "Veuillez entrer une valeur non nulle.",
+    "de_DE": "Bitte geben Sie einen Wert ungleich null ein.",
+    "pt_PT": "Por favor, insira um valor diferente de zero.",
+    "ar_SA": "الرجاء إدخال قيمة غير صفرية.",
+    "vi_VN": "Vui lòng nhập giá trị khác không.",
+    "fa_IR": "لطفاً یک مقدار غیر صفر وارد کنید.",
+    "id_ID": "Silakan masukkan nilai yang tidak nol.",
+    "ms_MY": "Sila masukkan nilai bukan sifar.",
+    "th_TH": "กรุณาใส่ค่าที่ไม่ใช่ศูนย์",
+    "ur_PK": "براہ کرم صفر سے مختلف قدر درج کریں۔",
+}
+
+PLEASE_SELECT_DESTINATION_FOLDER = {
+    "en_US": "Please select a destination folder in the save location dropdown.",
+    "es_ES": "Por favor, seleccione una carpeta de destino en el menú desplegable de ubicación de guardado.",
+    "tr_TR": "Lütfen kaydetme konumu açılır listesinden hedef klasörü seçin.",
+    "zh_CN": "请在保存位置下拉菜单中选择目标文件夹。",
+    "zh_TW": "請在儲存位置下拉選單中選擇目標資料夾。",
+    "ru_RU": "Пожалуйста, выберите папку назначения в выпадающем списке расположения сохранения.",
+    "pl_PL": "Proszę wybrać folder docelowy w rozwijanym menu lokalizacji zapisu.",
+    "uk_UA": "Будь ласка, виберіть папку призначення у спадному списку місця збереження.",
+    "ja_JP": "保存先ドロップダウンで保存先フォルダーを選択してください。",
+    "ko_KR": "저장 위치 드롭다운에서 대상 폴더를 선택하세요.",
+    "hi_IN": "कृपया सहेजने के स्थान ड्रॉपडाउन में गंतव्य फ़ोल्डर चुनें।",
+    "bn_BD": "দয়া করে সংরক্ষণ অবস্থান ড্রপডাউনে গন্তব্য ফোল্ডার নির্বাচন করুন।",
+    "it_IT": "Seleziona una cartella di destinazione nel menu a discesa della posizione di salvataggio.",
+    "fr_FR": "Veuillez sélectionner un dossier de destination dans la liste déroulante de l’emplacement d’enregistrement.",
+    "de_DE": "Bitte wählen Sie im Dropdown-Menü zum Speicherort einen Zielordner aus.",
+    "pt_PT": "Por favor, selecione uma pasta de destino no menu suspenso de local de salvamento.",
+    "ar_SA": "يرجى تحديد مجلد الوجهة في قائمة موقع الحفظ المنسدلة.",
+    "vi_VN": "Vui lòng chọn thư mục đích trong menu thả xuống vị trí lưu.",
+    "fa_IR": "لطفاً پوشه مقصد را در منوی کشویی محل ذخیره‌سازی انتخاب کنید.",
+    "id_ID": "Silakan pilih folder tujuan di dropdown lokasi penyimpanan.",
+    "ms_MY": "Sila pilih folder destinasi dalam dropdown lokasi simpan.",
+    "th_TH": "โปรดเลือกโฟลเดอร์ปลายทางในเมนูแบบเลื่อนลงตำแหน่งบันทึก",
+    "ur_PK": "براہ کرم سیو لوکیشن ڈراپ ڈاؤن میں منزل فولڈر منتخب کریں۔",
+}
+
+SELECTED_DESTINATION_FOLDER_NOT_EXIST = {
+    "en_US": "The selected destination folder does not exist:\n{folder}",
+    "es_ES": "La carpeta de destino seleccionada no existe:\n{folder}",
+    "tr_TR": "Seçilen hedef klasör mevcut değil:\n{folder}",
+    "zh_CN": "所选目标文件夹不存在：\n{folder}",
+    "zh_TW": "所選的目標資料夾不存在：\n{folder}",
+    "ru_RU": "Выбранная папка назначения не существует:\n{folder}",
+    "pl_PL": "Wybrany folder docelowy nie istnieje:\n{folder}",
+    "uk_UA": "Обрана папка призначення не існує:\n{folder}",
+    "ja_JP": "選択された保存先フォルダーが存在しません:\n{folder}",
+    "ko_KR": "선택한 대상 폴더가 존재하지 않습니다:\n{folder}",
+    "hi_IN": "चयनित गंतव्य फ़ोल्डर मौजूद नहीं है:\n{folder}",
+    "bn_BD": "নির্বাচিত গন্তব্য ফোল্ডার বিদ্যমান নেই:\n{folder}",
+    "it_IT": "La cartella di destinazione selezionata non esiste:\n{folder}",
+    "fr_FR": "Le dossier de destination sélectionné n'existe pas :\n{folder}",
+    "de_DE": "Der ausgewählte Zielordner existiert nicht:\n{folder}",
+    "pt_PT": "A pasta de destino selecionada não existe:\n{folder}",
+    "ar_SA": "المجلد الوجهة المحدد غير موجود:\n{folder}",
+    "vi_VN": "Thư mục đích đã chọn không tồn tại:\n{folder}",
+    "fa_IR": "پوشه مقصد انتخاب‌شده وجود ندارد:\n{folder}",
+    "id_ID": "Folder tujuan yang dipilih tidak ada:\n{folder}",
+    "ms_MY": "Folder destinasi yang dipilih tidak ada:\n{folder}",
+    "th_TH": "โฟลเดอร์ปลายทางที่เลือกไม่มีอยู่:\n{folder}",
+    "ur_PK": "منتخب شدہ منزل فولڈر موجود نہیں ہے:\n{folder}",
+}
+
+FILE_ALREADY_EXISTS_TITLE = {
+    "en_US": "File Already Exists",
+    "es_ES": "Archivo ya existe",
+    "tr_TR": "Dosya zaten var",
+    "zh_CN": "文件已存在",
+    "zh_TW": "檔案已存在",
+    "ru_RU": "Файл уже существует",
+    "pl_PL": "Plik już istnieje",
+    "uk_UA": "Файл уже існує",
+    "ja_JP": "ファイルが既に存在します",
+    "ko_KR": "파일이 이미 존재합니다",
+    "hi_IN": "फ़ाइल पहले से मौजूद है",
+    "bn_BD": "ফাইল ইতিমধ্যে বিদ্যমান",
+    "it_IT": "File già esistente",
+    "fr_FR": "Le fichier existe déjà",
+    "de_DE": "Datei existiert bereits",
+    "pt_PT": "Arquivo já existe",
+    "ar_SA": "الملف موجود بالفعل",
+    "vi_VN": "Tệp đã tồn tại",
+    "fa_IR": "فایل از قبل وجود دارد",
+    "id_ID": "File sudah ada",
+    "ms_MY": "Fail sudah wujud",
+    "th_TH": "ไฟล์มีอยู่แล้ว",
+    "ur_PK": "فائل پہلے سے موجود ہے",
+}
+
+FILE_ALREADY_EXISTS_MESSAGE = {
+    "en_US": "The output file already exists:\n{filename}\n\nDo you want to replace it?",
+    "es_ES": "El archivo de salida ya existe:\n{filename}\n\n¿Desea reemplazarlo?",
+    "tr_TR": "Çıktı dosyası zaten mevcut:\n{filename}\n\nÜzerine yazmak istiyor musunuz?",
+    "zh_CN": "输出文件已存在：\n{filename}\n\n您想要替换它吗？",
+    "zh_TW": "輸出檔案已存在：\n{filename}\n\n您想要取代它嗎？",
+    "ru_RU": "Выходной файл уже существует:\n{filename}\n\nПерезаписать?",
+    "pl_PL": "Plik wyjściowy już istnieje:\n{filename}\n\nCzy chcesz go zastąpić?",
+    "uk_UA": "Вихідний файл уже існує:\n{filename}\n\nБажаєте замінити його?",
+    "ja_JP": "出力ファイルは既に存在します：\n{filename}\n\n置き換えますか？",
+    "ko_KR": "출력 파일이 이미 존재합니다：\n{filename}\n\n교체하시겠습니까?",
+    "hi_IN": "आउटपुट फ़ाइल पहले से मौजूद है:\n{filename}\n\nक्या आप इसे प्रतिस्थापित करना चाहते हैं?",
+    "bn_BD": "আউটপুট ফাইল ইতিমধ্যে বিদ্যমান:\n{filename}\n\nআপনি কি এটি প্রতিস্থাপন করতে চান?",
+    "it_IT": "Il file di output esiste già:\n{filename}\n\nVuoi sostituirlo?",
+    "fr_FR": "Le fichier de sortie existe déjà :\n{filename}\n\nVoulez-vous le remplacer ?",
+    "de_DE": "Die Ausgabedatei existiert bereits:\n{filename}\n\nMöchten Sie sie ersetzen?",
+    "pt_PT": "O arquivo de saída já existe:\n{filename}\n\nDeseja substituí-lo?",
+    "ar_SA": "ملف الإخراج موجود بالفعل:\n{filename}\n\nهل تريد استبداله؟",
+    "vi_VN": "Tệp đầu ra đã tồn tại:\n{filename}\n\nBạn có muốn thay thế nó không?",
+    "fa_IR": "فایل خروجی قبلاً وجود دارد:\n{filename}\n\nآیا می‌خواهید آن را جایگزین کنید؟",
+    "id_ID": "File output sudah ada:\n{filename}\n\nApakah Anda ingin menggantinya?",
+    "ms_MY": "Fail output sudah wujud:\n{filename}\n\nAdakah anda mahu menggantikannya?",
+    "th_TH": "ไฟล์เอาต์พุตมีอยู่แล้ว:\n{filename}\n\nคุณต้องการแทนที่หรือไม่?",
+    "ur_PK": "آؤٹ پٹ فائل پہلے سے موجود ہے:\n{filename}\n\nکیا آپ اسے تبدیل کرنا چاہتے ہیں؟",
+}
+
+PROCESSING = {
+    "en_US": "Processing...",
+    "es_ES": "Procesando...",
+    "tr_TR": "İşleniyor...",
+    "zh_CN": "处理中...",
+    "zh_TW": "處理中...",
+    "ru_RU": "Обработка...",
+    "pl_PL": "Przetwarzanie...",
+    "uk_UA": "Обробка...",
+    "ja_JP": "処理中...",
+    "ko_KR": "처리 중...",
+    "hi_IN": "प्रसंस्करण हो रहा है...",
+    "bn_BD": "প্রসেসিং...",
+    "it_IT": "Elaborazione...",
+    "fr_FR": "Traitement en cours...",
+    "de_DE": "Verarbeitung...",
+    "pt_PT": "Processando...",
+    "ar_SA": "جاري المعالجة...",
+    "vi_VN": "Đang xử lý...",
+    "fa_IR": "در حال پردازش...",
+    "id_ID": "Sedang memproses...",
+    "ms_MY": "Sedang memproses...",
+    "th_TH": "กำลังประมวลผล...",
+    "ur_PK": "عملدرآمد ہو رہا ہے...",
+}
+
+FAILED_TO_SHIFT_SUBTITLE = {
+    "en_US": "Failed to shift subtitle:\n{message}",
+    "es_ES": "Error al desplazar los subtítulos:\n{message}",
+    "tr_TR": "Altyazı kaydırılamadı:\n{message}",
+    "zh_CN": "无法移动字幕：\n{message}",
+    "zh_TW": "無法移動字幕：\n{message}",
+    "ru_RU": "Не удалось сдвинуть субтитры:\n{message}",
+    "pl_PL": "Nie udało się przesunąć napisów:\n{message}",
+    "uk_UA": "Не вдалося зсунути субтитри:\n{message}",
+    "ja_JP": "字幕のシフトに失敗しました：\n{message}",
+    "ko_KR": "자막 이동 실패:\n{message}",
+    "hi_IN": "सबटाइटल शिफ्ट करने में विफल:\n{message}",
+    "bn_BD": "সাবটাইটেল সরানো ব্যর্থ হয়েছে:\n{message}",
+    "it_IT": "Impossibile spostare i sottotitoli:\n{message}",
+    "fr_FR": "Échec du décalage des sous-titres :\n{message}",
+    "de_DE": "Verschieben der Untertitel fehlgeschlagen:\n{message}",
+    "pt_PT": "Falha ao deslocar legenda:\n{message}",
+    "ar_SA": "فشل في تحريك الترجمة:\n{message}",
+    "vi_VN": "Không thể dịch phụ đề:\n{message}",
+    "fa_IR": "شکست در جابجایی زیرنویس‌ها:\n{message}",
+    "id_ID": "Gagal menggeser subtitle:\n{message}",
+    "ms_MY": "Gagal mengalihkan sari kata:\n{message}",
+    "th_TH": "ไม่สามารถเลื่อนคำบรรยายได้:\n{message}",
+    "ur_PK": "سب ٹائٹل شفٹ کرنے میں ناکام:\n{message}",
+}
+
+TOTAL_SHIFTED_LABEL = {
+    "en_US": "Total shifted: {total_ms:+d} ms",
+    "es_ES": "Total desplazado: {total_ms:+d} ms",
+    "tr_TR": "Toplam kaydırma: {total_ms:+d} ms",
+    "zh_CN": "总移动：{total_ms:+d} 毫秒",
+    "zh_TW": "總移動：{total_ms:+d} 毫秒",
+    "ru_RU": "Всего сдвинуто: {total_ms:+d} мс",
+    "pl_PL": "Łącznie przesunięto: {total_ms:+d} ms",
+    "uk_UA": "Всього зсунуто: {total_ms:+d} мс",
+    "ja_JP": "合計シフト：{total_ms:+d} ms",
+    "ko_KR": "총 이동: {total_ms:+d} ms",
+    "hi_IN": "कुल शिफ्ट: {total_ms:+d} मि.से.",
+    "bn_BD": "মোট সরানো হয়েছে: {total_ms:+d} মি.সে.",
+    "it_IT": "Totale spostato: {total_ms:+d} ms",
+    "fr_FR": "Total décalé : {total_ms:+d} ms",
+    "de_DE": "Insgesamt verschoben: {total_ms:+d} ms",
+    "pt_PT": "Total deslocado: {total_ms:+d} ms",
+    "ar_SA": "إجمالي الإزاحة: {total_ms:+d} مللي ثانية",
+    "vi_VN": "Tổng đã dịch: {total_ms:+d} ms",
+    "fa_IR": "مجموع جابجایی: {total_ms:+d} میلی‌ثانیه",
+    "id_ID": "Total digeser: {total_ms:+d} ms",
+    "ms_MY": "Jumlah digeser: {total_ms:+d} ms",
+    "th_TH": "เลื่อนทั้งหมด: {total_ms:+d} มิลลิวินาที",
+    "ur_PK": "کل شفٹ کیا گیا: {total_ms:+d} ملی سیکنڈ",
+}
+
+PREFIX_NOT_APPLICABLE_WHEN_OVERWRITING = {
+    "en_US": "Prefix is not applicable when overwriting the input file",
+    "es_ES": "El prefijo no es aplicable al sobrescribir el archivo de entrada",
+    "tr_TR": "Girdi dosyası üzerine yazılırken önek uygulanamaz",
+    "zh_CN": "覆盖输入文件时无法使用前缀",
+    "zh_TW": "覆寫輸入檔案時不適用前綴",
+    "ru_RU": "Префикс не применяется при перезаписи исходного файла",
+    "pl_PL": "Prefiks nie ma zastosowania podczas nadpisywania pliku wejściowego",
+    "uk_UA": "Префікс не застосовується при перезаписі вхідного файлу",
+    "ja_JP": "入力ファイルを上書きする場合、プレフィックスは適用されません",
+    "ko_KR": "입력 파일을 덮어쓸 때는 접두사를 사용할 수 없습니다",
+    "hi_IN": "इनपुट फ़ाइल को ओवरराइट करते समय उपसर्ग लागू नहीं होता",
+    "bn_BD": "ইনপুট ফাইল ওভাররাইট করলে প্রিফিক্স প্রযোজ্য নয়",
+    "it_IT": "Il prefisso non è applicabile durante la sovrascrittura del file di input",
+    "fr_FR": "Le préfixe n'est pas applicable lors de l'écrasement du fichier d'entrée",
+    "de_DE": "Präfix ist beim Überschreiben der Eingabedatei nicht anwendbar",
+    "pt_PT": "O prefixo não é aplicável ao sobrescrever o arquivo de entrada",
+    "ar_SA": "لا يمكن استخدام البادئة عند الكتابة فوق ملف الإدخال",
+    "vi_VN": "Tiền tố không áp dụng khi ghi đè tệp đầu vào",
+    "fa_IR": "پیشوند هنگام بازنویسی فایل ورودی قابل استفاده نیست",
+    "id_ID": "Awalan tidak berlaku saat menimpa file input",
+    "ms_MY": "Awalan tidak terpakai apabila menulis ganti fail input",
+    "th_TH": "ไม่สามารถใช้คำนำหน้าเมื่อเขียนทับไฟล์อินพุต",
+    "ur_PK": "ان پٹ فائل اووررائٹ کرتے وقت پریفکس لاگو نہیں ہوتا",
+}
+
+FILE_NOT_FOUND_TITLE = {
+    "en_US": "File Not Found",
+    "es_ES": "Archivo no encontrado",
+    "tr_TR": "Dosya bulunamadı",
+    "zh_CN": "未找到文件",
+    "zh_TW": "找不到檔案",
+    "ru_RU": "Файл не найден",
+    "pl_PL": "Nie znaleziono pliku",
+    "uk_UA": "Файл не знайдено",
+    "ja_JP": "ファイルが見つかりません",
+    "ko_KR": "파일을 찾을 수 없음",
+    "hi_IN": "फ़ाइल नहीं मिली",
+    "bn_BD": "ফাইল পাওয়া যায়নি",
+    "it_IT": "File non trovato",
+    "fr_FR": "Fichier introuvable",
+    "de_DE": "Datei nicht gefunden",
+    "pt_PT": "Arquivo não encontrado",
+    "ar_SA": "الملف غير موجود",
+    "vi_VN": "Không tìm thấy tệp",
+    "fa_IR": "فایل پیدا نشد",
+    "id_ID": "File tidak ditemukan",
+    "ms_MY": "Fail tidak dijumpai",
+    "th_TH": "ไม่พบไฟล์",
+    "ur_PK": "فائل نہیں ملی",
+}
+
+FILE_NOT_FOUND_MESSAGE = {
+    "en_US": "The output file could not be found:\n{filename}\n\nIt may have been moved or deleted.",
+    "es_ES": "No se pudo encontrar el archivo de salida:\n{filename}\n\nEs posible que se haya movido o eliminado.",
+    "tr_TR": "Çıktı dosyası bulunamadı:\n{filename}\n\nTaşınmış veya silinmiş olabilir.",
+    "zh_CN": "无法找到输出文件：\n{filename}\n\n可能已被移动或删除。",
+    "zh_TW": "找不到輸出檔案：\n{filename}\n\n可能已被移動或刪除。",
+    "ru_RU": "Не удалось найти выходной файл:\n{filename}\n\nВозможно, он был перемещён или удалён.",
+    "pl_PL": "Nie można znaleźć pliku wyjściowego:\n{filename}\n\nMożliwe, że został przeniesiony lub usunięty.",
+    "uk_UA": "Не вдалося знайти вихідний файл:\n{filename}\n\nМожливо, його було переміщено або видалено.",
+    "ja_JP": "出力ファイルが見つかりませんでした：\n{filename}\n\n移動または削除された可能性があります。",
+    "ko_KR": "출력 파일을 찾을 수 없습니다:\n{filename}\n\n이동되었거나 삭제되었을 수 있습니다.",
+    "hi_IN": "आउटपुट फ़ाइल नहीं मिली:\n{filename}\n\nयह स्थानांतरित या हटाई जा सकती है।",
+    "bn_BD": "আউটপুট ফাইল খুঁজে পাওয়া যায়নি:\n{filename}\n\nএটি সরানো বা মুছে ফেলা হতে পারে।",
+    "it_IT": "Impossibile trovare il file di output:\n{filename}\n\nPotrebbe essere stato spostato o eliminato.",
+    "fr_FR": "Impossible de trouver le fichier de sortie :\n{filename}\n\nIl a peut-être été déplacé ou supprimé.",
+    "de_DE": "Die Ausgabedatei konnte nicht gefunden werden:\n{filename}\n\nSie wurde möglicherweise verschoben oder gelöscht.",
+    "pt_PT": "Não foi possível encontrar o arquivo de saída:\n{filename}\n\nPode ter sido movido ou excluído.",
+    "ar_SA": "تعذر العثور على ملف الإخراج:\n{filename}\n\nقد يكون قد تم نقله أو حذفه.",
+    "vi_VN": "Không thể tìm thấy tệp đầu ra:\n{filename}\n\nCó thể đã bị di chuyển hoặc xóa.",
+    "fa_IR": "فایل خروجی پیدا نشد:\n{filename}\n\nممکن است جابجا یا حذف شده باشد.",
+    "id_ID": "File output tidak dapat ditemukan:\n{filename}\n\nMungkin telah dipindahkan atau dihapus.",
+    "ms_MY": "Fail output tidak dapat dijumpai:\n{filename}\n\nIa mungkin telah dipindahkan atau dipadam.",
+    "th_TH": "ไม่พบไฟล์เอาต์พุต:\n{filename}\n\nอาจถูกย้ายหรือถูกลบไปแล้ว",
+    "ur_PK": "آؤٹ پٹ فائل نہیں مل سکی:\n{filename}\n\nیہ منتقل یا حذف کی جا چکی ہو سکتی ہے۔",
+}
+
+
+############### gui_log_window.py ###############
+
+
+NEW_CONVERSION = {
+    "en_US": "New conversion",
+    "es_ES": "Nueva conversión",
+    "tr_TR": "Yeni dönüştürme",
+    "zh_CN": "新转换",
+    "zh_TW": "新轉換",
+    "ru_RU": "Новая конвертация",
+    "pl_PL": "Nowa konwersja",
+    "uk_UA": "Нове перетворення",
+    "ja_JP": "新しい変換",
+    "ko_KR": "새 변환",
+    "hi_IN": "नई रूपांतरण",
+    "bn_BD": "নতুন রূপান্তর",
+    "it_IT": "Nuova conversione",
+    "fr_FR": "Nouvelle conversion",
+    "de_DE": "Neue Konvertierung",
+    "pt_PT": "Nova conversão",
+    "ar_SA": "تحويل جديد",
+    "vi_VN": "Chuyển đổi mới",
+    "fa_IR": "تبدیل جدید",
+    "id_ID": "Konversi baru",
+    "ms_MY": "Penukaran baharu",
+    "th_TH": "การแปลงใหม่",
+    "ur_PK": "نیا کنورژن",
+}
+
+GO_BACK = {
+    "en_US": "Go back",
+    "es_ES": "Volver",
+    "tr_TR": "Geri dön",
+    "zh_CN": "返回",
+    "zh_TW": "返回",
+    "ru_RU": "Назад",
+    "pl_PL": "Wróć",
+    "uk_UA": "Повернутися",
+    "ja_JP": "戻る",
+    "ko_KR": "뒤로 가기",
+    "hi_IN": "वापस जाएं",
+    "bn_BD": "ফিরে যান",
+    "it_IT": "Torna indietro",
+    "fr_FR": "Retour",
+    "de_DE": "Zurück",
+    "pt_PT": "Voltar",
+    "ar_SA": "العودة",
+    "vi_VN": "Quay lại",
+    "fa_IR": "بازگشت",
+    "id_ID": "Kembali",
+    "ms_MY": "Kembali",
+    "th_TH": "ย้อนกลับ",
+    "ur_PK": "واپس جائیں",
+}
+
+CANCEL = {
+    "en_US": "Cancel",
+    "es_ES": "Cancelar",
+    "tr_TR": "İptal",
+    "zh_CN": "取消",
+    "zh_TW": "取消",
+    "ru_RU": "Отмена",
+    "pl_PL": "Anuluj",
+    "uk_UA": "Скасувати",
+    "ja_JP": "キャンセル",
+    "ko_KR": "취소",
+    "hi_IN": "रद्द करें",
+    "bn_BD": "বাতিল করুন",
+    "it_IT": "Annulla",
+    "fr_FR": "Annuler",
+    "de_DE": "Abbrechen",
+    "pt_PT": "Cancelar",
+    "ar_SA": "إلغاء",
+    "vi_VN": "Hủy",
+    "fa_IR": "لغو",
+    "id_ID": "Batal",
+    "ms_MY": "Batal",
+    "th_TH": "ยกเลิก",
+    "ur_PK": "منسوخ کریں",
+}
+
+CONFIGURATION_LABEL = {
+    "en_US": "Configuration:",
+    "es_ES": "Configuración:",
+    "tr_TR": "Ayarlar:",
+    "zh_CN": "配置：",
+    "zh_TW": "配置：",
+    "ru_RU": "Конфигурация:",
+    "pl_PL": "Konfiguracja:",
+    "uk_UA": "Конфігурація:",
+    "ja_JP": "構成：",
+    "ko_KR": "구성:",
+    "hi_IN": "कॉन्फ़िगरेशन:",
+    "bn_BD": "কনফিগারেশন:",
+    "it_IT": "Configurazione:",
+    "fr_FR": "Configuration :",
+    "de_DE": "Konfiguration:",
+    "pt_PT": "Configuração:",
+    "ar_SA": "الإعدادات:",
+    "vi_VN": "Cấu hình:",
+    "fa_IR": "پیکربندی:",
+    "id_ID": "Konfigurasi:",
+    "ms_MY": "Konfigurasi:",
+    "th_TH": "การกำหนดค่า:",
+    "ur_PK": "تشکیل:",
+}
+
+MODE_LABEL = {
+    "en_US": "Mode: ",
+    "es_ES": "Modo: ",
+    "tr_TR": "Mod: ",
+    "zh_CN": "模式：",
+    "zh_TW": "模式：",
+    "ru_RU": "Режим: ",
+    "pl_PL": "Tryb: ",
+    "uk_UA": "Режим: ",
+    "ja_JP": "モード：",
+    "ko_KR": "모드: ",
+    "hi_IN": "मोड: ",
+    "bn_BD": "মোড: ",
+    "it_IT": "Modalità: ",
+    "fr_FR": "Mode : ",
+    "de_DE": "Modus: ",
+    "pt_PT": "Modo: ",
+    "ar_SA": "الوضع: ",
+    "vi_VN": "Chế độ: ",
+    "fa_IR": "حالت: ",
+    "id_ID": "Mode: ",
+    "ms_MY": "Mod: ",
+    "th_TH": "โหมด: ",
+    "ur_PK": "موڈ: ",
+}
+
+TOTAL_PAIRS_LABEL = {
+    "en_US": "Total pairs:",
+    "es_ES": "Total de pares:",
+    "tr_TR": "Toplam eş:",
+    "zh_CN": "总对数：",
+    "zh_TW": "總配對數：",
+    "ru_RU": "Всего пар:",
+    "pl_PL": "Łączna liczba par:",
+    "uk_UA": "Всього пар:",
+    "ja_JP": "総ペア数：",
+    "ko_KR": "총 쌍:",
+    "hi_IN": "कुल जोड़े:",
+    "bn_BD": "মোট জোড়া:",
+    "it_IT": "Coppie totali:",
+    "fr_FR": "Paires totales :",
+    "de_DE": "Gesamtpaare:",
+    "pt_PT": "Total de pares:",
+    "ar_SA": "إجمالي الأزواج:",
+    "vi_VN": "Tổng số cặp:",
+    "fa_IR": "کل جفت‌ها:",
+    "id_ID": "Total pasangan:",
+    "ms_MY": "Jumlah pasangan:",
+    "th_TH": "คู่ทั้งหมด:",
+    "ur_PK": "کل جوڑے:",
+}
+
+SYNC_TOOL_LABEL = {
+    "en_US": "Sync tool:",
+    "es_ES": "Herramienta de sincronización:",
+    "tr_TR": "Senkronizasyon aracı:",
+    "zh_CN": "同步工具：",
+    "zh_TW": "同步工具：",
+    "ru_RU": "Инструмент синхронизации:",
+    "pl_PL": "Narzędzie synchronizacji:",
+    "uk_UA": "Інструмент синхронізації:",
+    "ja_JP": "同期ツール：",
+    "ko_KR": "동기화 도구:",
+    "hi_IN": "सिंक टूल:",
+    "bn_BD": "সিঙ্ক টুল:",
+    "it_IT": "Strumento di sincronizzazione:",
+    "fr_FR": "Outil de synchronisation:",
+    "de_DE": "Synchronisationswerkzeug:",
+    "pt_PT": "Ferramenta de sincronização:",
+    "ar_SA": "أداة المزامنة:",
+    "vi_VN": "Công cụ đồng bộ:",
+    "fa_IR": "ابزار همگام‌سازی:",
+    "id_ID": "Alat sinkronisasi:",
+    "ms_MY": "Alat segerak:",
+    "th_TH": "เครื่องมือซิงค์:",
+    "ur_PK": "سنک ٹول:",
+}
+
+NO_SPLITS = {
+    "en_US": "No splits",
+    "es_ES": "Sin divisiones",
+    "tr_TR": "Bölme yok",
+    "zh_CN": "无分割",
+    "zh_TW": "不分割",
+    "ru_RU": "Без разбиений",
+    "pl_PL": "Brak podziałów",
+    "uk_UA": "Без розділень",
+    "ja_JP": "分割なし",
+    "ko_KR": "분할 없음",
+    "hi_IN": "कोई विभाजन नहीं",
+    "bn_BD": "কোনো বিভাজন নেই",
+    "it_IT": "Nessuna divisione",
+    "fr_FR": "Aucune division",
+    "de_DE": "Keine Aufteilung",
+    "pt_PT": "Sem divisões",
+    "ar_SA": "لا تقسيمات",
+    "vi_VN": "Không chia nhỏ",
+    "fa_IR": "بدون تقسیم",
+    "id_ID": "Tidak ada pemisahan",
+    "ms_MY": "Tiada pecahan",
+    "th_TH": "ไม่มีการแบ่ง",
+    "ur_PK": "کوئی تقسیم نہیں",
+}
+
+UNKNOWN_SYNC_TOOL_NO_OPTIONS = {
+    "en_US": "Unknown sync tool. No options available.",
+    "es_ES": "Herramienta de sincronización desconocida. No hay opciones disponibles.",
+    "tr_TR": "Bilinmeyen senkronizasyon aracı. Seçenek yok.",
+    "zh_CN": "未知同步工具。没有可用选项。",
+    "zh_TW": "未知的同步工具。沒有可用的選項。",
+    "ru_RU": "Неизвестный инструмент синхронизации. Нет доступных опций.",
+    "pl_PL": "Nieznane narzędzie synchronizacji. Brak dostępnych opcji.",
+    "uk_UA": "Невідомий інструмент синхронізації. Немає доступних параметрів.",
+    "ja_JP": "不明な同期ツールです。利用可能なオプションはありません。",
+    "ko_KR": "알 수 없는 동기화 도구입니다. 사용 가능한 옵션이 없습니다.",
+    "hi_IN": "अज्ञात सिंक टूल। कोई विकल्प उपलब्ध नहीं है।",
+    "bn_BD": "অজানা সিঙ্ক টুল। কোনো বিকল্প নেই।",
+    "it_IT": "Strumento di sincronizzazione sconosciuto. Nessuna opzione disponibile.",
+    "fr_FR": "Outil de synchronisation inconnu. Aucune option disponible.",
+    "de_DE": "Unbekanntes Synchronisationswerkzeug. Keine Optionen verfügbar.",
+    "pt_PT": "Ferramenta de sincronização desconhecida. Nenhuma opção disponível.",
+    "ar_SA": "أداة مزامنة غير معروفة. لا توجد خيارات متاحة.",
+    "vi_VN": "Công cụ đồng bộ không xác định. Không có tùy chọn nào.",
+    "fa_IR": "ابزار همگام‌سازی ناشناخته. گزینه‌ای در دسترس نیست.",
+    "id_ID": "Alat sinkronisasi tidak diketahui. Tidak ada opsi yang tersedia.",
+    "ms_MY": "Alat segerak tidak diketahui. Tiada pilihan tersedia.",
+    "th_TH": "เครื่องมือซิงค์ที่ไม่รู้จัก ไม่มีตัวเลือกให้ใช้",
+    "ur_PK": "نامعلوم سنک ٹول۔ کوئی آپشن دستیاب نہیں۔",
+}
+
+OUTPUT_SUBTITLE_ENCODING_LABEL = {
+    "en_US": "Output subtitle encoding: ",
+    "es_ES": "Codificación de subtítulos de salida: ",
+    "tr_TR": "Çıktı altyazı kodlaması: ",
+    "zh_CN": "输出字幕编码：",
+    "zh_TW": "輸出字幕編碼：",
+    "ru_RU": "Кодировка выходных субтитров: ",
+    "pl_PL": "Kodowanie napisów wyjściowych: ",
+    "uk_UA": "Кодування вихідних субтитрів: ",
+    "ja_JP": "出力字幕のエンコーディング：",
+    "ko_KR": "출력 자막 인코딩: ",
+    "hi_IN": "आउटपुट सबटाइटल एन्कोडिंग: ",
+    "bn_BD": "আউটপুট সাবটাইটেল এনকোডিং: ",
+    "it_IT": "Codifica sottotitoli in uscita: ",
+    "fr_FR": "Encodage des sous-titres de sortie : ",
+    "de_DE": "Ausgabe-Untertitel-Kodierung: ",
+    "pt_PT": "Codificação da legenda de saída: ",
+    "ar_SA": "ترميز الترجمة الناتجة: ",
+    "vi_VN": "Mã hóa phụ đề đầu ra: ",
+    "fa_IR": "کدگذاری زیرنویس خروجی: ",
+    "id_ID": "Enkoding subtitle keluaran: ",
+    "ms_MY": "Pengekodan sari kata output: ",
+    "th_TH": "การเข้ารหัสคำบรรยายผลลัพธ์: ",
+    "ur_PK": "آؤٹ پٹ سب ٹائٹل انکوڈنگ: ",
+}
+
+FOLDER_LABEL = {
+    "en_US": "Folder: ",
+    "es_ES": "Carpeta: ",
+    "tr_TR": "Klasör: ",
+    "zh_CN": "文件夹：",
+    "zh_TW": "資料夾：",
+    "ru_RU": "Папка: ",
+    "pl_PL": "Folder: ",
+    "uk_UA": "Папка: ",
+    "ja_JP": "フォルダー：",
+    "ko_KR": "폴더: ",
+    "hi_IN": "फ़ोल्डर: ",
+    "bn_BD": "ফোল্ডার: ",
+    "it_IT": "Cartella: ",
+    "fr_FR": "Dossier : ",
+    "de_DE": "Ordner: ",
+    "pt_PT": "Pasta: ",
+    "ar_SA": "المجلد: ",
+    "vi_VN": "Thư mục: ",
+    "fa_IR": "پوشه: ",
+    "id_ID": "Folder: ",
+    "ms_MY": "Folder: ",
+    "th_TH": "โฟลเดอร์: ",
+    "ur_PK": "فولڈر: ",
+}
+
+ADDITIONAL_ARGUMENTS_LABEL = {
+    "en_US": "Additional arguments: ",
+    "es_ES": "Argumentos adicionales: ",
+    "tr_TR": "Ek argümanlar: ",
+    "zh_CN": "附加参数：",
+    "zh_TW": "附加參數：",
+    "ru_RU": "Дополнительные аргументы: ",
+    "pl_PL": "Dodatkowe argumenty: ",
+    "uk_UA": "Додаткові аргументи: ",
+    "ja_JP": "追加引数：",
+    "ko_KR": "추가 인수: ",
+    "hi_IN": "अतिरिक्त तर्क: ",
+    "bn_BD": "অতিরিক্ত আর্গুমেন্ট: ",
+    "it_IT": "Argomenti aggiuntivi: ",
+    "fr_FR": "Arguments supplémentaires : ",
+    "de_DE": "Zusätzliche Argumente: ",
+    "pt_PT": "Argumentos adicionais: ",
+    "ar_SA": "معاملات إضافية: ",
+    "vi_VN": "Tham số bổ sung: ",
+    "fa_IR": "آرگومان‌های اضافی: ",
+    "id_ID": "Argumen tambahan: ",
+    "ms_MY": "Argumen tambahan: ",
+    "th_TH": "อาร์กิวเมนต์เพิ่มเติม: ",
+    "ur_PK": "اضافی دلائل: ",
+}
+
+SYNC_STARTED_LABEL = {
+    "en_US": "Sync started:",
+    "es_ES": "Sincronización iniciada:",
+    "tr_TR": "Senkronizasyon başladı:",
+    "zh_CN": "同步已开始：",
+    "zh_TW": "同步已開始：",
+    "ru_RU": "Синхронизация начата:",
+    "pl_PL": "Rozpoczęto synchronizację:",
+    "uk_UA": "Синхронізація розпочата:",
+    "ja_JP": "同期開始：",
+    "ko_KR": "동기화 시작:",
+    "hi_IN": "सिंक शुरू हुआ:",
+    "bn_BD": "সিঙ্ক শুরু হয়েছে:",
+    "it_IT": "Sincronizzazione avviata:",
+    "fr_FR": "Synchronisation commencée :",
+    "de_DE": "Synchronisierung gestartet:",
+    "pt_PT": "Sincronização iniciada:",
+    "ar_SA": "بدأت المزامنة:",
+    "vi_VN": "Đã bắt đầu đồng bộ:",
+    "fa_IR": "همگام‌سازی آغاز شد:",
+    "id_ID": "Sinkronisasi dimulai:",
+    "ms_MY": "Penyegerakan bermula:",
+    "th_TH": "เริ่มการซิงค์:",
+    "ur_PK": "سنک شروع ہو گئی:",
+}
+
+SYNC_COMPLETED_SUCCESSFULLY = {
+    "en_US": "Synchronization completed successfully.",
+    "es_ES": "Sincronización completada con éxito.",
+    "tr_TR": "Senkronizasyon başarıyla tamamlandı.",
+    "zh_CN": "同步成功完成。",
+    "zh_TW": "同步成功完成。",
+    "ru_RU": "Синхронизация успешно завершена.",
+    "pl_PL": "Synchronizacja zakończona pomyślnie.",
+    "uk_UA": "Синхронізація успішно завершена.",
+    "ja_JP": "同期が正常に完了しました。",
+    "ko_KR": "동기화가 성공적으로 완료되었습니다.",
+    "hi_IN": "सिंक सफलतापूर्वक पूर्ण हुआ।",
+    "bn_BD": "সিঙ্ক সফলভাবে সম্পন্ন হয়েছে।",
+    "it_IT": "Sincronizzazione completata con successo.",
+    "fr_FR": "Synchronisation terminée avec succès.",
+    "de_DE": "Synchronisierung erfolgreich abgeschlossen.",
+    "pt_PT": "Sincronização concluída com sucesso.",
+    "ar_SA": "اكتملت المزامنة بنجاح.",
+    "vi_VN": "Đồng bộ hóa thành công.",
+    "fa_IR": "همگام‌سازی با موفقیت انجام شد.",
+    "id_ID": "Sinkronisasi berhasil diselesaikan.",
+    "ms_MY": "Penyegerakan berjaya diselesaikan.",
+    "th_TH": "ซิงค์เสร็จสมบูรณ์แล้ว",
+    "ur_PK": "سنک کامیابی سے مکمل ہو گئی۔",
+}
+
+SAVED_TO_LABEL = {
+    "en_US": "Saved to: {output}",
+    "es_ES": "Guardado en: {output}",
+    "tr_TR": "Kaydedildi: {output}",
+    "zh_CN": "已保存到：{output}",
+    "zh_TW": "已儲存至：{output}",
+    "ru_RU": "Сохранено в: {output}",
+    "pl_PL": "Zapisano do: {output}",
+    "uk_UA": "Збережено в: {output}",
+    "ja_JP": "保存先: {output}",
+    "ko_KR": "저장 위치: {output}",
+    "hi_IN": "यहाँ सहेजा गया: {output}",
+    "bn_BD": "এখানে সংরক্ষিত: {output}",
+    "it_IT": "Salvato in: {output}",
+    "fr_FR": "Enregistré dans : {output}",
+    "de_DE": "Gespeichert unter: {output}",
+    "pt_PT": "Guardado em: {output}",
+    "ar_SA": "تم الحفظ في: {output}",
+    "vi_VN": "Đã lưu tại: {output}",
+    "fa_IR": "ذخیره شد در: {output}",
+    "id_ID": "Disimpan di: {output}",
+    "ms_MY": "Disimpan ke: {output}",
+    "th_TH": "บันทึกที่: {output}",
+    "ur_PK": "یہاں محفوظ کیا گیا: {output}",
+}
+
+
+############### gui_batch_mode.py ###############
+
+
+PAIRS_HEADER_LABEL = {
+    "en_US": "Pairs (Valid: {valid}, Invalid: {invalid}, Skipped: {skipped})",
+    "es_ES": "Pares (Válidos: {valid}, Inválidos: {invalid}, Omitidos: {skipped})",
+    "tr_TR": "Eşler (Geçerli: {valid}, Geçersiz: {invalid}, Atlanan: {skipped})",
+    "zh_CN": "配对（有效: {valid}，无效: {invalid}，跳过: {skipped}）",
+    "zh_TW": "配對 (有效: {valid}, 無效: {invalid}, 跳過: {skipped})",
+    "ru_RU": "Пары (Валидных: {valid}, Невалидных: {invalid}, Пропущено: {skipped})",
+    "pl_PL": "Pary (Poprawnych: {valid}, Niepoprawnych: {invalid}, Pominiętych: {skipped})",
+    "uk_UA": "Пари (Дійсних: {valid}, Недійсних: {invalid}, Пропущено: {skipped})",
+    "ja_JP": "ペア（有効: {valid}, 無効: {invalid}, スキップ: {skipped}）",
+    "ko_KR": "쌍 (유효: {valid}, 무효: {invalid}, 건너뜀: {skipped})",
+    "hi_IN": "जोड़े (मान्य: {valid}, अमान्य: {invalid}, छोड़े गए: {skipped})",
+    "bn_BD": "জোড়া (বৈধ: {valid}, অবৈধ: {invalid}, এড়িয়ে যাওয়া: {skipped})",
+    "it_IT": "Coppie (Valide: {valid}, Non valide: {invalid}, Saltate: {skipped})",
+    "fr_FR": "Paires (Valides: {valid}, Invalides: {invalid}, Ignorées: {skipped})",
+    "de_DE": "Paare (Gültig: {valid}, Ungültig: {invalid}, Übersprungen: {skipped})",
+    "pt_PT": "Pares (Válidos: {valid}, Inválidos: {invalid}, Ignorados: {skipped})",
+    "ar_SA": "أزواج (صالحة: {valid}، غير صالحة: {invalid}، تم تخطيها: {skipped})",
+    "vi_VN": "Cặp (Hợp lệ: {valid}, Không hợp lệ: {invalid}, Bỏ qua: {skipped})",
+    "fa_IR": "جفت‌ها (معتبر: {valid}، نامعتبر: {invalid}، نادیده گرفته شده: {skipped})",
+    "id_ID": "Pasangan (Valid: {valid}, Tidak valid: {invalid}, Dilewati: {skipped})",
+    "ms_MY": "Pasangan (Sah: {valid}, Tidak sah: {invalid}, Dilangkau: {skipped})",
+    "th_TH": "คู่ (ถูกต้อง: {valid}, ไม่ถูกต้อง: {invalid}, ข้าม: {skipped})",
+    "ur_PK": "جوڑے (درست: {valid}، غلط: {invalid}، چھوڑے گئے: {skipped})",
+}
+
+BATCH_PAIR_STATUS_INVALID_LABEL = {
+    "en_US": "{id_text} Status: Invalid\n{message}",
+    "es_ES": "{id_text} Estado: Inválido\n{message}",
+    "tr_TR": "{id_text} Durum: Geçersiz\n{message}",
+    "zh_CN": "{id_text} 状态：无效\n{message}",
+    "zh_TW": "{id_text} 狀態：無效\n{message}",
+    "ru_RU": "{id_text} Статус: Недействительно\n{message}",
+    "pl_PL": "{id_text} Status: Nieprawidłowy\n{message}",
+    "uk_UA": "{id_text} Статус: Недійсний\n{message}",
+    "ja_JP": "{id_text} ステータス: 無効\n{message}",
+    "ko_KR": "{id_text} 상태: 잘못됨\n{message}",
+    "hi_IN": "{id_text} स्थिति: अमान्य\n{message}",
+    "bn_BD": "{id_text} অবস্থা: অবৈধ\n{message}",
+    "it_IT": "{id_text} Stato: Non valido\n{message}",
+    "fr_FR": "{id_text} Statut : Invalide\n{message}",
+    "de_DE": "{id_text} Status: Ungültig\n{message}",
+    "pt_PT": "{id_text} Estado: Inválido\n{message}",
+    "ar_SA": "{id_text} الحالة: غير صالح\n{message}",
+    "vi_VN": "{id_text} Trạng thái: Không hợp lệ\n{message}",
+    "fa_IR": "{id_text} وضعیت: نامعتبر\n{message}",
+    "id_ID": "{id_text} Status: Tidak valid\n{message}",
+    "ms_MY": "{id_text} Status: Tidak sah\n{message}",
+    "th_TH": "{id_text} สถานะ: ไม่ถูกต้อง\n{message}",
+    "ur_PK": "{id_text} اسٹیٹس: غلط\n{message}",
+}
+
+BATCH_PAIR_STATUS_VALID_LABEL = {
+    "en_US": "{id_text} Status: Valid",
+    "es_ES": "{id_text} Estado: Válido",
+    "tr_TR": "{id_text} Durum: Geçerli",
+    "zh_CN": "{id_text} 状态：有效",
+    "zh_TW": "{id_text} 狀態：有效",
+    "ru_RU": "{id_text} Статус: Действительно",
+    "pl_PL": "{id_text} Status: Prawidłowy",
+    "uk_UA": "{id_text} Статус: Дійсний",
+    "ja_JP": "{id_text} ステータス: 有効",
+    "ko_KR": "{id_text} 상태: 올바름",
+    "hi_IN": "{id_text} स्थिति: मान्य",
+    "bn_BD": "{id_text} অবস্থা: বৈধ",
+    "it_IT": "{id_text} Stato: Valido",
+    "fr_FR": "{id_text} Statut : Valide",
+    "de_DE": "{id_text} Status: Gültig",
+    "pt_PT": "{id_text} Estado: Válido",
+    "ar_SA": "{id_text} الحالة: صالح",
+    "vi_VN": "{id_text} Trạng thái: Hợp lệ",
+    "fa_IR": "{id_text} وضعیت: معتبر",
+    "id_ID": "{id_text} Status: Valid",
+    "ms_MY": "{id_text} Status: Sah",
+    "th_TH": "{id_text} สถานะ: ถูกต้อง",
+    "ur_PK": "{id_text} اسٹیٹس: درست",
+}
+
+BATCH_PAIR_STATUS_SKIPPED_LABEL = {
+    "en_US": "{id_text} Status: Skipped (already processed)",
+    "es_ES": "{id_text} Estado: Omitido (ya procesado)",
+    "tr_TR": "{id_text} Durum: Atlandı (zaten işlendi)",
+    "zh_CN": "{id_text} 状态：已跳过（已处理）",
+    "zh_TW": "{id_text} 狀態：已跳過 (已處理)",
+    "ru_RU": "{id_text} Статус: Пропущено (уже обработано)",
+    "pl_PL": "{id_text} Status: Pominięto (już przetworzone)",
+    "uk_UA": "{id_text} Статус: Пропущено (вже оброблено)",
+    "ja_JP": "{id_text} ステータス: スキップ（処理済み）",
+    "ko_KR": "{id_text} 상태: 건너뜀 (이미 처리됨)",
+    "hi_IN": "{id_text} स्थिति: छोड़ा गया (पहले से संसाधित)",
+    "bn_BD": "{id_text} অবস্থা: এড়িয়ে গেছে (ইতিমধ্যে প্রসেস করা হয়েছে)",
+    "it_IT": "{id_text} Stato: Saltato (già elaborato)",
+    "fr_FR": "{id_text} Statut : Ignoré (déjà traité)",
+    "de_DE": "{id_text} Status: Übersprungen (bereits verarbeitet)",
+    "pt_PT": "{id_text} Estado: Ignorado (já processado)",
+    "ar_SA": "{id_text} الحالة: تم تخطيه (تمت معالجته بالفعل)",
+    "vi_VN": "{id_text} Trạng thái: Bỏ qua (đã xử lý)",
+    "fa_IR": "{id_text} وضعیت: نادیده گرفته شده (قبلاً پردازش شده)",
+    "id_ID": "{id_text} Status: Dilewati (sudah diproses)",
+    "ms_MY": "{id_text} Status: Dilangkau (sudah diproses)",
+    "th_TH": "{id_text} สถานะ: ข้าม (ประมวลผลแล้ว)",
+    "ur_PK": "{id_text} اسٹیٹس: چھوڑ دیا گیا (پہلے ہی پراسیس ہو چکا)",
+}
+
+BATCH_VALIDATE_ADD_SUBTITLE = {
+    "en_US": "Add a subtitle file to this item",
+    "es_ES": "Agregue un archivo de subtítulos a este elemento",
+    "tr_TR": "Bu öğeye bir altyazı dosyası ekleyin",
+    "zh_CN": "为此项目添加字幕文件",
+    "zh_TW": "為此項目添加字幕檔案",
+    "ru_RU": "Добавьте файл субтитров к этому элементу",
+    "pl_PL": "Dodaj plik napisów do tego elementu",
+    "uk_UA": "Додайте файл субтитрів до цього елемента",
+    "ja_JP": "この項目に字幕ファイルを追加してください",
+    "ko_KR": "이 항목에 자막 파일을 추가하세요",
+    "hi_IN": "इस आइटम में एक सबटाइटल फ़ाइल जोड़ें",
+    "bn_BD": "এই আইটেমে একটি সাবটাইটেল ফাইল যোগ করুন",
+    "it_IT": "Aggiungi un file di sottotitoli a questo elemento",
+    "fr_FR": "Ajoutez un fichier de sous-titres à cet élément",
+    "de_DE": "Fügen Sie diesem Element eine Untertiteldatei hinzu",
+    "pt_PT": "Adicione um arquivo de legenda a este item",
+    "ar_SA": "أضف ملف ترجمة إلى هذا العنصر",
+    "vi_VN": "Thêm tệp phụ đề vào mục này",
+    "fa_IR": "یک فایل زیرنویس به این مورد اضافه کنید",
+    "id_ID": "Tambahkan file subtitle ke item ini",
+    "ms_MY": "Tambah fail sari kata ke item ini",
+    "th_TH": "เพิ่มไฟล์คำบรรยายให้กับรายการนี้",
+    "ur_PK": "اس آئٹم میں سب ٹائٹل فائل شامل کریں",
+}
+
+BATCH_VALIDATE_TOO_MANY_FILES = {
+    "en_US": "Too many files - keep only one subtitle per item",
+    "es_ES": "Demasiados archivos: mantenga solo un subtítulo por elemento",
+    "tr_TR": "Çok fazla dosya - her öğede yalnızca bir altyazı bulunmalı",
+    "zh_CN": "文件过多 - 每个项目只保留一个字幕",
+    "zh_TW": "檔案過多 - 每個項目只保留一個字幕",
+    "ru_RU": "Слишком много файлов — оставьте только один субтитр на элемент",
+    "pl_PL": "Za dużo plików - zachowaj tylko jeden napis na element",
+    "uk_UA": "Забагато файлів — залиште лише один субтитр на елемент",
+    "ja_JP": "ファイルが多すぎます - 各項目に1つの字幕のみを保持してください",
+    "ko_KR": "파일이 너무 많습니다 - 항목당 자막 하나만 유지하세요",
+    "hi_IN": "बहुत सारी फ़ाइलें - प्रति आइटम केवल एक सबटाइटल रखें",
+    "bn_BD": "অনেক বেশি ফাইল - প্রতি আইটেমে শুধুমাত্র একটি সাবটাইটেল রাখুন",
+    "it_IT": "Troppi file: mantieni solo un sottotitolo per elemento",
+    "fr_FR": "Trop de fichiers - gardez un seul sous-titre par élément",
+    "de_DE": "Zu viele Dateien – behalten Sie nur einen Untertitel pro Element",
+    "pt_PT": "Muitos arquivos - mantenha apenas uma legenda por item",
+    "ar_SA": "عدد كبير جدًا من الملفات - احتفظ بترجمة واحدة فقط لكل عنصر",
+    "vi_VN": "Quá nhiều tệp - chỉ giữ một phụ đề cho mỗi mục",
+    "fa_IR": "فایل‌های زیاد - فقط یک زیرنویس برای هر مورد نگه دارید",
+    "id_ID": "Terlalu banyak file - simpan hanya satu subtitle per item",
+    "ms_MY": "Terlalu banyak fail - simpan satu sari kata sahaja setiap item",
+    "th_TH": "ไฟล์มากเกินไป - ให้มีคำบรรยายเพียงไฟล์เดียวต่อรายการ",
+    "ur_PK": "بہت زیادہ فائلیں - ہر آئٹم کے لیے صرف ایک سب ٹائٹل رکھیں",
+}
+
+BATCH_VALIDATE_NESTED_NOT_ALLOWED = {
+    "en_US": "Nested items not allowed - remove extra levels",
+    "es_ES": "No se permiten elementos anidados: elimine los niveles adicionales",
+    "tr_TR": "İç içe öğelere izin verilmez - fazladan seviyeleri kaldırın",
+    "zh_CN": "不允许嵌套项目 - 请移除多余层级",
+    "zh_TW": "不允許巢狀項目 - 請移除多餘層級",
+    "ru_RU": "Вложенные элементы не допускаются — удалите лишние уровни",
+    "pl_PL": "Zagnieżdżone elementy niedozwolone - usuń dodatkowe poziomy",
+    "uk_UA": "Вкладені елементи не дозволені — видаліть зайві рівні",
+    "ja_JP": "ネストされた項目は許可されていません - 余分なレベルを削除してください",
+    "ko_KR": "중첩된 항목은 허용되지 않습니다 - 추가 레벨을 제거하세요",
+    "hi_IN": "नेस्टेड आइटम्स की अनुमति नहीं है - अतिरिक्त स्तर हटाएं",
+    "bn_BD": "নেস্টেড আইটেম অনুমোদিত নয় - অতিরিক্ত স্তর সরান",
+    "it_IT": "Elementi annidati non consentiti: rimuovere i livelli extra",
+    "fr_FR": "Éléments imbriqués non autorisés - supprimez les niveaux supplémentaires",
+    "de_DE": "Verschachtelte Elemente nicht erlaubt – entfernen Sie zusätzliche Ebenen",
+    "pt_PT": "Itens aninhados não permitidos - remova níveis extras",
+    "ar_SA": "العناصر المتداخلة غير مسموح بها - أزل المستويات الإضافية",
+    "vi_VN": "Không cho phép mục lồng nhau - hãy xóa các cấp bổ sung",
+    "fa_IR": "آیتم‌های تو در تو مجاز نیستند - سطوح اضافی را حذف کنید",
+    "id_ID": "Item bersarang tidak diizinkan - hapus level tambahan",
+    "ms_MY": "Item bersarang tidak dibenarkan - buang aras tambahan",
+    "th_TH": "ไม่อนุญาตให้มีรายการซ้อนกัน - ลบระดับที่เกินออก",
+    "ur_PK": "نیسٹڈ آئٹمز کی اجازت نہیں - اضافی لیول ہٹا دیں",
+}
+
+BATCH_VALIDATE_VIDEO_NOT_ALLOWED = {
+    "en_US": "Video files cannot be children - add a subtitle instead",
+    "es_ES": "Los archivos de vídeo no pueden ser secundarios: agregue un subtítulo",
+    "tr_TR": "Video dosyaları alt öğe olamaz - bunun yerine altyazı ekleyin",
+    "zh_CN": "视频文件不能作为子项 - 请添加字幕",
+    "zh_TW": "影片檔案不能作為子項 - 請改為添加字幕",
+    "ru_RU": "Видеофайлы не могут быть дочерними — добавьте субтитры",
+    "pl_PL": "Pliki wideo nie mogą być dziećmi - dodaj napis",
+    "uk_UA": "Відеофайли не можуть бути дочірніми — додайте субтитри",
+    "ja_JP": "ビデオファイルは子にできません - 字幕を追加してください",
+    "ko_KR": "비디오 파일은 자식이 될 수 없습니다 - 자막을 추가하세요",
+    "hi_IN": "वीडियो फ़ाइलें चाइल्ड नहीं हो सकतीं - इसके बजाय सबटाइटल जोड़ें",
+    "bn_BD": "ভিডিও ফাইল চাইল্ড হতে পারে না - পরিবর্তে সাবটাইটেল যোগ করুন",
+    "it_IT": "I file video non possono essere figli: aggiungi un sottotitolo",
+    "fr_FR": "Les fichiers vidéo ne peuvent pas être des enfants - ajoutez un sous-titre",
+    "de_DE": "Videodateien können keine Kinder sein – fügen Sie stattdessen Untertitel hinzu",
+    "pt_PT": "Arquivos de vídeo não podem ser filhos - adicione uma legenda",
+    "ar_SA": "لا يمكن أن تكون ملفات الفيديو عناصر فرعية - أضف ترجمة بدلاً من ذلك",
+    "vi_VN": "Tệp video không thể là con - hãy thêm phụ đề",
+    "fa_IR": "فایل‌های ویدیو نمی‌توانند زیرمجموعه باشند - به جای آن زیرنویس اضافه کنید",
+    "id_ID": "File video tidak dapat menjadi anak - tambahkan subtitle",
+    "ms_MY": "Fail video tidak boleh menjadi anak - tambah sari kata",
+    "th_TH": "ไฟล์วิดีโอไม่สามารถเป็นลูกได้ - เพิ่มคำบรรยายแทน",
+    "ur_PK": "ویڈیو فائلیں چائلڈ نہیں ہو سکتیں - سب ٹائٹل شامل کریں",
+}
+
+BATCH_VALIDATE_MISSING_FILE_PATH = {
+    "en_US": "Missing file path",
+    "es_ES": "Falta la ruta del archivo",
+    "tr_TR": "Dosya yolu eksik",
+    "zh_CN": "缺少文件路径",
+    "zh_TW": "缺少檔案路徑",
+    "ru_RU": "Отсутствует путь к файлу",
+    "pl_PL": "Brak ścieżki do pliku",
+    "uk_UA": "Відсутній шлях до файлу",
+    "ja_JP": "ファイルパスがありません",
+    "ko_KR": "파일 경로가 없습니다",
+    "hi_IN": "फ़ाइल पथ गुम है",
+    "bn_BD": "ফাইল পাথ নেই",
+    "it_IT": "Percorso file mancante",
+    "fr_FR": "Chemin de fichier manquant",
+    "de_DE": "Dateipfad fehlt",
+    "pt_PT": "Caminho do arquivo ausente",
+    "ar_SA": "مسار الملف مفقود",
+    "vi_VN": "Thiếu đường dẫn tệp",
+    "fa_IR": "مسیر فایل وجود ندارد",
+    "id_ID": "Jalur file hilang",
+    "ms_MY": "Laluan fail tiada",
+    "th_TH": "ไม่มีเส้นทางไฟล์",
+    "ur_PK": "فائل کا راستہ غائب ہے",
+}
+
+BATCH_VALIDATE_SAME_FILE = {
+    "en_US": "Parent and subtitle cannot be the same file",
+    "es_ES": "El archivo principal y el subtítulo no pueden ser el mismo archivo",
+    "tr_TR": "Ana dosya ve altyazı aynı dosya olamaz",
+    "zh_CN": "父文件和字幕不能是同一个文件",
+    "zh_TW": "父項和字幕不能是同一個檔案",
+    "ru_RU": "Исходный файл и субтитры не могут быть одним и тем же файлом",
+    "pl_PL": "Plik główny i napisy nie mogą być tym samym plikiem",
+    "uk_UA": "Основний файл і субтитри не можуть бути одним файлом",
+    "ja_JP": "親ファイルと字幕は同じファイルにできません",
+    "ko_KR": "부모와 자막은 같은 파일일 수 없습니다",
+    "hi_IN": "पैरेंट और सबटाइटल एक ही फ़ाइल नहीं हो सकते",
+    "bn_BD": "প্যারেন্ট এবং সাবটাইটেল একই ফাইল হতে পারে না",
+    "it_IT": "Il file principale e il sottotitolo non possono essere lo stesso file",
+    "fr_FR": "Le parent et le sous-titre ne peuvent pas être le même fichier",
+    "de_DE": "Hauptdatei und Untertitel dürfen nicht dieselbe Datei sein",
+    "pt_PT": "O ficheiro principal e a legenda não podem ser o mesmo ficheiro",
+    "ar_SA": "لا يمكن أن يكون الملف الرئيسي والترجمة نفس الملف",
+    "vi_VN": "Tệp cha và phụ đề không thể là cùng một tệp",
+    "fa_IR": "فایل والد و زیرنویس نمی‌توانند یکسان باشند",
+    "id_ID": "File induk dan subtitle tidak boleh sama",
+    "ms_MY": "Fail induk dan sari kata tidak boleh sama",
+    "th_TH": "ไฟล์หลักและคำบรรยายต้องไม่ใช่ไฟล์เดียวกัน",
+    "ur_PK": "پیرنٹ اور سب ٹائٹل ایک ہی فائل نہیں ہو سکتے",
+}
+
+BATCH_VALIDATE_CHILD_NOT_SUBTITLE = {
+    "en_US": "Child must be a subtitle file",
+    "es_ES": "El archivo secundario debe ser un archivo de subtítulos",
+    "tr_TR": "Alt öğe bir altyazı dosyası olmalıdır",
+    "zh_CN": "子项必须是字幕文件",
+    "zh_TW": "子項必須是字幕檔案",
+    "ru_RU": "Дочерний элемент должен быть файлом субтитров",
+    "pl_PL": "Element podrzędny musi być plikiem napisów",
+    "uk_UA": "Дочірній елемент має бути файлом субтитрів",
+    "ja_JP": "子は字幕ファイルでなければなりません",
+    "ko_KR": "자식은 자막 파일이어야 합니다",
+    "hi_IN": "चाइल्ड एक सबटाइटल फ़ाइल होना चाहिए",
+    "bn_BD": "চাইল্ড অবশ্যই একটি সাবটাইটেল ফাইল হতে হবে",
+    "it_IT": "Il file figlio deve essere un file di sottotitoli",
+    "fr_FR": "L'enfant doit être un fichier de sous-titres",
+    "de_DE": "Das Kindelement muss eine Untertiteldatei sein",
+    "pt_PT": "O ficheiro filho deve ser um ficheiro de legendas",
+    "ar_SA": "يجب أن يكون العنصر الفرعي ملف ترجمة",
+    "vi_VN": "Tệp con phải là tệp phụ đề",
+    "fa_IR": "فرزند باید یک فایل زیرنویس باشد",
+    "id_ID": "Anak harus berupa file subtitle",
+    "ms_MY": "Anak mesti fail sari kata",
+    "th_TH": "ไฟล์ลูกต้องเป็นไฟล์คำบรรยาย",
+    "ur_PK": "چائلڈ کو سب ٹائٹل فائل ہونا چاہیے",
+}
+
+BATCH_VALIDATE_DUPLICATE_CHILD = {
+    "en_US": "Duplicate subtitle files found - remove duplicates",
+    "es_ES": "Se encontraron archivos de subtítulos duplicados - elimine los duplicados",
+    "tr_TR": "Yinelenen altyazı dosyaları bulundu - yinelenenleri kaldırın",
+    "zh_CN": "发现重复的字幕文件 - 请移除重复项",
+    "zh_TW": "發現重複的字幕檔案 - 請移除重複項",
+    "ru_RU": "Найдены дублирующиеся субтитры - удалите дубликаты",
+    "pl_PL": "Znaleziono zduplikowane pliki napisów - usuń duplikaty",
+    "uk_UA": "Знайдено дублікати субтитрів - видаліть дублікати",
+    "ja_JP": "重複した字幕ファイルが見つかりました - 重複を削除してください",
+    "ko_KR": "중복된 자막 파일이 발견되었습니다 - 중복을 제거하세요",
+    "hi_IN": "डुप्लिकेट सबटाइटल फ़ाइलें मिलीं - डुप्लिकेट हटाएं",
+    "bn_BD": "ডুপ্লিকেট সাবটাইটেল ফাইল পাওয়া গেছে - ডুপ্লিকেট সরান",
+    "it_IT": "Trovati file di sottotitoli duplicati - rimuovere i duplicati",
+    "fr_FR": "Fichiers de sous-titres en double trouvés - supprimez les doublons",
+    "de_DE": "Doppelte Untertiteldateien gefunden - Duplikate entfernen",
+    "pt_PT": "Arquivos de legendas duplicados encontrados - remova os duplicados",
+    "ar_SA": "تم العثور على ملفات ترجمة مكررة - أزل التكرارات",
+    "vi_VN": "Tìm thấy tệp phụ đề trùng lặp - xóa các bản trùng",
+    "fa_IR": "فایل‌های زیرنویس تکراری یافت شد - تکراری‌ها را حذف کنید",
+    "id_ID": "File subtitle duplikat ditemukan - hapus duplikat",
+    "ms_MY": "Fail sari kata pendua ditemui - buang pendua",
+    "th_TH": "พบไฟล์คำบรรยายซ้ำ - ลบรายการที่ซ้ำออก",
+    "ur_PK": "ڈپلیکیٹ سب ٹائٹل فائلیں ملیں - ڈپلیکیٹ ہٹائیں",
+}
+
+DUPLICATE_PREFIX = {
+    "en_US": "(Duplicate)",
+    "es_ES": "(Duplicado)",
+    "tr_TR": "(Yinelenen)",
+    "zh_CN": "(重复)",
+    "zh_TW": "(重複)",
+    "ru_RU": "(Дубликат)",
+    "pl_PL": "(Duplikat)",
+    "uk_UA": "(Дублікат)",
+    "ja_JP": "(重複)",
+    "ko_KR": "(중복)",
+    "hi_IN": "(डुप्लिकेट)",
+    "bn_BD": "(ডুপ্লিकেট)",
+    "it_IT": "(Duplicato)",
+    "fr_FR": "(Doublon)",
+    "de_DE": "(Duplikat)",
+    "pt_PT": "(Duplicado)",
+    "ar_SA": "(مكرر)",
+    "vi_VN": "(Trùng lặp)",
+    "fa_IR": "(تکراری)",
+    "id_ID": "(Duplikat)",
+    "ms_MY": "(Pendua)",
+    "th_TH": "(ซ้ำ)",
+    "ur_PK": "(ڈپلیکیٹ)",
+}
+
+BATCH_VALIDATE_DUPLICATE_PAIR = {
+    "en_US": "This pair already exists",
+    "es_ES": "Este par ya existe",
+    "tr_TR": "Bu eşleşme zaten mevcut",
+    "zh_CN": "该配对已存在",
+    "zh_TW": "此配對已存在",
+    "ru_RU": "Эта пара уже существует",
+    "pl_PL": "Ta para już istnieje",
+    "uk_UA": "Ця пара вже існує",
+    "ja_JP": "このペアは既に存在します",
+    "ko_KR": "이 쌍은 이미 존재합니다",
+    "hi_IN": "यह जोड़ा पहले से मौजूद है",
+    "bn_BD": "এই জোড়াটি ইতিমধ্যেই বিদ্যমান",
+    "it_IT": "Questa coppia esiste già",
+    "fr_FR": "Cette paire existe déjà",
+    "de_DE": "Dieses Paar existiert bereits",
+    "pt_PT": "Este par já existe",
+    "ar_SA": "هذا الزوج موجود بالفعل",
+    "vi_VN": "Cặp này đã tồn tại",
+    "fa_IR": "این جفت قبلاً وجود دارد",
+    "id_ID": "Pasangan ini sudah ada",
+    "ms_MY": "Pasangan ini sudah wujud",
+    "th_TH": "คู่นี้มีอยู่แล้ว",
+    "ur_PK": "یہ جوڑا پہلے سے موجود ہے",
+}
+
+ADD_FILES = {
+    "en_US": "Add files",
+    "es_ES": "Añadir archivos",
+    "tr_TR": "Dosya ekle",
+    "zh_CN": "添加文件",
+    "zh_TW": "添加檔案",
+    "ru_RU": "Добавить файлы",
+    "pl_PL": "Dodaj pliki",
+    "uk_UA": "Додати файли",
+    "ja_JP": "ファイルを追加",
+    "ko_KR": "파일 추가",
+    "hi_IN": "फ़ाइलें जोड़ें",
+    "bn_BD": "ফাইল যোগ করুন",
+    "it_IT": "Aggiungi file",
+    "fr_FR": "Ajouter des fichiers",
+    "de_DE": "Dateien hinzufügen",
+    "pt_PT": "Adicionar arquivos",
+    "ar_SA": "إضافة ملفات",
+    "vi_VN": "Thêm tập tin",
+    "fa_IR": "افزودن فایل‌ها",
+    "id_ID": "Tambahkan file",
+    "ms_MY": "Tambah fail",
+    "th_TH": "เพิ่มไฟล์",
+    "ur_PK": "فائلیں شامل کریں",
+}
+
+UNDO = {
+    "en_US": "Undo",
+    "es_ES": "Deshacer",
+    "tr_TR": "Geri al",
+    "zh_CN": "撤销",
+    "zh_TW": "復原",
+    "ru_RU": "Отменить",
+    "pl_PL": "Cofnij",
+    "uk_UA": "Скасувати",
+    "ja_JP": "元に戻す",
+    "ko_KR": "실행 취소",
+    "hi_IN": "पूर्ववत करें",
+    "bn_BD": "পূর্বাবস্থায় ফেরান",
+    "it_IT": "Annulla",
+    "fr_FR": "Annuler",
+    "de_DE": "Rückgängig",
+    "pt_PT": "Desfazer",
+    "ar_SA": "تراجع",
+    "vi_VN": "Hoàn tác",
+    "fa_IR": "واگرد",
+    "id_ID": "Urungkan",
+    "ms_MY": "Buat asal",
+    "th_TH": "เลิกทำ",
+    "ur_PK": "واپس کریں",
+}
+
+REDO = {
+    "en_US": "Redo",
+    "es_ES": "Rehacer",
+    "tr_TR": "Yinele",
+    "zh_CN": "重做",
+    "zh_TW": "重做",
+    "ru_RU": "Повторить",
+    "pl_PL": "Ponów",
+    "uk_UA": "Повторити",
+    "ja_JP": "やり直す",
+    "ko_KR": "다시 실행",
+    "hi_IN": "फिर से करें",
+    "bn_BD": "পুনরায় করুন",
+    "it_IT": "Ripeti",
+    "fr_FR": "Rétablir",
+    "de_DE": "Wiederholen",
+    "pt_PT": "Refazer",
+    "ar_SA": "إعادة",
+    "vi_VN": "Làm lại",
+    "fa_IR": "انجام مجدد",
+    "id_ID": "Ulangi",
+    "ms_MY": "Buat semula",
+    "th_TH": "ทำซ้ำ",
+    "ur_PK": "دوبارہ کریں",
+}
+
+ADD_PAIR = {
+    "en_US": "Add pair",
+    "es_ES": "Añadir par",
+    "tr_TR": "Çift ekle",
+    "zh_CN": "添加配对",
+    "zh_TW": "添加配對",
+    "ru_RU": "Добавить пару",
+    "pl_PL": "Dodaj parę",
+    "uk_UA": "Додати пару",
+    "ja_JP": "ペアを追加",
+    "ko_KR": "쌍 추가",
+    "hi_IN": "जोड़ी जोड़ें",
+    "bn_BD": "জোড়া যোগ করুন",
+    "it_IT": "Aggiungi coppia",
+    "fr_FR": "Ajouter une paire",
+    "de_DE": "Paar hinzufügen",
+    "pt_PT": "Adicionar par",
+    "ar_SA": "إضافة زوج",
+    "vi_VN": "Thêm cặp",
+    "fa_IR": "افزودن جفت",
+    "id_ID": "Tambahkan pasangan",
+    "ms_MY": "Tambah pasangan",
+    "th_TH": "เพิ่มคู่",
+    "ur_PK": "جوڑا شامل کریں",
+}
+
+ADD_PAIR_CONTINUOUSLY = {
+    "en_US": "Add pair (continuously)",
+    "es_ES": "Añadir par (continuamente)",
+    "tr_TR": "Çift ekle (sürekli)",
+    "zh_CN": "连续添加配对",
+    "zh_TW": "連續添加配對",
+    "ru_RU": "Добавить пару (непрерывно)",
+    "pl_PL": "Dodaj parę (ciągle)",
+    "uk_UA": "Додати пару (безперервно)",
+    "ja_JP": "ペアを連続して追加",
+    "ko_KR": "쌍 추가 (계속)",
+    "hi_IN": "जोड़ी जोड़ें (लगातार)",
+    "bn_BD": "জোড়া যোগ করুন (অবিচ্ছিন্নভাবে)",
+    "it_IT": "Aggiungi coppia (continuamente)",
+    "fr_FR": "Ajouter une paire (en continu)",
+    "de_DE": "Paar hinzufügen (fortlaufend)",
+    "pt_PT": "Adicionar par (continuamente)",
+    "ar_SA": "إضافة زوج (باستمرار)",
+    "vi_VN": "Thêm cặp (liên tục)",
+    "fa_IR": "افزودن جفت (به طور مداوم)",
+    "id_ID": "Tambahkan pasangan (terus menerus)",
+    "ms_MY": "Tambah pasangan (berterusan)",
+    "th_TH": "เพิ่มคู่ (ต่อเนื่อง)",
+    "ur_PK": "جوڑا شامل کریں (مسلسل)",
+}
+
+ADD_FOLDER = {
+    "en_US": "Add folder",
+    "es_ES": "Añadir carpeta",
+    "tr_TR": "Klasör ekle",
+    "zh_CN": "添加文件夹",
+    "zh_TW": "添加資料夾",
+    "ru_RU": "Добавить папку",
+    "pl_PL": "Dodaj folder",
+    "uk_UA": "Додати папку",
+    "ja_JP": "フォルダーを追加",
+    "ko_KR": "폴더 추가",
+    "hi_IN": "फ़ोल्डर जोड़ें",
+    "bn_BD": "ফোল্ডার যোগ করুন",
+    "it_IT": "Aggiungi cartella",
+    "fr_FR": "Ajouter un dossier",
+    "de_DE": "Ordner hinzufügen",
+    "pt_PT": "Adicionar pasta",
+    "ar_SA": "إضافة مجلد",
+    "vi_VN": "Thêm thư mục",
+    "fa_IR": "افزودن پوشه",
+    "id_ID": "Tambahkan folder",
+    "ms_MY": "Tambah folder",
+    "th_TH": "เพิ่มโฟลเดอร์",
+    "ur_PK": "فولڈر شامل کریں",
+}
+
+ADD_MULTIPLE_FILES = {
+    "en_US": "Add multiple files",
+    "es_ES": "Añadir archivos múltiples",
+    "tr_TR": "Birden çok dosya ekle",
+    "zh_CN": "添加多个文件",
+    "zh_TW": "添加多個檔案",
+    "ru_RU": "Добавить несколько файлов",
+    "pl_PL": "Dodaj wiele plików",
+    "uk_UA": "Додати декілька файлів",
+    "ja_JP": "複数のファイルを追加",
+    "ko_KR": "여러 파일 추가",
+    "hi_IN": "कई फ़ाइलें जोड़ें",
+    "bn_BD": "একাধিক ফাইল যোগ করুন",
+    "it_IT": "Aggiungi più file",
+    "fr_FR": "Ajouter plusieurs fichiers",
+    "de_DE": "Mehrere Dateien hinzufügen",
+    "pt_PT": "Adicionar vários arquivos",
+    "ar_SA": "إضافة ملفات متعددة",
+    "vi_VN": "Thêm nhiều tập tin",
+    "fa_IR": "افزودن چند فایل",
+    "id_ID": "Tambahkan beberapa file",
+    "ms_MY": "Tambah berbilang fail",
+    "th_TH": "เพิ่มหลายไฟล์",
+    "ur_PK": "متعدد فائلیں شامل کریں",
+}
+
+AUTO_PAIRING_SEASON_EPISODE = {
+    "en_US": "Auto-Pairing with Season/Episode",
+    "es_ES": "Emparejamiento automático con temporada/episodio",
+    "tr_TR": "Sezon/Bölüm ile Otomatik Eşleştirme",
+    "zh_CN": "使用季/集自动配对",
+    "zh_TW": "使用季/集自動配對",
+    "ru_RU": "Автоматическое сопоставление по сезону/эпизоду",
+    "pl_PL": "Automatyczne parowanie z sezonem/odcinkiem",
+    "uk_UA": "Автоматичне створення пар за сезоном/епізодом",
+    "ja_JP": "シーズン/エピソードで自動ペアリング",
+    "ko_KR": "시즌/에피소드로 자동 페어링",
+    "hi_IN": "सीज़न/एपिसोड के साथ ऑटो-पेयरिंग",
+    "bn_BD": "সিজন/এপিসোড সহ অটো-পেয়ারিং",
+    "it_IT": "Associazione automatica con stagione/episodio",
+    "fr_FR": "Appairage automatique avec saison/épisode",
+    "de_DE": "Automatische Zuordnung mit Staffel/Episode",
+    "pt_PT": "Emparelhamento automático com temporada/episódio",
+    "ar_SA": "الاقتران التلقائي مع الموسم/الحلقة",
+    "vi_VN": "Tự động ghép nối theo Mùa/Tập",
+    "fa_IR": "جفت‌سازی خودکار با فصل/قسمت",
+    "id_ID": "Pemasangan Otomatis dengan Musim/Episode",
+    "ms_MY": "Ganding Auto dengan Musim/Episod",
+    "th_TH": "จับคู่อัตโนมัติด้วยซีซั่น/ตอน",
+    "ur_PK": "سیزن/ایپی سوڈ کے ساتھ خودکار جوڑا بنانا",
+}
+
+PAIR_MULTIPLE_SUBTITLES_WITH_SINGLE_SOURCE = {
+    "en_US": "Pair multiple subtitles with single source",
+    "es_ES": "Emparejar múltiples subtítulos con una sola fuente",
+    "tr_TR": "Birden fazla altyazıyı tek bir kaynağa eşleştir",
+    "zh_CN": "将多个字幕与单个源配对",
+    "zh_TW": "將多個字幕與單一來源配對",
+    "ru_RU": "Сопоставить несколько субтитров с одним источником",
+    "pl_PL": "Sparuj wiele napisów z jednym źródłem",
+    "uk_UA": "Сопоставити кілька субтитрів з одним джерелом",
+    "ja_JP": "複数の字幕を単一のソースとペアリング",
+    "ko_KR": "여러 자막을 단일 소스와 페어링",
+    "hi_IN": "एकल स्रोत के साथ कई उपशीर्षकों को जोड़ें",
+    "bn_BD": "একক উৎসের সাথে একাধিক সাবটাইটেল জোড়া",
+    "it_IT": "Associa più sottotitoli a una singola fonte",
+    "fr_FR": "Associer plusieurs sous-titres à une seule source",
+    "de_DE": "Mehrere Untertitel mit einer einzigen Quelle zuordnen",
+    "pt_PT": "Emparelhar vários legendas com uma única fonte",
+    "ar_SA": "ربط عدة ترجمات بمصدر واحد",
+    "vi_VN": "Ghép nhiều phụ đề với một nguồn",
+    "fa_IR": "جفت‌سازی چند زیرنویس با یک منبع",
+    "id_ID": "Pasangkan beberapa subtitle dengan satu sumber",
+    "ms_MY": "Pasangkan beberapa sari kata dengan satu sumber",
+    "th_TH": "จับคู่คำบรรยายหลายรายการกับแหล่งเดียว",
+    "ur_PK": "ایک ہی ماخذ کے ساتھ متعدد ذیلی عنوانات کو جوڑیں",
+}
+
+ADD_SUBTITLE_TO_ITEM = {
+    "en_US": "Add subtitle to this item",
+    "es_ES": "Añadir subtítulo a este elemento",
+    "tr_TR": "Bu öğeye altyazı ekle",
+    "zh_CN": "为该项目添加字幕",
+    "zh_TW": "為此項目添加字幕",
+    "ru_RU": "Добавить субтитры к этому элементу",
+    "pl_PL": "Dodaj napisy do tego elementu",
+    "uk_UA": "Додати субтитри до цього елемента",
+    "ja_JP": "このアイテムに字幕を追加",
+    "ko_KR": "이 항목에 자막 추가",
+    "hi_IN": "इस आइटम में सबटाइटल जोड़ें",
+    "bn_BD": "এই আইটেমে সাবটাইটেল যোগ করুন",
+    "it_IT": "Aggiungi sottotitolo a questo elemento",
+    "fr_FR": "Ajouter un sous-titre à cet élément",
+    "de_DE": "Untertitel zu diesem Element hinzufügen",
+    "pt_PT": "Adicionar legenda a este item",
+    "ar_SA": "أضف ترجمة إلى هذا العنصر",
+    "vi_VN": "Thêm phụ đề vào mục này",
+    "fa_IR": "افزودن زیرنویس به این مورد",
+    "id_ID": "Tambahkan subtitle ke item ini",
+    "ms_MY": "Tambah sari kata ke item ini",
+    "th_TH": "เพิ่มคำบรรยายในรายการนี้",
+    "ur_PK": "اس آئٹم میں سب ٹائٹل شامل کریں",
+}
+
+ADD_VIDEO_TO_ITEM = {
+    "en_US": "Add video to this item",
+    "es_ES": "Añadir vídeo a este elemento",
+    "tr_TR": "Bu öğeye video ekle",
+    "zh_CN": "为该项目添加视频",
+    "zh_TW": "為此項目添加影片",
+    "ru_RU": "Добавить видео к этому элементу",
+    "pl_PL": "Dodaj wideo do tego elementu",
+    "uk_UA": "Додати відео до цього елемента",
+    "ja_JP": "このアイテムにビデオを追加",
+    "ko_KR": "이 항목에 비디오 추가",
+    "hi_IN": "इस आइटम में वीडियो जोड़ें",
+    "bn_BD": "এই আইটেমে ভিডিও যোগ করুন",
+    "it_IT": "Aggiungi video a questo elemento",
+    "fr_FR": "Ajouter une vidéo à cet élément",
+    "de_DE": "Video zu diesem Element hinzufügen",
+    "pt_PT": "Adicionar vídeo a este item",
+    "ar_SA": "أضف فيديو إلى هذا العنصر",
+    "vi_VN": "Thêm video vào mục này",
+    "fa_IR": "افزودن ویدیو به این مورد",
+    "id_ID": "Tambahkan video ke item ini",
+    "ms_MY": "Tambah video ke item ini",
+    "th_TH": "เพิ่มวิดีโอในรายการนี้",
+    "ur_PK": "اس آئٹم میں ویڈیو شامل کریں",
+}
+
+CHANGE = {
+    "en_US": "Change",
+    "es_ES": "Cambiar",
+    "tr_TR": "Değiştir",
+    "zh_CN": "更改",
+    "zh_TW": "更改",
+    "ru_RU": "Изменить",
+    "pl_PL": "Zmień",
+    "uk_UA": "Змінити",
+    "ja_JP": "変更",
+    "ko_KR": "변경",
+    "hi_IN": "बदलें",
+    "bn_BD": "পরিবর্তন করুন",
+    "it_IT": "Cambia",
+    "fr_FR": "Changer",
+    "de_DE": "Ändern",
+    "pt_PT": "Alterar",
+    "ar_SA": "تغيير",
+    "vi_VN": "Thay đổi",
+    "fa_IR": "تغییر",
+    "id_ID": "Ubah",
+    "ms_MY": "Tukar",
+    "th_TH": "เปลี่ยนแปลง",
+    "ur_PK": "تبدیل کریں۔",
+}
+
+CHANGE_SELECTED = {
+    "en_US": "Change Selected",
+    "es_ES": "Cambiar seleccionado",
+    "tr_TR": "Seçileni değiştir",
+    "zh_CN": "更改所选",
+    "zh_TW": "更改所選",
+    "ru_RU": "Изменить выбранное",
+    "pl_PL": "Zmień zaznaczone",
+    "uk_UA": "Змінити вибране",
+    "ja_JP": "選択されたものを変更",
+    "ko_KR": "선택 항목 변경",
+    "hi_IN": "चयनित बदलें",
+    "bn_BD": "নির্বাচিত পরিবর্তন করুন",
+    "it_IT": "Cambia selezionato",
+    "fr_FR": "Modifier la sélection",
+    "de_DE": "Ausgewähltes ändern",
+    "pt_PT": "Alterar selecionado",
+    "ar_SA": "تغيير المحدد",
+    "vi_VN": "Thay đổi mục đã chọn",
+    "fa_IR": "تغییر انتخاب شده",
+    "id_ID": "Ubah yang dipilih",
+    "ms_MY": "Tukar yang dipilih",
+    "th_TH": "เปลี่ยนรายการที่เลือก",
+    "ur_PK": "منتخب کو تبدیل کریں۔",
+}
+
+REMOVE = {
+    "en_US": "Remove",
+    "es_ES": "Eliminar",
+    "tr_TR": "Kaldır",
+    "zh_CN": "移除",
+    "zh_TW": "移除",
+    "ru_RU": "Удалить",
+    "pl_PL": "Usuń",
+    "uk_UA": "Видалити",
+    "ja_JP": "削除",
+    "ko_KR": "제거",
+    "hi_IN": "हटाएं",
+    "bn_BD": "সরান",
+    "it_IT": "Rimuovi",
+    "fr_FR": "Supprimer",
+    "de_DE": "Entfernen",
+    "pt_PT": "Remover",
+    "ar_SA": "إزالة",
+    "vi_VN": "Xóa",
+    "fa_IR": "حذف",
+    "id_ID": "Hapus",
+    "ms_MY": "Alih keluar",
+    "th_TH": "ลบ",
+    "ur_PK": "ہٹائیں",
+}
+
+REMOVE_SELECTED_COUNT = {
+    "en_US": "Remove selected ({len})",
+    "es_ES": "Eliminar seleccionados ({len})",
+    "tr_TR": "Seçilenleri kaldır ({len})",
+    "zh_CN": "删除所选 ({len})",
+    "zh_TW": "移除所選 ({len})",
+    "ru_RU": "Удалить выбранные ({len})",
+    "pl_PL": "Usuń zaznaczone ({len})",
+    "uk_UA": "Видалити вибрані ({len})",
+    "ja_JP": "選択した項目を削除 ({len})",
+    "ko_KR": "선택된 항목 삭제 ({len})",
+    "hi_IN": "चयनित हटाएं ({len})",
+    "bn_BD": "নির্বাচিত সরান ({len})",
+    "it_IT": "Rimuovi selezionati ({len})",
+    "fr_FR": "Supprimer la sélection ({len})",
+    "de_DE": "Ausgewählte entfernen ({len})",
+    "pt_PT": "Remover selecionados ({len})",
+    "ar_SA": "إزالة المحدد ({len})",
+    "vi_VN": "Xóa mục đã chọn ({len})",
+    "fa_IR": "حذف انتخاب شده ({len})",
+    "id_ID": "Hapus yang dipilih ({len})",
+    "ms_MY": "Alih keluar yang dipilih ({len})",
+    "th_TH": "ลบรายการที่เลือก ({len})",
+    "ur_PK": "منتخب کو ہٹا دیں ({len})",
+}
+
+REMOVE_SELECTED = {
+    "en_US": "Remove selected",
+    "es_ES": "Eliminar seleccionados",
+    "tr_TR": "Seçilenleri kaldır",
+    "zh_CN": "删除所选",
+    "zh_TW": "移除所選",
+    "ru_RU": "Удалить выбранные",
+    "pl_PL": "Usuń zaznaczone",
+    "uk_UA": "Видалити вибрані",
+    "ja_JP": "選択した項目を削除",
+    "ko_KR": "선택된 항목 삭제",
+    "hi_IN": "चयनित हटाएं",
+    "bn_BD": "নির্বাচিত সরান",
+    "it_IT": "Rimuovi selezionati",
+    "fr_FR": "Supprimer la sélection",
+    "de_DE": "Ausgewählte entfernen",
+    "pt_PT": "Remover selecionados",
+    "ar_SA": "إزالة المحدد",
+    "vi_VN": "Xóa mục đã chọn",
+    "fa_IR": "حذف انتخاب شده",
+    "id_ID": "Hapus yang dipilih",
+    "ms_MY": "Alih keluar yang dipilih",
+    "th_TH": "ลบรายการที่เลือก",
+    "ur_PK": "منتخب کو ہٹا دیں",
+}
+
+INVALID_PAIR_TITLE = {
+    "en_US": "Invalid Pair",
+    "es_ES": "Par inválido",
+    "tr_TR": "Geçersiz eşleşme",
+    "zh_CN": "无效配对",
+    "zh_TW": "無效配對",
+    "ru_RU": "Недопустимая пара",
+    "pl_PL": "Nieprawidłowa para",
+    "uk_UA": "Недійсна пара",
+    "ja_JP": "無効なペア",
+    "ko_KR": "잘못된 쌍",
+    "hi_IN": "अमान्य जोड़ा",
+    "bn_BD": "অবৈধ জোড়া",
+    "it_IT": "Coppia non valida",
+    "fr_FR": "Paire invalide",
+    "de_DE": "Ungültiges Paar",
+    "pt_PT": "Par inválido",
+    "ar_SA": "زوج غير صالح",
+    "vi_VN": "Cặp không hợp lệ",
+    "fa_IR": "جفت نامعتبر",
+    "id_ID": "Pasangan tidak valid",
+    "ms_MY": "Pasangan tidak sah",
+    "th_TH": "คู่ไม่ถูกต้อง",
+    "ur_PK": "غلط جوڑا",
+}
+
+CANNOT_PAIR_FILE_WITH_ITSELF = {
+    "en_US": "Cannot pair file with itself.",
+    "es_ES": "No se puede emparejar el archivo consigo mismo.",
+    "tr_TR": "Dosya kendisiyle eşleştirilemez.",
+    "zh_CN": "无法将文件与自身配对。",
+    "zh_TW": "無法將檔案與其自身配對。",
+    "ru_RU": "Нельзя создать пару файла с самим собой.",
+    "pl_PL": "Nie można sparować pliku z samym sobą.",
+    "uk_UA": "Неможливо створити пару файлу з самим собою.",
+    "ja_JP": "ファイルを自分自身とペアにすることはできません。",
+    "ko_KR": "파일을 자기 자신과 쌍으로 만들 수 없습니다.",
+    "hi_IN": "फ़ाइल को अपने साथ जोड़ा नहीं जा सकता।",
+    "bn_BD": "ফাইলকে নিজের সাথে জোড়া দেওয়া যায় না।",
+    "it_IT": "Impossibile accoppiare il file con se stesso.",
+    "fr_FR": "Impossible d'associer le fichier avec lui-même.",
+    "de_DE": "Datei kann nicht mit sich selbst gepaart werden.",
+    "pt_PT": "Não é possível emparelhar o arquivo consigo mesmo.",
+    "ar_SA": "لا يمكن إقران الملف مع نفسه.",
+    "vi_VN": "Không thể ghép cặp tệp với chính nó.",
+    "fa_IR": "نمی‌توان فایل را با خودش جفت کرد.",
+    "id_ID": "Tidak dapat memasangkan file dengan dirinya sendiri.",
+    "ms_MY": "Tidak boleh memasangkan fail dengan dirinya sendiri.",
+    "th_TH": "ไม่สามารถจับคู่ไฟล์กับตัวเองได้",
+    "ur_PK": "فائل کو اپنے آپ کے ساتھ جوڑا نہیں جا سکتا۔",
+}
+
+NO_MEDIA_FILES_FOUND_TITLE = {
+    "en_US": "No Media Files Found",
+    "es_ES": "No se encontraron archivos multimedia",
+    "tr_TR": "Medya dosyası bulunamadı",
+    "zh_CN": "未找到媒体文件",
+    "zh_TW": "找不到媒體檔案",
+    "ru_RU": "Медиафайлы не найдены",
+    "pl_PL": "Nie znaleziono plików multimedialnych",
+    "uk_UA": "Медіафайли не знайдено",
+    "ja_JP": "メディアファイルが見つかりません",
+    "ko_KR": "미디어 파일을 찾을 수 없음",
+    "hi_IN": "मीडिया फाइलें नहीं मिलीं",
+    "bn_BD": "মিডিয়া ফাইল পাওয়া যায়নি",
+    "it_IT": "Nessun file multimediale trovato",
+    "fr_FR": "Aucun fichier multimédia trouvé",
+    "de_DE": "Keine Mediendateien gefunden",
+    "pt_PT": "Nenhum arquivo de mídia encontrado",
+    "ar_SA": "لم يتم العثور على ملفات وسائط",
+    "vi_VN": "Không tìm thấy tệp phương tiện",
+    "fa_IR": "فایل رسانه‌ای یافت نشد",
+    "id_ID": "Tidak ada file media ditemukan",
+    "ms_MY": "Tiada fail media dijumpai",
+    "th_TH": "ไม่พบไฟล์สื่อ",
+    "ur_PK": "میڈیا فائلیں نہیں ملیں",
+}
+
+NO_MEDIA_FILES_FOUND_MESSAGE = {
+    "en_US": "No supported video or subtitle files were found in the selected files/folders.",
+    "es_ES": "No se encontraron archivos de vídeo o subtítulos compatibles en los archivos/carpetas seleccionados.",
+    "tr_TR": "Seçilen dosyalar/klasörlerde desteklenen video veya altyazı dosyası bulunamadı.",
+    "zh_CN": "在所选文件/文件夹中未找到支持的视频或字幕文件。",
+    "zh_TW": "在所選檔案/資料夾中找不到支援的影片或字幕檔案。",
+    "ru_RU": "В выбранных файлах/папках не найдено поддерживаемых видео или субтитров.",
+    "pl_PL": "W wybranych plikach/folderach nie znaleziono obsługiwanych plików wideo lub napisów.",
+    "uk_UA": "У вибраних файлах/папках не знайдено підтримуваних відео або субтитрів.",
+    "ja_JP": "選択されたファイル/フォルダに、サポートされているビデオまたは字幕ファイルが見つかりませんでした。",
+    "ko_KR": "선택한 파일/폴더에서 지원되는 비디오 또는 자막 파일을 찾을 수 없습니다.",
+    "hi_IN": "चयनित फ़ाइलों/फ़ोल्डरों में कोई समर्थित वीडियो या सबटाइटल फ़ाइलें नहीं मिलीं।",
+    "bn_BD": "নির্বাচিত ফাইল/ফোল্ডারে কোনো সমর্থিত ভিডিও বা সাবটাইটেল ফাইল পাওয়া যায়নি।",
+    "it_IT": "Nessun file video o sottotitolo supportato trovato nei file/cartelle selezionati.",
+    "fr_FR": "Aucun fichier vidéo ou sous-titre pris en charge trouvé dans les fichiers/dossiers sélectionnés.",
+    "de_DE": "Keine unterstützten Video- oder Untertiteldateien in den ausgewählten Dateien/Ordnern gefunden.",
+    "pt_PT": "Nenhum arquivo de vídeo ou legenda suportado foi encontrado nos arquivos/pastas selecionados.",
+    "ar_SA": "لم يتم العثور على ملفات فيديو أو ترجمة مدعومة في الملفات/المجلدات المحددة.",
+    "vi_VN": "Không tìm thấy tệp video hoặc phụ đề được hỗ trợ trong các tệp/thư mục đã chọn.",
+    "fa_IR": "هیچ فایل ویدیو یا زیرنویس پشتیبانی شده‌ای در فایل‌ها/پوشه‌های انتخاب شده یافت نشد.",
+    "id_ID": "Tidak ada file video atau subtitle yang didukung ditemukan di file/folder yang dipilih.",
+    "ms_MY": "Tiada fail video atau sari kata yang disokong dijumpai dalam fail/folder yang dipilih.",
+    "th_TH": "ไม่พบไฟล์วิดีโอหรือคำบรรยายที่รองรับในไฟล์/โฟลเดอร์ที่เลือก",
+    "ur_PK": "منتخب فائلوں/فولڈرز میں کوئی معاون ویڈیو یا سب ٹائٹل فائلیں نہیں ملیں۔",
+}
+
+DUPLICATES_SKIPPED_TITLE = {
+    "en_US": "Duplicates Skipped",
+    "es_ES": "Duplicados omitidos",
+    "tr_TR": "Tekrarlar atlandı",
+    "zh_CN": "跳过重复项",
+    "zh_TW": "已跳過重複項",
+    "ru_RU": "Дубликаты пропущены",
+    "pl_PL": "Duplikaty pominięte",
+    "uk_UA": "Дублікати пропущено",
+    "ja_JP": "重複をスキップ",
+    "ko_KR": "중복 건너뜀",
+    "hi_IN": "डुप्लिकेट छोड़े गए",
+    "bn_BD": "ডুপ্লিকেট এড়িয়ে যাওয়া হয়েছে",
+    "it_IT": "Duplicati saltati",
+    "fr_FR": "Doublons ignorés",
+    "de_DE": "Duplikate übersprungen",
+    "pt_PT": "Duplicatas ignoradas",
+    "ar_SA": "تم تخطي المكررات",
+    "vi_VN": "Đã bỏ qua trùng lặp",
+    "fa_IR": "موارد تکراری نادیده گرفته شد",
+    "id_ID": "Duplikat dilewati",
+    "ms_MY": "Pendua dilangkau",
+    "th_TH": "ข้ามรายการซ้ำ",
+    "ur_PK": "ڈپلیکیٹس چھوڑ دیے گئے",
+}
+
+DUPLICATES_SKIPPED_MESSAGE = {
+    "en_US": "{count} duplicate pair(s) skipped.",
+    "es_ES": "{count} par(es) duplicado(s) omitido(s).",
+    "tr_TR": "{count} tekrar eden eşleşme atlandı.",
+    "zh_CN": "跳过了 {count} 个重复配对。",
+    "zh_TW": "跳過了 {count} 個重複配對。",
+    "ru_RU": "{count} дублирующих пар пропущено.",
+    "pl_PL": "{count} zduplikowanych par pominięto.",
+    "uk_UA": "{count} дублюючих пар пропущено.",
+    "ja_JP": "{count} 個の重複ペアをスキップしました。",
+    "ko_KR": "{count}개의 중복 쌍이 건너뛰어졌습니다.",
+    "hi_IN": "{count} डुप्लिकेट जोड़े छोड़े गए।",
+    "bn_BD": "{count} টি ডুপ্লিকেট জোড়া এড়িয়ে যাওয়া হয়েছে।",
+    "it_IT": "{count} coppia/e duplicata/e saltata/e.",
+    "fr_FR": "{count} paire(s) en double ignorée(s).",
+    "de_DE": "{count} doppelte Paare übersprungen.",
+    "pt_PT": "{count} par(es) duplicado(s) ignorado(s).",
+    "ar_SA": "تم تخطي {count} زوج/أزواج مكررة.",
+    "vi_VN": "Đã bỏ qua {count} cặp trùng lặp.",
+    "fa_IR": "{count} جفت تکراری نادیده گرفته شد.",
+    "id_ID": "{count} pasangan duplikat dilewati.",
+    "ms_MY": "{count} pasangan pendua dilangkau.",
+    "th_TH": "ข้าม {count} คู่ที่ซ้ำกัน",
+    "ur_PK": "{count} ڈپلیکیٹ جوڑے چھوڑ دیے گئے۔",
+}
+
+SELECTION_ERROR_TITLE = {
+    "en_US": "Selection Error",
+    "es_ES": "Error de selección",
+    "tr_TR": "Seçim hatası",
+    "zh_CN": "选择错误",
+    "zh_TW": "選擇錯誤",
+    "ru_RU": "Ошибка выбора",
+    "pl_PL": "Błąd wyboru",
+    "uk_UA": "Помилка вибору",
+    "ja_JP": "選択エラー",
+    "ko_KR": "선택 오류",
+    "hi_IN": "चयन त्रुटि",
+    "bn_BD": "নির্বাচন ত্রুটি",
+    "it_IT": "Errore di selezione",
+    "fr_FR": "Erreur de sélection",
+    "de_DE": "Auswahlfehler",
+    "pt_PT": "Erro de seleção",
+    "ar_SA": "خطأ في التحديد",
+    "vi_VN": "Lỗi lựa chọn",
+    "fa_IR": "خطای انتخاب",
+    "id_ID": "Kesalahan pemilihan",
+    "ms_MY": "Ralat pemilihan",
+    "th_TH": "ข้อผิดพลาดในการเลือก",
+    "ur_PK": "انتخاب کی خرابی",
+}
+
+SELECT_TOP_LEVEL_ITEM_MESSAGE = {
+    "en_US": "Please select a video or reference subtitle (a top-level item) to add a subtitle to.",
+    "es_ES": "Seleccione un vídeo o subtítulo de referencia (un elemento de nivel superior) para agregar un subtítulo.",
+    "tr_TR": "Altyazı eklemek için bir video veya referans altyazı (üst öğe) seçin.",
+    "zh_CN": "请选择视频或参考字幕（顶级项目）来添加字幕。",
+    "zh_TW": "請選擇影片或參考字幕（頂層項目）以添加字幕。",
+    "ru_RU": "Выберите видео или эталонные субтитры (элемент верхнего уровня) для добавления субтитров.",
+    "pl_PL": "Wybierz wideo lub napisy referencyjne (element najwyższego poziomu), aby dodać napisy.",
+    "uk_UA": "Виберіть відео або еталонні субтитри (елемент верхнього рівня) для додавання субтитрів.",
+    "ja_JP": "字幕を追加するには、ビデオまたは参照字幕（トップレベル項目）を選択してください。",
+    "ko_KR": "자막을 추가하려면 비디오 또는 참조 자막(최상위 항목)을 선택하세요.",
+    "hi_IN": "सबटाइटल जोड़ने के लिए कोई वीडियो या संदर्भ सबटाइटल (एक शीर्ष-स्तरीय आइटम) चुनें।",
+    "bn_BD": "সাবটাইটেল যোগ করতে একটি ভিডিও বা রেফারেন্স সাবটাইটেল (একটি শীর্ষ-স্তরের আইটেম) নির্বাচন করুন।",
+    "it_IT": "Seleziona un video o sottotitolo di riferimento (un elemento di primo livello) per aggiungere un sottotitolo.",
+    "fr_FR": "Veuillez sélectionner une vidéo ou des sous-titres de référence (un élément de niveau supérieur) pour ajouter un sous-titre.",
+    "de_DE": "Bitte wählen Sie ein Video oder Referenz-Untertitel (ein Element der obersten Ebene) aus, um einen Untertitel hinzuzufügen.",
+    "pt_PT": "Selecione um vídeo ou legenda de referência (um item de nível superior) para adicionar uma legenda.",
+    "ar_SA": "يرجى تحديد فيديو أو ترجمة مرجعية (عنصر من المستوى الأعلى) لإضافة ترجمة.",
+    "vi_VN": "Vui lòng chọn video hoặc phụ đề tham chiếu (mục cấp cao nhất) để thêm phụ đề.",
+    "fa_IR": "لطفاً یک ویدیو یا زیرنویس مرجع (یک آیتم سطح بالا) برای اضافه کردن زیرنویس انتخاب کنید.",
+    "id_ID": "Pilih video atau subtitle referensi (item tingkat atas) untuk menambahkan subtitle.",
+    "ms_MY": "Sila pilih video atau sari kata rujukan (item peringkat atas) untuk menambah sari kata.",
+    "th_TH": "โปรดเลือกวิดีโอหรือคำบรรยายอ้างอิง (รายการระดับบนสุด) เพื่อเพิ่มคำบรรยาย",
+    "ur_PK": "سب ٹائٹل شامل کرنے کے لیے کوئی ویڈیو یا ریفرنس سب ٹائٹل (ٹاپ لیول آئٹم) منتخب کریں۔",
+}
+
+SOME_FILES_SKIPPED_TITLE = {
+    "en_US": "Some Files Skipped",
+    "es_ES": "Algunos archivos omitidos",
+    "tr_TR": "Bazı dosyalar atlandı",
+    "zh_CN": "跳过了一些文件",
+    "zh_TW": "已跳過部分檔案",
+    "ru_RU": "Некоторые файлы пропущены",
+    "pl_PL": "Niektóre pliki pominięte",
+    "uk_UA": "Деякі файли пропущено",
+    "ja_JP": "一部のファイルをスキップ",
+    "ko_KR": "일부 파일 건너뜀",
+    "hi_IN": "कुछ फाइलें छोड़ी गईं",
+    "bn_BD": "কিছু ফাইল এড়িয়ে যাওয়া হয়েছে",
+    "it_IT": "Alcuni file saltati",
+    "fr_FR": "Certains fichiers ignorés",
+    "de_DE": "Einige Dateien übersprungen",
+    "pt_PT": "Alguns arquivos ignorados",
+    "ar_SA": "تم تخطي بعض الملفات",
+    "vi_VN": "Đã bỏ qua một số tệp",
+    "fa_IR": "برخی فایل‌ها نادیده گرفته شد",
+    "id_ID": "Beberapa file dilewati",
+    "ms_MY": "Beberapa fail dilangkau",
+    "th_TH": "ข้ามไฟล์บางไฟล์",
+    "ur_PK": "کچھ فائلیں چھوڑ دی گئیں",
+}
+
+SOME_FILES_SKIPPED_MESSAGE = {
+    "en_US": "{count} unsupported file(s) were skipped. Only video and subtitle files will be added.",
+    "es_ES": "{count} archivo(s) no compatible(s) fueron omitido(s). Solo se agregarán archivos de vídeo y subtítulos.",
+    "tr_TR": "{count} desteklenmeyen dosya atlandı. Sadece video ve altyazı dosyaları eklenecek.",
+    "zh_CN": "跳过了 {count} 个不支持的文件。只会添加视频和字幕文件。",
+    "zh_TW": "跳過了 {count} 個不支援的檔案。只會添加影片和字幕檔案。",
+    "ru_RU": "{count} неподдерживаемых файлов пропущено. Будут добавлены только видео и субтитры.",
+    "pl_PL": "{count} nieobsługiwanych plików pominięto. Dodane zostaną tylko pliki wideo i napisów.",
+    "uk_UA": "{count} непідтримуваних файлів пропущено. Будуть додані лише відео та субтитри.",
+    "ja_JP": "{count} 個のサポートされていないファイルがスキップされました。ビデオと字幕ファイルのみが追加されます。",
+    "ko_KR": "{count}개의 지원되지 않는 파일이 건너뛰어졌습니다. 비디오 및 자막 파일만 추가됩니다.",
+    "hi_IN": "{count} असमर्थित फ़ाइल(एं) छोड़ी गईं। केवल वीडियो और सबटाइटल फ़ाइलें जोड़ी जाएंगी।",
+    "bn_BD": "{count} টি অসমর্থিত ফাইল এড়িয়ে যাওয়া হয়েছে। শুধুমাত্র ভিডিও এবং সাবটাইটেল ফাইল যোগ করা হবে।",
+    "it_IT": "{count} file non supportati sono stati saltati. Verranno aggiunti solo file video e sottotitoli.",
+    "fr_FR": "{count} fichier(s) non pris en charge ont été ignorés. Seuls les fichiers vidéo et sous-titres seront ajoutés.",
+    "de_DE": "{count} nicht unterstützte Datei(en) wurden übersprungen. Nur Video- und Untertiteldateien werden hinzugefügt.",
+    "pt_PT": "{count} arquivo(s) não suportado(s) foram ignorados. Apenas arquivos de vídeo e legenda serão adicionados.",
+    "ar_SA": "تم تخطي {count} ملف/ملفات غير مدعومة. سيتم إضافة ملفات الفيديو والترجمة فقط.",
+    "vi_VN": "{count} tệp không được hỗ trợ đã bị bỏ qua. Chỉ các tệp video và phụ đề sẽ được thêm vào.",
+    "fa_IR": "{count} فایل پشتیبانی نشده نادیده گرفته شد. فقط فایل‌های ویدیو و زیرنویس اضافه خواهند شد.",
+    "id_ID": "{count} file yang tidak didukung dilewati. Hanya file video dan subtitle yang akan ditambahkan.",
+    "ms_MY": "{count} fail yang tidak disokong dilangkau. Hanya fail video dan sari kata akan ditambah.",
+    "th_TH": "ข้าม {count} ไฟล์ที่ไม่รองรับ จะเพิ่มเฉพาะไฟล์วิดีโอและคำบรรยายเท่านั้น",
+    "ur_PK": "{count} غیر تعاونی فائل(یں) چھوڑ دی گئیں۔ صرف ویڈیو اور سب ٹائٹل فائلیں شامل کی جائیں گی۔",
+}
+
+INVALID_FILE_TITLE = {
+    "en_US": "Invalid File",
+    "es_ES": "Archivo inválido",
+    "tr_TR": "Geçersiz dosya",
+    "zh_CN": "无效文件",
+    "zh_TW": "無效檔案",
+    "ru_RU": "Недопустимый файл",
+    "pl_PL": "Nieprawidłowy plik",
+    "uk_UA": "Недійсний файл",
+    "ja_JP": "無効なファイル",
+    "ko_KR": "잘못된 파일",
+    "hi_IN": "अमान्य फाइल",
+    "bn_BD": "অবৈধ ফাইল",
+    "it_IT": "File non valido",
+    "fr_FR": "Fichier invalide",
+    "de_DE": "Ungültige Datei",
+    "pt_PT": "Arquivo inválido",
+    "ar_SA": "ملف غير صالح",
+    "vi_VN": "Tệp không hợp lệ",
+    "fa_IR": "فایل نامعتبر",
+    "id_ID": "File tidak valid",
+    "ms_MY": "Fail tidak sah",
+    "th_TH": "ไฟล์ไม่ถูกต้อง",
+    "ur_PK": "غلط فائل",
+}
+
+INVALID_SUBTITLE_FILE_MESSAGE = {
+    "en_US": "'{filename}' is not a subtitle file. Skipping.",
+    "es_ES": "'{filename}' no es un archivo de subtítulos. Omitiendo.",
+    "tr_TR": "'{filename}' bir altyazı dosyası değil. Atlanıyor.",
+    "zh_CN": "'{filename}' 不是字幕文件。正在跳过。",
+    "zh_TW": "'{filename}' 不是字幕檔案。正在跳過。",
+    "ru_RU": "'{filename}' не является файлом субтитров. Пропускается.",
+    "pl_PL": "'{filename}' nie jest plikiem napisów. Pomijanie.",
+    "uk_UA": "'{filename}' не є файлом субтитрів. Пропускається.",
+    "ja_JP": "'{filename}' は字幕ファイルではありません。スキップしています。",
+    "ko_KR": "'{filename}'은(는) 자막 파일이 아닙니다. 건너뜁니다.",
+    "hi_IN": "'{filename}' एक सबटाइटल फ़ाइल नहीं है। छोड़ा जा रहा है।",
+    "bn_BD": "'{filename}' একটি সাবটাইটেল ফাইল নয়। এড়িয়ে যাওয়া হচ্ছে।",
+    "it_IT": "'{filename}' non è un file di sottotitoli. Saltando.",
+    "fr_FR": "'{filename}' n'est pas un fichier de sous-titres. Ignoré.",
+    "de_DE": "'{filename}' ist keine Untertiteldatei. Wird übersprungen.",
+    "pt_PT": "'{filename}' não é um arquivo de legenda. Pulando.",
+    "ar_SA": "'{filename}' ليس ملف ترجمة. تم التخطي.",
+    "vi_VN": "'{filename}' không phải là tệp phụ đề. Đang bỏ qua.",
+    "fa_IR": "'{filename}' یک فایل زیرنویس نیست. در حال رد کردن.",
+    "id_ID": "'{filename}' bukan file subtitle. Melewatkan.",
+    "ms_MY": "'{filename}' bukan fail sari kata. Melangkau.",
+    "th_TH": "'{filename}' ไม่ใช่ไฟล์คำบรรยาย กำลังข้าม",
+    "ur_PK": "'{filename}' سب ٹائٹل فائل نہیں ہے۔ چھوڑا جا رہا ہے۔",
+}
+
+SELECT_REPLACEMENT_VIDEO_OR_SUBTITLE_TITLE = {
+    "en_US": "Select Replacement Video or Reference Subtitle",
+    "es_ES": "Seleccionar vídeo de reemplazo o subtítulo de referencia",
+    "tr_TR": "Değiştirmek için video veya referans altyazıyı seçin",
+    "zh_CN": "选择替换视频或参考字幕",
+    "zh_TW": "選擇替換影片或參考字幕",
+    "ru_RU": "Выберите замещающее видео или эталонные субтитры",
+    "pl_PL": "Wybierz wideo zastępcze lub napisy referencyjne",
+    "uk_UA": "Виберіть замінне відео або еталонні субтитри",
+    "ja_JP": "置換ビデオまたは参照字幕を選択",
+    "ko_KR": "교체 비디오 또는 참조 자막 선택",
+    "hi_IN": "प्रतिस्थापन वीडियो या संदर्भ सबटाइटल चुनें",
+    "bn_BD": "প্রতিস্থাপন ভিডিও বা রেফারেন্স সাবটাইটেল নির্বাচন করুন",
+    "it_IT": "Seleziona video sostitutivo o sottotitolo di riferimento",
+    "fr_FR": "Sélectionner une vidéo de remplacement ou des sous-titres de référence",
+    "de_DE": "Ersatzvideo oder Referenz-Untertitel auswählen",
+    "pt_PT": "Selecionar vídeo substituto ou legenda de referência",
+    "ar_SA": "حدد فيديو بديل أو ترجمة مرجعية",
+    "vi_VN": "Chọn video thay thế hoặc phụ đề tham chiếu",
+    "fa_IR": "ویدیو جایگزین یا زیرنویس مرجع انتخاب کنید",
+    "id_ID": "Pilih video pengganti atau subtitle referensi",
+    "ms_MY": "Pilih video gantian atau sari kata rujukan",
+    "th_TH": "เลือกวิดีโอทดแทนหรือคำบรรยายอ้างอิง",
+    "ur_PK": "متبادل ویڈیو یا ریفرنس سب ٹائٹل منتخب کریں",
+}
+
+SELECT_REPLACEMENT_SUBTITLE_TITLE = {
+    "en_US": "Select Replacement Subtitle File",
+    "es_ES": "Seleccionar archivo de subtítulos de reemplazo",
+    "tr_TR": "Değiştirmek için altyazı dosyasını seçin",
+    "zh_CN": "选择替换字幕文件",
+    "zh_TW": "選擇替換字幕檔案",
+    "ru_RU": "Выберите замещающий файл субтитров",
+    "pl_PL": "Wybierz zastępczy plik napisów",
+    "uk_UA": "Виберіть замінний файл субтитрів",
+    "ja_JP": "置換字幕ファイルを選択",
+    "ko_KR": "교체 자막 파일 선택",
+    "hi_IN": "प्रतिस्थापन सबटाइटल फ़ाइल चुनें",
+    "bn_BD": "প্রতিস্থাপন সাবটাইটেল ফাইল নির্বাচন করুন",
+    "it_IT": "Seleziona file sottotitolo sostitutivo",
+    "fr_FR": "Sélectionner un fichier de sous-titres de remplacement",
+    "de_DE": "Ersatz-Untertiteldatei auswählen",
+    "pt_PT": "Selecionar arquivo de legenda substituto",
+    "ar_SA": "حدد ملف ترجمة بديل",
+    "vi_VN": "Chọn tệp phụ đề thay thế",
+    "fa_IR": "فایل زیرنویس جایگزین انتخاب کنید",
+    "id_ID": "Pilih file subtitle pengganti",
+    "ms_MY": "Pilih fail sari kata gantian",
+    "th_TH": "เลือกไฟล์คำบรรยายทดแทน",
+    "ur_PK": "متبادل سب ٹائٹل فائل منتخب کریں",
+}
+
+INVALID_FILE_TYPE_TITLE = {
+    "en_US": "Invalid File Type",
+    "es_ES": "Tipo de archivo inválido",
+    "tr_TR": "Geçersiz dosya türü",
+    "zh_CN": "无效文件类型",
+    "zh_TW": "無效檔案類型",
+    "ru_RU": "Недопустимый тип файла",
+    "pl_PL": "Nieprawidłowy typ pliku",
+    "uk_UA": "Недійсний тип файлу",
+    "ja_JP": "無効なファイルタイプ",
+    "ko_KR": "잘못된 파일 형식",
+    "hi_IN": "अमान्य फ़ाइल प्रकार",
+    "bn_BD": "অবৈধ ফাইল প্রকার",
+    "it_IT": "Tipo di file non valido",
+    "fr_FR": "Type de fichier invalide",
+    "de_DE": "Ungültiger Dateityp",
+    "pt_PT": "Tipo de arquivo inválido",
+    "ar_SA": "نوع ملف غير صالح",
+    "vi_VN": "Loại tệp không hợp lệ",
+    "fa_IR": "نوع فایل نامعتبر",
+    "id_ID": "Jenis file tidak valid",
+    "ms_MY": "Jenis fail tidak sah",
+    "th_TH": "ประเภทไฟล์ไม่ถูกต้อง",
+    "ur_PK": "غلط فائل کی قسم",
+}
+
+INVALID_FILE_TYPE_MESSAGE = {
+    "en_US": "The selected file type is not appropriate for this item.",
+    "es_ES": "El tipo de archivo seleccionado no es apropiado para este elemento.",
+    "tr_TR": "Seçilen dosya türü bu öğe için uygun değil.",
+    "zh_CN": "所选文件类型不适合此项目。",
+    "zh_TW": "所選檔案類型不適合此項目。",
+    "ru_RU": "Выбранный тип файла не подходит для этого элемента.",
+    "pl_PL": "Wybrany typ pliku nie jest odpowiedni dla tego elementu.",
+    "uk_UA": "Вибраний тип файлу не підходить для цього елемента.",
+    "ja_JP": "選択されたファイルタイプはこの項目に適していません。",
+    "ko_KR": "선택한 파일 형식이 이 항목에 적합하지 않습니다.",
+    "hi_IN": "चयनित फ़ाइल प्रकार इस आइटम के लिए उपयुक्त नहीं है।",
+    "bn_BD": "নির্বাচিত ফাইল প্রকার এই আইটেমের জন্য উপযুক্ত নয়।",
+    "it_IT": "Il tipo di file selezionato non è appropriato per questo elemento.",
+    "fr_FR": "Le type de fichier sélectionné n'est pas approprié pour cet élément.",
+    "de_DE": "Der ausgewählte Dateityp ist für dieses Element nicht geeignet.",
+    "pt_PT": "O tipo de arquivo selecionado não é apropriado para este item.",
+    "ar_SA": "نوع الملف المحدد غير مناسب لهذا العنصر.",
+    "vi_VN": "Loại tệp đã chọn không phù hợp với mục này.",
+    "fa_IR": "نوع فایل انتخاب شده برای این آیتم مناسب نیست.",
+    "id_ID": "Jenis file yang dipilih tidak sesuai untuk item ini.",
+    "ms_MY": "Jenis fail yang dipilih tidak sesuai untuk item ini.",
+    "th_TH": "ประเภทไฟล์ที่เลือกไม่เหมาะสมสำหรับรายการนี้",
+    "ur_PK": "منتخب فائل کی قسم اس آئٹم کے لیے موزوں نہیں ہے۔",
+}
+
+CONFIRM_CLEAR_ALL_TITLE = {
+    "en_US": "Confirm Clear All",
+    "es_ES": "Confirmar borrar todo",
+    "tr_TR": "Tümünü temizlemeyi onayla",
+    "zh_CN": "确认清除全部",
+    "zh_TW": "確認全部清除",
+    "ru_RU": "Подтвердите очистку всего",
+    "pl_PL": "Potwierdź wyczyszczenie wszystkiego",
+    "uk_UA": "Підтвердіть очищення всього",
+    "ja_JP": "すべてクリアを確認",
+    "ko_KR": "모두 지우기 확인",
+    "hi_IN": "सभी साफ़ करने की पुष्टि करें",
+    "bn_BD": "সব পরিষ্কার করার নিশ্চিতকরণ",
+    "it_IT": "Conferma cancellazione tutto",
+    "fr_FR": "Confirmer tout effacer",
+    "de_DE": "Alles löschen bestätigen",
+    "pt_PT": "Confirmar limpar tudo",
+    "ar_SA": "تأكيد مسح الكل",
+    "vi_VN": "Xác nhận xóa tất cả",
+    "fa_IR": "تأیید پاک کردن همه",
+    "id_ID": "Konfirmasi hapus semua",
+    "ms_MY": "Sahkan kosongkan semua",
+    "th_TH": "ยืนยันการล้างทั้งหมด",
+    "ur_PK": "تمام صاف کرنے کی تصدیق",
+}
+
+CONFIRM_CLEAR_ALL_MESSAGE = {
+    "en_US": "Are you sure you want to clear all items?",
+    "es_ES": "¿Está seguro de que desea borrar todos los elementos?",
+    "tr_TR": "Tüm öğeleri temizlemek istediğinizden emin misiniz?",
+    "zh_CN": "您确定要清除所有项目吗？",
+    "zh_TW": "您確定要清除所有項目嗎？",
+    "ru_RU": "Вы уверены, что хотите очистить все элементы?",
+    "pl_PL": "Czy na pewno chcesz wyczyścić wszystkie elementy?",
+    "uk_UA": "Ви впевнені, що хочете очистити всі елементи?",
+    "ja_JP": "すべての項目をクリアしてもよろしいですか？",
+    "ko_KR": "모든 항목을 지우시겠습니까?",
+    "hi_IN": "क्या आप वाकई सभी आइटम साफ़ करना चाहते हैं?",
+    "bn_BD": "আপনি কি সত্যিই সব আইটেম পরিষ্কার করতে চান?",
+    "it_IT": "Sei sicuro di voler cancellare tutti gli elementi?",
+    "fr_FR": "Êtes-vous sûr de vouloir tout effacer ?",
+    "de_DE": "Sind Sie sicher, dass Sie alle Elemente löschen möchten?",
+    "pt_PT": "Tem certeza de que deseja limpar todos os itens?",
+    "ar_SA": "هل أنت متأكد من أنك تريد مسح جميع العناصر؟",
+    "vi_VN": "Bạn có chắc chắn muốn xóa tất cả các mục không?",
+    "fa_IR": "آیا مطمئن هستید که می‌خواهید همه موارد را پاک کنید؟",
+    "id_ID": "Apakah Anda yakin ingin menghapus semua item?",
+    "ms_MY": "Adakah anda pasti ingin mengosongkan semua item?",
+    "th_TH": "คุณแน่ใจหรือไม่ว่าต้องการล้างรายการทั้งหมด?",
+    "ur_PK": "کیا آپ واقعی تمام آئٹمز صاف کرنا چاہتے ہیں؟",
+}
+
+FILE_NOT_FOUND_MESSAGE = {
+    "en_US": "The file does not exist or path is invalid.",
+    "es_ES": "El archivo no existe o la ruta no es válida.",
+    "tr_TR": "Dosya mevcut değil veya yol geçersiz.",
+    "zh_CN": "文件不存在或路径无效。",
+    "zh_TW": "找不到輸出檔案：\n{filename}\n\n可能已被移動或刪除。",
+    "ru_RU": "Файл не существует или путь недействителен.",
+    "pl_PL": "Plik nie istnieje lub ścieżka jest nieprawidłowa.",
+    "uk_UA": "Файл не існує або шлях недійсний.",
+    "ja_JP": "ファイルが存在しないか、パスが無効です。",
+    "ko_KR": "파일이 존재하지 않거나 경로가 유효하지 않습니다.",
+    "hi_IN": "फ़ाइल मौजूद नहीं है या पथ अमान्य है।",
+    "bn_BD": "ফাইলটি বিদ্যমান নেই বা পথ অবৈধ।",
+    "it_IT": "Il file non esiste o il percorso non è valido.",
+    "fr_FR": "Le fichier n'existe pas ou le chemin est invalide.",
+    "de_DE": "Die Datei existiert nicht oder der Pfad ist ungültig.",
+    "pt_PT": "O arquivo não existe ou o caminho é inválido.",
+    "ar_SA": "الملف غير موجود أو المسار غير صالح.",
+    "vi_VN": "Tệp không tồn tại hoặc đường dẫn không hợp lệ.",
+    "fa_IR": "فایل وجود ندارد یا مسیر نامعتبر است.",
+    "id_ID": "File tidak ada atau jalur tidak valid.",
+    "ms_MY": "Fail tidak wujud atau laluan tidak sah.",
+    "th_TH": "ไฟล์ไม่มีอยู่หรือเส้นทางไม่ถูกต้อง",
+    "ur_PK": "فائل موجود نہیں یا راستہ غلط ہے۔",
+}
+
+UNSUPPORTED_FILE_TYPE_TITLE = {
+    "en_US": "Unsupported File Type",
+    "es_ES": "Tipo de archivo no compatible",
+    "tr_TR": "Desteklenmeyen dosya türü",
+    "zh_CN": "不支持的文件类型",
+    "zh_TW": "不支援的檔案類型",
+    "ru_RU": "Неподдерживаемый тип файла",
+    "pl_PL": "Nieobsługiwany typ pliku",
+    "uk_UA": "Непідтримуваний тип файлу",
+    "ja_JP": "サポートされていないファイルタイプ",
+    "ko_KR": "지원되지 않는 파일 형식",
+    "hi_IN": "असमर्थित फ़ाइल प्रकार",
+    "bn_BD": "অসমর্থিত ফাইল প্রকার",
+    "it_IT": "Tipo di file non supportato",
+    "fr_FR": "Type de fichier non pris en charge",
+    "de_DE": "Nicht unterstützter Dateityp",
+    "pt_PT": "Tipo de arquivo não suportado",
+    "ar_SA": "نوع ملف غير مدعوم",
+    "vi_VN": "Loại tệp không được hỗ trợ",
+    "fa_IR": "نوع فایل پشتیبانی نشده",
+    "id_ID": "Jenis file tidak didukung",
+    "ms_MY": "Jenis fail tidak disokong",
+    "th_TH": "ประเภทไฟล์ที่ไม่รองรับ",
+    "ur_PK": "غیر تعاونی فائل کی قسم",
+}
+
+UNSUPPORTED_FILE_TYPE_MESSAGE = {
+    "en_US": "The selected file is not a supported video or subtitle format.",
+    "es_ES": "El archivo seleccionado no es un formato de vídeo o subtítulos compatible.",
+    "tr_TR": "Seçilen dosya desteklenen bir video veya altyazı formatı değil.",
+    "zh_CN": "所选文件不是支持的视频或字幕格式。",
+    "zh_TW": "所選檔案不是支援的影片或字幕格式。",
+    "ru_RU": "Выбранный файл не является поддерживаемым форматом видео или субтитров.",
+    "pl_PL": "Wybrany plik nie jest obsługiwanym formatem wideo lub napisów.",
+    "uk_UA": "Вибраний файл не є підтримуваним форматом відео або субтитрів.",
+    "ja_JP": "選択されたファイルは、サポートされているビデオまたは字幕形式ではありません。",
+    "ko_KR": "선택한 파일이 지원되는 비디오 또는 자막 형식이 아닙니다.",
+    "hi_IN": "चयनित फ़ाइल समर्थित वीडियो या सबटाइटल प्रारूप नहीं है।",
+    "bn_BD": "নির্বাচিত ফাইলটি একটি সমর্থিত ভিডিও বা সাবটাইটেল ফরম্যাট নয়।",
+    "it_IT": "Il file selezionato non è un formato video o sottotitolo supportato.",
+    "fr_FR": "Le fichier sélectionné n'est pas un format vidéo ou sous-titre pris en charge.",
+    "de_DE": "Die ausgewählte Datei ist kein unterstütztes Video- oder Untertitelformat.",
+    "pt_PT": "O arquivo selecionado não é um formato de vídeo ou legenda suportado.",
+    "ar_SA": "الملف المحدد ليس تنسيق فيديو أو ترجمة مدعوم.",
+    "vi_VN": "Tệp đã chọn không phải là định dạng video hoặc phụ đề được hỗ trợ.",
+    "fa_IR": "فایل انتخاب شده یک فرمت ویدیو یا زیرنویس پشتیبانی شده نیست.",
+    "id_ID": "File yang dipilih bukan format video atau subtitle yang didukung.",
+    "ms_MY": "Fail yang dipilih bukan format video atau sari kata yang disokong.",
+    "th_TH": "ไฟล์ที่เลือกไม่ใช่รูปแบบวิดีโอหรือคำบรรยายที่รองรับ",
+    "ur_PK": "منتخب فائل تعاونی ویڈیو یا سب ٹائٹل فارمیٹ نہیں ہے۔",
+}
+
+NO_VALID_PAIRS_TITLE = {
+    "en_US": "No Valid Pairs",
+    "es_ES": "No hay pares válidos",
+    "tr_TR": "Geçerli eşleşme yok",
+    "zh_CN": "没有有效配对",
+    "zh_TW": "沒有有效配對",
+    "ru_RU": "Нет действительных пар",
+    "pl_PL": "Brak prawidłowych par",
+    "uk_UA": "Немає дійсних пар",
+    "ja_JP": "有効なペアがありません",
+    "ko_KR": "유효한 쌍이 없음",
+    "hi_IN": "कोई मान्य जोड़े नहीं",
+    "bn_BD": "কোনো বৈধ জোড়া নেই",
+    "it_IT": "Nessuna coppia valida",
+    "fr_FR": "Aucune paire valide",
+    "de_DE": "Keine gültigen Paare",
+    "pt_PT": "Nenhum par válido",
+    "ar_SA": "لا توجد أزواج صالحة",
+    "vi_VN": "Không có cặp hợp lệ",
+    "fa_IR": "هیچ جفت معتبری وجود ندارد",
+    "id_ID": "Tidak ada pasangan yang valid",
+    "ms_MY": "Tiada pasangan yang sah",
+    "th_TH": "ไม่มีคู่ที่ถูกต้อง",
+    "ur_PK": "کوئی درست جوڑے نہیں",
+}
+
+NO_VALID_PAIRS_MESSAGE = {
+    "en_US": "No valid pairs found.",
+    "es_ES": "No se encontraron pares válidos.",
+    "tr_TR": "Geçerli eşleşme bulunamadı.",
+    "zh_CN": "未找到有效配对。",
+    "zh_TW": "找不到有效配對。",
+    "ru_RU": "Действительные пары не найдены.",
+    "pl_PL": "Nie znaleziono prawidłowych par.",
+    "uk_UA": "Дійсні пари не знайдено.",
+    "ja_JP": "有効なペアが見つかりませんでした。",
+    "ko_KR": "유효한 쌍을 찾을 수 없습니다.",
+    "hi_IN": "कोई मान्य जोड़े नहीं मिले।",
+    "bn_BD": "কোনো বৈধ জোড়া পাওয়া যায়নি।",
+    "it_IT": "Nessuna coppia valida trovata.",
+    "fr_FR": "Aucune paire valide trouvée.",
+    "de_DE": "Keine gültigen Paare gefunden.",
+    "pt_PT": "Nenhum par válido encontrado.",
+    "ar_SA": "لم يتم العثور على أزواج صالحة.",
+    "vi_VN": "Không tìm thấy cặp hợp lệ.",
+    "fa_IR": "هیچ جفت معتبری یافت نشد.",
+    "id_ID": "Tidak ada pasangan yang valid ditemukan.",
+    "ms_MY": "Tiada pasangan yang sah dijumpai.",
+    "th_TH": "ไม่พบคู่ที่ถูกต้อง",
+    "ur_PK": "کوئی درست جوڑے نہیں ملے۔",
+}
+
+BATCH_ADD_FILES_ERROR = {
+    "en_US": "Please add files for batch processing.",
+    "es_ES": "Agregue archivos para el procesamiento por lotes.",
+    "tr_TR": "Toplu işleme için dosya ekleyin.",
+    "zh_CN": "请添加文件进行批处理。",
+    "zh_TW": "請添加檔案以進行批次處理。",
+    "ru_RU": "Добавьте файлы для пакетной обработки.",
+    "pl_PL": "Dodaj pliki do przetwarzania wsadowego.",
+    "uk_UA": "Додайте файли для пакетної обробки.",
+    "ja_JP": "バッチ処理用のファイルを追加してください。",
+    "ko_KR": "일괄 처리를 위해 파일을 추가하세요.",
+    "hi_IN": "बैच प्रोसेसिंग के लिए फ़ाइलें जोड़ें।",
+    "bn_BD": "ব্যাচ প্রসেসিংয়ের জন্য ফাইল যোগ করুন।",
+    "it_IT": "Aggiungi file per l'elaborazione batch.",
+    "fr_FR": "Ajoutez des fichiers pour le traitement par lots.",
+    "de_DE": "Fügen Sie Dateien für die Stapelverarbeitung hinzu.",
+    "pt_PT": "Adicione arquivos para processamento em lote.",
+    "ar_SA": "أضف ملفات للمعالجة المجمعة.",
+    "vi_VN": "Thêm tệp để xử lý hàng loạt.",
+    "fa_IR": "فایل‌ها را برای پردازش دسته‌ای اضافه کنید.",
+    "id_ID": "Tambahkan file untuk pemrosesan batch.",
+    "ms_MY": "Tambah fail untuk pemprosesan kelompok.",
+    "th_TH": "เพิ่มไฟล์สำหรับการประมวลผลแบบกลุ่ม",
+    "ur_PK": "بیچ پروسیسنگ کے لیے فائلیں شامل کریں۔",
+}
+
+CONFIRM_REMOVE_SELECTED_TITLE = {
+    "en_US": "Confirm Remove Selected",
+    "es_ES": "Confirmar eliminar seleccionados",
+    "tr_TR": "Seçilenleri kaldırmayı onayla",
+    "zh_CN": "确认删除所选项",
+    "zh_TW": "確認移除所選",
+    "ru_RU": "Подтвердите удаление выбранных",
+    "pl_PL": "Potwierdź usunięcie zaznaczonych",
+    "uk_UA": "Підтвердіть видалення вибраних",
+    "ja_JP": "選択項目の削除を確認",
+    "ko_KR": "선택 항목 제거 확인",
+    "hi_IN": "चयनित को हटाने की पुष्टि करें",
+    "bn_BD": "নির্বাচিত অপসারণের নিশ্চিতকরণ",
+    "it_IT": "Conferma rimozione selezionati",
+    "fr_FR": "Confirmer la suppression des éléments sélectionnés",
+    "de_DE": "Entfernen der ausgewählten Elemente bestätigen",
+    "pt_PT": "Confirmar remoção dos selecionados",
+    "ar_SA": "تأكيد إزالة المحددة",
+    "vi_VN": "Xác nhận xóa các mục đã chọn",
+    "fa_IR": "تأیید حذف موارد انتخاب شده",
+    "id_ID": "Konfirmasi hapus yang dipilih",
+    "ms_MY": "Sahkan buang yang dipilih",
+    "th_TH": "ยืนยันการลบรายการที่เลือก",
+    "ur_PK": "منتخب کردہ کو ہٹانے کی تصدیق",
+}
+
+CONFIRM_REMOVE_SELECTED_MESSAGE = {
+    "en_US": "Are you sure you want to remove {count} items?",
+    "es_ES": "¿Está seguro de que desea eliminar {count} elementos?",
+    "tr_TR": "{count} öğeyi kaldırmak istediğinizden emin misiniz?",
+    "zh_CN": "您确定要删除 {count} 个项目吗？",
+    "zh_TW": "您確定要移除 {count} 個項目嗎？",
+    "ru_RU": "Вы уверены, что хотите удалить {count} элементов?",
+    "pl_PL": "Czy na pewno chcesz usunąć {count} elementów?",
+    "uk_UA": "Ви впевнені, що хочете видалити {count} елементів?",
+    "ja_JP": "{count} 個の項目を削除してもよろしいですか？",
+    "ko_KR": "{count}개 항목을 제거하시겠습니까?",
+    "hi_IN": "क्या आप वाकई {count} आइटम हटाना चाहते हैं?",
+    "bn_BD": "আপনি কি সত্যিই {count} টি আইটেম অপসারণ করতে চান?",
+    "it_IT": "Sei sicuro di voler rimuovere {count} elementi?",
+    "fr_FR": "Êtes-vous sûr de vouloir supprimer {count} éléments ?",
+    "de_DE": "Sind Sie sicher, dass Sie {count} Elemente entfernen möchten?",
+    "pt_PT": "Tem certeza de que deseja remover {count} itens?",
+    "ar_SA": "هل أنت متأكد من أنك تريد إزالة {count} عنصر؟",
+    "vi_VN": "Bạn có chắc chắn muốn xóa {count} mục không?",
+    "fa_IR": "آیا مطمئن هستید که می‌خواهید {count} مورد را حذف کنید؟",
+    "id_ID": "Apakah Anda yakin ingin menghapus {count} item?",
+    "ms_MY": "Adakah anda pasti ingin membuang {count} item?",
+    "th_TH": "คุณแน่ใจหรือไม่ว่าต้องการลบ {count} รายการ?",
+    "ur_PK": "کیا آپ واقعی {count} آئٹمز ہٹانا چاہتے ہیں؟",
+}
+
+SELECT_FOLDER_CONTAINING_MEDIA_FILES_TITLE = {
+    "en_US": "Select Folder Containing Media Files",
+    "es_ES": "Seleccionar carpeta que contenga archivos multimedia",
+    "tr_TR": "Medya dosyalarını içeren klasörü seçin",
+    "zh_CN": "选择包含媒体文件的文件夹",
+    "zh_TW": "選擇包含媒體檔案的資料夾",
+    "ru_RU": "Выберите папку с медиафайлами",
+    "pl_PL": "Wybierz folder zawierający pliki multimedialne",
+    "uk_UA": "Виберіть папку з медіафайлами",
+    "ja_JP": "メディアファイルを含むフォルダを選択",
+    "ko_KR": "미디어 파일이 포함된 폴더 선택",
+    "hi_IN": "मीडिया फ़ाइलों वाला फ़ोल्डर चुनें",
+    "bn_BD": "মিডিয়া ফাইল সম্বলিত ফোল্ডার নির্বাচন করুন",
+    "it_IT": "Seleziona cartella contenente file multimediali",
+    "fr_FR": "Sélectionner le dossier contenant les fichiers multimédias",
+    "de_DE": "Ordner mit Mediendateien auswählen",
+    "pt_PT": "Selecionar pasta contendo arquivos de mídia",
+    "ar_SA": "حدد مجلد يحتوي على ملفات وسائط",
+    "vi_VN": "Chọn thư mục chứa tệp phương tiện",
+    "fa_IR": "پوشه حاوی فایل‌های رسانه را انتخاب کنید",
+    "id_ID": "Pilih folder yang berisi file media",
+    "ms_MY": "Pilih folder yang mengandungi fail media",
+    "th_TH": "เลือกโฟลเดอร์ที่มีไฟล์สื่อ",
+    "ur_PK": "میڈیا فائلوں والا فولڈر منتخب کریں",
+}
+
+SELECT_FILES_TITLE = {
+    "en_US": "Select Files",
+    "es_ES": "Seleccionar archivos",
+    "tr_TR": "Dosyaları seçin",
+    "zh_CN": "选择文件",
+    "zh_TW": "選擇檔案",
+    "ru_RU": "Выберите файлы",
+    "pl_PL": "Wybierz pliki",
+    "uk_UA": "Виберіть файли",
+    "ja_JP": "ファイルを選択",
+    "ko_KR": "파일 선택",
+    "hi_IN": "फ़ाइलें चुनें",
+    "bn_BD": "ফাইল নির্বাচন করুন",
+    "it_IT": "Seleziona file",
+    "fr_FR": "Sélectionner des fichiers",
+    "de_DE": "Dateien auswählen",
+    "pt_PT": "Selecionar arquivos",
+    "ar_SA": "اختر الملفات",
+    "vi_VN": "Chọn tệp",
+    "fa_IR": "فایل‌ها را انتخاب کنید",
+    "id_ID": "Pilih file",
+    "ms_MY": "Pilih fail",
+    "th_TH": "เลือกไฟล์",
+    "ur_PK": "فائلیں منتخب کریں",
+}
+
+NORMAL_MODE = {
+    "en_US": "Normal mode",
+    "es_ES": "Modo normal",
+    "tr_TR": "Normal mod",
+    "zh_CN": "普通模式",
+    "zh_TW": "一般模式",
+    "ru_RU": "Обычный режим",
+    "pl_PL": "Tryb normalny",
+    "uk_UA": "Звичайний режим",
+    "ja_JP": "通常モード",
+    "ko_KR": "일반 모드",
+    "hi_IN": "सामान्य मोड",
+    "bn_BD": "সাধারণ মোড",
+    "it_IT": "Modalità normale",
+    "fr_FR": "Mode normal",
+    "de_DE": "Normalmodus",
+    "pt_PT": "Modo normal",
+    "ar_SA": "الوضع العادي",
+    "vi_VN": "Chế độ bình thường",
+    "fa_IR": "حالت عادی",
+    "id_ID": "Mode normal",
+    "ms_MY": "Mod biasa",
+    "th_TH": "โหมดปกติ",
+    "ur_PK": "عام موڈ",
+}
+
+BATCH_MODE = {
+    "en_US": "Batch mode",
+    "es_ES": "Modo por lotes",
+    "tr_TR": "Toplu mod",
+    "zh_CN": "批处理模式",
+    "zh_TW": "批次模式",
+    "ru_RU": "Пакетный режим",
+    "pl_PL": "Tryb wsadowy",
+    "uk_UA": "Пакетний режим",
+    "ja_JP": "バッチモード",
+    "ko_KR": "배치 모드",
+    "hi_IN": "बैच मोड",
+    "bn_BD": "ব্যাচ মোড",
+    "it_IT": "Modalità batch",
+    "fr_FR": "Mode lot",
+    "de_DE": "Stapelmodus",
+    "pt_PT": "Modo lote",
+    "ar_SA": "وضع المجموعة",
+    "vi_VN": "Chế độ hàng loạt",
+    "fa_IR": "حالت دسته‌ای",
+    "id_ID": "Mode batch",
+    "ms_MY": "Mod kelompok",
+    "th_TH": "โหมดแบบกลุ่ม",
+    "ur_PK": "بیچ موڈ",
+}
+
+
+############### gui_auto_pairing.py ###############
+
+
+HOW_THE_PAIRING_WORKS = {
+    "en_US": "How the Pairing Works?",
+    "es_ES": "¿Cómo funciona el emparejamiento?",
+    "tr_TR": "Eşleştirme Nasıl Çalışır?",
+    "zh_CN": "配对如何工作？",
+    "zh_TW": "配對如何運作？",
+    "ru_RU": "Как работает сопряжение?",
+    "pl_PL": "Jak działa parowanie?",
+    "uk_UA": "Як працює створення пар?",
+    "ja_JP": "ペアリングはどのように機能しますか？",
+    "ko_KR": "페어링은 어떻게 작동하나요?",
+    "hi_IN": "पेयरिंग कैसे काम करती है?",
+    "bn_BD": "পেয়ারিং কীভাবে কাজ করে?",
+    "it_IT": "Come funziona l'associazione?",
+    "fr_FR": "Comment fonctionne l'appairage ?",
+    "de_DE": "Wie funktioniert die Zuordnung?",
+    "pt_PT": "Como funciona o emparelhamento?",
+    "ar_SA": "كيف يعمل الاقتران؟",
+    "vi_VN": "Ghép nối hoạt động như thế nào?",
+    "fa_IR": "جفت‌سازی چگونه کار می‌کند؟",
+    "id_ID": "Bagaimana Cara Kerja Pemasangan?",
+    "ms_MY": "Bagaimana Gandaan Berfungsi?",
+    "th_TH": "การจับคู่ทำงานอย่างไร?",
+    "ur_PK": "جوڑا بنانا کیسے کام کرتا ہے؟",
+}
+
+HOW_THE_PAIRING_WORKS_DESC = {
+    "en_US": '{program_name} automatically matches video or reference subtitle files with subtitle files that have similar episode numbers in their names.\nFor example: "S01E01.srt/mkv" will be paired with "1x01.srt"\nSupported formats: S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+    "es_ES": '{program_name} empareja automáticamente archivos de video o subtítulos de referencia con archivos de subtítulos que tienen números de episodio similares en sus nombres.\nPor ejemplo: "S01E01.srt/mkv" se emparejará con "1x01.srt"\nFormatos compatibles: S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+    "tr_TR": '{program_name} benzer bölüm numaraları olan video veya referans altyazı dosyalarını altyazı dosyalarıyla otomatik olarak eşleştirir.\nÖrnek: "S01E01.srt/mkv" dosyası "1x01.srt" ile eşleştirilecektir\nDesteklenen formatlar: S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+    "zh_CN": '{program_name} 自动匹配文件名中包含相似集数的视频或参考字幕与字幕文件。\n示例："S01E01.srt/mkv" 会与 "1x01.srt" 配对\n支持的格式：S01E01、S1E1、S01E1、S1E01、S01B01、S1B1、S01B1、S1B01、1x01、01x1、01x01、1x1、101',
+    "zh_TW": '{program_name} 會自動將影片或參考字幕檔案與檔名中包含相似集數的字幕檔案進行配對。\n例如："S01E01.srt/mkv" 將與 "1x01.srt" 配對\n支援的格式：S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+    "ru_RU": '{program_name} автоматически сопоставляет видео или эталонные субтитры с файлами субтитров с похожими номерами эпизодов в названии.\nПример: "S01E01.srt/mkv" будет сопоставлен с "1x01.srt"\nПоддерживаемые форматы: S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+    "pl_PL": '{program_name} automatycznie dopasowuje pliki wideo lub napisy referencyjne z plikami napisów o podobnych numerach odcinków w nazwach.\nPrzykład: "S01E01.srt/mkv" zostanie sparowany z "1x01.srt"\nObsługiwane formaty: S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+    "uk_UA": '{program_name} автоматично зіставляє відео або еталонні субтитри з файлами субтитрів зі схожими номерами епізодів у назві.\nПриклад: "S01E01.srt/mkv" буде зіставлено з "1x01.srt"\nПідтримувані формати: S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+    "ja_JP": '{program_name} は、ファイル名に似たエピソード番号を持つビデオや参照字幕を字幕ファイルと自動的にマッチングします。\n例: "S01E01.srt/mkv" は "1x01.srt" とペアになります\n対応フォーマット: S01E01、S1E1、S01E1、S1E01、S01B01、S1B1、S01B1、S1B01、1x01、01x1、01x01、1x1、101',
+    "ko_KR": '{program_name}는 파일명에 유사한 에피소드 번호가 있는 비디오 또는 참조 자막을 자막 파일과 자동으로 매칭합니다.\n예: "S01E01.srt/mkv"는 "1x01.srt"와 페어링됩니다\n지원 형식: S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+    "hi_IN": '{program_name} अपने नामों में समान एपिसोड नंबर वाली वीडियो या संदर्भ सबटाइटल फ़ाइलों को सबटाइटल फ़ाइलों के साथ स्वचालित रूप से मैच करता है।\nउदाहरण: "S01E01.srt/mkv" को "1x01.srt" के साथ जोड़ा जाएगा\nसमर्थित फॉर्मेट: S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+    "bn_BD": '{program_name} নামে অনুরূপ এপিসোড নম্বর রয়েছে এমন ভিডিও বা রেফারেন্স সাবটাইটেল ফাইলগুলিকে সাবটাইটেল ফাইলের সাথে স্বয়ংক্রিয়ভাবে মিলায়।\nউদাহরণ: "S01E01.srt/mkv" কে "1x01.srt" এর সাথে জোড়া দেওয়া হবে\nসমর্থিত ফরম্যাট: S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+    "it_IT": '{program_name} abbina automaticamente i file video o i sottotitoli di riferimento con i file di sottotitoli che hanno numeri di episodio simili nei loro nomi.\nEsempio: "S01E01.srt/mkv" sarà abbinato con "1x01.srt"\nFormati supportati: S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+    "fr_FR": '{program_name} associe automatiquement les fichiers vidéo ou les sous-titres de référence avec les fichiers de sous-titres qui ont des numéros d\'épisode similaires dans leurs noms.\nExemple : "S01E01.srt/mkv" sera associé avec "1x01.srt"\nFormats pris en charge : S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+    "de_DE": '{program_name} ordnet automatisch Video- oder Referenz-Untertitel mit Untertiteldateien zu, die ähnliche Episodennummern in ihren Namen haben.\nBeispiel: "S01E01.srt/mkv" wird mit "1x01.srt" gepaart\nUnterstützte Formate: S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+    "pt_PT": '{program_name} emparelha automaticamente arquivos de vídeo ou legendas de referência com arquivos de legenda que têm números de episódio similares em seus nomes.\nExemplo: "S01E01.srt/mkv" será emparelhado com "1x01.srt"\nFormatos suportados: S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+    "ar_SA": '{program_name} يطابق تلقائيًا ملفات الفيديو أو الترجمات المرجعية مع ملفات الترجمة التي لها أرقام حلقات متشابهة في أسمائها.\nمثال: "S01E01.srt/mkv" سيقترن مع "1x01.srt"\nالصيغ المدعومة: S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+    "vi_VN": '{program_name} tự động ghép các tệp video hoặc phụ đề tham chiếu với các tệp phụ đề có số tập tương tự trong tên.\nVí dụ: "S01E01.srt/mkv" sẽ được ghép với "1x01.srt"\nĐịnh dạng được hỗ trợ: S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+    "fa_IR": '{program_name} به طور خودکار فایل‌های ویدیو یا زیرنویس‌های مرجع را با فایل‌های زیرنویس که شماره قسمت‌های مشابه در نام‌هایشان دارند مطابقت می‌دهد.\nمثال: "S01E01.srt/mkv" با "1x01.srt" جفت خواهد شد\nفرمت‌های پشتیبانی شده: S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+    "id_ID": '{program_name} secara otomatis mencocokkan file video atau subtitle referensi dengan file subtitle yang memiliki nomor episode serupa dalam namanya.\nContoh: "S01E01.srt/mkv" akan dipasangkan dengan "1x01.srt"\nFormat yang didukung: S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+    "ms_MY": '{program_name} secara automatik memasangkan fail video atau sari kata rujukan dengan fail sari kata yang mempunyai nombor episod serupa dalam namanya.\nContoh: "S01E01.srt/mkv" akan dipasangkan dengan "1x01.srt"\nFormat yang disokong: S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+    "th_TH": '{program_name} จับคู่ไฟล์วิดีโอหรือคำบรรยายอ้างอิงกับไฟล์คำบรรยายที่มีหมายเลขตอนคล้ายกันในชื่อโดยอัตโนมัติ\nตัวอย่าง: "S01E01.srt/mkv" จะจับคู่กับ "1x01.srt"\nรูปแบบที่รองรับ: S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+    "ur_PK": '{program_name} خودکار طور پر ویڈیو یا ریفرنس سب ٹائٹل فائلوں کو سب ٹائٹل فائلوں کے ساتھ میچ کرتا ہے جن کے ناموں میں ملتے جلتے ایپی سوڈ نمبر ہوں۔\nمثال: "S01E01.srt/mkv" کو "1x01.srt" کے ساتھ جوڑا جائے گا\nمعاون فارمیٹس: S01E01, S1E1, S01E1, S1E01, S01B01, S1B1, S01B1, S1B01, 1x01, 01x1, 01x01, 1x1, 101',
+}
+
+MULTIPLE_SUBTITLES_DESC = {
+    "en_US": "{program_name} lets you pair multiple subtitles with a single video or reference subtitle. You can select the source on the left and add subtitles on the right.",
+    "es_ES": "{program_name} te permite emparejar múltiples subtítulos con un solo vídeo o subtítulo de referencia. Puedes seleccionar la fuente a la izquierda y añadir subtítulos a la derecha.",
+    "tr_TR": "{program_name}, birden fazla altyazıyı tek bir video veya referans altyazı ile eşleştirmenizi sağlar. Sol taraftan kaynağı seçip sağ taraftan altyazıları ekleyebilirsiniz.",
+    "zh_CN": "{program_name} 允许将多个字幕与单个视频或参考字幕配对。您可以在左侧选择来源，在右侧添加字幕。",
+    "zh_TW": "{program_name} 允許您將多個字幕與單一影片或參考字幕配對。您可以在左側選擇來源，並在右側添加字幕。",
+    "ru_RU": "{program_name} позволяет сопоставить несколько файлов субтитров с одним видео или эталонными субтитрами. Вы можете выбрать источник слева и добавить субтитры справа.",
+    "pl_PL": "{program_name} umożliwia sparowanie wielu napisów z jednym wideo lub napisami referencyjnymi. Źródło możesz wybrać po lewej, a napisy dodać po prawej.",
+    "uk_UA": "{program_name} дозволяє зіставити кілька файлів субтитрів з одним відео або еталонними субтитрами. Джерело можна вибрати ліворуч, а субтитри додати праворуч.",
+    "ja_JP": "{program_name} は、複数の字幕を1つのビデオまたは参照字幕とペアリングできます。左側でソースを選択し、右側で字幕を追加できます。",
+    "ko_KR": "{program_name}는 여러 자막을 하나의 비디오 또는 참조 자막과 페어링할 수 있게 해줍니다. 왼쪽에서 소스를 선택하고 오른쪽에서 자막을 추가할 수 있습니다.",
+    "hi_IN": "{program_name} आपको कई सबटाइटल्स को एक ही वीडियो या संदर्भ सबटाइटल के साथ पेयर करने देता है। आप बाएँ तरफ स्रोत चुन सकते हैं और दाएँ तरफ सबटाइटल जोड़ सकते हैं.",
+    "bn_BD": "{program_name} আপনাকে একাধিক সাবটাইটেলকে একটি ভিডিও বা রেফারেন্স সাবটাইটেলের সঙ্গে জোড়া দিতে দেয়। আপনি বাম পাশে সোর্স নির্বাচন করে ডান পাশে সাবটাইটেল যোগ করতে পারেন.",
+    "it_IT": "{program_name} ti consente di associare più sottotitoli a un singolo video o a un sottotitolo di riferimento. Puoi selezionare la sorgente a sinistra e aggiungere i sottotitoli a destra.",
+    "fr_FR": "{program_name} vous permet d'associer plusieurs sous-titres à une seule vidéo ou à un sous-titre de référence. Vous pouvez sélectionner la source à gauche et ajouter des sous-titres à droite.",
+    "de_DE": "{program_name} ermöglicht es Ihnen, mehrere Untertitel mit einem einzelnen Video oder Referenz-Untertitel zu koppeln. Wählen Sie links die Quelle aus und fügen Sie rechts Untertitel hinzu.",
+    "pt_PT": "{program_name} permite emparelhar várias legendas com um único vídeo ou legenda de referência. Pode selecionar a fonte à esquerda e adicionar as legendas à direita.",
+    "ar_SA": "{program_name} يتيح لك إقران عدة ترجمات بفيديو واحد أو ترجمة مرجعية واحدة. يمكنك اختيار المصدر على اليسار وإضافة الترجمات على اليمين.",
+    "vi_VN": "{program_name} cho phép bạn ghép nhiều phụ đề với một video hoặc phụ đề tham chiếu. Bạn có thể chọn nguồn ở bên trái và thêm phụ đề ở bên phải.",
+    "fa_IR": "{program_name} به شما امکان می‌دهد چندین زیرنویس را با یک ویدیو یا زیرنویس مرجع جفت کنید. می‌توانید منبع را در سمت چپ انتخاب کرده و در سمت راست زیرنویس‌ها را اضافه کنید.",
+    "id_ID": "{program_name} memungkinkan Anda memasangkan beberapa subtitle dengan satu video atau subtitle referensi. Anda dapat memilih sumber di sebelah kiri dan menambahkan subtitle di sebelah kanan.",
+    "ms_MY": "{program_name} membolehkan anda memasangkan berbilang sari kata dengan satu video atau sari kata rujukan. Anda boleh memilih sumber di sebelah kiri dan menambah sari kata di sebelah kanan.",
+    "th_TH": "{program_name} ช่วยให้คุณจับคู่คำบรรยายหลายไฟล์กับวิดีโอเดียวหรือคำบรรยายอ้างอิงได้ คุณสามารถเลือกแหล่งที่มาทางด้านซ้ายและเพิ่มคำบรรยายทางด้านขวา",
+    "ur_PK": "{program_name} آپ کو متعدد سب ٹائٹلز کو ایک ہی ویڈیو یا ریفرنس سب ٹائٹل کے ساتھ جوڑنے کی اجازت دیتا ہے۔ آپ بائیں جانب سورس منتخب کر کے دائیں جانب سب ٹائٹلز شامل کر سکتے ہیں.",
+}
+
+TOTAL_VALID_PAIRS = {
+    "en_US": "Total valid pairs: {pairs_count}",
+    "es_ES": "Total de pares válidos: {pairs_count}",
+    "tr_TR": "Toplam geçerli çift: {pairs_count}",
+    "zh_CN": "有效配对总数：{pairs_count}",
+    "zh_TW": "有效配對總數：{pairs_count}",
+    "ru_RU": "Всего действительных пар: {pairs_count}",
+    "pl_PL": "Łączna liczba prawidłowych par: {pairs_count}",
+    "uk_UA": "Загальна кількість дійсних пар: {pairs_count}",
+    "ja_JP": "有効なペア数：{pairs_count}",
+    "ko_KR": "유효한 페어 총 개수: {pairs_count}",
+    "hi_IN": "कुल वैध जोड़े: {pairs_count}",
+    "bn_BD": "মোট বৈধ জোড়া: {pairs_count}",
+    "it_IT": "Totale coppie valide: {pairs_count}",
+    "fr_FR": "Total des paires valides : {pairs_count}",
+    "de_DE": "Gültige Paare insgesamt: {pairs_count}",
+    "pt_PT": "Total de pares válidos: {pairs_count}",
+    "ar_SA": "إجمالي الأزواج الصالحة: {pairs_count}",
+    "vi_VN": "Tổng số cặp hợp lệ: {pairs_count}",
+    "fa_IR": "مجموع جفت‌های معتبر: {pairs_count}",
+    "id_ID": "Total pasangan valid: {pairs_count}",
+    "ms_MY": "Jumlah pasangan yang sah: {pairs_count}",
+    "th_TH": "จำนวนคู่ที่ถูกต้องทั้งหมด: {pairs_count}",
+    "ur_PK": "کل درست جوڑے: {pairs_count}",
+}
+
+DRAG_DROP_VIDEO_SUBTITLE_FILES = {
+    "en_US": "Drag and drop video or reference subtitle file here or click to browse.",
+    "es_ES": "Arrastra y suelta archivo de video o subtítulo de referencia aquí o haz clic para buscar.",
+    "tr_TR": "Video veya referans altyazı dosyasını buraya sürükleyip bırakın veya göz atmak için tıklayın.",
+    "zh_CN": "将视频或参考字幕文件拖放到此处或点击浏览。",
+    "zh_TW": "將影片或參考字幕檔案拖放到此處，或點擊瀏覽。",
+    "ru_RU": "Перетащите видео или файл эталонных субтитров сюда или нажмите для обзора.",
+    "pl_PL": "Przeciągnij i upuść plik wideo lub napisy referencyjne tutaj lub kliknij, aby przeglądać.",
+    "uk_UA": "Перетягніть відео або файл еталонних субтитрів сюди або натисніть для перегляду.",
+    "ja_JP": "ビデオまたは参照字幕ファイルをここにドラッグ＆ドロップするか、クリックして参照してください。",
+    "ko_KR": "비디오 또는 참조 자막 파일을 여기에 드래그 앤 드롭하거나 클릭하여 찾아보세요.",
+    "hi_IN": "वीडियो या संदर्भ सबटाइटल फ़ाइल को यहाँ ड्रैग और ड्रॉप करें या ब्राउज़ करने के लिए क्लिक करें।",
+    "bn_BD": "ভিডিও বা রেফারেন্স সাবটাইটেল ফাইল এখানে ড্র্যাগ এবং ড্রপ করুন বা ব্রাউজ করতে ক্লিক করুন।",
+    "it_IT": "Trascina e rilascia file video o sottotitolo di riferimento qui o clicca per sfogliare.",
+    "fr_FR": "Glissez et déposez un fichier vidéo ou de sous-titres de référence ici ou cliquez pour parcourir.",
+    "de_DE": "Video- oder Referenz-Untertiteldatei hier hineinziehen oder zum Durchsuchen klicken.",
+    "pt_PT": "Arraste e solte arquivo de vídeo ou legenda de referência aqui ou clique para navegar.",
+    "ar_SA": "اسحب وأفلت ملف فيديو أو ترجمة مرجعية هنا أو انقر للتصفح.",
+    "vi_VN": "Kéo và thả tệp video hoặc phụ đề tham chiếu vào đây hoặc nhấp để duyệt.",
+    "fa_IR": "فایل ویدیو یا زیرنویس مرجع را اینجا بکشید و رها کنید یا برای مرور کلیک کنید.",
+    "id_ID": "Seret dan lepas file video atau subtitle referensi di sini atau klik untuk menelusuri.",
+    "ms_MY": "Seret dan lepas fail video atau sari kata rujukan di sini atau klik untuk melihat-lihat.",
+    "th_TH": "ลากและวางไฟล์วิดีโอหรือคำบรรยายอ้างอิงที่นี่หรือคลิกเพื่อเรียกดู",
+    "ur_PK": "ویڈیو یا ریفرنس سب ٹائٹل فائل یہاں ڈریگ اور ڈراپ کریں یا براؤز کرنے کے لیے کلک کریں۔",
+}
+
+DRAG_DROP_VIDEO_SUBTITLE_FILES_OR_CLICK = {
+    "en_US": "Drag and drop video or reference subtitle files here or click for options.",
+    "es_ES": "Arrastra y suelta archivos de video o subtítulos de referencia aquí o haz clic para opciones.",
+    "tr_TR": "Video veya referans altyazı dosyalarını buraya sürükleyip bırakın veya seçenekler için tıklayın.",
+    "zh_CN": "将视频或参考字幕文件拖放到此处或点击选择选项。",
+    "zh_TW": "將影片或參考字幕檔案拖放到此處，或點擊以查看選項。",
+    "ru_RU": "Перетащите видео или файлы эталонных субтитров сюда или нажмите для опций.",
+    "pl_PL": "Przeciągnij i upuść pliki wideo lub napisy referencyjne tutaj lub kliknij dla opcji.",
+    "uk_UA": "Перетягніть відео або файли еталонних субтитрів сюди або натисніть для опцій.",
+    "ja_JP": "ビデオまたは参照字幕ファイルをここにドラッグ＆ドロップするか、オプションをクリックしてください。",
+    "ko_KR": "비디오 또는 참조 자막 파일을 여기에 드래그 앤 드롭하거나 옵션을 클릭하세요.",
+    "hi_IN": "वीडियो या संदर्भ सबटाइटल फ़ाइलों को यहाँ ड्रैग और ड्रॉप करें या विकल्पों के लिए क्लिक करें।",
+    "bn_BD": "ভিডিও বা রেফারেন্স সাবটাইটেল ফাইলগুলি এখানে ড্র্যাগ এবং ড্রপ করুন বা বিকল্পের জন্য ক্লিক করুন।",
+    "it_IT": "Trascina e rilascia file video o sottotitoli di riferimento qui o clicca per le opzioni.",
+    "fr_FR": "Glissez et déposez des fichiers vidéo ou de sous-titres de référence ici ou cliquez pour les options.",
+    "de_DE": "Video- oder Referenz-Untertiteldateien hier hineinziehen oder für Optionen klicken.",
+    "pt_PT": "Arraste e solte arquivos de vídeo ou legendas de referência aqui ou clique para opções.",
+    "ar_SA": "اسحب وأسقط ملفات الفيديو أو الترجمات المرجعية هنا أو انقر للخيارات.",
+    "vi_VN": "Kéo và thả tệp video hoặc phụ đề tham chiếu vào đây hoặc nhấp để xem tùy chọn.",
+    "fa_IR": "فایل‌های ویدیو یا زیرنویس مرجع را اینجا بکشید و رها کنید یا برای گزینه‌ها کلیک کنید.",
+    "id_ID": "Seret dan lepas file video atau subtitle referensi di sini atau klik untuk opsi.",
+    "ms_MY": "Seret dan lepas fail video atau sari kata rujukan di sini atau klik untuk pilihan.",
+    "th_TH": "ลากและวางไฟล์วิดีโอหรือคำบรรยายอ้างอิงที่นี่หรือคลิกเพื่อดูตัวเลือก",
+    "ur_PK": "ویڈیو یا ریفرنس سب ٹائٹل فائلوں کو یہاں ڈریگ اور ڈراپ کریں یا آپشنز کے لیے کلک کریں۔",
+}
+
+DRAG_DROP_SUBTITLE_FILES_OR_CLICK = {
+    "en_US": "Drag and drop subtitle files here or click for options.",
+    "es_ES": "Arrastra y suelta archivos de subtítulos aquí o haz clic para opciones.",
+    "tr_TR": "Altyazı dosyalarını buraya sürükleyip bırakın veya seçenekler için tıklayın.",
+    "zh_CN": "将字幕文件拖放到此处或点击选择选项。",
+    "zh_TW": "將字幕檔案拖放到此處，或點擊以查看選項。",
+    "ru_RU": "Перетащите файлы субтитров сюда или нажмите для опций.",
+    "pl_PL": "Przeciągnij i upuść pliki napisów tutaj lub kliknij dla opcji.",
+    "uk_UA": "Перетягніть файли субтитрів сюди або натисніть для опцій.",
+    "ja_JP": "字幕ファイルをここにドラッグ＆ドロップするか、オプションをクリックしてください。",
+    "ko_KR": "자막 파일을 여기에 드래그 앤 드롭하거나 옵션을 클릭하세요.",
+    "hi_IN": "सबटाइटल फ़ाइलों को यहाँ ड्रैग और ड्रॉप करें या विकल्पों के लिए क्लिक करें।",
+    "bn_BD": "সাবটাইটেল ফাইলগুলি এখানে ড্র্যাগ এবং ড্রপ করুন বা বিকল্পের জন্য ক্লিক করুন।",
+    "it_IT": "Trascina e rilascia file sottotitoli qui o clicca per le opzioni.",
+    "fr_FR": "Glissez et déposez des fichiers de sous-titres ici ou cliquez pour les options.",
+    "de_DE": "Untertiteldateien hier hineinziehen oder für Optionen klicken.",
+    "pt_PT": "Arraste e solte arquivos de legenda aqui ou clique para opções.",
+    "ar_SA": "اسحب وأسقط ملفات الترجمة هنا أو انقر للخيارات.",
+    "vi_VN": "Kéo và thả tệp phụ đề vào đây hoặc nhấp để xem tùy chọn.",
+    "fa_IR": "فایل‌های زیرنویس را اینجا بکشید و رها کنید یا برای گزینه‌ها کلیک کنید.",
+    "id_ID": "Seret dan lepas file subtitle di sini atau klik untuk opsi.",
+    "ms_MY": "Seret dan lepas fail sari kata di sini atau klik untuk pilihan.",
+    "th_TH": "ลากและวางไฟล์คำบรรยายที่นี่หรือคลิกเพื่อดูตัวเลือก",
+    "ur_PK": "سب ٹائٹل فائلوں کو یہاں ڈریگ اور ڈراپ کریں یا آپشنز کے لیے کلک کریں।",
+}
+
+MOVE_SELECTED_ITEMS_TO_OTHER_LIST = {
+    "en_US": "Move selected items to other list",
+    "es_ES": "Mover elementos seleccionados a la otra lista",
+    "tr_TR": "Seçili öğeleri diğer listeye taşı",
+    "zh_CN": "将选中项目移动到另一个列表",
+    "zh_TW": "將所選項目移動到另一個清單",
+    "ru_RU": "Переместить выбранные элементы в другой список",
+    "pl_PL": "Przenieś wybrane elementy do drugiej listy",
+    "uk_UA": "Перемістити вибрані елементи до іншого списку",
+    "ja_JP": "選択した項目を他のリストに移動",
+    "ko_KR": "선택한 항목을 다른 목록으로 이동",
+    "hi_IN": "चयनित आइटम को दूसरी सूची में स्थानांतरित करें",
+    "bn_BD": "নির্বাচিত আইটেমগুলি অন্য তালিকায় সরান",
+    "it_IT": "Sposta gli elementi selezionati nell'altra lista",
+    "fr_FR": "Déplacer les éléments sélectionnés vers l'autre liste",
+    "de_DE": "Ausgewählte Elemente in andere Liste verschieben",
+    "pt_PT": "Mover itens selecionados para a outra lista",
+    "ar_SA": "نقل العناصر المحددة إلى القائمة الأخرى",
+    "vi_VN": "Di chuyển các mục đã chọn sang danh sách khác",
+    "fa_IR": "انتقال موارد انتخاب شده به فهرست دیگر",
+    "id_ID": "Pindahkan item yang dipilih ke daftar lain",
+    "ms_MY": "Alihkan item yang dipilih ke senarai lain",
+    "th_TH": "ย้ายรายการที่เลือกไปยังรายการอื่น",
+    "ur_PK": "منتخب آئٹمز کو دوسری فہرست میں منتقل کریں",
+}
+
+VIDEO_REFERENCE_SUBTITLES_TOTAL = {
+    "en_US": "Video/Reference Subtitles (Total files: {count})",
+    "es_ES": "Video/Subtítulos de referencia (Total de archivos: {count})",
+    "tr_TR": "Video/Referans Altyazılar (Toplam dosya: {count})",
+    "zh_CN": "视频/参考字幕 (文件总数: {count})",
+    "zh_TW": "影片/參考字幕 (檔案總數: {count})",
+    "ru_RU": "Видео/Эталонные субтитры (Всего файлов: {count})",
+    "pl_PL": "Wideo/Napisy referencyjne (Łącznie plików: {count})",
+    "uk_UA": "Відео/Еталонні субтитри (Всього файлів: {count})",
+    "ja_JP": "ビデオ/参照字幕 (ファイル総数: {count})",
+    "ko_KR": "비디오/참조 자막 (총 파일 수: {count})",
+    "hi_IN": "वीडियो/संदर्भ सबटाइटल (कुल फ़ाइलें: {count})",
+    "bn_BD": "ভিডিও/রেফারেন্স সাবটাইটেল (মোট ফাইল: {count})",
+    "it_IT": "Video/Sottotitoli di riferimento (File totali: {count})",
+    "fr_FR": "Vidéo/Sous-titres de référence (Total des fichiers : {count})",
+    "de_DE": "Video/Referenz-Untertitel (Dateien insgesamt: {count})",
+    "pt_PT": "Vídeo/Legendas de referência (Total de arquivos: {count})",
+    "ar_SA": "فيديو/ترجمات مرجعية (إجمالي الملفات: {count})",
+    "vi_VN": "Video/Phụ đề tham chiếu (Tổng số tệp: {count})",
+    "fa_IR": "ویدیو/زیرنویس‌های مرجع (مجموع فایل‌ها: {count})",
+    "id_ID": "Video/Subtitle Referensi (Total file: {count})",
+    "ms_MY": "Video/Sari Kata Rujukan (Jumlah fail: {count})",
+    "th_TH": "วิดีโอ/คำบรรยายอ้างอิง (ไฟล์ทั้งหมด: {count})",
+    "ur_PK": "ویڈیو/ریفرنس سب ٹائٹلز (کل فائلیں: {count})",
+}
+
+SUBTITLE_FILES_TOTAL = {
+    "en_US": "Subtitle Files (Total files: {count})",
+    "es_ES": "Archivos de subtítulos (Total de archivos: {count})",
+    "tr_TR": "Altyazı Dosyaları (Toplam dosya: {count})",
+    "zh_CN": "字幕文件 (文件总数: {count})",
+    "zh_TW": "字幕檔案 (檔案總數: {count})",
+    "ru_RU": "Файлы субтитров (Всего файлов: {count})",
+    "pl_PL": "Pliki napisów (Łącznie plików: {count})",
+    "uk_UA": "Файли субтитрів (Всього файлів: {count})",
+    "ja_JP": "字幕ファイル (ファイル総数: {count})",
+    "ko_KR": "자막 파일 (총 파일 수: {count})",
+    "hi_IN": "सबटाइटल फ़ाइलें (कुल फ़ाइलें: {count})",
+    "bn_BD": "সাবটাইটেল ফাইল (মোট ফাইল: {count})",
+    "it_IT": "File sottotitoli (File totali: {count})",
+    "fr_FR": "Fichiers de sous-titres (Total des fichiers : {count})",
+    "de_DE": "Untertiteldateien (Dateien insgesamt: {count})",
+    "pt_PT": "Arquivos de legenda (Total de arquivos: {count})",
+    "ar_SA": "ملفات الترجمة (إجمالي الملفات: {count})",
+    "vi_VN": "Tệp phụ đề (Tổng số tệp: {count})",
+    "fa_IR": "فایل‌های زیرنویس (مجموع فایل‌ها: {count})",
+    "id_ID": "File Subtitle (Total file: {count})",
+    "ms_MY": "Fail Sari Kata (Jumlah fail: {count})",
+    "th_TH": "ไฟล์คำบรรยาย (ไฟล์ทั้งหมด: {count})",
+    "ur_PK": "سب ٹائٹل فائلیں (کل فائلیں: {count})",
+}
+
+MOVE_TO_OTHER_LIST = {
+    "en_US": "Move to other list",
+    "es_ES": "Mover a otra lista",
+    "tr_TR": "Diğer listeye taşı",
+    "zh_CN": "移动到另一个列表",
+    "zh_TW": "移動到另一個清單",
+    "ru_RU": "Переместить в другой список",
+    "pl_PL": "Przenieś do drugiej listy",
+    "uk_UA": "Перемістити до іншого списку",
+    "ja_JP": "他のリストに移動",
+    "ko_KR": "다른 목록으로 이동",
+    "hi_IN": "दूसरी सूची में स्थानांतरित करें",
+    "bn_BD": "অন্য তালিকায় সরান",
+    "it_IT": "Sposta nell'altra lista",
+    "fr_FR": "Déplacer vers l'autre liste",
+    "de_DE": "In andere Liste verschieben",
+    "pt_PT": "Mover para outra lista",
+    "ar_SA": "نقل إلى القائمة الأخرى",
+    "vi_VN": "Di chuyển sang danh sách khác",
+    "fa_IR": "انتقال به فهرست دیگر",
+    "id_ID": "Pindah ke daftar lain",
+    "ms_MY": "Alih ke senarai lain",
+    "th_TH": "ย้ายไปยังรายการอื่น",
+    "ur_PK": "دوسری فہرست میں منتقل کریں",
+}
+
+SKIPPED_FILES_VIDEO_CANT_MOVE = {
+    "en_US": "Skipped {count} file(s): Video files can't be moved to subtitle list",
+    "es_ES": "Se omitieron {count} archivo(s): Los archivos de video no se pueden mover a la lista de subtítulos",
+    "tr_TR": "{count} dosya atlandı: Video dosyaları altyazı listesine taşınamaz",
+    "zh_CN": "跳过 {count} 个文件：视频文件不能移动到字幕列表",
+    "zh_TW": "跳過 {count} 個檔案：影片檔案無法移動到字幕清單",
+    "ru_RU": "Пропущено {count} файл(ов): Видеофайлы нельзя переместить в список субтитров",
+    "pl_PL": "Pominięto {count} plik(ów): Pliki wideo nie mogą być przeniesione do listy napisów",
+    "uk_UA": "Пропущено {count} файл(ів): Відеофайли не можна перемістити до списку субтитрів",
+    "ja_JP": "{count}個のファイルをスキップ: ビデオファイルは字幕リストに移動できません",
+    "ko_KR": "{count}개 파일 건너뜀: 비디오 파일은 자막 목록으로 이동할 수 없습니다",
+    "hi_IN": "{count} फ़ाइल(ें) छोड़ी गईं: वीडियो फ़ाइलों को सबटाइटल सूची में स्थानांतरित नहीं किया जा सकता",
+    "bn_BD": "{count}টি ফাইল এড়িয়ে যাওয়া হয়েছে: ভিডিও ফাইলগুলি সাবটাইটেল তালিকায় সরানো যাবে না",
+    "it_IT": "Saltati {count} file: I file video non possono essere spostati nella lista sottotitoli",
+    "fr_FR": "{count} fichier(s) ignoré(s) : Les fichiers vidéo ne peuvent pas être déplacés vers la liste des sous-titres",
+    "de_DE": "{count} Datei(en) übersprungen: Videodateien können nicht in die Untertitelliste verschoben werden",
+    "pt_PT": "{count} arquivo(s) ignorado(s): Arquivos de vídeo não podem ser movidos para a lista de legendas",
+    "ar_SA": "تم تخطي {count} ملف (ملفات): لا يمكن نقل ملفات الفيديو إلى قائمة الترجمة",
+    "vi_VN": "Đã bỏ qua {count} tệp: Tệp video không thể di chuyển sang danh sách phụ đề",
+    "fa_IR": "{count} فایل نادیده گرفته شد: فایل‌های ویدیو نمی‌توانند به فهرست زیرنویس منتقل شوند",
+    "id_ID": "Dilewati {count} file: File video tidak bisa dipindah ke daftar subtitle",
+    "ms_MY": "Dilangkau {count} fail: Fail video tidak boleh dipindahkan ke senarai sari kata",
+    "th_TH": "ข้าม {count} ไฟล์: ไฟล์วิดีโอไม่สามารถย้ายไปยังรายการคำบรรยายได้",
+    "ur_PK": "{count} فائل(یں) چھوڑی گئیں: ویڈیو فائلوں کو سب ٹائٹل فہرست میں منتقل نہیں کیا جا سکتا",
+}
+
+MOVE_ERRORS = {
+    "en_US": "Move Errors",
+    "es_ES": "Errores de movimiento",
+    "tr_TR": "Taşıma hataları",
+    "zh_CN": "移动错误",
+    "zh_TW": "移動錯誤",
+    "ru_RU": "Ошибки перемещения",
+    "pl_PL": "Błędy przenoszenia",
+    "uk_UA": "Помилки переміщення",
+    "ja_JP": "移動エラー",
+    "ko_KR": "이동 오류",
+    "hi_IN": "स्थानांतरण त्रुटियां",
+    "bn_BD": "স্থানান্তর ত্রুটি",
+    "it_IT": "Errori di spostamento",
+    "fr_FR": "Erreurs de déplacement",
+    "de_DE": "Verschiebungsfehler",
+    "pt_PT": "Erros de movimentação",
+    "ar_SA": "أخطاء النقل",
+    "vi_VN": "Lỗi di chuyển",
+    "fa_IR": "خطاهای انتقال",
+    "id_ID": "Kesalahan pemindahan",
+    "ms_MY": "Ralat pemindahan",
+    "th_TH": "ข้อผิดพลาดในการย้าย",
+    "ur_PK": "منتقلی کی خرابیاں",
+}
+
+NONE_OF_SELECTED_FILES_HAVE_VALID_EXTENSIONS = {
+    "en_US": "None of the selected files have valid extensions for the {list_type} list.",
+    "es_ES": "Ninguno de los archivos seleccionados tiene extensiones válidas para la lista de {list_type}.",
+    "tr_TR": "Seçilen dosyaların hiçbiri {list_type} listesi için geçerli uzantılara sahip değil.",
+    "zh_CN": "所选文件中没有任何文件具有 {list_type} 列表的有效扩展名。",
+    "zh_TW": "所選檔案中沒有任何檔案具有 {list_type} 清單的有效副檔名。",
+    "ru_RU": "Ни один из выбранных файлов не имеет действительных расширений для списка {list_type}.",
+    "pl_PL": "Żaden z wybranych plików nie ma prawidłowych rozszerzeń dla listy {list_type}.",
+    "uk_UA": "Жоден з вибраних файлів не має дійсних розширень для списку {list_type}.",
+    "ja_JP": "選択されたファイルには、{list_type}リストに有効な拡張子がありません。",
+    "ko_KR": "선택한 파일 중 {list_type} 목록에 유효한 확장자가 있는 파일이 없습니다.",
+    "hi_IN": "चयनित फ़ाइलों में से किसी भी फ़ाइल में {list_type} सूची के लिए वैध एक्सटेंशन नहीं हैं।",
+    "bn_BD": "নির্বাচিত ফাইলগুলির কোনোটিতেই {list_type} তালিকার জন্য বৈধ এক্সটেনশন নেই।",
+    "it_IT": "Nessuno dei file selezionati ha estensioni valide per l'elenco {list_type}.",
+    "fr_FR": "Aucun des fichiers sélectionnés n'a d'extensions valides pour la liste {list_type}.",
+    "de_DE": "Keine der ausgewählten Dateien hat gültige Erweiterungen für die {list_type}-Liste.",
+    "pt_PT": "Nenhum dos arquivos selecionados possui extensões válidas para a lista {list_type}.",
+    "ar_SA": "لا يحتوي أي من الملفات المحددة على امتدادات صالحة لقائمة {list_type}.",
+    "vi_VN": "Không có tệp nào được chọn có phần mở rộng hợp lệ cho danh sách {list_type}.",
+    "fa_IR": "هیچ‌یک از فایل‌های انتخاب شده پسوند معتبری برای فهرست {list_type} ندارند.",
+    "id_ID": "Tidak ada file yang dipilih memiliki ekstensi yang valid untuk daftar {list_type}.",
+    "ms_MY": "Tiada fail yang dipilih mempunyai sambungan yang sah untuk senarai {list_type}.",
+    "th_TH": "ไม่มีไฟล์ที่เลือกมีนามสกุลที่ถูกต้องสำหรับรายการ {list_type}",
+    "ur_PK": "منتخب فائلوں میں سے کوئی بھی {list_type} فہرست کے لیے درست ایکسٹینشن نہیں رکھتی۔",
+}
+
+REFERENCE = {
+    "en_US": "reference",
+    "es_ES": "referencia",
+    "tr_TR": "referans",
+    "zh_CN": "参考",
+    "zh_TW": "參考",
+    "ru_RU": "эталонный",
+    "pl_PL": "referencyjny",
+    "uk_UA": "еталонний",
+    "ja_JP": "参照",
+    "ko_KR": "참조",
+    "hi_IN": "संदर्भ",
+    "bn_BD": "রেফারেন্স",
+    "it_IT": "riferimento",
+    "fr_FR": "référence",
+    "de_DE": "Referenz",
+    "pt_PT": "referência",
+    "ar_SA": "مرجعي",
+    "vi_VN": "tham chiếu",
+    "fa_IR": "مرجع",
+    "id_ID": "referensi",
+    "ms_MY": "rujukan",
+    "th_TH": "อ้างอิง",
+    "ur_PK": "ریفرنس",
+}
+
+SUBTITLE = {
+    "en_US": "subtitle",
+    "es_ES": "subtítulo",
+    "tr_TR": "altyazı",
+    "zh_CN": "字幕",
+    "zh_TW": "字幕",
+    "ru_RU": "субтитры",
+    "pl_PL": "napisy",
+    "uk_UA": "субтитри",
+    "ja_JP": "字幕",
+    "ko_KR": "자막",
+    "hi_IN": "सबटाइटल",
+    "bn_BD": "সাবটাইটেল",
+    "it_IT": "sottotitolo",
+    "fr_FR": "sous-titre",
+    "de_DE": "Untertitel",
+    "pt_PT": "legenda",
+    "ar_SA": "ترجمة",
+    "vi_VN": "phụ đề",
+    "fa_IR": "زیرنویس",
+    "id_ID": "subtitle",
+    "ms_MY": "sari kata",
+    "th_TH": "คำบรรยาย",
+    "ur_PK": "سب ٹائٹل",
+}
+
+ALL_FILES_ALREADY_IN_LISTS = {
+    "en_US": "All files are already in the {list_type} list or the other list.",
+    "es_ES": "Todos los archivos ya están en la lista de {list_type} o en la otra lista.",
+    "tr_TR": "Tüm dosyalar zaten {list_type} listesinde veya diğer listede.",
+    "zh_CN": "所有文件都已经在 {list_type} 列表或另一个列表中。",
+    "zh_TW": "所有檔案都已在 {list_type} 清單或另一個清單中。",
+    "ru_RU": "Все файлы уже находятся в списке {list_type} или в другом списке.",
+    "pl_PL": "Wszystkie pliki są już na liście {list_type} lub na drugiej liście.",
+    "uk_UA": "Всі файли вже знаходяться в списку {list_type} або в іншому списку.",
+    "ja_JP": "すべてのファイルは既に{list_type}リストまたは他のリストにあります。",
+    "ko_KR": "모든 파일이 이미 {list_type} 목록 또는 다른 목록에 있습니다.",
+    "hi_IN": "सभी फ़ाइलें पहले से ही {list_type} सूची या दूसरी सूची में हैं।",
+    "bn_BD": "সমস্ত ফাইল ইতিমধ্যে {list_type} তালিকায় বা অন্য তালিকায় রয়েছে।",
+    "it_IT": "Tutti i file sono già nell'elenco {list_type} o nell'altro elenco.",
+    "fr_FR": "Tous les fichiers sont déjà dans la liste {list_type} ou dans l'autre liste.",
+    "de_DE": "Alle Dateien sind bereits in der {list_type}-Liste oder in der anderen Liste.",
+    "pt_PT": "Todos os arquivos já estão na lista {list_type} ou na outra lista.",
+    "ar_SA": "جميع الملفات موجودة بالفعل في قائمة {list_type} أو القائمة الأخرى.",
+    "vi_VN": "Tất cả tệp đã có trong danh sách {list_type} hoặc danh sách khác.",
+    "fa_IR": "همه فایل‌ها از قبل در فهرست {list_type} یا فهرست دیگر وجود دارند.",
+    "id_ID": "Semua file sudah ada dalam daftar {list_type} atau daftar lainnya.",
+    "ms_MY": "Semua fail sudah ada dalam senarai {list_type} atau senarai lain.",
+    "th_TH": "ไฟล์ทั้งหมดอยู่ในรายการ {list_type} หรือรายการอื่นแล้ว",
+    "ur_PK": "تمام فائلیں پہلے سے ہی {list_type} فہرست یا دوسری فہرست میں موجود ہیں۔",
+}
+
+SUCCESSFULLY_ADDED_FILES = {
+    "en_US": "Successfully added {count} file(s)",
+    "es_ES": "Se agregaron exitosamente {count} archivo(s)",
+    "tr_TR": "{count} dosya başarıyla eklendi",
+    "zh_CN": "成功添加 {count} 个文件",
+    "zh_TW": "成功添加 {count} 個檔案",
+    "ru_RU": "Успешно добавлено {count} файл(ов)",
+    "pl_PL": "Pomyślnie dodano {count} plik(ów)",
+    "uk_UA": "Успішно додано {count} файл(ів)",
+    "ja_JP": "{count}個のファイルが正常に追加されました",
+    "ko_KR": "{count}개 파일이 성공적으로 추가되었습니다",
+    "hi_IN": "{count} फ़ाइल(ें) सफलतापूर्वक जोड़ी गईं",
+    "bn_BD": "{count}টি ফাইল সফলভাবে যোগ করা হয়েছে",
+    "it_IT": "Aggiunti con successo {count} file",
+    "fr_FR": "{count} fichier(s) ajouté(s) avec succès",
+    "de_DE": "{count} Datei(en) erfolgreich hinzugefügt",
+    "pt_PT": "{count} arquivo(s) adicionado(s) com sucesso",
+    "ar_SA": "تمت إضافة {count} ملف (ملفات) بنجاح",
+    "vi_VN": "Đã thêm thành công {count} tệp",
+    "fa_IR": "{count} فایل با موفقیت اضافه شد",
+    "id_ID": "Berhasil menambahkan {count} file",
+    "ms_MY": "Berjaya menambah {count} fail",
+    "th_TH": "เพิ่ม {count} ไฟล์สำเร็จ",
+    "ur_PK": "{count} فائل(یں) کامیابی سے شامل کی گئیں",
+}
+
+SKIPPED_FILES_MISSING_SEASON_EPISODE = {
+    "en_US": "Skipped {count} file(s): Missing season/episode info",
+    "es_ES": "Se omitieron {count} archivo(s): Falta información de temporada/episodio",
+    "tr_TR": "{count} dosya atlandı: Sezon/bölüm bilgisi eksik",
+    "zh_CN": "跳过 {count} 个文件：缺少季/集信息",
+    "zh_TW": "跳過 {count} 個檔案：缺少季/集資訊",
+    "ru_RU": "Пропущено {count} файл(ов): Отсутствует информация о сезоне/эпизоде",
+    "pl_PL": "Pominięto {count} plik(ów): Brak informacji o sezonie/odcinku",
+    "uk_UA": "Пропущено {count} файл(ів): Відсутня інформація про сезон/епізод",
+    "ja_JP": "{count}個のファイルをスキップ: シーズン/エピソード情報が不足",
+    "ko_KR": "{count}개 파일 건너뜀: 시즌/에피소드 정보 누락",
+    "hi_IN": "{count} फ़ाइल(ें) छोड़ी गईं: सीज़न/एपिसोड की जानकारी गायब",
+    "bn_BD": "{count}টি ফাইল এড়িয়ে যাওয়া হয়েছে: সিজন/এপিসোড তথ্য অনুপস্থিত",
+    "it_IT": "Saltati {count} file: Informazioni stagione/episodio mancanti",
+    "fr_FR": "{count} fichier(s) ignoré(s) : Informations saison/épisode manquantes",
+    "de_DE": "{count} Datei(en) übersprungen: Staffel-/Episodeninformationen fehlen",
+    "pt_PT": "{count} arquivo(s) ignorado(s): Informações de temporada/episódio ausentes",
+    "ar_SA": "تم تخطي {count} ملف (ملفات): معلومات الموسم/الحلقة مفقودة",
+    "vi_VN": "Đã bỏ qua {count} tệp: Thiếu thông tin mùa/tập",
+    "fa_IR": "{count} فایل نادیده گرفته شد: اطلاعات فصل/قسمت موجود نیست",
+    "id_ID": "Dilewati {count} file: Informasi season/episode hilang",
+    "ms_MY": "Dilangkau {count} fail: Maklumat musim/episod hilang",
+    "th_TH": "ข้าม {count} ไฟล์: ขาดข้อมูลซีซัน/ตอน",
+    "ur_PK": "{count} فائل(یں) چھوڑی گئیں: سیزن/ایپی سوڈ کی معلومات غائب",
+}
+
+SKIPPED_FILES_ALREADY_IN_THIS_LIST = {
+    "en_US": "Skipped {count} file(s): Already in this list",
+    "es_ES": "Se omitieron {count} archivo(s): Ya están en esta lista",
+    "tr_TR": "{count} dosya atlandı: Zaten bu listede",
+    "zh_CN": "跳过 {count} 个文件：已在此列表中",
+    "zh_TW": "跳過 {count} 個檔案：已在此清單中",
+    "ru_RU": "Пропущено {count} файл(ов): Уже в этом списке",
+    "pl_PL": "Pominięto {count} plik(ów): Już na tej liście",
+    "uk_UA": "Пропущено {count} файл(ів): Вже в цьому списку",
+    "ja_JP": "{count}個のファイルをスキップ: 既にこのリストにあります",
+    "ko_KR": "{count}개 파일 건너뜀: 이미 이 목록에 있음",
+    "hi_IN": "{count} फ़ाइल(ें) छोड़ी गईं: पहले से ही इस सूची में हैं",
+    "bn_BD": "{count}টি ফাইল এড়িয়ে যাওয়া হয়েছে: ইতিমধ্যে এই তালিকায় রয়েছে",
+    "it_IT": "Saltati {count} file: Già in questa lista",
+    "fr_FR": "{count} fichier(s) ignoré(s) : Déjà dans cette liste",
+    "de_DE": "{count} Datei(en) übersprungen: Bereits in dieser Liste",
+    "pt_PT": "{count} arquivo(s) ignorado(s): Já estão nesta lista",
+    "ar_SA": "تم تخطي {count} ملف (ملفات): موجود بالفعل في هذه القائمة",
+    "vi_VN": "Đã bỏ qua {count} tệp: Đã có trong danh sách này",
+    "fa_IR": "{count} فایل نادیده گرفته شد: از قبل در این فهرست موجود است",
+    "id_ID": "Dilewati {count} file: Sudah ada dalam daftar ini",
+    "ms_MY": "Dilangkau {count} fail: Sudah ada dalam senarai ini",
+    "th_TH": "ข้าม {count} ไฟล์: อยู่ในรายการนี้แล้ว",
+    "ur_PK": "{count} فائل(یں) چھوڑی گئیں: پہلے سے اس فہرست میں موجود ہیں",
+}
+
+SKIPPED_FILES_ALREADY_IN_OTHER_LIST = {
+    "en_US": "Skipped {count} file(s): Already in other list",
+    "es_ES": "Se omitieron {count} archivo(s): Ya están en la otra lista",
+    "tr_TR": "{count} dosya atlandı: Zaten diğer listede",
+    "zh_CN": "跳过 {count} 个文件：已在另一个列表中",
+    "zh_TW": "跳過 {count} 個檔案：已在另一個清單中",
+    "ru_RU": "Пропущено {count} файл(ов): Уже в другом списке",
+    "pl_PL": "Pominięto {count} plik(ów): Już na drugiej liście",
+    "uk_UA": "Пропущено {count} файл(ів): Вже в іншому списку",
+    "ja_JP": "{count}個のファイルをスキップ: 既に他のリストにあります",
+    "ko_KR": "{count}개 파일 건너뜀: 이미 다른 목록에 있음",
+    "hi_IN": "{count} फ़ाइल(ें) छोड़ी गईं: पहले से ही दूसरी सूची में हैं",
+    "bn_BD": "{count}টি ফাইল এড়িয়ে যাওয়া হয়েছে: ইতিমধ্যে অন্য তালিকায় রয়েছে",
+    "it_IT": "Saltati {count} file: Già nell'altra lista",
+    "fr_FR": "{count} fichier(s) ignoré(s) : Déjà dans l'autre liste",
+    "de_DE": "{count} Datei(en) übersprungen: Bereits in der anderen Liste",
+    "pt_PT": "{count} arquivo(s) ignorado(s): Já estão na outra lista",
+    "ar_SA": "تم تخطي {count} ملف (ملفات): موجود بالفعل في القائمة الأخرى",
+    "vi_VN": "Đã bỏ qua {count} tệp: Đã có trong danh sách khác",
+    "fa_IR": "{count} فایل نادیده گرفته شد: از قبل در فهرست دیگر موجود است",
+    "id_ID": "Dilewati {count} file: Sudah ada dalam daftar lain",
+    "ms_MY": "Dilangkau {count} fail: Sudah ada dalam senarai lain",
+    "th_TH": "ข้าม {count} ไฟล์: อยู่ในรายการอื่นแล้ว",
+    "ur_PK": "{count} فائل(یں) چھوڑی گئیں: پہلے سے دوسری فہرست میں موجود ہیں",
+}
+
+SKIPPED_FILES_INVALID_EXTENSION = {
+    "en_US": "Skipped {count} file(s): Invalid file extension",
+    "es_ES": "Se omitieron {count} archivo(s): Extensión de archivo inválida",
+    "tr_TR": "{count} dosya atlandı: Geçersiz dosya uzantısı",
+    "zh_CN": "跳过 {count} 个文件：文件扩展名无效",
+    "zh_TW": "跳過 {count} 個檔案：無效的檔案副檔名",
+    "ru_RU": "Пропущено {count} файл(ов): Недействительное расширение файла",
+    "pl_PL": "Pominięto {count} plik(ów): Nieprawidłowe rozszerzenie pliku",
+    "uk_UA": "Пропущено {count} файл(ів): Недійсне розширення файлу",
+    "ja_JP": "{count}個のファイルをスキップ: 無効なファイル拡張子",
+    "ko_KR": "{count}개 파일 건너뜀: 유효하지 않은 파일 확장자",
+    "hi_IN": "{count} फ़ाइल(ें) छोड़ी गईं: अवैध फ़ाइल एक्सटेंशन",
+    "bn_BD": "{count}টি ফাইল এড়িয়ে যাওয়া হয়েছে: অবৈধ ফাইল এক্সটেনশন",
+    "it_IT": "Saltati {count} file: Estensione file non valida",
+    "fr_FR": "{count} fichier(s) ignoré(s) : Extension de fichier non valide",
+    "de_DE": "{count} Datei(en) übersprungen: Ungültige Dateierweiterung",
+    "pt_PT": "{count} arquivo(s) ignorado(s): Extensão de arquivo inválida",
+    "ar_SA": "تم تخطي {count} ملف (ملفات): امتداد ملف غير صالح",
+    "vi_VN": "Đã bỏ qua {count} tệp: Phần mở rộng tệp không hợp lệ",
+    "fa_IR": "{count} فایل نادیده گرفته شد: پسوند فایل نامعتبر",
+    "id_ID": "Dilewati {count} file: Ekstensi file tidak valid",
+    "ms_MY": "Dilangkau {count} fail: Sambungan fail tidak sah",
+    "th_TH": "ข้าม {count} ไฟล์: นามสกุลไฟล์ไม่ถูกต้อง",
+    "ur_PK": "{count} فائل(یں) چھوڑی گئیں: غلط فائل ایکسٹینشن",
+}
+
+SKIPPED_FILES_DUPLICATE_EPISODE = {
+    "en_US": "Skipped {count} file(s): Duplicate season/episode",
+    "es_ES": "Se omitieron {count} archivo(s): Temporada/episodio duplicado",
+    "tr_TR": "{count} dosya atlandı: Yinelenen sezon/bölüm",
+    "zh_CN": "跳过 {count} 个文件：重复的季/集",
+    "zh_TW": "跳過 {count} 個檔案：重複的季/集",
+    "ru_RU": "Пропущено {count} файл(ов): Дублирующийся сезон/эпизод",
+    "pl_PL": "Pominięto {count} plik(ów): Zduplikowany sezon/odcinek",
+    "uk_UA": "Пропущено {count} файл(ів): Дубльований сезон/епізод",
+    "ja_JP": "{count}個のファイルをスキップ: 重複したシーズン/エピソード",
+    "ko_KR": "{count}개 파일 건너뜀: 중복된 시즌/에피소드",
+    "hi_IN": "{count} फ़ाइल(ें) छोड़ी गईं: डुप्लिकेट सीज़न/एपिसोड",
+    "bn_BD": "{count}টি ফাইল এড়িয়ে যাওয়া হয়েছে: ডুপ্লিকেট সিজন/এপিসোড",
+    "it_IT": "Saltati {count} file: Stagione/episodio duplicato",
+    "fr_FR": "{count} fichier(s) ignoré(s) : Saison/épisode en double",
+    "de_DE": "{count} Datei(en) übersprungen: Doppelte Staffel/Episode",
+    "pt_PT": "{count} arquivo(s) ignorado(s): Temporada/episódio duplicado",
+    "ar_SA": "تم تخطي {count} ملف (ملفات): موسم/حلقة مكررة",
+    "vi_VN": "Đã bỏ qua {count} tệp: Mùa/tập trùng lặp",
+    "fa_IR": "{count} فایل نادیده گرفته شد: فصل/قسمت تکراری",
+    "id_ID": "Dilewati {count} file: Season/episode duplikat",
+    "ms_MY": "Dilangkau {count} fail: Musim/episod pendua",
+    "th_TH": "ข้าม {count} ไฟล์: ซีซัน/ตอนซ้ำ",
+    "ur_PK": "{count} فائل(یں) چھوڑی گئیں: ڈپلیکیٹ سیزن/ایپی سوڈ",
+}
+
+IMPORT_SUMMARY = {
+    "en_US": "Import Summary",
+    "es_ES": "Resumen de importación",
+    "tr_TR": "İçe aktarma özeti",
+    "zh_CN": "导入摘要",
+    "zh_TW": "匯入摘要",
+    "ru_RU": "Сводка импорта",
+    "pl_PL": "Podsumowanie importu",
+    "uk_UA": "Підсумок імпорту",
+    "ja_JP": "インポート概要",
+    "ko_KR": "가져오기 요약",
+    "hi_IN": "आयात सारांश",
+    "bn_BD": "ইম্পোর্ট সারসংক্ষেপ",
+    "it_IT": "Riepilogo importazione",
+    "fr_FR": "Résumé d'importation",
+    "de_DE": "Import-Zusammenfassung",
+    "pt_PT": "Resumo da importação",
+    "ar_SA": "ملخص الاستيراد",
+    "vi_VN": "Tóm tắt nhập",
+    "fa_IR": "خلاصه وارد کردن",
+    "id_ID": "Ringkasan impor",
+    "ms_MY": "Ringkasan import",
+    "th_TH": "สรุปการนำเข้า",
+    "ur_PK": "درآمد کا خلاصہ",
+}
+
+NO_NEW_PAIRS = {
+    "en_US": "No New Pairs",
+    "es_ES": "No hay pares nuevos",
+    "tr_TR": "Yeni çift yok",
+    "zh_CN": "没有新配对",
+    "zh_TW": "沒有新配對",
+    "ru_RU": "Нет новых пар",
+    "pl_PL": "Brak nowych par",
+    "uk_UA": "Немає нових пар",
+    "ja_JP": "新しいペアなし",
+    "ko_KR": "새로운 쌍 없음",
+    "hi_IN": "कोई नई जोड़ी नहीं",
+    "bn_BD": "কোনো নতুন জোড়া নেই",
+    "it_IT": "Nessuna nuova coppia",
+    "fr_FR": "Aucune nouvelle paire",
+    "de_DE": "Keine neuen Paare",
+    "pt_PT": "Nenhum par novo",
+    "ar_SA": "لا توجد أزواج جديدة",
+    "vi_VN": "Không có cặp mới",
+    "fa_IR": "جفت جدیدی وجود ندارد",
+    "id_ID": "Tidak ada pasangan baru",
+    "ms_MY": "Tiada pasangan baharu",
+    "th_TH": "ไม่มีคู่ใหม่",
+    "ur_PK": "کوئی نئے جوڑے نہیں",
+}
+
+ALL_PAIRS_ALREADY_EXIST_IN_BATCH = {
+    "en_US": "All pairs already exist in the batch.",
+    "es_ES": "Todos los pares ya existen en el lote.",
+    "tr_TR": "Tüm çiftler zaten grupta mevcut.",
+    "zh_CN": "所有配对已存在于批处理中。",
+    "zh_TW": "所有配對已存在於批次中。",
+    "ru_RU": "Все пары уже существуют в пакете.",
+    "pl_PL": "Wszystkie pary już istnieją w partii.",
+    "uk_UA": "Всі пари вже існують у пакеті.",
+    "ja_JP": "すべてのペアは既にバッチに存在します。",
+    "ko_KR": "모든 쌍이 이미 배치에 존재합니다.",
+    "hi_IN": "सभी जोड़ियां पहले से ही बैच में मौजूद हैं।",
+    "bn_BD": "সমস্ত জোড়া ইতিমধ্যে ব্যাচে বিদ্যমান।",
+    "it_IT": "Tutte le coppie esistono già nel batch.",
+    "fr_FR": "Toutes les paires existent déjà dans le lot.",
+    "de_DE": "Alle Paare existieren bereits im Batch.",
+    "pt_PT": "Todos os pares já existem no lote.",
+    "ar_SA": "جميع الأزواج موجودة بالفعل في الدفعة.",
+    "vi_VN": "Tất cả các cặp đã tồn tại trong lô.",
+    "fa_IR": "همه جفت‌ها از قبل در دسته موجود هستند.",
+    "id_ID": "Semua pasangan sudah ada dalam batch.",
+    "ms_MY": "Semua pasangan sudah wujud dalam kumpulan.",
+    "th_TH": "คู่ทั้งหมดมีอยู่ในชุดแล้ว",
+    "ur_PK": "تمام جوڑے پہلے سے ہی بیچ میں موجود ہیں۔",
+}
+
+############### gui_automatic_tab.py ###############
+
+SYNC_TOOL_SETTINGS = {
+    "en_US": "Sync tool settings",
+    "es_ES": "Configuración de herramienta de sincronización",
+    "tr_TR": "Senkronizasyon aracı ayarları",
+    "zh_CN": "同步工具设置",
+    "zh_TW": "同步工具設定",
+    "ru_RU": "Настройки инструмента синхронизации",
+    "pl_PL": "Ustawienia narzędzia synchronizacji",
+    "uk_UA": "Налаштування інструменту синхронізації",
+    "ja_JP": "同期ツール設定",
+    "ko_KR": "동기화 도구 설정",
+    "hi_IN": "सिंक टूल सेटिंग्स",
+    "bn_BD": "সিঙ্ক টুল সেটিংস",
+    "it_IT": "Impostazioni strumento di sincronizzazione",
+    "fr_FR": "Paramètres de l'outil de synchronisation",
+    "de_DE": "Sync-Tool-Einstellungen",
+    "pt_PT": "Configurações da ferramenta de sincronização",
+    "ar_SA": "إعدادات أداة المزامنة",
+    "vi_VN": "Cài đặt công cụ đồng bộ",
+    "fa_IR": "تنظیمات ابزار همگام‌سازی",
+    "id_ID": "Pengaturan alat sinkronisasi",
+    "ms_MY": "Tetapan alat penyegerakan",
+    "th_TH": "การตั้งค่าเครื่องมือซิงค์",
+    "ur_PK": "سنک ٹول کی سیٹنگز",
+}
+
+SHOW_TOOL_INFORMATION = {
+    "en_US": "Show tool information",
+    "es_ES": "Mostrar información de la herramienta",
+    "tr_TR": "Araç bilgilerini göster",
+    "zh_CN": "显示工具信息",
+    "zh_TW": "顯示工具資訊",
+    "ru_RU": "Показать информацию об инструменте",
+    "pl_PL": "Pokaż informacje o narzędziu",
+    "uk_UA": "Показати інформацію про інструмент",
+    "ja_JP": "ツール情報を表示",
+    "ko_KR": "도구 정보 표시",
+    "hi_IN": "टूल की जानकारी दिखाएं",
+    "bn_BD": "টুল তথ্য দেখান",
+    "it_IT": "Mostra informazioni strumento",
+    "fr_FR": "Afficher les informations de l'outil",
+    "de_DE": "Tool-Informationen anzeigen",
+    "pt_PT": "Mostrar informações da ferramenta",
+    "ar_SA": "إظهار معلومات الأداة",
+    "vi_VN": "Hiển thị thông tin công cụ",
+    "fa_IR": "نمایش اطلاعات ابزار",
+    "id_ID": "Tampilkan informasi alat",
+    "ms_MY": "Tunjukkan maklumat alat",
+    "th_TH": "แสดงข้อมูลเครื่องมือ",
+    "ur_PK": "ٹول کی معلومات دکھائیں",
+}
+
+CANNOT_USE_SAME_FILE_FOR_BOTH_INPUTS = {
+    "en_US": "Cannot use the same file for both inputs.",
+    "es_ES": "No se puede usar el mismo archivo para ambas entradas.",
+    "tr_TR": "Her iki giriş için aynı dosya kullanılamaz.",
+    "zh_CN": "不能为两个输入使用同一个文件。",
+    "zh_TW": "不能為兩個輸入使用同一個檔案。",
+    "ru_RU": "Нельзя использовать один и тот же файл для обоих входов.",
+    "pl_PL": "Nie można użyć tego samego pliku dla obu wejść.",
+    "uk_UA": "Не можна використовувати один і той же файл для обох входів.",
+    "ja_JP": "両方の入力に同じファイルを使用できません。",
+    "ko_KR": "두 입력 모두에 동일한 파일을 사용할 수 없습니다.",
+    "hi_IN": "दोनों इनपुट के लिए एक ही फ़ाइल का उपयोग नहीं किया जा सकता।",
+    "bn_BD": "উভয় ইনপুটের জন্য একই ফাইল ব্যবহার করা যাবে না।",
+    "it_IT": "Non è possibile utilizzare lo stesso file per entrambi gli input.",
+    "fr_FR": "Impossible d'utiliser le même fichier pour les deux entrées.",
+    "de_DE": "Die gleiche Datei kann nicht für beide Eingaben verwendet werden.",
+    "pt_PT": "Não é possível usar o mesmo arquivo para ambas as entradas.",
+    "ar_SA": "لا يمكن استخدام نفس الملف لكلا الإدخالين.",
+    "vi_VN": "Không thể sử dụng cùng một tệp cho cả hai đầu vào.",
+    "fa_IR": "نمی‌توان از یک فایل برای هر دو ورودی استفاده کرد.",
+    "id_ID": "Tidak dapat menggunakan file yang sama untuk kedua input.",
+    "ms_MY": "Tidak boleh menggunakan fail yang sama untuk kedua-dua input.",
+    "th_TH": "ไม่สามารถใช้ไฟล์เดียวกันสำหรับทั้งสองอินพุตได้",
+    "ur_PK": "دونوں ان پٹ کے لیے ایک ہی فائل استعمال نہیں کی جا سکتی۔",
+}
+
+VIDEO_REFERENCE_FILE_DOES_NOT_EXIST = {
+    "en_US": "Video/Reference file does not exist.",
+    "es_ES": "El archivo de video o referencia no existe.",
+    "tr_TR": "Video/Referans dosyası mevcut değil.",
+    "zh_CN": "视频/参考文件不存在。",
+    "zh_TW": "影片/參考檔案不存在。",
+    "ru_RU": "Видео/эталонный файл не существует.",
+    "pl_PL": "Plik wideo/referencyjny nie istnieje.",
+    "uk_UA": "Відео/референсний файл не існує.",
+    "ja_JP": "ビデオ/参照ファイルが存在しません。",
+    "ko_KR": "비디오/참조 파일이 존재하지 않습니다.",
+    "hi_IN": "वीडियो/संदर्भ फ़ाइल मौजूद नहीं है।",
+    "bn_BD": "ভিডিও/রেফারেন্স ফাইল বিদ্যমান নেই।",
+    "it_IT": "Il file video/riferimento non esiste.",
+    "fr_FR": "Le fichier vidéo/référence n'existe pas.",
+    "de_DE": "Video-/Referenzdatei existiert nicht.",
+    "pt_PT": "O arquivo de vídeo/referência não existe.",
+    "ar_SA": "ملف الفيديو/المرجع غير موجود.",
+    "vi_VN": "Tệp video/tham chiếu không tồn tại.",
+    "fa_IR": "فایل ویدیو/مرجع وجود ندارد.",
+    "id_ID": "File video/referensi tidak ada.",
+    "ms_MY": "Fail video/rujukan tidak wujud.",
+    "th_TH": "ไฟล์วิดีโอ/อ้างอิงไม่มีอยู่",
+    "ur_PK": "ویڈیو/ریفرنس فائل موجود نہیں ہے۔",
+}
+
+SUBTITLE_FILE_DOES_NOT_EXIST = {
+    "en_US": "Subtitle file does not exist.",
+    "es_ES": "El archivo de subtítulos no existe.",
+    "tr_TR": "Altyazı dosyası mevcut değil.",
+    "zh_CN": "字幕文件不存在。",
+    "zh_TW": "字幕檔案不存在。",
+    "ru_RU": "Файл субтитров не существует.",
+    "pl_PL": "Plik napisów nie istnieje.",
+    "uk_UA": "Файл субтитрів не існує.",
+    "ja_JP": "字幕ファイルが存在しません。",
+    "ko_KR": "자막 파일이 존재하지 않습니다.",
+    "hi_IN": "सबटाइटल फ़ाइल मौजूद नहीं है।",
+    "bn_BD": "সাবটাইটেল ফাইল বিদ্যমান নেই।",
+    "it_IT": "Il file dei sottotitoli non esiste.",
+    "fr_FR": "Le fichier de sous-titres n'existe pas.",
+    "de_DE": "Untertiteldatei existiert nicht.",
+    "pt_PT": "O arquivo de legenda não existe.",
+    "ar_SA": "ملف الترجمة غير موجود.",
+    "vi_VN": "Tệp phụ đề không tồn tại.",
+    "fa_IR": "فایل زیرنویس وجود ندارد.",
+    "id_ID": "File subtitle tidak ada.",
+    "ms_MY": "Fail sari kata tidak wujud.",
+    "th_TH": "ไฟล์คำบรรยายไม่มีอยู่",
+    "ur_PK": "سب ٹائٹل فائل موجود نہیں ہے۔",
+}
+
+ADDITIONAL_ARGUMENTS_TITLE = {
+    "en_US": "Additional arguments for {tool}",
+    "es_ES": "Argumentos adicionales para {tool}",
+    "tr_TR": "{tool} için ek argümanlar",
+    "zh_CN": "{tool} 的附加参数",
+    "zh_TW": "{tool} 的附加參數",
+    "ru_RU": "Дополнительные аргументы для {tool}",
+    "pl_PL": "Dodatkowe argumenty dla {tool}",
+    "uk_UA": "Додаткові аргументи для {tool}",
+    "ja_JP": "{tool} の追加引数",
+    "ko_KR": "{tool}의 추가 인수",
+    "hi_IN": "{tool} के लिए अतिरिक्त आर्गुमेंट्स",
+    "bn_BD": "{tool} এর জন্য অতিরিক্ত আর্গুমেন্ট",
+    "it_IT": "Argomenti aggiuntivi per {tool}",
+    "fr_FR": "Arguments supplémentaires pour {tool}",
+    "de_DE": "Zusätzliche Argumente für {tool}",
+    "pt_PT": "Argumentos adicionais para {tool}",
+    "ar_SA": "معاملات إضافية لـ {tool}",
+    "vi_VN": "Tham số bổ sung cho {tool}",
+    "fa_IR": "آرگومان‌های اضافی برای {tool}",
+    "id_ID": "Argumen tambahan untuk {tool}",
+    "ms_MY": "Argumen tambahan untuk {tool}",
+    "th_TH": "อาร์กิวเมนต์เพิ่มเติมสำหรับ {tool}",
+    "ur_PK": "{tool} کے لیے اضافی دلائل",
+}
+
+ENTER_ADDITIONAL_ARGUMENTS_PROMPT = {
+    "en_US": "Enter additional arguments for {tool}:",
+    "es_ES": "Introduce argumentos adicionales para {tool}:",
+    "tr_TR": "{tool} için ek argümanları girin:",
+    "zh_CN": "输入 {tool} 的附加参数：",
+    "zh_TW": "輸入 {tool} 的附加參數：",
+    "ru_RU": "Введите дополнительные аргументы для {tool}:",
+    "pl_PL": "Wprowadź dodatkowe argumenty dla {tool}:",
+    "uk_UA": "Введіть додаткові аргументи для {tool}:",
+    "ja_JP": "{tool} の追加引数を入力してください：",
+    "ko_KR": "{tool}의 추가 인수를 입력하세요:",
+    "hi_IN": "{tool} के लिए अतिरिक्त आर्गुमेंट्स दर्ज करें:",
+    "bn_BD": "{tool} এর জন্য অতিরিক্ত আর্গুমেন্ট লিখুন:",
+    "it_IT": "Inserisci argomenti aggiuntivi per {tool}:",
+    "fr_FR": "Entrez des arguments supplémentaires pour {tool} :",
+    "de_DE": "Geben Sie zusätzliche Argumente für {tool} ein:",
+    "pt_PT": "Insira argumentos adicionais para {tool}:",
+    "ar_SA": "أدخل معاملات إضافية لـ {tool}:",
+    "vi_VN": "Nhập tham số bổ sung cho {tool}:",
+    "fa_IR": "آرگومان‌های اضافی برای {tool} را وارد کنید:",
+    "id_ID": "Masukkan argumen tambahan untuk {tool}:",
+    "ms_MY": "Masukkan argumen tambahan untuk {tool}:",
+    "th_TH": "ป้อนอาร์กิวเมนต์เพิ่มเติมสำหรับ {tool}:",
+    "ur_PK": "{tool} کے لیے اضافی دلائل درج کریں:",
+}
+
+ADDITIONAL_ARGUMENTS = {
+    "en_US": "Additional arguments",
+    "es_ES": "Argumentos adicionales",
+    "tr_TR": "Ek argümanlar",
+    "zh_CN": "附加参数",
+    "zh_TW": "附加參數",
+    "ru_RU": "Дополнительные аргументы",
+    "pl_PL": "Dodatkowe argumenty",
+    "uk_UA": "Додаткові аргументи",
+    "ja_JP": "追加引数",
+    "ko_KR": "추가 인수",
+    "hi_IN": "अतिरिक्त आर्गुमेंट्स",
+    "bn_BD": "অতিরিক্ত আর্গুমেন্ট",
+    "it_IT": "Argomenti aggiuntivi",
+    "fr_FR": "Arguments supplémentaires",
+    "de_DE": "Zusätzliche Argumente",
+    "pt_PT": "Argumentos adicionais",
+    "ar_SA": "معاملات إضافية",
+    "vi_VN": "Tham số bổ sung",
+    "fa_IR": "آرگومان‌های اضافی",
+    "id_ID": "Argumen tambahan",
+    "ms_MY": "Argumen tambahan",
+    "th_TH": "อาร์กิวเมนต์เพิ่มเติม",
+    "ur_PK": "اضافی دلائل",
+}
+
+SYNC_LOG_TAB_LABEL = {
+    "en_US": "Sync Log",
+    "es_ES": "Registro de sincronización",
+    "tr_TR": "Senkronizasyon Günlüğü",
+    "zh_CN": "同步日志",
+    "zh_TW": "同步日誌",
+    "ru_RU": "Журнал синхронизации",
+    "pl_PL": "Dziennik synchronizacji",
+    "uk_UA": "Журнал синхронізації",
+    "ja_JP": "同期ログ",
+    "ko_KR": "동기화 로그",
+    "hi_IN": "सिंक लॉग",
+    "bn_BD": "সিঙ্ক লগ",
+    "it_IT": "Registro di sincronizzazione",
+    "fr_FR": "Journal de synchronisation",
+    "de_DE": "Sync-Protokoll",
+    "pt_PT": "Registro de sincronização",
+    "ar_SA": "سجل المزامنة",
+    "vi_VN": "Nhật ký đồng bộ",
+    "fa_IR": "گزارش همگام‌سازی",
+    "id_ID": "Log Sinkronisasi",
+    "ms_MY": "Log Penyegerakan",
+    "th_TH": "บันทึกการซิงค์",
+    "ur_PK": "سنک لاگ",
+}
+
+
+############### utils.py ###############
+
+
+SYNC_FAILED_CHECK_LOGS = {
+    "en_US": "Sync failed. Please check the logs.",
+    "es_ES": "La sincronización falló. Por favor, revisa los registros.",
+    "tr_TR": "Senkronizasyon başarısız oldu. Lütfen günlükleri kontrol edin.",
+    "zh_CN": "同步失败。请检查日志。",
+    "zh_TW": "同步失敗。請檢查日誌。",
+    "ru_RU": "Синхронизация не удалась. Пожалуйста, проверьте логи.",
+    "pl_PL": "Synchronizacja nie powiodła się. Sprawdź logi.",
+    "uk_UA": "Синхронізація не вдалася. Перевірте журнали.",
+    "ja_JP": "同期に失敗しました。ログを確認してください。",
+    "ko_KR": "동기화에 실패했습니다. 로그를 확인하세요.",
+    "hi_IN": "सिंक विफल रहा। कृपया लॉग जांचें।",
+    "bn_BD": "সিঙ্ক ব্যর্থ হয়েছে। অনুগ্রহ করে লগ চেক করুন।",
+    "it_IT": "Sincronizzazione non riuscita. Controlla i log.",
+    "fr_FR": "Échec de la synchronisation. Veuillez vérifier les journaux.",
+    "de_DE": "Synchronisierung fehlgeschlagen. Bitte überprüfen Sie die Protokolle.",
+    "pt_PT": "A sincronização falhou. Por favor, verifique os logs.",
+    "ar_SA": "فشلت المزامنة. يرجى التحقق من السجلات.",
+    "vi_VN": "Đồng bộ hóa thất bại. Vui lòng kiểm tra nhật ký.",
+    "fa_IR": "همگام‌سازی ناموفق بود. لطفاً لاگ‌ها را بررسی کنید.",
+    "id_ID": "Sinkronisasi gagal. Silakan periksa log.",
+    "ms_MY": "Penyegerakan gagal. Sila semak log.",
+    "th_TH": "การซิงค์ล้มเหลว โปรดตรวจสอบบันทึก",
+    "ur_PK": "سنک ناکام ہوگئی۔ براہ کرم لاگز چیک کریں۔",
+}
+
+REFERENCE_LABEL = {
+    "en_US": "Reference:",
+    "es_ES": "Referencia:",
+    "tr_TR": "Referans:",
+    "zh_CN": "参考",
+    "zh_TW": "參考：",
+    "ru_RU": "Референс:",
+    "pl_PL": "Odniesienie:",
+    "uk_UA": "Референс:",
+    "ja_JP": "参照:",
+    "ko_KR": "참조:",
+    "hi_IN": "संदर्भ:",
+    "bn_BD": "রেফারেন্স:",
+    "it_IT": "Riferimento:",
+    "fr_FR": "Référence:",
+    "de_DE": "Referenz:",
+    "pt_PT": "Referência:",
+    "ar_SA": "مرجع:",
+    "vi_VN": "Tham chiếu:",
+    "fa_IR": "مرجع:",
+    "id_ID": "Referensi:",
+    "ms_MY": "Rujukan:",
+    "th_TH": "อ้างอิง:",
+    "ur_PK": "حوالہ:",
+}
+
+SUBTITLE_LABEL = {
+    "en_US": "Subtitle:",
+    "es_ES": "Subtítulo:",
+    "tr_TR": "Altyazı:",
+    "zh_CN": "字幕:",
+    "zh_TW": "字幕：",
+    "ru_RU": "Субтитры:",
+    "pl_PL": "Napisy:",
+    "uk_UA": "Субтитри:",
+    "ja_JP": "字幕:",
+    "ko_KR": "자막:",
+    "hi_IN": "सबटाइटल:",
+    "bn_BD": "সাবটাইটেল:",
+    "it_IT": "Sottotitolo:",
+    "fr_FR": "Sous-titre:",
+    "de_DE": "Untertitel:",
+    "pt_PT": "Legenda:",
+    "ar_SA": "ترجمة:",
+    "vi_VN": "Phụ đề:",
+    "fa_IR": "زیرنویس:",
+    "id_ID": "Subtitle:",
+    "ms_MY": "Sarikata:",
+    "th_TH": "คำบรรยาย:",
+    "ur_PK": "سب ٹائٹل:",
+}
+
+SKIPPING_BOTH_FILES_DO_NOT_EXIST = {
+    "en_US": "Skipping: Both files do not exist",
+    "es_ES": "Omitiendo: Ambos archivos no existen",
+    "tr_TR": "Atlanıyor: Her iki dosya da mevcut değil",
+    "zh_CN": "跳过：两个文件都不存在",
+    "zh_TW": "跳過：兩個檔案都不存在",
+    "ru_RU": "Пропуск: оба файла не существуют",
+    "pl_PL": "Pomijanie: oba pliki nie istnieją",
+    "uk_UA": "Пропуск: обидва файли не існують",
+    "ja_JP": "スキップ: 両方のファイルが存在しません",
+    "ko_KR": "건너뜀: 두 파일 모두 존재하지 않습니다",
+    "hi_IN": "छोड़ा जा रहा है: दोनों फ़ाइलें मौजूद नहीं हैं",
+    "bn_BD": "এড়িয়ে যাওয়া হচ্ছে: উভয় ফাইলই বিদ্যমান নেই",
+    "it_IT": "Saltando: Entrambi i file non esistono",
+    "fr_FR": "Ignoré : Les deux fichiers n'existent pas",
+    "de_DE": "Überspringen: Beide Dateien existieren nicht",
+    "pt_PT": "Ignorando: Ambos os arquivos não existem",
+    "ar_SA": "تخطي: كلا الملفين غير موجودين",
+    "vi_VN": "Bỏ qua: Cả hai tệp đều không tồn tại",
+    "fa_IR": "رد شد: هر دو فایل وجود ندارند",
+    "id_ID": "Melewati: Kedua file tidak ada",
+    "ms_MY": "Langkau: Kedua-dua fail tidak wujud",
+    "th_TH": "ข้าม: ไฟล์ทั้งสองไม่มีอยู่",
+    "ur_PK": "چھوڑا جا رہا ہے: دونوں فائلیں موجود نہیں ہیں",
+}
+
+SKIPPING_REFERENCE_FILE_DOES_NOT_EXIST = {
+    "en_US": "Skipping: Reference file does not exist",
+    "es_ES": "Omitiendo: El archivo de referencia no existe",
+    "tr_TR": "Atlanıyor: Referans dosyası mevcut değil",
+    "zh_CN": "跳过：参考文件不存在",
+    "zh_TW": "跳過：參考檔案不存在",
+    "ru_RU": "Пропуск: файл-референс не существует",
+    "pl_PL": "Pomijanie: plik referencyjny nie istnieje",
+    "uk_UA": "Пропуск: референсний файл не існує",
+    "ja_JP": "スキップ: 参照ファイルが存在しません",
+    "ko_KR": "건너뜀: 참조 파일이 존재하지 않습니다",
+    "hi_IN": "छोड़ा जा रहा है: संदर्भ फ़ाइल मौजूद नहीं है",
+    "bn_BD": "এড়িয়ে যাওয়া হচ্ছে: রেফারেন্স ফাইল বিদ্যমান নেই",
+    "it_IT": "Saltando: Il file di riferimento non esiste",
+    "fr_FR": "Ignoré : Le fichier de référence n'existe pas",
+    "de_DE": "Überspringen: Referenzdatei existiert nicht",
+    "pt_PT": "Ignorando: O arquivo de referência não existe",
+    "ar_SA": "تخطي: ملف المرجع غير موجود",
+    "vi_VN": "Bỏ qua: Tệp tham chiếu không tồn tại",
+    "fa_IR": "رد شد: فایل مرجع وجود ندارد",
+    "id_ID": "Melewati: File referensi tidak ada",
+    "ms_MY": "Langkau: Fail rujukan tidak wujud",
+    "th_TH": "ข้าม: ไฟล์อ้างอิงไม่มีอยู่",
+    "ur_PK": "چھوڑا جا رہا ہے: ریفرنس فائل موجود نہیں ہے",
+}
+
+SKIPPING_SUBTITLE_FILE_DOES_NOT_EXIST = {
+    "en_US": "Skipping: Subtitle file does not exist",
+    "es_ES": "Omitiendo: El archivo de subtítulos no existe",
+    "tr_TR": "Atlanıyor: Altyazı dosyası mevcut değil",
+    "zh_CN": "跳过：字幕文件不存在",
+    "zh_TW": "跳過：字幕檔案不存在",
+    "ru_RU": "Пропуск: файл субтитров не существует",
+    "pl_PL": "Pomijanie: plik napisów nie istnieje",
+    "uk_UA": "Пропуск: файл субтитрів не існує",
+    "ja_JP": "スキップ: 字幕ファイルが存在しません",
+    "ko_KR": "건너뜀: 자막 파일이 존재하지 않습니다",
+    "hi_IN": "छोड़ा जा रहा है: सबटाइटल फ़ाइल मौजूद नहीं है",
+    "bn_BD": "এড়িয়ে যাওয়া হচ্ছে: সাবটাইটেল ফাইল বিদ্যমান নেই",
+    "it_IT": "Saltando: Il file dei sottotitoli non esiste",
+    "fr_FR": "Ignoré : Le fichier de sous-titres n'existe pas",
+    "de_DE": "Überspringen: Untertiteldatei existiert nicht",
+    "pt_PT": "Ignorando: O arquivo de legenda não existe",
+    "ar_SA": "تخطي: ملف الترجمة غير موجود",
+    "vi_VN": "Bỏ qua: Tệp phụ đề không tồn tại",
+    "fa_IR": "رد شد: فایل زیرنویس وجود ندارد",
+    "id_ID": "Melewati: File subtitle tidak ada",
+    "ms_MY": "Langkau: Fail sari kata tidak wujud",
+    "th_TH": "ข้าม: ไฟล์คำบรรยายไม่มีอยู่",
+    "ur_PK": "چھوڑا جا رہا ہے: سب ٹائٹل فائل موجود نہیں ہے",
+}
+
+UNKNOWN_SYNC_TOOL = {
+    "en_US": "Unknown sync tool: {tool}",
+    "es_ES": "Herramienta de sincronización desconocida: {tool}",
+    "tr_TR": "Bilinmeyen senkronizasyon aracı: {tool}",
+    "zh_CN": "未知的同步工具：{tool}",
+    "zh_TW": "未知的同步工具：{tool}",
+    "ru_RU": "Неизвестный инструмент синхронизации: {tool}",
+    "pl_PL": "Nieznane narzędzie synchronizacji: {tool}",
+    "uk_UA": "Невідомий інструмент синхронізації: {tool}",
+    "ja_JP": "不明な同期ツール: {tool}",
+    "ko_KR": "알 수 없는 동기화 도구: {tool}",
+    "hi_IN": "अज्ञात सिंक टूल: {tool}",
+    "bn_BD": "অজানা সিঙ্ক টুল: {tool}",
+    "it_IT": "Strumento di sincronizzazione sconosciuto: {tool}",
+    "fr_FR": "Outil de synchronisation inconnu : {tool}",
+    "de_DE": "Unbekanntes Sync-Tool: {tool}",
+    "pt_PT": "Ferramenta de sincronização desconhecida: {tool}",
+    "ar_SA": "أداة مزامنة غير معروفة: {tool}",
+    "vi_VN": "Công cụ đồng bộ không xác định: {tool}",
+    "fa_IR": "ابزار همگام‌سازی ناشناخته: {tool}",
+    "id_ID": "Alat sinkronisasi tidak dikenal: {tool}",
+    "ms_MY": "Alat penyegerakan tidak diketahui: {tool}",
+    "th_TH": "เครื่องมือซิงค์ที่ไม่รู้จัก: {tool}",
+    "ur_PK": "نامعلوم سنک ٹول: {tool}",
+}
+
+TOOL_DOES_NOT_SUPPORT_SUBTITLE_REFERENCE = {
+    "en_US": "{tool} does not support subtitle files as reference. Falling back to {fallback}.",
+    "es_ES": "{tool} no admite archivos de subtítulos como referencia. Usando {fallback}.",
+    "tr_TR": "{tool} altyazı dosyalarını referans olarak desteklemiyor. {fallback} aracına geçiliyor.",
+    "zh_CN": "{tool} 不支持将字幕文件作为参考。回退到 {fallback}。",
+    "zh_TW": "{tool} 不支援字幕檔案作為參考。退回到 {fallback}。",
+    "ru_RU": "{tool} не поддерживает использование файлов субтитров в качестве эталона. Используется {fallback}.",
+    "pl_PL": "{tool} nie obsługuje plików napisów jako referencji. Przełączanie na {fallback}.",
+    "uk_UA": "{tool} не підтримує файли субтитрів як еталон. Перехід до {fallback}.",
+    "ja_JP": "{tool} は字幕ファイルを参照としてサポートしていません。{fallback} にフォールバックします。",
+    "ko_KR": "{tool}은(는) 자막 파일을 참조로 지원하지 않습니다. {fallback}(으)로 대체합니다.",
+    "hi_IN": "{tool} संदर्भ के रूप में सबटाइटल फ़ाइलों का समर्थन नहीं करता। {fallback} पर वापस जा रहे हैं।",
+    "bn_BD": "{tool} রেফারেন্স হিসেবে সাবটাইটেল ফাইল সমর্থন করে না। {fallback} এ ফিরে যাচ্ছে।",
+    "it_IT": "{tool} non supporta i file di sottotitoli come riferimento. Passaggio a {fallback}.",
+    "fr_FR": "{tool} ne prend pas en charge les fichiers de sous-titres comme référence. Retour à {fallback}.",
+    "de_DE": "{tool} unterstützt keine Untertiteldateien als Referenz. Wechsel zu {fallback}.",
+    "pt_PT": "{tool} não suporta arquivos de legenda como referência. Recuando para {fallback}.",
+    "ar_SA": "{tool} لا يدعم ملفات الترجمة كمرجع. سيتم الرجوع إلى {fallback}.",
+    "vi_VN": "{tool} không hỗ trợ tệp phụ đề làm tham chiếu. Chuyển về {fallback}.",
+    "fa_IR": "{tool} از فایل زیرنویس به عنوان مرجع پشتیبانی نمی‌کند. بازگشت به {fallback}.",
+    "id_ID": "{tool} tidak mendukung file subtitle sebagai referensi. Kembali ke {fallback}.",
+    "ms_MY": "{tool} tidak menyokong fail sari kata sebagai rujukan. Beralih ke {fallback}.",
+    "th_TH": "{tool} ไม่รองรับไฟล์คำบรรยายเป็นข้อมูลอ้างอิง กำลังกลับไปใช้ {fallback}",
+    "ur_PK": "{tool} سب ٹائٹل فائلوں کو ریفرنس کے طور پر سپورٹ نہیں کرتا۔ {fallback} پر واپس جا رہے ہیں۔",
+}
+
+TOOL_DOES_NOT_SUPPORT_VIDEO_REFERENCE = {
+    "en_US": "{tool} only supports subtitle files as reference. Falling back to {fallback}.",
+    "es_ES": "{tool} solo admite archivos de subtítulos como referencia. Usando {fallback}.",
+    "tr_TR": "{tool} yalnızca altyazı dosyalarını referans olarak destekliyor. {fallback} aracına geçiliyor.",
+    "zh_CN": "{tool} 仅支持将字幕文件作为参考。回退到 {fallback}。",
+    "zh_TW": "{tool} 僅支援字幕檔案作為參考。退回到 {fallback}。",
+    "ru_RU": "{tool} поддерживает в качестве эталона только файлы субтитров. Используется {fallback}.",
+    "pl_PL": "{tool} obsługuje jako referencję tylko pliki napisów. Przełączanie na {fallback}.",
+    "uk_UA": "{tool} підтримує як еталон лише файли субтитрів. Перехід до {fallback}.",
+    "ja_JP": "{tool} は参照として字幕ファイルのみをサポートしています。{fallback} にフォールバックします。",
+    "ko_KR": "{tool}은(는) 자막 파일만 참조로 지원합니다. {fallback}(으)로 대체합니다.",
+    "hi_IN": "{tool} संदर्भ के रूप में केवल सबटाइटल फ़ाइलों का समर्थन करता है। {fallback} पर वापस जा रहे हैं।",
+    "bn_BD": "{tool} রেফারেন্স হিসেবে শুধুমাত্র সাবটাইটেল ফাইল সমর্থন করে। {fallback} এ ফিরে যাচ্ছে।",
+    "it_IT": "{tool} supporta solo file di sottotitoli come riferimento. Passaggio a {fallback}.",
+    "fr_FR": "{tool} ne prend en charge que les fichiers de sous-titres comme référence. Retour à {fallback}.",
+    "de_DE": "{tool} unterstützt nur Untertiteldateien als Referenz. Wechsel zu {fallback}.",
+    "pt_PT": "{tool} só suporta arquivos de legenda como referência. Recuando para {fallback}.",
+    "ar_SA": "{tool} يدعم ملفات الترجمة فقط كمرجع. سيتم الرجوع إلى {fallback}.",
+    "vi_VN": "{tool} chỉ hỗ trợ tệp phụ đề làm tham chiếu. Chuyển về {fallback}.",
+    "fa_IR": "{tool} فقط از فایل زیرنویس به عنوان مرجع پشتیبانی می‌کند. بازگشت به {fallback}.",
+    "id_ID": "{tool} hanya mendukung file subtitle sebagai referensi. Kembali ke {fallback}.",
+    "ms_MY": "{tool} hanya menyokong fail sari kata sebagai rujukan. Beralih ke {fallback}.",
+    "th_TH": "{tool} รองรับเฉพาะไฟล์คำบรรยายเป็นข้อมูลอ้างอิง กำลังกลับไปใช้ {fallback}",
+    "ur_PK": "{tool} صرف سب ٹائٹل فائلوں کو ریفرنس کے طور پر سپورٹ کرتا ہے۔ {fallback} پر واپس جا رہے ہیں۔",
+}
+
+NO_EXECUTABLE_FOUND = {
+    "en_US": "No executable found for {tool} on {os}",
+    "es_ES": "No se encontró ejecutable para {tool} en {os}",
+    "tr_TR": "{os} üzerinde {tool} için çalıştırılabilir dosya bulunamadı",
+    "zh_CN": "在 {os} 上未找到 {tool} 的可执行文件",
+    "zh_TW": "在 {os} 上找不到 {tool} 的執行檔",
+    "ru_RU": "Исполняемый файл для {tool} не найден в {os}",
+    "pl_PL": "Nie znaleziono pliku wykonywalnego dla {tool} w {os}",
+    "uk_UA": "Виконуваний файл для {tool} не знайдено в {os}",
+    "ja_JP": "{os} で {tool} の実行可能ファイルが見つかりません",
+    "ko_KR": "{os}에서 {tool}의 실행 파일을 찾을 수 없습니다",
+    "hi_IN": "{os} पर {tool} के लिए कोई एक्जीक्यूटेबल नहीं मिला",
+    "bn_BD": "{os} এ {tool} এর জন্য কোনো এক্সিকিউটেবল পাওয়া যায়নি",
+    "it_IT": "Nessun eseguibile trovato per {tool} su {os}",
+    "fr_FR": "Aucun exécutable trouvé pour {tool} sur {os}",
+    "de_DE": "Keine ausführbare Datei für {tool} auf {os} gefunden",
+    "pt_PT": "Nenhum executável encontrado para {tool} em {os}",
+    "ar_SA": "لم يتم العثور على ملف تنفيذي لـ {tool} على {os}",
+    "vi_VN": "Không tìm thấy tệp thực thi cho {tool} trên {os}",
+    "fa_IR": "فایل اجرایی برای {tool} در {os} یافت نشد",
+    "id_ID": "Tidak ada file executable yang ditemukan untuk {tool} di {os}",
+    "ms_MY": "Tiada fail boleh laksana ditemui untuk {tool} di {os}",
+    "th_TH": "ไม่พบไฟล์ที่รันได้สำหรับ {tool} บน {os}",
+    "ur_PK": "{os} پر {tool} کے لیے کوئی ایگزیکیوٹیبل نہیں ملا",
+}
+
+TOOL_FAILED_WITH_CODE = {
+    "en_US": "{tool} failed. Error code: {code}",
+    "es_ES": "{tool} falló. Código de error: {code}",
+    "tr_TR": "{tool} başarısız oldu. Hata kodu: {code}",
+    "zh_CN": "{tool} 失败。错误代码：{code}",
+    "zh_TW": "{tool} 失敗。錯誤代碼：{code}",
+    "ru_RU": "{tool} завершился с ошибкой. Код ошибки: {code}",
+    "pl_PL": "{tool} zakończył się niepowodzeniem. Kod błędu: {code}",
+    "uk_UA": "{tool} завершився з помилкою. Код помилки: {code}",
+    "ja_JP": "{tool} が失敗しました。エラーコード: {code}",
+    "ko_KR": "{tool}이(가) 실패했습니다. 오류 코드: {code}",
+    "hi_IN": "{tool} विफल रहा। त्रुटि कोड: {code}",
+    "bn_BD": "{tool} ব্যর্থ হয়েছে। ত্রুটি কোড: {code}",
+    "it_IT": "{tool} è fallito. Codice di errore: {code}",
+    "fr_FR": "{tool} a échoué. Code d'erreur: {code}",
+    "de_DE": "{tool} ist fehlgeschlagen. Fehlercode: {code}",
+    "pt_PT": "{tool} falhou. Código de erro: {code}",
+    "ar_SA": "{tool} فشل. كود الخطأ: {code}",
+    "vi_VN": "{tool} thất bại. Mã lỗi: {code}",
+    "fa_IR": "{tool} ناموفق بود. کد خطا: {code}",
+    "id_ID": "{tool} gagal. Kode kesalahan: {code}",
+    "ms_MY": "{tool} gagal. Kod ralat: {code}",
+    "th_TH": "{tool} ล้มเหลว รหัสข้อผิดพลาด: {code}",
+    "ur_PK": "{tool} ناکام ہوگیا۔ غلطی کا کوڈ: {code}",
+}
+
+ALASS_BRACKETS_ERROR = {
+    "en_US": "This error is likely caused because of '[' or ']' characters in file or folder names. ALASS cannot process names containing these characters. Please rename your files or folders and try again.",
+    "es_ES": "Este error probablemente se debe a que hay caracteres '[' o ']' en los nombres de archivos o carpetas. ALASS no puede procesar nombres que contengan estos caracteres. Por favor, renombra tus archivos o carpetas e inténtalo de nuevo.",
+    "tr_TR": "Bu hata muhtemelen dosya veya klasör adlarında '[' veya ']' karakterleri olduğu için oluştu. ALASS bu karakterleri içeren adları işleyemez. Lütfen dosya veya klasörlerinizi yeniden adlandırıp tekrar deneyin.",
+    "zh_CN": "此错误很可能是由于文件或文件夹名称中包含 '[' 或 ']' 字符引起的。ALASS 无法处理包含这些字符的名称。请重命名您的文件或文件夹，然后重试。",
+    "zh_TW": "此錯誤很可能是由於檔案或資料夾名稱中包含 '[' 或 ']' 字元引起的。ALASS 無法處理包含這些字元的名稱。請重新命名您的檔案或資料夾，然後重試。",
+    "ru_RU": "Эта ошибка, скорее всего, вызвана наличием символов '[' или ']' в именах файлов или папок. ALASS не может обрабатывать имена, содержащие эти символы. Переименуйте файлы или папки и попробуйте снова.",
+    "pl_PL": "Ten błąd prawdopodobnie jest spowodowany obecnością znaków '[' lub ']' w nazwach plików lub folderów. ALASS nie może przetwarzać nazw zawierających te znaki. Zmień nazwy plików lub folderów i spróbuj ponownie.",
+    "uk_UA": "Ця помилка, ймовірно, викликана наявністю символів '[' або ']' у назвах файлів чи папок. ALASS не може обробляти імена з цими символами. Перейменуйте файли або папки та спробуйте ще раз.",
+    "ja_JP": "このエラーは、ファイルまたはフォルダー名に「[」または「]」が含まれていることが原因の可能性があります。ALASSはこれらの文字を含む名前を処理できません。ファイルまたはフォルダーの名前を変更して、再度お試しください。",
+    "ko_KR": "이 오류는 파일 또는 폴더 이름에 '[' 또는 ']' 문자가 포함되어 있기 때문에 발생할 수 있습니다. ALASS는 이러한 문자가 포함된 이름을 처리할 수 없습니다. 파일이나 폴더의 이름을 바꾼 후 다시 시도하세요.",
+    "hi_IN": "यह त्रुटि संभवतः फ़ाइल या फ़ोल्डर नामों में '[' या ']' अक्षरों के कारण हुई है। ALASS इन अक्षरों वाले नामों को संसाधित नहीं कर सकता। कृपया अपनी फ़ाइलों या फ़ोल्डरों का नाम बदलें और पुनः प्रयास करें।",
+    "bn_BD": "এই ত্রুটিটি সম্ভবত ফাইল বা ফোল্ডারের নামের মধ্যে '[' বা ']' অক্ষর থাকার কারণে হয়েছে। ALASS এই অক্ষরযুক্ত নাম প্রক্রিয়া করতে পারে না। অনুগ্রহ করে আপনার ফাইল বা ফোল্ডারের নাম পরিবর্তন করুন এবং আবার চেষ্টা করুন।",
+    "it_IT": "Questo errore è probabilmente causato dalla presenza dei caratteri '[' o ']' nei nomi di file o cartelle. ALASS non può elaborare nomi che contengono questi caratteri. Rinomina i tuoi file o cartelle e riprova.",
+    "fr_FR": "Cette erreur est probablement due à la présence des caractères '[' ou ']' dans les noms de fichiers ou de dossiers. ALASS ne peut pas traiter les noms contenant ces caractères. Veuillez renommer vos fichiers ou dossiers et réessayer.",
+    "de_DE": "Dieser Fehler wird wahrscheinlich durch '[' oder ']' Zeichen in Datei- oder Ordnernamen verursacht. ALASS kann Namen mit diesen Zeichen nicht verarbeiten. Bitte benennen Sie Ihre Dateien oder Ordner um und versuchen Sie es erneut.",
+    "pt_PT": "Este erro provavelmente é causado por caracteres '[' ou ']' nos nomes de arquivos ou pastas. O ALASS não pode processar nomes que contenham esses caracteres. Por favor, renomeie seus arquivos ou pastas e tente novamente.",
+    "ar_SA": "من المحتمل أن يكون سبب هذا الخطأ هو وجود أحرف '[' أو ']' في أسماء الملفات أو المجلدات. لا يمكن لـ ALASS معالجة الأسماء التي تحتوي على هذه الأحرف. يرجى إعادة تسمية ملفاتك أو مجلداتك وحاول مرة أخرى.",
+    "vi_VN": "Lỗi này có thể do tên tệp hoặc thư mục chứa ký tự '[' hoặc ']'. ALASS không thể xử lý tên chứa các ký tự này. Vui lòng đổi tên tệp hoặc thư mục của bạn và thử lại.",
+    "fa_IR": "این خطا احتمالاً به دلیل وجود کاراکترهای '[' یا ']' در نام فایل یا پوشه است. ALASS نمی‌تواند نام‌هایی که این کاراکترها را دارند پردازش کند. لطفاً نام فایل‌ها یا پوشه‌های خود را تغییر دهید و دوباره امتحان کنید.",
+    "id_ID": "Kesalahan ini kemungkinan disebabkan oleh karakter '[' atau ']' dalam nama file atau folder. ALASS tidak dapat memproses nama yang mengandung karakter ini. Silakan ganti nama file atau folder Anda dan coba lagi.",
+    "ms_MY": "Ralat ini mungkin disebabkan oleh aksara '[' atau ']' dalam nama fail atau folder. ALASS tidak dapat memproses nama yang mengandungi aksara ini. Sila namakan semula fail atau folder anda dan cuba lagi.",
+    "th_TH": "ข้อผิดพลาดนี้อาจเกิดจากอักขระ '[' หรือ ']' ในชื่อไฟล์หรือโฟลเดอร์ ALASS ไม่สามารถประมวลผลชื่อที่มีอักขระเหล่านี้ได้ กรุณาเปลี่ยนชื่อไฟล์หรือโฟลเดอร์ของคุณแล้วลองใหม่",
+    "ur_PK": "یہ خرابی ممکنہ طور پر فائل یا فولڈر کے نام میں '[' یا ']' حروف کی وجہ سے ہے۔ ALASS ان حروف والے ناموں کو پراسیس نہیں کر سکتا۔ براہ کرم اپنی فائلوں یا فولڈرز کا نام تبدیل کریں اور دوبارہ کوشش کریں۔",
+}
+
+ALASS_RENAME_DIALOG_TITLE = {
+    "en_US": "Rename bracketed names for ALASS?",
+    "es_ES": "¿Renombrar nombres con corchetes para ALASS?",
+    "tr_TR": "ALASS için köşeli adları değiştirilsin mi?",
+    "zh_CN": "为 ALASS 重命名含方括号的名称？",
+    "zh_TW": "為 ALASS 重新命名含括號的名稱？",
+    "ru_RU": "Переименовать имена с '[' ']' для ALASS?",
+    "pl_PL": "Zmienić nazwy z nawiasami dla ALASS?",
+    "uk_UA": "Перейменувати назви з '[' ']' для ALASS?",
+    "ja_JP": "ALASS 用に［］を含む名前を変更しますか？",
+    "ko_KR": "ALASS용 대괄호 이름을 바꿀까요?",
+    "hi_IN": "ALASS के लिए '[' ']' वाले नाम बदलें?",
+    "bn_BD": "ALASS এর জন্য '[' ']' থাকা নাম বদলাবেন?",
+    "it_IT": "Rinominare i nomi con '[' ']' per ALASS?",
+    "fr_FR": "Renommer les noms avec '[' ']' pour ALASS ?",
+    "de_DE": "Namen mit '[' ']' für ALASS umbenennen?",
+    "pt_PT": "Renomear nomes com '[' ']' para o ALASS?",
+    "ar_SA": "إعادة تسمية الأسماء ذات '[' و']' لـ ALASS؟",
+    "vi_VN": "Đổi tên có '[' ']' để dùng ALASS?",
+    "fa_IR": "نام‌های دارای '[' و ']' برای ALASS تغییر یابد؟",
+    "id_ID": "Ganti nama dengan '[' ']' untuk ALASS?",
+    "ms_MY": "Tukar nama bertanda '[' ']' untuk ALASS?",
+    "th_TH": "เปลี่ยนชื่อที่มี '[' ']' สำหรับ ALASS หรือไม่?",
+    "ur_PK": "ALASS کے لیے '[' ']' والے نام بدلیں؟",
+}
+
+ALASS_RENAME_DIALOG_BODY = {
+    "en_US": "The video or subtitle path contains '[' and ']' characters, which causes the tool 'alass' to fail. Would you like to replace them with '(' and ')' to fix the issue?",
+    "es_ES": 'Tu ruta contiene caracteres "[" y "]" que causan que ALASS falle. ¿Deseas renombrarlos a "(" y ")" para que la sincronización pueda continuar?',
+    "tr_TR": 'Yolunuz ALASS\'ın başarısız olmasına neden olan "[" ve "]" karakterlerini içeriyor. Senkronizasyonun devam edebilmesi için bunları "(" ve ")" olarak yeniden adlandırmak ister misiniz?',
+    "zh_CN": '您的路径包含导致 ALASS 失败的 "[" 和 "]" 字符。您想将它们重命名为 "(" 和 ")" 以便同步可以继续吗？',
+    "zh_TW": '影片或字幕路徑包含 "[" 和 "]" 字元，導致工具 "alass" 失敗。您想將它們替換為 "(" 和 ")" 以修復此問題嗎？',
+    "ru_RU": 'Ваш путь содержит символы "[" и "]", которые вызывают сбой ALASS. Хотите переименовать их в "(" и ")", чтобы синхронизация могла продолжиться?',
+    "pl_PL": 'Twoja ścieżka zawiera znaki "[" i "]", które powodują błąd ALASS. Czy chcesz zmienić je na "(" i ")", aby synchronizacja mogła być kontynuowana?',
+    "uk_UA": 'Ваш шлях містить символи "[" та "]", які спричиняють збій ALASS. Бажаєте перейменувати їх на "(" та ")", щоб синхронізація могла продовжитися?',
+    "ja_JP": 'パスに ALASS の失敗を引き起こす "[" と "]" 文字が含まれています。同期を続行できるように "(" と ")" に名前を変更しますか？',
+    "ko_KR": '경로에 ALASS 실패를 유발하는 "[" 및 "]" 문자가 포함되어 있습니다. 동기화를 계속할 수 있도록 "(" 및 ")"로 이름을 변경하시겠습니까?',
+    "hi_IN": 'आपके पथ में "[" और "]" वर्ण हैं जो ALASS को विफल करते हैं। क्या आप इन्हें "(" और ")" में बदलना चाहते हैं ताकि सिंक जारी रह सके?',
+    "bn_BD": 'আপনার পাথে "[" এবং "]" অক্ষর রয়েছে যা ALASS ব্যর্থ করে। সিঙ্ক চালিয়ে যেতে এগুলিকে "(" এবং ")" তে পরিবর্তন করতে চান?',
+    "it_IT": 'Il tuo percorso contiene caratteri "[" e "]" che causano il fallimento di ALASS. Vuoi rinominarli in "(" e ")" per permettere alla sincronizzazione di procedere?',
+    "fr_FR": 'Votre chemin contient des caractères "[" et "]" qui font échouer ALASS. Voulez-vous les renommer en "(" et ")" pour que la synchronisation puisse continuer ?',
+    "de_DE": 'Ihr Pfad enthält "[" und "]" Zeichen, die ALASS zum Fehlschlagen bringen. Möchten Sie sie in "(" und ")" umbenennen, damit die Synchronisierung fortgesetzt werden kann?',
+    "pt_PT": 'O seu caminho contém caracteres "[" e "]" que causam falha no ALASS. Deseja renomeá-los para "(" e ")" para que a sincronização possa prosseguir?',
+    "ar_SA": 'يحتوي مسارك على أحرف "[" و"]" التي تسبب فشل ALASS. هل تريد إعادة تسميتها إلى "(" و")" حتى تتمكن المزامنة من المتابعة؟',
+    "vi_VN": 'Đường dẫn của bạn chứa ký tự "[" và "]" khiến ALASS thất bại. Bạn có muốn đổi tên chúng thành "(" và ")" để quá trình đồng bộ có thể tiếp tục không?',
+    "fa_IR": 'مسیر شما شامل کاراکترهای "[" و "]" است که باعث شکست ALASS می‌شود. آیا می‌خواهید آنها را به "(" و ")" تغییر نام دهید تا همگام‌سازی بتواند ادامه یابد؟',
+    "id_ID": 'Path Anda mengandung karakter "[" dan "]" yang menyebabkan ALASS gagal. Apakah Anda ingin mengganti namanya menjadi "(" dan ")" agar sinkronisasi dapat dilanjutkan?',
+    "ms_MY": 'Laluan anda mengandungi aksara "[" dan "]" yang menyebabkan ALASS gagal. Adakah anda mahu menukar namanya kepada "(" dan ")" supaya penyegerakan boleh diteruskan?',
+    "th_TH": 'เส้นทางของคุณมีอักขระ "[" และ "]" ซึ่งทำให้ ALASS ล้มเหลว คุณต้องการเปลี่ยนชื่อเป็น "(" และ ")" เพื่อให้การซิงค์สามารถดำเนินต่อไปได้หรือไม่?',
+    "ur_PK": 'آپ کے راستے میں "[" اور "]" حروف ہیں جو ALASS کو ناکام کرتے ہیں۔ کیا آپ انہیں "(" اور ")" میں تبدیل کرنا چاہتے ہیں تاکہ سنک جاری رہ سکے؟',
+}
+
+ALASS_RENAME_ALWAYS = {
+    "en_US": "Auto-rename files if needed",
+    "es_ES": "Renombrar archivos automáticamente si es necesario",
+    "tr_TR": "Gerekirse dosyaları otomatik yeniden adlandır",
+    "zh_CN": "必要时自动重命名文件",
+    "zh_TW": "必要時自動重新命名檔案",
+    "ru_RU": "Автоматически переименовывать файлы при необходимости",
+    "pl_PL": "Automatycznie zmieniaj nazwę plików w razie potrzeby",
+    "uk_UA": "Автоматично перейменовувати файли за потреби",
+    "ja_JP": "必要な場合にファイル名を自動で変更",
+    "ko_KR": "필요한 경우 파일 자동 이름 변경",
+    "hi_IN": "आवश्यक होने पर फ़ाइलों का स्वचालित नाम बदलें",
+    "bn_BD": "প্রয়োজনে ফাইলগুলির স্বয়ংক্রিয়ভাবে নাম পরিবর্তন করুন",
+    "it_IT": "Rinomina automaticamente i file se necessario",
+    "fr_FR": "Renommer automatiquement les fichiers si nécessaire",
+    "de_DE": "Dateien bei Bedarf automatisch umbenennen",
+    "pt_PT": "Renomear arquivos automaticamente, se necessário",
+    "ar_SA": "إعادة تسمية الملفات تلقائيًا عند الحاجة",
+    "vi_VN": "Tự động đổi tên tệp khi cần",
+    "fa_IR": "در صورت نیاز فایل‌ها را به‌صورت خودکار تغییر نام دهید",
+    "id_ID": "Ganti nama file secara otomatis jika diperlukan",
+    "ms_MY": "Tukar nama fail secara automatik jika diperlukan",
+    "th_TH": "เปลี่ยนชื่อไฟล์โดยอัตโนมัติเมื่อจำเป็น",
+    "ur_PK": "ضرورت پڑنے پر فائلوں کے نام خودکار طور پر تبدیل کریں",
+}
+
+ALASS_RENAME_DONT_ASK_AGAIN = {
+    "en_US": "Don't ask again",
+    "es_ES": "No volver a preguntar",
+    "tr_TR": "Bir daha sorma",
+    "zh_CN": "不要再次询问",
+    "zh_TW": "不要再次詢問",
+    "ru_RU": "Больше не спрашивать",
+    "pl_PL": "Nie pytaj ponownie",
+    "uk_UA": "Більше не запитувати",
+    "ja_JP": "もう聞かない",
+    "ko_KR": "다시 묻지 않기",
+    "hi_IN": "फिर से न पूछें",
+    "bn_BD": "আবার জিজ্ঞেস করবেন না",
+    "it_IT": "Non chiedere più",
+    "fr_FR": "Ne plus demander",
+    "de_DE": "Nicht erneut fragen",
+    "pt_PT": "Não perguntar de novo",
+    "ar_SA": "لا تسأل مرة أخرى",
+    "vi_VN": "Đừng hỏi lại",
+    "fa_IR": "دیگه سوال نکن",
+    "id_ID": "Jangan tanya lagi",
+    "ms_MY": "Jangan tanya lagi",
+    "th_TH": "อย่า hỏiอีก",
+    "ur_PK": "دوبارہ نہ پوچھیں",
+}
+
+ALASS_RENAME_TIMER = {
+    "en_US": "Skipping in {time} seconds...",
+    "es_ES": "Omitiendo en {time} segundos...",
+    "tr_TR": "{time} saniye içinde atlanıyor...",
+    "zh_CN": "{time} 秒后跳过...",
+    "zh_TW": "{time} 秒後跳過...",
+    "ru_RU": "Пропуск через {time} секунд...",
+    "pl_PL": "Pomijanie za {time} sekund...",
+    "uk_UA": "Пропуск через {time} секунд...",
+    "ja_JP": "{time} 秒後にスキップ...",
+    "ko_KR": "{time}초 후 건너뛰기...",
+    "hi_IN": "{time} सेकंड में छोड़ा जा रहा है...",
+    "bn_BD": "{time} সেকেন্ডে এড়িয়ে যাচ্ছে...",
+    "it_IT": "Salto in {time} secondi...",
+    "fr_FR": "Ignorer dans {time} secondes...",
+    "de_DE": "Überspringen in {time} Sekunden...",
+    "pt_PT": "Ignorando em {time} segundos...",
+    "ar_SA": "تخطي خلال {time} ثانية...",
+    "vi_VN": "Bỏ qua trong {time} giây...",
+    "fa_IR": "رد شدن در {time} ثانیه...",
+    "id_ID": "Melewati dalam {time} detik...",
+    "ms_MY": "Melangkau dalam {time} saat...",
+    "th_TH": "ข้ามใน {time} วินาที...",
+    "ur_PK": "{time} سیکنڈ میں چھوڑا جا رہا ہے...",
+}
+
+ALASS_RENAME_COMPLETED = {
+    "en_US": "Files/folders renamed: brackets [ ] replaced with parentheses ( )",
+    "es_ES": "Archivos/carpetas renombrados: corchetes [ ] reemplazados por paréntesis ( )",
+    "tr_TR": "Dosyalar/klasörler yeniden adlandırıldı: köşeli parantezler [ ] normal parantezlerle ( ) değiştirildi",
+    "zh_CN": "文件/文件夹已重命名：方括号 [ ] 已替换为圆括号 ( )",
+    "zh_TW": "檔案/資料夾已重新命名：中括號 [ ] 已替換為括號 ( )",
+    "ru_RU": "Файлы/папки переименованы: квадратные скобки [ ] заменены на круглые ( )",
+    "pl_PL": "Pliki/foldery przemianowane: nawiasy kwadratowe [ ] zastąpione okrągłymi ( )",
+    "uk_UA": "Файли/папки перейменовано: квадратні дужки [ ] замінено на круглі ( )",
+    "ja_JP": "ファイル/フォルダの名前を変更：角括弧 [ ] を丸括弧 ( ) に置換",
+    "ko_KR": "파일/폴더 이름 변경됨: 대괄호 [ ]가 소괄호 ( )로 대체됨",
+    "hi_IN": "फ़ाइलें/फ़ोल्डर का नाम बदला गया: वर्ग कोष्ठक [ ] को गोल कोष्ठक ( ) से बदला गया",
+    "bn_BD": "ফাইল/ফোল্ডারের নাম পরিবর্তিত: বর্গাকার বন্ধনী [ ] বৃত্তাকার বন্ধনী ( ) দিয়ে প্রতিস্থাপিত",
+    "it_IT": "File/cartelle rinominati: parentesi quadre [ ] sostituite con tonde ( )",
+    "fr_FR": "Fichiers/dossiers renommés : crochets [ ] remplacés par des parenthèses ( )",
+    "de_DE": "Dateien/Ordner umbenannt: eckige Klammern [ ] durch runde Klammern ( ) ersetzt",
+    "pt_PT": "Ficheiros/pastas renomeados: parênteses retos [ ] substituídos por curvos ( )",
+    "ar_SA": "تمت إعادة تسمية الملفات/المجلدات: تم استبدال الأقواس المربعة [ ] بأقواس دائرية ( )",
+    "vi_VN": "Đã đổi tên tệp/thư mục: dấu ngoặc vuông [ ] được thay bằng ngoặc tròn ( )",
+    "fa_IR": "فایل‌ها/پوشه‌ها تغییر نام یافتند: کروشه [ ] با پرانتز ( ) جایگزین شد",
+    "id_ID": "File/folder diganti nama: tanda kurung siku [ ] diganti dengan tanda kurung biasa ( )",
+    "ms_MY": "Fail/folder ditukar nama: kurungan segi empat [ ] diganti dengan kurungan biasa ( )",
+    "th_TH": "ไฟล์/โฟลเดอร์ถูกเปลี่ยนชื่อ: วงเล็บเหลี่ยม [ ] ถูกแทนที่ด้วยวงเล็บกลม ( )",
+    "ur_PK": "فائلوں/فولڈروں کا نام تبدیل ہوا: مربع بریکٹ [ ] گول بریکٹ ( ) سے تبدیل ہوئے",
+}
+
+
+ERROR_PREFIX = {
+    "en_US": "Error:",
+    "es_ES": "Error:",
+    "tr_TR": "Hata:",
+    "zh_CN": "错误：",
+    "zh_TW": "錯誤：",
+    "ru_RU": "Ошибка:",
+    "pl_PL": "Błąd:",
+    "uk_UA": "Помилка:",
+    "ja_JP": "エラー:",
+    "ko_KR": "오류:",
+    "hi_IN": "त्रुटि:",
+    "bn_BD": "ত্রুটি:",
+    "it_IT": "Errore:",
+    "fr_FR": "Erreur :",
+    "de_DE": "Fehler:",
+    "pt_PT": "Erro:",
+    "ar_SA": "خطأ:",
+    "vi_VN": "Lỗi:",
+    "fa_IR": "خطا:",
+    "id_ID": "Kesalahan:",
+    "ms_MY": "Ralat:",
+    "th_TH": "ข้อผิดพลาด:",
+    "ur_PK": "خرابی:",
+}
+
+CANCEL_BATCH_SYNC_TITLE = {
+    "en_US": "Cancel Batch Sync",
+    "es_ES": "Cancelar sincronización por lotes",
+    "tr_TR": "Toplu Senkronizasyonu İptal Et",
+    "zh_CN": "取消批量同步",
+    "zh_TW": "取消批次同步",
+    "ru_RU": "Отменить пакетную синхронизацию",
+    "pl_PL": "Anuluj synchronizację wsadową",
+    "uk_UA": "Скасувати пакетну синхронізацію",
+    "ja_JP": "バッチ同期のキャンセル",
+    "ko_KR": "배치 동기화 취소",
+    "hi_IN": "बैच सिंक रद्द करें",
+    "bn_BD": "ব্যাচ সিঙ্ক বাতিল করুন",
+    "it_IT": "Annulla sincronizzazione batch",
+    "fr_FR": "Annuler la synchronisation par lot",
+    "de_DE": "Batch-Synchronisierung abbrechen",
+    "pt_PT": "Cancelar sincronização em lote",
+    "ar_SA": "إلغاء مزامنة الدُفعات",
+    "vi_VN": "Hủy đồng bộ hàng loạt",
+    "fa_IR": "لغو همگام‌سازی دسته‌ای",
+    "id_ID": "Batalkan Sinkronisasi Batch",
+    "ms_MY": "Batalkan Segerak Kumpulan",
+    "th_TH": "ยกเลิกการซิงค์แบบกลุ่ม",
+    "ur_PK": "بیچ سنک منسوخ کریں",
+}
+
+CANCEL_BATCH_SYNC_PROMPT = {
+    "en_US": "Are you sure you want to cancel batch sync?",
+    "es_ES": "¿Estás seguro de que deseas cancelar la sincronización por lotes?",
+    "tr_TR": "Toplu senkronizasyonu iptal etmek istediğinizden emin misiniz?",
+    "zh_CN": "您确定要取消批量同步吗？",
+    "zh_TW": "您確定要取消批次同步嗎？",
+    "ru_RU": "Вы уверены, что хотите отменить пакетную синхронизацию?",
+    "pl_PL": "Czy na pewno chcesz anulować synchronizację wsadową?",
+    "uk_UA": "Ви впевнені, що хочете скасувати пакетну синхронізацію?",
+    "ja_JP": "バッチ同期をキャンセルしてもよろしいですか？",
+    "ko_KR": "배치 동기화를 취소하시겠습니까?",
+    "hi_IN": "क्या आप वाकई बैच सिंक रद्द करना चाहते हैं?",
+    "bn_BD": "আপনি কি নিশ্চিতভাবে ব্যাচ সিঙ্ক বাতিল করতে চান?",
+    "it_IT": "Sei sicuro di voler annullare la sincronizzazione batch?",
+    "fr_FR": "Êtes-vous sûr de vouloir annuler la synchronisation par lot ?",
+    "de_DE": "Möchten Sie die Batch-Synchronisierung wirklich abbrechen?",
+    "pt_PT": "Tem certeza de que deseja cancelar a sincronização em lote?",
+    "ar_SA": "هل أنت متأكد أنك تريد إلغاء مزامنة الدُفعات؟",
+    "vi_VN": "Bạn có chắc chắn muốn hủy đồng bộ hàng loạt không?",
+    "fa_IR": "آیا مطمئن هستید که می‌خواهید همگام‌سازی دسته‌ای را لغو کنید؟",
+    "id_ID": "Anda yakin ingin membatalkan sinkronisasi batch?",
+    "ms_MY": "Adakah anda pasti mahu batalkan segerak kumpulan?",
+    "th_TH": "คุณแน่ใจหรือไม่ว่าต้องการยกเลิกการซิงค์แบบกลุ่ม?",
+    "ur_PK": "کیا آپ واقعی بیچ سنک منسوخ کرنا چاہتے ہیں؟",
+}
+
+BATCH_SYNC_COMPLETED = {
+    "en_US": "Batch sync completed.",
+    "es_ES": "Sincronización por lotes completada.",
+    "tr_TR": "Toplu senkronizasyon tamamlandı.",
+    "zh_CN": "批量同步完成。",
+    "zh_TW": "批次同步完成。",
+    "ru_RU": "Пакетная синхронизация завершена.",
+    "pl_PL": "Synchronizacja wsadowa zakończona.",
+    "uk_UA": "Пакетна синхронізація завершена.",
+    "ja_JP": "バッチ同期が完了しました。",
+    "ko_KR": "배치 동기화가 완료되었습니다.",
+    "hi_IN": "बैच सिंक पूर्ण हुआ।",
+    "bn_BD": "ব্যাচ সিঙ্ক সম্পন্ন হয়েছে।",
+    "it_IT": "Sincronizzazione batch completata.",
+    "fr_FR": "Synchronisation par lot terminée.",
+    "de_DE": "Batch-Synchronisierung abgeschlossen.",
+    "pt_PT": "Sincronização em lote concluída.",
+    "ar_SA": "اكتملت مزامنة الدُفعات.",
+    "vi_VN": "Đồng bộ hàng loạt đã hoàn thành.",
+    "fa_IR": "همگام‌سازی دسته‌ای کامل شد.",
+    "id_ID": "Sinkronisasi batch selesai.",
+    "ms_MY": "Penyegerakan kumpulan selesai.",
+    "th_TH": "การซิงค์แบบกลุ่มเสร็จสมบูรณ์",
+    "ur_PK": "بیچ سنک مکمل ہو گیا۔",
+}
+
+BATCH_SYNC_SUCCESSFUL = {
+    "en_US": "Successful: {count}",
+    "es_ES": "Exitoso: {count}",
+    "tr_TR": "Başarılı: {count}",
+    "zh_CN": "成功：{count}",
+    "zh_TW": "成功：{count}",
+    "ru_RU": "Успешно: {count}",
+    "pl_PL": "Udane: {count}",
+    "uk_UA": "Успішно: {count}",
+    "ja_JP": "成功: {count}",
+    "ko_KR": "성공: {count}",
+    "hi_IN": "सफल: {count}",
+    "bn_BD": "সফল: {count}",
+    "it_IT": "Riuscito: {count}",
+    "fr_FR": "Réussi : {count}",
+    "de_DE": "Erfolgreich: {count}",
+    "pt_PT": "Bem-sucedido: {count}",
+    "ar_SA": "ناجح: {count}",
+    "vi_VN": "Thành công: {count}",
+    "fa_IR": "موفق: {count}",
+    "id_ID": "Berhasil: {count}",
+    "ms_MY": "Berjaya: {count}",
+    "th_TH": "สำเร็จ: {count}",
+    "ur_PK": "کامیاب: {count}",
+}
+
+BATCH_SYNC_FAILED_PAIR = {
+    "en_US": "Failed pair: [{idx}/{total}]",
+    "es_ES": "Par fallido: [{idx}/{total}]",
+    "tr_TR": "Başarısız eşleşme: [{idx}/{total}]",
+    "zh_CN": "失败的配对：[{idx}/{total}]",
+    "zh_TW": "失敗的配對：[{idx}/{total}]",
+    "ru_RU": "Неудачная пара: [{idx}/{total}]",
+    "pl_PL": "Nieudana para: [{idx}/{total}]",
+    "uk_UA": "Невдала пара: [{idx}/{total}]",
+    "ja_JP": "失敗したペア: [{idx}/{total}]",
+    "ko_KR": "실패한 쌍: [{idx}/{total}]",
+    "hi_IN": "असफल जोड़ी: [{idx}/{total}]",
+    "bn_BD": "ব্যর্থ জোড়া: [{idx}/{total}]",
+    "it_IT": "Coppia fallita: [{idx}/{total}]",
+    "fr_FR": "Paire échouée : [{idx}/{total}]",
+    "de_DE": "Fehlgeschlagenes Paar: [{idx}/{total}]",
+    "pt_PT": "Par falhado: [{idx}/{total}]",
+    "ar_SA": "زوج فشل: [{idx}/{total}]",
+    "vi_VN": "Cặp thất bại: [{idx}/{total}]",
+    "fa_IR": "جفت ناموفق: [{idx}/{total}]",
+    "id_ID": "Pasangan gagal: [{idx}/{total}]",
+    "ms_MY": "Pasangan gagal: [{idx}/{total}]",
+    "th_TH": "คู่ที่ล้มเหลว: [{idx}/{total}]",
+    "ur_PK": "ناکام جوڑا: [{idx}/{total}]",
+}
+
+BATCH_SYNC_FAILED = {
+    "en_US": "Failed: {count}",
+    "es_ES": "Fallidos: {count}",
+    "tr_TR": "Başarısız: {count}",
+    "zh_CN": "失败：{count}",
+    "zh_TW": "失敗：{count}",
+    "ru_RU": "Неудачно: {count}",
+    "pl_PL": "Nieudane: {count}",
+    "uk_UA": "Неуспішно: {count}",
+    "ja_JP": "失敗: {count}",
+    "ko_KR": "실패: {count}",
+    "hi_IN": "असफल: {count}",
+    "bn_BD": "ব্যর্থ: {count}",
+    "it_IT": "Fallito: {count}",
+    "fr_FR": "Échoué : {count}",
+    "de_DE": "Fehlgeschlagen: {count}",
+    "pt_PT": "Falhou: {count}",
+    "ar_SA": "فشل: {count}",
+    "vi_VN": "Thất bại: {count}",
+    "fa_IR": "ناموفق: {count}",
+    "id_ID": "Gagal: {count}",
+    "ms_MY": "Gagal: {count}",
+    "th_TH": "ล้มเหลว: {count}",
+    "ur_PK": "ناکام: {count}",
+}
+
+BATCH_SYNC_PROCESSING_PAIR = {
+    "en_US": "Processing pair [{idx}/{total}]",
+    "es_ES": "Procesando par [{idx}/{total}]",
+    "tr_TR": "Eş işleniyor [{idx}/{total}]",
+    "zh_CN": "正在处理配对 [{idx}/{total}]",
+    "zh_TW": "正在處理配對 [{idx}/{total}]",
+    "ru_RU": "Обработка пары [{idx}/{total}]",
+    "pl_PL": "Przetwarzanie pary [{idx}/{total}]",
+    "uk_UA": "Обробка пари [{idx}/{total}]",
+    "ja_JP": "ペアを処理中 [{idx}/{total}]",
+    "ko_KR": "쌍 처리 중 [{idx}/{total}]",
+    "hi_IN": "जोड़ी संसाधित हो रही है [{idx}/{total}]",
+    "bn_BD": "জোড়া প্রক্রিয়াকরণ হচ্ছে [{idx}/{total}]",
+    "it_IT": "Elaborazione coppia [{idx}/{total}]",
+    "fr_FR": "Traitement de la paire [{idx}/{total}]",
+    "de_DE": "Paar wird verarbeitet [{idx}/{total}]",
+    "pt_PT": "Processando par [{idx}/{total}]",
+    "ar_SA": "جارٍ معالجة الزوج [{idx}/{total}]",
+    "vi_VN": "Đang xử lý cặp [{idx}/{total}]",
+    "fa_IR": "در حال پردازش جفت [{idx}/{total}]",
+    "id_ID": "Memproses pasangan [{idx}/{total}]",
+    "ms_MY": "Memproses pasangan [{idx}/{total}]",
+    "th_TH": "กำลังประมวลผลคู่ [{idx}/{total}]",
+    "ur_PK": "جوڑا پروسیس ہو رہا ہے [{idx}/{total}]",
+}
+
+BATCH_SYNC_FINISHED_PAIR = {
+    "en_US": "Finished pair [{idx}/{total}]",
+    "es_ES": "Par finalizado [{idx}/{total}]",
+    "tr_TR": "Eş tamamlandı [{idx}/{total}]",
+    "zh_CN": "配对已完成 [{idx}/{total}]",
+    "zh_TW": "配對已完成 [{idx}/{total}]",
+    "ru_RU": "Пара завершена [{idx}/{total}]",
+    "pl_PL": "Para zakończona [{idx}/{total}]",
+    "uk_UA": "Пару завершено [{idx}/{total}]",
+    "ja_JP": "ペアの処理完了 [{idx}/{total}]",
+    "ko_KR": "쌍 처리 완료 [{idx}/{total}]",
+    "hi_IN": "जोड़ी पूर्ण हुई [{idx}/{total}]",
+    "bn_BD": "জোড়া সম্পন্ন হয়েছে [{idx}/{total}]",
+    "it_IT": "Coppia completata [{idx}/{total}]",
+    "fr_FR": "Paire terminée [{idx}/{total}]",
+    "de_DE": "Paar abgeschlossen [{idx}/{total}]",
+    "pt_PT": "Par concluído [{idx}/{total}]",
+    "ar_SA": "اكتمل الزوج [{idx}/{total}]",
+    "vi_VN": "Đã xong cặp [{idx}/{total}]",
+    "fa_IR": "جفت تکمیل شد [{idx}/{total}]",
+    "id_ID": "Pasangan selesai [{idx}/{total}]",
+    "ms_MY": "Pasangan selesai [{idx}/{total}]",
+    "th_TH": "ประมวลผลคู่เสร็จแล้ว [{idx}/{total}]",
+    "ur_PK": "جوڑا مکمل ہو گیا [{idx}/{total}]",
+}
+
+CHECKING_VIDEO_FOR_EMBEDDED_SUBTITLES = {
+    "en_US": "Checking video for embedded subtitles...",
+    "es_ES": "Comprobando si el vídeo tiene subtítulos incrustados...",
+    "tr_TR": "Videodaki gömülü altyazılar kontrol ediliyor...",
+    "zh_CN": "正在检查视频中的内嵌字幕...",
+    "zh_TW": "正在檢查影片中的內嵌字幕...",
+    "ru_RU": "Проверка видео на встроенные субтитры...",
+    "pl_PL": "Sprawdzanie, czy wideo zawiera osadzone napisy...",
+    "uk_UA": "Перевірка відео на вбудовані субтитри...",
+    "ja_JP": "ビデオに埋め込み字幕があるか確認中...",
+    "ko_KR": "비디오에 내장 자막이 있는지 확인 중...",
+    "hi_IN": "वीडियो में एम्बेडेड सबटाइटल्स की जांच हो रही है...",
+    "bn_BD": "ভিডিওতে এম্বেডেড সাবটাইটেল চেক করা হচ্ছে...",
+    "it_IT": "Controllo dei sottotitoli incorporati nel video...",
+    "fr_FR": "Vérification des sous-titres intégrés dans la vidéo...",
+    "de_DE": "Überprüfung des Videos auf eingebettete Untertitel...",
+    "pt_PT": "Verificando legendas incorporadas no vídeo...",
+    "ar_SA": "جارٍ التحقق من وجود ترجمات مضمنة في الفيديو...",
+    "vi_VN": "Đang kiểm tra phụ đề nhúng trong video...",
+    "fa_IR": "در حال بررسی زیرنویس‌های جاسازی‌شده در ویدیو...",
+    "id_ID": "Memeriksa subtitle tertanam dalam video...",
+    "ms_MY": "Memeriksa sari kata terbenam dalam video...",
+    "th_TH": "กำลังตรวจสอบวิดีโอสำหรับคำบรรยายที่ฝังอยู่...",
+    "ur_PK": "ویڈیو میں ایمبیڈڈ سب ٹائٹلز چیک کیے جا رہے ہیں...",
+}
+
+CHECKING_VIDEO_FOR_PGS_SUBTITLES = {
+    "en_US": "Checking for PGS subtitles...",
+    "es_ES": "Comprobando subtítulos PGS...",
+    "tr_TR": "PGS altyazıları kontrol ediliyor...",
+    "zh_CN": "正在检查 PGS 字幕...",
+    "zh_TW": "正在檢查 PGS 字幕...",
+    "ru_RU": "Проверка субтитров PGS...",
+    "pl_PL": "Sprawdzanie napisów PGS...",
+    "uk_UA": "Перевірка субтитрів PGS...",
+    "ja_JP": "PGS字幕を確認中...",
+    "ko_KR": "PGS 자막 확인 중...",
+    "hi_IN": "PGS सबटाइटल्स की जांच हो रही है...",
+    "bn_BD": "PGS সাবটাইটেল চেক করা হচ্ছে...",
+    "it_IT": "Controllo dei sottotitoli PGS...",
+    "fr_FR": "Vérification des sous-titres PGS...",
+    "de_DE": "Überprüfung auf PGS-Untertitel...",
+    "pt_PT": "A verificar legendas PGS...",
+    "ar_SA": "جارٍ التحقق من ترجمات PGS...",
+    "vi_VN": "Đang kiểm tra phụ đề PGS...",
+    "fa_IR": "در حال بررسی زیرنویس‌های PGS...",
+    "id_ID": "Memeriksa subtitle PGS...",
+    "ms_MY": "Memeriksa sari kata PGS...",
+    "th_TH": "กำลังตรวจสอบคำบรรยาย PGS...",
+    "ur_PK": "PGS سب ٹائٹلز چیک کیے جا رہے ہیں...",
+}
+
+EXTRACTION_FAILED_PREFIX = {
+    "en_US": "Extraction failed: ",
+    "es_ES": "Extracción fallida: ",
+    "tr_TR": "Çıkarma başarısız: ",
+    "zh_CN": "提取失败：",
+    "zh_TW": "提取失敗：",
+    "ru_RU": "Извлечение не удалось: ",
+    "pl_PL": "Wyodrębnianie nie powiodło się: ",
+    "uk_UA": "Не вдалося витягти: ",
+    "ja_JP": "抽出に失敗しました: ",
+    "ko_KR": "추출 실패: ",
+    "hi_IN": "एक्सट्रैक्शन विफल: ",
+    "bn_BD": "এক্সট্রাকশন ব্যর্থ: ",
+    "it_IT": "Estrazione non riuscita: ",
+    "fr_FR": "Échec de l'extraction : ",
+    "de_DE": "Extraktion fehlgeschlagen: ",
+    "pt_PT": "Falha na extração: ",
+    "ar_SA": "فشل الاستخراج: ",
+    "vi_VN": "Trích xuất thất bại: ",
+    "fa_IR": "استخراج ناموفق: ",
+    "id_ID": "Ekstraksi gagal: ",
+    "ms_MY": "Pengekstrakan gagal: ",
+    "th_TH": "การแยกข้อมูลล้มเหลว: ",
+    "ur_PK": "ایکسٹریکشن ناکام: ",
+}
+
+EXTRACTION_SELECTED_WITH_TIMESTAMP = {
+    "en_US": "Selected: {filename} with timestamp difference: {score}",
+    "es_ES": "Seleccionado: {filename} con diferencia de marca de tiempo: {score}",
+    "tr_TR": "Seçildi: {filename}, zaman damgası farkı: {score}",
+    "zh_CN": "已选择：{filename}，时间戳差异：{score}",
+    "zh_TW": "已選擇：{filename}，時間戳差異：{score}",
+    "ru_RU": "Выбрано: {filename} с разницей во времени: {score}",
+    "pl_PL": "Wybrano: {filename} z różnicą znaczników czasu: {score}",
+    "uk_UA": "Вибрано: {filename} з різницею часових міток: {score}",
+    "ja_JP": "選択: {filename}、タイムスタンプ差: {score}",
+    "ko_KR": "선택됨: {filename}, 타임스탬프 차이: {score}",
+    "hi_IN": "चयनित: {filename} टाइमस्टैम्प अंतर के साथ: {score}",
+    "bn_BD": "নির্বাচিত: {filename} টাইমস্ট্যাম্প পার্থক্য সহ: {score}",
+    "it_IT": "Selezionato: {filename} con differenza di timestamp: {score}",
+    "fr_FR": "Sélectionné : {filename} avec différence d'horodatage : {score}",
+    "de_DE": "Ausgewählt: {filename} mit Zeitstempel-Differenz: {score}",
+    "pt_PT": "Selecionado: {filename} com diferença de timestamp: {score}",
+    "ar_SA": "تم الاختيار: {filename} مع فرق الطابع الزمني: {score}",
+    "vi_VN": "Đã chọn: {filename} với chênh lệch dấu thời gian: {score}",
+    "fa_IR": "انتخاب شد: {filename} با اختلاف زمان‌بندی: {score}",
+    "id_ID": "Dipilih: {filename} dengan perbedaan timestamp: {score}",
+    "ms_MY": "Dipilih: {filename} dengan perbezaan cap masa: {score}",
+    "th_TH": "เลือกแล้ว: {filename} โดยมีความแตกต่างของ timestamp: {score}",
+    "ur_PK": "منتخب: {filename} ٹائم اسٹیمپ فرق کے ساتھ: {score}",
+}
+
+EXTRACTION_NO_COMPATIBLE_SUBTITLES = {
+    "en_US": "No compatible subtitles found to extract, using video...",
+    "es_ES": "No se encontraron subtítulos compatibles para extraer, usando el video...",
+    "tr_TR": "Çıkarmak için uyumlu altyazı bulunamadı, video kullanılıyor...",
+    "zh_CN": "未找到可提取的兼容字幕，正在使用视频...",
+    "zh_TW": "未找到可提取的相容字幕，正在使用影片...",
+    "ru_RU": "Не найдено совместимых субтитров для извлечения, используется видео...",
+    "pl_PL": "Nie znaleziono kompatybilnych napisów do wyodrębnienia, używany jest film...",
+    "uk_UA": "Не знайдено сумісних субтитрів для вилучення, використовується відео...",
+    "ja_JP": "抽出可能な互換性のある字幕が見つかりません。ビデオを使用します...",
+    "ko_KR": "추출할 호환 자막을 찾을 수 없어 비디오를 사용합니다...",
+    "hi_IN": "निकालने के लिए कोई संगत सबटाइटल नहीं मिला, वीडियो का उपयोग किया जा रहा है...",
+    "bn_BD": "এক্সট্রাক্ট করার জন্য কোনো উপযুক্ত সাবটাইটেল পাওয়া যায়নি, ভিডিও ব্যবহার করা হচ্ছে...",
+    "it_IT": "Nessun sottotitolo compatibile trovato da estrarre, utilizzo il video...",
+    "fr_FR": "Aucun sous-titre compatible trouvé à extraire, utilisation de la vidéo...",
+    "de_DE": "Keine kompatiblen Untertitel zum Extrahieren gefunden, Video wird verwendet...",
+    "pt_PT": "Nenhuma legenda compatível encontrada para extrair, usando o vídeo...",
+    "ar_SA": "لم يتم العثور على ترجمات متوافقة للاستخراج، يتم استخدام الفيديو...",
+    "vi_VN": "Không tìm thấy phụ đề tương thích để trích xuất, đang sử dụng video...",
+    "fa_IR": "زیرنویس سازگار برای استخراج یافت نشد، از ویدیو استفاده می‌شود...",
+    "id_ID": "Tidak ditemukan subtitle yang kompatibel untuk diekstrak, menggunakan video...",
+    "ms_MY": "Tiada sari kata serasi untuk diekstrak, menggunakan video...",
+    "th_TH": "ไม่พบคำบรรยายที่เข้ากันได้สำหรับการแยก ใช้วิดีโอแทน...",
+    "ur_PK": "ایکسٹریکٹ کے لیے کوئی ہم آہنگ سب ٹائٹلز نہیں ملے، ویڈیو استعمال کی جا رہی ہے...",
+}
+
+CONVERSION_FAILED_FOR_FILE = {
+    "en_US": "Conversion failed for {filename}",
+    "es_ES": "La conversión falló para {filename}",
+    "tr_TR": "{filename} için dönüştürme başarısız oldu",
+    "zh_CN": "{filename} 转换失败",
+    "zh_TW": "{filename} 轉換失敗",
+    "ru_RU": "Ошибка конвертации для {filename}",
+    "pl_PL": "Konwersja nie powiodła się dla {filename}",
+    "uk_UA": "Не вдалося конвертувати {filename}",
+    "ja_JP": "{filename} の変換に失敗しました",
+    "ko_KR": "{filename} 변환 실패",
+    "hi_IN": "{filename} के लिए रूपांतरण विफल रहा",
+    "bn_BD": "{filename} এর জন্য রূপান্তর ব্যর্থ হয়েছে",
+    "it_IT": "Conversione non riuscita per {filename}",
+    "fr_FR": "Échec de la conversion pour {filename}",
+    "de_DE": "Konvertierung fehlgeschlagen für {filename}",
+    "pt_PT": "Falha na conversão de {filename}",
+    "ar_SA": "فشل التحويل لـ {filename}",
+    "vi_VN": "Chuyển đổi thất bại cho {filename}",
+    "fa_IR": "تبدیل برای {filename} ناموفق بود",
+    "id_ID": "Konversi gagal untuk {filename}",
+    "ms_MY": "Penukaran gagal untuk {filename}",
+    "th_TH": "การแปลงล้มเหลวสำหรับ {filename}",
+    "ur_PK": "{filename} کے لیے کنورژن ناکام ہوگئی",
+}
+
+SYNC_CANCELLED_CONVERSION_FAILURE = {
+    "en_US": "Sync cancelled due to conversion failure.",
+    "es_ES": "Sincronización cancelada debido a un fallo de conversión.",
+    "tr_TR": "Dönüştürme hatası nedeniyle senkronizasyon iptal edildi.",
+    "zh_CN": "由于转换失败，同步已取消。",
+    "zh_TW": "由於轉換失敗，同步已取消。",
+    "ru_RU": "Синхронизация отменена из-за ошибки конвертации.",
+    "pl_PL": "Synchronizacja anulowana z powodu niepowodzenia konwersji.",
+    "uk_UA": "Синхронізацію скасовано через помилку конвертації.",
+    "ja_JP": "変換の失敗により同期がキャンセルされました。",
+    "ko_KR": "변환 실패로 인해 동기화가 취소되었습니다.",
+    "hi_IN": "रूपांतरण विफलता के कारण सिंक रद्द कर दिया गया।",
+    "bn_BD": "রূপান্তর ব্যর্থতার কারণে সিঙ্ক বাতিল করা হয়েছে।",
+    "it_IT": "Sincronizzazione annullata a causa di un errore di conversione.",
+    "fr_FR": "Synchronisation annulée en raison d'un échec de conversion.",
+    "de_DE": "Synchronisierung wegen Konvertierungsfehler abgebrochen.",
+    "pt_PT": "Sincronização cancelada devido a falha na conversão.",
+    "ar_SA": "تم إلغاء المزامنة بسبب فشل التحويل.",
+    "vi_VN": "Đồng bộ bị hủy do lỗi chuyển đổi.",
+    "fa_IR": "همگام‌سازی به دلیل خطای تبدیل لغو شد.",
+    "id_ID": "Sinkronisasi dibatalkan karena kegagalan konversi.",
+    "ms_MY": "Penyegerakan dibatalkan kerana kegagalan penukaran.",
+    "th_TH": "ยกเลิกการซิงค์เนื่องจากการแปลงล้มเหลว",
+    "ur_PK": "کنورژن کی ناکامی کی وجہ سے سنک منسوخ کر دی گئی۔",
+}
+
+
+############### sync_manual.py ###############
+
+
+ERROR_LOADING_SUBTITLE_FILE = {
+    "en_US": "Error loading subtitle file: {error}",
+    "es_ES": "Error al cargar el archivo de subtítulos: {error}",
+    "tr_TR": "Altyazı dosyası yükleme hatası: {error}",
+    "zh_CN": "加载字幕文件时出错：{error}",
+    "zh_TW": "載入字幕檔案時發生錯誤：{error}",
+    "ru_RU": "Ошибка загрузки файла субтитров: {error}",
+    "pl_PL": "Błąd ładowania pliku napisów: {error}",
+    "uk_UA": "Помилка завантаження файлу субтитрів: {error}",
+    "ja_JP": "字幕ファイルの読み込みエラー: {error}",
+    "ko_KR": "자막 파일 로딩 오류: {error}",
+    "hi_IN": "सबटाइटल फ़ाइल लोड करने में त्रुटि: {error}",
+    "bn_BD": "সাবটাইটেল ফাইল লোড করতে ত্রুটি: {error}",
+    "it_IT": "Errore nel caricamento del file dei sottotitoli: {error}",
+    "fr_FR": "Erreur lors du chargement du fichier de sous-titres : {error}",
+    "de_DE": "Fehler beim Laden der Untertiteldatei: {error}",
+    "pt_PT": "Erro ao carregar arquivo de legenda: {error}",
+    "ar_SA": "خطأ في تحميل ملف الترجمة: {error}",
+    "vi_VN": "Lỗi tải tệp phụ đề: {error}",
+    "fa_IR": "خطا در بارگذاری فایل زیرنویس: {error}",
+    "id_ID": "Kesalahan memuat file subtitle: {error}",
+    "ms_MY": "Ralat memuatkan fail sari kata: {error}",
+    "th_TH": "เกิดข้อผิดพลาดในการโหลดไฟล์คำบรรยาย: {error}",
+    "ur_PK": "سب ٹائٹل فائل لوڈ کرنے میں خرابی: {error}",
+}
+
+SUBTITLE_SHIFTED_SUCCESSFULLY = {
+    "en_US": "Subtitle shifted successfully by {milliseconds}ms!\nSaved to: {output_file}",
+    "es_ES": "¡Subtítulo desplazado exitosamente por {milliseconds}ms!\nGuardado en: {output_file}",
+    "tr_TR": "Altyazı başarıyla {milliseconds}ms kaydırıldı!\nKaydedildi: {output_file}",
+    "zh_CN": "字幕成功偏移 {milliseconds}毫秒！\n保存到：{output_file}",
+    "zh_TW": "字幕成功偏移 {milliseconds}毫秒！\n已儲存至：{output_file}",
+    "ru_RU": "Субтитры успешно смещены на {milliseconds}мс!\nСохранено в: {output_file}",
+    "pl_PL": "Napisy przesunięte pomyślnie o {milliseconds}ms!\nZapisano w: {output_file}",
+    "uk_UA": "Субтитри успішно зміщено на {milliseconds}мс!\nЗбережено в: {output_file}",
+    "ja_JP": "字幕を{milliseconds}ミリ秒正常にシフトしました！\n保存先: {output_file}",
+    "ko_KR": "자막이 {milliseconds}ms만큼 성공적으로 이동되었습니다!\n저장 위치: {output_file}",
+    "hi_IN": "सबटाइटल को {milliseconds}ms से सफलतापूर्वक शिफ्ट किया गया!\nसहेजा गया: {output_file}",
+    "bn_BD": "সাবটাইটেল সফলভাবে {milliseconds}ms শিফট করা হয়েছে!\nসংরক্ষিত: {output_file}",
+    "it_IT": "Sottotitolo spostato con successo di {milliseconds}ms!\nSalvato in: {output_file}",
+    "fr_FR": "Sous-titre décalé avec succès de {milliseconds}ms !\nEnregistré dans : {output_file}",
+    "de_DE": "Untertitel erfolgreich um {milliseconds}ms verschoben!\nGespeichert in: {output_file}",
+    "pt_PT": "Legenda deslocada com sucesso em {milliseconds}ms!\nSalvo em: {output_file}",
+    "ar_SA": "تم إزاحة الترجمة بنجاح بمقدار {milliseconds}ms!\nمحفوظ في: {output_file}",
+    "vi_VN": "Phụ đề đã được dịch chuyển thành công {milliseconds}ms!\nĐã lưu vào: {output_file}",
+    "fa_IR": "زیرنویس با موفقیت {milliseconds}ms جابجا شد!\nذخیره شده در: {output_file}",
+    "id_ID": "Subtitle berhasil digeser {milliseconds}ms!\nDisimpan di: {output_file}",
+    "ms_MY": "Sari kata berjaya dianjak {milliseconds}ms!\nDisimpan di: {output_file}",
+    "th_TH": "เลื่อนคำบรรยายสำเร็จ {milliseconds}ms!\nบันทึกที่: {output_file}",
+    "ur_PK": "سب ٹائٹل کامیابی سے {milliseconds}ms شفٹ ہو گیا!\nمحفوظ: {output_file}",
+}
+
+SUBTITLE_RETIMED_SUCCESSFULLY = {
+    "en_US": "Subtitle retimed successfully ({transform})!\nSaved to: {output_file}",
+    "es_ES": "¡Tiempos del subtítulo ajustados exitosamente ({transform})!\nGuardado en: {output_file}",
+    "tr_TR": "Altyazı zamanlaması başarıyla ayarlandı ({transform})!\nKaydedildi: {output_file}",
+    "zh_CN": "字幕时间轴调整成功（{transform}）！\n保存到：{output_file}",
+    "zh_TW": "字幕時間軸調整成功（{transform}）！\n已儲存至：{output_file}",
+    "ru_RU": "Тайминг субтитров успешно изменён ({transform})!\nСохранено в: {output_file}",
+    "pl_PL": "Czasy napisów zmienione pomyślnie ({transform})!\nZapisano w: {output_file}",
+    "uk_UA": "Таймінг субтитрів успішно змінено ({transform})!\nЗбережено в: {output_file}",
+    "ja_JP": "字幕のタイミングを正常に調整しました（{transform}）！\n保存先: {output_file}",
+    "ko_KR": "자막 타이밍이 성공적으로 조정되었습니다 ({transform})!\n저장 위치: {output_file}",
+    "hi_IN": "सबटाइटल की टाइमिंग सफलतापूर्वक बदली गई ({transform})!\nसहेजा गया: {output_file}",
+    "bn_BD": "সাবটাইটেলের টাইমিং সফলভাবে পরিবর্তন করা হয়েছে ({transform})!\nসংরক্ষিত: {output_file}",
+    "it_IT": "Tempi del sottotitolo regolati con successo ({transform})!\nSalvato in: {output_file}",
+    "fr_FR": "Minutage du sous-titre ajusté avec succès ({transform}) !\nEnregistré dans : {output_file}",
+    "de_DE": "Untertitel-Timing erfolgreich angepasst ({transform})!\nGespeichert in: {output_file}",
+    "pt_PT": "Tempos da legenda ajustados com sucesso ({transform})!\nSalvo em: {output_file}",
+    "ar_SA": "تم تعديل توقيت الترجمة بنجاح ({transform})!\nمحفوظ في: {output_file}",
+    "vi_VN": "Đã điều chỉnh thời gian phụ đề thành công ({transform})!\nĐã lưu vào: {output_file}",
+    "fa_IR": "زمان‌بندی زیرنویس با موفقیت تغییر کرد ({transform})!\nذخیره شده در: {output_file}",
+    "id_ID": "Waktu subtitle berhasil disesuaikan ({transform})!\nDisimpan di: {output_file}",
+    "ms_MY": "Masa sari kata berjaya dilaraskan ({transform})!\nDisimpan di: {output_file}",
+    "th_TH": "ปรับเวลาคำบรรยายสำเร็จ ({transform})!\nบันทึกที่: {output_file}",
+    "ur_PK": "سب ٹائٹل کی ٹائمنگ کامیابی سے تبدیل ہو گئی ({transform})!\nمحفوظ: {output_file}",
+}
+
+ERROR_SAVING_SHIFTED_SUBTITLE = {
+    "en_US": "Error saving shifted subtitle: {error}",
+    "es_ES": "Error al guardar subtítulo desplazado: {error}",
+    "tr_TR": "Kaydırılmış altyazı kaydedilirken hata: {error}",
+    "zh_CN": "保存偏移字幕时出错：{error}",
+    "zh_TW": "儲存偏移字幕時發生錯誤：{error}",
+    "ru_RU": "Ошибка сохранения смещенных субтитров: {error}",
+    "pl_PL": "Błąd zapisu przesuniętych napisów: {error}",
+    "uk_UA": "Помилка збереження зміщених субтитрів: {error}",
+    "ja_JP": "シフトした字幕の保存エラー: {error}",
+    "ko_KR": "이동된 자막 저장 오류: {error}",
+    "hi_IN": "शिफ्ट किए गए सबटाइटल को सेव करने में त्रुटि: {error}",
+    "bn_BD": "শিফট করা সাবটাইটেল সংরক্ষণে ত্রুটি: {error}",
+    "it_IT": "Errore nel salvataggio del sottotitolo spostato: {error}",
+    "fr_FR": "Erreur lors de la sauvegarde du sous-titre décalé : {error}",
+    "de_DE": "Fehler beim Speichern der verschobenen Untertitel: {error}",
+    "pt_PT": "Erro ao salvar legenda deslocada: {error}",
+    "ar_SA": "خطأ في حفظ الترجمة المزاحة: {error}",
+    "vi_VN": "Lỗi lưu phụ đề đã dịch chuyển: {error}",
+    "fa_IR": "خطا در ذخیره زیرنویس جابجا شده: {error}",
+    "id_ID": "Kesalahan menyimpan subtitle yang digeser: {error}",
+    "ms_MY": "Ralat menyimpan sari kata yang dianjak: {error}",
+    "th_TH": "เกิดข้อผิดพลาดในการบันทึกคำบรรยายที่เลื่อน: {error}",
+    "ur_PK": "شفٹ شدہ سب ٹائٹل محفوظ کرنے میں خرابی: {error}",
+}
+
+
+############### subtitle_extractor.py ###############
+
+
+USED_LONGEST_SUBTITLE_FILE = {
+    "en_US": "Used the longest subtitle file",
+    "es_ES": "Se usó el archivo de subtítulos más largo",
+    "tr_TR": "En uzun altyazı dosyası kullanıldı",
+    "zh_CN": "使用了最长的字幕文件",
+    "zh_TW": "使用了最長的字幕檔案",
+    "ru_RU": "Использован самый длинный файл субтитров",
+    "pl_PL": "Użyto najdłuższego pliku napisów",
+    "uk_UA": "Використано найдовший файл субтитрів",
+    "ja_JP": "最長の字幕ファイルを使用しました",
+    "ko_KR": "가장 긴 자막 파일을 사용했습니다",
+    "hi_IN": "सबसे लंबी सबटाइटल फ़ाइल का उपयोग किया गया",
+    "bn_BD": "সবচেয়ে দীর্ঘ সাবটাইটেল ফাইল ব্যবহার করা হয়েছে",
+    "it_IT": "Utilizzato il file di sottotitoli più lungo",
+    "fr_FR": "Fichier de sous-titres le plus long utilisé",
+    "de_DE": "Längste Untertiteldatei verwendet",
+    "pt_PT": "Usado o arquivo de legenda mais longo",
+    "ar_SA": "تم استخدام ملف الترجمة الأطول",
+    "vi_VN": "Đã sử dụng tệp phụ đề dài nhất",
+    "fa_IR": "از طولانی‌ترین فایل زیرنویس استفاده شد",
+    "id_ID": "Menggunakan file subtitle terpanjang",
+    "ms_MY": "Menggunakan fail sari kata terpanjang",
+    "th_TH": "ใช้ไฟล์คำบรรยายที่ยาวที่สุด",
+    "ur_PK": "سب سے لمبی سب ٹائٹل فائل استعمال کی گئی",
+}
+
+VIDEO_FILE_NOT_FOUND = {
+    "en_US": "Video file not found: {video_file}",
+    "es_ES": "Archivo de video no encontrado: {video_file}",
+    "tr_TR": "Video dosyası bulunamadı: {video_file}",
+    "zh_CN": "未找到视频文件：{video_file}",
+    "zh_TW": "找不到影片檔案：{video_file}",
+    "ru_RU": "Видеофайл не найден: {video_file}",
+    "pl_PL": "Nie znaleziono pliku wideo: {video_file}",
+    "uk_UA": "Відеофайл не знайдено: {video_file}",
+    "ja_JP": "ビデオファイルが見つかりません: {video_file}",
+    "ko_KR": "비디오 파일을 찾을 수 없습니다: {video_file}",
+    "hi_IN": "वीडियो फ़ाइल नहीं मिली: {video_file}",
+    "bn_BD": "ভিডিও ফাইল পাওয়া যায়নি: {video_file}",
+    "it_IT": "File video non trovato: {video_file}",
+    "fr_FR": "Fichier vidéo introuvable : {video_file}",
+    "de_DE": "Videodatei nicht gefunden: {video_file}",
+    "pt_PT": "Arquivo de vídeo não encontrado: {video_file}",
+    "ar_SA": "ملف الفيديو غير موجود: {video_file}",
+    "vi_VN": "Không tìm thấy tệp video: {video_file}",
+    "fa_IR": "فایل ویدیو یافت نشد: {video_file}",
+    "id_ID": "File video tidak ditemukan: {video_file}",
+    "ms_MY": "Fail video tidak dijumpai: {video_file}",
+    "th_TH": "ไม่พบไฟล์วิดีโอ: {video_file}",
+    "ur_PK": "ویڈیو فائل نہیں ملی: {video_file}",
+}
+
+FFPROBE_FAILED_TO_ANALYZE_VIDEO = {
+    "en_US": "FFprobe failed to analyze video file",
+    "es_ES": "FFprobe falló al analizar el archivo de video",
+    "tr_TR": "FFprobe video dosyasını analiz edemedi",
+    "zh_CN": "FFprobe 无法分析视频文件",
+    "zh_TW": "FFprobe 無法分析影片檔案",
+    "ru_RU": "FFprobe не удалось проанализировать видеофайл",
+    "pl_PL": "FFprobe nie udało się przeanalizować pliku wideo",
+    "uk_UA": "FFprobe не вдалося проаналізувати відеофайл",
+    "ja_JP": "FFprobe がビデオファイルの分析に失敗しました",
+    "ko_KR": "FFprobe가 비디오 파일 분석에 실패했습니다",
+    "hi_IN": "FFprobe वीडियो फ़ाइल का विश्लेषण करने में विफल रहा",
+    "bn_BD": "FFprobe ভিডিও ফাইল বিশ্লেষণে ব্যর্থ হয়েছে",
+    "it_IT": "FFprobe non è riuscito ad analizzare il file video",
+    "fr_FR": "FFprobe a échoué à analyser le fichier vidéo",
+    "de_DE": "FFprobe konnte die Videodatei nicht analysieren",
+    "pt_PT": "FFprobe falhou ao analisar o arquivo de vídeo",
+    "ar_SA": "فشل FFprobe في تحليل ملف الفيديو",
+    "vi_VN": "FFprobe không thể phân tích tệp video",
+    "fa_IR": "FFprobe نتوانست فایل ویدیو را تجزیه کند",
+    "id_ID": "FFprobe gagal menganalisis file video",
+    "ms_MY": "FFprobe gagal menganalisis fail video",
+    "th_TH": "FFprobe ไม่สามารถวิเคราะห์ไฟล์วิดีโอได้",
+    "ur_PK": "FFprobe ویڈیو فائل کا تجزیہ کرنے میں ناکام",
+}
+
+FOUND_COMPATIBLE_SUBTITLES_EXTRACTING = {
+    "en_US": "Found {count} compatible subtitle(s) in video file. Extracting to: {output_folder}",
+    "es_ES": "Se encontraron {count} subtítulo(s) compatible(s) en el archivo de video. Extrayendo a: {output_folder}",
+    "tr_TR": "Video dosyasında {count} uyumlu altyazı bulundu. Çıkarılıyor: {output_folder}",
+    "zh_CN": "在视频文件中找到 {count} 个兼容的字幕。正在提取到：{output_folder}",
+    "zh_TW": "在影片檔案中找到 {count} 個相容的字幕。正在提取至：{output_folder}",
+    "ru_RU": "Найдено {count} совместимых субтитров в видеофайле. Извлечение в: {output_folder}",
+    "pl_PL": "Znaleziono {count} kompatybilnych napisów w pliku wideo. Wyodrębnianie do: {output_folder}",
+    "uk_UA": "Знайдено {count} сумісних субтитрів у відеофайлі. Витягання в: {output_folder}",
+    "ja_JP": "ビデオファイルで {count} 個の互換性のある字幕を見つけました。抽出先: {output_folder}",
+    "ko_KR": "비디오 파일에서 {count}개의 호환 자막을 찾았습니다. 추출 위치: {output_folder}",
+    "hi_IN": "वीडियो फ़ाइल में {count} संगत सबटाइटल मिले। निकाला जा रहा है: {output_folder}",
+    "bn_BD": "ভিডিও ফাইলে {count}টি সামঞ্জস্যপূর্ণ সাবটাইটেল পাওয়া গেছে। এক্সট্রাক্ট করা হচ্ছে: {output_folder}",
+    "it_IT": "Trovati {count} sottotitoli compatibili nel file video. Estrazione in: {output_folder}",
+    "fr_FR": "Trouvé {count} sous-titre(s) compatible(s) dans le fichier vidéo. Extraction vers : {output_folder}",
+    "de_DE": "{count} kompatible Untertitel in der Videodatei gefunden. Extraktion nach: {output_folder}",
+    "pt_PT": "Encontradas {count} legenda(s) compatível(eis) no arquivo de vídeo. Extraindo para: {output_folder}",
+    "ar_SA": "تم العثور على {count} ترجمة متوافقة في ملف الفيديو. استخراج إلى: {output_folder}",
+    "vi_VN": "Tìm thấy {count} phụ đề tương thích trong tệp video. Đang trích xuất vào: {output_folder}",
+    "fa_IR": "{count} زیرنویس سازگار در فایل ویدیو یافت شد. استخراج به: {output_folder}",
+    "id_ID": "Ditemukan {count} subtitle yang kompatibel dalam file video. Mengekstrak ke: {output_folder}",
+    "ms_MY": "Ditemui {count} sari kata serasi dalam fail video. Mengekstrak ke: {output_folder}",
+    "th_TH": "พบคำบรรยายที่เข้ากันได้ {count} รายการในไฟล์วิดีโอ กำลังแยกไปยัง: {output_folder}",
+    "ur_PK": "ویڈیو فائل میں {count} ہم آہنگ سب ٹائٹل ملے۔ ایکسٹریکٹ کیا جا رہا ہے: {output_folder}",
+}
+
+SUCCESSFULLY_EXTRACTED_SUBTITLE = {
+    "en_US": "Successfully extracted: {filename}",
+    "es_ES": "Extraído exitosamente: {filename}",
+    "tr_TR": "Başarıyla çıkarıldı: {filename}",
+    "zh_CN": "成功提取：{filename}",
+    "zh_TW": "成功提取：{filename}",
+    "ru_RU": "Успешно извлечено: {filename}",
+    "pl_PL": "Pomyślnie wyodrębniono: {filename}",
+    "uk_UA": "Успішно витягнуто: {filename}",
+    "ja_JP": "正常に抽出されました: {filename}",
+    "ko_KR": "성공적으로 추출됨: {filename}",
+    "hi_IN": "सफलतापूर्वक निकाला गया: {filename}",
+    "bn_BD": "সফলভাবে এক্সট্রাক্ট করা হয়েছে: {filename}",
+    "it_IT": "Estratto con successo: {filename}",
+    "fr_FR": "Extrait avec succès : {filename}",
+    "de_DE": "Erfolgreich extrahiert: {filename}",
+    "pt_PT": "Extraído com sucesso: {filename}",
+    "ar_SA": "تم الاستخراج بنجاح: {filename}",
+    "vi_VN": "Trích xuất thành công: {filename}",
+    "fa_IR": "با موفقیت استخراج شد: {filename}",
+    "id_ID": "Berhasil diekstrak: {filename}",
+    "ms_MY": "Berjaya diekstrak: {filename}",
+    "th_TH": "แยกเสร็จสิ้น: {filename}",
+    "ur_PK": "کامیابی سے ایکسٹریکٹ کیا گیا: {filename}",
+}
+
+CHOOSING_BEST_SUBTITLE_MATCH = {
+    "en_US": "Choosing best subtitle match...",
+    "es_ES": "Eligiendo la mejor coincidencia de subtítulos...",
+    "tr_TR": "En iyi altyazı eşleşmesi seçiliyor...",
+    "zh_CN": "正在选择最佳字幕匹配...",
+    "zh_TW": "正在選擇最佳字幕匹配...",
+    "ru_RU": "Выбор лучшего совпадения субтитров...",
+    "pl_PL": "Wybieranie najlepszego dopasowania napisów...",
+    "uk_UA": "Вибір найкращого збігу субтитрів...",
+    "ja_JP": "最適な字幕マッチを選択中...",
+    "ko_KR": "최적의 자막 일치 항목을 선택하는 중...",
+    "hi_IN": "सबसे अच्छा सबटाइटल मैच चुना जा रहा है...",
+    "bn_BD": "সেরা সাবটাইটেল ম্যাচ বেছে নেওয়া হচ্ছে...",
+    "it_IT": "Scegliendo la migliore corrispondenza dei sottotitoli...",
+    "fr_FR": "Sélection de la meilleure correspondance de sous-titres...",
+    "de_DE": "Beste Untertitel-Übereinstimmung wird ausgewählt...",
+    "pt_PT": "Escolhendo a melhor correspondência de legenda...",
+    "ar_SA": "جارٍ اختيار أفضل تطابق للترجمة...",
+    "vi_VN": "Đang chọn phụ đề khớp tốt nhất...",
+    "fa_IR": "در حال انتخاب بهترین تطبیق زیرنویس...",
+    "id_ID": "Memilih kecocokan subtitle terbaik...",
+    "ms_MY": "Memilih padanan sari kata terbaik...",
+    "th_TH": "กำลังเลือกคำบรรยายที่ตรงกันที่สุด...",
+    "ur_PK": "بہترین سب ٹائٹل میچ منتخب کیا جا رہا ہے...",
+}
+
+SUBTITLE_EXTRACTION_FAILED = {
+    "en_US": "Subtitle extraction failed: {error}",
+    "es_ES": "Falló la extracción de subtítulos: {error}",
+    "tr_TR": "Altyazı çıkarma başarısız oldu: {error}",
+    "zh_CN": "字幕提取失败：{error}",
+    "zh_TW": "字幕提取失敗：{error}",
+    "ru_RU": "Ошибка извлечения субтитров: {error}",
+    "pl_PL": "Wyodrębnianie napisów nie powiodło się: {error}",
+    "uk_UA": "Помилка витягання субтитрів: {error}",
+    "ja_JP": "字幕抽出に失敗しました: {error}",
+    "ko_KR": "자막 추출 실패: {error}",
+    "hi_IN": "सबटाइटल एक्सट्रैक्शन विफल रहा: {error}",
+    "bn_BD": "সাবটাইটেল এক্সট্রাকশন ব্যর্থ হয়েছে: {error}",
+    "it_IT": "Estrazione dei sottotitoli non riuscita: {error}",
+    "fr_FR": "Échec de l'extraction des sous-titres : {error}",
+    "de_DE": "Untertitel-Extraktion fehlgeschlagen: {error}",
+    "pt_PT": "Falha na extração de legendas: {error}",
+    "ar_SA": "فشل في استخراج الترجمات: {error}",
+    "vi_VN": "Trích xuất phụ đề thất bại: {error}",
+    "fa_IR": "استخراج زیرنویس ناموفق بود: {error}",
+    "id_ID": "Ekstraksi subtitle gagal: {error}",
+    "ms_MY": "Pengekstrakan sari kata gagal: {error}",
+    "th_TH": "การแยกคำบรรยายล้มเหลว: {error}",
+    "ur_PK": "سب ٹائٹل ایکسٹریکشن ناکام: {error}",
+}
+
+
+############### subtitle_converter.py ###############
+
+
+ERROR_CONVERTING_SUBTITLE = {
+    "en_US": "Error converting subtitle: {error}",
+    "es_ES": "Error al convertir subtítulo: {error}",
+    "tr_TR": "Altyazı dönüştürme hatası: {error}",
+    "zh_CN": "转换字幕时出错：{error}",
+    "zh_TW": "轉換字幕時發生錯誤：{error}",
+    "ru_RU": "Ошибка конвертации субтитров: {error}",
+    "pl_PL": "Błąd konwersji napisów: {error}",
+    "uk_UA": "Помилка конвертації субтитрів: {error}",
+    "ja_JP": "字幕変換エラー: {error}",
+    "ko_KR": "자막 변환 오류: {error}",
+    "hi_IN": "सबटाइटल कन्वर्ट करने में त्रुटि: {error}",
+    "bn_BD": "সাবটাইটেল রূপান্তরে ত্রুটি: {error}",
+    "it_IT": "Errore nella conversione del sottotitolo: {error}",
+    "fr_FR": "Erreur lors de la conversion du sous-titre : {error}",
+    "de_DE": "Fehler bei der Untertitelkonvertierung: {error}",
+    "pt_PT": "Erro ao converter legenda: {error}",
+    "ar_SA": "خطأ في تحويل الترجمة: {error}",
+    "vi_VN": "Lỗi chuyển đổi phụ đề: {error}",
+    "fa_IR": "خطا در تبدیل زیرنویس: {error}",
+    "id_ID": "Kesalahan mengonversi subtitle: {error}",
+    "ms_MY": "Ralat menukar sari kata: {error}",
+    "th_TH": "เกิดข้อผิดพลาดในการแปลงคำบรรยาย: {error}",
+    "ur_PK": "سب ٹائٹل تبدیل کرنے میں خرابی: {error}",
+}
+
+ERROR_PARSING_XML = {
+    "en_US": "Error parsing XML: {error}",
+    "es_ES": "Error al analizar XML: {error}",
+    "tr_TR": "XML ayrıştırma hatası: {error}",
+    "zh_CN": "解析 XML 时出错：{error}",
+    "zh_TW": "解析 XML 時發生錯誤：{error}",
+    "ru_RU": "Ошибка разбора XML: {error}",
+    "pl_PL": "Błąd parsowania XML: {error}",
+    "uk_UA": "Помилка розбору XML: {error}",
+    "ja_JP": "XML解析エラー: {error}",
+    "ko_KR": "XML 파싱 오류: {error}",
+    "hi_IN": "XML पार्स करने में त्रुटि: {error}",
+    "bn_BD": "XML পার্স করতে ত্রুটি: {error}",
+    "it_IT": "Errore nell'analisi XML: {error}",
+    "fr_FR": "Erreur lors de l'analyse XML : {error}",
+    "de_DE": "Fehler beim Parsen von XML: {error}",
+    "pt_PT": "Erro ao analisar XML: {error}",
+    "ar_SA": "خطأ في تحليل XML: {error}",
+    "vi_VN": "Lỗi phân tích XML: {error}",
+    "fa_IR": "خطا در تجزیه XML: {error}",
+    "id_ID": "Kesalahan parsing XML: {error}",
+    "ms_MY": "Ralat menghurai XML: {error}",
+    "th_TH": "เกิดข้อผิดพลาดในการแยกวิเคราะห์ XML: {error}",
+    "ur_PK": "XML پارس کرنے میں خرابی: {error}",
+}
+
+ERROR_READING_FILE = {
+    "en_US": "Error reading file: {error}",
+    "es_ES": "Error al leer el archivo: {error}",
+    "tr_TR": "Dosya okuma hatası: {error}",
+    "zh_CN": "读取文件时出错：{error}",
+    "zh_TW": "讀取檔案時發生錯誤：{error}",
+    "ru_RU": "Ошибка чтения файла: {error}",
+    "pl_PL": "Błąd odczytu pliku: {error}",
+    "uk_UA": "Помилка читання файлу: {error}",
+    "ja_JP": "ファイル読み込みエラー: {error}",
+    "ko_KR": "파일 읽기 오류: {error}",
+    "hi_IN": "फ़ाइल पढ़ने में त्रुटि: {error}",
+    "bn_BD": "ফাইল পড়তে ত্রুটি: {error}",
+    "it_IT": "Errore nella lettura del file: {error}",
+    "fr_FR": "Erreur lors de la lecture du fichier : {error}",
+    "de_DE": "Fehler beim Lesen der Datei: {error}",
+    "pt_PT": "Erro ao ler o arquivo: {error}",
+    "ar_SA": "خطأ في قراءة الملف: {error}",
+    "vi_VN": "Lỗi đọc tệp: {error}",
+    "fa_IR": "خطا در خواندن فایل: {error}",
+    "id_ID": "Kesalahan membaca file: {error}",
+    "ms_MY": "Ralat membaca fail: {error}",
+    "th_TH": "เกิดข้อผิดพลาดในการอ่านไฟล์: {error}",
+    "ur_PK": "فائل پڑھنے میں خرابی: {error}",
+}
+
+NO_VALID_SYNC_BLOCKS_FOUND_SMI = {
+    "en_US": "No valid SYNC blocks found in SMI file",
+    "es_ES": "No se encontraron bloques SYNC válidos en el archivo SMI",
+    "tr_TR": "SMI dosyasında geçerli SYNC blokları bulunamadı",
+    "zh_CN": "在 SMI 文件中未找到有效的 SYNC 块",
+    "zh_TW": "在 SMI 檔案中未找到有效的 SYNC 區塊",
+    "ru_RU": "В файле SMI не найдены действительные блоки SYNC",
+    "pl_PL": "Nie znaleziono prawidłowych bloków SYNC w pliku SMI",
+    "uk_UA": "У файлі SMI не знайдено дійсних блоків SYNC",
+    "ja_JP": "SMI ファイルに有効な SYNC ブロックが見つかりません",
+    "ko_KR": "SMI 파일에서 유효한 SYNC 블록을 찾을 수 없습니다",
+    "hi_IN": "SMI फ़ाइल में कोई वैध SYNC ब्लॉक नहीं मिला",
+    "bn_BD": "SMI ফাইলে কোনো বৈধ SYNC ব্লক পাওয়া যায়নি",
+    "it_IT": "Nessun blocco SYNC valido trovato nel file SMI",
+    "fr_FR": "Aucun bloc SYNC valide trouvé dans le fichier SMI",
+    "de_DE": "Keine gültigen SYNC-Blöcke in der SMI-Datei gefunden",
+    "pt_PT": "Nenhum bloco SYNC válido encontrado no arquivo SMI",
+    "ar_SA": "لم يتم العثور على كتل SYNC صالحة في ملف SMI",
+    "vi_VN": "Không tìm thấy khối SYNC hợp lệ trong tệp SMI",
+    "fa_IR": "هیچ بلاک SYNC معتبری در فایل SMI یافت نشد",
+    "id_ID": "Tidak ditemukan blok SYNC yang valid dalam file SMI",
+    "ms_MY": "Tiada blok SYNC yang sah ditemui dalam fail SMI",
+    "th_TH": "ไม่พบบล็อก SYNC ที่ถูกต้องในไฟล์ SMI",
+    "ur_PK": "SMI فائل میں کوئی درست SYNC بلاک نہیں ملا",
+}
+
+UNSUPPORTED_SUBTITLE_FORMAT_FOR_CONVERSION = {
+    "en_US": "Error: Unsupported subtitle format for conversion: {extension}",
+    "es_ES": "Error: Formato de subtítulos no compatible para conversión: {extension}",
+    "tr_TR": "Hata: Dönüştürme için desteklenmeyen altyazı formatı: {extension}",
+    "zh_CN": "错误：不支持转换的字幕格式：{extension}",
+    "zh_TW": "錯誤：不支援轉換的字幕格式：{extension}",
+    "ru_RU": "Ошибка: Неподдерживаемый формат субтитров для конвертации: {extension}",
+    "pl_PL": "Błąd: Nieobsługiwany format napisów do konwersji: {extension}",
+    "uk_UA": "Помилка: Непідтримуваний формат субтитрів для конвертації: {extension}",
+    "ja_JP": "エラー: 変換に対応していない字幕形式: {extension}",
+    "ko_KR": "오류: 변환에 지원되지 않는 자막 형식: {extension}",
+    "hi_IN": "त्रुटि: रूपांतरण के लिए असमर्थित सबटाइटल प्रारूप: {extension}",
+    "bn_BD": "ত্রুটি: রূপান্তরের জন্য অসমর্থিত সাবটাইটেল ফরম্যাট: {extension}",
+    "it_IT": "Errore: Formato di sottotitoli non supportato per la conversione: {extension}",
+    "fr_FR": "Erreur : Format de sous-titres non pris en charge pour la conversion : {extension}",
+    "de_DE": "Fehler: Nicht unterstütztes Untertitelformat für die Konvertierung: {extension}",
+    "pt_PT": "Erro: Formato de legenda não suportado para conversão: {extension}",
+    "ar_SA": "خطأ: تنسيق ترجمة غير مدعوم للتحويل: {extension}",
+    "vi_VN": "Lỗi: Định dạng phụ đề không được hỗ trợ để chuyển đổi: {extension}",
+    "fa_IR": "خطا: فرمت زیرنویس پشتیبانی نشده برای تبدیل: {extension}",
+    "id_ID": "Kesalahan: Format subtitle tidak didukung untuk konversi: {extension}",
+    "ms_MY": "Ralat: Format sari kata tidak disokong untuk penukaran: {extension}",
+    "th_TH": "ข้อผิดพลาด: รูปแบบคำบรรยายไม่รองรับสำหรับการแปลง: {extension}",
+    "ur_PK": "خرابی: کنورژن کے لیے غیر معاون سب ٹائٹل فارمیٹ: {extension}",
+}
+
+CONVERTING_FORMAT_TO_SRT = {
+    "en_US": "Converting {format} to SRT...",
+    "es_ES": "Convirtiendo {format} a SRT...",
+    "tr_TR": "{format} SRT'ye dönüştürülüyor...",
+    "zh_CN": "正在将 {format} 转换为 SRT...",
+    "zh_TW": "正在將 {format} 轉換為 SRT...",
+    "ru_RU": "Конвертация {format} в SRT...",
+    "pl_PL": "Konwertowanie {format} na SRT...",
+    "uk_UA": "Конвертація {format} в SRT...",
+    "ja_JP": "{format} を SRT に変換中...",
+    "ko_KR": "{format}을(를) SRT로 변환 중...",
+    "hi_IN": "{format} को SRT में कन्वर्ट कर रहे हैं...",
+    "bn_BD": "{format} থেকে SRT এ রূপান্তর করা হচ্ছে...",
+    "it_IT": "Conversione da {format} a SRT...",
+    "fr_FR": "Conversion de {format} vers SRT...",
+    "de_DE": "Konvertierung von {format} zu SRT...",
+    "pt_PT": "Convertendo {format} para SRT...",
+    "ar_SA": "تحويل {format} إلى SRT...",
+    "vi_VN": "Đang chuyển đổi {format} sang SRT...",
+    "fa_IR": "در حال تبدیل {format} به SRT...",
+    "id_ID": "Mengonversi {format} ke SRT...",
+    "ms_MY": "Menukar {format} kepada SRT...",
+    "th_TH": "กำลังแปลง {format} เป็น SRT...",
+    "ur_PK": "{format} کو SRT میں تبدیل کیا جا رہا ہے...",
+}
+
+
+############### utils.py ###############
+
+
+CANNOT_MATCH_ENCODING_FILES_DO_NOT_EXIST = {
+    "en_US": "Cannot match encoding: one or both subtitle files do not exist",
+    "es_ES": "No se puede igualar la codificación: uno o ambos archivos de subtítulos no existen",
+    "tr_TR": "Kodlama eşleştirilemiyor: altyazı dosyalarından biri veya her ikisi mevcut değil",
+    "zh_CN": "无法匹配编码：一个或两个字幕文件不存在",
+    "zh_TW": "無法匹配編碼：一個或兩個字幕檔案不存在",
+    "ru_RU": "Невозможно сопоставить кодировку: один или оба файла субтитров не существуют",
+    "pl_PL": "Nie można dopasować kodowania: jeden lub oba pliki napisów nie istnieją",
+    "uk_UA": "Не вдалося зіставити кодування: один або обидва файли субтитрів не існують",
+    "ja_JP": "エンコーディングを一致できません: 字幕ファイルのいずれかまたは両方が存在しません",
+    "ko_KR": "인코딩을 맞출 수 없습니다: 하나 또는 두 개의 자막 파일이 존재하지 않습니다",
+    "hi_IN": "एन्कोडिंग मेल नहीं खा सकती: एक या दोनों सबटाइटल फ़ाइलें मौजूद नहीं हैं",
+    "bn_BD": "এনকোডিং মেলানো যাচ্ছে না: একটি বা দুটি সাবটাইটেল ফাইল নেই",
+    "it_IT": "Impossibile abbinare la codifica: uno o entrambi i file dei sottotitoli non esistono",
+    "fr_FR": "Impossible de faire correspondre l'encodage : un ou les deux fichiers de sous-titres n'existent pas",
+    "de_DE": "Kodierung kann nicht abgeglichen werden: Eine oder beide Untertiteldateien existieren nicht",
+    "pt_PT": "Não é possível corresponder a codificação: um ou ambos os arquivos de legenda não existem",
+    "ar_SA": "لا يمكن مطابقة الترميز: ملف أو كلا ملفي الترجمة غير موجود",
+    "vi_VN": "Không thể khớp mã hóa: một hoặc cả hai tệp phụ đề không tồn tại",
+    "fa_IR": "امکان تطبیق کدگذاری وجود ندارد: یکی یا هر دو فایل زیرنویس وجود ندارند",
+    "id_ID": "Tidak dapat mencocokkan encoding: satu atau kedua file subtitle tidak ada",
+    "ms_MY": "Tidak dapat memadankan pengekodan: satu atau kedua-dua fail sari kata tiada",
+    "th_TH": "ไม่สามารถจับคู่การเข้ารหัส: ไฟล์คำบรรยายหนึ่งหรือทั้งสองไม่มีอยู่",
+    "ur_PK": "اینکوڈنگ میچ نہیں ہو سکتی: ایک یا دونوں سب ٹائٹل فائلیں موجود نہیں",
+}
+
+FAILED_TO_READ_OUTPUT_WITH_ENCODING = {
+    "en_US": "Failed to read output file with detected encoding {encoding}, trying utf-8",
+    "es_ES": "No se pudo leer el archivo de salida con la codificación detectada {encoding}, intentando utf-8",
+    "tr_TR": "Çıktı dosyası algılanan {encoding} kodlamasıyla okunamadı, utf-8 deneniyor",
+    "zh_CN": "无法使用检测到的编码 {encoding} 读取输出文件，尝试使用 utf-8",
+    "zh_TW": "無法使用偵測到的編碼 {encoding} 讀取輸出檔案，嘗試使用 utf-8",
+    "ru_RU": "Не удалось прочитать выходной файл с определённой кодировкой {encoding}, пробуем utf-8",
+    "pl_PL": "Nie udało się odczytać pliku wyjściowego z wykrytą stroną kodową {encoding}, próba utf-8",
+    "uk_UA": "Не вдалося прочитати вихідний файл з виявленою кодуванням {encoding}, пробуємо utf-8",
+    "ja_JP": "検出されたエンコーディング {encoding} で出力ファイルの読み込みに失敗、utf-8 を試行します",
+    "ko_KR": "감지된 인코딩 {encoding}으로 출력 파일을 읽지 못했습니다. utf-8 시도 중",
+    "hi_IN": "डिटेक्टेड एन्कोडिंग {encoding} के साथ आउटपुट फ़ाइल पढ़ने में विफल, utf-8 आज़माया जा रहा है",
+    "bn_BD": "সনাক্তকৃত এনকোডিং {encoding} দিয়ে আউটপুট ফাইল পড়তে ব্যর্থ, utf-8 চেষ্টা করা হচ্ছে",
+    "it_IT": "Impossibile leggere il file di output con la codifica rilevata {encoding}, si prova utf-8",
+    "fr_FR": "Impossible de lire le fichier de sortie avec l'encodage détecté {encoding}, tentative avec utf-8",
+    "de_DE": "Ausgabedatei konnte mit erkannter Kodierung {encoding} nicht gelesen werden, versuche utf-8",
+    "pt_PT": "Falha ao ler o arquivo de saída com a codificação detectada {encoding}, tentando utf-8",
+    "ar_SA": "فشل في قراءة ملف الإخراج بالترميز المكتشف {encoding}، سيتم تجربة utf-8",
+    "vi_VN": "Không thể đọc tệp đầu ra với mã hóa phát hiện {encoding}, thử utf-8",
+    "fa_IR": "خواندن فایل خروجی با کدگذاری شناسایی‌شده {encoding} ناموفق بود، در حال تلاش با utf-8",
+    "id_ID": "Gagal membaca file output dengan encoding terdeteksi {encoding}, mencoba utf-8",
+    "ms_MY": "Gagal membaca fail output dengan pengekodan dikesan {encoding}, mencuba utf-8",
+    "th_TH": "ไม่สามารถอ่านไฟล์ผลลัพธ์ด้วยรหัสที่ตรวจพบ {encoding} กำลังลอง utf-8",
+    "ur_PK": "ڈیٹیکٹڈ اینکوڈنگ {encoding} کے ساتھ آؤٹ پٹ فائل پڑھنے میں ناکامی، utf-8 آزمایا جا رہا ہے",
+}
+
+CHANGED_OUTPUT_SUBTITLE_ENCODING = {
+    "en_US": "Changed output subtitle encoding from {output_encoding} to {final_encoding}",
+    "es_ES": "Se cambió la codificación de subtítulos de salida de {output_encoding} a {final_encoding}",
+    "tr_TR": "Çıktı altyazı kodlaması {output_encoding}'den {final_encoding}'e değiştirildi",
+    "zh_CN": "已将输出字幕编码从 {output_encoding} 更改为 {final_encoding}",
+    "zh_TW": "已將輸出字幕編碼從 {output_encoding} 更改為 {final_encoding}",
+    "ru_RU": "Кодировка выходных субтитров изменена с {output_encoding} на {final_encoding}",
+    "pl_PL": "Zmieniono kodowanie napisów wyjściowych z {output_encoding} na {final_encoding}",
+    "uk_UA": "Кодування вихідних субтитрів змінено з {output_encoding} на {final_encoding}",
+    "ja_JP": "出力字幕のエンコーディングを {output_encoding} から {final_encoding} に変更しました",
+    "ko_KR": "출력 자막 인코딩이 {output_encoding}에서 {final_encoding}(으)로 변경됨",
+    "hi_IN": "आउटपुट सबटाइटल एन्कोडिंग {output_encoding} से {final_encoding} में बदल दी गई",
+    "bn_BD": "আউটপুট সাবটাইটেল এনকোডিং {output_encoding} থেকে {final_encoding} এ পরিবর্তন করা হয়েছে",
+    "it_IT": "Codifica dei sottotitoli di output cambiata da {output_encoding} a {final_encoding}",
+    "fr_FR": "Encodage des sous-titres de sortie changé de {output_encoding} à {final_encoding}",
+    "de_DE": "Ausgabe-Untertitel-Kodierung von {output_encoding} zu {final_encoding} geändert",
+    "pt_PT": "Codificação da legenda de saída alterada de {output_encoding} para {final_encoding}",
+    "ar_SA": "تم تغيير ترميز الترجمة الناتجة من {output_encoding} إلى {final_encoding}",
+    "vi_VN": "Đã thay đổi mã hóa phụ đề đầu ra từ {output_encoding} sang {final_encoding}",
+    "fa_IR": "کدگذاری زیرنویس خروجی از {output_encoding} به {final_encoding} تغییر یافت",
+    "id_ID": "Pengkodean subtitle output diubah dari {output_encoding} ke {final_encoding}",
+    "ms_MY": "Pengekodan sari kata output ditukar dari {output_encoding} ke {final_encoding}",
+    "th_TH": "เปลี่ยนการเข้ารหัสคำบรรยายผลลัพธ์จาก {output_encoding} เป็น {final_encoding}",
+    "ur_PK": "آؤٹ پٹ سب ٹائٹل اینکوڈنگ {output_encoding} سے {final_encoding} میں تبدیل کر دی گئی",
+}
+
+FAILED_TO_REENCODE_KEEPING_ORIGINAL = {
+    "en_US": "Failed to re-encode to {final_encoding}: {error}. Keeping original encoding.",
+    "es_ES": "No se pudo volver a codificar a {final_encoding}: {error}. Se mantiene la codificación original.",
+    "tr_TR": "{final_encoding} kodlamasına yeniden kodlama başarısız: {error}. Orijinal kodlama korunuyor.",
+    "zh_CN": "重新编码为 {final_encoding} 失败：{error}。保留原始编码。",
+    "zh_TW": "無法重新編碼為 {final_encoding}：{error}。保留原始編碼。",
+    "ru_RU": "Не удалось перекодировать в {final_encoding}: {error}. Оставлена исходная кодировка.",
+    "pl_PL": "Nie udało się ponownie zakodować do {final_encoding}: {error}. Zachowano oryginalne kodowanie.",
+    "uk_UA": "Не вдалося перекодувати у {final_encoding}: {error}. Залишено оригінальне кодування.",
+    "ja_JP": "{final_encoding} への再エンコードに失敗しました: {error}。元のエンコーディングを維持します。",
+    "ko_KR": "{final_encoding}로 다시 인코딩하지 못했습니다: {error}. 원래 인코딩을 유지합니다.",
+    "hi_IN": "{final_encoding} में पुनः एन्कोड करने में विफल: {error}. मूल एन्कोडिंग रखी गई है।",
+    "bn_BD": "{final_encoding} এ পুনরায় এনকোড করতে ব্যর্থ: {error}। মূল এনকোডিং রাখা হয়েছে।",
+    "it_IT": "Impossibile ricodificare in {final_encoding}: {error}. Mantenuta la codifica originale.",
+    "fr_FR": "Échec du ré-encodage en {final_encoding} : {error}. Encodage d'origine conservé.",
+    "de_DE": "Fehler beim erneuten Kodieren zu {final_encoding}: {error}. Ursprüngliche Kodierung beibehalten.",
+    "pt_PT": "Falha ao recodificar para {final_encoding}: {error}. Mantendo a codificação original.",
+    "ar_SA": "فشل في إعادة الترميز إلى {final_encoding}: {error}. سيتم الاحتفاظ بالترميز الأصلي.",
+    "vi_VN": "Không thể mã hóa lại sang {final_encoding}: {error}. Giữ nguyên mã hóa gốc.",
+    "fa_IR": "تبدیل مجدد به {final_encoding} ناموفق بود: {error}. کدگذاری اصلی حفظ شد.",
+    "id_ID": "Gagal mengenkode ulang ke {final_encoding}: {error}. Tetap menggunakan encoding asli.",
+    "ms_MY": "Gagal mengekod semula kepada {final_encoding}: {error}. Mengekalkan pengekodan asal.",
+    "th_TH": "ไม่สามารถเข้ารหัสใหม่เป็น {final_encoding}: {error} จะคงการเข้ารหัสเดิมไว้",
+    "ur_PK": "{final_encoding} میں دوبارہ اینکوڈ کرنے میں ناکامی: {error}. اصل اینکوڈنگ برقرار رکھی گئی ہے۔",
+}
+
+ERROR_MATCHING_SUBTITLE_ENCODING = {
+    "en_US": "Error matching subtitle encoding: {error}",
+    "es_ES": "Error al igualar la codificación de subtítulos: {error}",
+    "tr_TR": "Altyazı kodlaması eşleştirilirken hata: {error}",
+    "zh_CN": "匹配字幕编码时出错：{error}",
+    "zh_TW": "匹配字幕編碼時發生錯誤：{error}",
+    "ru_RU": "Ошибка сопоставления кодировки субтитров: {error}",
+    "pl_PL": "Błąd dopasowania kodowania napisów: {error}",
+    "uk_UA": "Помилка зіставлення кодування субтитрів: {error}",
+    "ja_JP": "字幕エンコーディングの一致エラー: {error}",
+    "ko_KR": "자막 인코딩 일치 오류: {error}",
+    "hi_IN": "सबटाइटल एन्कोडिंग मिलाने में त्रुटि: {error}",
+    "bn_BD": "সাবটাইটেল এনকোডিং মেলাতে ত্রুটি: {error}",
+    "it_IT": "Errore nell'abbinamento della codifica dei sottotitoli: {error}",
+    "fr_FR": "Erreur lors de la correspondance de l'encodage des sous-titres : {error}",
+    "de_DE": "Fehler beim Abgleichen der Untertitelkodierung: {error}",
+    "pt_PT": "Erro ao corresponder a codificação da legenda: {error}",
+    "ar_SA": "خطأ في مطابقة ترميز الترجمة: {error}",
+    "vi_VN": "Lỗi khi khớp mã hóa phụ đề: {error}",
+    "fa_IR": "خطا در تطبیق کدگذاری زیرنویس: {error}",
+    "id_ID": "Kesalahan mencocokkan encoding subtitle: {error}",
+    "ms_MY": "Ralat memadankan pengekodan sari kata: {error}",
+    "th_TH": "เกิดข้อผิดพลาดในการจับคู่การเข้ารหัสคำบรรยาย: {error}",
+    "ur_PK": "سب ٹائٹل اینکوڈنگ میچ کرنے میں خرابی: {error}",
+}
+
+OPEN_FOLDER_ERROR_TITLE = {
+    "en_US": "Open Folder Error",
+    "es_ES": "Error al abrir carpeta",
+    "tr_TR": "Klasör Açma Hatası",
+    "zh_CN": "打开文件夹错误",
+    "zh_TW": "開啟資料夾錯誤",
+    "ru_RU": "Ошибка открытия папки",
+    "pl_PL": "Błąd otwierania folderu",
+    "uk_UA": "Помилка відкриття папки",
+    "ja_JP": "フォルダーを開くエラー",
+    "ko_KR": "폴더 열기 오류",
+    "hi_IN": "फ़ोल्डर खोलने में त्रुटि",
+    "bn_BD": "ফোল্ডার খোলার ত্রুটি",
+    "it_IT": "Errore apertura cartella",
+    "fr_FR": "Erreur d'ouverture du dossier",
+    "de_DE": "Fehler beim Öffnen des Ordners",
+    "pt_PT": "Erro ao abrir pasta",
+    "ar_SA": "خطأ في فتح المجلد",
+    "vi_VN": "Lỗi mở thư mục",
+    "fa_IR": "خطا در باز کردن پوشه",
+    "id_ID": "Kesalahan membuka folder",
+    "ms_MY": "Ralat membuka folder",
+    "th_TH": "ข้อผิดพลาดในการเปิดโฟลเดอร์",
+    "ur_PK": "فولڈر کھولنے میں خرابی",
+}
+
+COULD_NOT_OPEN_FOLDER = {
+    "en_US": "Could not open folder:\n{error}",
+    "es_ES": "No se pudo abrir la carpeta:\n{error}",
+    "tr_TR": "Klasör açılamadı:\n{error}",
+    "zh_CN": "无法打开文件夹：\n{error}",
+    "zh_TW": "無法開啟資料夾：\n{error}",
+    "ru_RU": "Не удалось открыть папку:\n{error}",
+    "pl_PL": "Nie można otworzyć folderu:\n{error}",
+    "uk_UA": "Не вдалося відкрити папку:\n{error}",
+    "ja_JP": "フォルダーを開けませんでした:\n{error}",
+    "ko_KR": "폴더를 열 수 없습니다:\n{error}",
+    "hi_IN": "फ़ोल्डर नहीं खोल सका:\n{error}",
+    "bn_BD": "ফোল্ডার খোলা যায়নি:\n{error}",
+    "it_IT": "Impossibile aprire la cartella:\n{error}",
+    "fr_FR": "Impossible d'ouvrir le dossier :\n{error}",
+    "de_DE": "Ordner konnte nicht geöffnet werden:\n{error}",
+    "pt_PT": "Não foi possível abrir a pasta:\n{error}",
+    "ar_SA": "تعذر فتح المجلد:\n{error}",
+    "vi_VN": "Không thể mở thư mục:\n{error}",
+    "fa_IR": "امکان باز کردن پوشه وجود ندارد:\n{error}",
+    "id_ID": "Tidak dapat membuka folder:\n{error}",
+    "ms_MY": "Tidak dapat membuka folder:\n{error}",
+    "th_TH": "ไม่สามารถเปิดโฟลเดอร์ได้:\n{error}",
+    "ur_PK": "فولڈر نہیں کھولا جا سکا:\n{error}",
+}
+
+RESET_SETTINGS_TITLE = {
+    "en_US": "Reset Settings",
+    "es_ES": "Restablecer configuración",
+    "tr_TR": "Ayarları Sıfırla",
+    "zh_CN": "重置设置",
+    "zh_TW": "重置設定",
+    "ru_RU": "Сбросить настройки",
+    "pl_PL": "Resetuj ustawienia",
+    "uk_UA": "Скинути налаштування",
+    "ja_JP": "設定をリセット",
+    "ko_KR": "설정 재설정",
+    "hi_IN": "सेटिंग्स रीसेट करें",
+    "bn_BD": "সেটিংস রিসেট করুন",
+    "it_IT": "Reimposta impostazioni",
+    "fr_FR": "Réinitialiser les paramètres",
+    "de_DE": "Einstellungen zurücksetzen",
+    "pt_PT": "Redefinir configurações",
+    "ar_SA": "إعادة تعيين الإعدادات",
+    "vi_VN": "Đặt lại cài đặt",
+    "fa_IR": "بازنشانی تنظیمات",
+    "id_ID": "Setel ulang pengaturan",
+    "ms_MY": "Tetapkan semula tetapan",
+    "th_TH": "รีเซ็ตการตั้งค่า",
+    "ur_PK": "سیٹنگز ری سیٹ کریں",
+}
+
+RESET_SETTINGS_CONFIRMATION = {
+    "en_US": "Are you sure you want to reset settings to default? This will restart the application and remove your current settings.",
+    "es_ES": "¿Está seguro de que desea restablecer la configuración a los valores predeterminados? Esto reiniciará la aplicación y eliminará su configuración actual.",
+    "tr_TR": "Ayarları varsayılana sıfırlamak istediğinizden emin misiniz? Bu, uygulamayı yeniden başlatacak ve mevcut ayarlarınızı kaldıracaktır.",
+    "zh_CN": "您确定要将设置重置为默认值吗？这将重启应用程序并移除您当前的设置。",
+    "zh_TW": "您確定要將設定重置為預設值嗎？這將重新啟動應用程式並移除您目前的設定。",
+    "ru_RU": "Вы уверены, что хотите сбросить настройки по умолчанию? Это перезапустит приложение и удалит ваши текущие настройки.",
+    "pl_PL": "Czy na pewno chcesz zresetować ustawienia do domyślnych? Spowoduje to ponowne uruchomienie aplikacji i usunięcie bieżących ustawień.",
+    "uk_UA": "Ви впевнені, що хочете скинути налаштування до стандартних? Це перезапустить програму та видалить ваші поточні налаштування.",
+    "ja_JP": "設定をデフォルトにリセットしてもよろしいですか？アプリケーションが再起動され、現在の設定が削除されます。",
+    "ko_KR": "설정을 기본값으로 재설정하시겠습니까? 이 작업은 애플리케이션을 다시 시작하고 현재 설정을 제거합니다.",
+    "hi_IN": "क्या आप वाकई सेटिंग्स को डिफ़ॉल्ट पर रीसेट करना चाहते हैं? इससे एप्लिकेशन पुनः आरंभ होगा और आपकी वर्तमान सेटिंग्स हटा दी जाएंगी।",
+    "bn_BD": "আপনি কি নিশ্চিত যে আপনি সেটিংস ডিফল্টে রিসেট করতে চান? এটি অ্যাপ্লিকেশনটি পুনরায় চালু করবে এবং আপনার বর্তমান সেটিংস মুছে দেবে।",
+    "it_IT": "Sei sicuro di voler reimpostare le impostazioni ai valori predefiniti? Questo riavvierà l'applicazione e rimuoverà le impostazioni correnti.",
+    "fr_FR": "Êtes-vous sûr de vouloir réinitialiser les paramètres par défaut ? Cela redémarrera l'application et supprimera vos paramètres actuels.",
+    "de_DE": "Möchten Sie die Einstellungen wirklich auf die Standardwerte zurücksetzen? Dadurch wird die Anwendung neu gestartet und Ihre aktuellen Einstellungen werden entfernt.",
+    "pt_PT": "Tem certeza de que deseja redefinir as configurações para o padrão? Isso irá reiniciar o aplicativo e remover suas configurações atuais.",
+    "ar_SA": "هل أنت متأكد أنك تريد إعادة تعيين الإعدادات إلى الوضع الافتراضي؟ سيؤدي ذلك إلى إعادة تشغيل التطبيق وإزالة إعداداتك الحالية.",
+    "vi_VN": "Bạn có chắc chắn muốn đặt lại cài đặt về mặc định không? Thao tác này sẽ khởi động lại ứng dụng và xóa các cài đặt hiện tại của bạn.",
+    "fa_IR": "آیا مطمئن هستید که می‌خواهید تنظیمات را به حالت پیش‌فرض بازنشانی کنید؟ این کار برنامه را مجدداً راه‌اندازی کرده و تنظیمات فعلی شما را حذف می‌کند.",
+    "id_ID": "Anda yakin ingin mengatur ulang pengaturan ke default? Ini akan memulai ulang aplikasi dan menghapus pengaturan Anda saat ini.",
+    "ms_MY": "Adakah anda pasti mahu tetapkan semula tetapan kepada lalai? Ini akan memulakan semula aplikasi dan membuang tetapan semasa anda.",
+    "th_TH": "คุณแน่ใจหรือไม่ว่าต้องการรีเซ็ตการตั้งค่าเป็นค่าเริ่มต้น? การดำเนินการนี้จะรีสตาร์ทแอปพลิเคชันและลบการตั้งค่าปัจจุบันของคุณ",
+    "ur_PK": "کیا آپ واقعی سیٹنگز کو ڈیفالٹ پر ری سیٹ کرنا چاہتے ہیں؟ اس سے ایپلیکیشن دوبارہ شروع ہوگی اور آپ کی موجودہ سیٹنگز ہٹا دی جائیں گی۔",
+}
+
+FAILED_TO_RESET_SETTINGS = {
+    "en_US": "Failed to reset settings: {error}",
+    "es_ES": "No se pudo restablecer la configuración: {error}",
+    "tr_TR": "Ayarlar sıfırlanamadı: {error}",
+    "zh_CN": "重置设置失败：{error}",
+    "zh_TW": "重置設定失敗：{error}",
+    "ru_RU": "Не удалось сбросить настройки: {error}",
+    "pl_PL": "Nie udało się zresetować ustawień: {error}",
+    "uk_UA": "Не вдалося скинути налаштування: {error}",
+    "ja_JP": "設定のリセットに失敗しました: {error}",
+    "ko_KR": "설정 재설정 실패: {error}",
+    "hi_IN": "सेटिंग्स रीसेट करने में विफल: {error}",
+    "bn_BD": "সেটিংস রিসেট করতে ব্যর্থ: {error}",
+    "it_IT": "Impossibile reimpostare le impostazioni: {error}",
+    "fr_FR": "Échec de la réinitialisation des paramètres : {error}",
+    "de_DE": "Zurücksetzen der Einstellungen fehlgeschlagen: {error}",
+    "pt_PT": "Falha ao redefinir configurações: {error}",
+    "ar_SA": "فشل في إعادة تعيين الإعدادات: {error}",
+    "vi_VN": "Không thể đặt lại cài đặt: {error}",
+    "fa_IR": "بازنشانی تنظیمات ناموفق بود: {error}",
+    "id_ID": "Gagal mengatur ulang pengaturan: {error}",
+    "ms_MY": "Gagal menetapkan semula tetapan: {error}",
+    "th_TH": "ไม่สามารถรีเซ็ตการตั้งค่าได้: {error}",
+    "ur_PK": "سیٹنگز ری سیٹ کرنے میں ناکامی: {error}",
+}
+
+COULD_NOT_OPEN_CONFIG_LOCATION = {
+    "en_US": "Could not open config location:\n{error}",
+    "es_ES": "No se pudo abrir la ubicación de configuración:\n{error}",
+    "tr_TR": "Ayarlar konumu açılamadı:\n{error}",
+    "zh_CN": "无法打开配置位置：\n{error}",
+    "zh_TW": "無法開啟配置位置：\n{error}",
+    "ru_RU": "Не удалось открыть расположение конфигурации:\n{error}",
+    "pl_PL": "Nie można otworzyć lokalizacji konfiguracji:\n{error}",
+    "uk_UA": "Не вдалося відкрити місце збереження конфігурації:\n{error}",
+    "ja_JP": "設定の場所を開けませんでした:\n{error}",
+    "ko_KR": "설정 위치를 열 수 없습니다:\n{error}",
+    "hi_IN": "कॉन्फ़िग स्थान नहीं खोल सका:\n{error}",
+    "bn_BD": "কনফিগারেশন অবস্থান খোলা যায়নি:\n{error}",
+    "it_IT": "Impossibile aprire la posizione della configurazione:\n{error}",
+    "fr_FR": "Impossible d'ouvrir l'emplacement de la configuration :\n{error}",
+    "de_DE": "Konfigurationsort konnte nicht geöffnet werden:\n{error}",
+    "pt_PT": "Não foi possível abrir o local da configuração:\n{error}",
+    "ar_SA": "تعذر فتح موقع الإعدادات:\n{error}",
+    "vi_VN": "Không thể mở vị trí cấu hình:\n{error}",
+    "fa_IR": "امکان باز کردن محل پیکربندی وجود ندارد:\n{error}",
+    "id_ID": "Tidak dapat membuka lokasi konfigurasi:\n{error}",
+    "ms_MY": "Tidak dapat membuka lokasi konfigurasi:\n{error}",
+    "th_TH": "ไม่สามารถเปิดตำแหน่งการกำหนดค่าได้:\n{error}",
+    "ur_PK": "کنفیگ لوکیشن نہیں کھولی جا سکی:\n{error}",
+}
+
+LOGS_DIRECTORY_TITLE = {
+    "en_US": "Logs Directory",
+    "es_ES": "Directorio de registros",
+    "tr_TR": "Günlükler Dizini",
+    "zh_CN": "日志目录",
+    "zh_TW": "日誌目錄",
+    "ru_RU": "Каталог журналов",
+    "pl_PL": "Katalog logów",
+    "uk_UA": "Каталог журналів",
+    "ja_JP": "ログディレクトリ",
+    "ko_KR": "로그 디렉터리",
+    "hi_IN": "लॉग्स डायरेक्टरी",
+    "bn_BD": "লগ ডিরেক্টরি",
+    "it_IT": "Directory dei log",
+    "fr_FR": "Répertoire des journaux",
+    "de_DE": "Protokollverzeichnis",
+    "pt_PT": "Diretório de logs",
+    "ar_SA": "دليل السجلات",
+    "vi_VN": "Thư mục nhật ký",
+    "fa_IR": "دایرکتوری لاگ‌ها",
+    "id_ID": "Direktori log",
+    "ms_MY": "Direktori log",
+    "th_TH": "ไดเรกทอรีล็อก",
+    "ur_PK": "لاگز ڈائریکٹری",
+}
+
+LOGS_DIRECTORY_EMPTY = {
+    "en_US": "Logs directory is empty.",
+    "es_ES": "El directorio de registros está vacío.",
+    "tr_TR": "Günlükler dizini boş.",
+    "zh_CN": "日志目录为空。",
+    "zh_TW": "日誌目錄為空。",
+    "ru_RU": "Каталог журналов пуст.",
+    "pl_PL": "Katalog logów jest pusty.",
+    "uk_UA": "Каталог журналів порожній.",
+    "ja_JP": "ログディレクトリは空です。",
+    "ko_KR": "로그 디렉터리가 비어 있습니다.",
+    "hi_IN": "लॉग्स डायरेक्टरी खाली है।",
+    "bn_BD": "লগ ডিরেক্টরি খালি।",
+    "it_IT": "La directory dei log è vuota.",
+    "fr_FR": "Le répertoire des journaux est vide.",
+    "de_DE": "Das Protokollverzeichnis ist leer.",
+    "pt_PT": "O diretório de logs está vazio.",
+    "ar_SA": "دليل السجلات فارغ.",
+    "vi_VN": "Thư mục nhật ký trống.",
+    "fa_IR": "دایرکتوری لاگ‌ها خالی است.",
+    "id_ID": "Direktori log kosong.",
+    "ms_MY": "Direktori log kosong.",
+    "th_TH": "ไดเรกทอรีล็อกว่างเปล่า",
+    "ur_PK": "لاگز ڈائریکٹری خالی ہے۔",
+}
+
+DELETE_LOGS_DIRECTORY_TITLE = {
+    "en_US": "Delete logs directory",
+    "es_ES": "Eliminar directorio de registros",
+    "tr_TR": "Günlükler dizinini sil",
+    "zh_CN": "删除日志目录",
+    "zh_TW": "刪除日誌目錄",
+    "ru_RU": "Удалить каталог журналов",
+    "pl_PL": "Usuń katalog logów",
+    "uk_UA": "Видалити каталог журналів",
+    "ja_JP": "ログディレクトリを削除",
+    "ko_KR": "로그 디렉터리 삭제",
+    "hi_IN": "लॉग्स डायरेक्टरी हटाएं",
+    "bn_BD": "লগ ডিরেক্টরি মুছুন",
+    "it_IT": "Elimina directory dei log",
+    "fr_FR": "Supprimer le répertoire des journaux",
+    "de_DE": "Protokollverzeichnis löschen",
+    "pt_PT": "Excluir diretório de logs",
+    "ar_SA": "حذف دليل السجلات",
+    "vi_VN": "Xóa thư mục nhật ký",
+    "fa_IR": "حذف دایرکتوری لاگ‌ها",
+    "id_ID": "Hapus direktori log",
+    "ms_MY": "Padam direktori log",
+    "th_TH": "ลบไดเรกทอรีล็อก",
+    "ur_PK": "لاگز ڈائریکٹری حذف کریں",
+}
+
+DELETE_LOGS_DIRECTORY_CONFIRMATION = {
+    "en_US": "Are you sure you want to delete logs directory with {total_files} files?",
+    "es_ES": "¿Está seguro de que desea eliminar el directorio de registros con {total_files} archivos?",
+    "tr_TR": "{total_files} dosya içeren günlükler dizinini silmek istediğinizden emin misiniz?",
+    "zh_CN": "您确定要删除包含 {total_files} 个文件的日志目录吗？",
+    "zh_TW": "您確定要刪除包含 {total_files} 個檔案的日誌目錄嗎？",
+    "ru_RU": "Вы уверены, что хотите удалить каталог журналов с {total_files} файлами?",
+    "pl_PL": "Czy na pewno chcesz usunąć katalog logów zawierający {total_files} plików?",
+    "uk_UA": "Ви впевнені, що хочете видалити каталог журналів з {total_files} файлами?",
+    "ja_JP": "{total_files} 個のファイルがあるログディレクトリを削除してもよろしいですか？",
+    "ko_KR": "{total_files}개의 파일이 있는 로그 디렉터리를 삭제하시겠습니까?",
+    "hi_IN": "क्या आप वाकई {total_files} फ़ाइलों वाली लॉग्स डायरेक्टरी हटाना चाहते हैं?",
+    "bn_BD": "আপনি কি নিশ্চিত যে আপনি {total_files} ফাইলসহ লগ ডিরেক্টরি মুছে ফেলতে চান?",
+    "it_IT": "Sei sicuro di voler eliminare la directory dei log con {total_files} file?",
+    "fr_FR": "Êtes-vous sûr de vouloir supprimer le répertoire des journaux contenant {total_files} fichiers ?",
+    "de_DE": "Möchten Sie das Protokollverzeichnis mit {total_files} Dateien wirklich löschen?",
+    "pt_PT": "Tem certeza de que deseja excluir o diretório de logs com {total_files} arquivos?",
+    "ar_SA": "هل أنت متأكد أنك تريد حذف دليل السجلات الذي يحتوي على {total_files} ملف؟",
+    "vi_VN": "Bạn có chắc chắn muốn xóa thư mục nhật ký với {total_files} tệp không?",
+    "fa_IR": "آیا مطمئن هستید که می‌خواهید دایرکتوری لاگ‌ها با {total_files} فایل را حذف کنید؟",
+    "id_ID": "Anda yakin ingin menghapus direktori log dengan {total_files} file?",
+    "ms_MY": "Adakah anda pasti mahu padam direktori log dengan {total_files} fail?",
+    "th_TH": "คุณแน่ใจหรือไม่ว่าต้องการลบไดเรกทอรีล็อกที่มี {total_files} ไฟล์?",
+    "ur_PK": "کیا آپ واقعی {total_files} فائلوں کے ساتھ لاگز ڈائریکٹری حذف کرنا چاہتے ہیں؟",
+}
+
+LOGS_DIRECTORY_CLEARED_TITLE = {
+    "en_US": "Logs Directory Cleared",
+    "es_ES": "Directorio de registros eliminado",
+    "tr_TR": "Günlükler Dizini Temizlendi",
+    "zh_CN": "日志目录已清除",
+    "zh_TW": "日誌目錄已清除",
+    "ru_RU": "Каталог журналов очищен",
+    "pl_PL": "Katalog logów wyczyszczony",
+    "uk_UA": "Каталог журналів очищено",
+    "ja_JP": "ログディレクトリがクリアされました",
+    "ko_KR": "로그 디렉터리가 삭제되었습니다",
+    "hi_IN": "लॉग्स डायरेक्टरी साफ़ कर दी गई",
+    "bn_BD": "লগ ডিরেক্টরি সফলভাবে মুছে ফেলা হয়েছে",
+    "it_IT": "Directory dei log eliminata",
+    "fr_FR": "Répertoire des journaux effacé",
+    "de_DE": "Protokollverzeichnis gelöscht",
+    "pt_PT": "Diretório de logs limpo",
+    "ar_SA": "تم مسح دليل السجلات",
+    "vi_VN": "Thư mục nhật ký đã được xóa",
+    "fa_IR": "دایرکتوری لاگ‌ها پاک شد",
+    "id_ID": "Direktori log telah dihapus",
+    "ms_MY": "Direktori log telah dipadam",
+    "th_TH": "ไดเรกทอรีล็อกถูกล้างแล้ว",
+    "ur_PK": "لاگز ڈائریکٹری صاف کر دی گئی",
+}
+
+LOGS_DIRECTORY_CLEARED = {
+    "en_US": "Logs directory has been successfully deleted.",
+    "es_ES": "El directorio de registros se ha eliminado correctamente.",
+    "tr_TR": "Günlükler dizini başarıyla silindi.",
+    "zh_CN": "日志目录已成功删除。",
+    "zh_TW": "日誌目錄已成功刪除。",
+    "ru_RU": "Каталог журналов успешно удалён.",
+    "pl_PL": "Katalog logów został pomyślnie usunięty.",
+    "uk_UA": "Каталог журналів успішно видалено.",
+    "ja_JP": "ログディレクトリが正常に削除されました。",
+    "ko_KR": "로그 디렉터리가 성공적으로 삭제되었습니다.",
+    "hi_IN": "लॉग्स डायरेक्टरी सफलतापूर्वक हटा दी गई है।",
+    "bn_BD": "লগ ডিরেক্টরি সফলভাবে মুছে ফেলা হয়েছে।",
+    "it_IT": "La directory dei log è stata eliminata con successo.",
+    "fr_FR": "Le répertoire des journaux a été supprimé avec succès.",
+    "de_DE": "Das Protokollverzeichnis wurde erfolgreich gelöscht.",
+    "pt_PT": "O diretório de logs foi excluído com sucesso.",
+    "ar_SA": "تم حذف دليل السجلات بنجاح.",
+    "vi_VN": "Thư mục nhật ký đã được xóa thành công.",
+    "fa_IR": "دایرکتوری لاگ‌ها با موفقیت حذف شد.",
+    "id_ID": "Direktori log berhasil dihapus.",
+    "ms_MY": "Direktori log berjaya dipadam.",
+    "th_TH": "ไดเรกทอรีล็อกถูกลบเรียบร้อยแล้ว",
+    "ur_PK": "لاگز ڈائریکٹری کامیابی سے حذف کر دی گئی ہے۔",
+}
+
+FAILED_TO_CLEAR_LOGS_DIRECTORY = {
+    "en_US": "Failed to clear logs directory: {error}",
+    "es_ES": "No se pudo limpiar el directorio de registros: {error}",
+    "tr_TR": "Günlükler dizini temizlenemedi: {error}",
+    "zh_CN": "清除日志目录失败：{error}",
+    "zh_TW": "清除日誌目錄失敗：{error}",
+    "ru_RU": "Не удалось очистить каталог журналов: {error}",
+    "pl_PL": "Nie udało się wyczyścić katalogu logów: {error}",
+    "uk_UA": "Не вдалося очистити каталог журналів: {error}",
+    "ja_JP": "ログディレクトリのクリアに失敗しました: {error}",
+    "ko_KR": "로그 디렉터리 삭제 실패: {error}",
+    "hi_IN": "लॉग्स डायरेक्टरी साफ़ करने में विफल: {error}",
+    "bn_BD": "লগ ডিরেক্টরি পরিষ্কার করতে ব্যর্থ: {error}",
+    "it_IT": "Impossibile cancellare la directory dei log: {error}",
+    "fr_FR": "Échec du nettoyage du répertoire des journaux : {error}",
+    "de_DE": "Protokollverzeichnis konnte nicht gelöscht werden: {error}",
+    "pt_PT": "Falha ao limpar o diretório de logs: {error}",
+    "ar_SA": "فشل في مسح دليل السجلات: {error}",
+    "vi_VN": "Không thể xóa thư mục nhật ký: {error}",
+    "fa_IR": "پاک‌سازی دایرکتوری لاگ‌ها ناموفق بود: {error}",
+    "id_ID": "Gagal menghapus direktori log: {error}",
+    "ms_MY": "Gagal memadam direktori log: {error}",
+    "th_TH": "ไม่สามารถล้างไดเรกทอรีล็อกได้: {error}",
+    "ur_PK": "لاگز ڈائریکٹری صاف کرنے میں ناکامی: {error}",
+}
+
+ABOUT_PROGRAM_TITLE = {
+    "en_US": "About {program_name}",
+    "es_ES": "Acerca de {program_name}",
+    "tr_TR": "{program_name} Hakkında",
+    "zh_CN": "关于 {program_name}",
+    "zh_TW": "關於 {program_name}",
+    "ru_RU": "О программе {program_name}",
+    "pl_PL": "O programie {program_name}",
+    "uk_UA": "Про {program_name}",
+    "ja_JP": "{program_name} について",
+    "ko_KR": "{program_name} 정보",
+    "hi_IN": "{program_name} के बारे में",
+    "bn_BD": "{program_name} সম্পর্কে",
+    "it_IT": "Informazioni su {program_name}",
+    "fr_FR": "À propos de {program_name}",
+    "de_DE": "Über {program_name}",
+    "pt_PT": "Sobre {program_name}",
+    "ar_SA": "حول {program_name}",
+    "vi_VN": "Giới thiệu về {program_name}",
+    "fa_IR": "درباره {program_name}",
+    "id_ID": "Tentang {program_name}",
+    "ms_MY": "Perihal {program_name}",
+    "th_TH": "เกี่ยวกับ {program_name}",
+    "ur_PK": "{program_name} کے بارے میں",
+}
+
+VISIT_GITHUB_PAGE = {
+    "en_US": "Visit the GitHub page for updates, documentation, and to report issues.",
+    "es_ES": "Visite la página de GitHub para actualizaciones, documentación y para reportar problemas.",
+    "tr_TR": "Güncellemeler, belgeler ve sorun bildirimi için GitHub sayfasını ziyaret edin.",
+    "zh_CN": "访问 GitHub 页面获取更新、文档和报告问题。",
+    "zh_TW": "訪問 GitHub 頁面獲取更新、文件和回報問題。",
+    "ru_RU": "Посетите страницу GitHub для обновлений, документации и сообщения о проблемах.",
+    "pl_PL": "Odwiedź stronę GitHub, aby uzyskać aktualizacje, dokumentację i zgłosić problemy.",
+    "uk_UA": "Відвідайте сторінку GitHub для оновлень, документації та повідомлення про проблеми.",
+    "ja_JP": "アップデート、ドキュメント、問題の報告については GitHub ページをご覧ください。",
+    "ko_KR": "업데이트, 문서화 및 문제 보고를 위해 GitHub 페이지를 방문하세요.",
+    "hi_IN": "अपडेट, दस्तावेज़ीकरण और समस्याओं की रिपोर्ट के लिए GitHub पेज पर जाएँ।",
+    "bn_BD": "আপডেট, ডকুমেন্টেশন এবং সমস্যা রিপোর্ট করার জন্য GitHub পেজ দেখুন।",
+    "it_IT": "Visita la pagina GitHub per aggiornamenti, documentazione e per segnalare problemi.",
+    "fr_FR": "Visitez la page GitHub pour les mises à jour, la documentation et signaler des problèmes.",
+    "de_DE": "Besuchen Sie die GitHub-Seite für Updates, Dokumentation und zur Fehlermeldung.",
+    "pt_PT": "Visite a página do GitHub para atualizações, documentação e para relatar problemas.",
+    "ar_SA": "زر صفحة GitHub للحصول على التحديثات والوثائق والإبلاغ عن المشاكل.",
+    "vi_VN": "Truy cập trang GitHub để cập nhật, tài liệu và báo cáo sự cố.",
+    "fa_IR": "برای به‌روزرسانی، مستندات و گزارش مشکلات به صفحه GitHub مراجعه کنید.",
+    "id_ID": "Kunjungi halaman GitHub untuk pembaruan, dokumentasi, dan melaporkan masalah.",
+    "ms_MY": "Lawati halaman GitHub untuk kemas kini, dokumentasi dan melaporkan isu.",
+    "th_TH": "เยี่ยมชมหน้า GitHub สำหรับการอัปเดต เอกสาร และการรายงานปัญหา",
+    "ur_PK": "اپڈیٹس، دستاویزات اور مسائل کی رپورٹ کے لیے GitHub صفحہ ملاحظہ کریں۔",
+}
+
+VISIT_GITHUB_PAGE_BUTTON = {
+    "en_US": "Visit GitHub Page",
+    "es_ES": "Visitar página de GitHub",
+    "tr_TR": "GitHub Sayfasını Ziyaret Et",
+    "zh_CN": "访问 GitHub 页面",
+    "zh_TW": "訪問 GitHub 頁面",
+    "ru_RU": "Посетить страницу GitHub",
+    "pl_PL": "Odwiedź stronę GitHub",
+    "uk_UA": "Відвідати сторінку GitHub",
+    "ja_JP": "GitHub ページを訪問",
+    "ko_KR": "GitHub 페이지 방문",
+    "hi_IN": "GitHub पेज पर जाएँ",
+    "bn_BD": "GitHub পেজ দেখুন",
+    "it_IT": "Visita pagina GitHub",
+    "fr_FR": "Visiter la page GitHub",
+    "de_DE": "GitHub-Seite besuchen",
+    "pt_PT": "Visitar página do GitHub",
+    "ar_SA": "زيارة صفحة GitHub",
+    "vi_VN": "Truy cập trang GitHub",
+    "fa_IR": "بازدید از صفحه GitHub",
+    "id_ID": "Kunjungi halaman GitHub",
+    "ms_MY": "Lawati halaman GitHub",
+    "th_TH": "เยี่ยมชมหน้า GitHub",
+    "ur_PK": "GitHub صفحہ ملاحظہ کریں",
+}
+
+CHECK_FOR_UPDATES_BUTTON = {
+    "en_US": "Check for updates",
+    "es_ES": "Buscar actualizaciones",
+    "tr_TR": "Güncellemeleri kontrol et",
+    "zh_CN": "检查更新",
+    "zh_TW": "檢查更新",
+    "ru_RU": "Проверить обновления",
+    "pl_PL": "Sprawdź aktualizacje",
+    "uk_UA": "Перевірити оновлення",
+    "ja_JP": "アップデートを確認",
+    "ko_KR": "업데이트 확인",
+    "hi_IN": "अपडेट की जांच करें",
+    "bn_BD": "আপডেট চেক করুন",
+    "it_IT": "Controlla aggiornamenti",
+    "fr_FR": "Vérifier les mises à jour",
+    "de_DE": "Nach Updates suchen",
+    "pt_PT": "Verificar atualizações",
+    "ar_SA": "التحقق من التحديثات",
+    "vi_VN": "Kiểm tra cập nhật",
+    "fa_IR": "بررسی به‌روزرسانی",
+    "id_ID": "Periksa pembaruan",
+    "ms_MY": "Semak kemas kini",
+    "th_TH": "ตรวจสอบการอัปเดต",
+    "ur_PK": "اپڈیٹس چیک کریں",
+}
+
+CLOSE_BUTTON = {
+    "en_US": "Close",
+    "es_ES": "Cerrar",
+    "tr_TR": "Kapat",
+    "zh_CN": "关闭",
+    "zh_TW": "關閉",
+    "ru_RU": "Закрыть",
+    "pl_PL": "Zamknij",
+    "uk_UA": "Закрити",
+    "ja_JP": "閉じる",
+    "ko_KR": "닫기",
+    "hi_IN": "बंद करें",
+    "bn_BD": "বন্ধ করুন",
+    "it_IT": "Chiudi",
+    "fr_FR": "Fermer",
+    "de_DE": "Schließen",
+    "pt_PT": "Fechar",
+    "ar_SA": "إغلاق",
+    "vi_VN": "Đóng",
+    "fa_IR": "بستن",
+    "id_ID": "Tutup",
+    "ms_MY": "Tutup",
+    "th_TH": "ปิด",
+    "ur_PK": "بند کریں",
+}
+
+MODULE_LABEL = {
+    "en_US": "Module",
+    "es_ES": "Módulo",
+    "tr_TR": "Modül",
+    "zh_CN": "模块",
+    "zh_TW": "模組",
+    "ru_RU": "Модуль",
+    "pl_PL": "Moduł",
+    "uk_UA": "Модуль",
+    "ja_JP": "モジュール",
+    "ko_KR": "모듈",
+    "hi_IN": "मॉड्यूल",
+    "bn_BD": "মডিউল",
+    "it_IT": "Modulo",
+    "fr_FR": "Module",
+    "de_DE": "Modul",
+    "pt_PT": "Módulo",
+    "ar_SA": "وحدة",
+    "vi_VN": "Mô-đun",
+    "fa_IR": "ماژول",
+    "id_ID": "Modul",
+    "ms_MY": "Modul",
+    "th_TH": "โมดูล",
+    "ur_PK": "ماڈیول",
+}
+
+EXECUTABLE_LABEL = {
+    "en_US": "Executable",
+    "es_ES": "Ejecutable",
+    "tr_TR": "Çalıştırılabilir",
+    "zh_CN": "可执行文件",
+    "zh_TW": "執行檔",
+    "ru_RU": "Исполняемый файл",
+    "pl_PL": "Plik wykonywalny",
+    "uk_UA": "Виконуваний файл",
+    "ja_JP": "実行可能ファイル",
+    "ko_KR": "실행 파일",
+    "hi_IN": "निष्पादन योग्य",
+    "bn_BD": "এক্সিকিউটেবল",
+    "it_IT": "Eseguibile",
+    "fr_FR": "Exécutable",
+    "de_DE": "Ausführbare Datei",
+    "pt_PT": "Executável",
+    "ar_SA": "ملف قابل للتنفيذ",
+    "vi_VN": "Tệp thực thi",
+    "fa_IR": "فایل اجرایی",
+    "id_ID": "File yang dapat dieksekusi",
+    "ms_MY": "Fail boleh laksana",
+    "th_TH": "ไฟล์ปฏิบัติการ",
+    "ur_PK": "قابل عمل فائل",
+}
+
+TYPE_LABEL = {
+    "en_US": "Type:",
+    "es_ES": "Tipo:",
+    "tr_TR": "Tür:",
+    "zh_CN": "类型：",
+    "zh_TW": "類型：",
+    "ru_RU": "Тип:",
+    "pl_PL": "Typ:",
+    "uk_UA": "Тип:",
+    "ja_JP": "タイプ:",
+    "ko_KR": "유형:",
+    "hi_IN": "प्रकार:",
+    "bn_BD": "ধরন:",
+    "it_IT": "Tipo:",
+    "fr_FR": "Type :",
+    "de_DE": "Typ:",
+    "pt_PT": "Tipo:",
+    "ar_SA": "النوع:",
+    "vi_VN": "Loại:",
+    "fa_IR": "نوع:",
+    "id_ID": "Tipe:",
+    "ms_MY": "Jenis:",
+    "th_TH": "ประเภท:",
+    "ur_PK": "قسم:",
+}
+
+COMMAND_STRUCTURE_LABEL = {
+    "en_US": "Command structure:",
+    "es_ES": "Estructura de comando:",
+    "tr_TR": "Komut yapısı:",
+    "zh_CN": "命令结构：",
+    "zh_TW": "命令結構：",
+    "ru_RU": "Структура команды:",
+    "pl_PL": "Struktura polecenia:",
+    "uk_UA": "Структура команди:",
+    "ja_JP": "コマンド構造:",
+    "ko_KR": "명령 구조:",
+    "hi_IN": "कमांड संरचना:",
+    "bn_BD": "কমান্ড কাঠামো:",
+    "it_IT": "Struttura comando:",
+    "fr_FR": "Structure de commande :",
+    "de_DE": "Befehlsstruktur:",
+    "pt_PT": "Estrutura do comando:",
+    "ar_SA": "هيكل الأمر:",
+    "vi_VN": "Cấu trúc lệnh:",
+    "fa_IR": "ساختار دستور:",
+    "id_ID": "Struktur perintah:",
+    "ms_MY": "Struktur arahan:",
+    "th_TH": "โครงสร้างคำสั่ง:",
+    "ur_PK": "کمانڈ کی ساخت:",
+}
+
+SUPPORTED_FORMATS_LABEL = {
+    "en_US": "Supported formats:",
+    "es_ES": "Formatos compatibles:",
+    "tr_TR": "Desteklenen formatlar:",
+    "zh_CN": "支持的格式：",
+    "zh_TW": "支援的格式：",
+    "ru_RU": "Поддерживаемые форматы:",
+    "pl_PL": "Obsługiwane formaty:",
+    "uk_UA": "Підтримувані формати:",
+    "ja_JP": "サポート形式:",
+    "ko_KR": "지원 형식:",
+    "hi_IN": "समर्थित प्रारूप:",
+    "bn_BD": "সমর্থিত ফরম্যাট:",
+    "it_IT": "Formati supportati:",
+    "fr_FR": "Formats pris en charge :",
+    "de_DE": "Unterstützte Formate:",
+    "pt_PT": "Formatos suportados:",
+    "ar_SA": "التنسيقات المدعومة:",
+    "vi_VN": "Định dạng được hỗ trợ:",
+    "fa_IR": "فرمت‌های پشتیبانی شده:",
+    "id_ID": "Format yang didukung:",
+    "ms_MY": "Format yang disokong:",
+    "th_TH": "รูปแบบที่รองรับ:",
+    "ur_PK": "معاون شدہ فارمیٹس:",
+}
+
+SUPPORTS_SUBTITLE_REFERENCE_LABEL = {
+    "en_US": "Supports subtitle as reference:",
+    "es_ES": "Soporta subtítulo como referencia:",
+    "tr_TR": "Referans olarak altyazıları destekler:",
+    "zh_CN": "支持字幕作为参考：",
+    "zh_TW": "支援字幕作為參考：",
+    "ru_RU": "Поддерживает субтитры как эталон:",
+    "pl_PL": "Obsługuje napisy jako odniesienie:",
+    "uk_UA": "Підтримує субтитри як еталон:",
+    "ja_JP": "字幕を参照として対応:",
+    "ko_KR": "자막을 참조로 지원:",
+    "hi_IN": "संदर्भ के रूप में सबटाइटल का समर्थन:",
+    "bn_BD": "রেফারেন্স হিসেবে সাবটাইটেল সমর্থন:",
+    "it_IT": "Supporta sottotitoli come riferimento:",
+    "fr_FR": "Prend en charge les sous-titres comme référence :",
+    "de_DE": "Unterstützt Untertitel als Referenz:",
+    "pt_PT": "Suporta legenda como referência:",
+    "ar_SA": "يدعم الترجمة كمرجع:",
+    "vi_VN": "Hỗ trợ phụ đề làm tham chiếu:",
+    "fa_IR": "پشتیبانی از زیرنویس به‌عنوان مرجع:",
+    "id_ID": "Mendukung subtitle sebagai referensi:",
+    "ms_MY": "Menyokong sari kata sebagai rujukan:",
+    "th_TH": "รองรับคำบรรยายเป็นข้อมูลอ้างอิง:",
+    "ur_PK": "ریفرنس کے طور پر سب ٹائٹل کی حمایت:",
+}
+
+YES_LABEL = {
+    "en_US": "Yes",
+    "es_ES": "Sí",
+    "tr_TR": "Evet",
+    "zh_CN": "是",
+    "zh_TW": "是",
+    "ru_RU": "Да",
+    "pl_PL": "Tak",
+    "uk_UA": "Так",
+    "ja_JP": "はい",
+    "ko_KR": "예",
+    "hi_IN": "हाँ",
+    "bn_BD": "হ্যাঁ",
+    "it_IT": "Sì",
+    "fr_FR": "Oui",
+    "de_DE": "Ja",
+    "pt_PT": "Sim",
+    "ar_SA": "نعم",
+    "vi_VN": "Có",
+    "fa_IR": "بله",
+    "id_ID": "Ya",
+    "ms_MY": "Ya",
+    "th_TH": "ใช่",
+    "ur_PK": "ہاں",
+}
+
+NO_LABEL = {
+    "en_US": "No",
+    "es_ES": "No",
+    "tr_TR": "Hayır",
+    "zh_CN": "否",
+    "zh_TW": "否",
+    "ru_RU": "Нет",
+    "pl_PL": "Nie",
+    "uk_UA": "Ні",
+    "ja_JP": "いいえ",
+    "ko_KR": "아니요",
+    "hi_IN": "नहीं",
+    "bn_BD": "না",
+    "it_IT": "No",
+    "fr_FR": "Non",
+    "de_DE": "Nein",
+    "pt_PT": "Não",
+    "ar_SA": "لا",
+    "vi_VN": "Không",
+    "fa_IR": "خیر",
+    "id_ID": "Tidak",
+    "ms_MY": "Tidak",
+    "th_TH": "ไม่",
+    "ur_PK": "نہیں",
+}
+
+DOCUMENTATION_BUTTON = {
+    "en_US": "Documentation",
+    "es_ES": "Documentación",
+    "tr_TR": "Dokümantasyon",
+    "zh_CN": "文档",
+    "zh_TW": "文件",
+    "ru_RU": "Документация",
+    "pl_PL": "Dokumentacja",
+    "uk_UA": "Документація",
+    "ja_JP": "ドキュメント",
+    "ko_KR": "문서",
+    "hi_IN": "दस्तावेज़ीकरण",
+    "bn_BD": "ডকুমেন্টেশন",
+    "it_IT": "Documentazione",
+    "fr_FR": "Documentation",
+    "de_DE": "Dokumentation",
+    "pt_PT": "Documentação",
+    "ar_SA": "التوثيق",
+    "vi_VN": "Tài liệu",
+    "fa_IR": "مستندات",
+    "id_ID": "Dokumentasi",
+    "ms_MY": "Dokumentasi",
+    "th_TH": "เอกสาร",
+    "ur_PK": "دستاویزات",
+}
+
+UPDATE_AVAILABLE_TITLE = {
+    "en_US": "Update Available",
+    "es_ES": "Actualización disponible",
+    "tr_TR": "Güncelleme Mevcut",
+    "zh_CN": "有可用更新",
+    "zh_TW": "有可用更新",
+    "ru_RU": "Доступно обновление",
+    "pl_PL": "Dostępna aktualizacja",
+    "uk_UA": "Доступне оновлення",
+    "ja_JP": "アップデート利用可能",
+    "ko_KR": "업데이트 사용 가능",
+    "hi_IN": "अपडेट उपलब्ध है",
+    "bn_BD": "আপডেট উপলব্ধ",
+    "it_IT": "Aggiornamento disponibile",
+    "fr_FR": "Mise à jour disponible",
+    "de_DE": "Update verfügbar",
+    "pt_PT": "Atualização disponível",
+    "ar_SA": "تحديث متاح",
+    "vi_VN": "Có bản cập nhật",
+    "fa_IR": "به‌روزرسانی موجود است",
+    "id_ID": "Pembaruan tersedia",
+    "ms_MY": "Kemas kini tersedia",
+    "th_TH": "มีการอัปเดต",
+    "ur_PK": "اپڈیٹ دستیاب ہے",
+}
+
+NEW_VERSION_AVAILABLE = {
+    "en_US": "A new version of {program_name} is available! ({local_version} → {remote_version})",
+    "es_ES": "¡Una nueva versión de {program_name} está disponible! ({local_version} → {remote_version})",
+    "tr_TR": "{program_name} için yeni bir sürüm mevcut! ({local_version} → {remote_version})",
+    "zh_CN": "{program_name} 有新版本可用！({local_version} → {remote_version})",
+    "zh_TW": "{program_name} 有新版本可用！({local_version} → {remote_version})",
+    "ru_RU": "Доступна новая версия {program_name}! ({local_version} → {remote_version})",
+    "pl_PL": "Dostępna jest nowa wersja {program_name}! ({local_version} → {remote_version})",
+    "uk_UA": "Доступна нова версія {program_name}! ({local_version} → {remote_version})",
+    "ja_JP": "{program_name} の新しいバージョンが利用可能です！({local_version} → {remote_version})",
+    "ko_KR": "{program_name}의 새 버전이 사용 가능합니다! ({local_version} → {remote_version})",
+    "hi_IN": "{program_name} का नया संस्करण उपलब्ध है! ({local_version} → {remote_version})",
+    "bn_BD": "{program_name} এর নতুন সংস্করণ উপলব্ধ! ({local_version} → {remote_version})",
+    "it_IT": "È disponibile una nuova versione di {program_name}! ({local_version} → {remote_version})",
+    "fr_FR": "Une nouvelle version de {program_name} est disponible ! ({local_version} → {remote_version})",
+    "de_DE": "Eine neue Version von {program_name} ist verfügbar! ({local_version} → {remote_version})",
+    "pt_PT": "Uma nova versão do {program_name} está disponível! ({local_version} → {remote_version})",
+    "ar_SA": "إصدار جديد من {program_name} متاح! ({local_version} → {remote_version})",
+    "vi_VN": "Có phiên bản mới của {program_name}! ({local_version} → {remote_version})",
+    "fa_IR": "نسخه جدید {program_name} موجود است! ({local_version} → {remote_version})",
+    "id_ID": "Versi baru {program_name} tersedia! ({local_version} → {remote_version})",
+    "ms_MY": "Versi baharu {program_name} tersedia! ({local_version} → {remote_version})",
+    "th_TH": "มี {program_name} เวอร์ชันใหม่! ({local_version} → {remote_version})",
+    "ur_PK": "{program_name} کا نیا ورژن دستیاب ہے! ({local_version} → {remote_version})",
+}
+
+VISIT_GITHUB_DOWNLOAD_LATEST = {
+    "en_US": "Please visit the GitHub page and download the latest version. Would you like to open the GitHub releases page?",
+    "es_ES": "Por favor visite la página de GitHub y descargue la última versión. ¿Le gustaría abrir la página de lanzamientos de GitHub?",
+    "tr_TR": "Lütfen GitHub sayfasını ziyaret edin ve en son sürümü indirin. GitHub sürümler sayfasını açmak ister misiniz?",
+    "zh_CN": "请访问 GitHub 页面并下载最新版本。您想要打开 GitHub 发布页面吗？",
+    "zh_TW": "請訪問 GitHub 頁面並下載最新版本。您想要打開 GitHub 發佈頁面嗎？",
+    "ru_RU": "Пожалуйста, посетите страницу GitHub и загрузите последнюю версию. Хотите открыть страницу релизов GitHub?",
+    "pl_PL": "Proszę odwiedzić stronę GitHub i pobrać najnowszą wersję. Czy chcesz otworzyć stronę wydań GitHub?",
+    "uk_UA": "Будь ласка, відвідайте сторінку GitHub і завантажте останню версію. Бажаєте відкрити сторінку релізів GitHub?",
+    "ja_JP": "GitHub ページにアクセスして最新バージョンをダウンロードしてください。GitHub のリリースページを開きますか？",
+    "ko_KR": "GitHub 페이지를 방문하여 최신 버전을 다운로드하세요. GitHub 릴리스 페이지를 여시겠습니까?",
+    "hi_IN": "कृपया GitHub पेज पर जाएँ और नवीनतम संस्करण डाउनलोड करें। क्या आप GitHub रिलीज़ पेज खोलना चाहते हैं?",
+    "bn_BD": "অনুগ্রহ করে GitHub পেজ দেখুন এবং সর্বশেষ সংস্করণ ডাউনলোড করুন। আপনি কি GitHub রিলিজ পেজ খুলতে চান?",
+    "it_IT": "Si prega di visitare la pagina GitHub e scaricare la versione più recente. Vuoi aprire la pagina delle release di GitHub?",
+    "fr_FR": "Veuillez visiter la page GitHub et télécharger la dernière version. Voulez-vous ouvrir la page des versions GitHub ?",
+    "de_DE": "Bitte besuchen Sie die GitHub-Seite und laden Sie die neueste Version herunter. Möchten Sie die GitHub-Releases-Seite öffnen?",
+    "pt_PT": "Por favor, visite a página do GitHub e baixe a versão mais recente. Gostaria de abrir a página de lançamentos do GitHub?",
+    "ar_SA": "يرجى زيارة صفحة GitHub وتنزيل أحدث إصدار. هل تريد فتح صفحة إصدارات GitHub؟",
+    "vi_VN": "Vui lòng truy cập trang GitHub và tải xuống phiên bản mới nhất. Bạn có muốn mở trang phát hành GitHub không?",
+    "fa_IR": "لطفاً از صفحه GitHub بازدید کنید و آخرین نسخه را دانلود کنید. آیا می‌خواهید صفحه انتشارات GitHub را باز کنید؟",
+    "id_ID": "Silakan kunjungi halaman GitHub dan unduh versi terbaru. Apakah Anda ingin membuka halaman rilis GitHub?",
+    "ms_MY": "Sila lawati halaman GitHub dan muat turun versi terkini. Adakah anda mahu membuka halaman keluaran GitHub?",
+    "th_TH": "โปรดเยี่ยมชมหน้า GitHub และดาวน์โหลดเวอร์ชันล่าสุด คุณต้องการเปิดหน้าการเผยแพร่ GitHub หรือไม่?",
+    "ur_PK": "براہ کرم GitHub صفحہ ملاحظہ کریں اور تازہ ترین ورژن ڈاؤن لوڈ کریں۔ کیا آپ GitHub ریلیز صفحہ کھولنا چاہتے ہیں؟",
+}
+
+UP_TO_DATE_TITLE = {
+    "en_US": "Up to Date",
+    "es_ES": "Actualizado",
+    "tr_TR": "Güncel",
+    "zh_CN": "已是最新版本",
+    "zh_TW": "已是最新版本",
+    "ru_RU": "Актуальная версия",
+    "pl_PL": "Aktualna wersja",
+    "uk_UA": "Актуальна версія",
+    "ja_JP": "最新版です",
+    "ko_KR": "최신 버전",
+    "hi_IN": "अप टू डेट",
+    "bn_BD": "আপ টু ডেট",
+    "it_IT": "Aggiornato",
+    "fr_FR": "À jour",
+    "de_DE": "Aktuell",
+    "pt_PT": "Atualizado",
+    "ar_SA": "محدث",
+    "vi_VN": "Đã cập nhật",
+    "fa_IR": "به‌روز",
+    "id_ID": "Terbaru",
+    "ms_MY": "Terkini",
+    "th_TH": "เป็นเวอร์ชันล่าสุด",
+    "ur_PK": "اپ ٹو ڈیٹ",
+}
+
+RUNNING_LATEST_VERSION = {
+    "en_US": "You are using the latest version ({version}) of {program_name}.",
+    "es_ES": "Está utilizando la última versión ({version}) de {program_name}.",
+    "tr_TR": "{program_name} uygulamasının en son sürümünü ({version}) kullanıyorsunuz.",
+    "zh_CN": "您正在使用 {program_name} 的最新版本（{version}）。",
+    "zh_TW": "您正在使用 {program_name} 的最新版本 ({version})。",
+    "ru_RU": "Вы используете последнюю версию ({version}) программы {program_name}.",
+    "pl_PL": "Używasz najnowszej wersji ({version}) programu {program_name}.",
+    "uk_UA": "Ви використовуєте останню версію ({version}) програми {program_name}.",
+    "ja_JP": "{program_name} の最新バージョン（{version}）を使用しています。",
+    "ko_KR": "{program_name}의 최신 버전({version})을 사용 중입니다.",
+    "hi_IN": "आप {program_name} का नवीनतम संस्करण ({version}) उपयोग कर रहे हैं।",
+    "bn_BD": "আপনি {program_name} এর সর্বশেষ সংস্করণ ({version}) ব্যবহার করছেন।",
+    "it_IT": "Stai utilizzando l'ultima versione ({version}) di {program_name}.",
+    "fr_FR": "Vous utilisez la dernière version ({version}) de {program_name}.",
+    "de_DE": "Sie verwenden die neueste Version ({version}) von {program_name}.",
+    "pt_PT": "Está a usar a versão mais recente ({version}) de {program_name}.",
+    "ar_SA": "أنت تستخدم أحدث إصدار ({version}) من {program_name}.",
+    "vi_VN": "Bạn đang sử dụng phiên bản mới nhất ({version}) của {program_name}.",
+    "fa_IR": "شما در حال استفاده از آخرین نسخه ({version}) از {program_name} هستید.",
+    "id_ID": "Anda menggunakan versi terbaru ({version}) dari {program_name}.",
+    "ms_MY": "Anda menggunakan versi terkini ({version}) bagi {program_name}.",
+    "th_TH": "คุณกำลังใช้ {program_name} เวอร์ชันล่าสุด ({version})",
+    "ur_PK": "آپ {program_name} کا تازہ ترین ورژن ({version}) استعمال کر رہے ہیں۔",
+}
+
+UPDATE_CHECK_FAILED_TITLE = {
+    "en_US": "Update Check Failed",
+    "es_ES": "Falló la verificación de actualización",
+    "tr_TR": "Güncelleme Kontrolü Başarısız",
+    "zh_CN": "更新检查失败",
+    "zh_TW": "更新檢查失敗",
+    "ru_RU": "Ошибка проверки обновлений",
+    "pl_PL": "Sprawdzenie aktualizacji nie powiodło się",
+    "uk_UA": "Помилка перевірки оновлень",
+    "ja_JP": "アップデート確認に失敗",
+    "ko_KR": "업데이트 확인 실패",
+    "hi_IN": "अपडेट जांच विफल",
+    "bn_BD": "আপডেট চেক ব্যর্থ",
+    "it_IT": "Controllo aggiornamenti fallito",
+    "fr_FR": "Vérification de mise à jour échouée",
+    "de_DE": "Update-Prüfung fehlgeschlagen",
+    "pt_PT": "Verificação de atualização falhou",
+    "ar_SA": "فشل في فحص التحديث",
+    "vi_VN": "Kiểm tra cập nhật thất bại",
+    "fa_IR": "بررسی به‌روزرسانی ناموفق",
+    "id_ID": "Pemeriksaan pembaruan gagal",
+    "ms_MY": "Semakan kemas kini gagal",
+    "th_TH": "การตรวจสอบการอัปเดตล้มเหลว",
+    "ur_PK": "اپڈیٹ چیک ناکام",
+}
+
+COULD_NOT_CHECK_FOR_UPDATES = {
+    "en_US": "Could not check for updates:\n{error_message}",
+    "es_ES": "No se pudo verificar actualizaciones:\n{error_message}",
+    "tr_TR": "Güncellemeler kontrol edilemedi:\n{error_message}",
+    "zh_CN": "无法检查更新：\n{error_message}",
+    "zh_TW": "無法檢查更新：\n{error_message}",
+    "ru_RU": "Не удалось проверить обновления:\n{error_message}",
+    "pl_PL": "Nie można sprawdzić aktualizacji:\n{error_message}",
+    "uk_UA": "Не вдалося перевірити оновлення:\n{error_message}",
+    "ja_JP": "アップデートを確認できませんでした:\n{error_message}",
+    "ko_KR": "업데이트를 확인할 수 없습니다:\n{error_message}",
+    "hi_IN": "अपडेट की जांच नहीं कर सका:\n{error_message}",
+    "bn_BD": "আপডেট চেক করা যায়নি:\n{error_message}",
+    "it_IT": "Impossibile controllare gli aggiornamenti:\n{error_message}",
+    "fr_FR": "Impossible de vérifier les mises à jour :\n{error_message}",
+    "de_DE": "Updates konnten nicht überprüft werden:\n{error_message}",
+    "pt_PT": "Não foi possível verificar atualizações:\n{error_message}",
+    "ar_SA": "تعذر فحص التحديثات:\n{error_message}",
+    "vi_VN": "Không thể kiểm tra cập nhật:\n{error_message}",
+    "fa_IR": "امکان بررسی به‌روزرسانی وجود ندارد:\n{error_message}",
+    "id_ID": "Tidak dapat memeriksa pembaruan:\n{error_message}",
+    "ms_MY": "Tidak dapat menyemak kemas kini:\n{error_message}",
+    "th_TH": "ไม่สามารถตรวจสอบการอัปเดตได้:\n{error_message}",
+    "ur_PK": "اپڈیٹس چیک نہیں کر سکے:\n{error_message}",
+}
+
+SELECTED_FOLDER = {
+    "en_US": 'Selected folder: <span style="color:{color}">{folder_path}</span>',
+    "es_ES": 'Carpeta seleccionada: <span style="color:{color}">{folder_path}</span>',
+    "tr_TR": 'Seçilen klasör: <span style="color:{color}">{folder_path}</span>',
+    "zh_CN": '选定文件夹：<span style="color:{color}">{folder_path}</span>',
+    "zh_TW": '選定資料夾：<span style="color:{color}">{folder_path}</span>',
+    "ru_RU": 'Выбранная папка: <span style="color:{color}">{folder_path}</span>',
+    "pl_PL": 'Wybrana folder: <span style="color:{color}">{folder_path}</span>',
+    "uk_UA": 'Вибрана папка: <span style="color:{color}">{folder_path}</span>',
+    "ja_JP": '選択されたフォルダー: <span style="color:{color}">{folder_path}</span>',
+    "ko_KR": '선택된 폴더: <span style="color:{color}">{folder_path}</span>',
+    "hi_IN": 'चयनित फ़ोल्डर: <span style="color:{color}">{folder_path}</span>',
+    "bn_BD": 'নির্বাচিত ফোল্ডার: <span style="color:{color}">{folder_path}</span>',
+    "it_IT": 'Cartella selezionata: <span style="color:{color}">{folder_path}</span>',
+    "fr_FR": 'Dossier sélectionné : <span style="color:{color}">{folder_path}</span>',
+    "de_DE": 'Ausgewählter Ordner: <span style="color:{color}">{folder_path}</span>',
+    "pt_PT": 'Pasta selecionada: <span style="color:{color}">{folder_path}</span>',
+    "ar_SA": 'المجلد المحدد: <span style="color:{color}">{folder_path}</span>',
+    "vi_VN": 'Thư mục đã chọn: <span style="color:{color}">{folder_path}</span>',
+    "fa_IR": 'پوشه انتخاب شده: <span style="color:{color}">{folder_path}</span>',
+    "id_ID": 'Folder yang dipilih: <span style="color:{color}">{folder_path}</span>',
+    "ms_MY": 'Folder yang dipilih: <span style="color:{color}">{folder_path}</span>',
+    "th_TH": 'โฟลเดอร์ที่เลือก: <span style="color:{color}">{folder_path}</span>',
+    "ur_PK": 'منتخب کردہ فولڈر: <span style="color:{color}">{folder_path}</span>',
+}
+
+SELECT_DESTINATION_FOLDER = {
+    "en_US": "Select Destination Folder",
+    "es_ES": "Seleccionar carpeta de destino",
+    "tr_TR": "Hedef Klasörü Seç",
+    "zh_CN": "选择目标文件夹",
+    "zh_TW": "選擇目標資料夾",
+    "ru_RU": "Выберите папку назначения",
+    "pl_PL": "Wybierz folder docelowy",
+    "uk_UA": "Виберіть папку призначення",
+    "ja_JP": "保存先フォルダーを選択",
+    "ko_KR": "대상 폴더 선택",
+    "hi_IN": "गंतव्य फ़ोल्डर चुनें",
+    "bn_BD": "গন্তব্য ফোল্ডার নির্বাচন করুন",
+    "it_IT": "Seleziona cartella di destinazione",
+    "fr_FR": "Sélectionner le dossier de destination",
+    "de_DE": "Zielordner auswählen",
+    "pt_PT": "Selecionar pasta de destino",
+    "ar_SA": "اختر مجلد الوجهة",
+    "vi_VN": "Chọn thư mục đích",
+    "fa_IR": "انتخاب پوشه مقصد",
+    "id_ID": "Pilih folder tujuan",
+    "ms_MY": "Pilih folder destinasi",
+    "th_TH": "เลือกโฟลเดอร์ปลายทาง",
+    "ur_PK": "منزل کا فولڈر منتخب کریں",
+}
+
+############### Smart Deduplication ###############
+
+SKIP_PREVIOUSLY_PROCESSED_VIDEOS = {
+    "en_US": "Skip previously processed videos",
+    "es_ES": "Omitir videos ya procesados",
+    "tr_TR": "Daha önce işlenmiş videoları atla",
+    "zh_CN": "跳过之前处理过的视频",
+    "zh_TW": "跳過先前已處理的影片",
+    "ru_RU": "Пропускать ранее обработанные видео",
+    "pl_PL": "Pomiń wcześniej przetworzone filmy",
+    "uk_UA": "Пропускати раніше оброблені відео",
+    "ja_JP": "処理済みの動画をスキップ",
+    "ko_KR": "이전에 처리된 동영상 건너뛰기",
+    "hi_IN": "पहले से संसाधित वीडियो छोड़ें",
+    "bn_BD": "আগে প্রসেস করা ভিডিও এড়িয়ে যান",
+    "it_IT": "Salta i video già elaborati",
+    "fr_FR": "Ignorer les vidéos déjà traitées",
+    "de_DE": "Bereits verarbeitete Videos überspringen",
+    "pt_PT": "Pular vídeos já processados",
+    "ar_SA": "تخطي مقاطع الفيديو المعالجة سابقًا",
+    "vi_VN": "Bỏ qua các video đã xử lý trước đó",
+    "fa_IR": "نادیده گرفتن ویدیوهای پردازش شده قبلی",
+    "id_ID": "Lewati video yang sudah diproses sebelumnya",
+    "ms_MY": "Langkau video yang telah diproses sebelumnya",
+    "th_TH": "ข้ามวิดีโอที่ประมวลผลไปแล้ว",
+    "ur_PK": "پہلے سے پراسیس شدہ ویڈیوز کو چھوڑ دیں",
+}
+
+FORCE_PROCESS_SELECTED_VIDEOS = {
+    "en_US": "Force process selected video(s)",
+    "es_ES": "Forzar procesamiento de video(s) seleccionado(s)",
+    "tr_TR": "Seçili video(lar)ı zorla işle",
+    "zh_CN": "强制处理所选视频",
+    "zh_TW": "強制處理所選影片",
+    "ru_RU": "Принудительно обработать выбранные видео",
+    "pl_PL": "Wymuś przetworzenie wybranych filmów",
+    "uk_UA": "Примусово обробити вибрані відео",
+    "ja_JP": "選択した動画を強制処理",
+    "ko_KR": "선택한 동영상 강제 처리",
+    "hi_IN": "चयनित वीडियो का जबरन प्रसंस्करण करें",
+    "bn_BD": "নির্বাচিত ভিডিও(গুলি) জোর করে প্রসেস করুন",
+    "it_IT": "Forza l'elaborazione dei video selezionati",
+    "fr_FR": "Forcer le traitement des vidéos sélectionnées",
+    "de_DE": "Ausgewählte Videos erzwingen verarbeiten",
+    "pt_PT": "Forçar processamento dos vídeos selecionados",
+    "ar_SA": "فرض معالجة مقاطع الفيديو المحددة",
+    "vi_VN": "Buộc xử lý các video đã chọn",
+    "fa_IR": "پردازش اجباری ویدیوهای انتخاب شده",
+    "id_ID": "Paksa proses video yang dipilih",
+    "ms_MY": "Paksa proses video yang dipilih",
+    "th_TH": "บังคับประมวลผลวิดีโอที่เลือก",
+    "ur_PK": "منتخب ویڈیو(ز) کو زبردستی پراسیس کریں",
+}
+
+SKIP_PROCESS_SELECTED_VIDEOS = {
+    "en_US": "Skip processing selected video(s)",
+    "es_ES": "Omitir procesamiento de video(s) seleccionado(s)",
+    "tr_TR": "Seçili video(lar)ı işlemeyi atla",
+    "zh_CN": "跳过处理所选视频",
+    "zh_TW": "跳過處理所選影片",
+    "ru_RU": "Пропустить обработку выбранных видео",
+    "pl_PL": "Pomiń przetwarzanie wybranych filmów",
+    "uk_UA": "Пропустити обробку вибраних відео",
+    "ja_JP": "選択した動画の処理をスキップ",
+    "ko_KR": "선택한 동영상 처리 건너뛰기",
+    "hi_IN": "चयनित वीडियो का प्रसंस्करण छोड़ें",
+    "bn_BD": "নির্বাচিত ভিডিও(গুলি) প্রসেস করা বাদ দিন",
+    "it_IT": "Salta l'elaborazione dei video selezionati",
+    "fr_FR": "Ignorer le traitement des vidéos sélectionnées",
+    "de_DE": "Verarbeitung der ausgewählten Videos überspringen",
+    "pt_PT": "Ignorar processamento dos vídeos selecionados",
+    "ar_SA": "تخطي معالجة مقاطع الفيديو المحددة",
+    "vi_VN": "Bỏ qua xử lý các video đã chọn",
+    "fa_IR": "رد شدن از پردازش ویدیوهای انتخاب شده",
+    "id_ID": "Lewati proses video yang dipilih",
+    "ms_MY": "Langkau pemprosesan video yang dipilih",
+    "th_TH": "ข้ามการประมวลผลวิดีโอที่เลือก",
+    "ur_PK": "منتخب ویڈیو(ز) کی پراسیسنگ چھوڑ دیں",
+}
+
+ADD_VIDEOS_TO_PROCESSED_DATABASE = {
+    "en_US": "Add selected video(s) to processed items database",
+    "es_ES": "Agregar video(s) seleccionado(s) a la base de datos de elementos procesados",
+    "tr_TR": "Seçili video(lar)ı işlenmiş öğeler veritabanına ekle",
+    "zh_CN": "将所选视频添加到已处理项目数据库",
+    "zh_TW": "將所選影片新增至已處理項目資料庫",
+    "ru_RU": "Добавить выбранные видео в базу обработанных элементов",
+    "pl_PL": "Dodaj wybrane filmy do bazy przetworzonych elementów",
+    "uk_UA": "Додати вибрані відео до бази оброблених елементів",
+    "ja_JP": "選択した動画を処理済みアイテムデータベースに追加",
+    "ko_KR": "선택한 동영상을 처리된 항목 데이터베이스에 추가",
+    "hi_IN": "चयनित वीडियो को संसाधित आइटम डेटाबेस में जोड़ें",
+    "bn_BD": "নির্বাচিত ভিডিও(গুলি) প্রসেসড আইটেম ডাটাবেসে যোগ করুন",
+    "it_IT": "Aggiungi i video selezionati al database degli elementi elaborati",
+    "fr_FR": "Ajouter les vidéos sélectionnées à la base de données des éléments traités",
+    "de_DE": "Ausgewählte Videos zur Datenbank verarbeiteter Elemente hinzufügen",
+    "pt_PT": "Adicionar vídeos selecionados ao banco de dados de itens processados",
+    "ar_SA": "إضافة مقاطع الفيديو المحددة إلى قاعدة بيانات العناصر المعالجة",
+    "vi_VN": "Thêm video đã chọn vào cơ sở dữ liệu mục đã xử lý",
+    "fa_IR": "افزودن ویدیوهای انتخاب شده به پایگاه داده آیتم‌های پردازش شده",
+    "id_ID": "Tambahkan video yang dipilih ke database item yang diproses",
+    "ms_MY": "Tambah video yang dipilih ke pangkalan data item yang diproses",
+    "th_TH": "เพิ่มวิดีโอที่เลือกไปยังฐานข้อมูลรายการที่ประมวลผลแล้ว",
+    "ur_PK": "منتخب ویڈیو(ز) کو پراسیسڈ آئٹمز ڈیٹابیس میں شامل کریں",
+}
+
+REMOVE_VIDEOS_FROM_PROCESSED_DATABASE = {
+    "en_US": "Remove selected video(s) from processed items database",
+    "es_ES": "Eliminar video(s) seleccionado(s) de la base de datos de elementos procesados",
+    "tr_TR": "Seçili video(lar)ı işlenmiş öğeler veritabanından kaldır",
+    "zh_CN": "从已处理项目数据库中删除所选视频",
+    "zh_TW": "從已處理項目資料庫中移除所選影片",
+    "ru_RU": "Удалить выбранные видео из базы обработанных элементов",
+    "pl_PL": "Usuń wybrane filmy z bazy przetworzonych elementów",
+    "uk_UA": "Видалити вибрані відео з бази оброблених елементів",
+    "ja_JP": "選択した動画を処理済みアイテムデータベースから削除",
+    "ko_KR": "선택한 동영상을 처리된 항목 데이터베이스에서 제거",
+    "hi_IN": "चयनित वीडियो को संसाधित आइटम डेटाबेस से हटाएं",
+    "bn_BD": "নির্বাচিত ভিডিও(গুলি) প্রসেসড আইটেম ডাটাবেস থেকে সরান",
+    "it_IT": "Rimuovi i video selezionati dal database degli elementi elaborati",
+    "fr_FR": "Retirer les vidéos sélectionnées de la base de données des éléments traités",
+    "de_DE": "Ausgewählte Videos aus der Datenbank verarbeiteter Elemente entfernen",
+    "pt_PT": "Remover vídeos selecionados do banco de dados de itens processados",
+    "ar_SA": "إزالة مقاطع الفيديو المحددة من قاعدة بيانات العناصر المعالجة",
+    "vi_VN": "Xóa video đã chọn khỏi cơ sở dữ liệu mục đã xử lý",
+    "fa_IR": "حذف ویدیوهای انتخاب شده از پایگاه داده آیتم‌های پردازش شده",
+    "id_ID": "Hapus video yang dipilih dari database item yang diproses",
+    "ms_MY": "Alih keluar video yang dipilih dari pangkalan data item yang diproses",
+    "th_TH": "ลบวิดีโอที่เลือกออกจากฐานข้อมูลรายการที่ประมวลผลแล้ว",
+    "ur_PK": "منتخب ویڈیو(ز) کو پراسیسڈ آئٹمز ڈیٹابیس سے ہٹائیں",
+}
+
+SCANNING_PROCESSED_ITEMS = {
+    "en_US": "Scanning already processed items...",
+    "es_ES": "Escaneando elementos ya procesados...",
+    "tr_TR": "Daha önce işlenmiş öğeler taranıyor...",
+    "zh_CN": "正在扫描已处理的项目...",
+    "zh_TW": "正在掃描已處理的項目...",
+    "ru_RU": "Сканирование обработанных элементов...",
+    "pl_PL": "Skanowanie przetworzonych elementów...",
+    "uk_UA": "Сканування оброблених елементів...",
+    "ja_JP": "処理済みアイテムをスキャン中...",
+    "ko_KR": "처리된 항목 검색 중...",
+    "hi_IN": "संसाधित आइटम स्कैन किए जा रहे हैं...",
+    "bn_BD": "প্রসেস করা আইটেম স্ক্যান করা হচ্ছে...",
+    "it_IT": "Scansione elementi già elaborati...",
+    "fr_FR": "Analyse des éléments déjà traités...",
+    "de_DE": "Bereits verarbeitete Elemente werden gescannt...",
+    "pt_PT": "Verificando itens já processados...",
+    "ar_SA": "جاري فحص العناصر المعالجة...",
+    "vi_VN": "Đang quét các mục đã xử lý...",
+    "fa_IR": "در حال اسکن آیتم‌های پردازش شده...",
+    "id_ID": "Memindai item yang sudah diproses...",
+    "ms_MY": "Mengimbas item yang telah diproses...",
+    "th_TH": "กำลังสแกนรายการที่ประมวลผลแล้ว...",
+    "ur_PK": "پہلے سے پراسیس شدہ آئٹمز اسکین ہو رہے ہیں...",
+}
+
+ITEM_ALREADY_PROCESSED = {
+    "en_US": "Already processed (will be skipped)",
+    "es_ES": "Ya procesado (se omitirá)",
+    "tr_TR": "Zaten işlenmiş (atlanacak)",
+    "zh_CN": "已处理（将被跳过）",
+    "zh_TW": "已處理 (將被跳過)",
+    "ru_RU": "Уже обработан (будет пропущен)",
+    "pl_PL": "Już przetworzone (zostanie pominięte)",
+    "uk_UA": "Вже оброблено (буде пропущено)",
+    "ja_JP": "処理済み（スキップされます）",
+    "ko_KR": "이미 처리됨 (건너뜀)",
+    "hi_IN": "पहले से संसाधित (छोड़ दिया जाएगा)",
+    "bn_BD": "ইতিমধ্যে প্রসেস করা হয়েছে (এড়িয়ে যাওয়া হবে)",
+    "it_IT": "Già elaborato (verrà saltato)",
+    "fr_FR": "Déjà traité (sera ignoré)",
+    "de_DE": "Bereits verarbeitet (wird übersprungen)",
+    "pt_PT": "Já processado (será pulado)",
+    "ar_SA": "تمت معالجته بالفعل (سيتم تخطيه)",
+    "vi_VN": "Đã xử lý (sẽ bị bỏ qua)",
+    "fa_IR": "قبلاً پردازش شده (نادیده گرفته می‌شود)",
+    "id_ID": "Sudah diproses (akan dilewati)",
+    "ms_MY": "Sudah diproses (akan dilangkau)",
+    "th_TH": "ประมวลผลแล้ว (จะถูกข้าม)",
+    "ur_PK": "پہلے ہی پراسیس ہو چکا (چھوڑ دیا جائے گا)",
+}
+
+CLEAR_PROCESSED_ITEMS_DATABASE = {
+    "en_US": "Clear processed items database",
+    "es_ES": "Borrar base de datos de elementos procesados",
+    "tr_TR": "İşlenmiş öğeler veritabanını temizle",
+    "zh_CN": "清除已处理项目数据库",
+    "zh_TW": "清除已處理項目資料庫",
+    "ru_RU": "Очистить базу данных обработанных элементов",
+    "pl_PL": "Wyczyść bazę danych przetworzonych elementów",
+    "uk_UA": "Очистити базу даних оброблених елементів",
+    "ja_JP": "処理済みアイテムデータベースをクリア",
+    "ko_KR": "처리된 항목 데이터베이스 지우기",
+    "hi_IN": "संसाधित आइटम डेटाबेस साफ़ करें",
+    "bn_BD": "প্রসেস করা আইটেম ডাটাবেস মুছুন",
+    "it_IT": "Cancella database elementi elaborati",
+    "fr_FR": "Effacer la base de données des éléments traités",
+    "de_DE": "Datenbank verarbeiteter Elemente löschen",
+    "pt_PT": "Limpar banco de dados de itens processados",
+    "ar_SA": "مسح قاعدة بيانات العناصر المعالجة",
+    "vi_VN": "Xóa cơ sở dữ liệu các mục đã xử lý",
+    "fa_IR": "پاک کردن پایگاه داده آیتم‌های پردازش شده",
+    "id_ID": "Hapus database item yang diproses",
+    "ms_MY": "Kosongkan pangkalan data item yang diproses",
+    "th_TH": "ล้างฐานข้อมูลรายการที่ประมวลผลแล้ว",
+    "ur_PK": "پراسیس شدہ آئٹمز ڈیٹابیس صاف کریں",
+}
+
+CLEAR_DATABASE_CONFIRM = {
+    "en_US": "Are you sure you want to clear the processed items database? This will allow all items to be processed again.",
+    "es_ES": "¿Está seguro de que desea borrar la base de datos de elementos procesados? Esto permitirá que todos los elementos se procesen nuevamente.",
+    "tr_TR": "İşlenmiş öğeler veritabanını temizlemek istediğinizden emin misiniz? Bu, tüm öğelerin yeniden işlenmesine izin verecektir.",
+    "zh_CN": "您确定要清除已处理项目数据库吗？这将允许所有项目再次被处理。",
+    "zh_TW": "您確定要清除已處理項目資料庫嗎？這將允許所有項目再次被處理。",
+    "ru_RU": "Вы уверены, что хотите очистить базу данных обработанных элементов? Это позволит обработать все элементы заново.",
+    "pl_PL": "Czy na pewno chcesz wyczyścić bazę danych przetworzonych elementów? Umożliwi to ponowne przetworzenie wszystkich elementów.",
+    "uk_UA": "Ви впевнені, що хочете очистити базу даних оброблених елементів? Це дозволить обробити всі елементи знову.",
+    "ja_JP": "処理済みアイテムデータベースをクリアしてもよろしいですか？これにより、すべてのアイテムを再度処理できるようになります。",
+    "ko_KR": "처리된 항목 데이터베이스를 지우시겠습니까? 이렇게 하면 모든 항목을 다시 처리할 수 있습니다.",
+    "hi_IN": "क्या आप सुनिश्चित हैं कि आप संसाधित आइटम डेटाबेस साफ़ करना चाहते हैं? इससे सभी आइटम फिर से संसाधित किए जा सकेंगे।",
+    "bn_BD": "আপনি কি নিশ্চিত যে আপনি প্রসেস করা আইটেম ডাটাবেস মুছতে চান? এটি সব আইটেমকে আবার প্রসেস করতে দেবে।",
+    "it_IT": "Sei sicuro di voler cancellare il database degli elementi elaborati? Questo permetterà di elaborare nuovamente tutti gli elementi.",
+    "fr_FR": "Êtes-vous sûr de vouloir effacer la base de données des éléments traités ? Cela permettra de traiter à nouveau tous les éléments.",
+    "de_DE": "Sind Sie sicher, dass Sie die Datenbank verarbeiteter Elemente löschen möchten? Dadurch können alle Elemente erneut verarbeitet werden.",
+    "pt_PT": "Tem certeza de que deseja limpar o banco de dados de itens processados? Isso permitirá que todos os itens sejam processados novamente.",
+    "ar_SA": "هل أنت متأكد من أنك تريد مسح قاعدة بيانات العناصر المعالجة؟ سيسمح هذا بمعالجة جميع العناصر مرة أخرى.",
+    "vi_VN": "Bạn có chắc chắn muốn xóa cơ sở dữ liệu các mục đã xử lý không? Điều này sẽ cho phép tất cả các mục được xử lý lại.",
+    "fa_IR": "آیا مطمئن هستید که می‌خواهید پایگاه داده آیتم‌های پردازش شده را پاک کنید؟ این امکان پردازش مجدد همه آیتم‌ها را فراهم می‌کند.",
+    "id_ID": "Apakah Anda yakin ingin menghapus database item yang diproses? Ini akan memungkinkan semua item diproses lagi.",
+    "ms_MY": "Adakah anda pasti mahu mengosongkan pangkalan data item yang diproses? Ini akan membenarkan semua item diproses semula.",
+    "th_TH": "คุณแน่ใจหรือไม่ว่าต้องการล้างฐานข้อมูลรายการที่ประมวลผลแล้ว? การดำเนินการนี้จะอนุญาตให้ประมวลผลรายการทั้งหมดอีกครั้ง",
+    "ur_PK": "کیا آپ واقعی پراسیس شدہ آئٹمز ڈیٹابیس صاف کرنا چاہتے ہیں؟ اس سے تمام آئٹمز کو دوبارہ پراسیس کرنے کی اجازت ملے گی۔",
+}
+
+DATABASE_CLEARED_SUCCESS = {
+    "en_US": "Processed items database cleared successfully ({count} items removed).",
+    "es_ES": "Base de datos de elementos procesados borrada correctamente ({count} elementos eliminados).",
+    "tr_TR": "İşlenmiş öğeler veritabanı başarıyla temizlendi ({count} öğe kaldırıldı).",
+    "zh_CN": "已处理项目数据库已成功清除（已删除 {count} 个项目）。",
+    "zh_TW": "已處理項目資料庫已成功清除 ({count} 個項目已移除)。",
+    "ru_RU": "База данных обработанных элементов успешно очищена ({count} элементов удалено).",
+    "pl_PL": "Baza danych przetworzonych elementów została wyczyszczona ({count} elementów usunięto).",
+    "uk_UA": "Базу даних оброблених елементів успішно очищено ({count} елементів видалено).",
+    "ja_JP": "処理済みアイテムデータベースを正常にクリアしました（{count} 件のアイテムを削除）。",
+    "ko_KR": "처리된 항목 데이터베이스가 성공적으로 지워졌습니다 ({count}개 항목 제거됨).",
+    "hi_IN": "संसाधित आइटम डेटाबेस सफलतापूर्वक साफ़ किया गया ({count} आइटम हटाए गए)।",
+    "bn_BD": "প্রসেস করা আইটেম ডাটাবেস সফলভাবে মুছে ফেলা হয়েছে ({count}টি আইটেম সরানো হয়েছে)।",
+    "it_IT": "Database elementi elaborati cancellato con successo ({count} elementi rimossi).",
+    "fr_FR": "Base de données des éléments traités effacée avec succès ({count} éléments supprimés).",
+    "de_DE": "Datenbank verarbeiteter Elemente erfolgreich gelöscht ({count} Elemente entfernt).",
+    "pt_PT": "Banco de dados de itens processados limpo com sucesso ({count} itens removidos).",
+    "ar_SA": "تم مسح قاعدة بيانات العناصر المعالجة بنجاح (تمت إزالة {count} عنصر).",
+    "vi_VN": "Đã xóa cơ sở dữ liệu các mục đã xử lý thành công (đã xóa {count} mục).",
+    "fa_IR": "پایگاه داده آیتم‌های پردازش شده با موفقیت پاک شد ({count} آیتم حذف شد).",
+    "id_ID": "Database item yang diproses berhasil dihapus ({count} item dihapus).",
+    "ms_MY": "Pangkalan data item yang diproses berjaya dikosongkan ({count} item dialih keluar).",
+    "th_TH": "ล้างฐานข้อมูลรายการที่ประมวลผลแล้วสำเร็จ (ลบ {count} รายการ)",
+    "ur_PK": "پراسیس شدہ آئٹمز ڈیٹابیس کامیابی سے صاف ہو گیا ({count} آئٹمز ہٹا دیے گئے)۔",
+}
+
+LOADING_PLEASE_WAIT = {
+    "en_US": "Loading, please wait...",
+    "es_ES": "Cargando, por favor espere...",
+    "tr_TR": "Yükleniyor, lütfen bekleyin...",
+    "zh_CN": "加载中，请稍候...",
+    "zh_TW": "載入中，請稍候...",
+    "ru_RU": "Загрузка, пожалуйста, подождите...",
+    "pl_PL": "Ładowanie, proszę czekać...",
+    "uk_UA": "Завантаження, будь ласка, зачекайте...",
+    "ja_JP": "読み込み中、お待ちください...",
+    "ko_KR": "로딩 중, 잠시만 기다려주세요...",
+    "hi_IN": "लोड हो रहा है, कृपया प्रतीक्षा करें...",
+    "bn_BD": "লোড হচ্ছে, অনুগ্রহ করে অপেক্ষা করুন...",
+    "it_IT": "Caricamento, attendere prego...",
+    "fr_FR": "Chargement, veuillez patienter...",
+    "de_DE": "Laden, bitte warten...",
+    "pt_PT": "Carregando, por favor aguarde...",
+    "ar_SA": "جاري التحميل، يرجى الانتظار...",
+    "vi_VN": "Đang tải, vui lòng chờ...",
+    "fa_IR": "در حال بارگذاری، لطفاً صبر کنید...",
+    "id_ID": "Memuat, harap tunggu...",
+    "ms_MY": "Memuatkan, sila tunggu...",
+    "th_TH": "กำลังโหลด กรุณารอสักครู่...",
+    "ur_PK": "لوڈ ہو رہا ہے، براہ کرم انتظار کریں...",
+}
+
+REFRESH = {
+    "en_US": "Refresh",
+    "es_ES": "Actualizar",
+    "tr_TR": "Yenile",
+    "zh_CN": "刷新",
+    "zh_TW": "重新整理",
+    "ru_RU": "Обновить",
+    "pl_PL": "Odśwież",
+    "uk_UA": "Оновити",
+    "ja_JP": "更新",
+    "ko_KR": "새로고침",
+    "hi_IN": "रीफ़्रेश",
+    "bn_BD": "রিফ্রেশ",
+    "it_IT": "Aggiorna",
+    "fr_FR": "Actualiser",
+    "de_DE": "Aktualisieren",
+    "pt_PT": "Atualizar",
+    "ar_SA": "تحديث",
+    "vi_VN": "Làm mới",
+    "fa_IR": "بازخوانی",
+    "id_ID": "Segarkan",
+    "ms_MY": "Muat semula",
+    "th_TH": "รีเฟรช",
+    "ur_PK": "ریفریش",
+}
+
+REFRESH_PROCESSED_STATUS_TOOLTIP = {
+    "en_US": "Re-scan all videos to check their processed status from the database",
+    "es_ES": "Volver a escanear todos los videos para verificar su estado de procesamiento en la base de datos",
+    "tr_TR": "Veritabanından işlenme durumlarını kontrol etmek için tüm videoları yeniden tara",
+    "zh_CN": "重新扫描所有视频以从数据库检查其处理状态",
+    "zh_TW": "重新掃描所有影片以從資料庫檢查其處理狀態",
+    "ru_RU": "Повторно сканировать все видео для проверки статуса обработки в базе данных",
+    "pl_PL": "Przeskanuj ponownie wszystkie filmy, aby sprawdzić ich status przetworzenia w bazie danych",
+    "uk_UA": "Повторно сканувати всі відео для перевірки статусу обробки в базі даних",
+    "ja_JP": "すべての動画を再スキャンしてデータベースの処理済みステータスを確認",
+    "ko_KR": "데이터베이스에서 처리 상태를 확인하기 위해 모든 비디오를 다시 스캔",
+    "hi_IN": "डेटाबेस से प्रोसेस्ड स्थिति जांचने के लिए सभी वीडियो को फिर से स्कैन करें",
+    "bn_BD": "ডাটাবেস থেকে প্রসেস করা স্ট্যাটাস চেক করতে সব ভিডিও রি-স্ক্যান করুন",
+    "it_IT": "Riscansiona tutti i video per verificare il loro stato di elaborazione dal database",
+    "fr_FR": "Rescanner toutes les vidéos pour vérifier leur statut de traitement dans la base de données",
+    "de_DE": "Alle Videos erneut scannen, um ihren Verarbeitungsstatus aus der Datenbank zu überprüfen",
+    "pt_PT": "Reescanear todos os vídeos para verificar o status de processamento no banco de dados",
+    "ar_SA": "إعادة فحص جميع مقاطع الفيديو للتحقق من حالة المعالجة من قاعدة البيانات",
+    "vi_VN": "Quét lại tất cả video để kiểm tra trạng thái đã xử lý từ cơ sở dữ liệu",
+    "fa_IR": "اسکن مجدد همه ویدیوها برای بررسی وضعیت پردازش از پایگاه داده",
+    "id_ID": "Pindai ulang semua video untuk memeriksa status pemrosesan dari database",
+    "ms_MY": "Imbas semula semua video untuk menyemak status pemprosesan dari pangkalan data",
+    "th_TH": "สแกนวิดีโอทั้งหมดอีกครั้งเพื่อตรวจสอบสถานะการประมวลผลจากฐานข้อมูล",
+    "ur_PK": "ڈیٹابیس سے پراسیس شدہ حیثیت چیک کرنے کے لیے تمام ویڈیوز کو دوبارہ اسکین کریں",
+}
+
+CONFIRMATION = {
+    "en_US": "Confirmation",
+    "es_ES": "Confirmación",
+    "tr_TR": "Onay",
+    "zh_CN": "确认",
+    "zh_TW": "確認",
+    "ru_RU": "Подтверждение",
+    "pl_PL": "Potwierdzenie",
+    "uk_UA": "Підтвердження",
+    "ja_JP": "確認",
+    "ko_KR": "확인",
+    "hi_IN": "पुष्टि",
+    "bn_BD": "নিশ্চিতকরণ",
+    "it_IT": "Conferma",
+    "fr_FR": "Confirmation",
+    "de_DE": "Bestätigung",
+    "pt_PT": "Confirmação",
+    "ar_SA": "تأكيد",
+    "vi_VN": "Xác nhận",
+    "fa_IR": "تایید",
+    "id_ID": "Konfirmasi",
+    "ms_MY": "Pengesahan",
+    "th_TH": "ยืนยัน",
+    "ur_PK": "تصدیق",
+}
+
+CONFIRM_ADD_TO_DATABASE = {
+    "en_US": "Are you sure you want to add {count} videos to the processed items database?",
+    "es_ES": "¿Está seguro de que desea agregar {count} videos a la base de datos de elementos procesados?",
+    "tr_TR": "{count} videoyu işlenmiş öğeler veritabanına eklemek istediğinizden emin misiniz?",
+    "zh_CN": "您确定要将 {count} 个视频添加到已处理项目数据库吗？",
+    "zh_TW": "您確定要將 {count} 個影片新增至已處理項目資料庫嗎？",
+    "ru_RU": "Вы уверены, что хотите добавить {count} видео в базу данных обработанных элементов?",
+    "pl_PL": "Czy na pewno chcesz dodać {count} filmów do bazy danych przetworzonych elementów?",
+    "uk_UA": "Ви впевнені, що хочете додати {count} відео до бази даних оброблених елементів?",
+    "ja_JP": "{count} 件の動画を処理済みアイテムデータベースに追加してもよろしいですか？",
+    "ko_KR": "{count}개의 비디오를 처리된 항목 데이터베이스에 추가하시겠습니까?",
+    "hi_IN": "क्या आप सुनिश्चित हैं कि आप {count} वीडियो को संसाधित आइटम डेटाबेस में जोड़ना चाहते हैं?",
+    "bn_BD": "আপনি কি নিশ্চিত যে আপনি {count}টি ভিডিও প্রসেসড আইটেম ডাটাবেসে যোগ করতে চান?",
+    "it_IT": "Sei sicuro di voler aggiungere {count} video al database degli elementi elaborati?",
+    "fr_FR": "Êtes-vous sûr de vouloir ajouter {count} vidéos à la base de données des éléments traités?",
+    "de_DE": "Sind Sie sicher, dass Sie {count} Videos zur Datenbank verarbeiteter Elemente hinzufügen möchten?",
+    "pt_PT": "Tem certeza de que deseja adicionar {count} vídeos ao banco de dados de itens processados?",
+    "ar_SA": "هل أنت متأكد من أنك تريد إضافة {count} مقاطع فيديو إلى قاعدة بيانات العناصر المعالجة؟",
+    "vi_VN": "Bạn có chắc chắn muốn thêm {count} video vào cơ sở dữ liệu mục đã xử lý không?",
+    "fa_IR": "آیا مطمئن هستید که می‌خواهید {count} ویدیو را به پایگاه داده آیتم‌های پردازش شده اضافه کنید؟",
+    "id_ID": "Apakah Anda yakin ingin menambahkan {count} video ke database item yang diproses?",
+    "ms_MY": "Adakah anda pasti mahu menambah {count} video ke pangkalan data item yang diproses?",
+    "th_TH": "คุณแน่ใจหรือไม่ว่าต้องการเพิ่ม {count} วิดีโอลงในฐานข้อมูลรายการที่ประมวลผลแล้ว?",
+    "ur_PK": "کیا آپ واقعی {count} ویڈیوز کو پراسیسڈ آئٹمز ڈیٹابیس میں شامل کرنا چاہتے ہیں؟",
+}
+
+CONFIRM_REMOVE_FROM_DATABASE = {
+    "en_US": "Are you sure you want to remove {count} videos from the processed items database?",
+    "es_ES": "¿Está seguro de que desea eliminar {count} videos de la base de datos de elementos procesados?",
+    "tr_TR": "{count} videoyu işlenmiş öğeler veritabanından kaldırmak istediğinizden emin misiniz?",
+    "zh_CN": "您确定要从已处理项目数据库中删除 {count} 个视频吗？",
+    "zh_TW": "您確定要從已處理項目資料庫中移除 {count} 個影片嗎？",
+    "ru_RU": "Вы уверены, что хотите удалить {count} видео из базы данных обработанных элементов?",
+    "pl_PL": "Czy na pewno chcesz usunąć {count} filmów z bazy danych przetworzonych elementów?",
+    "uk_UA": "Ви впевнені, що хочете видалити {count} відео з бази даних оброблених елементів?",
+    "ja_JP": "{count} 件の動画を処理済みアイテムデータベースから削除してもよろしいですか？",
+    "ko_KR": "{count}개의 비디오를 처리된 항목 데이터베이스에서 제거하시겠습니까?",
+    "hi_IN": "क्या आप सुनिश्चित हैं कि आप {count} वीडियो को संसाधित आइटम डेटाबेस से हटाना चाहते हैं?",
+    "bn_BD": "আপনি কি নিশ্চিত যে আপনি {count}টি ভিডিও প্রসেসড আইটেম ডাটাবেস থেকে সরাতে চান?",
+    "it_IT": "Sei sicuro di voler rimuovere {count} video dal database degli elementi elaborati?",
+    "fr_FR": "Êtes-vous sûr de vouloir supprimer {count} vidéos de la base de données des éléments traités?",
+    "de_DE": "Sind Sie sicher, dass Sie {count} Videos aus der Datenbank verarbeiteter Elemente entfernen möchten?",
+    "pt_PT": "Tem certeza de que deseja remover {count} vídeos do banco de dados de itens processados?",
+    "ar_SA": "هل أنت متأكد من أنك تريد إزالة {count} مقاطع فيديو من قاعدة بيانات العناصر المعالجة؟",
+    "vi_VN": "Bạn có chắc chắn muốn xóa {count} video khỏi cơ sở dữ liệu mục đã xử lý không?",
+    "fa_IR": "آیا مطمئن هستید که می‌خواهید {count} ویدیو را از پایگاه داده آیتم‌های پردازش شده حذف کنید؟",
+    "id_ID": "Apakah Anda yakin ingin menghapus {count} video dari database item yang diproses?",
+    "ms_MY": "Adakah anda pasti mahu mengalih keluar {count} video dari pangkalan data item yang diproses?",
+    "th_TH": "คุณแน่ใจหรือไม่ว่าต้องการลบ {count} วิดีโอออกจากฐานข้อมูลรายการที่ประมวลผลแล้ว?",
+    "ur_PK": "کیا آپ واقعی {count} ویڈیوز کو پراسیسڈ آئٹمز ڈیٹابیس سے ہٹانا چاہتے ہیں؟",
+}
+
+############### gui_load_library.py ###############
+
+SYNC_TRACKING = {
+    "en_US": "Sync tracking",
+    "es_ES": "Seguimiento de sincronización",
+    "tr_TR": "Senkron takibi",
+    "zh_CN": "同步跟踪",
+    "zh_TW": "同步追蹤",
+    "ru_RU": "Отслеживание синхронизации",
+    "pl_PL": "Śledzenie synchronizacji",
+    "uk_UA": "Відстеження синхронізації",
+    "ja_JP": "同期トラッキング",
+    "ko_KR": "동기화 추적",
+    "hi_IN": "सिंक ट्रैकिंग",
+    "bn_BD": "সিঙ্ক ট্র্যাকিং",
+    "it_IT": "Monitoraggio sincronizzazione",
+    "fr_FR": "Suivi de synchronisation",
+    "de_DE": "Synchronisierungsverfolgung",
+    "pt_PT": "Rastreamento de sincronização",
+    "ar_SA": "تتبع المزامنة",
+    "vi_VN": "Theo dõi đồng bộ",
+    "fa_IR": "ردیابی همگام‌سازی",
+    "id_ID": "Pelacakan sinkronisasi",
+    "ms_MY": "Penjejakan penyegerakan",
+    "th_TH": "ติดตามการซิงค์",
+    "ur_PK": "سنک ٹریکنگ",
+}
+
+LOAD_LIBRARY = {
+    "en_US": "Load library",
+    "es_ES": "Cargar biblioteca",
+    "tr_TR": "Kütüphaneyi yükle",
+    "zh_CN": "加载媒体库",
+    "zh_TW": "載入媒體庫",
+    "ru_RU": "Загрузить библиотеку",
+    "pl_PL": "Załaduj bibliotekę",
+    "uk_UA": "Завантажити бібліотеку",
+    "ja_JP": "ライブラリを読み込む",
+    "ko_KR": "라이브러리 로드",
+    "hi_IN": "लाइब्रेरी लोड करें",
+    "bn_BD": "লাইব্রেরি লোড করুন",
+    "it_IT": "Carica libreria",
+    "fr_FR": "Charger la bibliothèque",
+    "de_DE": "Bibliothek laden",
+    "pt_PT": "Carregar biblioteca",
+    "ar_SA": "تحميل المكتبة",
+    "vi_VN": "Tải thư viện",
+    "fa_IR": "بارگذاری کتابخانه",
+    "id_ID": "Muat pustaka",
+    "ms_MY": "Muat pustaka",
+    "th_TH": "โหลดไลบรารี",
+    "ur_PK": "لائبریری لوڈ کریں",
+}
+
+RELOAD_LIBRARY = {
+    "en_US": "Reload library",
+    "es_ES": "Recargar biblioteca",
+    "tr_TR": "Kütüphaneyi yeniden yükle",
+    "zh_CN": "重新加载媒体库",
+    "zh_TW": "重新載入媒體庫",
+    "ru_RU": "Перезагрузить библиотеку",
+    "pl_PL": "Przeładuj bibliotekę",
+    "uk_UA": "Перезавантажити бібліотеку",
+    "ja_JP": "ライブラリを再読み込み",
+    "ko_KR": "라이브러리 다시 로드",
+    "hi_IN": "लाइब्रेरी रीलोड करें",
+    "bn_BD": "লাইব্রেরি রিলোড করুন",
+    "it_IT": "Ricarica libreria",
+    "fr_FR": "Recharger la bibliothèque",
+    "de_DE": "Bibliothek neu laden",
+    "pt_PT": "Recarregar biblioteca",
+    "ar_SA": "إعادة تحميل المكتبة",
+    "vi_VN": "Tải lại thư viện",
+    "fa_IR": "بارگذاری مجدد کتابخانه",
+    "id_ID": "Muat ulang pustaka",
+    "ms_MY": "Muat semula pustaka",
+    "th_TH": "โหลดไลบรารีใหม่",
+    "ur_PK": "لائبریری دوبارہ لوڈ کریں",
+}
+
+MANAGE_LIBRARY_FOLDERS = {
+    "en_US": "Manage library folders",
+    "es_ES": "Gestionar carpetas de biblioteca",
+    "tr_TR": "Kütüphane klasörlerini yönet",
+    "zh_CN": "管理媒体库文件夹",
+    "zh_TW": "管理媒體庫資料夾",
+    "ru_RU": "Управление папками библиотеки",
+    "pl_PL": "Zarządzaj folderami biblioteki",
+    "uk_UA": "Керувати папками бібліотеки",
+    "ja_JP": "ライブラリフォルダを管理",
+    "ko_KR": "라이브러리 폴더 관리",
+    "hi_IN": "लाइब्रेरी फोल्डर प्रबंधित करें",
+    "bn_BD": "লাইব্রেরি ফোল্ডার ব্যবস্থাপনা",
+    "it_IT": "Gestisci cartelle libreria",
+    "fr_FR": "Gérer les dossiers de la bibliothèque",
+    "de_DE": "Bibliotheksordner verwalten",
+    "pt_PT": "Gerenciar pastas da biblioteca",
+    "ar_SA": "إدارة مجلدات المكتبة",
+    "vi_VN": "Quản lý thư mục thư viện",
+    "fa_IR": "مدیریت پوشه‌های کتابخانه",
+    "id_ID": "Kelola folder pustaka",
+    "ms_MY": "Urus folder pustaka",
+    "th_TH": "จัดการโฟลเดอร์ไลบรารี",
+    "ur_PK": "لائبریری فولڈرز کا انتظام",
+}
+
+LIBRARY_MANAGER_TITLE = {
+    "en_US": "Library Manager",
+    "es_ES": "Gestor de biblioteca",
+    "tr_TR": "Kütüphane Yöneticisi",
+    "zh_CN": "媒体库管理器",
+    "zh_TW": "媒體庫管理器",
+    "ru_RU": "Менеджер библиотеки",
+    "pl_PL": "Menedżer biblioteki",
+    "uk_UA": "Менеджер бібліотеки",
+    "ja_JP": "ライブラリマネージャー",
+    "ko_KR": "라이브러리 관리자",
+    "hi_IN": "लाइब्रेरी मैनेजर",
+    "bn_BD": "লাইব্রেরি ম্যানেজার",
+    "it_IT": "Gestore libreria",
+    "fr_FR": "Gestionnaire de bibliothèque",
+    "de_DE": "Bibliotheksverwaltung",
+    "pt_PT": "Gerenciador de biblioteca",
+    "ar_SA": "مدير المكتبة",
+    "vi_VN": "Trình quản lý thư viện",
+    "fa_IR": "مدیر کتابخانه",
+    "id_ID": "Manajer Pustaka",
+    "ms_MY": "Pengurus Pustaka",
+    "th_TH": "ตัวจัดการไลบรารี",
+    "ur_PK": "لائبریری مینیجر",
+}
+
+LIBRARY_MANAGER_DESC = {
+    "en_US": "The Library Manager allows you to save frequently used folders for quick access in Batch Mode. Add folders containing video files and their corresponding subtitle files. These folders will be remembered between sessions, so you don't have to re-add them each time. You can add, remove, or clear folders as needed. Only existing folders will be loaded into Batch Mode. When 'Load library' is clicked, it will load all videos and subtitles that exist in the folders you added.",
+    "es_ES": "El Administrador de Biblioteca le permite guardar carpetas de uso frecuente para acceso rápido en Modo por lotes. Agregue carpetas que contengan archivos de video y sus archivos de subtítulos correspondientes. Estas carpetas se recordarán entre sesiones, por lo que no tendrá que volver a agregarlas cada vez. Puede agregar, eliminar o borrar carpetas según sea necesario. Solo las carpetas existentes se cargarán en el Modo por lotes. Cuando se hace clic en 'Cargar biblioteca', se cargarán todos los videos y subtítulos que existen en las carpetas que agregó.",
+    "tr_TR": "Kütüphane Yöneticisi, Toplu Mod'da hızlı erişim için sık kullanılan klasörleri kaydetmenizi sağlar. Video dosyaları ve ilgili altyazı dosyalarını içeren klasörler ekleyin. Bu klasörler oturumlar arasında hatırlanacak, böylece her seferinde yeniden eklemenize gerek kalmayacak. Gerektiğinde klasör ekleyebilir, kaldırabilir veya temizleyebilirsiniz. Yalnızca mevcut klasörler Toplu Mod'a yüklenecektir. 'Kütüphaneyi yükle' tıklandığında, eklediğiniz klasörlerde bulunan tüm videolar ve altyazılar yüklenecektir.",
+    "zh_CN": "媒体库管理器允许您保存常用文件夹，以便在批处理模式中快速访问。添加包含视频文件及其相应字幕文件的文件夹。这些文件夹将在会话之间被记住，因此您不必每次都重新添加它们。您可以根据需要添加、删除或清除文件夹。只有现有文件夹会被加载到批处理模式中。点击'加载库'时，它将加载您添加的文件夹中存在的所有视频和字幕。",
+    "zh_TW": "媒體庫管理器允許您儲存常用資料夾，以便在批次模式中快速存取。新增包含影片檔案及其對應字幕檔案的資料夾。這些資料夾將在工作階段之間被記住，因此您不必每次都重新新增它們。您可以根據需要新增、移除或清除資料夾。只有現有資料夾會被載入到批次模式中。點擊「載入媒體庫」時，它將載入您新增的資料夾中存在的所有影片和字幕。",
+    "ru_RU": "Менеджер библиотеки позволяет сохранять часто используемые папки для быстрого доступа в пакетном режиме. Добавьте папки, содержащие видеофайлы и соответствующие файлы субтитров. Эти папки будут запоминаться между сеансами, поэтому вам не придется добавлять их заново каждый раз. Вы можете добавлять, удалять или очищать папки по мере необходимости. Только существующие папки будут загружены в пакетный режим. При нажатии 'Загрузить библиотеку' будут загружены все видео и субтитры, существующие в добавленных вами папках.",
+    "pl_PL": "Menedżer biblioteki pozwala zapisywać często używane foldery w celu szybkiego dostępu w trybie wsadowym. Dodaj foldery zawierające pliki wideo i odpowiadające im pliki napisów. Te foldery będą pamiętane między sesjami, więc nie musisz ich ponownie dodawać za każdym razem. Możesz dodawać, usuwać lub czyścić foldery w razie potrzeby. Tylko istniejące foldery zostaną załadowane do trybu wsadowego. Po kliknięciu 'Załaduj bibliotekę' zostaną załadowane wszystkie filmy i napisy istniejące w dodanych przez Ciebie folderach.",
+    "uk_UA": "Менеджер бібліотеки дозволяє зберігати часто використовувані папки для швидкого доступу в пакетному режимі. Додайте папки, що містять відеофайли та відповідні файли субтитрів. Ці папки зберігатимуться між сеансами, тому вам не доведеться додавати їх знову щоразу. Ви можете додавати, видаляти або очищати папки за потребою. Тільки існуючі папки будуть завантажені в пакетний режим. При натисканні 'Завантажити бібліотеку' будуть завантажені всі відео та субтитри, що існують у доданих вами папках.",
+    "ja_JP": "ライブラリマネージャーを使用すると、バッチモードで頻繁に使用するフォルダを保存してすばやくアクセスできます。ビデオファイルと対応する字幕ファイルを含むフォルダを追加します。これらのフォルダはセッション間で記憶されるため、毎回再追加する必要はありません。必要に応じてフォルダを追加、削除、またはクリアできます。既存のフォルダのみがバッチモードに読み込まれます。「ライブラリを読み込む」をクリックすると、追加したフォルダに存在するすべてのビデオと字幕が読み込まれます。",
+    "ko_KR": "라이브러리 관리자를 사용하면 배치 모드에서 자주 사용하는 폴더를 저장하여 빠르게 액세스할 수 있습니다. 비디오 파일과 해당 자막 파일을 포함하는 폴더를 추가하세요. 이러한 폴더는 세션 간에 기억되므로 매번 다시 추가할 필요가 없습니다. 필요에 따라 폴더를 추가, 제거 또는 지울 수 있습니다. 기존 폴더만 배치 모드에 로드됩니다. '라이브러리 로드'를 클릭하면 추가한 폴더에 존재하는 모든 비디오와 자막이 로드됩니다.",
+    "hi_IN": "लाइब्रेरी मैनेजर आपको बैच मोड में त्वरित पहुंच के लिए अक्सर इस्तेमाल किए जाने वाले फोल्डरों को सहेजने की अनुमति देता है। वीडियो फाइलें और उनकी संबंधित सबटाइटल फाइलें युक्त फोल्डर जोड़ें। ये फोल्डर सत्रों के बीच याद रखे जाएंगे, इसलिए आपको हर बार उन्हें फिर से जोड़ने की आवश्यकता नहीं होगी। आप आवश्यकतानुसार फोल्डर जोड़, हटा या साफ कर सकते हैं। केवल मौजूदा फोल्डर बैच मोड में लोड किए जाएंगे। जब 'लाइब्रेरी लोड करें' पर क्लिक किया जाता है, तो यह आपके द्वारा जोड़े गए फोल्डरों में मौजूद सभी वीडियो और सबटाइटल लोड करेगा।",
+    "bn_BD": "লাইব্রেরি ম্যানেজার আপনাকে ব্যাচ মোডে দ্রুত অ্যাক্সেসের জন্য ঘন ঘন ব্যবহৃত ফোল্ডারগুলি সংরক্ষণ করতে দেয়। ভিডিও ফাইল এবং তাদের সংশ্লিষ্ট সাবটাইটেল ফাইল ধারণকারী ফোল্ডার যোগ করুন। এই ফোল্ডারগুলি সেশনের মধ্যে মনে রাখা হবে, তাই আপনাকে প্রতিবার তাদের পুনরায় যোগ করতে হবে না। আপনি প্রয়োজন অনুসারে ফোল্ডার যোগ, অপসারণ বা সাফ করতে পারেন। শুধুমাত্র বিদ্যমান ফোল্ডারগুলি ব্যাচ মোডে লোড করা হবে। যখন 'লাইব্রেরি লোড করুন' ক্লিক করা হয়, তখন এটি আপনার যোগ করা ফোল্ডারগুলিতে বিদ্যমান সমস্ত ভিডিও এবং সাবটাইটেল লোড করবে।",
+    "it_IT": "Il Gestore Libreria ti permette di salvare cartelle frequentemente utilizzate per un accesso rapido in Modalità batch. Aggiungi cartelle contenenti file video e i relativi file di sottotitoli. Queste cartelle verranno ricordate tra le sessioni, quindi non dovrai aggiungerle nuovamente ogni volta. Puoi aggiungere, rimuovere o cancellare cartelle secondo necessità. Solo le cartelle esistenti verranno caricate in Modalità batch. Quando si fa clic su 'Carica libreria', verranno caricati tutti i video e i sottotitoli esistenti nelle cartelle che hai aggiunto.",
+    "fr_FR": "Le Gestionnaire de Bibliothèque vous permet de sauvegarder des dossiers fréquemment utilisés pour un accès rapide en mode lot. Ajoutez des dossiers contenant des fichiers vidéo et leurs fichiers de sous-titres correspondants. Ces dossiers seront mémorisés entre les sessions, vous n'aurez donc pas à les rajouter à chaque fois. Vous pouvez ajouter, supprimer ou effacer des dossiers selon vos besoins. Seuls les dossiers existants seront chargés en mode lot. Lorsque vous cliquez sur 'Charger la bibliothèque', tous les vidéos et sous-titres existants dans les dossiers que vous avez ajoutés seront chargés.",
+    "de_DE": "Der Bibliotheksmanager ermöglicht es Ihnen, häufig verwendete Ordner für den schnellen Zugriff im Stapelmodus zu speichern. Fügen Sie Ordner hinzu, die Videodateien und die entsprechenden Untertiteldateien enthalten. Diese Ordner werden zwischen Sitzungen gespeichert, sodass Sie sie nicht jedes Mal neu hinzufügen müssen. Sie können Ordner nach Bedarf hinzufügen, entfernen oder löschen. Nur vorhandene Ordner werden in den Stapelmodus geladen. Wenn Sie auf 'Bibliothek laden' klicken, werden alle Videos und Untertitel geladen, die in den von Ihnen hinzugefügten Ordnern vorhanden sind.",
+    "pt_PT": "O Gerenciador de Biblioteca permite salvar pastas frequentemente usadas para acesso rápido no Modo em lote. Adicione pastas contendo arquivos de vídeo e seus arquivos de legenda correspondentes. Essas pastas serão lembradas entre sessões, para que você não precise adicioná-las novamente cada vez. Você pode adicionar, remover ou limpar pastas conforme necessário. Apenas pastas existentes serão carregadas no Modo em lote. Quando 'Carregar biblioteca' for clicado, ele carregará todos os vídeos e legendas que existem nas pastas que você adicionou.",
+    "ar_SA": "يسمح لك مدير المكتبة بحفظ المجلدات المستخدمة بشكل متكرر للوصول السريع في وضع الدُفعات. أضف مجلدات تحتوي على ملفات فيديو وملفات الترجمة المقابلة. سيتم تذكر هذه المجلدات بين الجلسات، لذا لن تحتاج إلى إعادة إضافتها في كل مرة. يمكنك إضافة أو إزالة أو مسح المجلدات حسب الحاجة. سيتم تحميل المجلدات الموجودة فقط في وضع الدُفعات. عند النقر على 'تحميل المكتبة'، سيتم تحميل جميع الفيديوهات والترجمات الموجودة في المجلدات التي أضفتها.",
+    "vi_VN": "Trình quản lý Thư viện cho phép bạn lưu các thư mục thường dùng để truy cập nhanh trong Chế độ hàng loạt. Thêm các thư mục chứa tệp video và tệp phụ đề tương ứng. Các thư mục này sẽ được ghi nhớ giữa các phiên, vì vậy bạn không cần thêm lại chúng mỗi lần. Bạn có thể thêm, xóa hoặc xóa sạch thư mục theo nhu cầu. Chỉ các thư mục hiện có sẽ được tải vào Chế độ hàng loạt. Khi nhấp vào 'Tải thư viện', nó sẽ tải tất cả video và phụ đề tồn tại trong các thư mục bạn đã thêm.",
+    "fa_IR": "مدیر کتابخانه به شما اجازه می‌دهد تا پوشه‌های مورد استفاده مکرر را برای دسترسی سریع در حالت دسته‌ای ذخیره کنید. پوشه‌هایی که حاوی فایل‌های ویدیو و فایل‌های زیرنویس مربوطه هستند اضافه کنید. این پوشه‌ها بین جلسات ذخیره می‌شوند، بنابراین نیازی به اضافه کردن مجدد آنها هر بار ندارید. می‌توانید پوشه‌ها را بر اساس نیاز اضافه، حذف یا پاک کنید. فقط پوشه‌های موجود در حالت دسته‌ای بارگذاری می‌شوند. هنگامی که روی 'بارگذاری کتابخانه' کلیک می‌شود، تمام ویدیوها و زیرنویس‌هایی که در پوشه‌های اضافه شده شما وجود دارند بارگذاری خواهند شد.",
+    "id_ID": "Pengelola Perpustakaan memungkinkan Anda menyimpan folder yang sering digunakan untuk akses cepat di Mode Batch. Tambahkan folder yang berisi file video dan file subtitle yang sesuai. Folder ini akan diingat antar sesi, jadi Anda tidak perlu menambahkannya kembali setiap kali. Anda dapat menambah, menghapus, atau membersihkan folder sesuai kebutuhan. Hanya folder yang ada yang akan dimuat ke Mode Batch. Ketika 'Muat pustaka' diklik, itu akan memuat semua video dan subtitle yang ada di folder yang Anda tambahkan.",
+    "ms_MY": "Pengurus Perpustakaan membolehkan anda menyimpan folder yang sering digunakan untuk akses pantas dalam Mod Kelompok. Tambah folder yang mengandungi fail video dan fail sarikata yang sepadan. Folder ini akan diingati antara sesi, jadi anda tidak perlu menambahkannya semula setiap kali. Anda boleh menambah, membuang, atau membersihkan folder mengikut keperluan. Hanya folder yang wujud sahaja yang akan dimuatkan ke Mod Kelompok. Apabila 'Muat pustaka' diklik, ia akan memuatkan semua video dan sarikata yang wujud dalam folder yang anda tambah.",
+    "th_TH": "ตัวจัดการไลบรารีช่วยให้คุณบันทึกโฟลเดอร์ที่ใช้บ่อยเพื่อเข้าถึงอย่างรวดเร็วในโหมดแบตช์ เพิ่มโฟลเดอร์ที่มีไฟล์วิดีโอและไฟล์คำบรรยายที่เกี่ยวข้อง โฟลเดอร์เหล่านี้จะถูกจดจำระหว่างเซสชัน ดังนั้นคุณไม่จำเป็นต้องเพิ่มใหม่ทุกครั้ง คุณสามารถเพิ่ม ลบ หรือล้างโฟลเดอร์ตามความจำเป็น เฉพาะโฟลเดอร์ที่มีอยู่เท่านั้นที่จะถูกโหลดเข้าโหมดแบตช์ เมื่อคลิก 'โหลดไลบรารี' มันจะโหลดวิดีโอและคำบรรยายทั้งหมดที่มีอยู่ในโฟลเดอร์ที่คุณเพิ่ม",
+    "ur_PK": "لائبریری مینیجر آپ کو بیچ موڈ میں تیزی سے رسائی کے لیے اکثر استعمال ہونے والے فولڈرز کو محفوظ کرنے کی اجازت دیتا ہے۔ ویڈیو فائلیں اور ان کی متعلقہ سب ٹائٹل فائلیں پر مشتمل فولڈرز شامل کریں۔ یہ فولڈرز سیشنز کے درمیان یاد رکھے جائیں گے، اس لیے آپ کو ہر بار انہیں دوبارہ شامل کرنے کی ضرورت نہیں ہوگی۔ آپ ضرورت کے مطابق فولڈرز شامل، ہٹا یا صاف کر سکتے ہیں۔ صرف موجودہ فولڈرز ہی بیچ موڈ میں لوڈ کیے جائیں گے۔ جب 'لائبریری لوڈ کریں' پر کلک کیا جائے گا، تو یہ آپ کے شامل کردہ فولڈرز میں موجود تمام ویڈیوز اور سب ٹائٹلز لوڈ کرے گا۔",
+}
+
+FOLDER_PATH = {
+    "en_US": "Folder Path",
+    "es_ES": "Ruta de carpeta",
+    "tr_TR": "Klasör Yolu",
+    "zh_CN": "文件夹路径",
+    "zh_TW": "資料夾路徑",
+    "ru_RU": "Путь к папке",
+    "pl_PL": "Ścieżka folderu",
+    "uk_UA": "Шлях до папки",
+    "ja_JP": "フォルダパス",
+    "ko_KR": "폴더 경로",
+    "hi_IN": "फोल्डर पथ",
+    "bn_BD": "ফোল্ডার পাথ",
+    "it_IT": "Percorso cartella",
+    "fr_FR": "Chemin du dossier",
+    "de_DE": "Ordnerpfad",
+    "pt_PT": "Caminho da pasta",
+    "ar_SA": "مسار المجلد",
+    "vi_VN": "Đường dẫn thư mục",
+    "fa_IR": "مسیر پوشه",
+    "id_ID": "Jalur Folder",
+    "ms_MY": "Laluan Folder",
+    "th_TH": "เส้นทางโฟลเดอร์",
+    "ur_PK": "فولڈر پاتھ",
+}
+
+STATUS = {
+    "en_US": "Status",
+    "es_ES": "Estado",
+    "tr_TR": "Durum",
+    "zh_CN": "状态",
+    "zh_TW": "狀態",
+    "ru_RU": "Статус",
+    "pl_PL": "Status",
+    "uk_UA": "Статус",
+    "ja_JP": "ステータス",
+    "ko_KR": "상태",
+    "hi_IN": "स्थिति",
+    "bn_BD": "স্ট্যাটাস",
+    "it_IT": "Stato",
+    "fr_FR": "Statut",
+    "de_DE": "Status",
+    "pt_PT": "Status",
+    "ar_SA": "الحالة",
+    "vi_VN": "Trạng thái",
+    "fa_IR": "وضعیت",
+    "id_ID": "Status",
+    "ms_MY": "Status",
+    "th_TH": "สถานะ",
+    "ur_PK": "سٹیٹس",
+}
+
+SYNC_TRACKING_ENABLED = {
+    "en_US": "Sync tracking: Enabled",
+    "es_ES": "Seguimiento de sincronización: Activado",
+    "tr_TR": "Senkron takibi: Etkin",
+    "zh_CN": "同步跟踪：已启用",
+    "zh_TW": "同步追蹤：已啟用",
+    "ru_RU": "Отслеживание синхронизации: Включено",
+    "pl_PL": "Śledzenie synchronizacji: Włączony",
+    "uk_UA": "Відстеження синхронізації: Увімкнено",
+    "ja_JP": "同期トラッキング：有効",
+    "ko_KR": "동기화 추적: 활성화됨",
+    "hi_IN": "सिंक ट्रैकिंग: सक्षम",
+    "bn_BD": "সিঙ্ক ট্র্যাকিং: সক্রিয়",
+    "it_IT": "Monitoraggio sincronizzazione: Abilitato",
+    "fr_FR": "Suivi de synchronisation: Activé",
+    "de_DE": "Sync-Tracking: Aktiviert",
+    "pt_PT": "Rastreamento de sincronização: Ativado",
+    "ar_SA": "تتبع المزامنة: مُفعّل",
+    "vi_VN": "Theo dõi đồng bộ: Đã bật",
+    "fa_IR": "ردیابی همگام‌سازی: فعال",
+    "id_ID": "Pelacakan sinkronisasi: Aktif",
+    "ms_MY": "Penjejakan penyegerakan: Diaktifkan",
+    "th_TH": "ติดตามการซิงค์: เปิดใช้งาน",
+    "ur_PK": "سنک ٹریکنگ: فعال",
+}
+
+SYNC_TRACKING_DISABLED = {
+    "en_US": "Sync tracking: Disabled",
+    "es_ES": "Seguimiento de sincronización: Desactivado",
+    "tr_TR": "Senkron takibi: Devre dışı",
+    "zh_CN": "同步跟踪：已禁用",
+    "zh_TW": "同步追蹤：已停用",
+    "ru_RU": "Отслеживание синхронизации: Отключено",
+    "pl_PL": "Śledzenie synchronizacji: Wyłączony",
+    "uk_UA": "Відстеження синхронізації: Вимкнено",
+    "ja_JP": "同期トラッキング：無効",
+    "ko_KR": "동기화 추적: 비활성화됨",
+    "hi_IN": "सिंक ट्रैकिंग: अक्षम",
+    "bn_BD": "সিঙ্ক ট্র্যাকিং: নিষ্ক্রিয়",
+    "it_IT": "Monitoraggio sincronizzazione: Disabilitato",
+    "fr_FR": "Suivi de synchronisation: Désactivé",
+    "de_DE": "Sync-Tracking: Deaktiviert",
+    "pt_PT": "Rastreamento de sincronização: Desativado",
+    "ar_SA": "تتبع المزامنة: مُعطّل",
+    "vi_VN": "Theo dõi đồng bộ: Đã tắt",
+    "fa_IR": "ردیابی همگام‌سازی: غیرفعال",
+    "id_ID": "Pelacakan sinkronisasi: Nonaktif",
+    "ms_MY": "Penjejakan penyegerakan: Dinyahaktifkan",
+    "th_TH": "ติดตามการซิงค์: ปิดใช้งาน",
+    "ur_PK": "سنک ٹریکنگ: غیر فعال",
+}
+
+SYNC_TRACKING_ADDED_TO_DATABASE = {
+    "en_US": "Sync tracking: Video added to processed items database.",
+    "es_ES": "Seguimiento de sincronización: Video añadido a la base de datos.",
+    "tr_TR": "Senkron takibi: Video veritabanına eklendi.",
+    "zh_CN": "同步跟踪：视频已添加到已处理项目数据库。",
+    "zh_TW": "同步追蹤：影片已新增至已處理項目資料庫。",
+    "ru_RU": "Отслеживание синхронизации: Видео добавлено в базу данных.",
+    "pl_PL": "Śledzenie synchronizacji: Film dodano do bazy danych.",
+    "uk_UA": "Відстеження синхронізації: Відео додано до бази даних.",
+    "ja_JP": "同期トラッキング：動画が処理済みデータベースに追加されました。",
+    "ko_KR": "동기화 추적: 동영상이 처리된 항목 데이터베이스에 추가됨.",
+    "hi_IN": "सिंक ट्रैकिंग: वीडियो प्रोसेस्ड आइटम डेटाबेस में जोड़ा गया।",
+    "bn_BD": "সিঙ্ক ট্র্যাকিং: ভিডিও প্রসেসড আইটেম ডাটাবেসে যোগ করা হয়েছে।",
+    "it_IT": "Monitoraggio sincronizzazione: Video aggiunto al database.",
+    "fr_FR": "Suivi de synchronisation: Vidéo ajoutée à la base de données.",
+    "de_DE": "Sync-Tracking: Video zur Datenbank hinzugefügt.",
+    "pt_PT": "Rastreamento de sincronização: Vídeo adicionado ao banco de dados.",
+    "ar_SA": "تتبع المزامنة: تمت إضافة الفيديو إلى قاعدة البيانات.",
+    "vi_VN": "Theo dõi đồng bộ: Video đã được thêm vào cơ sở dữ liệu.",
+    "fa_IR": "ردیابی همگام‌سازی: ویدیو به پایگاه داده اضافه شد.",
+    "id_ID": "Pelacakan sinkronisasi: Video ditambahkan ke database.",
+    "ms_MY": "Penjejakan penyegerakan: Video ditambah ke pangkalan data.",
+    "th_TH": "ติดตามการซิงค์: เพิ่มวิดีโอลงในฐานข้อมูลแล้ว",
+    "ur_PK": "سنک ٹریکنگ: ویڈیو ڈیٹابیس میں شامل کیا گیا۔",
+}
+
+BACKUP_PROCESSED_DATABASE = {
+    "en_US": "Backup processed items database",
+    "es_ES": "Respaldar base de datos de elementos procesados",
+    "tr_TR": "İşlenmiş öğeler veritabanını yedekle",
+    "zh_CN": "备份已处理项目数据库",
+    "zh_TW": "備份已處理項目資料庫",
+    "ru_RU": "Резервная копия базы данных обработанных элементов",
+    "pl_PL": "Kopia zapasowa bazy przetworzonych elementów",
+    "uk_UA": "Резервна копія бази оброблених елементів",
+    "ja_JP": "処理済みアイテムデータベースをバックアップ",
+    "ko_KR": "처리된 항목 데이터베이스 백업",
+    "hi_IN": "संसाधित आइटम डेटाबेस का बैकअप",
+    "bn_BD": "প্রসেসড আইটেম ডাটাবেস ব্যাকআপ",
+    "it_IT": "Backup database elementi elaborati",
+    "fr_FR": "Sauvegarder la base de données des éléments traités",
+    "de_DE": "Datenbank verarbeiteter Elemente sichern",
+    "pt_PT": "Backup do banco de dados de itens processados",
+    "ar_SA": "نسخ احتياطي لقاعدة بيانات العناصر المعالجة",
+    "vi_VN": "Sao lưu cơ sở dữ liệu mục đã xử lý",
+    "fa_IR": "پشتیبان‌گیری از پایگاه داده آیتم‌های پردازش شده",
+    "id_ID": "Cadangkan database item yang diproses",
+    "ms_MY": "Sandarkan pangkalan data item yang diproses",
+    "th_TH": "สำรองฐานข้อมูลรายการที่ประมวลผลแล้ว",
+    "ur_PK": "پراسیسڈ آئٹمز ڈیٹابیس کا بیک اپ",
+}
+
+IMPORT_PROCESSED_DATABASE = {
+    "en_US": "Import processed items database",
+    "es_ES": "Importar base de datos de elementos procesados",
+    "tr_TR": "İşlenmiş öğeler veritabanını içe aktar",
+    "zh_CN": "导入已处理项目数据库",
+    "zh_TW": "匯入已處理項目資料庫",
+    "ru_RU": "Импортировать базу данных обработанных элементов",
+    "pl_PL": "Importuj bazę przetworzonych elementów",
+    "uk_UA": "Імпортувати базу оброблених елементів",
+    "ja_JP": "処理済みアイテムデータベースをインポート",
+    "ko_KR": "처리된 항목 데이터베이스 가져오기",
+    "hi_IN": "संसाधित आइटम डेटाबेस आयात करें",
+    "bn_BD": "প্রসেসড আইটেম ডাটাবেস আমদানি করুন",
+    "it_IT": "Importa database elementi elaborati",
+    "fr_FR": "Importer la base de données des éléments traités",
+    "de_DE": "Datenbank verarbeiteter Elemente importieren",
+    "pt_PT": "Importar banco de dados de itens processados",
+    "ar_SA": "استيراد قاعدة بيانات العناصر المعالجة",
+    "vi_VN": "Nhập cơ sở dữ liệu mục đã xử lý",
+    "fa_IR": "وارد کردن پایگاه داده آیتم‌های پردازش شده",
+    "id_ID": "Impor database item yang diproses",
+    "ms_MY": "Import pangkalan data item yang diproses",
+    "th_TH": "นำเข้าฐานข้อมูลรายการที่ประมวลผลแล้ว",
+    "ur_PK": "پراسیسڈ آئٹمز ڈیٹابیس درآمد کریں",
+}
+
+DATABASE_NOT_FOUND = {
+    "en_US": "Database file not found.",
+    "es_ES": "Archivo de base de datos no encontrado.",
+    "tr_TR": "Veritabanı dosyası bulunamadı.",
+    "zh_CN": "未找到数据库文件。",
+    "zh_TW": "找不到資料庫檔案。",
+    "ru_RU": "Файл базы данных не найден.",
+    "pl_PL": "Nie znaleziono pliku bazy danych.",
+    "uk_UA": "Файл бази даних не знайдено.",
+    "ja_JP": "データベースファイルが見つかりません。",
+    "ko_KR": "데이터베이스 파일을 찾을 수 없습니다.",
+    "hi_IN": "डेटाबेस फाइल नहीं मिली।",
+    "bn_BD": "ডাটাবেস ফাইল পাওয়া যায়নি।",
+    "it_IT": "File database non trovato.",
+    "fr_FR": "Fichier de base de données introuvable.",
+    "de_DE": "Datenbankdatei nicht gefunden.",
+    "pt_PT": "Arquivo de banco de dados não encontrado.",
+    "ar_SA": "ملف قاعدة البيانات غير موجود.",
+    "vi_VN": "Không tìm thấy tệp cơ sở dữ liệu.",
+    "fa_IR": "فایل پایگاه داده یافت نشد.",
+    "id_ID": "File database tidak ditemukan.",
+    "ms_MY": "Fail pangkalan data tidak dijumpai.",
+    "th_TH": "ไม่พบไฟล์ฐานข้อมูล",
+    "ur_PK": "ڈیٹابیس فائل نہیں ملی۔",
+}
+
+DATABASE_BACKUP_SUCCESS = {
+    "en_US": "Database backed up successfully to:\n{path}",
+    "es_ES": "Base de datos respaldada exitosamente en:\n{path}",
+    "tr_TR": "Veritabanı başarıyla yedeklendi:\n{path}",
+    "zh_CN": "数据库已成功备份到：\n{path}",
+    "zh_TW": "資料庫備份成功至：\n{path}",
+    "ru_RU": "База данных успешно сохранена в:\n{path}",
+    "pl_PL": "Kopia zapasowa bazy danych utworzona pomyślnie:\n{path}",
+    "uk_UA": "Базу даних успішно збережено в:\n{path}",
+    "ja_JP": "データベースのバックアップが完了しました：\n{path}",
+    "ko_KR": "데이터베이스가 성공적으로 백업되었습니다:\n{path}",
+    "hi_IN": "डेटाबेस सफलतापूर्वक बैकअप किया गया:\n{path}",
+    "bn_BD": "ডাটাবেস সফলভাবে ব্যাকআপ হয়েছে:\n{path}",
+    "it_IT": "Backup del database completato con successo:\n{path}",
+    "fr_FR": "Base de données sauvegardée avec succès dans :\n{path}",
+    "de_DE": "Datenbank erfolgreich gesichert unter:\n{path}",
+    "pt_PT": "Backup do banco de dados realizado com sucesso:\n{path}",
+    "ar_SA": "تم نسخ قاعدة البيانات احتياطيًا بنجاح إلى:\n{path}",
+    "vi_VN": "Sao lưu cơ sở dữ liệu thành công tại:\n{path}",
+    "fa_IR": "پشتیبان‌گیری از پایگاه داده با موفقیت انجام شد:\n{path}",
+    "id_ID": "Database berhasil dicadangkan ke:\n{path}",
+    "ms_MY": "Pangkalan data berjaya disandarkan ke:\n{path}",
+    "th_TH": "สำรองฐานข้อมูลสำเร็จที่:\n{path}",
+    "ur_PK": "ڈیٹابیس کامیابی سے بیک اپ ہوگیا:\n{path}",
+}
+
+DATABASE_BACKUP_FAILED = {
+    "en_US": "Failed to backup database:\n{error}",
+    "es_ES": "Error al respaldar la base de datos:\n{error}",
+    "tr_TR": "Veritabanı yedeklenemedi:\n{error}",
+    "zh_CN": "备份数据库失败：\n{error}",
+    "zh_TW": "備份資料庫失敗：\n{error}",
+    "ru_RU": "Не удалось создать резервную копию базы данных:\n{error}",
+    "pl_PL": "Nie udało się utworzyć kopii zapasowej bazy danych:\n{error}",
+    "uk_UA": "Не вдалося створити резервну копію бази даних:\n{error}",
+    "ja_JP": "データベースのバックアップに失敗しました：\n{error}",
+    "ko_KR": "데이터베이스 백업 실패:\n{error}",
+    "hi_IN": "डेटाबेस बैकअप विफल:\n{error}",
+    "bn_BD": "ডাটাবেস ব্যাকআপ ব্যর্থ:\n{error}",
+    "it_IT": "Backup del database non riuscito:\n{error}",
+    "fr_FR": "Échec de la sauvegarde de la base de données :\n{error}",
+    "de_DE": "Datenbanksicherung fehlgeschlagen:\n{error}",
+    "pt_PT": "Falha ao fazer backup do banco de dados:\n{error}",
+    "ar_SA": "فشل في نسخ قاعدة البيانات احتياطيًا:\n{error}",
+    "vi_VN": "Sao lưu cơ sở dữ liệu thất bại:\n{error}",
+    "fa_IR": "پشتیبان‌گیری از پایگاه داده ناموفق بود:\n{error}",
+    "id_ID": "Gagal mencadangkan database:\n{error}",
+    "ms_MY": "Gagal menyandarkan pangkalan data:\n{error}",
+    "th_TH": "สำรองฐานข้อมูลล้มเหลว:\n{error}",
+    "ur_PK": "ڈیٹابیس بیک اپ ناکام:\n{error}",
+}
+
+DATABASE_IMPORT_SUCCESS = {
+    "en_US": "Successfully imported {imported} items.\n{skipped} duplicates were skipped.",
+    "es_ES": "Se importaron {imported} elementos exitosamente.\nSe omitieron {skipped} duplicados.",
+    "tr_TR": "{imported} öğe başarıyla içe aktarıldı.\n{skipped} kopya atlandı.",
+    "zh_CN": "成功导入 {imported} 个项目。\n跳过了 {skipped} 个重复项。",
+    "zh_TW": "成功匯入 {imported} 個項目。\n跳過了 {skipped} 個重複項目。",
+    "ru_RU": "Успешно импортировано {imported} элементов.\n{skipped} дубликатов пропущено.",
+    "pl_PL": "Pomyślnie zaimportowano {imported} elementów.\n{skipped} duplikatów zostało pominiętych.",
+    "uk_UA": "Успішно імпортовано {imported} елементів.\n{skipped} дублікатів пропущено.",
+    "ja_JP": "{imported}件のアイテムをインポートしました。\n{skipped}件の重複がスキップされました。",
+    "ko_KR": "{imported}개 항목을 성공적으로 가져왔습니다.\n{skipped}개 중복 항목이 건너뛰어졌습니다.",
+    "hi_IN": "{imported} आइटम सफलतापूर्वक आयात किए गए।\n{skipped} डुप्लिकेट छोड़े गए।",
+    "bn_BD": "{imported}টি আইটেম সফলভাবে আমদানি হয়েছে।\n{skipped}টি ডুপ্লিকেট এড়িয়ে যাওয়া হয়েছে।",
+    "it_IT": "Importati con successo {imported} elementi.\n{skipped} duplicati ignorati.",
+    "fr_FR": "{imported} éléments importés avec succès.\n{skipped} doublons ignorés.",
+    "de_DE": "{imported} Elemente erfolgreich importiert.\n{skipped} Duplikate wurden übersprungen.",
+    "pt_PT": "{imported} itens importados com sucesso.\n{skipped} duplicados foram ignorados.",
+    "ar_SA": "تم استيراد {imported} عنصر بنجاح.\nتم تخطي {skipped} مكرر.",
+    "vi_VN": "Đã nhập thành công {imported} mục.\n{skipped} mục trùng lặp đã bị bỏ qua.",
+    "fa_IR": "{imported} مورد با موفقیت وارد شد.\n{skipped} مورد تکراری رد شد.",
+    "id_ID": "Berhasil mengimpor {imported} item.\n{skipped} duplikat dilewati.",
+    "ms_MY": "Berjaya mengimport {imported} item.\n{skipped} pendua dilangkau.",
+    "th_TH": "นำเข้า {imported} รายการสำเร็จ\nข้าม {skipped} รายการที่ซ้ำกัน",
+    "ur_PK": "{imported} آئٹمز کامیابی سے درآمد ہوئے۔\n{skipped} ڈپلیکیٹس چھوڑے گئے۔",
+}
+
+DATABASE_IMPORT_FAILED = {
+    "en_US": "Failed to import database. Please ensure the file is a valid processed items database.",
+    "es_ES": "Error al importar la base de datos. Asegúrese de que el archivo sea una base de datos válida.",
+    "tr_TR": "Veritabanı içe aktarılamadı. Dosyanın geçerli bir veritabanı olduğundan emin olun.",
+    "zh_CN": "导入数据库失败。请确保文件是有效的已处理项目数据库。",
+    "zh_TW": "匯入資料庫失敗。請確認檔案是有效的已處理項目資料庫。",
+    "ru_RU": "Не удалось импортировать базу данных. Убедитесь, что файл является действительной базой данных.",
+    "pl_PL": "Nie udało się zaimportować bazy danych. Upewnij się, że plik jest prawidłową bazą danych.",
+    "uk_UA": "Не вдалося імпортувати базу даних. Переконайтеся, що файл є дійсною базою даних.",
+    "ja_JP": "データベースのインポートに失敗しました。ファイルが有効なデータベースであることを確認してください。",
+    "ko_KR": "데이터베이스 가져오기 실패. 파일이 유효한 데이터베이스인지 확인하세요.",
+    "hi_IN": "डेटाबेस आयात विफल। कृपया सुनिश्चित करें कि फाइल एक वैध डेटाबेस है।",
+    "bn_BD": "ডাটাবেস আমদানি ব্যর্থ। অনুগ্রহ করে নিশ্চিত করুন যে ফাইলটি একটি বৈধ ডাটাবেস।",
+    "it_IT": "Importazione database non riuscita. Assicurati che il file sia un database valido.",
+    "fr_FR": "Échec de l'importation de la base de données. Assurez-vous que le fichier est une base de données valide.",
+    "de_DE": "Datenbankimport fehlgeschlagen. Stellen Sie sicher, dass die Datei eine gültige Datenbank ist.",
+    "pt_PT": "Falha ao importar banco de dados. Certifique-se de que o arquivo é um banco de dados válido.",
+    "ar_SA": "فشل في استيراد قاعدة البيانات. تأكد من أن الملف قاعدة بيانات صالحة.",
+    "vi_VN": "Nhập cơ sở dữ liệu thất bại. Vui lòng đảm bảo tệp là cơ sở dữ liệu hợp lệ.",
+    "fa_IR": "وارد کردن پایگاه داده ناموفق بود. لطفاً مطمئن شوید فایل یک پایگاه داده معتبر است.",
+    "id_ID": "Gagal mengimpor database. Pastikan file adalah database yang valid.",
+    "ms_MY": "Gagal mengimport pangkalan data. Pastikan fail adalah pangkalan data yang sah.",
+    "th_TH": "นำเข้าฐานข้อมูลล้มเหลว กรุณาตรวจสอบว่าไฟล์เป็นฐานข้อมูลที่ถูกต้อง",
+    "ur_PK": "ڈیٹابیس درآمد ناکام۔ براہ کرم یقینی بنائیں کہ فائل ایک درست ڈیٹابیس ہے۔",
+}
+
+FOLDER_EXISTS = {
+    "en_US": "OK",
+    "es_ES": "OK",
+    "tr_TR": "Tamam",
+    "zh_CN": "正常",
+    "zh_TW": "正常",
+    "ru_RU": "ОК",
+    "pl_PL": "OK",
+    "uk_UA": "OK",
+    "ja_JP": "OK",
+    "ko_KR": "확인",
+    "hi_IN": "ठीक है",
+    "bn_BD": "ঠিক আছে",
+    "it_IT": "OK",
+    "fr_FR": "OK",
+    "de_DE": "OK",
+    "pt_PT": "OK",
+    "ar_SA": "موافق",
+    "vi_VN": "OK",
+    "fa_IR": "تأیید",
+    "id_ID": "OK",
+    "ms_MY": "OK",
+    "th_TH": "ตกลง",
+    "ur_PK": "ٹھیک ہے",
+}
+
+FOLDER_DOES_NOT_EXIST = {
+    "en_US": "Not found",
+    "es_ES": "No encontrado",
+    "tr_TR": "Bulunamadı",
+    "zh_CN": "未找到",
+    "zh_TW": "未找到",
+    "ru_RU": "Не найдено",
+    "pl_PL": "Nie znaleziono",
+    "uk_UA": "Не знайдено",
+    "ja_JP": "見つかりません",
+    "ko_KR": "찾을 수 없음",
+    "hi_IN": "नहीं मिला",
+    "bn_BD": "পাওয়া যায়নি",
+    "it_IT": "Non trovato",
+    "fr_FR": "Non trouvé",
+    "de_DE": "Nicht gefunden",
+    "pt_PT": "Não encontrado",
+    "ar_SA": "غير موجود",
+    "vi_VN": "Không tìm thấy",
+    "fa_IR": "یافت نشد",
+    "id_ID": "Tidak ditemukan",
+    "ms_MY": "Tidak dijumpai",
+    "th_TH": "ไม่พบ",
+    "ur_PK": "نہیں ملا",
+}
+
+SELECT_FOLDER = {
+    "en_US": "Select Folder",
+    "es_ES": "Seleccionar carpeta",
+    "tr_TR": "Klasör Seç",
+    "zh_CN": "选择文件夹",
+    "zh_TW": "選擇資料夾",
+    "ru_RU": "Выберите папку",
+    "pl_PL": "Wybierz folder",
+    "uk_UA": "Виберіть папку",
+    "ja_JP": "フォルダを選択",
+    "ko_KR": "폴더 선택",
+    "hi_IN": "फोल्डर चुनें",
+    "bn_BD": "ফোল্ডার নির্বাচন করুন",
+    "it_IT": "Seleziona cartella",
+    "fr_FR": "Sélectionner le dossier",
+    "de_DE": "Ordner auswählen",
+    "pt_PT": "Selecionar pasta",
+    "ar_SA": "حدد المجلد",
+    "vi_VN": "Chọn thư mục",
+    "fa_IR": "انتخاب پوشه",
+    "id_ID": "Pilih Folder",
+    "ms_MY": "Pilih Folder",
+    "th_TH": "เลือกโฟลเดอร์",
+    "ur_PK": "فولڈر منتخب کریں",
+}
+
+FOLDER_ALREADY_IN_LIBRARY = {
+    "en_US": "This folder is already in the library.",
+    "es_ES": "Esta carpeta ya está en la biblioteca.",
+    "tr_TR": "Bu klasör zaten kütüphanede.",
+    "zh_CN": "此文件夹已在媒体库中。",
+    "zh_TW": "此資料夾已在媒體庫中。",
+    "ru_RU": "Эта папка уже в библиотеке.",
+    "pl_PL": "Ten folder jest już w bibliotece.",
+    "uk_UA": "Ця папка вже в бібліотеці.",
+    "ja_JP": "このフォルダはすでにライブラリにあります。",
+    "ko_KR": "이 폴더는 이미 라이브러리에 있습니다.",
+    "hi_IN": "यह फोल्डर पहले से लाइब्रेरी में है।",
+    "bn_BD": "এই ফোল্ডারটি ইতিমধ্যে লাইব্রেরিতে রয়েছে।",
+    "it_IT": "Questa cartella è già nella libreria.",
+    "fr_FR": "Ce dossier est déjà dans la bibliothèque.",
+    "de_DE": "Dieser Ordner ist bereits in der Bibliothek.",
+    "pt_PT": "Esta pasta já está na biblioteca.",
+    "ar_SA": "هذا المجلد موجود بالفعل في المكتبة.",
+    "vi_VN": "Thư mục này đã có trong thư viện.",
+    "fa_IR": "این پوشه قبلاً در کتابخانه است.",
+    "id_ID": "Folder ini sudah ada di pustaka.",
+    "ms_MY": "Folder ini sudah ada dalam pustaka.",
+    "th_TH": "โฟลเดอร์นี้อยู่ในไลบรารีแล้ว",
+    "ur_PK": "یہ فولڈر پہلے سے لائبریری میں ہے۔",
+}
+
+FAILED_TO_ADD_FOLDER = {
+    "en_US": "Failed to add folder to library.",
+    "es_ES": "Error al agregar carpeta a la biblioteca.",
+    "tr_TR": "Klasör kütüphaneye eklenemedi.",
+    "zh_CN": "无法将文件夹添加到媒体库。",
+    "zh_TW": "無法將資料夾新增至媒體庫。",
+    "ru_RU": "Не удалось добавить папку в библиотеку.",
+    "pl_PL": "Nie udało się dodać folderu do biblioteki.",
+    "uk_UA": "Не вдалося додати папку до бібліотеки.",
+    "ja_JP": "フォルダをライブラリに追加できませんでした。",
+    "ko_KR": "라이브러리에 폴더를 추가하지 못했습니다.",
+    "hi_IN": "लाइब्रेरी में फोल्डर जोड़ने में विफल।",
+    "bn_BD": "লাইব্রেরিতে ফোল্ডার যোগ করতে ব্যর্থ।",
+    "it_IT": "Impossibile aggiungere la cartella alla libreria.",
+    "fr_FR": "Échec de l'ajout du dossier à la bibliothèque.",
+    "de_DE": "Ordner konnte nicht zur Bibliothek hinzugefügt werden.",
+    "pt_PT": "Falha ao adicionar pasta à biblioteca.",
+    "ar_SA": "فشل في إضافة المجلد إلى المكتبة.",
+    "vi_VN": "Không thể thêm thư mục vào thư viện.",
+    "fa_IR": "افزودن پوشه به کتابخانه ناموفق بود.",
+    "id_ID": "Gagal menambahkan folder ke pustaka.",
+    "ms_MY": "Gagal menambah folder ke pustaka.",
+    "th_TH": "ไม่สามารถเพิ่มโฟลเดอร์ลงในไลบรารี",
+    "ur_PK": "لائبریری میں فولڈر شامل کرنے میں ناکام۔",
+}
+
+CONFIRM_REMOVE_FOLDERS = {
+    "en_US": "Are you sure you want to remove {count} folders from the library?",
+    "es_ES": "¿Está seguro de que desea eliminar {count} carpetas de la biblioteca?",
+    "tr_TR": "{count} klasörü kütüphaneden kaldırmak istediğinizden emin misiniz?",
+    "zh_CN": "您确定要从媒体库中删除 {count} 个文件夹吗？",
+    "zh_TW": "您確定要從媒體庫中移除 {count} 個資料夾嗎？",
+    "ru_RU": "Вы уверены, что хотите удалить {count} папок из библиотеки?",
+    "pl_PL": "Czy na pewno chcesz usunąć {count} folderów z biblioteki?",
+    "uk_UA": "Ви впевнені, що хочете видалити {count} папок з бібліотеки?",
+    "ja_JP": "ライブラリから {count} 個のフォルダを削除してもよろしいですか？",
+    "ko_KR": "라이브러리에서 {count}개의 폴더를 제거하시겠습니까?",
+    "hi_IN": "क्या आप लाइब्रेरी से {count} फोल्डर हटाना चाहते हैं?",
+    "bn_BD": "আপনি কি নিশ্চিত যে আপনি লাইব্রেরি থেকে {count}টি ফোল্ডার সরাতে চান?",
+    "it_IT": "Sei sicuro di voler rimuovere {count} cartelle dalla libreria?",
+    "fr_FR": "Êtes-vous sûr de vouloir supprimer {count} dossiers de la bibliothèque?",
+    "de_DE": "Sind Sie sicher, dass Sie {count} Ordner aus der Bibliothek entfernen möchten?",
+    "pt_PT": "Tem certeza de que deseja remover {count} pastas da biblioteca?",
+    "ar_SA": "هل أنت متأكد من أنك تريد إزالة {count} مجلدات من المكتبة؟",
+    "vi_VN": "Bạn có chắc chắn muốn xóa {count} thư mục khỏi thư viện không?",
+    "fa_IR": "آیا مطمئن هستید که می‌خواهید {count} پوشه را از کتابخانه حذف کنید؟",
+    "id_ID": "Apakah Anda yakin ingin menghapus {count} folder dari pustaka?",
+    "ms_MY": "Adakah anda pasti mahu mengalih keluar {count} folder dari pustaka?",
+    "th_TH": "คุณแน่ใจหรือไม่ว่าต้องการลบ {count} โฟลเดอร์ออกจากไลบรารี?",
+    "ur_PK": "کیا آپ واقعی لائبریری سے {count} فولڈرز ہٹانا چاہتے ہیں؟",
+}
+
+CONFIRM_CLEAR_LIBRARY = {
+    "en_US": "Are you sure you want to remove all {count} folders from the library?",
+    "es_ES": "¿Está seguro de que desea eliminar las {count} carpetas de la biblioteca?",
+    "tr_TR": "Tüm {count} klasörü kütüphaneden kaldırmak istediğinizden emin misiniz?",
+    "zh_CN": "您确定要从媒体库中删除所有 {count} 个文件夹吗？",
+    "zh_TW": "您確定要從媒體庫中移除所有 {count} 個資料夾嗎？",
+    "ru_RU": "Вы уверены, что хотите удалить все {count} папок из библиотеки?",
+    "pl_PL": "Czy na pewno chcesz usunąć wszystkie {count} folderów z biblioteki?",
+    "uk_UA": "Ви впевнені, що хочете видалити всі {count} папок з бібліотеки?",
+    "ja_JP": "ライブラリからすべての {count} 個のフォルダを削除してもよろしいですか？",
+    "ko_KR": "라이브러리에서 모든 {count}개의 폴더를 제거하시겠습니까?",
+    "hi_IN": "क्या आप लाइब्रेरी से सभी {count} फोल्डर हटाना चाहते हैं?",
+    "bn_BD": "আপনি কি নিশ্চিত যে আপনি লাইব্রেরি থেকে সমস্ত {count}টি ফোল্ডার সরাতে চান?",
+    "it_IT": "Sei sicuro di voler rimuovere tutte le {count} cartelle dalla libreria?",
+    "fr_FR": "Êtes-vous sûr de vouloir supprimer tous les {count} dossiers de la bibliothèque?",
+    "de_DE": "Sind Sie sicher, dass Sie alle {count} Ordner aus der Bibliothek entfernen möchten?",
+    "pt_PT": "Tem certeza de que deseja remover todas as {count} pastas da biblioteca?",
+    "ar_SA": "هل أنت متأكد من أنك تريد إزالة جميع المجلدات الـ {count} من المكتبة؟",
+    "vi_VN": "Bạn có chắc chắn muốn xóa tất cả {count} thư mục khỏi thư viện không?",
+    "fa_IR": "آیا مطمئن هستید که می‌خواهید همه {count} پوشه را از کتابخانه حذف کنید؟",
+    "id_ID": "Apakah Anda yakin ingin menghapus semua {count} folder dari pustaka?",
+    "ms_MY": "Adakah anda pasti mahu mengalih keluar semua {count} folder dari pustaka?",
+    "th_TH": "คุณแน่ใจหรือไม่ว่าต้องการลบโฟลเดอร์ทั้ง {count} รายการออกจากไลบรารี?",
+    "ur_PK": "کیا آپ واقعی لائبریری سے تمام {count} فولڈرز ہٹانا چاہتے ہیں؟",
+}
+
+LIBRARY_FOLDER_COUNT = {
+    "en_US": "{count} folder(s) in library",
+    "es_ES": "{count} carpeta(s) en la biblioteca",
+    "tr_TR": "Kütüphanede {count} klasör",
+    "zh_CN": "媒体库中有 {count} 个文件夹",
+    "zh_TW": "媒體庫中有 {count} 個資料夾",
+    "ru_RU": "{count} папок в библиотеке",
+    "pl_PL": "{count} folder(ów) w bibliotece",
+    "uk_UA": "{count} папок у бібліотеці",
+    "ja_JP": "ライブラリに {count} 個のフォルダ",
+    "ko_KR": "라이브러리에 {count}개의 폴더",
+    "hi_IN": "लाइब्रेरी में {count} फोल्डर",
+    "bn_BD": "লাইব্রেরিতে {count}টি ফোল্ডার",
+    "it_IT": "{count} cartella(e) nella libreria",
+    "fr_FR": "{count} dossier(s) dans la bibliothèque",
+    "de_DE": "{count} Ordner in der Bibliothek",
+    "pt_PT": "{count} pasta(s) na biblioteca",
+    "ar_SA": "{count} مجلد(ات) في المكتبة",
+    "vi_VN": "{count} thư mục trong thư viện",
+    "fa_IR": "{count} پوشه در کتابخانه",
+    "id_ID": "{count} folder di pustaka",
+    "ms_MY": "{count} folder dalam pustaka",
+    "th_TH": "{count} โฟลเดอร์ในไลบรารี",
+    "ur_PK": "لائبریری میں {count} فولڈر",
+}
+
+CLEAR_ALL = {
+    "en_US": "Clear All",
+    "es_ES": "Borrar todo",
+    "tr_TR": "Tümünü Temizle",
+    "zh_CN": "全部清除",
+    "zh_TW": "全部清除",
+    "ru_RU": "Очистить все",
+    "pl_PL": "Wyczyść wszystko",
+    "uk_UA": "Очистити все",
+    "ja_JP": "すべてクリア",
+    "ko_KR": "모두 지우기",
+    "hi_IN": "सब साफ करें",
+    "bn_BD": "সব মুছুন",
+    "it_IT": "Cancella tutto",
+    "fr_FR": "Tout effacer",
+    "de_DE": "Alles löschen",
+    "pt_PT": "Limpar tudo",
+    "ar_SA": "مسح الكل",
+    "vi_VN": "Xóa tất cả",
+    "fa_IR": "پاک کردن همه",
+    "id_ID": "Hapus Semua",
+    "ms_MY": "Kosongkan Semua",
+    "th_TH": "ล้างทั้งหมด",
+    "ur_PK": "سب صاف کریں",
+}
+
+NO_VALID_LIBRARY_FOLDERS = {
+    "en_US": "No valid folders found in library. All folders may have been moved or deleted.",
+    "es_ES": "No se encontraron carpetas válidas en la biblioteca. Todas las carpetas pueden haber sido movidas o eliminadas.",
+    "tr_TR": "Kütüphanede geçerli klasör bulunamadı. Tüm klasörler taşınmış veya silinmiş olabilir.",
+    "zh_CN": "媒体库中未找到有效文件夹。所有文件夹可能已被移动或删除。",
+    "zh_TW": "媒體庫中未找到有效資料夾。所有資料夾可能已被移動或刪除。",
+    "ru_RU": "В библиотеке не найдено допустимых папок. Все папки могли быть перемещены или удалены.",
+    "pl_PL": "Nie znaleziono prawidłowych folderów w bibliotece. Wszystkie foldery mogły zostać przeniesione lub usunięte.",
+    "uk_UA": "У бібліотеці не знайдено дійсних папок. Усі папки могли бути переміщені або видалені.",
+    "ja_JP": "ライブラリに有効なフォルダが見つかりません。すべてのフォルダが移動または削除された可能性があります。",
+    "ko_KR": "라이브러리에서 유효한 폴더를 찾을 수 없습니다. 모든 폴더가 이동되거나 삭제되었을 수 있습니다.",
+    "hi_IN": "लाइब्रेरी में कोई वैध फोल्डर नहीं मिला। सभी फोल्डर स्थानांतरित या हटा दिए गए हो सकते हैं।",
+    "bn_BD": "লাইব্রেরিতে কোনো বৈধ ফোল্ডার পাওয়া যায়নি। সমস্ত ফোল্ডার সরানো বা মুছে ফেলা হয়ে থাকতে পারে।",
+    "it_IT": "Nessuna cartella valida trovata nella libreria. Tutte le cartelle potrebbero essere state spostate o eliminate.",
+    "fr_FR": "Aucun dossier valide trouvé dans la bibliothèque. Tous les dossiers ont peut-être été déplacés ou supprimés.",
+    "de_DE": "Keine gültigen Ordner in der Bibliothek gefunden. Alle Ordner wurden möglicherweise verschoben oder gelöscht.",
+    "pt_PT": "Nenhuma pasta válida encontrada na biblioteca. Todas as pastas podem ter sido movidas ou excluídas.",
+    "ar_SA": "لم يتم العثور على مجلدات صالحة في المكتبة. قد تكون جميع المجلدات قد تم نقلها أو حذفها.",
+    "vi_VN": "Không tìm thấy thư mục hợp lệ trong thư viện. Tất cả các thư mục có thể đã bị di chuyển hoặc xóa.",
+    "fa_IR": "هیچ پوشه معتبری در کتابخانه یافت نشد. ممکن است همه پوشه‌ها جابجا یا حذف شده باشند.",
+    "id_ID": "Tidak ditemukan folder valid di pustaka. Semua folder mungkin telah dipindahkan atau dihapus.",
+    "ms_MY": "Tiada folder sah ditemui dalam pustaka. Semua folder mungkin telah dialih atau dipadam.",
+    "th_TH": "ไม่พบโฟลเดอร์ที่ถูกต้องในไลบรารี โฟลเดอร์ทั้งหมดอาจถูกย้ายหรือลบไปแล้ว",
+    "ur_PK": "لائبریری میں کوئی درست فولڈر نہیں ملا۔ تمام فولڈرز منتقل یا حذف ہو سکتے ہیں۔",
+}
+
+INFORMATION = {
+    "en_US": "Information",
+    "es_ES": "Información",
+    "tr_TR": "Bilgi",
+    "zh_CN": "信息",
+    "zh_TW": "資訊",
+    "ru_RU": "Информация",
+    "pl_PL": "Informacja",
+    "uk_UA": "Інформація",
+    "ja_JP": "情報",
+    "ko_KR": "정보",
+    "hi_IN": "जानकारी",
+    "bn_BD": "তথ্য",
+    "it_IT": "Informazione",
+    "fr_FR": "Information",
+    "de_DE": "Information",
+    "pt_PT": "Informação",
+    "ar_SA": "معلومات",
+    "vi_VN": "Thông tin",
+    "fa_IR": "اطلاعات",
+    "id_ID": "Informasi",
+    "ms_MY": "Maklumat",
+    "th_TH": "ข้อมูล",
+    "ur_PK": "معلومات",
+}
+
+DOWNLOADING_FFMPEG = {
+    "en_US": "Downloading FFmpeg...",
+    "es_ES": "Descargando FFmpeg...",
+    "tr_TR": "FFmpeg indiriliyor...",
+    "zh_CN": "正在下载 FFmpeg...",
+    "zh_TW": "正在下載 FFmpeg...",
+    "ru_RU": "Загрузка FFmpeg...",
+    "pl_PL": "Pobieranie FFmpeg...",
+    "uk_UA": "Завантаження FFmpeg...",
+    "ja_JP": "FFmpegをダウンロード中...",
+    "ko_KR": "FFmpeg 다운로드 중...",
+    "hi_IN": "FFmpeg डाउनलोड हो रहा है...",
+    "bn_BD": "FFmpeg ডাউনলোড হচ্ছে...",
+    "it_IT": "Download di FFmpeg...",
+    "fr_FR": "Téléchargement de FFmpeg...",
+    "de_DE": "FFmpeg wird heruntergeladen...",
+    "pt_PT": "Baixando FFmpeg...",
+    "ar_SA": "جاري تنزيل FFmpeg...",
+    "vi_VN": "Đang tải FFmpeg...",
+    "fa_IR": "در حال دانلود FFmpeg...",
+    "id_ID": "Mengunduh FFmpeg...",
+    "ms_MY": "Memuat turun FFmpeg...",
+    "th_TH": "กำลังดาวน์โหลด FFmpeg...",
+    "ur_PK": "FFmpeg ڈاؤن لوڈ ہو رہا ہے...",
+}
+
+DOWNLOADING_FFMPEG_FIRST_RUN = {
+    "en_US": "FFmpeg is required for this application.\nDownloading FFmpeg binaries (first run only)...",
+    "es_ES": "FFmpeg es necesario para esta aplicación.\nDescargando binarios de FFmpeg (solo la primera ejecución)...",
+    "tr_TR": "Bu uygulama için FFmpeg gereklidir.\nFFmpeg dosyaları indiriliyor (yalnızca ilk çalıştırmada)...",
+    "zh_CN": "此应用程序需要 FFmpeg。\n正在下载 FFmpeg 二进制文件（仅首次运行）...",
+    "zh_TW": "此應用程式需要 FFmpeg。\n正在下載 FFmpeg 二進位檔案（僅首次執行）...",
+    "ru_RU": "FFmpeg необходим для этого приложения.\nЗагрузка бинарных файлов FFmpeg (только при первом запуске)...",
+    "pl_PL": "FFmpeg jest wymagany dla tej aplikacji.\nPobieranie plików FFmpeg (tylko przy pierwszym uruchomieniu)...",
+    "uk_UA": "FFmpeg необхідний для цього додатку.\nЗавантаження бінарних файлів FFmpeg (лише при першому запуску)...",
+    "ja_JP": "このアプリケーションにはFFmpegが必要です。\nFFmpegバイナリをダウンロード中（初回起動時のみ）...",
+    "ko_KR": "이 애플리케이션에는 FFmpeg가 필요합니다.\nFFmpeg 바이너리 다운로드 중 (첫 실행 시에만)...",
+    "hi_IN": "इस एप्लिकेशन के लिए FFmpeg आवश्यक है।\nFFmpeg बाइनरी डाउनलोड हो रही है (केवल पहली बार)...",
+    "bn_BD": "এই অ্যাপ্লিকেশনের জন্য FFmpeg প্রয়োজন।\nFFmpeg বাইনারি ডাউনলোড হচ্ছে (শুধুমাত্র প্রথম চালু)...",
+    "it_IT": "FFmpeg è richiesto per questa applicazione.\nDownload dei binari FFmpeg (solo alla prima esecuzione)...",
+    "fr_FR": "FFmpeg est requis pour cette application.\nTéléchargement des binaires FFmpeg (première exécution uniquement)...",
+    "de_DE": "FFmpeg wird für diese Anwendung benötigt.\nFFmpeg-Binärdateien werden heruntergeladen (nur beim ersten Start)...",
+    "pt_PT": "FFmpeg é necessário para esta aplicação.\nBaixando binários do FFmpeg (apenas na primeira execução)...",
+    "ar_SA": "FFmpeg مطلوب لهذا التطبيق.\nجاري تنزيل ملفات FFmpeg (التشغيل الأول فقط)...",
+    "vi_VN": "FFmpeg là bắt buộc cho ứng dụng này.\nĐang tải các tệp FFmpeg (chỉ chạy lần đầu)...",
+    "fa_IR": "FFmpeg برای این برنامه ضروری است.\nدر حال دانلود فایل‌های FFmpeg (فقط اجرای اول)...",
+    "id_ID": "FFmpeg diperlukan untuk aplikasi ini.\nMengunduh biner FFmpeg (hanya saat pertama kali dijalankan)...",
+    "ms_MY": "FFmpeg diperlukan untuk aplikasi ini.\nMemuat turun binari FFmpeg (hanya kali pertama)...",
+    "th_TH": "FFmpeg จำเป็นสำหรับแอปพลิเคชันนี้\nกำลังดาวน์โหลดไฟล์ FFmpeg (เฉพาะครั้งแรก)...",
+    "ur_PK": "اس ایپلیکیشن کے لیے FFmpeg ضروری ہے۔\nFFmpeg فائلیں ڈاؤن لوڈ ہو رہی ہیں (صرف پہلی بار)...",
+}
+
+FFMPEG_DOWNLOAD_COMPLETE = {
+    "en_US": "FFmpeg download complete!",
+    "es_ES": "¡Descarga de FFmpeg completada!",
+    "tr_TR": "FFmpeg indirme tamamlandı!",
+    "zh_CN": "FFmpeg 下载完成！",
+    "zh_TW": "FFmpeg 下載完成！",
+    "ru_RU": "Загрузка FFmpeg завершена!",
+    "pl_PL": "Pobieranie FFmpeg zakończone!",
+    "uk_UA": "Завантаження FFmpeg завершено!",
+    "ja_JP": "FFmpegのダウンロードが完了しました！",
+    "ko_KR": "FFmpeg 다운로드 완료!",
+    "hi_IN": "FFmpeg डाउनलोड पूर्ण!",
+    "bn_BD": "FFmpeg ডাউনলোড সম্পূর্ণ!",
+    "it_IT": "Download di FFmpeg completato!",
+    "fr_FR": "Téléchargement de FFmpeg terminé !",
+    "de_DE": "FFmpeg-Download abgeschlossen!",
+    "pt_PT": "Download do FFmpeg concluído!",
+    "ar_SA": "اكتمل تنزيل FFmpeg!",
+    "vi_VN": "Tải FFmpeg hoàn tất!",
+    "fa_IR": "دانلود FFmpeg کامل شد!",
+    "id_ID": "Unduhan FFmpeg selesai!",
+    "ms_MY": "Muat turun FFmpeg selesai!",
+    "th_TH": "ดาวน์โหลด FFmpeg เสร็จสมบูรณ์!",
+    "ur_PK": "FFmpeg ڈاؤن لوڈ مکمل!",
+}
+
+FFMPEG_DOWNLOAD_FAILED = {
+    "en_US": "FFmpeg download failed: {error}\nSome features may not work correctly.",
+    "es_ES": "Error al descargar FFmpeg: {error}\nAlgunas funciones pueden no funcionar correctamente.",
+    "tr_TR": "FFmpeg indirme başarısız: {error}\nBazı özellikler düzgün çalışmayabilir.",
+    "zh_CN": "FFmpeg 下载失败：{error}\n某些功能可能无法正常工作。",
+    "zh_TW": "FFmpeg 下載失敗：{error}\n某些功能可能無法正常運作。",
+    "ru_RU": "Ошибка загрузки FFmpeg: {error}\nНекоторые функции могут работать некорректно.",
+    "pl_PL": "Pobieranie FFmpeg nie powiodło się: {error}\nNiektóre funkcje mogą nie działać poprawnie.",
+    "uk_UA": "Помилка завантаження FFmpeg: {error}\nДеякі функції можуть працювати некоректно.",
+    "ja_JP": "FFmpegのダウンロードに失敗しました：{error}\n一部の機能が正しく動作しない可能性があります。",
+    "ko_KR": "FFmpeg 다운로드 실패: {error}\n일부 기능이 제대로 작동하지 않을 수 있습니다.",
+    "hi_IN": "FFmpeg डाउनलोड विफल: {error}\nकुछ सुविधाएँ ठीक से काम नहीं कर सकती हैं।",
+    "bn_BD": "FFmpeg ডাউনলোড ব্যর্থ: {error}\nকিছু বৈশিষ্ট্য সঠিকভাবে কাজ নাও করতে পারে।",
+    "it_IT": "Download di FFmpeg fallito: {error}\nAlcune funzionalità potrebbero non funzionare correttamente.",
+    "fr_FR": "Échec du téléchargement de FFmpeg : {error}\nCertaines fonctionnalités peuvent ne pas fonctionner correctement.",
+    "de_DE": "FFmpeg-Download fehlgeschlagen: {error}\nEinige Funktionen funktionieren möglicherweise nicht richtig.",
+    "pt_PT": "Falha no download do FFmpeg: {error}\nAlgumas funcionalidades podem não funcionar corretamente.",
+    "ar_SA": "فشل تنزيل FFmpeg: {error}\nقد لا تعمل بعض الميزات بشكل صحيح.",
+    "vi_VN": "Tải FFmpeg thất bại: {error}\nMột số tính năng có thể không hoạt động đúng.",
+    "fa_IR": "دانلود FFmpeg ناموفق بود: {error}\nبرخی ویژگی‌ها ممکن است به درستی کار نکنند.",
+    "id_ID": "Unduhan FFmpeg gagal: {error}\nBeberapa fitur mungkin tidak berfungsi dengan benar.",
+    "ms_MY": "Muat turun FFmpeg gagal: {error}\nSesetengah ciri mungkin tidak berfungsi dengan betul.",
+    "th_TH": "ดาวน์โหลด FFmpeg ล้มเหลว: {error}\nบางฟีเจอร์อาจไม่ทำงานอย่างถูกต้อง",
+    "ur_PK": "FFmpeg ڈاؤن لوڈ ناکام: {error}\nکچھ خصوصیات ٹھیک سے کام نہیں کر سکتیں۔",
+}
+
+DOWNLOADING_DEPENDENCIES = {
+    "en_US": "Downloading required files...",
+    "es_ES": "Descargando archivos necesarios...",
+    "tr_TR": "Gerekli dosyalar indiriliyor...",
+    "zh_CN": "正在下载必要文件...",
+    "zh_TW": "正在下載必要檔案...",
+    "ru_RU": "Загрузка необходимых файлов...",
+    "pl_PL": "Pobieranie wymaganych plików...",
+    "uk_UA": "Завантаження необхідних файлів...",
+    "ja_JP": "必要なファイルをダウンロード中...",
+    "ko_KR": "필요한 파일 다운로드 중...",
+    "hi_IN": "आवश्यक फ़ाइलें डाउनलोड हो रही हैं...",
+    "bn_BD": "প্রয়োজনীয় ফাইল ডাউনলোড হচ্ছে...",
+    "it_IT": "Download dei file necessari...",
+    "fr_FR": "Téléchargement des fichiers requis...",
+    "de_DE": "Erforderliche Dateien werden heruntergeladen...",
+    "pt_PT": "Baixando arquivos necessários...",
+    "ar_SA": "جاري تنزيل الملفات المطلوبة...",
+    "vi_VN": "Đang tải các tệp cần thiết...",
+    "fa_IR": "در حال دانلود فایل‌های مورد نیاز...",
+    "id_ID": "Mengunduh file yang diperlukan...",
+    "ms_MY": "Memuat turun fail yang diperlukan...",
+    "th_TH": "กำลังดาวน์โหลดไฟล์ที่จำเป็น...",
+    "ur_PK": "ضروری فائلیں ڈاؤن لوڈ ہو رہی ہیں...",
+}
+
+DOWNLOADING_LAPSE = {
+    "en_US": "Downloading lapse...",
+    "es_ES": "Descargando lapse...",
+    "tr_TR": "lapse indiriliyor...",
+    "zh_CN": "正在下载 lapse...",
+    "zh_TW": "正在下載 lapse...",
+    "ru_RU": "Загрузка lapse...",
+    "pl_PL": "Pobieranie lapse...",
+    "uk_UA": "Завантаження lapse...",
+    "ja_JP": "lapseをダウンロード中...",
+    "ko_KR": "lapse 다운로드 중...",
+    "hi_IN": "lapse डाउनलोड हो रहा है...",
+    "bn_BD": "lapse ডাউনলোড হচ্ছে...",
+    "it_IT": "Download di lapse...",
+    "fr_FR": "Téléchargement de lapse...",
+    "de_DE": "lapse wird heruntergeladen...",
+    "pt_PT": "Baixando lapse...",
+    "ar_SA": "جاري تنزيل lapse...",
+    "vi_VN": "Đang tải lapse...",
+    "fa_IR": "در حال دانلود lapse...",
+    "id_ID": "Mengunduh lapse...",
+    "ms_MY": "Memuat turun lapse...",
+    "th_TH": "กำลังดาวน์โหลด lapse...",
+    "ur_PK": "lapse ڈاؤن لوڈ ہو رہا ہے...",
+}
+
+DOWNLOADING_LAPSE_FIRST_RUN = {
+    "en_US": "lapse is a new sync tool.\nDownloading lapse binaries (first run only)...",
+    "es_ES": "lapse es una nueva herramienta de sincronización.\nDescargando archivos de lapse (solo la primera ejecución)...",
+    "tr_TR": "lapse yeni bir senkronizasyon aracıdır.\nlapse dosyaları indiriliyor (yalnızca ilk çalıştırmada)...",
+    "zh_CN": "lapse 是一个新的同步工具。\n正在下载 lapse 二进制文件（仅首次运行）...",
+    "zh_TW": "lapse 是一個新的同步工具。\n正在下載 lapse 二進位檔案（僅首次執行）...",
+    "ru_RU": "lapse — новый инструмент синхронизации.\nЗагрузка файлов lapse (только при первом запуске)...",
+    "pl_PL": "lapse to nowe narzędzie do synchronizacji.\nPobieranie plików lapse (tylko przy pierwszym uruchomieniu)...",
+    "uk_UA": "lapse — новий інструмент синхронізації.\nЗавантаження файлів lapse (лише при першому запуску)...",
+    "ja_JP": "lapseは新しい同期ツールです。\nlapseバイナリをダウンロード中（初回起動時のみ）...",
+    "ko_KR": "lapse는 새로운 동기화 도구입니다.\nlapse 바이너리 다운로드 중 (첫 실행 시에만)...",
+    "hi_IN": "lapse एक नया सिंक टूल है।\nlapse बाइनरी डाउनलोड हो रही है (केवल पहली बार)...",
+    "bn_BD": "lapse একটি নতুন সিঙ্ক টুল।\nlapse বাইনারি ডাউনলোড হচ্ছে (শুধুমাত্র প্রথম চালু)...",
+    "it_IT": "lapse è un nuovo strumento di sincronizzazione.\nDownload dei file lapse (solo alla prima esecuzione)...",
+    "fr_FR": "lapse est un nouvel outil de synchronisation.\nTéléchargement des fichiers lapse (première exécution uniquement)...",
+    "de_DE": "lapse ist ein neues Synchronisierungswerkzeug.\nlapse-Dateien werden heruntergeladen (nur beim ersten Start)...",
+    "pt_PT": "lapse é uma nova ferramenta de sincronização.\nBaixando arquivos do lapse (apenas na primeira execução)...",
+    "ar_SA": "lapse أداة مزامنة جديدة.\nجاري تنزيل ملفات lapse (التشغيل الأول فقط)...",
+    "vi_VN": "lapse là một công cụ đồng bộ mới.\nĐang tải các tệp lapse (chỉ chạy lần đầu)...",
+    "fa_IR": "lapse ابزار همگام‌سازی جدیدی است.\nدر حال دانلود فایل‌های lapse (فقط اجرای اول)...",
+    "id_ID": "lapse adalah alat sinkronisasi baru.\nMengunduh file lapse (hanya saat pertama kali)...",
+    "ms_MY": "lapse ialah alat penyelarasan baharu.\nMemuat turun fail lapse (hanya kali pertama)...",
+    "th_TH": "lapse เป็นเครื่องมือซิงค์ใหม่\nกำลังดาวน์โหลดไฟล์ lapse (เฉพาะครั้งแรก)...",
+    "ur_PK": "lapse ایک نیا سنک ٹول ہے۔\nlapse فائلیں ڈاؤن لوڈ ہو رہی ہیں (صرف پہلی بار)...",
+}
+
+LAPSE_DOWNLOAD_FAILED = {
+    "en_US": "lapse download failed: {error}\nAudio-based synchronization may not work.",
+    "es_ES": "Error al descargar lapse: {error}\nLa sincronización basada en audio puede no funcionar.",
+    "tr_TR": "lapse indirme başarısız: {error}\nSes tabanlı senkronizasyon çalışmayabilir.",
+    "zh_CN": "lapse 下载失败：{error}\n音频同步可能无法正常工作。",
+    "zh_TW": "lapse 下載失敗：{error}\n音訊同步可能無法正常運作。",
+    "ru_RU": "Ошибка загрузки lapse: {error}\nСинхронизация по аудио может не работать.",
+    "pl_PL": "Pobieranie lapse nie powiodło się: {error}\nSynchronizacja audio może nie działać.",
+    "uk_UA": "Помилка завантаження lapse: {error}\nСинхронізація за аудіо може не працювати.",
+    "ja_JP": "lapseのダウンロードに失敗しました：{error}\n音声ベースの同期が機能しない場合があります。",
+    "ko_KR": "lapse 다운로드 실패: {error}\n오디오 기반 동기화가 작동하지 않을 수 있습니다.",
+    "hi_IN": "lapse डाउनलोड विफल: {error}\nऑडियो-आधारित सिंक्रोनाइज़ेशन काम नहीं कर सकता।",
+    "bn_BD": "lapse ডাউনলোড ব্যর্থ: {error}\nঅডিও-ভিত্তিক সিঙ্ক্রোনাইজেশন কাজ নাও করতে পারে।",
+    "it_IT": "Download di lapse fallito: {error}\nLa sincronizzazione audio potrebbe non funzionare.",
+    "fr_FR": "Échec du téléchargement de lapse : {error}\nLa synchronisation audio peut ne pas fonctionner.",
+    "de_DE": "lapse-Download fehlgeschlagen: {error}\nDie audiobasierte Synchronisation funktioniert möglicherweise nicht.",
+    "pt_PT": "Falha no download do lapse: {error}\nA sincronização baseada em áudio pode não funcionar.",
+    "ar_SA": "فشل تنزيل lapse: {error}\nقد لا تعمل المزامنة المستندة إلى الصوت.",
+    "vi_VN": "Tải lapse thất bại: {error}\nĐồng bộ dựa trên âm thanh có thể không hoạt động.",
+    "fa_IR": "دانلود lapse ناموفق بود: {error}\nهمگام‌سازی مبتنی بر صدا ممکن است کار نکند.",
+    "id_ID": "Unduhan lapse gagal: {error}\nSinkronisasi berbasis audio mungkin tidak berfungsi.",
+    "ms_MY": "Muat turun lapse gagal: {error}\nPenyelarasan berasaskan audio mungkin tidak berfungsi.",
+    "th_TH": "ดาวน์โหลด lapse ล้มเหลว: {error}\nการซิงค์ตามเสียงอาจไม่ทำงาน",
+    "ur_PK": "lapse ڈاؤن لوڈ ناکام: {error}\nآڈیو پر مبنی سنکنگ کام نہیں کر سکتی۔",
+}
+
+
+COULD_NOT_ACCESS_OR_WRITE_SUBTITLE = {
+    "en_US": "Could not access or write the subtitle file. It may be open in another application:\n{path}\n\n{error}",
+    "es_ES": "No se pudo acceder o escribir en el archivo de subtítulos. Puede estar abierto en otra aplicación:\n{path}\n\n{error}",
+    "tr_TR": "Altyazı dosyasına erişilemedi veya yazılamadı. Başka bir uygulamada açık olabilir:\n{path}\n\n{error}",
+    "zh_CN": "无法访问或写入字幕文件。它可能在另一个应用程序中打开：\n{path}\n\n{error}",
+    "zh_TW": "無法存取或寫入字幕檔案。它可能在另一個應用程式中開啟：\n{path}\n\n{error}",
+    "ru_RU": "Не удалось получить доступ или записать файл субтитров. Возможно, он открыт в другой программе:\n{path}\n\n{error}",
+    "pl_PL": "Nie można uzyskać dostępu ani zapisać pliku napisów. Może być otwarty w innej aplikacji:\n{path}\n\n{error}",
+    "uk_UA": "Не вдалося отримати доступ або записати файл субтитрів. Можливо, він відкритий в іншій програмі:\n{path}\n\n{error}",
+    "ja_JP": "字幕ファイルにアクセスまたは書き込みできませんでした。別のアプリケーションで開いている可能性があります:\n{path}\n\n{error}",
+    "ko_KR": "자막 파일에 액세스하거나 쓸 수 없습니다. 다른 응용 프로그램에서 열려 있을 수 있습니다:\n{path}\n\n{error}",
+    "hi_IN": "उपशीर्षक फ़ाइल तक नहीं पहुँचा जा सका या लिखा नहीं जा सका। यह किसी अन्य एप्लिकेशन में खुला हो सकता है:\n{path}\n\n{error}",
+    "bn_BD": "সাবটাইটেল ফাইল অ্যাক্সেস বা লেখা যায়নি। এটি অন্য অ্যাপ্লিকেশনে খোলা থাকতে পারে:\n{path}\n\n{error}",
+    "it_IT": "Impossibile accedere o scrivere il file dei sottotitoli. Potrebbe essere aperto in un'altra applicazione:\n{path}\n\n{error}",
+    "fr_FR": "Impossible d'accéder ou d'écrire le fichier de sous-titres. Il est peut-être ouvert dans une autre application :\n{path}\n\n{error}",
+    "de_DE": "Auf die Untertiteldatei konnte nicht zugegriffen oder geschrieben werden. Sie ist möglicherweise in einer anderen Anwendung geöffnet:\n{path}\n\n{error}",
+    "pt_PT": "Não foi possível aceder ou escrever no ficheiro de legendas. Pode estar aberto noutra aplicação:\n{path}\n\n{error}",
+    "ar_SA": "تعذر الوصول إلى ملف الترجمة أو الكتابة عليه. قد يكون مفتوحًا في تطبيق آخر:\n{path}\n\n{error}",
+    "vi_VN": "Không thể truy cập hoặc ghi tệp phụ đề. Tệp có thể đang mở trong ứng dụng khác:\n{path}\n\n{error}",
+    "fa_IR": "امکان دسترسی یا نوشتن روی فایل زیرنویس وجود ندارد. ممکن است در برنامه دیگری باز باشد:\n{path}\n\n{error}",
+    "id_ID": "Tidak dapat mengakses atau menulis file subtitle. Mungkin sedang dibuka di aplikasi lain:\n{path}\n\n{error}",
+    "ms_MY": "Tidak dapat mengakses atau menulis fail sarikata. Ia mungkin dibuka dalam aplikasi lain:\n{path}\n\n{error}",
+    "th_TH": "ไม่สามารถเข้าถึงหรือเขียนไฟล์คำบรรยายได้ อาจเปิดอยู่ในแอปพลิเคชันอื่น:\n{path}\n\n{error}",
+    "ur_PK": "سب ٹائٹل فائل تک رسائی یا لکھائی ممکن نہیں ہے۔ ہو سکتا ہے یہ کسی دوسری ایپلیکیشن میں کھلی ہو:\n{path}\n\n{error}",
+}
+
+COULD_NOT_ACCESS_REFERENCE_FILE = {
+    "en_US": "Could not access reference file. It may be open in another application or unreadable:\n{path}\n\n{error}",
+    "es_ES": "No se pudo acceder al archivo de referencia. Puede estar abierto en otra aplicación o no ser legible:\n{path}\n\n{error}",
+    "tr_TR": "Referans dosyasına erişilemedi. Başka bir uygulamada açık olabilir veya okunamıyor olabilir:\n{path}\n\n{error}",
+    "zh_CN": "无法访问参考文件。它可能在另一个应用程序中打开或不可读：\n{path}\n\n{error}",
+    "zh_TW": "無法存取參考檔案。它可能在另一個應用程式中開啟或無法讀取：\n{path}\n\n{error}",
+    "ru_RU": "Не удалось получить доступ к файлу-источнику. Возможно, он открыт в другой программе или недоступен для чтения:\n{path}\n\n{error}",
+    "pl_PL": "Nie można uzyskać dostępu do pliku referencyjnego. Może być otwarty w innej aplikacji lub nieczytelny:\n{path}\n\n{error}",
+    "uk_UA": "Не вдалося отримати доступ до файлу-еталону. Можливо, він відкритий в іншій програмі або непридатний для читання:\n{path}\n\n{error}",
+    "ja_JP": "参照ファイルにアクセスできませんでした。別のアプリケーションで開いているか、読み取れない可能性があります:\n{path}\n\n{error}",
+    "ko_KR": "참조 파일에 액세스할 수 없습니다. 다른 응용 프로그램에서 열려 있거나 읽을 수 없을 수 있습니다:\n{path}\n\n{error}",
+    "hi_IN": "संदर्भ फ़ाइल तक नहीं पहुँचा जा सका। यह किसी अन्य एप्लिकेशन में खुली हो सकती है या पढ़ने योग्य नहीं हो सकती है:\n{path}\n\n{error}",
+    "bn_BD": "রেফারেন্স ফাইল অ্যাক্সেস করা যায়নি। এটি অন্য অ্যাপ্লিকেশনে খোলা থাকতে পারে বা অপাঠ্য হতে পারে:\n{path}\n\n{error}",
+    "it_IT": "Impossibile accedere al file di riferimento. Potrebbe essere aperto in un'altra applicazione o illeggibile:\n{path}\n\n{error}",
+    "fr_FR": "Impossible d'accéder au fichier de référence. Il est peut-être ouvert dans une autre application ou illisible :\n{path}\n\n{error}",
+    "de_DE": "Auf die Referenzdatei konnte nicht zugegriffen werden. Sie ist möglicherweise in einer anderen Anwendung geöffnet oder unlesbar:\n{path}\n\n{error}",
+    "pt_PT": "Não foi possível aceder ao ficheiro de referência. Pode estar aberto noutra aplicação ou ilegível:\n{path}\n\n{error}",
+    "ar_SA": "تعذر الوصول إلى الملف المرجعي. قد يكون مفتوحًا في تطبيق آخر أو غير قابل للقراءة:\n{path}\n\n{error}",
+    "vi_VN": "Không thể truy cập tệp tham chiếu. Tệp có thể đang mở trong ứng dụng khác hoặc không thể đọc được:\n{path}\n\n{error}",
+    "fa_IR": "امکان دسترسی به فایل مرجع وجود ندارد. ممکن است در برنامه دیگری باز باشد یا قابل خواندن نباشد:\n{path}\n\n{error}",
+    "id_ID": "Tidak dapat mengakses file referensi. Mungkin sedang dibuka di aplikasi lain atau tidak dapat dibaca:\n{path}\n\n{error}",
+    "ms_MY": "Tidak dapat mengakses fail rujukan. Ia mungkin dibuka dalam aplikasi lain atau tidak boleh dibaca:\n{path}\n\n{error}",
+    "th_TH": "ไม่สามารถเข้าถึงไฟล์อ้างอิงได้ อาจเปิดอยู่ในแอปพลิเคชันอื่นหรือไม่สามารถอ่านได้:\n{path}\n\n{error}",
+    "ur_PK": "حوالہ فائل تک رسائی ممکن نہیں ہے۔ ہو سکتا ہے یہ کسی دوسری ایپلیکیشن میں کھلی ہو یا پڑھنے کے قابل نہ ہو:\n{path}\n\n{error}",
+}
+
+COULD_NOT_WRITE_OUTPUT_FILE = {
+    "en_US": "Could not write to output path. It may be locked or permission denied:\n{path}\n\n{error}",
+    "es_ES": "No se pudo escribir en la ruta de salida. Puede estar bloqueada o permiso denegado:\n{path}\n\n{error}",
+    "tr_TR": "Çıktı yoluna yazılamadı. Kilitli olabilir veya izin reddedildi:\n{path}\n\n{error}",
+    "zh_CN": "无法写入输出路径。它可能被锁定或权限被拒绝：\n{path}\n\n{error}",
+    "zh_TW": "無法寫入輸出路徑。它可能已被鎖定或權限遭拒：\n{path}\n\n{error}",
+    "ru_RU": "Не удалось записать по пути вывода. Возможно, он заблокирован или нет прав доступа:\n{path}\n\n{error}",
+    "pl_PL": "Nie można zapisać w ścieżce wyjściowej. Może być zablokowana lub brak uprawnień:\n{path}\n\n{error}",
+    "uk_UA": "Не вдалося записати у вихідний шлях. Можливо, він заблокований або немає прав доступу:\n{path}\n\n{error}",
+    "ja_JP": "出力パスに書き込めませんでした。ロックされているか、アクセス許可が拒否された可能性があります:\n{path}\n\n{error}",
+    "ko_KR": "출력 경로에 쓸 수 없습니다. 잠겨 있거나 권한이 거부되었을 수 있습니다:\n{path}\n\n{error}",
+    "hi_IN": "आउटपुट पथ पर नहीं लिखा जा सका। यह लॉक हो सकता है या अनुमति अस्वीकृत हो सकती है:\n{path}\n\n{error}",
+    "bn_BD": "আউটপুট পাথে লেখা যায়নি। এটি লক করা থাকতে পারে বা অনুমতি অস্বীকৃত হতে পারে:\n{path}\n\n{error}",
+    "it_IT": "Impossibile scrivere nel percorso di output. Potrebbe essere bloccato o autorizzazione negata:\n{path}\n\n{error}",
+    "fr_FR": "Impossible d'écrire dans le chemin de sortie. Il est peut-être verrouillé ou l'autorisation est refusée :\n{path}\n\n{error}",
+    "de_DE": "In den Ausgabepfad konnte nicht geschrieben werden. Er ist möglicherweise gesperrt oder die Berechtigung wurde verweigert:\n{path}\n\n{error}",
+    "pt_PT": "Não foi possível escrever no caminho de saída. Pode estar bloqueado ou permissão negada:\n{path}\n\n{error}",
+    "ar_SA": "تعذر الكتابة في مسار الإخراج. قد يكون مغلقًا أو تم رفض الإذن:\n{path}\n\n{error}",
+    "vi_VN": "Không thể ghi vào đường dẫn đầu ra. Đường dẫn có thể bị khóa hoặc bị từ chối quyền truy cập:\n{path}\n\n{error}",
+    "fa_IR": "امکان نوشتن در مسیر خروجی وجود ندارد. ممکن است قفل شده باشد یا دسترسی رد شده باشد:\n{path}\n\n{error}",
+    "id_ID": "Tidak dapat menulis ke jalur keluaran. Mungkin terkunci atau izin ditolak:\n{path}\n\n{error}",
+    "ms_MY": "Tidak dapat menulis ke laluan output. Ia mungkin dikunci atau kebenaran ditolak:\n{path}\n\n{error}",
+    "th_TH": "ไม่สามารถเขียนไปยังพาธเอาต์พุตได้ อาจถูกล็อคหรือถูกปฏิเสธการอนุญาต:\n{path}\n\n{error}",
+    "ur_PK": "آؤٹ پٹ پاتھ پر لکھا نہیں جا سکا۔ ہو سکتا ہے یہ مقفل ہو یا اجازت مسترد کر دی گئی ہو:\n{path}\n\n{error}",
+}
+
+FILE_ACCESS_ERROR_TITLE = {
+    "en_US": "File Access Error",
+    "es_ES": "Error de acceso a archivos",
+    "tr_TR": "Dosya Erişim Hatası",
+    "zh_CN": "文件访问错误",
+    "zh_TW": "檔案存取錯誤",
+    "ru_RU": "Ошибка доступа к файлу",
+    "pl_PL": "Błąd dostępu do pliku",
+    "uk_UA": "Помилка доступу до файлу",
+    "ja_JP": "ファイルアクセスエラー",
+    "ko_KR": "파일 액세스 오류",
+    "hi_IN": "फ़ाइल एक्सेस त्रुटि",
+    "bn_BD": "ফাইল অ্যাক্সেস ত্রুটি",
+    "it_IT": "Errore di accesso al file",
+    "fr_FR": "Erreur d'accès au fichier",
+    "de_DE": "Dateizugriffsfehler",
+    "pt_PT": "Erro de acesso ao ficheiro",
+    "ar_SA": "خطأ في الوصول إلى الملف",
+    "vi_VN": "Lỗi truy cập tệp",
+    "fa_IR": "خطای دسترسی به فایل",
+    "id_ID": "Kesalahan Akses File",
+    "ms_MY": "Ralat Akses Fail",
+    "th_TH": "ข้อผิดพลาดในการเข้าถึงไฟล์",
+    "ur_PK": "فائل تک رسائی کی خرابی",
+}
+
+COULD_NOT_RENAME_FOR_ALASS = {
+    "en_US": "Could not rename files for ALASS compatibility. The file may be in use by another application:\n{error}",
+    "es_ES": "No se pudieron renombrar los archivos para la compatibilidad con ALASS. El archivo puede estar en uso por otra aplicación:\n{error}",
+    "tr_TR": "ALASS uyumluluğu için dosyalar yeniden adlandırılamadı. Dosya başka bir uygulama tarafından kullanılıyor olabilir:\n{error}",
+    "zh_CN": "无法为 ALASS 兼容性重命名文件。该文件可能正被另一个应用程序使用：\n{error}",
+    "zh_TW": "無法為 ALASS 相容性重新命名檔案。該檔案可能正被另一個應用程式使用：\n{error}",
+    "ru_RU": "Не удалось переименовать файлы для совместимости с ALASS. Возможно, файл используется другой программой:\n{error}",
+    "pl_PL": "Nie można zmienić nazwy plików dla zgodności z ALASS. Plik może być używany przez inną aplikację:\n{error}",
+    "uk_UA": "Не вдалося перейменувати файли для сумісності з ALASS. Можливо, файл використовується іншою програмою:\n{error}",
+    "ja_JP": "ALASS 互換性のためにファイル名を変更できませんでした。ファイルが別のアプリケーションで使用されている可能性があります:\n{error}",
+    "ko_KR": "ALASS 호환성을 위해 파일 이름을 바꿀 수 없습니다. 다른 응용 프로그램에서 파일을 사용 중일 수 있습니다:\n{error}",
+    "hi_IN": "ALASS संगतता के लिए फ़ाइलों का नाम नहीं बदला जा सका। फ़ाइल किसी अन्य एप्लिकेशन द्वारा उपयोग में हो सकती है:\n{error}",
+    "bn_BD": "ALASS সামঞ্জস্যের জন্য ফাইলের নাম পরিবর্তন করা যায়নি। ফাইলটি অন্য কোনও অ্যাপ্লিকেশন দ্বারা ব্যবহৃত হতে পারে:\n{error}",
+    "it_IT": "Impossibile rinominare i file per la compatibilità con ALASS. Il file potrebbe essere in uso da un'altra applicazione:\n{error}",
+    "fr_FR": "Impossible de renommer les fichiers pour la compatibilité ALASS. Le fichier est peut-être utilisé par une autre application :\n{error}",
+    "de_DE": "Dateien konnten für ALASS-Kompatibilität nicht umbenannt werden. Die Datei wird möglicherweise von einer anderen Anwendung verwendet:\n{error}",
+    "pt_PT": "Não foi possível renomear os ficheiros para compatibilidade com ALASS. O ficheiro pode estar em uso por outra aplicação:\n{error}",
+    "ar_SA": "تعذر إعادة تسمية الملفات للتوافق مع ALASS. قد يكون الملف قيد الاستخدام بواسطة تطبيق آخر:\n{error}",
+    "vi_VN": "Không thể đổi tên tệp để tương thích với ALASS. Tệp có thể đang được sử dụng bởi một ứng dụng khác:\n{error}",
+    "fa_IR": "تغییر نام فایل‌ها برای سازگاری با ALASS امکان‌پذیر نبود. ممکن است فایل توسط برنامه دیگری در حال استفاده باشد:\n{error}",
+    "id_ID": "Tidak dapat mengganti nama file untuk kompatibilitas ALASS. File mungkin sedang digunakan oleh aplikasi lain:\n{error}",
+    "ms_MY": "Tidak dapat menamakan semula fail untuk keserasian ALASS. Fail mungkin sedang digunakan oleh aplikasi lain:\n{error}",
+    "th_TH": "ไม่สามารถเปลี่ยนชื่อไฟล์เพื่อให้เข้ากันได้กับ ALASS ไฟล์อาจถูกใช้งานโดยแอปพลิเคชันอื่น:\n{error}",
+    "ur_PK": "ALASS مطابقت کے لیے فائلوں کا نام تبدیل نہیں کیا جا سکا۔ ہو سکتا ہے فائل کسی دوسری ایپلیکیشن کے زیر استعمال ہو:\n{error}",
+}
+
+NO_FILE_PATH_PROVIDED = {
+    "en_US": "No file path provided.",
+    "es_ES": "No se proporcionó una ruta de archivo.",
+    "tr_TR": "Dosya yolu belirtilmedi.",
+    "zh_CN": "未提供文件路径。",
+    "zh_TW": "未提供檔案路徑。",
+    "ru_RU": "Путь к файлу не указан.",
+    "pl_PL": "Nie podano ścieżki do pliku.",
+    "uk_UA": "Шлях до файлу не вказано.",
+    "ja_JP": "ファイルパスが指定されていません。",
+    "ko_KR": "파일 경로가 제공되지 않았습니다.",
+    "hi_IN": "कोई फ़ाइल पथ प्रदान नहीं किया गया।",
+    "bn_BD": "কোনো ফাইল পাথ প্রদান করা হয়নি।",
+    "it_IT": "Nessun percorso file fornito.",
+    "fr_FR": "Aucun chemin de fichier fourni.",
+    "de_DE": "Kein Dateipfad angegeben.",
+    "pt_PT": "Nenhum caminho de ficheiro fornecido.",
+    "ar_SA": "لم يتم توفير مسار الملف.",
+    "vi_VN": "Không có đường dẫn tệp được cung cấp.",
+    "fa_IR": "مسیر فایل ارائه نشده است.",
+    "id_ID": "Tidak ada jalur file yang diberikan.",
+    "ms_MY": "Tiada laluan fail disediakan.",
+    "th_TH": "ไม่ได้ระบุพาธไฟล์",
+    "ur_PK": "کوئی فائل پاتھ فراہم نہیں کیا گیا۔",
+}
@@ -0,0 +1,274 @@
+"""Compiled per-language translation catalogs.
+
+User-facing texts are written as {locale: text} dicts, in texts_source.py and,
+for the sync tools, save locations and program description, in constants.py.
+compile_catalogs() flattens them into one {key: text} catalog per language,
+which write_catalogs() stores as resources/translations/<locale>.json. Run
+`python translations.py` after changing any of those texts.
+
+The catalogs are build artifacts, committed with their sources and compiled
+only by that script (and build.py). The index records a hash of the compiled
+texts, which the tests compare against the sources to catch stale catalogs.
+
+At runtime a TranslationDict resolves its key in the catalog of the active
+language, falling back to another region of the same language and then to
+en_US, so only the catalogs of the languages in use are loaded. Nothing is
+written at runtime; if the catalogs are missing, they are compiled in memory.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+FALLBACK_LOCALE = "en_US"
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+CATALOG_DIR = os.path.join(SOURCE_DIR, "resources", "translations")
+INDEX_FILE = "index.json"
+
+_lock = threading.RLock()
+_catalogs = {}
+_fallback_chains = {}
+_compiled = None  # All catalogs, when they had to be compiled in memory
+_index = None
+
+
+def is_translation(value) -> bool:
+    """Whether value is a {locale: text} dict."""
+    return isinstance(value, dict) and FALLBACK_LOCALE in value
+
+
+def iter_translations(tree, prefix):
+    """(key, {locale: text}) for the translation dicts nested in tree.
+
+    Keys are the dotted path from prefix, e.g.
+    "SYNC_TOOLS.alass.options.split_penalty.label".
+    """
+    if is_translation(tree):
+        yield prefix, tree
+    elif isinstance(tree, dict):
+        for name, value in tree.items():
+            yield from iter_translations(value, f"{prefix}.{name}")
+
+
+def translate_tree(tree, prefix):
+    """Replace the translation dicts nested in tree with catalog-backed
+    TranslationDicts, keyed as in iter_translations. Returns tree."""
+    for name, value in tree.items():
+        key = f"{prefix}.{name}"
+        if is_translation(value):
+            tree[name] = TranslationDict(key=key)
+        elif isinstance(value, dict):
+            translate_tree(value, key)
+    return tree
+
+
+def _sources():
+    import texts_source
+    import constants
+
+    for name, value in vars(texts_source).items():
+        if is_translation(value):
+            yield name, value
+    yield from constants.translation_sources().items()
+
+
+def compile_catalogs() -> dict:
+    """{locale: {key: text}} for every text in the sources."""
+    catalogs = {}
+    for prefix, tree in _sources():
+        for key, translations in iter_translations(tree, prefix):
+            if key in catalogs.get(FALLBACK_LOCALE, {}):
+                raise ValueError(f"Duplicate translation key: {key}")
+            for locale, text in translations.items():
+                catalogs.setdefault(locale, {})[key] = text
+    return catalogs
+
+
+def catalog_hash(catalogs) -> str:
+    """Hash of the compiled texts, stored in the index as "source_hash"."""
+    data = json.dumps(catalogs, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _write_json(path, data):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(
+                data, f, ensure_ascii=False, separators=(",", ":"), sort_keys=True
+            )
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_catalogs(catalogs=None, directory=None) -> list:
+    """Write one catalog per locale and the index; returns the locales."""
+    if catalogs is None:
+        catalogs = compile_catalogs()
+    directory = directory or CATALOG_DIR
+    os.makedirs(directory, exist_ok=True)
+    for locale, catalog in catalogs.items():
+        _write_json(os.path.join(directory, f"{locale}.json"), catalog)
+    # The index goes last, so an interrupted write leaves the old hash behind
+    locales = sorted(catalogs)
+    _write_json(
+        os.path.join(directory, INDEX_FILE),
+        {"locales": locales, "source_hash": catalog_hash(catalogs)},
+    )
+    return locales
+
+
+def _load_index():
+    """Read the index once, compiling the catalogs in memory if it is missing."""
+    global _index, _compiled
+    if _index is not None:
+        return _index
+    try:
+        with open(os.path.join(CATALOG_DIR, INDEX_FILE), encoding="utf-8") as f:
+            _index = json.load(f)
+    except (OSError, ValueError):
+        _compiled = compile_catalogs()
+        _index = {"locales": sorted(_compiled)}
+    return _index
+
+
+def available_locales() -> list:
+    with _lock:
+        return list(_load_index()["locales"])
+
+
+def catalog(locale) -> dict:
+    """The {key: text} catalog of locale, loaded on first use."""
+    loaded = _catalogs.get(locale)
+    if loaded is not None:
+        return loaded
+    with _lock:
+        if locale not in _catalogs:
+            index = _load_index()
+            if _compiled is not None:
+                _catalogs[locale] = _compiled.get(locale, {})
+            elif locale not in index["locales"]:
+                _catalogs[locale] = {}
+            else:
+                path = os.path.join(CATALOG_DIR, f"{locale}.json")
+                try:
+                    with open(path, encoding="utf-8") as f:
+                        _catalogs[locale] = json.load(f)
+                except (OSError, ValueError):
+                    _catalogs[locale] = {}
+        return _catalogs[locale]
+
+
+def fallback_chain(locale) -> list:
+    """The catalogs a text is looked up in, in order."""
+    chain = _fallback_chains.get(locale)
+    if chain is None:
+        locales = available_locales()
+        chain = [locale]
+        if locale not in locales:
+            language = locale.split("_")[0]
+            chain += [l for l in locales if l.split("_")[0] == language][:1]
+        if FALLBACK_LOCALE not in chain:
+            chain.append(FALLBACK_LOCALE)
+        _fallback_chains[locale] = chain
+    return chain
+
+
+def lookup(key, locale, default=""):
+    """The text of key in locale, or in the first fallback that has it."""
+    for candidate in fallback_chain(locale):
+        text = catalog(candidate).get(key)
+        if text is not None:
+            return text
+    return default
+
+
+def has_key(key) -> bool:
+    return key in catalog(FALLBACK_LOCALE)
+
+
+def loaded_locales() -> list:
+    return sorted(_catalogs)
+
+
+def clear_cache():
+    """Forget the loaded catalogs, e.g. after write_catalogs()."""
+    global _index, _compiled
+    with _lock:
+        _catalogs.clear()
+        _fallback_chains.clear()
+        _index = None
+        _compiled = None
+
+
+def _current_locale():
+    try:
+        from utils import get_locale
+
+        return get_locale()
+    except Exception:
+        return FALLBACK_LOCALE
+
+
+class TranslationDict(str):
+    """A user-facing text: a str in the current language.
+
+    The text is either a catalog key or an inline {locale: text} dict. str()
+    and format() follow the current locale, so a text created before the
+    language is known still renders in the right one.
+    """
+
+    def __new__(cls, translations=None, key=None):
+        instance = str.__new__(cls, cls._resolve(translations, key, _current_locale()))
+        instance._translations = translations
+        instance._key = key
+        return instance
+
+    @staticmethod
+    def _resolve(translations, key, language):
+        if translations is None:
+            return lookup(key, language)
+        return translations.get(language, translations.get(FALLBACK_LOCALE, ""))
+
+    def _text(self):
+        return self._resolve(self._translations, self._key, _current_locale())
+
+    def __missing__(self, key):
+        return self.get(FALLBACK_LOCALE)
+
+    def __str__(self):
+        return self._text()
+
+    def __repr__(self):
+        return repr(str(self))
+
+    def __eq__(self, other):
+        return str(self) == (str(other) if other is not None else None)
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __reduce__(self):
+        return (TranslationDict, (self._translations, self._key))
+
+    def format(self, *args, **kwargs):
+        return self._text().format(*args, **kwargs)
+
+    def get(self, key, default=""):
+        """The text in the language key, or default."""
+        if self._translations is None:
+            return catalog(key).get(self._key, default)
+        return self._translations.get(key, default)
+
+
+if __name__ == "__main__":
+    for written in write_catalogs():
+        print(os.path.join(CATALOG_DIR, f"{written}.json"))
@@ -9,23 +9,8 @@ import platform
 import signal
 import time
 import shutil
-import texts
-
-try:
-    import cchardet
-except:
-    cchardet = None
-try:
-    import chardet
-except:
-    chardet = None
-try:
-    import charset_normalizer
-except:
-    charset_normalizer = None
-from PyQt6.QtCore import pyqtSignal, QObject
-import requests
-import webbrowser
+
+from encoding_detection import detect_encoding
 
 logger = logging.getLogger(__name__)
 
@@ -44,100 +29,121 @@ _process_lock = threading.Lock()
 def create_process(cmd):
     """Create a subprocess with proper threading support and termination handling."""
     with _process_lock:
-        logger.info(f"Executing: {' '.join(cmd) if isinstance(cmd, list) else cmd}")
-        env = {**os.environ, "TERM": "dumb", "COLUMNS": "70"}
-
-        # If executing lapse, ensure LAPSE_ONNXRUNTIME and LAPSE_VAD_MODEL are provided
-        if cmd and ("lapse" in os.path.basename(cmd[0]).lower()):
-            exe_dir = os.path.dirname(cmd[0])
-            base_dir = os.path.dirname(os.path.abspath(__file__))
-
-            # Resolve silero_vad.onnx model path
-            if "LAPSE_VAD_MODEL" not in env:
-                candidates = [
-                    os.path.join(exe_dir, "silero_vad.onnx"),
-                    os.path.join(base_dir, "resources", "lapse", "silero_vad.onnx"),
-                ]
-                if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
-                    candidates.append(
-                        os.path.join(sys._MEIPASS, "resources", "lapse", "silero_vad.onnx")
-                    )
-                for candidate in candidates:
-                    if os.path.isfile(candidate):
-                        env["LAPSE_VAD_MODEL"] = candidate
-                        break
-
-            # Resolve onnxruntime shared library
-            if "LAPSE_ONNXRUNTIME" not in env:
-                lib_names = (
-                    ("onnxruntime.dll",)
-                    if platform.system() == "Windows"
-                    else (
-                        "libonnxruntime.dylib",
-                        "libonnxruntime.1.dylib",
-                    )
-                    if platform.system() == "Darwin"
-                    else ("libonnxruntime.so", "libonnxruntime.so.1")
+        return subprocess.Popen(cmd, **_process_options(cmd))
+
+
+async def create_process_async(cmd):
+    """Start cmd like create_process, for use from asyncio.
+
+    Where os.wait4 is available the child is a process_usage.AsyncProcess, so
+    its resource usage can be read once it exits; otherwise it is an asyncio
+    subprocess.
+    """
+    if hasattr(os, "wait4"):
+        from process_usage import AsyncProcess
+
+        return await AsyncProcess.start(create_process(cmd))
+    import asyncio
+
+    return await asyncio.create_subprocess_exec(*cmd, **_process_options(cmd))
+
+
+def _process_options(cmd):
+    """Popen keyword arguments for running a sync tool."""
+    logger.info(f"Executing: {' '.join(cmd) if isinstance(cmd, list) else cmd}")
+    env = {**os.environ, "TERM": "dumb", "COLUMNS": "70"}
+
+    # If executing lapse, ensure LAPSE_ONNXRUNTIME and LAPSE_VAD_MODEL are provided
+    if cmd and ("lapse" in os.path.basename(cmd[0]).lower()):
+        exe_dir = os.path.dirname(cmd[0])
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+
+        # Resolve silero_vad.onnx model path
+        if "LAPSE_VAD_MODEL" not in env:
+            candidates = [
+                os.path.join(exe_dir, "silero_vad.onnx"),
+                os.path.join(base_dir, "resources", "lapse", "silero_vad.onnx"),
+            ]
+            if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
+                candidates.append(
+                    os.path.join(sys._MEIPASS, "resources", "lapse", "silero_vad.onnx")
+                )
+            for candidate in candidates:
+                if os.path.isfile(candidate):
+                    env["LAPSE_VAD_MODEL"] = candidate
+                    break
+
+        # Resolve onnxruntime shared library
+        if "LAPSE_ONNXRUNTIME" not in env:
+            lib_names = (
+                ("onnxruntime.dll",)
+                if platform.system() == "Windows"
+                else (
+                    "libonnxruntime.dylib",
+                    "libonnxruntime.1.dylib",
                 )
-                search_dirs = [exe_dir, os.path.join(base_dir, "resources", "lapse")]
-                if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
-                    search_dirs.append(
-                        os.path.join(sys._MEIPASS, "resources", "lapse")
+                if platform.system() == "Darwin"
+                else ("libonnxruntime.so", "libonnxruntime.so.1")
+            )
+            search_dirs = [exe_dir, os.path.join(base_dir, "resources", "lapse")]
+            if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
+                search_dirs.append(
+                    os.path.join(sys._MEIPASS, "resources", "lapse")
+                )
+            found_lib = None
+            for sdir in search_dirs:
+                if os.path.isdir(sdir):
+                    for lib_name in lib_names:
+                        candidate = os.path.join(sdir, lib_name)
+                        if os.path.isfile(candidate):
+                            found_lib = candidate
+                            break
+                if found_lib:
+                    break
+
+            if not found_lib:
+                try:
+                    import onnxruntime
+
+                    capi_dir = os.path.join(
+                        os.path.dirname(onnxruntime.__file__), "capi"
                     )
-                found_lib = None
-                for sdir in search_dirs:
-                    if os.path.isdir(sdir):
-                        for lib_name in lib_names:
-                            candidate = os.path.join(sdir, lib_name)
-                            if os.path.isfile(candidate):
-                                found_lib = candidate
+                    if os.path.isdir(capi_dir):
+                        for f in os.listdir(capi_dir):
+                            if "libonnxruntime" in f or "onnxruntime.dll" in f:
+                                found_lib = os.path.join(capi_dir, f)
                                 break
-                    if found_lib:
-                        break
-
-                if not found_lib:
-                    try:
-                        import onnxruntime
-
-                        capi_dir = os.path.join(
-                            os.path.dirname(onnxruntime.__file__), "capi"
-                        )
-                        if os.path.isdir(capi_dir):
-                            for f in os.listdir(capi_dir):
-                                if "libonnxruntime" in f or "onnxruntime.dll" in f:
-                                    found_lib = os.path.join(capi_dir, f)
-                                    break
-                    except Exception:
-                        pass
+                except Exception:
+                    pass
 
-                if found_lib:
-                    env["LAPSE_ONNXRUNTIME"] = found_lib
-
-        kwargs = {
-            "shell": False,
-            "stdout": subprocess.PIPE,
-            "stderr": subprocess.STDOUT,
-            "universal_newlines": False,
-            "bufsize": 0,
-            "env": env,
-        }
-
-        if platform.system() == "Windows" and hasattr(subprocess, "STARTUPINFO"):
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            kwargs.update(
-                {
-                    "startupinfo": startupinfo,
-                    "creationflags": getattr(subprocess, "CREATE_NO_WINDOW", 0)
-                    | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0),
-                }
-            )
-        elif platform.system() != "Windows":
-            # On Unix-like systems, create a new session/process group via posix_spawn
-            kwargs["start_new_session"] = True
+            if found_lib:
+                env["LAPSE_ONNXRUNTIME"] = found_lib
+
+    kwargs = {
+        "shell": False,
+        "stdout": subprocess.PIPE,
+        "stderr": subprocess.STDOUT,
+        "universal_newlines": False,
+        "bufsize": 0,
+        "env": env,
+    }
+
+    if platform.system() == "Windows" and hasattr(subprocess, "STARTUPINFO"):
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        startupinfo.wShowWindow = subprocess.SW_HIDE
+        kwargs.update(
+            {
+                "startupinfo": startupinfo,
+                "creationflags": getattr(subprocess, "CREATE_NO_WINDOW", 0)
+                | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0),
+            }
+        )
+    elif platform.system() != "Windows":
+        # On Unix-like systems, create a new session/process group via posix_spawn
+        kwargs["start_new_session"] = True
 
-        return subprocess.Popen(cmd, **kwargs)
+    return kwargs
 
 
 
@@ -182,6 +188,47 @@ def terminate_process_safely(process):
     threading.Thread(target=_terminate, daemon=True).start()
 
 
+async def terminate_process_async(process):
+    """Terminate an asyncio subprocess and its children.
+
+    Same escalation as terminate_process_safely, waiting on the event loop
+    instead of in a thread. Returns once the process has exited.
+    """
+    import asyncio
+
+    async def exited(timeout):
+        try:
+            await asyncio.wait_for(process.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    if process.returncode is not None:
+        return
+    try:
+        logger.info(f"Terminating process: {process.pid}")
+        if platform.system() == "Windows":
+            process.send_signal(signal.CTRL_BREAK_EVENT)
+            if not await exited(0.5):
+                process.terminate()
+                if not await exited(1):
+                    process.kill()
+        else:
+            try:
+                os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+                if not await exited(0.5):
+                    os.killpg(os.getpgid(process.pid), signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            except OSError:
+                process.terminate()
+                if not await exited(1):
+                    process.kill()
+        await process.wait()
+    except Exception as e:
+        logger.error(f"Error terminating process: {e}")
+
+
 def create_backup(file_path):
     base_name, ext = os.path.splitext(os.path.basename(file_path))
     backup_dir = os.path.dirname(file_path)
@@ -195,22 +242,6 @@ def create_backup(file_path):
     return backup_file
 
 
-def detect_encoding(file_path):
-    with open(file_path, "rb") as f:
-        raw_data = f.read()
-    detected_encoding = None
-    for detectors in (cchardet, charset_normalizer, chardet):
-        try:
-            result = detectors.detect(raw_data)["encoding"]
-        except Exception:
-            continue
-        if result is not None:
-            detected_encoding = result
-            break
-    encoding = detected_encoding if detected_encoding else "utf-8"
-    return encoding.lower()
-
-
 def levenshtein_distance(s1, s2):
     """Compute the Levenshtein distance between s1 and s2."""
     if len(s1) < len(s2):
@@ -254,6 +285,8 @@ def match_subtitle_encoding(
     Returns:
         bool: True if encoding was matched or files already match, False if failed
     """
+    import texts
+
     try:
         from constants import COLORS
 
@@ -796,6 +829,7 @@ def open_folder(path, parent=None):
     Returns:
         bool: True if successful, False otherwise
     """
+    import texts
     from PyQt6.QtWidgets import QMessageBox
     from PyQt6.QtCore import QUrl
     from PyQt6.QtGui import QDesktopServices
@@ -912,6 +946,7 @@ def toggle_remember_changes(obj, checked):
 
 
 def reset_to_defaults(parent):
+    import texts
     from PyQt6.QtWidgets import QMessageBox
 
     # Show confirmation dialog
@@ -944,6 +979,7 @@ def reset_to_defaults(parent):
 
 def open_config_directory(parent=None):
     """Open the config directory in the system file manager"""
+    import texts
     from PyQt6.QtWidgets import QMessageBox
 
     try:
@@ -965,6 +1001,7 @@ def open_logs_directory(parent=None):
 
 def clear_logs_directory(parent=None):
     """Delete logs directory after user confirmation."""
+    import texts
     from PyQt6.QtWidgets import QMessageBox
 
     try:
@@ -1018,6 +1055,7 @@ def clear_logs_directory(parent=None):
 
 def safe_open_url(url):
     """Open a URL in the default browser, handling PyInstaller LD_LIBRARY_PATH issues on Linux."""
+    import webbrowser
     import sys
     import platform
     import subprocess
@@ -1045,6 +1083,7 @@ def safe_open_url(url):
 
 def show_about_dialog(parent):
     """Show an About dialog with program information including GitHub link."""
+    import texts
     from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel
     from PyQt6.QtCore import Qt
     from PyQt6.QtGui import QIcon
@@ -1103,6 +1142,7 @@ def show_about_dialog(parent):
 
 
 def show_tool_info_dialog(parent):
+    import texts
     from PyQt6.QtWidgets import (
         QDialog,
         QVBoxLayout,
@@ -1174,7 +1214,7 @@ def show_tool_info_dialog(parent):
     desc_label.setTextFormat(Qt.TextFormat.RichText)
     info_layout.addWidget(desc_label)
     typ = tool.get("type", "")
-    if typ == "module":
+    if typ in ("module", "native"):
         label = texts.MODULE_LABEL
         val = tool.get("module", "")
     elif typ == "executable":
@@ -1252,26 +1292,81 @@ def get_version_info(module_name):
             return "0.0"
 
 
+# Qt signal holders, defined on first use so that importing utils does not
+# load Qt (the CLI imports utils without a GUI).
+_signal_classes = {}
+
+
+def _define_signal_classes():
+    from PyQt6.QtCore import pyqtSignal, QObject
+
+    class UpdateSignals(QObject):
+        update_available = pyqtSignal(str, str)
+        up_to_date = pyqtSignal(str)
+        check_failed = pyqtSignal(str)
+
+    class DownloadSignals(QObject):
+        """Signals for dependency download progress."""
+
+        finished = pyqtSignal(bool, str)  # success, JSON-encoded list of [component, error] pairs
+        status = pyqtSignal(str)          # current status label text
+
+    _signal_classes.update(
+        UpdateSignals=UpdateSignals,
+        DownloadSignals=DownloadSignals,
+        FFmpegDownloadSignals=DownloadSignals,  # backward compatibility alias
+    )
+
+
+def _signal_class(name):
+    if not _signal_classes:
+        _define_signal_classes()
+    return _signal_classes[name]
+
+
+def __getattr__(name):
+    if name in ("UpdateSignals", "DownloadSignals", "FFmpegDownloadSignals"):
+        return _signal_class(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Update checking functionality
-class UpdateSignals(QObject):
-    update_available = pyqtSignal(str, str)
-    up_to_date = pyqtSignal(str)
-    check_failed = pyqtSignal(str)
+
+
+def _system_locale_name():
+    """The system locale as "ll_CC", from Qt if it is loaded.
+
+    Without Qt (the CLI), the locale Python picked up from the environment is
+    used instead, so that translating a message never loads Qt.
+    """
+    if "PyQt6.QtCore" in sys.modules:
+        from PyQt6.QtCore import QLocale
+
+        return QLocale().name()
+    import locale
+
+    if platform.system() == "Windows":
+        import ctypes
+
+        # The UI language, as QLocale reports it
+        lang_id = ctypes.windll.kernel32.GetUserDefaultUILanguage()
+        return locale.windows_locale.get(lang_id, "")
+    name = locale.getlocale()[0] or ""
+    return locale.normalize(name).split(".")[0]
 
 
 def get_locale():
-    """Get the current locale of the system using PyQt with caching."""
+    """Get the current locale of the system with caching."""
     global _locale_cache
 
     # Return cached locale if available
     if _locale_cache is not None:
         return _locale_cache
 
-    from PyQt6.QtCore import QLocale
     from constants import LANGUAGES
 
     config = load_config()
-    system_locale = QLocale().name()
+    system_locale = _system_locale_name()
 
     if config.get("language") in LANGUAGES.values():
         _locale_cache = config.get("language")
@@ -1285,6 +1380,7 @@ def get_locale():
 
 
 def _show_update_message(parent, remote_version, local_version):
+    import texts
     from PyQt6.QtWidgets import QMessageBox
     from constants import GITHUB_LATEST_RELEASE_URL, PROGRAM_NAME
     from utils import safe_open_url
@@ -1312,6 +1408,7 @@ def _show_update_message(parent, remote_version, local_version):
 
 
 def _show_up_to_date(parent, version):
+    import texts
     from PyQt6.QtWidgets import QMessageBox
     from constants import PROGRAM_NAME
 
@@ -1323,6 +1420,7 @@ def _show_up_to_date(parent, version):
 
 
 def _show_check_failed(parent, error_message):
+    import texts
     from PyQt6.QtWidgets import QMessageBox
 
     QMessageBox.warning(
@@ -1341,7 +1439,7 @@ def manual_check_for_updates(parent):
 def check_for_updates_startup(parent):
     from constants import GITHUB_VERSION_URL, VERSION
 
-    signals = UpdateSignals()
+    signals = _signal_class("UpdateSignals")()
     show_result = getattr(parent, "_show_update_check_result", False)
     parent._show_update_check_result = False
 
@@ -1357,6 +1455,7 @@ def check_for_updates_startup(parent):
         try:
             logger.info("Checking for updates...")
             import certifi
+            import requests
 
             response = requests.get(
                 GITHUB_VERSION_URL, timeout=5, verify=certifi.where()
@@ -1383,6 +1482,8 @@ def check_for_updates_startup(parent):
 
 def update_folder_label(label, folder_path=""):
     """Helper function to update the folder label consistently"""
+    import texts
+
     if folder_path:
         # Check if label supports rich text (has setTextFormat method)
 
@@ -1416,6 +1517,8 @@ def handle_save_location_dropdown(
     """
     Generic handler for save location dropdowns with folder selection and label update.
     """
+    import texts
+
     try:
         if dropdown.currentIndex() < 0:
             return
@@ -1469,16 +1572,6 @@ def handle_save_location_dropdown(
 
 
 # Dependency initialization for pip installs
-class DownloadSignals(QObject):
-    """Signals for dependency download progress."""
-
-    finished = pyqtSignal(bool, str)  # success, JSON-encoded list of [component, error] pairs
-    status = pyqtSignal(str)          # current status label text
-
-
-FFmpegDownloadSignals = DownloadSignals  # backward compatibility alias
-
-
 def _needs_lapse_download():
     """Return True if lapse binary or silero_vad.onnx need to be downloaded (pip installs only)."""
     if getattr(sys, "frozen", False):
@@ -1511,6 +1604,7 @@ def initialize_static_ffmpeg(parent=None, callback=None):
     Returns:
         bool: True if successful or not needed, False if a critical component failed
     """
+    import texts
     from PyQt6.QtWidgets import QMessageBox
     from constants import NEEDS_STATIC_FFMPEG, FFMPEG_EXECUTABLE
 
@@ -1657,7 +1751,7 @@ def initialize_static_ffmpeg(parent=None, callback=None):
     layout.addWidget(progress)
 
     # Wire up signals
-    dl_signals = DownloadSignals()
+    dl_signals = _signal_class("DownloadSignals")()
     thread = DownloadThread(dl_signals, needs_ffmpeg, needs_lapse)
 
     def on_status(msg):
@@ -1711,6 +1805,8 @@ def check_file_readable(file_path: str) -> tuple[bool, str]:
     Returns:
         tuple of (is_readable, error_message)
     """
+    import texts
+
     if not file_path:
         return False, str(texts.NO_FILE_PATH_PROVIDED)
     from constants import is_remote_url
@@ -1733,6 +1829,8 @@ def check_file_writable(file_path: str) -> tuple[bool, str]:
     Returns:
         tuple of (is_writable, error_message)
     """
+    import texts
+
     if not file_path:
         return False, str(texts.NO_FILE_PATH_PROVIDED)
     if os.path.exists(file_path):
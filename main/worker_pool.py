@@ -0,0 +1,278 @@
+"""Persistent pool of warm worker processes for module-based sync tools.
+
+Spawning a fresh multiprocessing.Process per sync makes every job pay for
+importing ffsubsync/autosubsync, numpy, scipy and onnxruntime and for the
+patches applied by call_ffsubsync._load_ffsubsync. Pool workers import and
+patch a tool module once, then run many jobs.
+
+A worker is retired after MAX_JOBS_PER_WORKER jobs or when its resident memory
+goes above MAX_WORKER_RSS_MB. Each worker runs one job at a time, so
+cancelling a job terminates only that job's worker.
+"""
+
+import os
+import sys
+import logging
+import importlib
+import threading
+import multiprocessing
+import multiprocessing.util
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_JOBS_PER_WORKER = 25
+MAX_WORKER_RSS_MB = 2048
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Resident set size of the calling process, or None if unknown."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and kilobytes elsewhere.
+        return peak if sys.platform == "darwin" else peak * 1024
+    except (ImportError, OSError):
+        return None
+
+
+def warm_module(module_name: str):
+    """Import a tool module and run its optional warmup() hook."""
+    module = importlib.import_module(module_name)
+    warmup = getattr(module, "warmup", None)
+    if callable(warmup):
+        try:
+            warmup()
+        except Exception as e:
+            logger.warning(f"Warmup of {module_name} failed: {e}")
+    return module
+
+
+def pool_worker_main(conn, preload):
+    """Top-level multiprocessing target for pool workers.
+
+    Receives ("job", module_name, args) messages and streams the usual
+    progress/error/finished messages back for each job. The finished message
+    carries the worker's RSS so the pool can retire bloated workers.
+    """
+    from sync_core import execute_module_job
+
+    for module_name in preload:
+        try:
+            warm_module(module_name)
+        except Exception as e:
+            logger.warning(f"Failed to preload {module_name}: {e}")
+    while True:
+        try:
+            msg = conn.recv()
+        except (EOFError, OSError):
+            break
+        if not msg or msg[0] != "job":
+            break
+        _, module_name, args = msg
+        execute_module_job(module_name, args, conn, report_rss=True)
+
+
+class PoolWorker:
+    """One warm worker process and the parent end of its pipe."""
+
+    def __init__(self, preload):
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=pool_worker_main,
+            args=(child_conn, tuple(preload)),
+            name="assy-module-worker",
+        )
+        self.process.start()
+        child_conn.close()
+        self.modules = set(preload)
+        self.jobs_done = 0
+
+    def submit(self, module_name, args):
+        self.modules.add(module_name)
+        self.conn.send(("job", module_name, list(args)))
+
+    def is_alive(self):
+        return self.process.is_alive()
+
+    def stop(self):
+        """Ask an idle worker to exit, killing it if it does not."""
+        try:
+            self.conn.send(("stop",))
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=2)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout=1)
+            if self.process.is_alive():
+                self.process.kill()
+                self.process.join(timeout=1)
+        try:
+            self.conn.close()
+        except OSError:
+            pass
+
+
+class ModuleWorkerPool:
+    """Thread-safe pool of PoolWorker processes, grown on demand."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_jobs_per_worker: int = MAX_JOBS_PER_WORKER,
+        max_rss_mb: Optional[int] = MAX_WORKER_RSS_MB,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.max_rss_bytes = max_rss_mb * 1024 * 1024 if max_rss_mb else None
+        self._idle = []
+        self._busy = 0
+        self._in_use = set()
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def prestart(self, module_name: str, count: int):
+        """Start up to `count` idle workers with module_name already warm."""
+        with self._cond:
+            room = self.max_workers - self._busy - len(self._idle)
+            warm = sum(1 for w in self._idle if module_name in w.modules)
+            to_start = max(0, min(count - warm, room))
+            for _ in range(to_start):
+                self._idle.append(PoolWorker([module_name]))
+        return to_start
+
+    def acquire(self, module_name: str) -> PoolWorker:
+        """Take an idle worker, preferring one that already imported the module.
+
+        Starts a new worker if the pool has room, otherwise waits for one to be
+        released.
+        """
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Module worker pool is shut down")
+                self._idle = [w for w in self._idle if w.is_alive()]
+                worker = next(
+                    (w for w in self._idle if module_name in w.modules),
+                    self._idle[0] if self._idle else None,
+                )
+                if worker is not None:
+                    self._idle.remove(worker)
+                    self._busy += 1
+                    self._in_use.add(worker)
+                    return worker
+                if self._busy < self.max_workers:
+                    self._busy += 1
+                    break
+                self._cond.wait()
+        try:
+            worker = PoolWorker([module_name])
+        except Exception:
+            with self._cond:
+                self._busy -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._in_use.add(worker)
+        return worker
+
+    def release(self, worker: PoolWorker, rss_bytes: Optional[int] = None):
+        """Return a worker after a completed job, retiring it if it is spent."""
+        worker.jobs_done += 1
+        retire = (
+            not worker.is_alive()
+            or worker.jobs_done >= self.max_jobs_per_worker
+            or (
+                self.max_rss_bytes is not None
+                and rss_bytes is not None
+                and rss_bytes > self.max_rss_bytes
+            )
+        )
+        with self._cond:
+            self._busy -= 1
+            self._in_use.discard(worker)
+            if not retire and not self._closed:
+                self._idle.append(worker)
+                worker = None
+            self._cond.notify()
+        if worker is not None:
+            logger.info(
+                f"Retiring module worker after {worker.jobs_done} jobs"
+                + (f" ({rss_bytes // (1024 * 1024)} MB RSS)" if rss_bytes else "")
+            )
+            worker.stop()
+
+    def discard(self, worker: PoolWorker):
+        """Kill a worker whose job was cancelled or crashed."""
+        worker.kill()
+        with self._cond:
+            self._busy -= 1
+            self._in_use.discard(worker)
+            self._cond.notify()
+
+    def shutdown(self):
+        """Stop idle workers and kill any that are still running a job."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            in_use = list(self._in_use)
+            self._cond.notify_all()
+        for worker in idle:
+            worker.stop()
+        for worker in in_use:
+            worker.kill()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+_pool_enabled = True
+
+
+def _register_shutdown(pool):
+    # Workers are non-daemonic (tools such as autosubsync start their own
+    # multiprocessing pools), and multiprocessing joins non-daemonic children at
+    # exit. A finalizer with an exit priority runs before that join, whereas a
+    # plain atexit hook registered earlier would run after it and hang.
+    multiprocessing.util.Finalize(pool, pool.shutdown, exitpriority=10)
+
+
+def get_module_worker_pool() -> Optional[ModuleWorkerPool]:
+    """Shared pool used by sync_core.run_module_tool, or None if disabled."""
+    global _pool
+    if not _pool_enabled:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = ModuleWorkerPool()
+            _register_shutdown(_pool)
+        return _pool
+
+
+def configure_module_worker_pool(
+    enabled: bool = True,
+    max_workers: Optional[int] = None,
+    max_jobs_per_worker: int = MAX_JOBS_PER_WORKER,
+    max_rss_mb: Optional[int] = MAX_WORKER_RSS_MB,
+):
+    """Replace the shared pool with one using the given limits."""
+    global _pool, _pool_enabled
+    with _pool_lock:
+        old, _pool = _pool, None
+        _pool_enabled = enabled
+        if enabled:
+            _pool = ModuleWorkerPool(max_workers, max_jobs_per_worker, max_rss_mb)
+            _register_shutdown(_pool)
+    if old is not None:
+        old.shutdown()
@@ -59,7 +59,7 @@ Dialogue: 0,0:00:03.50,0:00:04.80,Default,,0,0,0,,Second Line / 第二行
         executed_cmd_args = []
         logged_messages = []
 
-        def mock_run_module_tool(module_name, cmd_args, callbacks, sync_tool, process_holder=None):
+        def mock_run_module_tool(module_name, cmd_args, callbacks, sync_tool, process_holder=None, usage=None):
             self.assertEqual(module_name, "call_autosubsync")
             executed_cmd_args.extend(cmd_args)
             # cmd_args structure: [video, subtitle_input, output_path, ...]
@@ -85,7 +85,7 @@ Dialogue: 0,0:00:03.50,0:00:04.80,Default,,0,0,0,,Second Line / 第二行
             on_log=lambda msg, color: logged_messages.append(msg)
         )
 
-        with patch("sync_core.run_module_tool", side_effect=mock_run_module_tool):
+        with patch("sync_core.run_module_tool_async", side_effect=mock_run_module_tool):
             result = sync_core.run_sync(
                 self.video_path,
                 self.ass_path,
@@ -112,7 +112,7 @@ Dialogue: 0,0:00:03.50,0:00:04.80,Default,,0,0,0,,Second Line / 第二行
         config = dict(DEFAULT_OPTIONS)
         config["sync_tool"] = "autosubsync"
 
-        def mock_run_module_tool(module_name, cmd_args, callbacks, sync_tool, process_holder=None):
+        def mock_run_module_tool(module_name, cmd_args, callbacks, sync_tool, process_holder=None, usage=None):
             # Simulate autosubsync returning 1 due to low quality of fit
             return 1
 
@@ -121,7 +121,7 @@ Dialogue: 0,0:00:03.50,0:00:04.80,Default,,0,0,0,,Second Line / 第二行
             on_error=lambda msg: error_messages.append(msg)
         )
 
-        with patch("sync_core.run_module_tool", side_effect=mock_run_module_tool):
+        with patch("sync_core.run_module_tool_async", side_effect=mock_run_module_tool):
             result = sync_core.run_sync(
                 self.video_path,
                 self.ass_path,
@@ -141,7 +141,7 @@ Dialogue: 0,0:00:03.50,0:00:04.80,Default,,0,0,0,,Second Line / 第二行
         config["sync_tool"] = "autosubsync"
         out_file = os.path.join(self.temp_dir, "empty_out.srt")
 
-        def mock_run_module_tool(module_name, cmd_args, callbacks, sync_tool, process_holder=None):
+        def mock_run_module_tool(module_name, cmd_args, callbacks, sync_tool, process_holder=None, usage=None):
             # Create a 0-byte file and return 0
             with open(out_file, "w", encoding="utf-8") as f:
                 pass
@@ -152,7 +152,7 @@ Dialogue: 0,0:00:03.50,0:00:04.80,Default,,0,0,0,,Second Line / 第二行
             on_error=lambda msg: error_messages.append(msg)
         )
 
-        with patch("sync_core.run_module_tool", side_effect=mock_run_module_tool):
+        with patch("sync_core.run_module_tool_async", side_effect=mock_run_module_tool):
             result = sync_core.run_sync(
                 self.video_path,
                 self.ass_path,
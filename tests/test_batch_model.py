@@ -0,0 +1,359 @@
+import os
+import sys
+import time
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main")))
+
+from PyQt6.QtCore import QMimeData, QPointF, Qt
+from PyQt6.QtGui import QDropEvent
+from PyQt6.QtTest import QAbstractItemModelTester, QTest
+from PyQt6.QtWidgets import QAbstractItemView, QApplication, QMessageBox, QWidget
+
+import texts
+from batch_model import UNDO_ITEM_COST, BatchItem
+from gui_batch_mode import BatchTreeView, create_tree_widget_item
+
+
+class _FakeApp(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.config = {"skip_previously_processed_videos": False}
+
+
+def _pair(view, n, sub=None):
+    parent = create_tree_widget_item(f"/lib/ep{n}.mkv", item_id=view._get_next_id())
+    create_tree_widget_item(
+        sub or f"/lib/ep{n}.srt", parent, item_id=view._get_next_id()
+    )
+    return parent
+
+
+class _InternalDrop(QDropEvent):
+    """A drop whose drag started in view, as Qt reports for internal moves."""
+
+    def __init__(self, view, pos):
+        self._mime = QMimeData()  # Kept alive for the event
+        super().__init__(
+            QPointF(pos),
+            Qt.DropAction.MoveAction,
+            self._mime,
+            Qt.MouseButton.LeftButton,
+            Qt.KeyboardModifier.NoModifier,
+        )
+        self._view = view
+
+    def source(self):
+        return self._view
+
+
+def _flat(item, rows):
+    rows.append(item)
+    if item.isExpanded():
+        for i in range(item.childCount()):
+            _flat(item.child(i), rows)
+    return rows
+
+
+class BatchViewTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._qapp = QApplication.instance() or QApplication(["-platform", "offscreen"])
+
+    def setUp(self):
+        self.app = _FakeApp()
+        self.view = BatchTreeView(self.app)
+        self.model = self.view._model
+
+    def tearDown(self):
+        self.view.deleteLater()
+        self.app.deleteLater()
+
+    def assertRowsMatchTree(self):
+        rows = []
+        for i in range(self.view.topLevelItemCount()):
+            _flat(self.view.topLevelItem(i), rows)
+        self.assertEqual(self.model.rowCount(), len(rows))
+        for row, item in enumerate(rows):
+            self.assertIs(self.model.item_at(row), item)
+            self.assertEqual(self.model.row_of(item), row)
+
+    def header(self):
+        return self.model.headerData(0, Qt.Orientation.Horizontal)
+
+    def counts(self, valid, invalid, skipped=0):
+        return texts.PAIRS_HEADER_LABEL.format(
+            valid=valid, invalid=invalid, skipped=skipped
+        )
+
+
+class TestBatchModel(BatchViewTestCase):
+    def test_model_contract(self):
+        QAbstractItemModelTester(
+            self.model, QAbstractItemModelTester.FailureReportingMode.Fatal
+        )
+        items = [_pair(self.view, n) for n in range(5)]
+        self.view.insertTopLevelItems(0, items)
+        items[1].setExpanded(False)
+        create_tree_widget_item("/lib/extra.srt", items[2])
+        self.model.move_items([items[0]], items[3])
+        self.model.remove_items([items[4], items[2].child(0)])
+        items[1].setExpanded(True)
+        self.view.clear()
+        self.assertEqual(self.model.rowCount(), 0)
+
+    def test_rows_follow_tree_edits(self):
+        items = [_pair(self.view, n) for n in range(6)]
+        self.view.addTopLevelItems(items[:3])
+        self.view.insertTopLevelItems(1, items[3:])
+        self.assertRowsMatchTree()
+        items[4].setExpanded(False)
+        self.assertEqual(self.model.row_of(items[4].child(0)), -1)
+        self.assertRowsMatchTree()
+        create_tree_widget_item("/lib/ep4.en.srt", items[4])
+        items[0].insertChild(0, BatchItem("a.srt"))
+        self.assertRowsMatchTree()
+        items[4].setExpanded(True)
+        self.assertEqual(items[4].childCount(), 2)
+        self.assertRowsMatchTree()
+        self.model.remove_items([items[0].child(1), items[2], items[5]])
+        self.assertRowsMatchTree()
+        self.assertEqual(self.view.takeTopLevelItem(0), items[0])
+        self.assertIsNone(items[0].parent())
+        self.assertRowsMatchTree()
+
+    def test_move_items(self):
+        items = [_pair(self.view, n) for n in range(4)]
+        self.view.addTopLevelItems(items)
+        # Reorder top-level items
+        self.assertTrue(
+            self.model.move_items([items[3], items[1]], self.model.root, items[0])
+        )
+        self.assertEqual(
+            [self.view.topLevelItem(i) for i in range(4)],
+            [items[1], items[3], items[0], items[2]],
+        )
+        # Move a subtitle under another reference
+        subtitle = items[2].child(0)
+        self.assertTrue(self.model.move_items([subtitle], items[0]))
+        self.assertIs(subtitle.parent(), items[0])
+        self.assertEqual(items[2].childCount(), 0)
+        # An item can't be moved into itself
+        self.assertFalse(self.model.move_items([items[0]], items[0]))
+        self.assertRowsMatchTree()
+
+    def test_selected_items_in_row_order(self):
+        items = [_pair(self.view, n) for n in range(3)]
+        self.view.addTopLevelItems(items)
+        selection = self.view.selectionModel()
+        for row in (4, 0, 1):
+            selection.select(
+                self.model.index(row, 0),
+                selection.SelectionFlag.Select | selection.SelectionFlag.Rows,
+            )
+        self.assertEqual(
+            self.view.selectedItems(), [items[0], items[0].child(0), items[2]]
+        )
+
+
+class TestBatchTreeView(BatchViewTestCase):
+    def test_validation_and_header_counts(self):
+        valid = _pair(self.view, 1)
+        duplicate = _pair(self.view, 1)
+        no_subtitle = create_tree_widget_item(
+            "/lib/ep2.mkv", item_id=self.view._get_next_id()
+        )
+        self.view.addTopLevelItems([valid, duplicate, no_subtitle])
+        self.view._perform_actual_ui_update()
+        self.assertEqual(valid.data(0, BatchTreeView.VALID_STATE_ROLE), "valid")
+        # The newest of two identical pairs is the invalid one
+        self.assertEqual(duplicate.data(0, BatchTreeView.VALID_STATE_ROLE), "invalid")
+        self.assertIn(texts.BATCH_VALIDATE_DUPLICATE_PAIR, duplicate.toolTip(0))
+        self.assertEqual(self.header(), self.counts(1, 2))
+        self.assertEqual(
+            self.view.get_all_valid_pairs(), [("/lib/ep1.mkv", "/lib/ep1.srt")]
+        )
+
+        # Removing the original makes the duplicate valid again
+        self.model.remove_items([valid])
+        self.view._perform_actual_ui_update()
+        self.assertEqual(duplicate.data(0, BatchTreeView.VALID_STATE_ROLE), "valid")
+        self.assertEqual(self.header(), self.counts(1, 1))
+
+        create_tree_widget_item("/lib/ep2.srt", no_subtitle)
+        self.view._perform_actual_ui_update()
+        self.assertEqual(self.header(), self.counts(2, 0))
+
+    def test_undo_restores_items(self):
+        self.view.addTopLevelItems([_pair(self.view, n) for n in range(3)])
+        self.view._perform_actual_ui_update()
+        self.view.remove_item(self.view.topLevelItem(1))
+        self.assertEqual(self.view.topLevelItemCount(), 2)
+        self.view.undo()
+        self.view._perform_actual_ui_update()
+        self.assertEqual(
+            [self.view.topLevelItem(i).text(0) for i in range(3)],
+            ["ep0.mkv", "ep1.mkv", "ep2.mkv"],
+        )
+        self.assertEqual(self.header(), self.counts(3, 0))
+        self.assertRowsMatchTree()
+
+    def test_undo_reverts_whole_action_after_dialog(self):
+        self.view.addTopLevelItems([_pair(self.view, n) for n in range(2)])
+        self.view._perform_actual_ui_update()
+        parent = self.view.topLevelItem(0)
+        files = ["/lib/extra.en.srt", "/lib/notes.txt", "/lib/extra.fr.srt"]
+
+        # The warning for the invalid file runs a nested event loop mid-action
+        warning = lambda *args: QApplication.processEvents()
+        with patch("gui_batch_mode.open_filedialog", return_value=files):
+            with patch.object(QMessageBox, "warning", side_effect=warning):
+                self.view.add_subtitle_to_item_dialog(parent)
+        QApplication.processEvents()
+        self.assertEqual(parent.childCount(), 3)
+        self.assertEqual(len(self.view._undo_stack), 1)
+
+        self.view.undo()
+        self.view._perform_actual_ui_update()
+        self.assertEqual(parent.childCount(), 1)
+        self.assertEqual(parent.child(0).text(0), "ep0.srt")
+        self.assertRowsMatchTree()
+
+    def test_undo_redo_changes_in_place(self):
+        items = [_pair(self.view, n) for n in range(4)]
+        self.view.addTopLevelItems(items)
+        self.view._perform_actual_ui_update()
+
+        self.view._save_state_for_undo()
+        self.model.move_items([items[3]], self.model.root, items[0])
+        self.view.skip_process_items([items[1]])
+        self.view.undo()
+        self.assertEqual([self.view.topLevelItem(i) for i in range(4)], items)
+        self.assertFalse(items[1].data(0, BatchTreeView.PROCESSED_STATE_ROLE))
+        self.view.redo()
+        self.assertEqual(
+            [self.view.topLevelItem(i) for i in range(4)],
+            [items[3], items[0], items[1], items[2]],
+        )
+        self.assertTrue(items[1].data(0, BatchTreeView.PROCESSED_STATE_ROLE))
+        self.assertRowsMatchTree()
+
+        self.view.clear_all_items()
+        self.assertFalse(self.view.has_items())
+        self.view.undo()
+        self.view._perform_actual_ui_update()
+        self.assertEqual(self.view.topLevelItemCount(), 4)
+        self.assertEqual(self.header(), self.counts(4, 0))
+        self.assertRowsMatchTree()
+
+    def test_undo_memory_budget(self):
+        self.view.addTopLevelItems([_pair(self.view, n) for n in range(200)])
+        self.view._undo_memory_budget = 40 * UNDO_ITEM_COST
+        for _ in range(5):
+            self.view.remove_item(self.view.topLevelItem(0))
+        # Each removal keeps two items alive; only the newest entries fit
+        self.assertEqual(len(self.view._undo_stack), 5)
+        for _ in range(30):
+            self.view.remove_item(self.view.topLevelItem(0))
+        self.assertLessEqual(
+            sum(c.cost for c in self.view._undo_stack), 40 * UNDO_ITEM_COST
+        )
+        self.assertEqual(len(self.view._undo_stack), 20)
+
+        # A large entry is kept even when it exceeds the budget alone
+        with patch.object(
+            QMessageBox, "question", return_value=QMessageBox.StandardButton.Yes
+        ):
+            self.view.clear_all_items()
+        self.assertEqual(len(self.view._undo_stack), 1)
+        self.view.undo()
+        self.assertEqual(self.view.topLevelItemCount(), 165)
+
+    def test_arrow_keys_expand_and_collapse(self):
+        parent = _pair(self.view, 1)
+        self.view.addTopLevelItem(parent)
+        self.view.setCurrentItem(parent)
+        QTest.keyClick(self.view, Qt.Key.Key_Left)
+        self.assertFalse(parent.isExpanded())
+        self.assertEqual(self.model.rowCount(), 1)
+        QTest.keyClick(self.view, Qt.Key.Key_Right)
+        self.assertTrue(parent.isExpanded())
+        QTest.keyClick(self.view, Qt.Key.Key_Right)
+        self.assertIs(self.view.currentItem(), parent.child(0))
+        QTest.keyClick(self.view, Qt.Key.Key_Left)
+        self.assertIs(self.view.currentItem(), parent)
+        self.assertTrue(parent.isExpanded())
+        self.assertRowsMatchTree()
+
+    def test_double_click_toggles_parent_rows(self):
+        parent = _pair(self.view, 1)
+        self.view.addTopLevelItem(parent)
+        self.view.doubleClicked.emit(self.model.index_from_item(parent))
+        self.assertFalse(parent.isExpanded())
+        self.view.doubleClicked.emit(self.model.index_from_item(parent))
+        self.assertTrue(parent.isExpanded())
+        # Subtitle rows have nothing to expand
+        self.view.doubleClicked.emit(self.model.index_from_item(parent.child(0)))
+        self.assertTrue(parent.isExpanded())
+        self.assertRowsMatchTree()
+
+    def test_internal_drop_moves_items(self):
+        items = [_pair(self.view, n) for n in range(3)]
+        self.view.addTopLevelItems(items)
+        self.view._perform_actual_ui_update()
+        self.view.resize(400, 600)
+        selection = self.view.selectionModel()
+
+        # Onto empty space: the pair moves to the end
+        self.view.setCurrentItem(items[0])
+        self.view.dropEvent(_InternalDrop(self.view, QPointF(5, 590)))
+        self.assertEqual(
+            [self.view.topLevelItem(i) for i in range(3)],
+            [items[1], items[2], items[0]],
+        )
+
+        # Onto a reference: the subtitle becomes its child
+        subtitle = items[1].child(0)
+        selection.clearSelection()
+        self.view.setCurrentItem(subtitle)
+        target = self.view.visualRect(self.model.index_from_item(items[2])).center()
+        Position = QAbstractItemView.DropIndicatorPosition
+        with patch.object(
+            self.view, "dropIndicatorPosition", return_value=Position.OnItem
+        ):
+            self.view.dropEvent(_InternalDrop(self.view, QPointF(target)))
+        self.assertIs(subtitle.parent(), items[2])
+        self.assertEqual(items[1].childCount(), 0)
+        self.assertRowsMatchTree()
+
+        self.view.undo()
+        self.view.undo()
+        self.assertEqual([self.view.topLevelItem(i) for i in range(3)], items)
+        self.assertIs(subtitle.parent(), items[1])
+        self.assertRowsMatchTree()
+
+    def test_large_batch_updates_incrementally(self):
+        count = 50_000
+        start = time.perf_counter()
+        self.view.insertTopLevelItems(0, [_pair(self.view, n) for n in range(count)])
+        self.view._perform_actual_ui_update()
+        build = time.perf_counter() - start
+        self.assertEqual(self.model.rowCount(), 2 * count)
+        self.assertEqual(self.header(), self.counts(count, 0))
+
+        # Small edits must not revisit all 50k items
+        start = time.perf_counter()
+        for n in range(20):
+            self.view.addTopLevelItem(_pair(self.view, count + n))
+            self.model.remove_items([self.view.topLevelItem(n * 100)])
+            self.view._perform_actual_ui_update()
+        edits = time.perf_counter() - start
+        self.assertEqual(self.header(), self.counts(count, 0))
+        self.assertLess(edits, max(build, 0.5))
+        self.assertLess(build, 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
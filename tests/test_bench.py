@@ -0,0 +1,108 @@
+import io
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main")))
+
+import bench
+import cli
+from constants import FFMPEG_EXECUTABLE
+from subtitle_ir import FORMATS, load_subtitle
+
+
+@unittest.skipUnless(shutil.which(FFMPEG_EXECUTABLE), "needs ffmpeg")
+class TestBench(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_corpus_is_deterministic(self):
+        first = bench.generate_corpus(os.path.join(self.temp_dir, "a"), [15], seed=7)
+        second = bench.generate_corpus(os.path.join(self.temp_dir, "b"), [15], seed=7)
+        (item,) = first
+        self.assertEqual(set(item.subtitles), set(FORMATS))
+        for a, b in zip(
+            [item.audio, item.reference, *item.subtitles.values()],
+            [second[0].audio, second[0].reference, *second[0].subtitles.values()],
+        ):
+            with open(a, "rb") as f, open(b, "rb") as g:
+                self.assertEqual(f.read(), g.read(), a)
+        self.assertTrue(os.path.getsize(item.video))
+
+    def test_every_format_carries_the_offset(self):
+        (item,) = bench.generate_corpus(self.temp_dir, [30])
+        truth = load_subtitle(item.reference)
+        self.assertEqual(len(truth), item.cues)
+        self.assertGreater(item.cues, 0)
+        for ext, path in item.subtitles.items():
+            shifted = load_subtitle(path)
+            self.assertEqual(len(shifted), item.cues, ext)
+            # STL stores frames at 30 fps
+            error = abs(shifted.starts - truth.starts - item.offset_ms).max()
+            self.assertLessEqual(error, 34, ext)
+
+    def test_cli_report(self):
+        argv = [
+            "--config-file",
+            os.path.join(self.temp_dir, "none.json"),
+            "-q",
+            "bench",
+            "-t",
+            "fftalign",
+            "--durations",
+            "20",
+            "--counts",
+            "10",
+            "--repeat",
+            "1",
+            "--max-jobs",
+            "2",
+            "-o",
+            self.temp_dir,
+            "--json",
+        ]
+        out = io.StringIO()
+        with patch.object(cli, "_ensure_ffmpeg"), redirect_stdout(out):
+            self.assertEqual(cli.main(argv), cli.EXIT_OK)
+        report = json.loads(out.getvalue())
+        (tool,) = report["tools"]
+        self.assertTrue(tool["ok"], tool["message"])
+        self.assertEqual(tool["reference"], "subtitle")
+        self.assertLess(tool["error_ms"], 100)
+        self.assertEqual(len(report["converters"]), len(FORMATS) - 1)
+        self.assertTrue(all(r["ok"] for r in report["converters"] + report["shifter"]))
+        self.assertEqual(report["pairer"][0]["pairs"], 10)
+        self.assertEqual(report["database"][0]["found"], 10)
+        self.assertEqual([run["jobs"] for run in report["jobs"]["runs"]], [1, 2])
+        self.assertIn(report["jobs"]["recommended"], (1, 2))
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, "work")))
+
+
+class TestRecommendJobs(unittest.TestCase):
+    def test_fewest_jobs_near_the_best_throughput(self):
+        runs = [
+            {"jobs": 1, "pairs_per_s": 2.0},
+            {"jobs": 2, "pairs_per_s": 3.9},
+            {"jobs": 4, "pairs_per_s": 4.0},
+            {"jobs": 8, "pairs_per_s": 3.5},
+        ]
+        self.assertEqual(bench.recommend_jobs(runs), 2)
+        self.assertEqual(bench.recommend_jobs(runs, tolerance=0), 4)
+        self.assertIsNone(bench.recommend_jobs([{"jobs": 1, "pairs_per_s": 0}]))
+
+    def test_jobs_candidates(self):
+        self.assertEqual(bench.jobs_candidates(1), [1])
+        self.assertEqual(bench.jobs_candidates(8), [1, 2, 4, 8])
+        self.assertEqual(bench.jobs_candidates(12), [1, 2, 4, 8, 12])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main")))
+
+import cli
+import sync_core
+
+
+class TestCliBatchJobs(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.pairs = []
+        for i in range(6):
+            video = os.path.join(self.temp_dir, f"episode{i}.mkv")
+            sub = os.path.join(self.temp_dir, f"episode{i}.srt")
+            with open(video, "wb") as f:
+                f.write(b"\x00" * 16)
+            with open(sub, "w", encoding="utf-8") as f:
+                f.write("1\n00:00:01,000 --> 00:00:02,000\nHi\n")
+            self.pairs.append((video, sub))
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _fake_run_sync(self, fail_on=None, delay=0.05):
+        def fake(reference, subtitle, *, tool, output=None, config, callbacks=None, **_):
+            with self.lock:
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            try:
+                deadline = time.monotonic() + delay
+                while time.monotonic() < deadline:
+                    if callbacks and callbacks._cancelled():
+                        return sync_core.SyncResult(
+                            False, None, tool, "cancelled", None, 0, True
+                        )
+                    time.sleep(0.005)
+                if fail_on and os.path.basename(subtitle) in fail_on:
+                    return sync_core.SyncResult(False, None, tool, "boom", 1, 1)
+                out = subtitle + ".synced.srt"
+                shutil.copy(subtitle, out)
+                return sync_core.SyncResult(True, out, tool, "ok", 0, 1)
+            finally:
+                with self.lock:
+                    self.active -= 1
+
+        return fake
+
+    def _run_cli(self, extra):
+        argv = ["--config-file", os.path.join(self.temp_dir, "none.json"), "-q", "batch"]
+        for video, sub in self.pairs:
+            argv += ["--pair", video, sub]
+        argv += [
+            "--no-embedded-subtitles",
+            "--no-skip-processed",
+            "--no-mark-processed",
+            "--encoding",
+            "disabled",
+            "--json",
+        ] + extra
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            rc = cli.main(argv)
+        lines = [json.loads(line) for line in buf.getvalue().splitlines() if line]
+        return rc, lines
+
+    def test_jobs_run_pairs_concurrently_and_report_every_pair(self):
+        with patch.object(cli, "_ensure_ffmpeg"), patch(
+            "sync_core.run_sync", side_effect=self._fake_run_sync()
+        ):
+            rc, lines = self._run_cli(["--jobs", "3"])
+
+        self.assertEqual(rc, cli.EXIT_OK)
+        self.assertGreater(self.max_active, 1)
+        self.assertLessEqual(self.max_active, 3)
+        records, summary = lines[:-1], lines[-1]["summary"]
+        self.assertEqual(len(records), len(self.pairs))
+        self.assertEqual(
+            sorted(r["input"] for r in records), sorted(s for _, s in self.pairs)
+        )
+        timings = summary.pop("timings")
+        self.assertEqual(summary, {"total": 6, "ok": 6, "failed": 0, "skipped": 0})
+        self.assertEqual(list(timings), ["output_encoding", "total"])
+
+    def test_jobs_continue_on_error_counts_failures(self):
+        with patch.object(cli, "_ensure_ffmpeg"), patch(
+            "sync_core.run_sync",
+            side_effect=self._fake_run_sync(fail_on={"episode2.srt"}),
+        ):
+            rc, lines = self._run_cli(["--jobs", "4", "--continue-on-error"])
+
+        self.assertEqual(rc, cli.EXIT_SYNC_FAILED)
+        summary = lines[-1]["summary"]
+        self.assertEqual(summary["ok"], 5)
+        self.assertEqual(summary["failed"], 1)
+        self.assertNotIn("aborted", summary)
+
+    def test_jobs_abort_on_first_failure_cancels_remaining(self):
+        with patch.object(cli, "_ensure_ffmpeg"), patch(
+            "sync_core.run_sync",
+            side_effect=self._fake_run_sync(fail_on={"episode0.srt"}, delay=0.2),
+        ):
+            rc, lines = self._run_cli(["--jobs", "2"])
+
+        self.assertEqual(rc, cli.EXIT_SYNC_FAILED)
+        summary = lines[-1]["summary"]
+        self.assertTrue(summary["aborted"])
+        self.assertEqual(summary["failed"], 1)
+        self.assertLess(summary["ok"], len(self.pairs) - 1)
+
+    def test_jobs_never_share_an_output(self):
+        # Same-named subtitles from two folders into one --output-dir
+        self.pairs = []
+        for season in ("s1", "s2"):
+            folder = os.path.join(self.temp_dir, season)
+            os.makedirs(folder)
+            video = os.path.join(folder, "episode.mkv")
+            sub = os.path.join(folder, "episode.srt")
+            for path in (video, sub):
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write("1\n00:00:01,000 --> 00:00:02,000\nHi\n")
+            self.pairs.append((video, sub))
+        out_dir = os.path.join(self.temp_dir, "out")
+
+        def fake(reference, subtitle, *, tool, output=None, config, **_):
+            if output is None:
+                output = sync_core.determine_output_path(
+                    reference, subtitle, config=config
+                )
+            time.sleep(0.1)  # Both jobs resolve their output before either writes
+            shutil.copy(subtitle, output)
+            return sync_core.SyncResult(True, output, tool, "ok", 0, 1)
+
+        with patch.object(cli, "_ensure_ffmpeg"), patch(
+            "sync_core.run_sync", side_effect=fake
+        ):
+            rc, lines = self._run_cli(["--jobs", "2", "--output-dir", out_dir])
+
+        self.assertEqual(rc, cli.EXIT_OK)
+        self.assertEqual(
+            sorted(record["output"] for record in lines[:-1]),
+            [
+                os.path.join(out_dir, "episode.srt"),
+                os.path.join(out_dir, "episode_2.srt"),
+            ],
+        )
+
+    def test_summary_aggregates_stage_timings(self):
+        def fake(reference, subtitle, *, tool, config, **_):
+            idx = int(os.path.basename(subtitle)[len("episode")])
+            out = subtitle + ".synced.srt"
+            shutil.copy(subtitle, out)
+            result = sync_core.SyncResult(True, out, tool, "ok", 0, 1)
+            result.timings = {"validation": 1.0, "tool": 100.0 * (idx + 1)}
+            return result
+
+        with patch.object(cli, "_ensure_ffmpeg"), patch(
+            "sync_core.run_sync", side_effect=fake
+        ):
+            rc, lines = self._run_cli(["--jobs", "1"])
+
+        self.assertEqual(rc, cli.EXIT_OK)
+        records, summary = lines[:-1], lines[-1]["summary"]
+        for record in records:
+            self.assertEqual(
+                list(record["timings"]), ["validation", "tool", "output_encoding"]
+            )
+        tool = summary["timings"]["tool"]
+        self.assertEqual(tool, {"total_ms": 2100.0, "p50_ms": 300.0, "p95_ms": 600.0})
+        self.assertEqual(summary["timings"]["validation"]["total_ms"], 6.0)
+        self.assertGreaterEqual(summary["timings"]["total"]["p95_ms"], 601.0)
+
+    def test_percentile_is_nearest_rank(self):
+        values = [5, 1, 4, 2, 3]
+        self.assertEqual(cli._percentile(values, 50), 3)
+        self.assertEqual(cli._percentile(values, 95), 5)
+        self.assertEqual(cli._percentile([7], 95), 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
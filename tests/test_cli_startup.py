@@ -0,0 +1,125 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+import subprocess
+
+MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main"))
+
+# Modules the CLI must not load just to start up, parse arguments or print
+# its version: Qt, the GUI translation catalog and libraries only needed by
+# particular commands.
+HEAVY_MODULES = (
+    "PyQt6",
+    "texts",
+    "requests",
+    "rich",
+    "cchardet",
+    "chardet",
+    "charset_normalizer",
+    "platformdirs",
+    "numpy",
+)
+# Cumulative import time of the CLI's own modules with warm bytecode. A cold
+# start used to take well over 200 ms; it is now a few tens of ms.
+IMPORT_BUDGET_MS = 150
+
+CHILD = """
+import json, sys
+startup = set(sys.modules)
+sys.path.insert(0, {main_dir!r})
+import cli
+{call}
+print(json.dumps(sorted(set(sys.modules) - startup)))
+"""
+
+
+class TestCliStartup(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.cache_dir = tempfile.mkdtemp()
+        cls.env = dict(os.environ, PYTHONPYCACHEPREFIX=cls.cache_dir)
+        cls.env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.cache_dir, ignore_errors=True)
+
+    def _run(self, call=""):
+        code = CHILD.format(main_dir=MAIN_DIR, call=call)
+        res = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            env=self.env,
+            timeout=120,
+        )
+        self.assertEqual(res.returncode, 0, res.stderr)
+        modules = json.loads(res.stdout.splitlines()[-1])
+        return modules, res.stdout.splitlines()[:-1], res.stderr
+
+    @staticmethod
+    def _import_ms(importtime_output):
+        """Self time of every module imported after interpreter startup."""
+        lines = [
+            line.split("|")
+            for line in importtime_output.splitlines()
+            if line.startswith("import time:") and "self [us]" not in line
+        ]
+        names = [fields[2].strip() for fields in lines]
+        start = len(names) - names[::-1].index("site") if "site" in names else 0
+        return sum(int(fields[0].split(":")[1]) for fields in lines[start:]) / 1000
+
+    def assertNoHeavyModules(self, modules):
+        loaded = sorted(
+            name for name in modules if name.split(".")[0] in HEAVY_MODULES
+        )
+        self.assertEqual(loaded, [])
+
+    def test_import_is_light(self):
+        modules, _, _ = self._run()
+        self.assertNoHeavyModules(modules)
+        self.assertNotIn("utils", modules)
+        self.assertNotIn("constants", modules)
+
+    def test_version_and_help_are_light(self):
+        modules, stdout, _ = self._run('cli.main(["version"])')
+        self.assertNoHeavyModules(modules)
+        self.assertRegex(stdout[0], r"^\d+(\.\d+)*")
+
+        modules, _, _ = self._run(
+            'try:\n    cli.main(["sync", "--help"])\nexcept SystemExit:\n    pass'
+        )
+        self.assertNoHeavyModules(modules)
+
+        modules, _, _ = self._run(
+            'try:\n    cli.main(["shift", "--help"])\nexcept SystemExit:\n    pass'
+        )
+        self.assertNoHeavyModules(modules)
+
+    def test_shift_is_light(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "a.srt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("1\n00:00:01,000 --> 00:00:02,000\nHello\n")
+            modules, stdout, _ = self._run(
+                f'cli.main(["shift", {path!r}, "500", "--json"])'
+            )
+        self.assertTrue(json.loads(stdout[0])["ok"])
+        # numpy holds the subtitle times, so only the shift itself may load it
+        self.assertNoHeavyModules(
+            [name for name in modules if name.split(".")[0] != "numpy"]
+        )
+
+    def test_import_time_budget(self):
+        self._run()  # populate the bytecode cache
+        best = min(
+            self._import_ms(self._run('cli.main(["version"])')[2]) for _ in range(3)
+        )
+        self.assertLess(best, IMPORT_BUDGET_MS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import sys
+import codecs
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main")))
+
+import encoding_detection
+from encoding_detection import cache_stats, detect_bytes_encoding, detect_encoding
+
+SRT = "1\n00:00:01,000 --> 00:00:02,000\n{}\n\n"
+
+
+class TestEncodingDetection(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        encoding_detection.clear_cache()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        encoding_detection.clear_cache()
+
+    def _write(self, name, data):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_fast_paths_skip_statistical_detectors(self):
+        cases = {
+            b"Hello": "ascii",
+            "Grüße".encode("utf-8"): "utf-8",
+            codecs.BOM_UTF8 + b"Hi": "utf-8-sig",
+            "Hi".encode("utf-16"): "utf-16",
+        }
+        with mock.patch.object(encoding_detection, "_run_detectors") as detectors:
+            for data, expected in cases.items():
+                self.assertEqual(detect_bytes_encoding(data), expected)
+            detectors.assert_not_called()
+
+    def test_legacy_encoding_uses_detectors(self):
+        text = SRT.format("Привет, как дела? Это тестовый субтитр.") * 20
+        path = self._write("cyrillic.srt", text.encode("cp1251"))
+        encoding = detect_encoding(path)
+        self.assertNotIn(encoding, ("ascii", "utf-8"))
+        with open(path, "rb") as f:
+            self.assertEqual(f.read().decode(encoding), text)
+
+    def test_memo_is_keyed_by_file_version(self):
+        path = self._write("movie.srt", SRT.format("Hello").encode())
+        self.assertEqual(detect_encoding(path), "ascii")
+        self.assertEqual(detect_encoding(path), "ascii")
+        self.assertEqual(cache_stats()["hits"], 1)
+        # A rewritten file (new size and mtime) is detected again.
+        self._write("movie.srt", SRT.format("Grüße").encode())
+        os.utime(path, ns=(0, 10**9))
+        self.assertEqual(detect_encoding(path), "utf-8")
+        self.assertEqual(cache_stats()["misses"], 2)
+
+    def test_large_file_is_sampled(self):
+        cue = SRT.format("Grüße aus München").encode("latin-1")
+        path = self._write("big.srt", cue * 2000)
+        with (
+            mock.patch.object(encoding_detection, "FULL_UTF8_CHECK_BYTES", 4096),
+            mock.patch.object(encoding_detection, "SAMPLE_BYTES", 3000),
+            mock.patch.object(
+                encoding_detection, "_run_detectors", return_value="ISO-8859-1"
+            ) as detectors,
+        ):
+            self.assertEqual(detect_encoding(path), "iso-8859-1")
+        sample = detectors.call_args[0][0]
+        self.assertLess(len(sample), 3100)
+
+    def test_sampled_utf8_tolerates_cut_characters(self):
+        data = ("é" * 5000).encode("utf-8")
+        chunks = encoding_detection._sample_chunks(data, 301)
+        self.assertEqual(detect_bytes_encoding(chunks), "utf-8")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,7 @@
 import os
 import sys
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main")))
 
@@ -12,7 +12,7 @@ from constants import (
 )
 from utils import check_file_readable, check_pgs_subtitles_usable
 from subtitle_extractor import should_extract_subtitles
-from sync_core import build_cmd, determine_output_path, run_sync
+from sync_core import SyncCallbacks, build_cmd, determine_output_path, run_sync
 import call_ffsubsync
 
 
@@ -250,11 +250,9 @@ def test_run_sync_pgs_fallback_when_unusable(tmp_path):
         return 0
 
     with patch("utils.check_pgs_subtitles_usable", return_value=(False, "no usable timing packets")), \
-         patch("sync_core.run_module_tool", side_effect=mock_run_module):
+         patch("sync_core.run_module_tool_async", side_effect=mock_run_module):
         logs = []
-        callbacks = MagicMock()
-        callbacks._log.side_effect = lambda msg, color=None: logs.append((str(msg), color))
-        callbacks._cancelled.return_value = False
+        callbacks = SyncCallbacks(on_log=lambda msg, color=None: logs.append((str(msg), color)))
         result = run_sync(video_file, sub_file, tool="ffsubsync", config=config, callbacks=callbacks)
         assert any("Checking for PGS subtitles..." in m for m, c in logs)
         assert result.ok is True
@@ -290,7 +288,7 @@ def test_run_sync_with_remote_url(tmp_path):
     url = "https://example.com/stream.mp4"
     config = dict(DEFAULT_OPTIONS)
 
-    with patch("sync_core.run_module_tool", return_value=0):
+    with patch("sync_core.run_module_tool_async", return_value=0):
         result = run_sync(
             url,
             sub_file,
@@ -357,3 +355,130 @@ def test_upstream_ffsubsync_pgs_support_detector():
                 "The patch _patch_ffsubsync_pgs_timings in call_ffsubsync.py may no longer be required.",
                 UserWarning,
             )
+
+
+class _LeakyRecurrentSession:
+    """Stand-in for the Silero ONNX session: a per-row leaky integrator."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def run(self, _outputs, feeds):
+        import numpy as np
+
+        self.calls += 1
+        x, state = feeds["input"], feeds["state"]
+        new_state = state * 0.8
+        new_state[0, :, 0] += np.abs(x).mean(axis=1)
+        prob = 1.0 / (1.0 + np.exp(-(new_state[0, :, 0] - 0.5) * 10))
+        return prob[:, None].astype(np.float32), new_state.astype(np.float32)
+
+
+def _serial_silero(session, chunks, state):
+    import numpy as np
+
+    probs = []
+    for chunk in chunks:
+        out, state = session.run(
+            None, {"input": chunk[None], "state": state, "sr": np.array(16000)}
+        )
+        probs.append(float(out[0][0]))
+    return np.array(probs, dtype=np.float32), state
+
+
+def test_batched_silero_matches_sequential_inference():
+    """Batched segments reproduce sequential Silero outputs within tolerance."""
+    import numpy as np
+
+    rng = np.random.default_rng(7)
+    gate = np.repeat(rng.random(90) > 0.5, 25 * 512)
+    audio = (gate * 0.6 * rng.standard_normal(len(gate))).astype(np.float32)
+    chunks = call_ffsubsync._split_chunks(audio[: len(audio) - 100], 512)
+    state = np.zeros((2, 1, 128), dtype=np.float32)
+    state[0, 0, 0] = 0.3
+
+    expected, expected_state = _serial_silero(_LeakyRecurrentSession(), chunks, state)
+    session = _LeakyRecurrentSession()
+    probs, final_state = call_ffsubsync.run_silero_batched(
+        session, chunks, state, segments=8, warmup=32, min_segment=128
+    )
+
+    assert probs.shape == expected.shape
+    assert np.max(np.abs(probs - expected)) < 1e-2
+    assert final_state.shape == (2, 1, 128)
+    assert np.allclose(final_state, expected_state, atol=1e-2)
+    assert session.calls < len(chunks) // 4
+
+    single, single_state = call_ffsubsync.run_silero_batched(
+        _LeakyRecurrentSession(), chunks, state, segments=1
+    )
+    assert np.array_equal(single, expected)
+    assert np.array_equal(single_state, expected_state)
+
+
+def _write_tone_wav(path, seconds=4, sample_rate=16000):
+    import wave
+    import numpy as np
+
+    t = np.arange(seconds * sample_rate) / sample_rate
+    gate = (t % 2) < 1
+    samples = (gate * 8000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16)
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(samples.tobytes())
+
+
+def test_speech_cache_skips_decoding_for_repeat_reference(tmp_path, monkeypatch):
+    """A second fit of the same reference content is served from the speech cache."""
+    import shutil
+    import numpy as np
+    import ffsubsync.speech_transformers as st
+
+    if shutil.which("ffmpeg") is None:
+        pytest.skip("ffmpeg is not available")
+    monkeypatch.setenv("ASSY_SPEECH_CACHE_DIR", str(tmp_path / "cache"))
+    call_ffsubsync._patch_ffsubsync_speech_cache()
+    reference = tmp_path / "reference.wav"
+    _write_tone_wav(reference)
+
+    first = st.VideoSpeechTransformer(vad="webrtc", sample_rate=16000, frame_rate=48000, non_speech_label=0.0)
+    expected = first.fit(str(reference)).transform()
+    assert len(list((tmp_path / "cache").glob("*.npy"))) == 1
+
+    # Same content under another name, with decoding made impossible.
+    renamed = tmp_path / "renamed.wav"
+    shutil.copy(reference, renamed)
+    with patch.object(st.subprocess, "Popen", side_effect=AssertionError("decoded again")):
+        second = st.VideoSpeechTransformer(vad="webrtc", sample_rate=16000, frame_rate=48000, non_speech_label=0.0)
+        cached = second.fit(str(renamed)).transform()
+    assert isinstance(cached, np.memmap)
+    assert np.array_equal(cached, expected)
+
+    # Different VAD settings must not reuse the entry.
+    other = st.VideoSpeechTransformer(vad="webrtc", sample_rate=16000, frame_rate=48000, non_speech_label=0.5)
+    assert other.fit(str(reference)).transform() is not None
+    assert len(list((tmp_path / "cache").glob("*.npy"))) == 2
+
+
+def test_speech_cache_evicts_least_recently_used(tmp_path):
+    """Entries beyond the size budget are evicted oldest-use first."""
+    import time
+    import numpy as np
+    from speech_cache import SpeechCache
+
+    cache = SpeechCache(str(tmp_path), max_bytes=2 * 8000 + 512)
+    for key in ("a", "b"):
+        assert cache.put(key, np.zeros(1000, dtype=np.float64))
+    past = time.time() - 60
+    os.utime(tmp_path / "a.npy", (past, past))
+    os.utime(tmp_path / "b.npy", (past - 60, past - 60))
+    assert cache.get("b") is not None  # b becomes the most recently used
+    assert cache.put("c", np.ones(1000, dtype=np.float64))
+
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert np.array_equal(cache.get("c"), np.ones(1000))
+    assert not cache.put("huge", np.zeros(10000))
+    assert (cache.hits, cache.misses) == (3, 1)
@@ -0,0 +1,129 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main")))
+
+import fft_align
+import subtitle_ir
+import sync_core
+
+
+def _cues(count=300, seed=0):
+    rng = np.random.default_rng(seed)
+    starts = np.cumsum(rng.integers(1000, 6000, count))
+    ends = np.minimum(
+        starts + rng.integers(500, 4000, count), np.append(starts[1:], 10**12) - 1
+    )
+    return starts.astype(np.int64), ends.astype(np.int64)
+
+
+def _write_subtitle(path, starts, ends):
+    texts = [f"Line {n}" for n in range(1, len(starts) + 1)]
+    doc = subtitle_ir.SubtitleDocument.from_cues("srt", starts, ends, texts)
+    subtitle_ir.save_subtitle(doc, path, subtitle_ir.format_for_path(path))
+
+
+class TestFindAlignment(unittest.TestCase):
+    def test_recovers_offset(self):
+        starts, ends = _cues()
+        offset, ratio, _ = fft_align.find_alignment(
+            starts, ends, starts - 4320, ends - 4320
+        )
+        self.assertEqual(offset, 4320)
+        self.assertEqual(ratio, 1.0)
+
+    def test_recovers_framerate_ratio(self):
+        starts, ends = _cues()
+        scale = 25.0 / 23.976
+        sub_starts = np.rint((starts - 1500) / scale).astype(np.int64)
+        sub_ends = np.rint((ends - 1500) / scale).astype(np.int64)
+        ratios = [1.0] + fft_align.FRAMERATE_RATIOS
+        offset, ratio, _ = fft_align.find_alignment(
+            starts, ends, sub_starts, sub_ends, ratios=ratios
+        )
+        self.assertAlmostEqual(ratio, scale)
+        self.assertLessEqual(abs(offset - 1500), fft_align.BIN_MS)
+
+    def test_max_offset_limits_search(self):
+        starts, ends = _cues()
+        offset, _, _ = fft_align.find_alignment(
+            starts, ends, starts + 30000, ends + 30000, max_offset_ms=10000
+        )
+        self.assertLessEqual(abs(offset), 10000)
+
+
+class TestFftAlignTool(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        starts, ends = _cues(count=100)
+        self.reference = os.path.join(self.temp_dir, "reference.srt")
+        self.subtitle = os.path.join(self.temp_dir, "subtitle.ass")
+        self.output = os.path.join(self.temp_dir, "output.ass")
+        _write_subtitle(self.reference, starts, ends)
+        _write_subtitle(self.subtitle, starts + 2500, ends + 2500)
+        self.expected_starts = starts
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_run_sync_aligns_in_process(self):
+        lines = []
+        callbacks = sync_core.SyncCallbacks(
+            on_subprocess_line=lambda l, _: lines.append(l)
+        )
+        with (
+            patch.object(sync_core, "run_module_tool_async") as module_tool,
+            patch.object(sync_core, "run_executable_tool_async") as executable_tool,
+        ):
+            result = sync_core.run_sync(
+                self.reference,
+                self.subtitle,
+                tool="fftalign",
+                output=self.output,
+                config={"backup_subtitles_before_overwriting": False},
+                callbacks=callbacks,
+            )
+        module_tool.assert_not_called()
+        executable_tool.assert_not_called()
+
+        self.assertTrue(result.ok, result.message)
+        self.assertEqual(result.tool_used, "fftalign")
+        self.assertIn("offset seconds: -2.500", lines)
+        # The ASS subtitle is aligned natively, without an SRT conversion.
+        aligned = subtitle_ir.load_subtitle(self.output)
+        self.assertEqual(aligned.format, "ass")
+        np.testing.assert_array_equal(aligned.starts, self.expected_starts // 10 * 10)
+
+    def test_cancel_is_not_reported_as_error(self):
+        errors = []
+        callbacks = sync_core.SyncCallbacks(
+            on_error=errors.append, is_cancelled=lambda: True
+        )
+        rc = fft_align.sync(
+            self.reference, self.subtitle, self.output, config={}, callbacks=callbacks
+        )
+        self.assertEqual(rc, 1)
+        self.assertEqual(errors, [])
+        self.assertFalse(os.path.exists(self.output))
+
+    def test_video_reference_falls_back_to_default_tool(self):
+        video = os.path.join(self.temp_dir, "movie.mkv")
+        with open(video, "wb") as f:
+            f.write(b"\x00" * 16)
+        logs = []
+        callbacks = sync_core.SyncCallbacks(on_log=lambda msg, _: logs.append(msg))
+        tool, _, _ = sync_core.get_tool_with_fallback(
+            video, config={"sync_tool": "fftalign"}, callbacks=callbacks
+        )
+        self.assertEqual(tool, sync_core.DEFAULT_OPTIONS["sync_tool"])
+        self.assertEqual(len(logs), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+import os
+import sys
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main")))
+
+from PyQt6.QtWidgets import QApplication, QMessageBox, QWidget
+
+import texts
+import sync_core
+import sync_auto
+from gui_log_window import LogWindow
+
+
+class _FakeTree:
+    def __init__(self, pairs):
+        self._pairs = pairs
+
+    def get_all_valid_pairs(self):
+        return list(self._pairs)
+
+
+class _FakeApp(QWidget):
+    def __init__(self, pairs, concurrency):
+        super().__init__()
+        self.config = {
+            "sync_tool": "ffsubsync",
+            "batch_concurrency": concurrency,
+            "output_subtitle_encoding": "disabled",
+            "keep_log_records": False,
+        }
+        self.batch_mode_enabled = True
+        self.batch_tree_view = _FakeTree(pairs)
+        self.log_window = LogWindow(self)
+
+    def restore_auto_sync_tab(self):
+        pass
+
+
+class TestGuiConcurrentBatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._qapp = QApplication.instance() or QApplication(["-platform", "offscreen"])
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.pairs = []
+        for i in range(4):
+            ref = os.path.join(self.temp_dir, f"ref{i}.srt")
+            sub = os.path.join(self.temp_dir, f"episode{i}.srt")
+            for path in (ref, sub):
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write("1\n00:00:01,000 --> 00:00:02,000\nHi\n")
+            self.pairs.append((ref, sub))
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _fake_run_sync(self, reference, subtitle, *, tool, output, config, callbacks, **_):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            callbacks._progress(50.0)
+            time.sleep(0.2)
+            if os.path.basename(subtitle) == "episode1.srt":
+                return sync_core.SyncResult(False, None, tool, "boom", 1, 1)
+            shutil.copy(subtitle, output)
+            return sync_core.SyncResult(True, output, tool, "ok", 0, 1)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def _wait_until(self, app, predicate, timeout=15):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and not predicate():
+            self._qapp.processEvents()
+            time.sleep(0.01)
+        return predicate()
+
+    def test_concurrent_batch_runs_pairs_in_parallel_and_reports_summary(self):
+        app = _FakeApp(self.pairs, concurrency=2)
+        with patch.object(sync_core, "run_sync", side_effect=self._fake_run_sync):
+            sync_auto.start_sync_process(app)
+            done = self._wait_until(app, lambda: not hasattr(app, "_batch_state"))
+
+        self.assertTrue(done)
+        self.assertEqual(self.max_active, 2)
+        content = app.log_window.log_text.toPlainText()
+        self.assertIn(str(texts.BATCH_SYNC_SUCCESSFUL.format(count=3)), content)
+        self.assertIn(str(texts.BATCH_SYNC_FAILED.format(count=1)), content)
+        self.assertIn(str(texts.BATCH_SYNC_FAILED_PAIR.format(idx=2, total=4)), content)
+        for idx in range(1, 5):
+            self.assertIn(
+                str(texts.BATCH_SYNC_FINISHED_PAIR.format(idx=idx, total=4)), content
+            )
+        self.assertFalse(app.log_window.job_progress_label.isVisibleTo(app))
+
+    def test_jobs_never_share_an_output(self):
+        # One subtitle paired with two references
+        ref, sub = self.pairs[0]
+        app = _FakeApp([(ref, sub), (self.pairs[1][0], sub)], concurrency=2)
+        outputs = []
+
+        def fake(reference, subtitle, *, tool, output, config, callbacks, **_):
+            time.sleep(0.2)  # Both jobs are in flight before either writes
+            shutil.copy(subtitle, output)
+            outputs.append(output)
+            return sync_core.SyncResult(True, output, tool, "ok", 0, 1)
+
+        with patch.object(sync_core, "run_sync", side_effect=fake):
+            sync_auto.start_sync_process(app)
+            done = self._wait_until(app, lambda: not hasattr(app, "_batch_state"))
+
+        self.assertTrue(done)
+        self.assertEqual(
+            sorted(os.path.basename(output) for output in outputs),
+            ["episode0_2.srt", "episode0_3.srt"],
+        )
+
+    def test_cancel_stops_every_in_flight_job(self):
+        app = _FakeApp(self.pairs, concurrency=4)
+        cancelled = []
+
+        def fake(reference, subtitle, *, tool, output, config, callbacks, **_):
+            while not callbacks._cancelled():
+                time.sleep(0.01)
+            cancelled.append(subtitle)
+            return sync_core.SyncResult(False, None, tool, "cancelled", None, 0, True)
+
+        with patch.object(sync_core, "run_sync", side_effect=fake):
+            sync_auto.start_sync_process(app)
+            in_flight = lambda: len(app._batch_state["active_processes"]) == 4
+            self.assertTrue(self._wait_until(app, in_flight))
+            with patch.object(
+                QMessageBox, "question", return_value=QMessageBox.StandardButton.Yes
+            ):
+                app.log_window.cancel_clicked.emit()
+            done = self._wait_until(app, lambda: not hasattr(app, "_batch_state"))
+
+        self.assertTrue(done)
+        self.assertEqual(len(cancelled), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
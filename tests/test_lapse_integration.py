@@ -1,10 +1,12 @@
 import os
 import sys
+import asyncio
 import tempfile
 import unittest
 import shutil
 import platform
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main")))
 
@@ -14,6 +16,24 @@ from cli import TOOL_CHOICES
 import resources.lapse_download as lapse_download
 
 
+def _fake_process(chunks, returncode=0):
+    """A create_process_async stand-in whose tool prints chunks and exits."""
+
+    async def create(cmd):
+        stdout = asyncio.StreamReader()
+        for chunk in chunks:
+            stdout.feed_data(chunk)
+        stdout.feed_eof()
+        return SimpleNamespace(
+            stdout=stdout,
+            returncode=returncode,
+            wait=AsyncMock(return_value=returncode),
+            rusage=None,
+        )
+
+    return create
+
+
 class TestLapseIntegration(unittest.TestCase):
     def setUp(self):
         self.temp_dir = tempfile.mkdtemp()
@@ -148,14 +168,14 @@ class TestLapseIntegration(unittest.TestCase):
         with open(fake_downloaded_bin, "w") as f:
             f.write("#!/bin/sh\n")
 
-        def fake_run_executable(cmd, callbacks, *, sync_tool, process_holder=None):
+        def fake_run_executable(cmd, callbacks, *, sync_tool, process_holder=None, usage=None):
             with open(out_sub, "w", encoding="utf-8") as f:
                 f.write("1\n00:00:02,000 --> 00:00:04,000\nSynced text\n")
             return 0
 
         with patch("resources.lapse_download.DIST_BIN_PATH", os.path.join(self.temp_dir, "nonexistent")), \
              patch("resources.lapse_download.download", return_value=fake_downloaded_bin) as mock_dl, \
-             patch("sync_core.run_executable_tool", side_effect=fake_run_executable):
+             patch("sync_core.run_executable_tool_async", side_effect=fake_run_executable):
             with patch.dict(SYNC_TOOLS["lapse"]["executable"], {platform.system(): "/nonexistent/lapse"}):
                 result = sync_core.run_sync(
                     self.video_path,
@@ -171,12 +191,12 @@ class TestLapseIntegration(unittest.TestCase):
         config = dict(DEFAULT_OPTIONS)
         out_sub = os.path.join(self.temp_dir, "synced_lapse.srt")
 
-        def fake_run_executable(cmd, callbacks, *, sync_tool, process_holder=None):
+        def fake_run_executable(cmd, callbacks, *, sync_tool, process_holder=None, usage=None):
             with open(out_sub, "w", encoding="utf-8") as f:
                 f.write("1\n00:00:02,000 --> 00:00:04,000\nSynced text\n")
             return 0
 
-        with patch("sync_core.run_executable_tool", side_effect=fake_run_executable):
+        with patch("sync_core.run_executable_tool_async", side_effect=fake_run_executable):
             result = sync_core.run_sync(
                 self.video_path,
                 self.sub_path,
@@ -426,11 +446,7 @@ class TestLapseIntegration(unittest.TestCase):
             on_subprocess_line=lambda line, is_ow: received_lines.append((line, is_ow)),
         )
 
-        mock_proc = MagicMock()
-        mock_proc.stdout.read.side_effect = [crlf_output, b""]
-        mock_proc.wait.return_value = 0
-
-        with patch("sync_core.create_process", return_value=mock_proc):
+        with patch("utils.create_process_async", _fake_process([crlf_output])):
             rc = sync_core.run_executable_tool(["lapse.exe"], cb, sync_tool="lapse")
             self.assertEqual(rc, 0)
 
@@ -455,11 +471,7 @@ class TestLapseIntegration(unittest.TestCase):
             on_subprocess_line=lambda line, is_ow: received_lines.append((line, is_ow)),
         )
 
-        mock_proc = MagicMock()
-        mock_proc.stdout.read.side_effect = stream_data + [b""]
-        mock_proc.wait.return_value = 0
-
-        with patch("sync_core.create_process", return_value=mock_proc):
+        with patch("utils.create_process_async", _fake_process(stream_data)):
             rc = sync_core.run_executable_tool(["lapse.exe"], cb, sync_tool="lapse")
             self.assertEqual(rc, 0)
 
@@ -0,0 +1,107 @@
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main")))
+
+from PyQt6.QtWidgets import QApplication, QWidget
+
+import gui_log_window
+from gui_log_window import LogWindow
+
+
+class _FakeApp(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.config = {"keep_log_records": True}
+
+
+class TestLogWindow(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._qapp = QApplication.instance() or QApplication(["-platform", "offscreen"])
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_window = LogWindow()
+
+    def tearDown(self):
+        self.log_window.clear()
+        self.log_window.deleteLater()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_messages_are_rendered_in_batches(self):
+        with patch.object(
+            self.log_window,
+            "_render_messages",
+            wraps=self.log_window._render_messages,
+        ) as render:
+            for i in range(500):
+                self.log_window.append_message(f"line {i}")
+            self.assertEqual(self.log_window._log_text.toPlainText(), "")
+            content = self.log_window.log_text.toPlainText()
+        render.assert_called_once()
+        self.assertEqual(content.splitlines(), [f"line {i}" for i in range(500)])
+
+    def test_overwrite_lines_collapse_before_rendering(self):
+        log = self.log_window
+        log.append_message("start")
+        for percent in range(101):
+            log.append_message(f"progress {percent}%", overwrite=True)
+        log.flush()
+        self.assertEqual(log._log_text.toPlainText(), "start\nprogress 100%")
+        # An overwrite line from the previous batch is still replaced
+        log.append_message("progress done", overwrite=True)
+        log.append_message("finished", bold=True)
+        self.assertEqual(log.log_text.toPlainText(), "start\nprogress done\nfinished\n")
+
+    def test_messages_from_worker_threads(self):
+        def worker(n):
+            for i in range(200):
+                self.log_window.append_message(f"worker {n} line {i}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        lines = self.log_window.log_text.toPlainText().splitlines()
+        self.assertEqual(len(lines), 800)
+        for n in range(4):
+            mine = [line for line in lines if line.startswith(f"worker {n} ")]
+            self.assertEqual(mine, [f"worker {n} line {i}" for i in range(200)])
+
+    def test_view_is_capped_and_saved_log_is_complete(self):
+        with patch.object(gui_log_window, "LOG_MAX_BLOCKS", 100):
+            log = LogWindow()
+        for i in range(1000):
+            log.append_message(f"line {i}")
+            if i % 100 == 0:
+                log.append_message("working", overwrite=True)
+                log.append_message("working...", overwrite=True)
+        self.assertLessEqual(log.log_text.document().blockCount(), 100)
+
+        with patch.object(
+            gui_log_window, "get_logs_directory", return_value=self.temp_dir
+        ):
+            log._save_log_output_to_file(_FakeApp(), success=True, mode="batch")
+        (name,) = os.listdir(self.temp_dir)
+        with open(os.path.join(self.temp_dir, name), encoding="utf-8") as f:
+            saved = f.read().split("=" * 50 + "\n\n", 1)[1]
+        expected = []
+        for i in range(1000):
+            expected.append(f"line {i}")
+            if i % 100 == 0:
+                expected.append("working...")
+        self.assertEqual(saved.splitlines(), expected)
+        log.clear()
+        log.deleteLater()
+
+
+if __name__ == "__main__":
+    unittest.main()
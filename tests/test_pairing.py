@@ -0,0 +1,124 @@
+import os
+import sys
+import time
+import random
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main")))
+
+from pairing import (
+    calculate_file_similarity,
+    normalized_basename,
+    pair_exact,
+    pair_paths,
+)
+
+
+def brute_force_pair_paths(references, subs):
+    """The original all-pairs matcher, kept as the reference behaviour."""
+    paired_references, paired_subs, pairs = set(), set(), []
+    for reference in references:
+        for sub in subs:
+            if sub in paired_subs:
+                continue
+            if normalized_basename(reference) == normalized_basename(sub):
+                pairs.append((reference, sub))
+                paired_references.add(reference)
+                paired_subs.add(sub)
+                break
+    for reference in references:
+        if reference in paired_references:
+            continue
+        best_match, best_score = None, 0
+        for sub in subs:
+            if sub in paired_subs:
+                continue
+            similarity = calculate_file_similarity(reference, sub)
+            if similarity > best_score:
+                best_score, best_match = similarity, sub
+        if best_match and best_score >= 30:
+            pairs.append((reference, best_match))
+            paired_references.add(reference)
+            paired_subs.add(best_match)
+    return pairs, paired_references, paired_subs
+
+
+def library(count, rng):
+    """count episodes with subtitles named in a few common styles, shuffled."""
+    videos, subs = [], []
+    for i in range(count):
+        name = f"/lib/Show {i // 1000:03d}/Show.S{i // 100:03d}E{i % 100:02d}"
+        videos.append(f"{name}.1080p.WEB.mkv")
+        subs.append(name + rng.choice([".1080p.WEB.en.srt", ".en.srt", ".srt"]))
+    rng.shuffle(subs)
+    return videos, subs
+
+
+class TestPairPaths(unittest.TestCase):
+    def test_exact_and_similar_matches(self):
+        videos = ["/v/Movie.2020.mkv", "/v/Show.S01E01.720p.mkv", "/v/Other.mkv"]
+        subs = ["/s/Show.S01E01.srt", "/s/movie.2020.en.srt", "/s/unrelated.srt"]
+        pairs, paired_refs, paired_subs = pair_paths(videos, subs)
+        self.assertEqual(
+            pairs,
+            [
+                # "Movie.2020" loses ".2020" as if it were a language tag, so
+                # it only pairs in the similarity pass.
+                ("/v/Show.S01E01.720p.mkv", "/s/Show.S01E01.srt"),
+                ("/v/Movie.2020.mkv", "/s/movie.2020.en.srt"),
+            ],
+        )
+        self.assertEqual(paired_refs, {"/v/Movie.2020.mkv", "/v/Show.S01E01.720p.mkv"})
+        self.assertNotIn("/s/unrelated.srt", paired_subs)
+
+    def test_pair_exact_takes_first_unpaired_subtitle(self):
+        subs = ["/a/ep1.en.srt", "/b/ep1.srt", "/c/ep2.srt"]
+        pairs, _, paired_subs = pair_exact(["/v/ep1.mkv", "/w/ep1.mp4"], subs)
+        self.assertEqual(
+            pairs, [("/v/ep1.mkv", "/a/ep1.en.srt"), ("/w/ep1.mp4", "/b/ep1.srt")]
+        )
+        self.assertEqual(paired_subs, {"/a/ep1.en.srt", "/b/ep1.srt"})
+
+    def test_matches_brute_force_on_random_names(self):
+        rng = random.Random(7)
+
+        def name():
+            return "".join(rng.choice("ab.-_ [e1") for _ in range(rng.randint(0, 9)))
+
+        for _ in range(2000):
+            videos = [f"/v/{name()}.mkv" for _ in range(rng.randint(0, 10))]
+            subs = [
+                f"/s/{name()}{rng.choice(['', '.en', '_eng', '-es-ES'])}.srt"
+                for _ in range(rng.randint(0, 10))
+            ]
+            if subs and rng.random() < 0.2:
+                subs.append(rng.choice(subs))
+            self.assertEqual(
+                pair_paths(videos, subs), brute_force_pair_paths(videos, subs)
+            )
+
+    def test_matches_brute_force_on_library_names(self):
+        rng = random.Random(3)
+        videos, subs = library(300, rng)
+        # Drop some subtitles and rename others so the similarity pass runs.
+        subs = [s.replace("E1", "E-1") for s in subs[:250]]
+        self.assertEqual(pair_paths(videos, subs), brute_force_pair_paths(videos, subs))
+
+
+class TestPairingScale(unittest.TestCase):
+    def test_benchmark_scales_to_100k_files(self):
+        rng = random.Random(1)
+        timings = {}
+        for count in (10_000, 100_000):
+            videos, subs = library(count, rng)
+            start = time.perf_counter()
+            pairs, _, _ = pair_paths(videos, subs)
+            timings[count] = time.perf_counter() - start
+            self.assertEqual(len(pairs), count)
+        # Ten times the files must not cost anywhere near 100 times the time.
+        self.assertLess(timings[100_000], max(timings[10_000], 0.05) * 30)
+        self.assertLess(timings[100_000], 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
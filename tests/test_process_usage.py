@@ -0,0 +1,75 @@
+import os
+import sys
+import time
+import asyncio
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main")))
+
+import process_usage
+from process_usage import AsyncProcess, ProcessUsage, snapshot, usage_since
+from utils import create_process
+
+# Touches 64 MiB, burns some CPU, prints and exits with 3
+CHILD = (
+    "import sys; b = bytearray(64 << 20); b[::4096] = b'x' * (len(b) // 4096); "
+    "sum(range(2_000_000)); print('done'); sys.exit(3)"
+)
+
+
+@unittest.skipUnless(hasattr(os, "wait4"), "needs os.wait4")
+class TestProcessUsage(unittest.TestCase):
+    def _check(self, usage, name):
+        self.assertEqual((usage.name, usage.returncode), (name, 3))
+        self.assertGreater(usage.wall_ms, 0)
+        self.assertGreater(usage.user_ms, 0)
+        self.assertGreaterEqual(usage.sys_ms, 0)
+        self.assertGreater(usage.max_rss_bytes, 64 << 20)
+        self.assertGreaterEqual(usage.block_in, 0)
+
+    def test_communicate_reaps_with_usage(self):
+        started = time.monotonic()
+        process = create_process([sys.executable, "-c", CHILD])
+        output, usage = process_usage.communicate(process, "child", started)
+        self.assertEqual(output.strip(), b"done")
+        self.assertEqual(process.returncode, 3)
+        self._check(usage, "child")
+        self.assertEqual(set(usage.as_dict()), set(ProcessUsage.__dataclass_fields__))
+
+    def test_already_reaped_child_has_wall_time_only(self):
+        started = time.monotonic()
+        process = create_process([sys.executable, "-c", "pass"])
+        process.wait()
+        rc, usage = process_usage.wait_process(process, "child", started)
+        self.assertEqual(rc, 0)
+        self.assertIsNone(usage.user_ms)
+        self.assertGreater(usage.wall_ms, 0)
+
+    def test_async_process_collects_rusage(self):
+        async def main():
+            started = time.monotonic()
+            process = await AsyncProcess.start(
+                create_process([sys.executable, "-c", CHILD])
+            )
+            output = await process.stdout.read()
+            rc = await process.wait()
+            return output, ProcessUsage.from_rusage(
+                "child", started, rc, process.rusage
+            )
+
+        output, usage = asyncio.run(main())
+        self.assertEqual(output.strip(), b"done")
+        self._check(usage, "child")
+
+    def test_usage_since_covers_reaped_children(self):
+        before = snapshot()
+        process = create_process([sys.executable, "-c", CHILD])
+        process.communicate()
+        usage = ProcessUsage.from_report(
+            "job", time.monotonic(), 3, usage_since(before)
+        )
+        self._check(usage, "job")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main")))
+
+import processed_items_manager
+from processed_items_manager import ProcessedItemsManager, calculate_partial_hashes
+
+
+class ManagerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        db_path = os.path.join(self.temp_dir, "processed_items.db")
+        patcher = mock.patch.object(
+            ProcessedItemsManager, "_get_db_path", return_value=db_path
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        ProcessedItemsManager._instance = None
+        self.manager = ProcessedItemsManager()
+        self.videos = []
+        for i in range(12):
+            path = os.path.join(self.temp_dir, f"episode{i:02d}.mkv")
+            with open(path, "wb") as f:
+                f.write(os.urandom(1000 + i))
+            self.videos.append(path)
+
+    def tearDown(self):
+        self.manager.close()
+        ProcessedItemsManager._instance = None
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+
+class TestBulkProcessedItems(ManagerTestCase):
+    def test_parallel_hashes_match_sequential(self):
+        hashes = calculate_partial_hashes(self.videos, max_workers=4)
+        self.assertEqual(list(hashes), self.videos)
+        for path in self.videos:
+            self.assertEqual(
+                hashes[path], processed_items_manager.calculate_partial_hash(path)
+            )
+
+    def test_mark_many_and_is_processed_many(self):
+        missing = os.path.join(self.temp_dir, "missing.mkv")
+        marked = self.manager.mark_many(self.videos[:5] + [missing])
+        self.assertTrue(all(marked[path] for path in self.videos[:5]))
+        self.assertFalse(marked[missing])
+        self.assertEqual(self.manager.get_processed_count(), 5)
+
+        # Small batches force several IN (...) queries.
+        with mock.patch.object(processed_items_manager, "SQL_BATCH_SIZE", 3):
+            status = self.manager.is_processed_many(self.videos + [missing])
+        expected = {path: i < 5 for i, path in enumerate(self.videos)}
+        expected[missing] = False
+        self.assertEqual(status, expected)
+        for path in self.videos:
+            self.assertEqual(self.manager.is_processed(path), expected[path])
+
+    def test_remove_many(self):
+        self.manager.mark_many(self.videos[:4])
+        removed = self.manager.remove_many(self.videos[2:6])
+        self.assertEqual(
+            [removed[path] for path in self.videos[2:6]], [True, True, False, False]
+        )
+        self.assertEqual(self.manager.get_processed_count(), 2)
+
+
+class TestFingerprintCache(ManagerTestCase):
+    def test_unchanged_files_are_not_read_again(self):
+        self.manager.mark_many(self.videos)
+        self.assertEqual(self.manager.get_fingerprint_count(), len(self.videos))
+        with mock.patch.object(
+            processed_items_manager, "calculate_partial_hash"
+        ) as hash_file:
+            status = self.manager.is_processed_many(self.videos)
+            self.assertTrue(self.manager.is_processed(self.videos[0]))
+        hash_file.assert_not_called()
+        self.assertTrue(all(status.values()))
+
+    def test_changed_file_is_hashed_again(self):
+        path = self.videos[0]
+        self.manager.mark_as_processed(path)
+        with open(path, "ab") as f:
+            f.write(b"more")
+        with mock.patch.object(
+            processed_items_manager,
+            "calculate_partial_hash",
+            wraps=processed_items_manager.calculate_partial_hash,
+        ) as hash_file:
+            self.assertFalse(self.manager.is_processed(path))
+            self.assertFalse(self.manager.is_processed(path))
+        hash_file.assert_called_once_with(path)
+
+    def test_prune_drops_vanished_and_changed_paths(self):
+        self.manager.mark_many(self.videos[:3])
+        os.remove(self.videos[0])
+        os.utime(self.videos[1], ns=(0, 10**9))
+        self.assertEqual(self.manager.prune_fingerprints(), 2)
+        self.assertEqual(self.manager.get_fingerprint_count(), 1)
+        # The processed items themselves are kept.
+        self.assertEqual(self.manager.get_processed_count(), 3)
+
+
+class TestDatabaseMaintenance(ManagerTestCase):
+    def _make_import_db(self, rows):
+        path = os.path.join(self.temp_dir, "import.db")
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE processed_items (id INTEGER PRIMARY KEY, file_hash TEXT "
+            "UNIQUE, file_size INTEGER, original_filename TEXT, processed_at TIMESTAMP)"
+        )
+        conn.executemany(
+            "INSERT INTO processed_items (file_hash, file_size, original_filename) "
+            "VALUES (?, ?, ?)",
+            rows,
+        )
+        conn.commit()
+        conn.close()
+        return path
+
+    def test_uses_write_ahead_log(self):
+        mode = self.manager._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_import_merges_with_attach(self):
+        self.manager.mark_many(self.videos[:2])
+        known = processed_items_manager.calculate_partial_hash(self.videos[0])
+        rows = [(f"{i:064x}", i, f"ep{i}.mkv") for i in range(20000)]
+        rows += [(known[0], known[1], "known.mkv"), ("bad", None, "no_size.mkv")]
+        path = self._make_import_db(rows)
+        self.assertEqual(self.manager.import_from_database(path), (20000, 2))
+        self.assertEqual(self.manager.get_processed_count(), 20002)
+        # The import database is detached afterwards.
+        databases = self.manager._conn.execute("PRAGMA database_list").fetchall()
+        self.assertEqual([db[1] for db in databases], ["main"])
+
+    def test_import_rejects_foreign_databases(self):
+        path = os.path.join(self.temp_dir, "other.db")
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE something (x)")
+        conn.close()
+        self.assertEqual(self.manager.import_from_database(path), (-1, -1))
+        missing = os.path.join(self.temp_dir, "missing.db")
+        self.assertEqual(self.manager.import_from_database(missing), (-1, -1))
+        self.assertFalse(os.path.exists(missing))
+
+    def test_backup_includes_uncheckpointed_writes(self):
+        self.manager.mark_many(self.videos)
+        backup = os.path.join(self.temp_dir, "backup.db")
+        self.assertTrue(self.manager.backup_to(backup))
+        conn = sqlite3.connect(backup)
+        count = conn.execute("SELECT COUNT(*) FROM processed_items").fetchone()[0]
+        conn.close()
+        self.assertEqual(count, len(self.videos))
+
+
+if __name__ == "__main__":
+    unittest.main()
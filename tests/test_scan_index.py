@@ -0,0 +1,96 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main")))
+
+import scan_index
+from scan_index import ScanIndex
+from pairing import pair_folder
+
+OLD_NS = 1_600_000_000 * 10**9
+
+
+class TestScanIndex(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.library = os.path.join(self.temp_dir, "library")
+        self.index_path = os.path.join(self.temp_dir, "scan_index.json")
+        for season in ("Season 1", "Season 2"):
+            os.makedirs(os.path.join(self.library, "Show", season))
+            for ep in range(1, 4):
+                for ext in (".mkv", ".en.srt"):
+                    self._touch("Show", season, f"Show.S{season[-1]}E{ep}{ext}")
+        self._age_dirs()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _touch(self, *parts):
+        with open(os.path.join(self.library, *parts), "w") as f:
+            f.write("x")
+
+    def _age_dirs(self):
+        # Directory mtimes outside the racy window, as on a settled library.
+        for root, _, _ in os.walk(self.library):
+            os.utime(root, ns=(OLD_NS, OLD_NS))
+
+    def _walk(self):
+        return sorted(
+            os.path.join(root, name)
+            for root, _, names in os.walk(self.library)
+            for name in names
+        )
+
+    def test_matches_os_walk(self):
+        index = ScanIndex()
+        self.assertEqual(sorted(index.files(self.library)), self._walk())
+        self.assertEqual(index.files(self.library, recursive=False), [])
+
+    def test_unchanged_directories_are_not_listed_again(self):
+        index = ScanIndex(self.index_path)
+        first = index.files(self.library)
+        self.assertTrue(index.save())
+        reloaded = ScanIndex(self.index_path)
+        with mock.patch.object(scan_index.os, "scandir") as scandir:
+            self.assertEqual(reloaded.files(self.library), first)
+        scandir.assert_not_called()
+        self.assertEqual(reloaded.hits, 4)
+
+    def test_only_changed_directories_are_rescanned(self):
+        index = ScanIndex(self.index_path)
+        index.files(self.library)
+        self._touch("Show", "Season 2", "Show.S2E4.mkv")
+        shutil.rmtree(os.path.join(self.library, "Show", "Season 1"))
+        self._age_dirs()
+        os.utime(os.path.join(self.library, "Show"), ns=(OLD_NS, OLD_NS + 1))
+        os.utime(
+            os.path.join(self.library, "Show", "Season 2"), ns=(OLD_NS, OLD_NS + 1)
+        )
+
+        index.misses = 0
+        self.assertEqual(sorted(index.files(self.library)), self._walk())
+        self.assertEqual(index.misses, 2)
+        # The removed season's snapshot is pruned.
+        self.assertNotIn(os.path.join(self.library, "Show", "Season 1"), index._dirs)
+
+    def test_recent_directories_are_not_trusted(self):
+        index = ScanIndex()
+        self._touch("Show", "Season 1", "new.srt")  # mtime is now
+        index.files(self.library)
+        index.misses = 0
+        index.files(self.library)
+        self.assertEqual(index.misses, 1)
+
+    def test_pair_folder_lists_folder_once(self):
+        with mock.patch.object(scan_index.os, "scandir", wraps=os.scandir) as scandir:
+            pairs = pair_folder(self.library, recursive=True)
+        self.assertEqual(len(pairs), 6)
+        self.assertEqual(scandir.call_count, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
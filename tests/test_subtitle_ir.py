@@ -0,0 +1,135 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main")))
+
+import subtitle_ir
+from sync_manual import shift_subtitle
+from subtitle_extractor import parse_timestamps
+
+SAMPLES = {
+    "srt": (
+        "1\r\n00:00:01,000 --> 00:00:02,500\r\nHello\r\nworld\r\n\r\n"
+        "2\r\n00:00:03,000 --> 00:00:04,000\r\n<i>Two</i>\r\n"
+    ),
+    "vtt": (
+        "WEBVTT\n\n00:01.000 --> 00:02.500 align:start\n<v Bob>Hello</v>\nworld\n\n"
+        "00:00:03.000 --> 00:00:04.000\n<i>Two</i>\n"
+    ),
+    "sbv": "0:00:01.000,0:00:02.500\nHello\nworld\n\n0:00:03.000,0:00:04.000\n<i>Two</i>\n",
+    "sub": "{1}{1}24\n{24}{60}Hello|world\n{72}{96}<i>Two</i>\n",
+    "ass": (
+        "[Script Info]\nScriptType: v4.00+\n\n[Events]\n"
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+        "Dialogue: 0,0:00:01.00,0:00:02.50,Main,,0,0,0,,Hello\\Nworld\n"
+        "Comment: 0,0:00:02.00,0:00:03.00,Main,,0,0,0,,note\n"
+        "Dialogue: 0,0:00:03.00,0:00:04.00,Sign,,0,0,0,,{i}Two{/i}\n"
+    ),
+    "stl": "$FontName = Arial\n00:00:01:00 , 00:00:02:15 , Hello | world\n00:00:03:00 , 00:00:04:00 , <i>Two</i>\n",
+    "smi": (
+        "<SAMI><BODY>\n<SYNC Start=1000><P Class=ENCC>Hello<br>world\n"
+        "<SYNC Start=2500><P Class=ENCC>&nbsp;\n<SYNC Start=3000><P Class=ENCC><i>Two</i>\n"
+        "<SYNC Start=4000><P Class=ENCC>&nbsp;\n</BODY></SAMI>\n"
+    ),
+    "ttml": (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<tt xmlns="http://www.w3.org/ns/ttml" '
+        'xmlns:ttp="http://www.w3.org/ns/ttml#parameter" ttp:tickRate="10000000">'
+        '<body><div>\n<p begin="00:00:01.000" end="00:00:02.500">Hello<br/>world</p>\n'
+        '<p begin="30000000t" end="40000000t"><span style="italic">Two</span></p>\n'
+        "</div></body></tt>\n"
+    ),
+}
+
+
+class TestSubtitleIR(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, name, content):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        return path
+
+    def test_every_format_parses_to_the_same_cues(self):
+        for fmt, source in SAMPLES.items():
+            with self.subTest(fmt=fmt):
+                doc = subtitle_ir.parse_subtitle(source, fmt)
+                self.assertEqual(doc.starts.tolist(), [1000, 3000])
+                self.assertEqual(doc.ends[0], 2500)
+                self.assertEqual(doc.texts(), ["Hello\nworld", "<i>Two</i>"])
+                self.assertEqual(doc.offsets[-1], len(doc.text))
+
+    def test_styles_and_untimed_marks(self):
+        doc = subtitle_ir.parse_subtitle(SAMPLES["ass"], "ass")
+        self.assertEqual([doc.style(i) for i in range(len(doc))], ["Main", "Sign"])
+        self.assertEqual(doc.marks.tolist(), [2000, 3000])
+        smi = subtitle_ir.parse_subtitle(SAMPLES["smi"], "smi")
+        self.assertEqual(smi.ends.tolist(), [2500, 4000])
+        self.assertEqual(smi.styles, ["ENCC"])
+
+    def test_in_place_shift_only_touches_timestamps(self):
+        for fmt, source in SAMPLES.items():
+            with self.subTest(fmt=fmt):
+                doc = subtitle_ir.parse_subtitle(source, fmt)
+                shifted = subtitle_ir.dumps(doc.shifted(1500))
+                again = subtitle_ir.parse_subtitle(shifted, fmt)
+                np.testing.assert_array_equal(again.starts, doc.starts + 1500)
+                np.testing.assert_array_equal(again.marks, doc.marks + 1500)
+                self.assertEqual(again.texts(), doc.texts())
+                # Everything outside the timestamps is unchanged.
+                strip = lambda text: "".join(c for c in text if not c.isdigit())
+                self.assertEqual(strip(shifted), strip(source))
+
+    def test_canonical_writers_round_trip(self):
+        doc = subtitle_ir.parse_subtitle(SAMPLES["srt"], "srt")
+        for fmt in ("srt", "vtt", "sbv", "sub", "ass", "ssa", "stl", "smi", "ttml"):
+            with self.subTest(fmt=fmt):
+                back = subtitle_ir.parse_subtitle(subtitle_ir.dumps(doc, fmt), fmt)
+                self.assertLessEqual(np.abs(back.starts - doc.starts).max(), 40)
+                self.assertEqual(back.texts()[0], "Hello\nworld")
+
+    def test_shift_subtitle_keeps_ass_header_and_line_endings(self):
+        source = SAMPLES["ass"].replace("\n", "\r\n")
+        path = self._write("movie.ass", source)
+        output, ok, _ = shift_subtitle(path, -1500)
+        self.assertTrue(ok)
+        with open(output, "r", encoding="utf-8", newline="") as f:
+            result = f.read()
+        self.assertTrue(result.startswith("[Script Info]\r\nScriptType: v4.00+\r\n"))
+        self.assertIn(
+            "Dialogue: 0,0:00:00.00,0:00:01.00,Main,,0,0,0,,Hello\\Nworld\r\n", result
+        )
+        self.assertIn("Comment: 0,0:00:00.50,0:00:01.50,Main", result)
+
+    def test_microdvd_shift_moves_frames(self):
+        path = self._write("movie.sub", "{25}{62}Hello|there\n{250}{300}Two\n")
+        output, ok, _ = shift_subtitle(path, 1500)
+        self.assertTrue(ok)
+        with open(output, "r", encoding="utf-8") as f:
+            # 1500 ms is 36 frames at the default 23.976 fps
+            self.assertEqual(f.read(), "{61}{98}Hello|there\n{286}{336}Two\n")
+        path = self._write("early.sub", "{25}{62}Hello|there\n")
+        output, ok, _ = shift_subtitle(path, -1200)
+        self.assertTrue(ok)
+        with open(output, "r", encoding="utf-8") as f:
+            self.assertEqual(f.read(), "{0}{33}Hello|there\n")
+
+    def test_parse_timestamps_uses_ir_for_all_formats(self):
+        for fmt in ("srt", "ass", "smi"):
+            path = self._write(f"movie.{fmt}", SAMPLES[fmt])
+            self.assertEqual(parse_timestamps(path), [1.0, 3.0])
+        self.assertEqual(parse_timestamps(self._write("movie.idx", "")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import io
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main")))
+
+import cli
+import subtitle_ir
+from subtitle_transform import (
+    AffineTransform,
+    framerate,
+    offset,
+    parse_time,
+    piecewise,
+)
+
+ASS = (
+    "[Script Info]\nScriptType: v4.00+\n\n[Events]\n"
+    "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+    "Dialogue: 0,0:00:10.00,0:00:12.00,Default,,0,0,0,,{\\k20}ka{\\k30}ra\n"
+    "Dialogue: 0,0:40:00.00,0:40:02.00,Default,,0,0,0,,Bye\n"
+)
+
+
+class TestTransforms(unittest.TestCase):
+    def test_offset_is_exact_and_clamped(self):
+        times = np.array([0, 1000, 3_600_000], dtype=np.int64)
+        np.testing.assert_array_equal(offset(-500)(times), [0, 500, 3_599_500])
+
+    def test_framerate_conversion(self):
+        transform = framerate(23.976, 25)
+        self.assertAlmostEqual(transform.scale, 23.976 / 25)
+        self.assertEqual(transform(np.array([2_500_000]))[0], round(2_500_000 * 23.976 / 25))
+        self.assertEqual(AffineTransform(2.0, 100)(np.array([1000]))[0], 2100)
+
+    def test_piecewise_interpolates_between_anchors(self):
+        transform = piecewise([(600_000, 603_000), (0, 0)])
+        result = transform(np.array([0, 300_000, 600_000, 900_000]))
+        # Linear in between, and the last anchor's offset after it.
+        np.testing.assert_array_equal(result, [0, 301_500, 603_000, 903_000])
+        np.testing.assert_array_equal(piecewise([(0, 2000)])(np.array([5])), [2005])
+        with self.assertRaises(ValueError):
+            piecewise([(0, 1), (0, 2)])
+
+    def test_parse_time(self):
+        self.assertEqual(parse_time("-1500"), -1500)
+        self.assertEqual(parse_time("01:02:03,004"), 3_723_004)
+        self.assertEqual(parse_time("02:03.5"), 123_500)
+        with self.assertRaises(ValueError):
+            parse_time("soon")
+
+
+class TestCliShiftTransforms(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.subtitle = os.path.join(self.temp_dir, "karaoke.ass")
+        with open(self.subtitle, "w", encoding="utf-8") as f:
+            f.write(ASS)
+        self.output = os.path.join(self.temp_dir, "out.ass")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _shift(self, *extra):
+        argv = ["-q", "shift", self.subtitle, *extra, "-o", self.output, "--json"]
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            rc = cli.main(argv)
+        return rc, buf.getvalue()
+
+    def test_fps_conversion_keeps_ass_markup(self):
+        rc, out = self._shift("200", "--fps", "23.976:25")
+        self.assertEqual(rc, cli.EXIT_OK)
+        self.assertEqual(json.loads(out)["transform"], "x0.95904 +200ms")
+        doc = subtitle_ir.load_subtitle(self.output)
+        expected = np.rint(np.array([10_000, 2_400_000]) * 23.976 / 25) + 200
+        np.testing.assert_array_equal(doc.starts, expected // 10 * 10)
+        with open(self.output, encoding="utf-8") as f:
+            self.assertIn("{\\k20}ka{\\k30}ra", f.read())
+
+    def test_anchors(self):
+        rc, _ = self._shift("--anchor", "0=0", "--anchor", "00:40:00,000=00:40:03,000")
+        self.assertEqual(rc, cli.EXIT_OK)
+        doc = subtitle_ir.load_subtitle(self.output)
+        self.assertEqual(doc.starts.tolist(), [10_010, 2_403_000])
+
+    def test_anchor_with_offset_is_rejected(self):
+        rc, _ = self._shift("500", "--anchor", "0=0")
+        self.assertEqual(rc, cli.EXIT_USAGE)
+        self.assertFalse(os.path.exists(self.output))
+
+
+if __name__ == "__main__":
+    unittest.main()
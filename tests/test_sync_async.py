@@ -0,0 +1,160 @@
+import os
+import sys
+import time
+import shutil
+import asyncio
+import platform
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main")))
+
+import sync_core
+from constants import SYNC_TOOLS
+from sync_core import SyncCallbacks, run_sync, run_sync_async
+
+# Stands in for alass: prints progress, waits, then copies the subtitle
+FAKE_TOOL = """#!{python}
+import shutil, sys, time
+reference, subtitle, output = sys.argv[1:4]
+print("Progress 50%", flush=True)
+time.sleep({delay})
+shutil.copy(subtitle, output)
+print("Done", flush=True)
+"""
+SRT = "1\n00:00:01,000 --> 00:00:02,000\nHello\n"
+
+
+@unittest.skipIf(os.name == "nt", "the fake tool is a POSIX script")
+class TestRunSyncAsync(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.reference = self._write("reference.srt", SRT)
+        self.config = {"backup_subtitles_before_overwriting": False}
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, name, content):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def _use_fake_tool(self, delay):
+        exe = self._write("alass", FAKE_TOOL.format(python=sys.executable, delay=delay))
+        os.chmod(exe, 0o755)
+        patcher = patch.dict(
+            SYNC_TOOLS["alass"]["executable"], {platform.system(): exe}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _sync(self, idx, **kwargs):
+        subtitle = self._write(f"subtitle{idx}.srt", SRT)
+        output = os.path.join(self.temp_dir, f"output{idx}.srt")
+        return run_sync_async(
+            self.reference,
+            subtitle,
+            tool="alass",
+            output=output,
+            config=self.config,
+            **kwargs,
+        )
+
+    def test_many_syncs_run_concurrently_on_one_loop(self):
+        self._use_fake_tool(delay=0.5)
+
+        async def main():
+            return await asyncio.gather(*(self._sync(i) for i in range(20)))
+
+        start = time.monotonic()
+        results = asyncio.run(main())
+        self.assertTrue(all(r.ok for r in results), [r.message for r in results])
+        # One after the other, this would take 10 s
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertTrue(all(os.path.exists(r.output_path) for r in results))
+
+    def test_timeout_stops_the_tool(self):
+        self._use_fake_tool(delay=60)
+        holder = {}
+
+        async def main():
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(self._sync(0, process_holder=holder), 0.5)
+            return holder["process"].returncode
+
+        start = time.monotonic()
+        self.assertIsNotNone(asyncio.run(main()))
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, "output0.srt")))
+
+    def test_async_callbacks_are_awaited(self):
+        self._use_fake_tool(delay=0)
+        lines = []
+        cancel = asyncio.Event()
+
+        async def on_subprocess_line(line, is_overwrite):
+            await asyncio.sleep(0)
+            lines.append(line)
+
+        async def is_cancelled():
+            return cancel.is_set()
+
+        async def main():
+            callbacks = SyncCallbacks(
+                on_subprocess_line=on_subprocess_line, is_cancelled=is_cancelled
+            )
+            done = await self._sync(0, callbacks=callbacks)
+            cancel.set()
+            cancelled = await self._sync(1, callbacks=callbacks)
+            return done, cancelled
+
+        done, cancelled = asyncio.run(main())
+        self.assertTrue(done.ok, done.message)
+        self.assertEqual(lines, ["Progress 50%", "Done"])
+        self.assertTrue(cancelled.cancelled)
+
+    def test_timings_cover_each_stage(self):
+        self._use_fake_tool(delay=0.3)
+        result = asyncio.run(self._sync(0))
+        self.assertTrue(result.ok, result.message)
+        self.assertEqual(
+            list(result.timings),
+            ["validation", "conversion", "output", "tool_setup", "tool", "postprocess"],
+        )
+        self.assertGreaterEqual(result.timings["tool"], 300)
+        self.assertLessEqual(sum(result.timings.values()), result.elapsed_ms + 2)
+
+    def test_tool_process_usage_is_recorded(self):
+        self._use_fake_tool(delay=0.2)
+        result = asyncio.run(self._sync(0))
+        self.assertTrue(result.ok, result.message)
+        (usage,) = result.processes
+        self.assertEqual((usage.name, usage.returncode), ("alass", 0))
+        self.assertGreaterEqual(usage.wall_ms, 200)
+        self.assertGreater(usage.user_ms + usage.sys_ms, 0)
+        self.assertGreater(usage.max_rss_bytes, 0)
+
+    def test_run_sync_wraps_the_async_sync(self):
+        self._use_fake_tool(delay=0)
+        subtitle = self._write("subtitle.srt", SRT)
+        output = os.path.join(self.temp_dir, "output.srt")
+        with patch.object(
+            sync_core, "run_sync_async", wraps=sync_core.run_sync_async
+        ) as wrapped:
+            result = run_sync(
+                self.reference,
+                subtitle,
+                tool="alass",
+                output=output,
+                config=self.config,
+            )
+        wrapped.assert_called_once()
+        self.assertTrue(result.ok, result.message)
+        self.assertEqual(result.output_path, output)
+
+
+if __name__ == "__main__":
+    unittest.main()
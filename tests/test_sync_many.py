@@ -0,0 +1,163 @@
+import io
+import os
+import sys
+import json
+import time
+import logging
+import shutil
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main")))
+
+import cli
+import sync_core
+import worker_pool
+
+
+def _write_srt(path, offset=0.0):
+    def ts(seconds):
+        ms = int(round(seconds * 1000))
+        return f"{ms // 3600000:02}:{ms // 60000 % 60:02}:{ms // 1000 % 60:02},{ms % 1000:03}"
+
+    with open(path, "w", encoding="utf-8") as f:
+        for n, start in enumerate(range(2, 40, 4), 1):
+            f.write(f"{n}\n{ts(start + offset)} --> {ts(start + 2 + offset)}\nLine {n}\n\n")
+
+
+def _write_speech_wav(path, sample_rate=16000, seconds=42):
+    import wave
+    import numpy as np
+
+    t = np.arange(seconds * sample_rate) / sample_rate
+    gate = ((t - 2) % 4 < 2) & (t >= 2) & (t < 40)
+    samples = (gate * 8000 * np.sin(2 * np.pi * 300 * t)).astype(np.int16)
+    with wave.open(path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(samples.tobytes())
+
+
+class TestRunSyncMany(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.video = os.path.join(self.temp_dir, "movie.mkv")
+        with open(self.video, "wb") as f:
+            f.write(b"\x00" * 16)
+        self.subtitles = []
+        for lang in ("en", "fr", "de", "es"):
+            path = os.path.join(self.temp_dir, f"movie.{lang}.srt")
+            _write_srt(path)
+            self.subtitles.append(path)
+        self.events = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _fake_run_sync(self, reference, subtitle, *, tool, output, config, callbacks, **_):
+        with self.lock:
+            self.events.append(("sync", subtitle))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(0.1)
+            shutil.copy(subtitle, output)
+            return sync_core.SyncResult(True, output, tool, "ok", 0, 100)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def test_reference_is_primed_once_and_subtitles_run_in_parallel(self):
+        config = {
+            "sync_tool": "ffsubsync",
+            "automatic_save_location": "save_next_to_video_with_same_filename",
+        }
+        prime = lambda *a, **k: self.events.append(("prime", a[0])) or True
+        with patch.object(sync_core, "prime_reference_speech", side_effect=prime), patch.object(
+            sync_core, "run_sync", side_effect=self._fake_run_sync
+        ):
+            results = sync_core.run_sync_many(
+                self.video, self.subtitles, tool="ffsubsync", config=config, jobs=4
+            )
+
+        self.assertEqual(self.events[0], ("prime", self.video))
+        self.assertEqual([e[0] for e in self.events[1:]], ["sync"] * 4)
+        self.assertGreater(self.max_active, 1)
+        self.assertTrue(all(r.ok for r in results))
+        # Every subtitle would map to movie.srt; planned outputs must not collide.
+        outputs = [r.output_path for r in results]
+        self.assertEqual(len(set(outputs)), 4)
+        self.assertEqual(os.path.basename(outputs[0]), "movie.srt")
+        self.assertEqual(os.path.basename(outputs[1]), "movie_2.srt")
+
+    def test_cli_sync_accepts_several_subtitles(self):
+        out_dir = os.path.join(self.temp_dir, "out")
+        argv = [
+            "--config-file", os.path.join(self.temp_dir, "none.json"),
+            "-q", "sync", self.video, *self.subtitles,
+            "-o", out_dir, "-t", "ffsubsync", "--encoding", "disabled",
+            "--no-embedded-subtitles", "--json",
+        ]
+        buf = io.StringIO()
+        with patch.object(cli, "_ensure_ffmpeg"), patch.object(
+            sync_core, "prime_reference_speech", return_value=True
+        ), patch.object(sync_core, "run_sync", side_effect=self._fake_run_sync):
+            with redirect_stdout(buf):
+                rc = cli.main(argv)
+
+        lines = [json.loads(line) for line in buf.getvalue().splitlines() if line]
+        self.assertEqual(rc, cli.EXIT_OK)
+        self.assertEqual([r["input"] for r in lines[:-1]], self.subtitles)
+        self.assertTrue(all(r["output"].startswith(out_dir) for r in lines[:-1]))
+        self.assertEqual(lines[-1]["summary"], {"total": 4, "ok": 4, "failed": 0})
+
+
+@unittest.skipIf(shutil.which("ffmpeg") is None, "ffmpeg is not available")
+class TestRunSyncManyFfsubsync(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "cache")
+        self._env = patch.dict(os.environ, {"ASSY_SPEECH_CACHE_DIR": self.cache_dir})
+        self._env.start()
+        self._root_level = logging.getLogger().level
+        logging.getLogger().setLevel(logging.INFO)
+        # Fresh workers so they inherit the cache location and log level.
+        worker_pool.configure_module_worker_pool()
+
+    def tearDown(self):
+        worker_pool.configure_module_worker_pool()
+        logging.getLogger().setLevel(self._root_level)
+        self._env.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_reference_speech_is_decoded_once(self):
+        reference = os.path.join(self.temp_dir, "reference.wav")
+        _write_speech_wav(reference)
+        subtitles = []
+        for idx, offset in enumerate((1.5, -1.0, 2.5)):
+            path = os.path.join(self.temp_dir, f"sub{idx}.srt")
+            _write_srt(path, offset=offset + 2.0)
+            subtitles.append(path)
+        lines = []
+        callbacks = sync_core.SyncCallbacks(on_subprocess_line=lambda l, _: lines.append(l))
+        config = {"sync_tool": "ffsubsync", "ffsubsync_vad": "webrtc"}
+
+        results = sync_core.run_sync_many(
+            reference, subtitles, tool="ffsubsync", config=config, callbacks=callbacks, jobs=3
+        )
+
+        self.assertTrue(all(r.ok for r in results), [r.message for r in results])
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        cached = [l for l in lines if "using cached speech segments" in l]
+        self.assertEqual(len(cached), len(subtitles))
+
+
+if __name__ == "__main__":
+    unittest.main()
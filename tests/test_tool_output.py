@@ -0,0 +1,98 @@
+import os
+import sys
+import time
+import asyncio
+import threading
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main")))
+
+import sync_core
+from sync_core import SyncCallbacks, _LineSplitter, run_executable_tool, run_sync
+
+OUTPUT = (
+    b"Format: mov\r\n"
+    b"plain line\n"
+    b"progress 10%\rprogress 50%\rprogress 100%\r\n"
+    b"caf\xc3\xa9\n"
+    b"\n"
+    b"tail without newline"
+)
+EXPECTED = [
+    ("Format: mov", False),
+    ("plain line", False),
+    ("progress 10%", True),
+    ("progress 50%", True),
+    ("progress 100%", True),
+    ("café", False),
+    ("", False),
+]
+
+
+class TestLineSplitter(unittest.TestCase):
+    def test_chunk_boundaries_do_not_matter(self):
+        for size in (1, 2, 3, 7, len(OUTPUT)):
+            splitter = _LineSplitter("utf-8")
+            lines = []
+            for i in range(0, len(OUTPUT), size):
+                lines += splitter.feed(OUTPUT[i : i + size])
+            self.assertEqual(lines, EXPECTED, size)
+            self.assertEqual(splitter.flush(), ("tail without newline", False))
+
+    def test_long_output_is_split_in_linear_time(self):
+        splitter = _LineSplitter("utf-8")
+        data = b"".join(b"line %d\n" % i for i in range(200_000))
+        start = time.perf_counter()
+        count = sum(
+            len(splitter.feed(data[i : i + 65536])) for i in range(0, len(data), 65536)
+        )
+        self.assertEqual(count, 200_000)
+        self.assertLess(time.perf_counter() - start, 5)
+
+
+class TestRunExecutableTool(unittest.TestCase):
+    def _run(self, code, callbacks):
+        return run_executable_tool(
+            [sys.executable, "-c", code], callbacks, sync_tool="lapse"
+        )
+
+    def test_streams_real_process_output(self):
+        received = []
+        code = f"import sys; sys.stdout.buffer.write({OUTPUT!r}); sys.exit(3)"
+        callbacks = SyncCallbacks(
+            on_subprocess_line=lambda line, ow: received.append((line, ow))
+        )
+        self.assertEqual(self._run(code, callbacks), 3)
+        # Empty lines are dropped by process_output
+        self.assertEqual(
+            received,
+            [line for line in EXPECTED if line[0]] + [("tail without newline", False)],
+        )
+
+    def test_silent_tool_is_cancelled_promptly(self):
+        cancel = threading.Event()
+        holder = {}
+        threading.Timer(0.3, cancel.set).start()
+        start = time.monotonic()
+        rc = run_executable_tool(
+            [sys.executable, "-c", "import time; time.sleep(60)"],
+            SyncCallbacks(is_cancelled=cancel.is_set),
+            sync_tool="lapse",
+            process_holder=holder,
+        )
+        self.assertEqual(rc, 1)
+        self.assertLess(time.monotonic() - start, 0.3 + 1.0)
+        # The tool is stopped before run_executable_tool returns
+        self.assertIsNotNone(holder["process"].returncode)
+
+    def test_blocking_runners_refuse_a_running_loop(self):
+        async def main():
+            with self.assertRaisesRegex(RuntimeError, "await run_sync_async"):
+                run_sync("reference.srt", "subtitle.srt", tool="alass", config={})
+            with self.assertRaisesRegex(RuntimeError, "run_executable_tool_async"):
+                self._run("pass", SyncCallbacks())
+
+        asyncio.run(main())
+
+if __name__ == "__main__":
+    unittest.main()
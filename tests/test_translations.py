@@ -0,0 +1,110 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main")))
+
+import texts
+import texts_source
+import translations
+import utils
+from translations import TranslationDict
+
+
+class TestTranslations(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        translations.clear_cache()
+        utils._locale_cache = "en_US"
+
+    def tearDown(self):
+        translations.clear_cache()
+        utils._locale_cache = None
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _use_catalog_dir(self, catalogs=None):
+        """Serve catalogs from the temp dir (none at all if catalogs is None)."""
+        catalog_dir = os.path.join(self.temp_dir, "translations")
+        if catalogs is not None:
+            translations.write_catalogs(catalogs, catalog_dir)
+        patcher = mock.patch.object(translations, "CATALOG_DIR", catalog_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return catalog_dir
+
+    def test_catalogs_are_up_to_date(self):
+        # Run `python main/translations.py` after changing a text
+        compiled = translations.compile_catalogs()
+        with open(
+            os.path.join(translations.CATALOG_DIR, translations.INDEX_FILE),
+            encoding="utf-8",
+        ) as f:
+            index = json.load(f)
+        self.assertEqual(index["locales"], sorted(compiled))
+        self.assertEqual(index["source_hash"], translations.catalog_hash(compiled))
+        for locale, catalog in compiled.items():
+            path = os.path.join(translations.CATALOG_DIR, f"{locale}.json")
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(json.load(f), catalog, locale)
+        self.assertEqual(
+            compiled["tr_TR"]["CHANGE_LANGUAGE_TITLE"],
+            texts_source.CHANGE_LANGUAGE_TITLE["tr_TR"],
+        )
+        self.assertIn("SYNC_TOOLS.ffsubsync.description", compiled["en_US"])
+
+    def test_only_languages_in_use_are_loaded(self):
+        utils._locale_cache = "de_DE"
+        self.assertEqual(
+            str(texts.CHANGE_LANGUAGE_TITLE),
+            texts_source.CHANGE_LANGUAGE_TITLE["de_DE"],
+        )
+        self.assertIn("de_DE", translations.loaded_locales())
+        self.assertLessEqual(set(translations.loaded_locales()), {"de_DE", "en_US"})
+        with self.assertRaises(AttributeError):
+            texts.NOT_A_TEXT
+
+    def test_fallback_chain(self):
+        self._use_catalog_dir(
+            {
+                "en_US": {"GREETING": "Hello", "FAREWELL": "Bye"},
+                "pt_PT": {"GREETING": "Olá"},
+            }
+        )
+        self.assertEqual(translations.lookup("GREETING", "pt_PT"), "Olá")
+        # Missing text, missing region and missing language
+        self.assertEqual(translations.lookup("FAREWELL", "pt_PT"), "Bye")
+        self.assertEqual(translations.lookup("GREETING", "pt_BR"), "Olá")
+        self.assertEqual(translations.lookup("GREETING", "xx_XX"), "Hello")
+        self.assertEqual(translations.lookup("MISSING", "pt_PT", "?"), "?")
+
+    def test_write_catalogs(self):
+        catalogs = {"en_US": {"GREETING": "Hello"}, "tr_TR": {"GREETING": "Merhaba"}}
+        catalog_dir = self._use_catalog_dir(catalogs)
+        self.assertEqual(
+            sorted(os.listdir(catalog_dir)), ["en_US.json", "index.json", "tr_TR.json"]
+        )
+        self.assertEqual(translations.lookup("GREETING", "tr_TR"), "Merhaba")
+
+    def test_missing_catalogs_are_compiled_in_memory(self):
+        catalog_dir = self._use_catalog_dir()
+        text = TranslationDict(key="CHANGE_LANGUAGE_TITLE")
+        self.assertEqual(text, texts_source.CHANGE_LANGUAGE_TITLE["en_US"])
+        # Catalogs are never written at runtime
+        self.assertFalse(os.path.exists(catalog_dir))
+
+    def test_translation_dict_follows_locale(self):
+        text = TranslationDict(key="CHANGE_LANGUAGE_TITLE")
+        utils._locale_cache = "tr_TR"
+        expected = texts_source.CHANGE_LANGUAGE_TITLE["tr_TR"]
+        self.assertEqual(str(text), expected)
+        self.assertEqual(hash(text), hash(expected))
+        self.assertEqual({text: 1}.get(expected), 1)
+        self.assertEqual(text.get("es_ES"), texts_source.CHANGE_LANGUAGE_TITLE["es_ES"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import os
+import sys
+import time
+import shutil
+import tempfile
+import textwrap
+import threading
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main")))
+
+import sync_core
+import worker_pool
+
+_TOOL_SOURCE = textwrap.dedent(
+    """
+    import os
+    import time
+
+    WARMED = False
+
+
+    def warmup():
+        global WARMED
+        WARMED = True
+
+
+    def cli_entry(args):
+        if args and args[0] == "sleep":
+            time.sleep(float(args[1]))
+        print(f"pid={os.getpid()} warmed={WARMED}")
+        return 0
+    """
+)
+
+
+class TestModuleWorkerPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.module_dir = tempfile.mkdtemp()
+        with open(os.path.join(cls.module_dir, "fake_pool_tool.py"), "w") as f:
+            f.write(_TOOL_SOURCE)
+        sys.path.insert(0, cls.module_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        sys.path.remove(cls.module_dir)
+        shutil.rmtree(cls.module_dir, ignore_errors=True)
+        worker_pool.configure_module_worker_pool()
+
+    def _run(self, args=(), cancel_event=None):
+        lines = []
+        holder = {}
+        callbacks = sync_core.SyncCallbacks(
+            on_subprocess_line=lambda line, _: lines.append(line),
+            is_cancelled=cancel_event.is_set if cancel_event else None,
+        )
+        rc = sync_core.run_module_tool(
+            "fake_pool_tool",
+            list(args),
+            callbacks,
+            sync_tool="ffsubsync",
+            process_holder=holder,
+        )
+        return rc, lines, holder
+
+    def test_jobs_reuse_a_warm_worker_until_recycled(self):
+        worker_pool.configure_module_worker_pool(max_workers=1, max_jobs_per_worker=2)
+        results = [self._run() for _ in range(3)]
+
+        self.assertTrue(all(rc == 0 for rc, _, _ in results))
+        # A cancel arriving after a job must not reach the pooled worker
+        self.assertTrue(all("module_proc" not in holder for _, _, holder in results))
+        outputs = [lines[-1] for _, lines, _ in results]
+        self.assertTrue(all("warmed=True" in line for line in outputs))
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertNotEqual(outputs[1], outputs[2])
+
+    def test_memory_ceiling_retires_worker(self):
+        worker_pool.configure_module_worker_pool(max_workers=1, max_rss_mb=1)
+        (_, first, _), (_, second, _) = self._run(), self._run()
+        self.assertNotEqual(first[-1], second[-1])
+
+    def test_cancel_kills_only_the_cancelled_job(self):
+        worker_pool.configure_module_worker_pool(max_workers=2)
+        cancel = threading.Event()
+        slow = {}
+
+        def run_slow():
+            slow["result"] = self._run(["sleep", "30"], cancel_event=cancel)
+
+        thread = threading.Thread(target=run_slow)
+        thread.start()
+        rc, lines, _ = self._run(["sleep", "0.5"])
+        slow_proc = next(
+            w.process for w in worker_pool.get_module_worker_pool()._in_use
+        )
+        self.assertEqual(rc, 0)
+
+        started = time.monotonic()
+        cancel.set()
+        thread.join(timeout=10)
+        self.assertFalse(thread.is_alive())
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertFalse(slow_proc.is_alive())
+        # The worker that ran the short job survives and serves the next one.
+        _, again, _ = self._run()
+        self.assertEqual(lines[-1], again[-1])
+
+    def test_disabled_pool_uses_one_shot_process(self):
+        worker_pool.configure_module_worker_pool(enabled=False)
+        (_, first, _), (_, second, _) = self._run(), self._run()
+        self.assertNotEqual(first[-1], second[-1])
+        self.assertIn("warmed=False", first[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()